@@ -0,0 +1,268 @@
+import argparse
+import json
+import math
+import os
+import shutil
+
+import faiss
+import numpy as np
+
+from mmap_index import VECTORS_FILE, export_vectors
+
+INDEX_CONFIG_FILE = "index_config.json"
+INDEX_TYPES = ["flat", "hnsw", "ivf", "fp16", "sq8", "pq"]
+COMPRESSED_TYPES = {"fp16", "sq8", "pq"}
+
+# Build and search parameters per index type. Build parameters are fixed once the index is
+# written; ef_search and nprobe can be overridden when the index is loaded.
+# For the compressed types, rerank > 0 re-scores the top k * rerank candidates exactly
+# against the float32 vectors kept (memory-mapped, not loaded) in index.vectors.npy.
+DEFAULT_PARAMS = {
+    "flat": {},
+    "hnsw": {"M": 32, "ef_construction": 200, "ef_search": 64},
+    "ivf": {"nlist": None, "nprobe": 16},
+    "fp16": {"rerank": 0},
+    "sq8": {"rerank": 0},
+    "pq": {"M": 96, "nbits": 8, "rerank": 4},
+}
+
+
+def read_index_config(vector_path):
+    path = os.path.join(vector_path, INDEX_CONFIG_FILE)
+    if not os.path.exists(path):
+        return {"type": "flat"}
+    with open(path) as file:
+        return json.load(file)
+
+
+def write_index_config(vector_path, config):
+    with open(os.path.join(vector_path, INDEX_CONFIG_FILE), 'w') as file:
+        json.dump(config, file, indent=2)
+
+
+def create_index_config(index_type, **params):
+    if index_type not in DEFAULT_PARAMS:
+        raise ValueError(f"Unknown index type {index_type}, expected one of {', '.join(INDEX_TYPES)}")
+    config = {"type": index_type, **DEFAULT_PARAMS[index_type]}
+    config.update({key: value for key, value in params.items() if value is not None})
+    return config
+
+
+def create_index(vectors, config, metric=faiss.METRIC_L2):
+    count, dimension = vectors.shape
+    index_type = config["type"]
+    if index_type == "flat":
+        index = faiss.IndexFlat(dimension, metric)
+    elif index_type == "hnsw":
+        index = faiss.IndexHNSWFlat(dimension, config["M"], metric)
+        index.hnsw.efConstruction = config["ef_construction"]
+    elif index_type == "ivf":
+        # ~4 * sqrt(n) lists is the usual starting point; faiss wants ~39 training points per list
+        config["nlist"] = config.get("nlist") or max(1, min(int(4 * math.sqrt(count)), count // 39))
+        index = faiss.IndexIVFFlat(faiss.IndexFlat(dimension, metric), dimension, config["nlist"], metric)
+        index.train(vectors)
+    elif index_type in ("fp16", "sq8"):
+        quantizer_type = faiss.ScalarQuantizer.QT_fp16 if index_type == "fp16" else faiss.ScalarQuantizer.QT_8bit
+        index = faiss.IndexScalarQuantizer(dimension, quantizer_type, metric)
+        index.train(vectors)
+    elif index_type == "pq":
+        if dimension % config["M"]:
+            raise ValueError(f"pq M={config['M']} must divide the vector dimension {dimension}")
+        # Each sub-quantizer needs at least 2^nbits training vectors
+        config["nbits"] = min(config["nbits"], max(1, int(math.log2(max(count, 2)))))
+        index = faiss.IndexPQ(dimension, config["M"], config["nbits"], metric)
+        index.train(vectors)
+    else:
+        raise ValueError(f"Unknown index type {index_type}, expected one of {', '.join(INDEX_TYPES)}")
+    index.add(vectors)
+    apply_search_params(index, config)
+    return index
+
+
+def can_remove_rows(index):
+    # faiss raises "not implemented" from remove_ids on graph indexes; remove_rows rebuilds HNSW instead
+    return not isinstance(getattr(index, "index", index), (faiss.IndexNSG, faiss.IndexNNDescent))
+
+
+def remove_rows(index, rows):
+    # Removes rows and moves the later ones up to close the gaps, the numbering FAISS.delete gives the docstore
+    # ids. An HNSW graph cannot unlink a node, so an HNSW index is rebuilt in place from the rows that are left;
+    # its M and efConstruction survive reset().
+    rows = np.asarray(rows, dtype=np.int64)
+    if isinstance(index, faiss.IndexIVF):
+        # IVF keeps each vector's id in its inverted list and leaves the other ids as they were: shift them down
+        removed = index.remove_ids(rows)
+        rows = np.sort(rows)
+        for list_no in range(index.nlist):
+            size = index.invlists.list_size(list_no)
+            if size:
+                ids = faiss.rev_swig_ptr(index.invlists.get_ids(list_no), size)
+                ids -= np.searchsorted(rows, ids)
+        return removed
+    if not isinstance(index, faiss.IndexHNSW):
+        return index.remove_ids(rows)
+    keep = np.ones(index.ntotal, dtype=bool)
+    keep[rows] = False
+    vectors = index.reconstruct_n(0, index.ntotal)[keep]
+    index.reset()
+    index.add(vectors)
+    return len(rows)
+
+
+def apply_search_params(index, config):
+    if config.get("ef_search") is not None and hasattr(index, "hnsw"):
+        index.hnsw.efSearch = config["ef_search"]
+    if config.get("nprobe") is not None and hasattr(index, "nprobe"):
+        index.nprobe = config["nprobe"]
+
+
+class RerankIndex:
+    # Wraps a compressed index: searches it for k * factor candidates, then orders them by the
+    # exact distance to the float32 vectors. Only the candidate rows of the mmap'd file are read.
+    # Writes leave the file alone: added vectors go to a heap buffer and removed rows are masked
+    # until save_vectors writes out the rows still live and reopen maps that file instead.
+    def __init__(self, index, vectors, factor):
+        self.index = index
+        self.factor = factor
+        self.d = index.d
+        self.metric_type = index.metric_type
+        self.is_trained = True
+        self._reset(vectors)
+
+    def _reset(self, vectors):
+        self.vectors = vectors
+        self._added = np.empty((0, self.d), dtype=np.float32)
+        self._added_count = 0
+        # Per stored row (file rows, then buffer rows); None until something is removed
+        self._deleted = None
+        # FAISS renumbers rows after a removal: position -> stored row, rebuilt on demand from the mask
+        self._rows = None
+
+    @classmethod
+    def load(cls, index, vector_path, factor):
+        return cls(index, np.load(os.path.join(vector_path, VECTORS_FILE), mmap_mode="r"), factor)
+
+    def reopen(self, vector_path):
+        self._reset(np.load(os.path.join(vector_path, VECTORS_FILE), mmap_mode="r"))
+
+    @property
+    def ntotal(self):
+        return self.index.ntotal
+
+    def _stored_rows(self, positions):
+        if self._deleted is None:
+            return positions
+        if self._rows is None:
+            self._rows = np.flatnonzero(~self._deleted[:len(self.vectors) + self._added_count])
+        return self._rows[positions]
+
+    def _gather(self, positions):
+        # Vectors at sorted FAISS positions, read from the file or the buffer
+        rows = self._stored_rows(positions)
+        split = np.searchsorted(rows, len(self.vectors))
+        exact = np.asarray(self.vectors[rows[:split]])
+        if split == len(rows):
+            return exact
+        return np.concatenate([exact, self._added[rows[split:] - len(self.vectors)]])
+
+    def search(self, x, k, params=None):
+        x = np.asarray(x, dtype=np.float32)
+        _, candidates = self.index.search(x, k * self.factor, params=params)
+        distances = np.full((len(x), k), np.inf if self.metric_type == faiss.METRIC_L2 else -np.inf, dtype=np.float32)
+        labels = np.full((len(x), k), -1, dtype=np.int64)
+        for row, (query, ids) in enumerate(zip(x, candidates)):
+            ids = np.sort(ids[ids >= 0])
+            if not len(ids):
+                continue
+            exact = self._gather(ids)
+            if self.metric_type == faiss.METRIC_L2:
+                scores = ((exact - query) ** 2).sum(axis=1)
+                order = scores.argsort()[:k]
+            else:
+                scores = exact @ query
+                order = (-scores).argsort()[:k]
+            distances[row, :len(order)] = scores[order]
+            labels[row, :len(order)] = ids[order]
+        return distances, labels
+
+    def add(self, x):
+        x = np.asarray(x, dtype=np.float32)
+        self.index.add(x)
+        count = self._added_count + len(x)
+        if count > len(self._added):
+            # Grown by doubling, so adding n vectors one at a time copies O(n) rows in total
+            grown = np.empty((max(count, 2 * len(self._added), 1024), self.d), dtype=np.float32)
+            grown[:self._added_count] = self._added[:self._added_count]
+            self._added = grown
+            if self._deleted is not None:
+                extra = len(self.vectors) + len(grown) - len(self._deleted)
+                self._deleted = np.concatenate([self._deleted, np.zeros(extra, dtype=bool)])
+        self._added[self._added_count:count] = x
+        self._added_count = count
+        self._rows = None
+
+    def remove_ids(self, ids):
+        ids = np.asarray(ids, dtype=np.int64)
+        rows = self._stored_rows(np.sort(ids[(ids >= 0) & (ids < self.ntotal)]))
+        removed = self.index.remove_ids(ids)
+        if self._deleted is None:
+            self._deleted = np.zeros(len(self.vectors) + len(self._added), dtype=bool)
+        self._deleted[rows] = True
+        self._rows = None
+        return removed
+
+    def reconstruct(self, i):
+        return self._gather(np.array([i]))[0]
+
+    def reconstruct_n(self, i0, n):
+        return self._gather(np.arange(i0, min(i0 + n, self.ntotal)))
+
+    def save_vectors(self, vector_path, batch_size=65536):
+        # Streams the live rows into a new file, so saving never holds every vector in memory at once
+        path = os.path.join(vector_path, VECTORS_FILE)
+        tmp_path = f"{path}.{os.getpid()}.tmp.npy"
+        output = np.lib.format.open_memmap(tmp_path, mode="w+", dtype=np.float32, shape=(self.ntotal, self.d))
+        for start in range(0, self.ntotal, batch_size):
+            output[start:start + batch_size] = self.reconstruct_n(start, batch_size)
+        output.flush()
+        del output
+        os.replace(tmp_path, path)
+
+
+def convert_vector_store(vector_store, config):
+    # Rebuilds the store's index in place; row order (and so index_to_docstore_id) is unchanged
+    vectors = vector_store.index.reconstruct_n(0, vector_store.index.ntotal)
+    vector_store.index = create_index(vectors, config, vector_store.index.metric_type)
+    return vector_store
+
+
+if __name__ == "__main__":
+    # e.g. python ann_index.py --index Swinburne_Chat_Bot --output Swinburne_Chat_Bot_HNSW --type hnsw
+    parser = argparse.ArgumentParser(description="Convert a flat FAISS index into an approximate one")
+    parser.add_argument("--index", default="Swinburne_Chat_Bot")
+    parser.add_argument("--output", required=True)
+    parser.add_argument("--type", choices=INDEX_TYPES, required=True)
+    parser.add_argument("--M", type=int)
+    parser.add_argument("--ef-construction", type=int)
+    parser.add_argument("--ef-search", type=int)
+    parser.add_argument("--nlist", type=int)
+    parser.add_argument("--nprobe", type=int)
+    parser.add_argument("--nbits", type=int)
+    parser.add_argument("--rerank", type=int, help="re-rank k * RERANK compressed candidates exactly")
+    args = parser.parse_args()
+
+    config = create_index_config(
+        args.type, M=args.M, ef_construction=args.ef_construction, ef_search=args.ef_search,
+        nlist=args.nlist, nprobe=args.nprobe, nbits=args.nbits, rerank=args.rerank,
+    )
+    flat = faiss.read_index(os.path.join(args.index, "index.faiss"))
+    index = create_index(flat.reconstruct_n(0, flat.ntotal), config, flat.metric_type)
+    os.makedirs(args.output, exist_ok=True)
+    if config.get("rerank"):
+        export_vectors(args.output, flat)
+    faiss.write_index(index, os.path.join(args.output, "index.faiss"))
+    for filename in ("index.pkl", "docstore.sqlite", "index.bm25.npz", "index.filters.npz"):
+        if os.path.exists(os.path.join(args.index, filename)):
+            shutil.copy(os.path.join(args.index, filename), os.path.join(args.output, filename))
+    write_index_config(args.output, config)
+    print(f"Wrote {args.type} index with {index.ntotal} vectors to {args.output}")
@@ -0,0 +1,103 @@
+import argparse
+import csv
+import os
+import time
+
+import faiss
+import numpy as np
+
+from ann_index import COMPRESSED_TYPES, RerankIndex, create_index, create_index_config, apply_search_params
+
+# Search latency and recall@k of approximate and compressed indexes against the exact flat index of a built corpus:
+#   python benchmark_ann.py --index Swinburne_Chat_Bot --queries 500 --k 5
+#   python benchmark_ann.py --index Swinburne_Chat_Bot --topics topics.csv   (real questions, needs the API key)
+
+
+def load_queries(vectors, count, topics_file=None, seed=0):
+    if topics_file:
+        from embedding_cache import create_embedder
+
+        with open(topics_file) as file:
+            questions = [row["topic"] for row in csv.DictReader(file)]
+        return np.array(create_embedder().embed_documents(questions), dtype=np.float32)
+    # Corpus vectors with a little noise stand in for queries that land near real chunks
+    generator = np.random.RandomState(seed)
+    sample = vectors[generator.choice(len(vectors), size=min(count, len(vectors)), replace=False)]
+    noise = generator.normal(scale=0.01, size=sample.shape).astype(np.float32)
+    return sample + noise
+
+
+def measure(index, queries, k):
+    # One query per call, as /chat does it
+    latencies = []
+    labels = []
+    for query in queries:
+        started = time.perf_counter()
+        _, found = index.search(query[None, :], k)
+        latencies.append((time.perf_counter() - started) * 1000)
+        labels.append(found[0])
+    return np.array(latencies), np.array(labels)
+
+
+def recall_at_k(labels, truth, k):
+    return float(np.mean([len(set(found[:k]) & set(expected[:k])) / k for found, expected in zip(labels, truth)]))
+
+
+def report(name, latencies, labels, truth, k, build_seconds=None):
+    build = f" build={build_seconds:7.1f}s" if build_seconds is not None else ""
+    print(
+        f"{name:<28} p50={np.percentile(latencies, 50):7.3f}ms p99={np.percentile(latencies, 99):7.3f}ms "
+        f"recall@{k}={recall_at_k(labels, truth, k):.4f}{build}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark HNSW and IVF indexes against the flat index")
+    parser.add_argument("--index", default="Swinburne_Chat_Bot")
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--topics", help="embed the questions in this topics.csv as queries")
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--M", type=int, nargs="+", default=[16, 32])
+    parser.add_argument("--ef-search", type=int, nargs="+", default=[16, 32, 64, 128, 256])
+    parser.add_argument("--nlist", type=int)
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--pq-m", type=int, default=96)
+    parser.add_argument("--rerank", type=int, nargs="+", default=[2, 4, 8])
+    args = parser.parse_args()
+
+    flat = faiss.read_index(os.path.join(args.index, "index.faiss"))
+    vectors = flat.reconstruct_n(0, flat.ntotal)
+    queries = load_queries(vectors, args.queries, args.topics)
+    print(f"{flat.ntotal} vectors of dimension {flat.d}, {len(queries)} queries")
+
+    latencies, truth = measure(flat, queries, args.k)
+    report("flat", latencies, truth, truth, args.k)
+
+    for m in args.M:
+        config = create_index_config("hnsw", M=m)
+        started = time.perf_counter()
+        index = create_index(vectors, config, flat.metric_type)
+        build_seconds = time.perf_counter() - started
+        for ef_search in args.ef_search:
+            apply_search_params(index, {"ef_search": ef_search})
+            latencies, labels = measure(index, queries, args.k)
+            report(f"hnsw M={m} efSearch={ef_search}", latencies, labels, truth, args.k, build_seconds)
+
+    config = create_index_config("ivf", nlist=args.nlist)
+    started = time.perf_counter()
+    index = create_index(vectors, config, flat.metric_type)
+    build_seconds = time.perf_counter() - started
+    for nprobe in args.nprobe:
+        apply_search_params(index, {"nprobe": nprobe})
+        latencies, labels = measure(index, queries, args.k)
+        report(f"ivf nlist={config['nlist']} nprobe={nprobe}", latencies, labels, truth, args.k, build_seconds)
+
+    for index_type in sorted(COMPRESSED_TYPES):
+        config = create_index_config(index_type, M=args.pq_m) if index_type == "pq" else create_index_config(index_type)
+        index = create_index(vectors, config, flat.metric_type)
+        bytes_per_vector = len(faiss.serialize_index(index)) / max(index.ntotal, 1)
+        latencies, labels = measure(index, queries, args.k)
+        report(f"{index_type} {bytes_per_vector:.0f}B/vector", latencies, labels, truth, args.k)
+        for factor in args.rerank:
+            latencies, labels = measure(RerankIndex(index, vectors, factor), queries, args.k)
+            report(f"{index_type} rerank={factor}", latencies, labels, truth, args.k)
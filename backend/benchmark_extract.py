@@ -0,0 +1,72 @@
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from crawler import AsyncWebCrawler, Page
+from catalogue import load_urls
+from pipeline import extract_and_split
+
+# Compares single-process and N-process extract+split throughput on a saved corpus:
+#   python benchmark_extract.py --save-corpus corpus --limit 500
+#   python benchmark_extract.py --corpus corpus --processes 1 2 4 8
+
+
+def save_corpus(directory, urls):
+    os.makedirs(directory, exist_ok=True)
+    index = []
+    for i, page in enumerate(AsyncWebCrawler().fetch(urls)):
+        if not page.ok:
+            continue
+        filename = f"{i:05d}.html"
+        with open(os.path.join(directory, filename), 'wb') as file:
+            file.write(page.content)
+        index.append({"url": page.url, "file": filename, "encoding": page.encoding})
+    with open(os.path.join(directory, "index.json"), 'w') as file:
+        json.dump(index, file, indent=2)
+    print(f"Saved {len(index)} pages to {directory}")
+
+
+def load_corpus(directory):
+    with open(os.path.join(directory, "index.json")) as file:
+        index = json.load(file)
+    pages = []
+    for entry in index:
+        with open(os.path.join(directory, entry["file"]), 'rb') as file:
+            pages.append(Page(entry["url"], 200, file.read(), encoding=entry["encoding"]))
+    return pages
+
+
+def run(pages, processes):
+    started = time.perf_counter()
+    if processes == 1:
+        chunks = sum(len(extract_and_split(page)) for page in pages)
+    else:
+        with ProcessPoolExecutor(processes) as executor:
+            chunks = sum(len(result) for result in executor.map(extract_and_split, pages, chunksize=8))
+    return time.perf_counter() - started, chunks
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the extract-and-split ingestion stage")
+    parser.add_argument("--corpus", default="corpus")
+    parser.add_argument("--save-corpus", metavar="DIRECTORY")
+    parser.add_argument("--limit", type=int, default=500)
+    parser.add_argument("--processes", type=int, nargs="+", default=[1, 2, 4, os.cpu_count()])
+    args = parser.parse_args()
+
+    if args.save_corpus:
+        save_corpus(args.save_corpus, load_urls()[:args.limit])
+    else:
+        pages = load_corpus(args.corpus)
+        megabytes = sum(len(page.content) for page in pages) / 1e6
+        print(f"{len(pages)} pages, {megabytes:.1f} MB")
+        baseline = None
+        for processes in sorted(set(args.processes)):
+            elapsed, chunks = run(pages, processes)
+            baseline = baseline or elapsed
+            print(
+                f"processes={processes:<3} {elapsed:7.2f}s {len(pages) / elapsed:8.1f} pages/s "
+                f"{megabytes / elapsed:6.2f} MB/s chunks={chunks} speedup={baseline / elapsed:.2f}x"
+            )
@@ -0,0 +1,88 @@
+import argparse
+import hashlib
+import json
+import os
+from collections import Counter
+
+from bs4 import BeautifulSoup
+
+BOILERPLATE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "boilerplate.json")
+
+# Template parts of the Swinburne sites that never carry page content
+DEFAULT_SELECTORS = [
+    "script", "style", "noscript", "template", "svg", "iframe",
+    "header:not(main header, article header)", "footer:not(main footer, article footer)", "nav",
+    "[role=banner]", "[role=navigation]", "[role=contentinfo]", "[role=search]",
+    "[aria-hidden=true]",
+    "[id*=cookie]", "[class*=cookie]", "[id*=onetrust]",
+    "[class*=mega-menu]", "[class*=megamenu]", "[class*=breadcrumb]",
+    "[class*=skip-link]", "[class*=social-share]",
+    "[class*=related-courses]", "[class*=related-content]",
+]
+BLOCK_TAGS = ["aside", "div", "section", "ul", "ol", "table", "form", "p"]
+
+
+def _fingerprint(element):
+    text = " ".join(element.get_text(" ").split())
+    if len(text) < 20:
+        return None
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+class BoilerplateStripper:
+    def __init__(self, selectors=None, fingerprints=None):
+        self.selectors = list(DEFAULT_SELECTORS if selectors is None else selectors)
+        self.fingerprints = set(fingerprints or [])
+
+    @classmethod
+    def load(cls, path=BOILERPLATE_PATH):
+        if not os.path.exists(path):
+            return cls()
+        with open(path) as file:
+            config = json.load(file)
+        return cls(config.get("selectors"), config.get("fingerprints"))
+
+    def save(self, path=BOILERPLATE_PATH):
+        with open(path, 'w') as file:
+            json.dump({"selectors": self.selectors, "fingerprints": sorted(self.fingerprints)}, file, indent=2)
+
+    def learn(self, soups, min_fraction=0.2, min_pages=5):
+        # A block whose exact text shows up on a large share of pages is template, not content
+        counts = Counter()
+        for soup in soups:
+            self._strip_selectors(soup)
+            counts.update({fingerprint for fingerprint in map(_fingerprint, soup.find_all(BLOCK_TAGS)) if fingerprint})
+        threshold = max(min_pages, min_fraction * len(soups))
+        learned = {fingerprint for fingerprint, count in counts.items() if count >= threshold}
+        self.fingerprints |= learned
+        return learned
+
+    def _strip_selectors(self, soup):
+        for selector in self.selectors:
+            for element in soup.select(selector):
+                element.decompose()
+
+    def strip(self, soup):
+        self._strip_selectors(soup)
+        if self.fingerprints:
+            for element in soup.find_all(BLOCK_TAGS):
+                if not element.decomposed and _fingerprint(element) in self.fingerprints:
+                    element.decompose()
+        return soup
+
+
+if __name__ == "__main__":
+    # Learns repeated template blocks from a corpus saved with benchmark_extract.py --save-corpus
+    from benchmark_extract import load_corpus
+
+    parser = argparse.ArgumentParser(description="Learn repeated page template blocks from a saved corpus")
+    parser.add_argument("--corpus", default="corpus")
+    parser.add_argument("--min-fraction", type=float, default=0.2)
+    args = parser.parse_args()
+
+    pages = load_corpus(args.corpus)
+    soups = [BeautifulSoup(page.content, "html.parser", from_encoding=page.encoding) for page in pages]
+    stripper = BoilerplateStripper()
+    learned = stripper.learn(soups, min_fraction=args.min_fraction)
+    stripper.save()
+    print(f"Learned {len(learned)} template blocks from {len(pages)} pages, saved to {BOILERPLATE_PATH}")
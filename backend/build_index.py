@@ -0,0 +1,265 @@
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import time
+
+from ann_index import INDEX_TYPES, convert_vector_store, create_index_config, write_index_config
+from mmap_index import export_vectors
+from sqlite_docstore import export_docstore
+from lexical_index import build_lexical_index
+from metadata_index import build_metadata_index, url_metadata
+from index_versions import new_version_name, publish_version
+from sharded_index import shard_name, write_shard_manifest
+from create_vector_store import create_pipeline, load_index
+from crawler import is_retryable
+from dedup import DEDUP_FILE, NearDuplicateFilter
+from pipeline import apply_aliases
+from catalogue import CATALOGUE_PATH, GONE_STATUSES, load_urls, record_statuses
+
+
+def _write_json(path, data):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as file:
+        json.dump(data, file, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _read_json(path):
+    with open(path) as file:
+        return json.load(file)
+
+
+def save_vector_store(vector_store, output, index_config, docstore="sqlite"):
+    # Writes a flat store as a servable index directory: index.faiss in the configured type, the BM25 and
+    # metadata filter indexes, the docstore and index_config.json
+    if index_config.get("rerank"):
+        os.makedirs(output, exist_ok=True)
+        export_vectors(output, vector_store.index)
+    convert_vector_store(vector_store, index_config)
+    vector_store.save_local(output)
+    build_lexical_index(vector_store).save(output)
+    build_metadata_index(vector_store).save(output)
+    if docstore == "sqlite":
+        export_docstore(vector_store, output)
+        os.remove(os.path.join(output, "index.pkl"))
+    write_index_config(output, index_config)
+    return vector_store
+
+
+class IndexBuilder:
+    def __init__(self, urls, output, shard_size=500, retries=3, index_config=None, docstore="sqlite", shards_dir=None,
+                 catalogue=None):
+        self.urls = list(urls)
+        # With a catalogue, urls that turn out to be gone (404/410) are marked there for the next build
+        self.catalogue = catalogue
+        self.docstore = docstore
+        self.index_config = index_config or create_index_config("flat")
+        self.output = output
+        self.shard_size = shard_size
+        self.retries = retries
+        self.shards_dir = shards_dir or f"{output}-shards"
+        self.checkpoint_path = os.path.join(self.shards_dir, "checkpoint.json")
+
+    def _urls_hash(self):
+        return hashlib.sha256("\n".join(self.urls).encode()).hexdigest()
+
+    def _shard_ranges(self):
+        for start in range(0, len(self.urls), self.shard_size):
+            end = min(start + self.shard_size, len(self.urls)) - 1
+            yield f"{start:05d}-{end:05d}", start, end + 1
+
+    def _load_checkpoint(self, restart):
+        checkpoint = {"urls_hash": self._urls_hash(), "shard_size": self.shard_size, "shards": {}}
+        if restart and os.path.exists(self.shards_dir):
+            shutil.rmtree(self.shards_dir)
+        if os.path.exists(self.checkpoint_path):
+            with open(self.checkpoint_path) as file:
+                saved = json.load(file)
+            if saved["urls_hash"] != checkpoint["urls_hash"] or saved["shard_size"] != self.shard_size:
+                raise ValueError(
+                    f"{self.checkpoint_path} was written for a different URL list or shard size, "
+                    "rerun with --restart to discard it"
+                )
+            checkpoint = saved
+        os.makedirs(self.shards_dir, exist_ok=True)
+        return checkpoint
+
+    def _build_shard(self, name, shard_urls, checkpoint):
+        # Returns the pipeline that ran and the shard's store (None if nothing was indexed). Every attempt
+        # starts from the dedup filter saved after the last completed shard, so chunks kept by earlier shards
+        # are not indexed again.
+        for attempt in range(self.retries):
+            try:
+                if checkpoint.get("dedup"):
+                    dedup_filter = NearDuplicateFilter.load(os.path.join(self.shards_dir, checkpoint["dedup"]))
+                else:
+                    dedup_filter = NearDuplicateFilter()
+                pipeline = create_pipeline(dedup_filter=dedup_filter)
+                return pipeline, pipeline.run(shard_urls)
+            except Exception as e:
+                if attempt == self.retries - 1:
+                    raise
+                wait = 30 * 2 ** attempt
+                print(f"Shard {name} failed ({e}), retrying in {wait}s...")
+                time.sleep(wait)
+
+    def _save_shard(self, shard_path, vector_store):
+        # Save next to the final path first so a crash never leaves a half-written shard
+        shutil.rmtree(f"{shard_path}.tmp", ignore_errors=True)
+        vector_store.save_local(f"{shard_path}.tmp")
+        shutil.rmtree(shard_path, ignore_errors=True)
+        os.replace(f"{shard_path}.tmp", shard_path)
+
+    def build_shards(self, restart=False):
+        checkpoint = self._load_checkpoint(restart)
+        for name, start, end in self._shard_ranges():
+            shard_path = os.path.join(self.shards_dir, name)
+            entry = checkpoint["shards"].get(name)
+            if entry is not None and not entry.get("failed"):
+                print(f"Shard {name} already built, skipping")
+                continue
+
+            if entry is None:
+                print(f"Building shard {name} ({end - start} urls)...")
+                pipeline, vector_store = self._build_shard(name, self.urls[start:end], checkpoint)
+                entry = {"empty": True, "gone": {}, "aliases": None}
+            else:
+                # Built before, but some pages were rate limited or errored: fetch just those and add them
+                print(f"Retrying {len(entry['failed'])} failed urls of shard {name}...")
+                pipeline, vector_store = self._build_shard(name, entry["failed"], checkpoint)
+                if not entry["empty"]:
+                    shard = load_index(shard_path)
+                    if vector_store is not None:
+                        shard.merge_from(vector_store)
+                    vector_store = shard
+            if vector_store is not None:
+                self._save_shard(shard_path, vector_store)
+            failures = pipeline.crawler.failures
+            failed = [url for url, status in failures.items() if is_retryable(status)]
+            gone = {url: status for url, status in failures.items() if str(status) in GONE_STATUSES}
+            if failed:
+                print(f"Shard {name}: {len(failed)} urls failed and will be retried on the next run")
+
+            # The filter state and the shard's aliases of chunks in other shards are written under new names
+            # and only become current with the checkpoint, so a crash before it leaves the last ones intact
+            step = checkpoint.get("dedup_step", 0) + 1
+            dedup_file, aliases_file = f"dedup-{step}.npz", f"aliases-{step}.json"
+            pipeline.dedup_filter.save(os.path.join(self.shards_dir, dedup_file))
+            aliases = self._read_aliases(entry)
+            for doc_id, sources in pipeline.aliases.items():
+                aliases[doc_id] = list(dict.fromkeys(aliases.get(doc_id, []) + sources))
+            _write_json(os.path.join(self.shards_dir, aliases_file), aliases)
+
+            previous = [checkpoint.get("dedup"), entry.get("aliases")]
+            checkpoint["dedup"], checkpoint["dedup_step"] = dedup_file, step
+            checkpoint["shards"][name] = {
+                "urls": end - start,
+                "empty": entry["empty"] and vector_store is None,
+                "failed": failed,
+                "gone": {**entry.get("gone", {}), **gone},
+                "aliases": aliases_file,
+            }
+            _write_json(self.checkpoint_path, checkpoint)
+            for file_name in previous:
+                if file_name:
+                    os.remove(os.path.join(self.shards_dir, file_name))
+        return checkpoint
+
+    def _read_aliases(self, entry):
+        if not entry.get("aliases"):
+            return {}
+        return _read_json(os.path.join(self.shards_dir, entry["aliases"]))
+
+    def failed_urls(self, checkpoint):
+        return [url for entry in checkpoint["shards"].values() for url in entry.get("failed", [])]
+
+    def merge_shards(self, checkpoint):
+        vector_store = None
+        for name, _, _ in self._shard_ranges():
+            if checkpoint["shards"][name]["empty"]:
+                continue
+            shard = load_index(os.path.join(self.shards_dir, name))
+            if vector_store is None:
+                vector_store = shard
+            else:
+                vector_store.merge_from(shard)
+        if vector_store is None:
+            raise ValueError(f"None of the {len(self.urls)} urls produced any chunks, nothing to merge into {self.output}")
+        # Near-duplicates of chunks kept by another shard are only known once the shards are merged
+        aliases = {}
+        for entry in checkpoint["shards"].values():
+            for doc_id, sources in self._read_aliases(entry).items():
+                aliases.setdefault(doc_id, []).extend(sources)
+        apply_aliases(vector_store.docstore, aliases)
+        # Shards are always flat so they can be merged; the final index type is chosen here
+        save_vector_store(vector_store, self.output, self.index_config, self.docstore)
+        if checkpoint.get("dedup"):
+            # Refreshes of the index compare new chunks against the same filter
+            shutil.copyfile(os.path.join(self.shards_dir, checkpoint["dedup"]), os.path.join(self.output, DEDUP_FILE))
+        print(f"Merged {len(checkpoint['shards'])} shards into {self.output}")
+        # The shards are only a resume point for this build; a later build of the same urls must fetch them anew
+        shutil.rmtree(self.shards_dir)
+        return vector_store
+
+    def build(self, restart=False, allow_failures=False):
+        checkpoint = self.build_shards(restart)
+        if self.catalogue:
+            gone = {url: status for entry in checkpoint["shards"].values() for url, status in entry.get("gone", {}).items()}
+            record_statuses(gone, self.catalogue)
+        failed = self.failed_urls(checkpoint)
+        if failed and not allow_failures:
+            raise RuntimeError(
+                f"{len(failed)} urls could not be fetched (rate limited or server errors). Rerun the same command "
+                "to retry just those, or pass --allow-failures to build the index without them"
+            )
+        return self.merge_shards(checkpoint)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the FAISS index in resumable, checkpointed shards")
+    parser.add_argument("--output", default="Swinburne_Chat_Bot")
+    parser.add_argument("--shard-size", type=int, default=500)
+    parser.add_argument("--start", type=int, default=0)
+    parser.add_argument("--end", type=int, default=None)
+    parser.add_argument("--restart", action="store_true", help="discard existing shards and start over")
+    parser.add_argument("--allow-failures", action="store_true", help="merge even if some urls still fail after retrying")
+    parser.add_argument("--index-type", choices=INDEX_TYPES, default="flat")
+    parser.add_argument("--ef-search", type=int)
+    parser.add_argument("--nprobe", type=int)
+    parser.add_argument("--rerank", type=int, help="for fp16/sq8/pq: re-rank k * RERANK candidates exactly")
+    parser.add_argument("--docstore", choices=["sqlite", "pickle"], default="sqlite")
+    parser.add_argument("--publish", action="store_true", help="build a new version inside --output and make it current")
+    parser.add_argument("--split-by-domain", action="store_true", help="build one index per domain, served as a sharded index")
+    parser.add_argument("--only", help="with --split-by-domain: rebuild just this domain's shard")
+    args = parser.parse_args()
+
+    urls = load_urls()[args.start:args.end]
+    # Each entry is (index directory, directory its build shards are kept in, urls)
+    if args.split_by_domain:
+        domains = sorted({url_metadata(url)["domain"] for url in urls})
+        if args.only and args.only not in domains:
+            parser.error(f"--only {args.only} is not one of the domains: {', '.join(domains)}")
+        urls_by_domain = {domain: [url for url in urls if url_metadata(url)["domain"] == domain] for domain in domains}
+        builds = [
+            (os.path.join(args.output, shard_name(domain)), f"{args.output}-shards/{shard_name(domain)}", urls_by_domain[domain])
+            for domain in domains if not args.only or domain == args.only
+        ]
+    else:
+        builds = [(args.output, f"{args.output}-shards", urls)]
+
+    for output, shards_dir, build_urls in builds:
+        index_config = create_index_config(args.index_type, ef_search=args.ef_search, nprobe=args.nprobe, rerank=args.rerank)
+        # Published builds keep their shards beside the versioned directory, so a resumed build finds them
+        # whatever version name it ends up with
+        version = new_version_name() if args.publish else None
+        IndexBuilder(
+            build_urls, os.path.join(output, version) if version else output, args.shard_size,
+            index_config=index_config, docstore=args.docstore, shards_dir=shards_dir, catalogue=CATALOGUE_PATH,
+        ).build(args.restart, args.allow_failures)
+        if version:
+            publish_version(output, version)
+            print(f"Published {version} as the current version of {output}; POST /admin/reload to serve it")
+    if args.split_by_domain and not args.only:
+        write_shard_manifest(args.output, "domain", domains)
@@ -0,0 +1,41 @@
+import csv
+import gzip
+import os
+
+CATALOGUE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "urls.csv.gz")
+FIELDS = ["url", "lastmod", "changefreq", "priority", "status"]
+GONE_STATUSES = {"404", "410"}
+
+# URL catalogue used by the index builds. It is only read when a build asks for it,
+# so nothing on the serving path pays for parsing or holding the URL list.
+
+def save_catalogue(entries, filename=CATALOGUE_PATH):
+    tmp_path = f"{filename}.tmp"
+    with gzip.open(tmp_path, 'wt', newline='') as file:
+        writer = csv.DictWriter(file, fieldnames=FIELDS, extrasaction='ignore')
+        writer.writeheader()
+        for entry in entries:
+            writer.writerow({field: entry.get(field) or "" for field in FIELDS})
+    os.replace(tmp_path, filename)
+
+def iter_catalogue(filename=CATALOGUE_PATH):
+    with gzip.open(filename, 'rt', newline='') as file:
+        yield from csv.DictReader(file)
+
+def record_statuses(statuses, filename=CATALOGUE_PATH):
+    # Stores the status a build or refresh got for each url; 404 and 410 keep it out of load_urls until the
+    # next discovery run writes a fresh catalogue
+    if not statuses or not os.path.exists(filename):
+        return
+    statuses = {url: str(status) for url, status in statuses.items()}
+    # Streams the old catalogue into the new one; save_catalogue only replaces it once fully written
+    save_catalogue(
+        ({**entry, "status": statuses.get(entry["url"], entry["status"])} for entry in iter_catalogue(filename)),
+        filename,
+    )
+
+def load_urls(filename=CATALOGUE_PATH, include_gone=False):
+    return [
+        entry["url"] for entry in iter_catalogue(filename)
+        if include_gone or entry["status"] not in GONE_STATUSES
+    ]
@@ -1,14 +1,27 @@
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain.chains.combine_documents import create_stuff_documents_chain
 from langchain.chains.retrieval import create_retrieval_chain
-from langchain_core.messages import HumanMessage, AIMessage
+from session_store import SessionStore
+from suggestions import SuggestionEngine
+
+# Seconds from the start of a chat request after which the answer is returned without similar questions
+SIMILAR_QUESTIONS_DEADLINE = float(os.getenv('SIMILAR_QUESTIONS_DEADLINE', "10"))
 
 class ChatBot:
-    def __init__(self, vector_db):
+    def __init__(self, vector_db, sessions=None, topics_db=None):
         self.vector_db = vector_db
         self.chain = self._create_chain()
-        self.chat_history = []
+        # History is kept per session, so each prompt only carries its own user's (bounded) conversation
+        self.sessions = sessions or SessionStore()
+        self.similar_questions_deadline = SIMILAR_QUESTIONS_DEADLINE
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="similar-questions")
+        # With the topics index, suggestions are past student questions and the LLM only fills in gaps
+        self.suggestions = SuggestionEngine(topics_db, fallback=self.agenerate_similar_questionsWithFormat) if topics_db else None
 
     def _create_chain(self):
         model = ChatOpenAI(model="gpt-4o", temperature=0.5)
@@ -46,34 +59,112 @@ class ChatBot:
             'chat_history': chat_history
         })
         return response['answer']
-    
+
+    # Async versions of the chat path for the API: the OpenAI calls are awaited and the vector search runs on
+    # the database's search threads, so the event loop keeps serving other chats meanwhile
+    async def aprocess_chat(self, query, chat_history):
+        response = await self.chain.ainvoke({
+            'input': query,
+            'chat_history': chat_history
+        })
+        return response['answer']
+
+    def _similar_questions_prompt(self, query):
+        return f"Generate 4 similar questions in bullet points related to: '{query}'. The questions should be about Swinburne University."
+
     def generate_similar_questions(self, query):
-        prompt = f"Generate 4 similar questions in bullet points related to: '{query}'. The questions should be about Swinburne University."
-        response = self.process_chat(prompt, [])
+        response = self.process_chat(self._similar_questions_prompt(query), [])
+        questions = response.split('\n')
+        return questions[1:]
+
+    async def agenerate_similar_questions(self, query):
+        response = await self.aprocess_chat(self._similar_questions_prompt(query), [])
         questions = response.split('\n')
         return questions[1:]
+
+    async def asuggest_questions(self, query):
+        if self.suggestions is None:
+            return await self.agenerate_similar_questions(query)
+        return await self.suggestions.asuggest(query)
     
-    def generate_similar_questionsWithFormat(self, query):
+    async def agenerate_similar_questionsWithFormat(self, query):
+        # Nothing but the questions, one per line, so no line has to be dropped as a preamble (the suggestion fallback)
         prompt = f"Generate 4 similar questions in bullet points related to: '{query}'. The questions should be about Swinburne University. You dont need to write anything beside topics. Just each topic seperate. No - in the front as well"
-        response = self.process_chat(prompt, [])
-        questions = response.split('\n')
-        return questions
+        response = await self.aprocess_chat(prompt, [])
+        return [question for question in response.split('\n') if question.strip()]
 
     def process_chat_with_similar_questions(self, query):
         similar_questions = self.generate_similar_questions(query)
         return "*".join(similar_questions)
     
-    def process_user_input(self, user_input):
-        self.chat_history.append(HumanMessage(content=user_input))
-        ai_output = self.process_chat(user_input, self.chat_history)
-        self.chat_history.append(AIMessage(content=ai_output))
-        similar_questions = self.process_chat_with_similar_questions(user_input)
+    def process_user_input(self, user_input, session=None):
+        # Similar questions only depend on the input, so they are generated alongside the answer
+        start = time.monotonic()
+        similar = self._executor.submit(self.process_chat_with_similar_questions, user_input)
+        # The question itself goes in as {input}; chat_history holds the earlier turns only
+        ai_output = self.process_chat(user_input, self.sessions.history(session))
+        self.sessions.append(session, user_input, ai_output)
+        try:
+            similar_questions = similar.result(timeout=max(0.0, start + self.similar_questions_deadline - time.monotonic()))
+        except FutureTimeoutError:
+            print(f"Similar questions missed the {self.similar_questions_deadline}s deadline")
+            similar_questions = ""
+        except Exception as e:
+            print(f"Could not generate similar questions: {e}")
+            similar_questions = ""
         return ai_output, similar_questions
-    
+
+    async def aprocess_user_input(self, user_input, session=None):
+        start = time.monotonic()
+        similar = asyncio.create_task(self.asuggest_questions(user_input))
+        try:
+            ai_output = await self.aprocess_chat(user_input, self.sessions.history(session))
+        except BaseException:
+            similar.cancel()
+            raise
+        self.sessions.append(session, user_input, ai_output)
+        return ai_output, await self._similar_questions_by_deadline(similar, start)
+
+    async def astream_user_input(self, user_input, session=None):
+        # Yields ("token", text) as the answer is generated, then ("similar_questions", "q1*q2*...")
+        start = time.monotonic()
+        similar = asyncio.create_task(self.asuggest_questions(user_input))
+        tokens = []
+        try:
+            async for chunk in self.chain.astream({'input': user_input, 'chat_history': self.sessions.history(session)}):
+                # The retrieval chain also streams its input and the retrieved context; only answer chunks are text
+                if chunk.get('answer'):
+                    tokens.append(chunk['answer'])
+                    yield "token", chunk['answer']
+        except BaseException:
+            # Also reached when the client disconnects and the generator is closed
+            similar.cancel()
+            raise
+        self.sessions.append(session, user_input, "".join(tokens))
+        yield "similar_questions", await self._similar_questions_by_deadline(similar, start)
+
+    async def _similar_questions_by_deadline(self, similar, start):
+        # The answer is never held back for them: past the deadline it goes out without similar questions
+        try:
+            return "*".join(
+                await asyncio.wait_for(similar, max(0.0, start + self.similar_questions_deadline - time.monotonic()))
+            )
+        except asyncio.TimeoutError:
+            print(f"Similar questions missed the {self.similar_questions_deadline}s deadline")
+        except Exception as e:
+            print(f"Could not generate similar questions: {e}")
+        return ""
+
     # this is for checking spelling only, this is needed because this does not need the swinbunre only commands
     def checkQuerySpelling(self, query):
         prompt = f"Check spelling only, just return the correct form: '{query}'."
         model = ChatOpenAI(model="gpt-4o", temperature=0.5)
         response = model.invoke(prompt)
         topic = response.content
-        return topic
\ No newline at end of file
+        return topic
+
+    async def acheckQuerySpelling(self, query):
+        prompt = f"Check spelling only, just return the correct form: '{query}'."
+        model = ChatOpenAI(model="gpt-4o", temperature=0.5)
+        response = await model.ainvoke(prompt)
+        return response.content
\ No newline at end of file
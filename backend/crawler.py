@@ -0,0 +1,151 @@
+import asyncio
+import os
+import sys
+import time
+from urllib.parse import urlparse
+
+import aiohttp
+from bs4 import BeautifulSoup
+from langchain_core.documents import Document
+from langchain_community.document_loaders.web_base import _build_metadata, default_header_template
+from metadata_index import url_metadata
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+def is_retryable(status):
+    # Rate limited, server error or no response at all: worth fetching again later
+    return status is None or status in RETRY_STATUSES
+
+
+class Page:
+    def __init__(self, url, status, content=b"", headers=None, encoding=None):
+        self.url = url
+        self.status = status
+        self.content = content
+        self.headers = headers or {}
+        self.encoding = encoding
+
+    @property
+    def ok(self):
+        return self.status == 200
+
+    @property
+    def retryable(self):
+        return is_retryable(self.status)
+
+
+def page_to_document(page, parser="html.parser", stripper=None):
+    # Same shape as WebBaseLoader: soup text plus source/title/description/language, plus the
+    # domain/section/page_type used by filtered search, optionally without the site template blocks
+    soup = BeautifulSoup(page.content, parser, from_encoding=page.encoding)
+    metadata = _build_metadata(soup, page.url)
+    metadata.update(url_metadata(page.url))
+    if stripper is not None:
+        stripper.strip(soup)
+    return Document(page_content=soup.get_text(), metadata=metadata)
+
+
+class AsyncWebCrawler:
+    def __init__(self, concurrency=32, per_host=8, delay=0.1, timeout=30, retries=3, headers=None):
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.delay = delay
+        self.timeout = timeout
+        self.retries = retries
+        self.headers = dict(headers or default_header_template)
+        if os.getenv('USER_AGENT'):
+            self.headers["User-Agent"] = os.getenv('USER_AGENT')
+        self._host_locks = {}
+        self._host_next = {}
+        # url -> status (None when no response came back) of every page that was not a 200 or a 304
+        self.failures = {}
+
+    def _create_session(self):
+        connector = aiohttp.TCPConnector(limit=self.concurrency, limit_per_host=self.per_host)
+        return aiohttp.ClientSession(
+            connector=connector,
+            headers=self.headers,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        )
+
+    async def _wait_for_host(self, host):
+        # Politeness: space out request starts to the same host by at least `delay` seconds
+        lock = self._host_locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            now = time.monotonic()
+            start = max(now, self._host_next.get(host, now))
+            self._host_next[host] = start + self.delay
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    async def _fetch(self, session, url, headers=None):
+        host = urlparse(url).netloc
+        # retries is the number of attempts; there is always at least one
+        attempts = max(self.retries, 1)
+        for attempt in range(attempts):
+            await self._wait_for_host(host)
+            try:
+                async with session.get(url, headers=headers) as response:
+                    if response.status in RETRY_STATUSES and attempt < attempts - 1:
+                        retry_after = response.headers.get("Retry-After", "")
+                        await asyncio.sleep(float(retry_after) if retry_after.isdigit() else 2 ** attempt)
+                        continue
+                    content = await response.read() if response.status == 200 else b""
+                    return Page(url, response.status, content, dict(response.headers), response.charset)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt == attempts - 1:
+                    print(f"Failed to retrieve {url}: {e}")
+                    return Page(url, None)
+                await asyncio.sleep(2 ** attempt)
+
+    async def iter_pages(self, urls, headers_for=None):
+        # Yields pages as they complete, keeping at most `concurrency` requests in flight
+        urls = iter(urls)
+        async with self._create_session() as session:
+            pending = set()
+            while True:
+                while len(pending) < self.concurrency:
+                    url = next(urls, None)
+                    if url is None:
+                        break
+                    headers = headers_for(url) if headers_for else None
+                    pending.add(asyncio.ensure_future(self._fetch(session, url, headers)))
+                if not pending:
+                    break
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    page = task.result()
+                    if not page.ok and page.status != 304:
+                        self.failures[page.url] = page.status
+                    yield page
+
+    async def fetch_all(self, urls, headers_for=None):
+        pages = {}
+        async for page in self.iter_pages(urls, headers_for):
+            pages[page.url] = page
+        return pages
+
+    def fetch(self, urls, headers_for=None):
+        urls = list(urls)
+        pages = asyncio.run(self.fetch_all(urls, headers_for))
+        return [pages[url] for url in urls]
+
+    def load(self, urls):
+        # Pages that could not be fetched are left out of the result and listed in self.failures
+        documents = []
+        for page in self.fetch(urls):
+            if page.ok:
+                documents.append(page_to_document(page))
+            elif page.status is not None:
+                print(f"Failed to retrieve {page.url} (status {page.status})")
+        return documents
+
+
+if __name__ == "__main__":
+    # e.g. python crawler.py http://127.0.0.1:8001/a.html http://127.0.0.1:8001/b.html
+    start = time.monotonic()
+    documents = AsyncWebCrawler().load(sys.argv[1:])
+    for document in documents:
+        print(document.metadata["source"], len(document.page_content))
+    print(f"Loaded {len(documents)} documents in {time.monotonic() - start:.2f}s")
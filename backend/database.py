@@ -1,25 +1,227 @@
 import os
-from langchain_openai import OpenAIEmbeddings
+import asyncio
+import glob
+import json
+import pickle
+import shutil
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, Optional
+import faiss
+import numpy as np
+from embedding_cache import create_embedder, embed_queries
+from mmap_index import VECTORS_FILE, MmapFlatIndex, export_vectors, has_fresh_vectors
+from ann_index import RerankIndex, can_remove_rows, read_index_config, apply_search_params, remove_rows
+from sqlite_docstore import DOCSTORE_FILE, load_index_ids, open_docstore, write_ids
+from wal import IndexLock, LogCursor, WriteAheadLog, fcntl
+from lexical_index import LexicalIndex
+from metadata_index import MetadataIndex, document_fields, parse_filter, selector_params
+from index_versions import current_version, list_versions, publish_version, resolve_version
 from langchain_community.vectorstores.faiss import FAISS
 from langchain_core.documents import Document
+from langchain_core.retrievers import BaseRetriever
 from dotenv import load_dotenv
 # from create_vector_store import storeVector
-from urls_list import urls
 load_dotenv()
 
+# How many candidates per result a filtered search fetches from an index that takes no selector (pq)
+FILTER_OVERFETCH = 10
+
+# Written last into a save's temp directory; a load that finds it finishes the interrupted save
+COMMIT_FILE = "COMMIT"
+
+# Async retrieval runs the blocking embed + FAISS search here, off the event loop. Bounded so a burst of
+# chats queues for search threads instead of starting one thread per request.
+SEARCH_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv('VECTOR_DB_SEARCH_THREADS', "8")), thread_name_prefix="vector-search"
+)
+
+
+def _fsync(path):
+    with open(path, "rb") as file:
+        os.fsync(file.fileno())
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+class StaleIndexError(RuntimeError):
+    # Another process saved the index since this one loaded it, so writing from this copy would undo that save
+    pass
+
+
+class ReadWriteLock:
+    # Any number of readers, or one writer. A waiting writer holds back new readers, so a steady stream of
+    # searches cannot starve it. Both sides are re-entrant, and the writer may read; a reader must not write.
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._readers = 0
+        self._writer = None
+        self._writes = 0
+        self._writers_waiting = 0
+        self._local = threading.local()
+
+    def reading(self):
+        return getattr(self._local, "reads", 0) > 0
+
+    @contextmanager
+    def read(self):
+        reads = getattr(self._local, "reads", 0)
+        if not reads and self._writer != threading.get_ident():
+            with self._condition:
+                while self._writer is not None or self._writers_waiting:
+                    self._condition.wait()
+                self._readers += 1
+        self._local.reads = reads + 1
+        try:
+            yield
+        finally:
+            self._local.reads = reads
+            if not reads and self._writer != threading.get_ident():
+                with self._condition:
+                    self._readers -= 1
+                    if not self._readers:
+                        self._condition.notify_all()
+
+    @contextmanager
+    def write(self):
+        with self._condition:
+            if self._writer != threading.get_ident():
+                self._writers_waiting += 1
+                while self._writer is not None or self._readers:
+                    self._condition.wait()
+                self._writers_waiting -= 1
+                self._writer = threading.get_ident()
+            self._writes += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._writes -= 1
+                if not self._writes:
+                    self._writer = None
+                    self._condition.notify_all()
+
+
 class VectorDB:
-    def __init__(self, vector_path):
-        self.vector_path = vector_path
-        self.vector_store = self._load_or_create_vector_store()
+    def __init__(self, vector_path, mmap=None, ef_search=None, nprobe=None, version=None):
+        # A versioned directory (see index_versions.py) is served from its CURRENT version unless one is given
+        self.root = vector_path
+        self.version = version or current_version(vector_path)
+        self.vector_path = resolve_version(vector_path, self.version)
+        # Read-only memory-mapped vectors shared by all uvicorn workers, see mmap_index.py
+        self.mmap = os.getenv('VECTOR_DB_MMAP') == '1' if mmap is None else mmap
+        # index_config.json says which index type index.faiss holds (flat, hnsw, ivf or a compressed type), see ann_index.py
+        self.index_config = read_index_config(self.vector_path)
+        self.search_params = {
+            "ef_search": ef_search or os.getenv('VECTOR_DB_EF_SEARCH'),
+            "nprobe": nprobe or os.getenv('VECTOR_DB_NPROBE'),
+        }
+        # docstore.sqlite replaces the pickled docstore in index.pkl when present, see sqlite_docstore.py
+        self.sqlite = os.path.exists(os.path.join(self.vector_path, DOCSTORE_FILE))
+        self._read_only = False
+        self._files = None
+        self.closed = False
+        # Writes are logged to index.wal and folded into the index files every VECTOR_DB_COMPACT_INTERVAL seconds.
+        # Every worker follows the log into its own memory; only the one holding index.lock writes to the
+        # directory, and a save by one makes the others stale until they reload (see wal.py)
+        self.wal = WriteAheadLog.for_index(self.vector_path)
+        self.index_lock = IndexLock.for_index(self.vector_path)
+        self.compact_interval = float(os.getenv('VECTOR_DB_COMPACT_INTERVAL', 60))
+        # _lock orders this worker's writes and saves. Searches hold the read side of _searches and only
+        # wait while a write changes the in-memory index, not while a save writes the files.
+        self._lock = threading.RLock()
+        self._searches = ReadWriteLock()
+        self._compact_timer = None
+        # BM25 over chunk text (index.bm25.npz, see lexical_index.py); retrieval fuses it with the vector search
+        # when VECTOR_DB_HYBRID=1
+        self.hybrid = os.getenv('VECTOR_DB_HYBRID', '0') == '1'
+        self._recover_interrupted_save()
+        with self.index_lock.shared():
+            self.vector_store = self._load_or_create_vector_store()
+            self.lexical = LexicalIndex.load(self.vector_path) if LexicalIndex.exists(self.vector_path) else None
+            # domain / section / page_type bitmaps for filtered search (index.filters.npz, see metadata_index.py)
+            self.metadata_index = self._load_metadata_index()
+            self._log = LogCursor(self.wal)
+            self._files = self._files_stamp()
+        self._follow_log()
+        if self._log.has_records():
+            self._schedule_compaction()
+
+    def _index_file_path(self):
+        return os.path.join(self.vector_path, "index.faiss")
+
+    def _load_mmap_index(self):
+        if self.index_config["type"] == "flat":
+            if not has_fresh_vectors(self.vector_path):
+                export_vectors(self.vector_path, faiss.read_index(self._index_file_path()))
+            return MmapFlatIndex.load(self.vector_path)
+        if self.index_config["type"] == "ivf":
+            # faiss maps the inverted lists straight out of index.faiss
+            return faiss.read_index(self._index_file_path(), faiss.IO_FLAG_MMAP)
+        print(f"{self.index_config['type']} indexes cannot be memory-mapped, loading {self.vector_path} into memory")
+        return None
+
+    def _ensure_writable(self):
+        # Writes need an in-memory FAISS index; mmap'd files are rewritten on save
+        if self._read_only:
+            with self.index_lock.shared():
+                # index.faiss has to be the file this snapshot mapped, not a later save's
+                self._check_current()
+                self.vector_store.index = self._wrap_index(faiss.read_index(self._index_file_path()))
+            self._read_only = False
+
+    def _wrap_index(self, index):
+        apply_search_params(index, self._search_config())
+        factor = self.index_config.get("rerank")
+        if factor and os.path.exists(os.path.join(self.vector_path, VECTORS_FILE)):
+            return RerankIndex.load(index, self.vector_path, factor)
+        return index
+
+    def _search_config(self):
+        overrides = {key: int(value) for key, value in self.search_params.items() if value}
+        return {**self.index_config, **overrides}
+
+    def _load_docstore(self):
+        if self.sqlite:
+            return open_docstore(self.vector_path)
+        with open(os.path.join(self.vector_path, "index.pkl"), "rb") as file:
+            return pickle.load(file)
 
     def _load_vector_store(self):
-        embedder = OpenAIEmbeddings()
-        return FAISS.load_local(
-            self.vector_path,
-            embedder,
-            index_name="index",
-            allow_dangerous_deserialization=True
-        )
+        embedder = create_embedder()
+        index = self._load_mmap_index() if self.mmap else None
+        if index is None and not self.sqlite:
+            vector_store = FAISS.load_local(
+                self.vector_path,
+                embedder,
+                index_name="index",
+                allow_dangerous_deserialization=True
+            )
+        else:
+            if index is None:
+                index = faiss.read_index(self._index_file_path())
+            else:
+                self._read_only = True
+            docstore, index_to_docstore_id = self._load_docstore()
+            if len(index_to_docstore_id) > index.ntotal:
+                # An index_map table from before index.ids.npy can hold rows a crash kept out of the last save
+                index_to_docstore_id.ids = index_to_docstore_id.ids[:index.ntotal]
+            vector_store = FAISS(embedder, index, docstore, index_to_docstore_id)
+        if not isinstance(vector_store.index, MmapFlatIndex):
+            vector_store.index = self._wrap_index(vector_store.index)
+        return vector_store
 
     def _load_or_create_vector_store(self):
         index_file_path = os.path.join(self.vector_path, "index.faiss")
@@ -48,15 +250,551 @@ class VectorDB:
         
         return vector_store
 
-    def get_retriever(self):
-        return self.vector_store.as_retriever(
-            search_type="similarity",
-            search_kwargs={'k': 1}
+    def get_retriever(self, filter=None):
+        return SnapshotRetriever(vector_db=self, k=1, filter=filter)
+
+    def _load_metadata_index(self):
+        if not MetadataIndex.exists(self.vector_path):
+            return None
+        metadata_index = MetadataIndex.load(self.vector_path)
+        if metadata_index.rows != self.vector_store.index.ntotal:
+            print(f"Ignoring {self.vector_path} metadata index: {metadata_index.rows} rows for {self.vector_store.index.ntotal} vectors")
+            return None
+        return metadata_index
+
+    def _recover_interrupted_save(self):
+        if not glob.glob(f"{glob.escape(self.vector_path)}.*.tmp"):
+            return
+        with self.index_lock.exclusive():
+            # Whoever left these behind is no longer saving, or it would hold the lock
+            for tmp_path in glob.glob(f"{glob.escape(self.vector_path)}.*.tmp"):
+                pid = tmp_path[len(self.vector_path) + 1:-len(".tmp")]
+                if fcntl is None and pid.isdigit() and int(pid) != os.getpid() and _pid_alive(int(pid)):
+                    # Without flock (Windows) only the pid tells that another worker is saving right now
+                    continue
+                if os.path.exists(os.path.join(tmp_path, COMMIT_FILE)):
+                    print(f"Finishing an interrupted save of {self.vector_path}")
+                    self._commit(tmp_path)
+                else:
+                    shutil.rmtree(tmp_path)
+
+    def _files_stamp(self):
+        try:
+            stat = os.stat(self._index_file_path())
+        except FileNotFoundError:
+            # Being rebuilt right now; the rebuilt file will differ from the one loaded
+            return self._files
+        return stat.st_ino, stat.st_mtime_ns
+
+    def stale(self):
+        # True once another process saved or rebuilt the index: reload to see its files (ReloadableVectorDB
+        # does this by itself)
+        return self._log.replaced() or self._files_stamp() != self._files
+
+    def close(self):
+        # For a snapshot a reload replaced, once the searches on it are done. Writes logged here and not yet
+        # saved are folded in first (unless another worker's save already has them).
+        self.compact()
+        with self._lock:
+            if self._compact_timer is not None:
+                self._compact_timer.cancel()
+                self._compact_timer = None
+            with self._searches.write():
+                self._log.close()
+                if self.sqlite:
+                    self.vector_store.docstore.close()
+                self.closed = True
+
+    def _check_current(self):
+        if self._log.replaced():
+            raise StaleIndexError(f"{self.vector_path} was saved by another process since it was loaded here; reload it and retry")
+
+    def _follow_log(self):
+        # Applies the records this and other workers appended since the last call. When this worker is busy
+        # writing or saving, that thread applies them, and searches meanwhile go on with what they have.
+        if self._searches.reading() or not self._log.pending() or not self._lock.acquire(blocking=False):
+            return
+        try:
+            with self.index_lock.shared():
+                # Saved by another worker in between: its files already hold these records, and this
+                # snapshot goes on as it is until it is reloaded
+                if self._log.replaced():
+                    return
+                records = self._log.read()
+                if records:
+                    with self._searches.write():
+                        self._ensure_writable()
+                        self._apply_records(records)
+        finally:
+            self._lock.release()
+
+    def _apply_records(self, records):
+        # A log only holds writes made after the files it follows were saved, so adds never repeat a saved id
+        for record in records:
+            if record["op"] == "add":
+                self._apply_add(record["ids"], record["vectors"], [Document(**document) for document in record["documents"]])
+            else:
+                # The ids were live when logged, but an earlier record may have deleted some of them since
+                existing_ids = set(self.vector_store.index_to_docstore_id.values())
+                ids = [doc_id for doc_id in record["ids"] if doc_id in existing_ids]
+                if ids:
+                    self._apply_delete(ids)
+
+    def _schedule_compaction(self):
+        if self._compact_timer is None:
+            self._compact_timer = threading.Timer(self.compact_interval, self.compact)
+            self._compact_timer.daemon = True
+            self._compact_timer.start()
+
+    def compact(self):
+        with self._lock:
+            self._compact_timer = None
+            if not self._log.has_records():
+                return
+            try:
+                self.save()
+            except StaleIndexError:
+                # Another worker saved first, and with it everything this one logged
+                pass
+
+    def save(self):
+        # Write beside the live files and rename over them: other workers may have index.faiss mmap'd,
+        # and truncating it in place would pull the pages out from under them
+        with self._lock:
+            if self._compact_timer is not None:
+                self._compact_timer.cancel()
+                self._compact_timer = None
+            with self.index_lock.exclusive():
+                # Nothing can be logged while this process holds the lock, so the new log starts with nothing lost
+                self._check_current()
+                self._follow_log()
+                if self._read_only:
+                    # Nothing can have changed while the index is still the read-only mmap'd one
+                    return
+                # Searches go on while the files are written: nothing else changes the index under _lock
+                tmp_path = f"{self.vector_path}.{os.getpid()}.tmp"
+                os.makedirs(tmp_path, exist_ok=True)
+                index = self.vector_store.index
+                docstore = self.vector_store.docstore
+                mapping = self.vector_store.index_to_docstore_id
+                faiss.write_index(index.index if isinstance(index, RerankIndex) else index, os.path.join(tmp_path, "index.faiss"))
+                if self.sqlite:
+                    write_ids(tmp_path, [doc_id for _, doc_id in sorted(mapping.items())])
+                    docstore.write_added()
+                else:
+                    with open(os.path.join(tmp_path, "index.pkl"), "wb") as file:
+                        pickle.dump((docstore, mapping), file)
+                if isinstance(index, RerankIndex):
+                    index.save_vectors(tmp_path)
+                if self.lexical is not None:
+                    self.lexical.save(tmp_path)
+                if self.metadata_index is not None:
+                    self.metadata_index.save(tmp_path)
+                for filename in os.listdir(tmp_path):
+                    _fsync(os.path.join(tmp_path, filename))
+
+                # Once COMMIT exists the save counts as done, and a crash from here on is rolled forward on the next load
+                commit_path = os.path.join(tmp_path, COMMIT_FILE)
+                with open(f"{commit_path}.tmp", 'w') as file:
+                    json.dump({"generation": self._log.generation + 1}, file)
+                    file.flush()
+                    os.fsync(file.fileno())
+                os.replace(f"{commit_path}.tmp", commit_path)
+                self._commit(tmp_path)
+                with self._searches.write():
+                    if isinstance(index, RerankIndex):
+                        # The saved file now holds every live vector: map it and start a new buffer
+                        index.reopen(self.vector_path)
+                    if self.sqlite:
+                        # A delete leaves a renumbered plain dict behind; the saved ids file matches it
+                        self.vector_store.index_to_docstore_id = load_index_ids(self.vector_path)
+                    self._log.reset()
+                    self._files = self._files_stamp()
+                if self.sqlite:
+                    docstore.write_deleted()
+                if self.mmap and self.index_config["type"] == "flat":
+                    export_vectors(self.vector_path, self.vector_store.index)
+
+    def _commit(self, tmp_path):
+        # Safe to repeat, so a crash part-way through is finished by the next load
+        with open(os.path.join(tmp_path, COMMIT_FILE)) as file:
+            commit = json.load(file)
+        if isinstance(commit, dict):
+            generation = commit["generation"]
+        else:
+            # Left by a save from before the log had generations; for SQLite it holds the row mapping
+            if commit is not None:
+                write_ids(tmp_path, commit)
+            generation = self.wal.generation() + 1
+        for filename in os.listdir(tmp_path):
+            if filename != COMMIT_FILE:
+                os.replace(os.path.join(tmp_path, filename), os.path.join(self.vector_path, filename))
+        # Repeated after a crash, the new log may already have records other workers appended to it
+        if self.wal.generation() < generation:
+            self.wal.start(generation)
+        os.remove(os.path.join(tmp_path, COMMIT_FILE))
+        os.rmdir(tmp_path)
+
+    def _apply_add(self, ids, vectors, documents):
+        self.vector_store.add_embeddings(
+            list(zip([document.page_content for document in documents], vectors)),
+            metadatas=[document.metadata for document in documents],
+            ids=ids,
         )
+        if self.lexical is not None:
+            self.lexical.add(ids, [document.page_content for document in documents])
+        if self.metadata_index is not None:
+            self.metadata_index.add([document.metadata for document in documents])
+
+    def _apply_delete(self, ids):
+        # FAISS.delete, with the rows removed through remove_rows so HNSW indexes can delete too
+        vector_store = self.vector_store
+        deleted = set(ids)
+        mapping = sorted(vector_store.index_to_docstore_id.items())
+        rows = [row for row, doc_id in mapping if doc_id in deleted]
+        # FAISS first: if it refuses the delete, nothing else has changed yet
+        remove_rows(vector_store.index, rows)
+        vector_store.docstore.delete(ids)
+        vector_store.index_to_docstore_id = dict(enumerate(doc_id for _, doc_id in mapping if doc_id not in deleted))
+        if self.metadata_index is not None:
+            self.metadata_index.delete_rows(rows)
+        if self.lexical is not None:
+            self.lexical.delete(ids)
+
+    def _log_and_apply(self, log):
+        # Called with the IndexLock held exclusively, so no other worker can read the record before it is applied
+        offset = log()
+        try:
+            # Applied by following the log, in the order every other worker applies it
+            self._follow_log()
+        except Exception:
+            # Never acknowledged: drop the record, or every load that replays the log would fail on it too
+            self.wal.truncate(offset)
+            self._log.rewind(offset)
+            raise
+
+    def add_documents(self, documents, ids=None, save=True):
+        # save=True makes the write durable before returning: it is appended to the log, which every worker
+        # follows, not rewritten into the index files. save=False only changes this process's copy until the
+        # caller runs save() itself.
+        if not documents:
+            return []
+        ids = ids or [str(uuid.uuid4()) for _ in documents]
+        vectors = self.vector_store.embeddings.embed_documents([document.page_content for document in documents])
+        if len(vectors[0]) != self.vector_store.index.d:
+            raise ValueError(f"{len(vectors[0])}-dimensional embeddings cannot go into the {self.vector_store.index.d}-dimensional index {self.vector_path}")
+        with self._lock:
+            if not save:
+                with self._searches.write():
+                    self._ensure_writable()
+                    self._apply_add(ids, vectors, documents)
+                return ids
+            with self.index_lock.exclusive():
+                self._check_current()
+                self._log_and_apply(lambda: self.wal.log_add(ids, vectors, documents, self._log.generation))
+                self._schedule_compaction()
+        return ids
+
+    def delete_documents(self, ids, save=True):
+        if not can_remove_rows(self.vector_store.index):
+            raise ValueError(f"{self.index_config['type']} indexes cannot delete documents; rebuild {self.vector_path} without them instead")
+        with self._lock:
+            if save:
+                self._follow_log()
+            # Ids that are already gone (e.g. a refresh interrupted before the manifest was saved) are ignored
+            existing_ids = set(self.vector_store.index_to_docstore_id.values())
+            ids = [doc_id for doc_id in set(ids) if doc_id in existing_ids]
+            if not ids:
+                return ids
+            if not save:
+                with self._searches.write():
+                    self._ensure_writable()
+                    self._apply_delete(ids)
+                return ids
+            with self.index_lock.exclusive():
+                self._check_current()
+                self._log_and_apply(lambda: self.wal.log_delete(ids, self._log.generation))
+                self._schedule_compaction()
+        return ids
+
+    @contextmanager
+    def _reading(self):
+        # Searches see every write logged before they start, and FAISS, the row mapping and the docstore
+        # do not change under them until they finish
+        self._follow_log()
+        with self._searches.read():
+            yield
+
+    def similarity_search(self, query, k=5, filter=None):
+        return self.similarity_search_batch([query], k=k, filter=filter)[0]
+
+    def hybrid_search(self, query, k=5, fetch_k=20, rrf_k=60, filter=None):
+        return [document for document, _ in self.hybrid_search_with_score(query, k, fetch_k, rrf_k, filter)]
+
+    def hybrid_search_with_score(self, query, k=5, fetch_k=20, rrf_k=60, filter=None):
+        # Reciprocal rank fusion of the vector and BM25 rankings. It works on ranks, so L2 distances and BM25
+        # scores never need putting on one scale; a chunk both searches rank highly comes first.
+        vector = self.vector_store.embeddings.embed_query(query)
+        with self._reading():
+            vector_ranking, lexical_ranking, exact = self._hybrid_rankings(query, fetch_k, filter, vector)
+            fused = reciprocal_rank_fusion([vector_ranking, lexical_ranking], rrf_k)
+            best = fused_order(fused, exact)[:k]
+            documents = self._documents(best)
+        return [(documents[doc_id], fused[doc_id]) for doc_id in best if doc_id in documents]
+
+    def hybrid_rankings(self, query, fetch_k=20, filter=None, vector=None):
+        # The two rankings hybrid search fuses, as (doc_id, score) lists: L2 distances first, then BM25 scores;
+        # then the set of BM25 results that contain the codes the query names (see fused_order).
+        # `vector` is the query's embedding when the caller already has it (e.g. ShardedVectorDB).
+        if vector is None:
+            vector = self.vector_store.embeddings.embed_query(query)
+        with self._reading():
+            return self._hybrid_rankings(query, fetch_k, filter, vector)
+
+    def _hybrid_rankings(self, query, fetch_k, filter, vector):
+        vector_store, lexical = self.vector_store, self.lexical
+        scores, labels = self._search_rows(vector_store, np.array([vector], dtype=np.float32), fetch_k, filter)
+        vector_ranking = [
+            (vector_store.index_to_docstore_id[row], score)
+            for row, score in zip(labels[0].tolist(), scores[0].tolist()) if row >= 0
+        ]
+        lexical_ranking, exact = [], set()
+        if lexical is not None:
+            lexical_ranking = lexical.search(query, fetch_k if filter is None else fetch_k * 4)
+            if filter is not None:
+                # The BM25 side is keyed by docstore id, not row, so it checks the filter per document
+                node = parse_filter(filter)
+                documents = self._documents([doc_id for doc_id, _ in lexical_ranking])
+                lexical_ranking = [
+                    (doc_id, score) for doc_id, score in lexical_ranking
+                    if doc_id in documents and node.matches(document_fields(documents[doc_id].metadata))
+                ][:fetch_k]
+            exact = lexical.exact_matches(query, [doc_id for doc_id, _ in lexical_ranking])
+        return vector_ranking, lexical_ranking, exact
+
+    def documents(self, doc_ids):
+        # doc_id -> Document for the ids still in the store
+        with self._reading():
+            return self._documents(doc_ids)
+
+    def _documents(self, doc_ids):
+        docstore = self.vector_store.docstore
+        documents = {}
+        for doc_id in doc_ids:
+            document = docstore.search(doc_id)
+            # A save by another worker deletes the documents it dropped from docstore.sqlite, possibly while
+            # this snapshot, loaded before it, is still searching; those results are left out
+            if isinstance(document, Document):
+                documents[doc_id] = document
+        return documents
+
+    def retrieve(self, query, k=1, filter=None):
+        if self.hybrid and self.lexical is not None:
+            return self.hybrid_search(query, k=k, filter=filter)
+        return self.similarity_search(query, k=k, filter=filter)
+
+    def similarity_search_batch_with_score(self, queries, k=5, filter=None):
+        # All queries go out in one embedding call and are searched as one matrix; results are per query, in order
+        if not queries:
+            return []
+        vectors = np.array(embed_queries(self.vector_store.embeddings, list(queries)), dtype=np.float32)
+        return self.search_vectors(vectors, k, filter)
+
+    def search_vectors(self, vectors, k=5, filter=None):
+        # similarity_search_batch_with_score for queries that are already embedded
+        with self._reading():
+            return self._search_vectors(self.vector_store, np.array(vectors, dtype=np.float32), k, filter)
+
+    def similarity_search_batch(self, queries, k=5, filter=None):
+        return [[document for document, _ in results] for results in self.similarity_search_batch_with_score(queries, k, filter)]
+
+    def _search_rows(self, vector_store, vectors, k, filter=None):
+        # filter is an expression over domain / section / page_type (see metadata_index.parse_filter). It is
+        # applied inside the FAISS search through a bitmap selector, so only matching rows are ever scored.
+        if vector_store._normalize_L2:
+            faiss.normalize_L2(vectors)
+        index = vector_store.index
+        if filter is None:
+            return index.search(vectors, k)
+        metadata_index = self.metadata_index
+        if metadata_index is None:
+            raise ValueError(f"{self.vector_path} has no metadata index; build it with python metadata_index.py --index {self.root}")
+        _, bitmap = metadata_index.select(filter)
+        if not bitmap.any():
+            # Nothing here matches (e.g. a domain filter on another domain's shard)
+            return np.full((len(vectors), k), np.inf, dtype=np.float32), np.full((len(vectors), k), -1, dtype=np.int64)
+        params = selector_params(index, bitmap)
+        if params is not None:
+            return index.search(vectors, k, params=params)
+        # IndexPQ takes no selector: over-fetch and drop the rows outside the bitmap
+        fetch_k = min(k * FILTER_OVERFETCH, index.ntotal)
+        scores, labels = index.search(vectors, fetch_k)
+        allowed = np.unpackbits(bitmap, count=index.ntotal, bitorder="little").astype(bool)
+        kept_scores = np.full((len(vectors), k), np.inf, dtype=np.float32)
+        kept_labels = np.full((len(vectors), k), -1, dtype=np.int64)
+        for query, (query_scores, query_labels) in enumerate(zip(scores, labels)):
+            keep = (query_labels >= 0) & allowed[np.maximum(query_labels, 0)]
+            count = min(int(keep.sum()), k)
+            kept_scores[query, :count] = query_scores[keep][:count]
+            kept_labels[query, :count] = query_labels[keep][:count]
+        return kept_scores, kept_labels
+
+    def _search_vectors(self, vector_store, vectors, k, filter=None):
+        scores, labels = self._search_rows(vector_store, vectors, k, filter)
+        # Queries in a batch often share hits; fetch each document once
+        doc_ids = {row: vector_store.index_to_docstore_id[row] for row in set(labels[labels >= 0].tolist())}
+        documents = self._documents(doc_ids.values())
+        return [
+            [
+                (documents[doc_ids[row]], float(score)) for row, score in zip(query_labels, query_scores)
+                if row >= 0 and doc_ids[row] in documents
+            ]
+            for query_labels, query_scores in zip(labels.tolist(), scores.tolist())
+        ]
+
+
+def reciprocal_rank_fusion(rankings, rrf_k=60):
+    # Vector ranking first: fused scores tie when the two searches rank different chunks at the same place, and
+    # the stable sort callers use then keeps the vector search's order, which retrieval followed before BM25
+    fused = {}
+    for ranking in rankings:
+        for rank, (doc_id, _) in enumerate(ranking):
+            fused[doc_id] = fused.get(doc_id, 0.0) + 1.0 / (rrf_k + rank + 1)
+    return fused
+
+
+def fused_order(fused, exact=()):
+    # Best first. Chunks containing the unit code or building number the query names go ahead of the rest: an
+    # exact BM25 hit the vector search missed otherwise only ties the vector search's first result, and loses.
+    return sorted(fused, key=lambda doc_id: (doc_id in exact, fused[doc_id]), reverse=True)
+
+
+class SnapshotRetriever(BaseRetriever):
+    # Looks the store up on every query instead of capturing it, so chains built once follow reloads
+    vector_db: Any
+    k: int = 1
+    filter: Optional[str] = None
+
+    def _get_relevant_documents(self, query, *, run_manager):
+        # On a ReloadableVectorDB this resolves to the snapshot that is current right now
+        return self.vector_db.retrieve(query, k=self.k, filter=self.filter)
+
+    async def _aget_relevant_documents(self, query, *, run_manager):
+        # Used by chain.ainvoke; the event loop keeps serving other requests while the search runs
+        search = partial(self.vector_db.retrieve, query, k=self.k, filter=self.filter)
+        return await asyncio.get_running_loop().run_in_executor(SEARCH_EXECUTOR, search)
+
+
+class ReloadableVectorDB:
+    # Serves a VectorDB that is replaced by a freshly loaded one when the index changes on disk: CURRENT names
+    # another version (build_index.py --publish), or another worker saved or rebuilt the index. Every worker
+    # checks on each request, so none is left serving the old files. The new store is loaded in the background
+    # and swapped in with a single assignment; requests still using the old snapshot finish on it, and it is
+    # closed once the last of them is done.
+    def __init__(self, vector_path, **options):
+        self.root = vector_path
+        self.options = options
+        self._reload_lock = threading.Lock()
+        self._retry_at = 0
+        self._users = {}
+        self._users_lock = threading.Lock()
+        self._current = VectorDB(vector_path, **options)
+
+    def _outdated(self, vector_db):
+        return vector_db.stale() or current_version(self.root) != vector_db.version
+
+    @property
+    def current(self):
+        current = self._current
+        if time.monotonic() >= self._retry_at and self._outdated(current) and self._reload_lock.acquire(blocking=False):
+            threading.Thread(target=self._reload_in_background, args=(current,), daemon=True).start()
+        return current
+
+    def _reload_in_background(self, current):
+        try:
+            if self._current is current:
+                self._swap(VectorDB(self.root, **self.options))
+        except Exception as e:
+            # Requests stay on the old snapshot; a broken version is not loaded again on every request
+            print(f"Reloading {self.root} failed, retrying in 30s: {e}")
+            self._retry_at = time.monotonic() + 30
+        finally:
+            self._reload_lock.release()
+
+    def _swap(self, vector_db):
+        with self._users_lock:
+            old, self._current = self._current, vector_db
+            idle = old not in self._users
+        if idle:
+            self._retire(old)
+        print(f"Now serving {vector_db.vector_path}")
+
+    def _retire(self, vector_db):
+        threading.Thread(target=vector_db.close, daemon=True).start()
+
+    @contextmanager
+    def snapshot(self):
+        # The current VectorDB, kept open until the caller is done with it even if a reload swaps in another meanwhile
+        self.current
+        with self._users_lock:
+            vector_db = self._current
+            self._users[vector_db] = self._users.get(vector_db, 0) + 1
+        try:
+            yield vector_db
+        finally:
+            with self._users_lock:
+                self._users[vector_db] -= 1
+                retired = not self._users[vector_db] and vector_db is not self._current
+                if not self._users[vector_db]:
+                    del self._users[vector_db]
+            if retired:
+                self._retire(vector_db)
+
+    def reload(self, version=None):
+        # A version is published to CURRENT, which every worker follows, rather than loaded by this one alone
+        if version:
+            if version not in list_versions(self.root):
+                raise ValueError(f"{self.root} has no version {version}")
+            publish_version(self.root, version)
+        with self._reload_lock:
+            vector_db = VectorDB(self.root, **self.options)
+            self._swap(vector_db)
+        return vector_db.version
+
+    def _write(self, name, *args, **kwargs):
+        # Writes hold the reload lock, so a swap waits for them and they go to whichever snapshot is current
+        # once a reload in progress is done. Another worker saving in between sends them to the saved files.
+        for attempt in range(3):
+            with self._reload_lock:
+                if self._outdated(self._current):
+                    self._swap(VectorDB(self.root, **self.options))
+                try:
+                    return getattr(self._current, name)(*args, **kwargs)
+                except StaleIndexError:
+                    if attempt == 2:
+                        raise
+
+    def add_documents(self, documents, ids=None, save=True):
+        return self._write("add_documents", documents, ids=ids, save=save)
+
+    def delete_documents(self, ids, save=True):
+        return self._write("delete_documents", ids, save=save)
+
+    def save(self):
+        return self._write("save")
+
+    def get_retriever(self, filter=None):
+        return SnapshotRetriever(vector_db=self, k=1, filter=filter)
 
-    def add_documents(self, documents):
-        self.vector_store.add_documents(documents)
-        self.vector_store.save_local(self.vector_path)
+    def __getattr__(self, name):
+        # Everything else goes to whichever snapshot is current at the time of the call; a method keeps that
+        # snapshot open until it returns
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if not callable(getattr(self.current, name)):
+            return getattr(self.current, name)
 
-    def similarity_search(self, query, k=5):
-        return self.vector_store.similarity_search(query, k=k)
\ No newline at end of file
+        def call(*args, **kwargs):
+            with self.snapshot() as vector_db:
+                return getattr(vector_db, name)(*args, **kwargs)
+        return call
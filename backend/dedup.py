@@ -0,0 +1,121 @@
+import os
+import re
+import zlib
+
+import numpy as np
+
+_MERSENNE_PRIME = (1 << 31) - 1
+_WORD_RE = re.compile(r"\w+")
+# Saved in an index directory by build_index.py and kept up to date by refresh_index.py
+DEDUP_FILE = "dedup.npz"
+
+
+class NearDuplicateFilter:
+    # MinHash signatures over word shingles, bucketed with LSH banding. A chunk whose estimated
+    # Jaccard similarity to an already kept chunk is at least `threshold` is reported as its duplicate.
+    def __init__(self, num_perm=128, bands=16, threshold=0.85, shingle_size=5, seed=1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.seed = seed
+        generator = np.random.RandomState(seed)
+        self._a = generator.randint(1, _MERSENNE_PRIME, size=(num_perm, 1), dtype=np.uint64)
+        self._b = generator.randint(0, _MERSENNE_PRIME, size=(num_perm, 1), dtype=np.uint64)
+        self._buckets = [{} for _ in range(bands)]
+        self._signatures = []
+        # Key of each kept chunk by position, None once discarded
+        self._keys = []
+        self._positions = {}
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            num_perm, bands, shingle_size, seed = (int(value) for value in data["params"])
+            dedup_filter = cls(num_perm, bands, float(data["threshold"]), shingle_size, seed)
+            for key, signature in zip(data["keys"].tolist(), data["signatures"]):
+                dedup_filter._keep(key, signature, dedup_filter._band_keys(signature))
+        return dedup_filter
+
+    @classmethod
+    def from_vector_store(cls, vector_store, **options):
+        # For indexes built without a saved filter; the first of any near-duplicates already in it is kept
+        dedup_filter = cls(**options)
+        for doc_id in vector_store.index_to_docstore_id.values():
+            dedup_filter.add(doc_id, vector_store.docstore.search(doc_id).page_content)
+        return dedup_filter
+
+    def save(self, path):
+        # Only the kept chunks still in the index; the LSH buckets are rebuilt from their signatures on load
+        live = [position for position, key in enumerate(self._keys) if key is not None]
+        signatures = np.array([self._signatures[position] for position in live], dtype=np.uint32).reshape(-1, self.num_perm)
+        # np.savez adds .npz to names without it, so write through an open file to keep the tmp name
+        with open(f"{path}.tmp", 'wb') as file:
+            np.savez(
+                file,
+                params=np.array([self.num_perm, self.bands, self.shingle_size, self.seed]),
+                threshold=np.array(self.threshold),
+                keys=np.array([self._keys[position] for position in live], dtype=str),
+                signatures=signatures,
+            )
+        os.replace(f"{path}.tmp", path)
+
+    def _shingles(self, text):
+        words = _WORD_RE.findall(text.lower())
+        size = min(self.shingle_size, len(words)) or 1
+        shingles = {" ".join(words[i:i + size]) for i in range(max(len(words) - size + 1, 1))}
+        return np.fromiter((zlib.crc32(shingle.encode("utf-8")) for shingle in shingles), dtype=np.uint64)
+
+    def signature(self, text):
+        hashes = self._shingles(text)
+        # Universal hashing (a*x + b) mod p; a, b < 2^31 and x < 2^32 keep the product inside uint64
+        return ((self._a * hashes + self._b) % _MERSENNE_PRIME).min(axis=1).astype(np.uint32)
+
+    def _band_keys(self, signature):
+        return [signature[i * self.rows:(i + 1) * self.rows].tobytes() for i in range(self.bands)]
+
+    def add(self, key, text):
+        # Returns the key of the kept chunk this text duplicates, or None after keeping it
+        signature = self.signature(text)
+        band_keys = self._band_keys(signature)
+        candidates = set()
+        for bucket, band_key in zip(self._buckets, band_keys):
+            candidates.update(bucket.get(band_key, ()))
+        best, best_similarity = None, self.threshold
+        for candidate in candidates:
+            if self._keys[candidate] is None:
+                continue
+            similarity = float(np.mean(self._signatures[candidate] == signature))
+            if similarity >= best_similarity:
+                best, best_similarity = candidate, similarity
+        if best is not None:
+            return self._keys[best]
+        self._keep(key, signature, band_keys)
+        return None
+
+    def _keep(self, key, signature, band_keys):
+        position = len(self._keys)
+        self._keys.append(key)
+        self._positions[key] = position
+        self._signatures.append(signature)
+        for bucket, band_key in zip(self._buckets, band_keys):
+            bucket.setdefault(band_key, []).append(position)
+
+    def discard(self, keys):
+        # Chunks deleted from the index stop counting as kept, so their text can be indexed again
+        for key in keys:
+            position = self._positions.pop(key, None)
+            if position is not None:
+                self._keys[position] = None
+
+    def keys(self):
+        return list(self._positions)
+
+    def __contains__(self, key):
+        return key in self._positions
+
+    def __len__(self):
+        return len(self._positions)
@@ -0,0 +1,133 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import unicodedata
+from array import array
+from collections import OrderedDict
+
+from langchain_core.embeddings import Embeddings
+from langchain_openai import OpenAIEmbeddings
+
+EMBEDDING_CACHE_PATH = os.getenv('EMBEDDING_CACHE_PATH', "embedding_cache.sqlite")
+# Query embeddings are kept in memory per process, most recently used first; 0 turns that off
+EMBEDDING_QUERY_CACHE_SIZE = int(os.getenv('EMBEDDING_QUERY_CACHE_SIZE', "1024"))
+
+
+def normalize_text(text):
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+class CachedEmbeddings(Embeddings):
+    # Document embeddings are cached in SQLite, shared by every build and refresh on the box. Queries only go
+    # through a bounded in-memory LRU, so answering a question never writes to disk, and a server that only
+    # answers questions never opens the SQLite file at all.
+    def __init__(self, embedder, cache_path=EMBEDDING_CACHE_PATH, batch_size=500, query_cache_size=EMBEDDING_QUERY_CACHE_SIZE):
+        self.embedder = embedder
+        self.model = getattr(embedder, "model", type(embedder).__name__)
+        self.cache_path = cache_path
+        self.batch_size = batch_size
+        self.query_cache_size = query_cache_size
+        self._lock = threading.Lock()
+        self._connection = None
+        self._queries = OrderedDict()
+        self._queries_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _connect(self):
+        # Opened on the first document lookup; shared by every worker and build process on the box, so let
+        # sqlite do the locking
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.cache_path, timeout=30, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)")
+            self._connection.commit()
+        return self._connection
+
+    def _key(self, text):
+        return hashlib.sha256(f"{self.model}\0{normalize_text(text)}".encode("utf-8")).hexdigest()
+
+    def _lookup(self, keys):
+        found = {}
+        with self._lock:
+            connection = self._connect()
+            for start in range(0, len(keys), self.batch_size):
+                batch = keys[start:start + self.batch_size]
+                rows = connection.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(batch))})", batch
+                )
+                for key, blob in rows:
+                    found[key] = array('f', blob).tolist()
+        return found
+
+    def _store(self, vectors):
+        with self._lock:
+            connection = self._connect()
+            connection.executemany(
+                "INSERT OR IGNORE INTO embeddings (key, vector) VALUES (?, ?)",
+                [(key, array('f', vector).tobytes()) for key, vector in vectors.items()],
+            )
+            connection.commit()
+
+    def embed_documents(self, texts):
+        keys = [self._key(text) for text in texts]
+        vectors = self._lookup(list(set(keys)))
+
+        # Each distinct missing text is sent to the embedder once, however often it repeats
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in vectors and key not in missing:
+                missing[key] = text
+        self.hits += len(texts) - len(missing)
+        self.misses += len(missing)
+
+        if missing:
+            embedded = self.embedder.embed_documents(list(missing.values()))
+            new_vectors = {key: array('f', vector).tolist() for key, vector in zip(missing, embedded)}
+            self._store(new_vectors)
+            vectors.update(new_vectors)
+
+        return [vectors[key] for key in keys]
+
+    def embed_queries(self, texts):
+        keys = [self._key(text) for text in texts]
+        vectors = {}
+        with self._queries_lock:
+            for key in keys:
+                if key in self._queries:
+                    self._queries.move_to_end(key)
+                    vectors[key] = self._queries[key]
+
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in vectors and key not in missing:
+                missing[key] = text
+        self.hits += len(texts) - len(missing)
+        self.misses += len(missing)
+
+        if missing:
+            embedded = self.embedder.embed_documents(list(missing.values()))
+            vectors.update(zip(missing, embedded))
+            with self._queries_lock:
+                for key in missing:
+                    self._queries[key] = vectors[key]
+                    self._queries.move_to_end(key)
+                while len(self._queries) > self.query_cache_size:
+                    self._queries.popitem(last=False)
+
+        return [vectors[key] for key in keys]
+
+    def embed_query(self, text):
+        return self.embed_queries([text])[0]
+
+
+def embed_queries(embeddings, texts):
+    # Batched query embedding for any Embeddings; only CachedEmbeddings tells queries apart from documents
+    if isinstance(embeddings, CachedEmbeddings):
+        return embeddings.embed_queries(texts)
+    return embeddings.embed_documents(texts)
+
+
+def create_embedder(**kwargs):
+    return CachedEmbeddings(OpenAIEmbeddings(**kwargs))
@@ -0,0 +1,65 @@
+import argparse
+import os
+import time
+
+# A versioned index directory holds one complete index per subdirectory and a CURRENT file naming
+# the one being served:
+#   Swinburne_Chat_Bot/CURRENT            -> "v20241018-120000"
+#   Swinburne_Chat_Bot/v20241018-120000/  index.faiss, docstore.sqlite, ...
+# A directory without CURRENT is an unversioned index and is served as it is.
+CURRENT_FILE = "CURRENT"
+
+
+def new_version_name():
+    return time.strftime("v%Y%m%d-%H%M%S")
+
+
+def current_version(root):
+    path = os.path.join(root, CURRENT_FILE)
+    if not os.path.exists(path):
+        return None
+    with open(path) as file:
+        return file.read().strip()
+
+
+def resolve_version(root, version=None):
+    # Directory holding the index files for `version`, or for the current one
+    version = version or current_version(root)
+    return os.path.join(root, version) if version else root
+
+
+def list_versions(root):
+    if not os.path.isdir(root):
+        return []
+    return sorted(
+        name for name in os.listdir(root)
+        if os.path.exists(os.path.join(root, name, "index.faiss"))
+    )
+
+
+def publish_version(root, version):
+    # Points CURRENT at a version already built inside root. The rename is atomic, so a reader sees
+    # either the old version or the new one; servers pick it up on their next reload.
+    if not os.path.exists(os.path.join(root, version, "index.faiss")):
+        raise ValueError(f"{os.path.join(root, version)} does not contain an index")
+    path = os.path.join(root, CURRENT_FILE)
+    with open(f"{path}.tmp", 'w') as file:
+        file.write(version)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(f"{path}.tmp", path)
+
+
+if __name__ == "__main__":
+    # python index_versions.py --root Swinburne_Chat_Bot               list versions
+    # python index_versions.py --root Swinburne_Chat_Bot --use NAME    publish (or roll back to) NAME
+    parser = argparse.ArgumentParser(description="List or publish versions of a versioned index directory")
+    parser.add_argument("--root", default="Swinburne_Chat_Bot")
+    parser.add_argument("--use", help="version to make current")
+    args = parser.parse_args()
+
+    if args.use:
+        publish_version(args.root, args.use)
+    current = current_version(args.root)
+    for version in list_versions(args.root):
+        print(f"{'*' if version == current else ' '} {version}")
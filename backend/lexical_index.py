@@ -0,0 +1,246 @@
+import argparse
+import math
+import os
+import re
+from collections import Counter
+
+import numpy as np
+
+LEXICAL_INDEX_FILE = "index.bm25.npz"
+# Unit codes (COS30049), building numbers (EN101) and the like stay single tokens
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+# Tokens mixing letters and digits, the codes a query names exactly
+_CODE_RE = re.compile(r"[a-z][0-9]|[0-9][a-z]")
+
+
+def tokenize(text):
+    return _TOKEN_RE.findall(text.lower())
+
+
+def code_terms(text):
+    return [term for term in set(tokenize(text)) if _CODE_RE.search(term)]
+
+
+def _grow(array, size):
+    # Room for at least `size` items, doubling so that n appends copy O(n) items in total
+    grown = np.zeros(max(size, 2 * len(array), 8), dtype=array.dtype)
+    grown[:len(array)] = array
+    return grown
+
+
+class _Postings:
+    # One term's document positions and term frequencies, in arrays with room to grow
+    def __init__(self, positions, counts):
+        self._positions = positions
+        self._counts = counts
+        self.size = len(positions)
+
+    @property
+    def positions(self):
+        return self._positions[:self.size]
+
+    @property
+    def counts(self):
+        return self._counts[:self.size]
+
+    def extend(self, positions, counts):
+        size = self.size + len(positions)
+        if size > len(self._positions):
+            self._positions = _grow(self._positions[:self.size], size)
+            self._counts = _grow(self._counts[:self.size], size)
+        self._positions[self.size:size] = positions
+        self._counts[self.size:size] = counts
+        self.size = size
+
+
+class LexicalIndex:
+    # BM25 inverted index over chunk text, keyed by docstore id. Each term's postings are two numpy arrays
+    # (document positions and term frequencies), so a query only touches the postings of its own terms.
+    # The per-document arrays and the postings keep spare room, so adding documents does not copy them.
+    def __init__(self, k1=1.2, b=0.75, common_fraction=0.05):
+        self.k1 = k1
+        self.b = b
+        self.common_fraction = common_fraction
+        self.doc_ids = []
+        self.positions = {}
+        self.lengths = np.zeros(0, dtype=np.float32)
+        self.alive = np.zeros(0, dtype=bool)
+        self.total_length = 0.0
+        self.postings = {}
+
+    def __len__(self):
+        return len(self.positions)
+
+    def __contains__(self, doc_id):
+        return doc_id in self.positions
+
+    def add(self, doc_ids, texts):
+        # Re-adding an id (e.g. a log replayed over an index built after it) replaces the old entry
+        self.delete([doc_id for doc_id in doc_ids if doc_id in self.positions])
+        start = len(self.doc_ids)
+        lengths = []
+        new_postings = {}
+        for position, (doc_id, text) in enumerate(zip(doc_ids, texts), start):
+            tokens = tokenize(text)
+            lengths.append(len(tokens))
+            for term, count in Counter(tokens).items():
+                positions, counts = new_postings.setdefault(term, ([], []))
+                positions.append(position)
+                counts.append(count)
+        end = start + len(lengths)
+        if end > len(self.lengths):
+            self.lengths = _grow(self.lengths[:start], end)
+            self.alive = _grow(self.alive[:start], end)
+        # Lengths before postings: a concurrent search never sees a position it cannot look up
+        self.lengths[start:end] = lengths
+        self.alive[start:end] = True
+        for position, doc_id in enumerate(doc_ids, start):
+            self.doc_ids.append(doc_id)
+            self.positions[doc_id] = position
+        self.total_length += sum(lengths)
+        for term, (positions, counts) in new_postings.items():
+            positions = np.array(positions, dtype=np.int32)
+            counts = np.array(counts, dtype=np.float32)
+            if term in self.postings:
+                self.postings[term].extend(positions, counts)
+            else:
+                self.postings[term] = _Postings(positions, counts)
+
+    def delete(self, doc_ids):
+        # Deleted documents stay in the postings, masked out, until the next save compacts them away
+        for doc_id in doc_ids:
+            position = self.positions.pop(doc_id, None)
+            if position is not None:
+                self.alive[position] = False
+                self.total_length -= float(self.lengths[position])
+
+    def search(self, query, k=5):
+        count = len(self.positions)
+        postings = [
+            (self.postings[term].positions, self.postings[term].counts) for term in set(tokenize(query)) if term in self.postings
+        ]
+        if not count or not postings:
+            return []
+        # Read after the postings: add() extends these first, so they cover every position seen above
+        lengths, alive = self.lengths, self.alive
+        average_length = max(self.total_length / count, 1.0)
+        # Document frequencies count live documents only; deleted ones stay in the postings until the next save
+        if count < len(self.doc_ids):
+            postings = [(positions, counts, int(alive[positions].sum())) for positions, counts in postings]
+        else:
+            postings = [(positions, counts, len(positions)) for positions, counts in postings]
+
+        # Candidates come from the postings of the rarer terms. Terms found in a large share of the corpus
+        # ("the", "student") carry almost no idf and are only intersected with those candidates; a query made
+        # of nothing else has no exact tokens to match and is left to the vector search.
+        limit = max(self.common_fraction * count, 1000)
+        rare = [term_postings for term_postings in postings if term_postings[2] <= limit]
+        if not rare:
+            return []
+        candidates = rare[0][0] if len(rare) == 1 else np.unique(np.concatenate([positions for positions, _, _ in rare]))
+        candidates = candidates[alive[candidates]]
+        if not len(candidates):
+            return []
+        norm = self.k1 * (1 - self.b + self.b * lengths[candidates] / average_length)
+        scores = np.zeros(len(candidates), dtype=np.float32)
+        for positions, counts, frequency in postings:
+            idf = math.log(1 + (count - frequency + 0.5) / (frequency + 0.5))
+            # Postings are sorted by position, so the intersection is a binary search per candidate
+            found = np.minimum(np.searchsorted(positions, candidates), len(positions) - 1)
+            term_counts = np.where(positions[found] == candidates, counts[found], 0)
+            scores += idf * term_counts * (self.k1 + 1) / (term_counts + norm)
+
+        if len(candidates) > k:
+            top = np.argpartition(-scores, k - 1)[:k]
+            candidates, scores = candidates[top], scores[top]
+        order = (-scores).argsort()
+        return [(self.doc_ids[candidates[i]], float(scores[i])) for i in order]
+
+    def exact_matches(self, query, doc_ids):
+        # Those of doc_ids (live documents) that contain every code the query names, such as a unit code
+        terms = code_terms(query)
+        if not terms or any(term not in self.postings for term in terms):
+            return set()
+        matches = set(doc_ids)
+        for term in terms:
+            positions = self.postings[term].positions
+            # Read after the postings, as in search()
+            positions = positions[self.alive[positions]].tolist()
+            matches &= {self.doc_ids[position] for position in positions}
+        return matches
+
+    def save(self, vector_path):
+        # Compacts out deleted documents and stores the postings as flat arrays, no pickle involved
+        keep = np.flatnonzero(self.alive)
+        remap = np.full(len(self.alive), -1, dtype=np.int64)
+        remap[keep] = np.arange(len(keep))
+        terms, offsets, positions, counts = [], [0], [], []
+        for term, term_postings in self.postings.items():
+            term_positions, term_counts = term_postings.positions, term_postings.counts
+            mask = self.alive[term_positions]
+            if not mask.any():
+                continue
+            terms.append(term)
+            positions.append(remap[term_positions[mask]].astype(np.int32))
+            counts.append(term_counts[mask])
+            offsets.append(offsets[-1] + int(mask.sum()))
+        path = os.path.join(vector_path, LEXICAL_INDEX_FILE)
+        tmp_path = f"{path}.{os.getpid()}.tmp.npz"
+        np.savez(
+            tmp_path,
+            doc_ids=np.array([self.doc_ids[position] for position in keep], dtype=str),
+            lengths=self.lengths[keep],
+            terms=np.array(terms, dtype=str),
+            offsets=np.array(offsets, dtype=np.int64),
+            positions=np.concatenate(positions) if positions else np.zeros(0, dtype=np.int32),
+            counts=np.concatenate(counts) if counts else np.zeros(0, dtype=np.float32),
+            params=np.array([self.k1, self.b]),
+        )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, vector_path):
+        with np.load(os.path.join(vector_path, LEXICAL_INDEX_FILE)) as data:
+            k1, b = data["params"].tolist()
+            index = cls(k1, b)
+            index.doc_ids = data["doc_ids"].tolist()
+            index.positions = {doc_id: position for position, doc_id in enumerate(index.doc_ids)}
+            index.lengths = data["lengths"]
+            index.alive = np.ones(len(index.doc_ids), dtype=bool)
+            index.total_length = float(index.lengths.sum())
+            offsets, positions, counts = data["offsets"], data["positions"], data["counts"]
+            index.postings = {
+                term: _Postings(positions[offsets[i]:offsets[i + 1]], counts[offsets[i]:offsets[i + 1]])
+                for i, term in enumerate(data["terms"].tolist())
+            }
+        return index
+
+    @classmethod
+    def exists(cls, vector_path):
+        return os.path.exists(os.path.join(vector_path, LEXICAL_INDEX_FILE))
+
+
+def build_lexical_index(vector_store):
+    mapping = vector_store.index_to_docstore_id
+    doc_ids = [doc_id for _, doc_id in sorted(mapping.items())]
+    index = LexicalIndex()
+    index.add(doc_ids, [vector_store.docstore.search(doc_id).page_content for doc_id in doc_ids])
+    return index
+
+
+if __name__ == "__main__":
+    # Builds index.bm25.npz for an index made before build_index.py wrote one (for every shard of a sharded index)
+    from database import VectorDB
+    from sharded_index import index_paths
+
+    parser = argparse.ArgumentParser(description="Build the BM25 index of an existing FAISS index")
+    parser.add_argument("--index", default="Swinburne_Chat_Bot")
+    args = parser.parse_args()
+
+    for vector_path in index_paths(args.index):
+        # In memory, not mmap'd: save() skips an index that is still the read-only mapped one
+        vector_db = VectorDB(vector_path=vector_path, mmap=False)
+        vector_db.lexical = build_lexical_index(vector_db.vector_store)
+        # Saved together with the index under its lock, so a save by a running worker cannot drop it
+        vector_db.save()
+        print(f"Wrote {len(vector_db.lexical)} documents and {len(vector_db.lexical.postings)} terms to {os.path.join(vector_db.vector_path, LEXICAL_INDEX_FILE)}")
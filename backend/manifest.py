@@ -0,0 +1,82 @@
+import hashlib
+import json
+import os
+from collections import Counter
+
+
+def content_hash(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+# Per-URL ETag/Last-Modified, extracted-text hash and {chunk hash: docstore id} of an index
+class Manifest:
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+        if os.path.exists(path):
+            with open(path) as file:
+                self.entries = json.load(file)
+
+    @classmethod
+    def for_index(cls, vector_path):
+        return cls(os.path.join(vector_path, "manifest.json"))
+
+    def seed_from_vector_store(self, vector_store):
+        # Indexes built before the manifest existed: recover chunk ids from the docstore so
+        # unchanged chunks are kept and stale ones can still be deleted on the first refresh
+        for doc_id in vector_store.index_to_docstore_id.values():
+            document = vector_store.docstore.search(doc_id)
+            url = document.metadata.get("source")
+            if url is None:
+                continue
+            # Pages whose near-duplicates of the chunk were dropped at build time contain it too
+            for page_url in [url] + document.metadata.get("aliases", []):
+                entry = self.entries.setdefault(page_url, self._new_entry())
+                entry["chunks"][content_hash(document.page_content)] = doc_id
+
+    @staticmethod
+    def _new_entry():
+        return {"etag": None, "last_modified": None, "content_hash": None, "chunks": {}}
+
+    def __contains__(self, url):
+        return url in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def urls(self):
+        return list(self.entries)
+
+    def chunk_references(self):
+        # How many chunks of all pages map to each docstore id; more than one when pages share a chunk
+        return Counter(doc_id for entry in self.entries.values() for doc_id in entry["chunks"].values())
+
+    def get(self, url):
+        return self.entries.get(url)
+
+    def conditional_headers(self, url):
+        entry = self.entries.get(url)
+        headers = {}
+        if entry and entry["etag"]:
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry["last_modified"]:
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def update(self, url, etag=None, last_modified=None, text_hash=None, chunks=None):
+        entry = self.entries.setdefault(url, self._new_entry())
+        entry["etag"] = etag
+        entry["last_modified"] = last_modified
+        if text_hash is not None:
+            entry["content_hash"] = text_hash
+        if chunks is not None:
+            entry["chunks"] = chunks
+
+    def remove(self, url):
+        return self.entries.pop(url, None)
+
+    def save(self):
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w') as file:
+            json.dump(self.entries, file)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,310 @@
+import argparse
+import os
+import re
+from urllib.parse import urlsplit
+
+import faiss
+import numpy as np
+
+from mmap_index import MmapFlatIndex
+
+METADATA_INDEX_FILE = "index.filters.npz"
+FIELDS = ("domain", "section", "page_type")
+
+# First matching path prefix wins, so the more specific prefixes come first
+PAGE_TYPE_RULES = [
+    ("/online-courses/units", "unit"),
+    ("/courses/fees", "fees"),
+    ("/fees", "fees"),
+    ("/course", "course"),
+    ("/online-courses", "course"),
+    ("/short-courses", "course"),
+    ("/news", "news"),
+    ("/faqs", "faq"),
+    ("/about/policies-regulations", "policy"),
+    ("/policies", "policy"),
+    ("/research", "research"),
+    ("/library", "library"),
+    ("/how-guides", "guide"),
+    ("/life-at-swinburne/student-support-services", "support"),
+    ("/support", "support"),
+    ("/current-students", "support"),
+    ("/about", "about"),
+]
+
+
+def _under(path, prefix):
+    return path == prefix or path.startswith(prefix.rstrip("/") + "/")
+
+
+def url_metadata(url):
+    # domain, section (the first two path segments) and page type, filled in for every chunk at ingestion
+    parts = urlsplit(url)
+    path = "/" + "/".join(segment for segment in parts.path.lower().split("/") if segment)
+    page_type = next((page_type for prefix, page_type in PAGE_TYPE_RULES if _under(path, prefix)), "page")
+    return {
+        "domain": (parts.hostname or "").lower(),
+        "section": "/" + "/".join(path.split("/")[1:3]),
+        "page_type": page_type,
+    }
+
+
+def document_fields(metadata):
+    # Indexes built before these fields were stored still have the source URL to derive them from
+    if all(field in metadata for field in FIELDS):
+        return {field: metadata[field] for field in FIELDS}
+    return url_metadata(metadata.get("source", ""))
+
+
+def _value_matches(field, wanted, value):
+    if field == "domain":
+        # domain:swinburne.edu.au also covers www.swinburne.edu.au
+        return value == wanted or value.endswith("." + wanted)
+    if field == "section":
+        # section:/study covers /study/options
+        return _under(value, wanted)
+    return value == wanted
+
+
+class _Term:
+    def __init__(self, field, value):
+        if field not in FIELDS:
+            raise ValueError(f"Unknown filter field {field}, expected one of {', '.join(FIELDS)}")
+        self.field = field
+        self.value = value.lower().rstrip("/") if field == "section" else value.lower()
+
+    def bitmap(self, index):
+        bitmap = index.empty_bitmap()
+        for (field, value), values_bitmap in index.items():
+            if field == self.field and _value_matches(field, self.value, value):
+                bitmap |= values_bitmap
+        return bitmap
+
+    def matches(self, fields):
+        return _value_matches(self.field, self.value, fields[self.field])
+
+
+class _Not:
+    def __init__(self, operand):
+        self.operand = operand
+
+    def bitmap(self, index):
+        # Also sets the padding bits past the last row; faiss never reads them
+        return ~self.operand.bitmap(index)
+
+    def matches(self, fields):
+        return not self.operand.matches(fields)
+
+
+class _And:
+    def __init__(self, operands):
+        self.operands = operands
+
+    def bitmap(self, index):
+        bitmap = self.operands[0].bitmap(index)
+        for operand in self.operands[1:]:
+            bitmap &= operand.bitmap(index)
+        return bitmap
+
+    def matches(self, fields):
+        return all(operand.matches(fields) for operand in self.operands)
+
+
+class _Or(_And):
+    def bitmap(self, index):
+        bitmap = self.operands[0].bitmap(index)
+        for operand in self.operands[1:]:
+            bitmap |= operand.bitmap(index)
+        return bitmap
+
+    def matches(self, fields):
+        return any(operand.matches(fields) for operand in self.operands)
+
+
+_FILTER_TOKEN_RE = re.compile(r"\(|\)|[^\s()]+")
+
+
+def parse_filter(expression):
+    # field:value terms combined with and / or / not and parentheses; adjacent terms are and-ed, e.g.
+    #   domain:swinburneonline.edu.au
+    #   section:/study/courses and not page_type:news
+    #   (page_type:course or page_type:unit) domain:swinburne.edu.au
+    tokens = _FILTER_TOKEN_RE.findall(expression)
+    position = 0
+
+    def peek():
+        return tokens[position].lower() if position < len(tokens) else None
+
+    def take():
+        nonlocal position
+        position += 1
+        return tokens[position - 1]
+
+    def parse_or():
+        operands = [parse_and()]
+        while peek() == "or":
+            take()
+            operands.append(parse_and())
+        return operands[0] if len(operands) == 1 else _Or(operands)
+
+    def parse_and():
+        operands = [parse_not()]
+        while peek() not in (None, "or", ")"):
+            if peek() == "and":
+                take()
+            operands.append(parse_not())
+        return operands[0] if len(operands) == 1 else _And(operands)
+
+    def parse_not():
+        if peek() == "not":
+            take()
+            return _Not(parse_not())
+        if peek() == "(":
+            take()
+            node = parse_or()
+            if peek() != ")":
+                raise ValueError(f"Missing ) in filter {expression!r}")
+            take()
+            return node
+        token = take() if peek() is not None else ""
+        field, separator, value = token.partition(":")
+        if not separator or not value:
+            raise ValueError(f"Expected field:value in filter {expression!r}, got {token!r}")
+        return _Term(field.lower(), value)
+
+    if not tokens:
+        raise ValueError("Empty filter")
+    node = parse_or()
+    if position != len(tokens):
+        raise ValueError(f"Unexpected {tokens[position]!r} in filter {expression!r}")
+    return node
+
+
+class MetadataIndex:
+    # One packed bitmap per (field, value) over the FAISS rows, bit i set when row i has that value. A filter
+    # combines them with bitwise ops and hands the result to faiss as an IDSelectorBitmap.
+    def __init__(self, rows=0, bitmaps=None):
+        self.rows = rows
+        # Bitmaps keep spare zero bytes past the last row, so adding rows sets bits in place instead of
+        # copying every bitmap; items() gives them cut to the current rows
+        self.bitmaps = bitmaps or {}
+
+    def _size(self):
+        return (self.rows + 7) // 8
+
+    def items(self):
+        size = self._size()
+        return [(key, bitmap[:size]) for key, bitmap in self.bitmaps.items()]
+
+    def empty_bitmap(self):
+        return np.zeros(self._size(), dtype=np.uint8)
+
+    def _unpack(self, key):
+        return np.unpackbits(self.bitmaps[key], count=self.rows, bitorder="little").astype(bool)
+
+    def add(self, metadatas):
+        rows_by_key = {}
+        for row, metadata in enumerate(metadatas, self.rows):
+            for key in document_fields(metadata).items():
+                rows_by_key.setdefault(key, []).append(row)
+        self.rows += len(metadatas)
+        size = self._size()
+        for key in rows_by_key:
+            self.bitmaps.setdefault(key, np.zeros(size, dtype=np.uint8))
+        for key, bitmap in self.bitmaps.items():
+            if len(bitmap) < size:
+                # Doubling, so n rows added one at a time copy each bitmap O(n) bytes in total
+                grown = np.zeros(max(size, 2 * len(bitmap)), dtype=np.uint8)
+                grown[:len(bitmap)] = bitmap
+                self.bitmaps[key] = grown
+        for key, rows in rows_by_key.items():
+            # Bit i of the little-endian packed bitmap is bit i % 8 of byte i // 8
+            rows = np.array(rows, dtype=np.int64)
+            np.bitwise_or.at(self.bitmaps[key], rows >> 3, np.left_shift(1, rows & 7).astype(np.uint8))
+
+    def delete_rows(self, rows):
+        # FAISS renumbers the rows after a delete; the bitmaps shift the same way
+        for key in list(self.bitmaps):
+            bits = np.delete(self._unpack(key), rows)
+            if bits.any():
+                self.bitmaps[key] = np.packbits(bits, bitorder="little")
+            else:
+                del self.bitmaps[key]
+        self.rows -= len(rows)
+
+    def select(self, expression):
+        # Packed with little-endian bit order, the layout faiss.IDSelectorBitmap reads
+        node = parse_filter(expression)
+        return node, node.bitmap(self)
+
+    def save(self, vector_path):
+        items = self.items()
+        path = os.path.join(vector_path, METADATA_INDEX_FILE)
+        tmp_path = f"{path}.{os.getpid()}.tmp.npz"
+        np.savez(
+            tmp_path,
+            rows=np.array([self.rows]),
+            fields=np.array([field for (field, _), _ in items], dtype=str),
+            values=np.array([value for (_, value), _ in items], dtype=str),
+            bitmaps=np.array([bitmap for _, bitmap in items], dtype=np.uint8).reshape(len(items), -1),
+        )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, vector_path):
+        with np.load(os.path.join(vector_path, METADATA_INDEX_FILE)) as data:
+            bitmaps = {
+                (field, value): bitmap
+                for field, value, bitmap in zip(data["fields"].tolist(), data["values"].tolist(), data["bitmaps"])
+            }
+            return cls(int(data["rows"][0]), bitmaps)
+
+    @classmethod
+    def exists(cls, vector_path):
+        return os.path.exists(os.path.join(vector_path, METADATA_INDEX_FILE))
+
+
+def build_metadata_index(vector_store):
+    mapping = vector_store.index_to_docstore_id
+    index = MetadataIndex()
+    index.add([vector_store.docstore.search(doc_id).metadata for _, doc_id in sorted(mapping.items())])
+    return index
+
+
+def selector_params(index, bitmap):
+    # Search parameters restricting `index` to the rows set in `bitmap`, or None when the index type cannot
+    # take a selector (IndexPQ) and the caller has to filter the results itself
+    if isinstance(index, MmapFlatIndex):
+        return np.unpackbits(bitmap, count=index.ntotal, bitorder="little").astype(bool)
+    base_index = getattr(index, "index", index)
+    if isinstance(base_index, faiss.IndexPQ):
+        return None
+    selector = faiss.IDSelectorBitmap(index.ntotal, faiss.swig_ptr(bitmap))
+    # The per-type parameter objects default to efSearch=16 / nprobe=1, so carry the index's own settings over
+    if hasattr(base_index, "hnsw"):
+        params = faiss.SearchParametersHNSW(sel=selector, efSearch=base_index.hnsw.efSearch)
+    elif hasattr(base_index, "nprobe"):
+        params = faiss.SearchParametersIVF(sel=selector, nprobe=base_index.nprobe)
+    else:
+        params = faiss.SearchParameters(sel=selector)
+    # faiss only holds raw pointers; keep the bitmap and selector alive as long as the parameters
+    params.referenced_objects = [bitmap, selector]
+    return params
+
+
+if __name__ == "__main__":
+    # Builds index.filters.npz for an index made before build_index.py wrote one (for every shard of a sharded index)
+    from database import VectorDB
+    from sharded_index import index_paths
+
+    parser = argparse.ArgumentParser(description="Build the metadata filter bitmaps of an existing FAISS index")
+    parser.add_argument("--index", default="Swinburne_Chat_Bot")
+    args = parser.parse_args()
+
+    for vector_path in index_paths(args.index):
+        # In memory, not mmap'd: save() skips an index that is still the read-only mapped one
+        vector_db = VectorDB(vector_path=vector_path, mmap=False)
+        vector_db.metadata_index = build_metadata_index(vector_db.vector_store)
+        # Saved together with the index so the rows line up, including writes replayed from the log
+        vector_db.save()
+        print(f"Wrote {len(vector_db.metadata_index.bitmaps)} bitmaps over {vector_db.metadata_index.rows} rows to {vector_db.vector_path}")
@@ -0,0 +1,77 @@
+import os
+
+import faiss
+import numpy as np
+
+VECTORS_FILE = "index.vectors.npy"
+NORMS_FILE = "index.norms.npy"
+
+
+def export_vectors(vector_path, index):
+    # Raw float32 rows of a flat index, written once so every worker can mmap the same file
+    vectors = index.reconstruct_n(0, index.ntotal) if index.ntotal else np.zeros((0, index.d), dtype=np.float32)
+    norms = np.einsum("ij,ij->i", vectors, vectors)
+    for filename, array in ((VECTORS_FILE, vectors), (NORMS_FILE, norms)):
+        path = os.path.join(vector_path, filename)
+        tmp_path = f"{path}.{os.getpid()}.tmp.npy"
+        np.save(tmp_path, array)
+        os.replace(tmp_path, path)
+
+
+def has_fresh_vectors(vector_path, index_name="index"):
+    index_file = os.path.join(vector_path, f"{index_name}.faiss")
+    vectors_file = os.path.join(vector_path, VECTORS_FILE)
+    norms_file = os.path.join(vector_path, NORMS_FILE)
+    if not (os.path.exists(vectors_file) and os.path.exists(norms_file)):
+        return False
+    return os.path.getmtime(vectors_file) >= os.path.getmtime(index_file)
+
+
+class MmapFlatIndex:
+    # Read-only stand-in for IndexFlatL2/IndexFlatIP that searches a memory-mapped .npy file.
+    # Every process maps the same file, so the vectors live once in the page cache and opening
+    # the index costs the same regardless of its size.
+    def __init__(self, vectors, norms, metric_type=faiss.METRIC_L2):
+        self.vectors = vectors
+        self.norms = norms
+        self.metric_type = metric_type
+        self.d = vectors.shape[1]
+        self.ntotal = vectors.shape[0]
+        self.is_trained = True
+
+    @classmethod
+    def load(cls, vector_path, metric_type=faiss.METRIC_L2):
+        vectors = np.load(os.path.join(vector_path, VECTORS_FILE), mmap_mode="r")
+        norms = np.load(os.path.join(vector_path, NORMS_FILE), mmap_mode="r")
+        return cls(vectors, norms, metric_type)
+
+    def search(self, x, k, params=None):
+        # params, when given, is a boolean mask of the rows allowed (the IDSelectorBitmap equivalent)
+        x = np.asarray(x, dtype=np.float32)
+        scores = x @ self.vectors.T
+        if self.metric_type == faiss.METRIC_L2:
+            # Squared L2 like IndexFlatL2: |v|^2 - 2 x.v + |x|^2
+            scores = self.norms[None, :] - 2 * scores + np.einsum("ij,ij->i", x, x)[:, None]
+        else:
+            scores = -scores
+        allowed = self.ntotal
+        if params is not None:
+            scores[:, ~params] = np.inf
+            allowed = int(params.sum())
+
+        distances = np.full((len(x), k), np.inf if self.metric_type == faiss.METRIC_L2 else -np.inf, dtype=np.float32)
+        labels = np.full((len(x), k), -1, dtype=np.int64)
+        top = min(k, allowed)
+        if top:
+            candidates = np.argpartition(scores, top - 1, axis=1)[:, :top]
+            order = np.take_along_axis(scores, candidates, axis=1).argsort(axis=1)
+            labels[:, :top] = np.take_along_axis(candidates, order, axis=1)
+            best = np.take_along_axis(scores, labels[:, :top], axis=1)
+            distances[:, :top] = best if self.metric_type == faiss.METRIC_L2 else -best
+        return distances, labels
+
+    def reconstruct(self, i):
+        return np.array(self.vectors[i])
+
+    def reconstruct_n(self, i0, n):
+        return np.array(self.vectors[i0:i0 + n])
@@ -18,9 +18,17 @@ class SimilarTopicRequest(BaseModel):
 class SimilarTopicResponse(BaseModel):
     topics: list[str]
 
+class ReloadRequest(BaseModel):
+    index: str = "chat"
+    version: str | None = None
+    shard: str | None = None
+
 class ChatRequest(BaseModel):
     query: str
+    # The session_id of an earlier response, to answer within that conversation; without it a new one starts
+    session_id: str | None = None
 
 class ChatResponse(BaseModel):
     answer: str
-    similar_questions: str
\ No newline at end of file
+    similar_questions: str
+    session_id: str
\ No newline at end of file
@@ -0,0 +1,302 @@
+import asyncio
+import os
+import queue
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+
+from langchain_community.vectorstores.faiss import FAISS
+from langchain_core.documents import Document
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+from crawler import AsyncWebCrawler, page_to_document
+from dedup import NearDuplicateFilter
+
+_DONE = object()
+_worker_splitter = None
+_worker_stripper = None
+
+
+def _init_worker(splitter, stripper):
+    global _worker_splitter, _worker_stripper
+    _worker_splitter = splitter
+    _worker_stripper = stripper
+
+
+def extract_and_split(page, splitter=None, stripper=None):
+    # Top-level so it can run in a worker process: raw page bytes in, chunks out
+    splitter = splitter or _worker_splitter or RecursiveCharacterTextSplitter()
+    return splitter.split_documents([page_to_document(page, stripper=stripper or _worker_stripper)])
+
+
+def apply_aliases(docstore, aliases):
+    # Adds each duplicate's source to the kept chunk's metadata["aliases"], except the chunk's own page.
+    # Returns the aliases whose kept chunk is not in this docstore.
+    missing = {}
+    for doc_id, sources in aliases.items():
+        document = docstore.search(doc_id)
+        if not isinstance(document, Document):
+            missing[doc_id] = sources
+            continue
+        known = [document.metadata.get("source")] + document.metadata.get("aliases", [])
+        new_sources = [source for source in sources if source not in known]
+        if new_sources:
+            document.metadata["aliases"] = known[1:] + new_sources
+    return missing
+
+
+class PipelineStopped(Exception):
+    pass
+
+
+class StageStats:
+    def __init__(self, name):
+        self.name = name
+        self.items_in = 0
+        self.items_out = 0
+        self.busy = 0.0
+        self.started = None
+        self.finished = None
+
+    def report(self):
+        elapsed = (self.finished or time.monotonic()) - (self.started or time.monotonic())
+        rate = self.items_in / elapsed if elapsed > 0 else 0.0
+        return (
+            f"{self.name:<8} in={self.items_in:<7} out={self.items_out:<7} "
+            f"busy={self.busy:8.2f}s wall={elapsed:8.2f}s {rate:8.1f} items/s"
+        )
+
+
+class Stage:
+    # Worker threads reading from `inbox` and writing to `outbox`. Both queues are bounded,
+    # so a slow stage blocks the ones before it instead of letting items pile up in memory.
+    def __init__(self, pipeline, name, func, inbox, outbox, workers=1, batch_size=None):
+        self.pipeline = pipeline
+        self.func = func
+        self.inbox = inbox
+        self.outbox = outbox
+        self.workers = workers
+        self.batch_size = batch_size
+        self.stats = StageStats(name)
+        self._lock = threading.Lock()
+        self._running = workers
+        self._threads = [threading.Thread(target=self._run, name=f"{name}-{i}", daemon=True) for i in range(workers)]
+
+    def start(self):
+        self.stats.started = time.monotonic()
+        for thread in self._threads:
+            thread.start()
+
+    def join(self):
+        for thread in self._threads:
+            thread.join()
+
+    def _next(self):
+        if self.batch_size is None:
+            return self.pipeline.get(self.inbox)
+        batch = []
+        while len(batch) < self.batch_size:
+            item = self.pipeline.get(self.inbox)
+            if item is _DONE:
+                # Let the other workers of this stage see the end of input too
+                self.pipeline.put(self.inbox, _DONE)
+                break
+            batch.append(item)
+        return batch or _DONE
+
+    def _run(self):
+        try:
+            while True:
+                item = self._next()
+                if item is _DONE:
+                    break
+                started = time.monotonic()
+                results = self.func(item)
+                elapsed = time.monotonic() - started
+                with self._lock:
+                    self.stats.busy += elapsed
+                    self.stats.items_in += len(item) if self.batch_size else 1
+                for result in results:
+                    if self.outbox is not None:
+                        self.pipeline.put(self.outbox, result)
+                    with self._lock:
+                        self.stats.items_out += 1
+        except PipelineStopped:
+            return
+        except Exception as e:
+            self.pipeline.fail(e)
+            return
+        finally:
+            with self._lock:
+                self._running -= 1
+                last = self._running == 0
+        if self.batch_size is None:
+            self.pipeline.put(self.inbox, _DONE)
+        if last:
+            self.stats.finished = time.monotonic()
+            if self.outbox is not None:
+                self.pipeline.put(self.outbox, _DONE)
+
+
+class IngestionPipeline:
+    def __init__(self, embedder, splitter=None, crawler=None, queue_size=64, embed_batch_size=256, embed_workers=2,
+                 extract_processes=None, stripper=None, dedup=True, dedup_filter=None):
+        self.embedder = embedder
+        self.splitter = splitter or RecursiveCharacterTextSplitter()
+        self.stripper = stripper
+        self.crawler = crawler or AsyncWebCrawler()
+        self.queue_size = queue_size
+        self.embed_batch_size = embed_batch_size
+        self.embed_workers = embed_workers
+        # HTML parsing and splitting are CPU-bound, so by default they run in one process per core
+        self.extract_processes = os.cpu_count() if extract_processes is None else extract_processes
+        self._pool = None
+        # Pass a loaded filter to also drop near-duplicates of chunks kept by earlier runs (other build shards)
+        if dedup_filter is None and dedup:
+            dedup_filter = NearDuplicateFilter()
+        self.dedup_filter = dedup_filter
+        # Kept chunk id -> sources of its near-duplicates; only duplicates are recorded. After run() it holds
+        # just those whose kept chunk came from an earlier run, for the caller to apply where that chunk is.
+        self.aliases = {}
+        self.vector_store = None
+        self.stages = []
+        self._stop = threading.Event()
+        self._error = None
+
+    def put(self, q, item):
+        while not self._stop.is_set():
+            try:
+                q.put(item, timeout=0.5)
+                return
+            except queue.Full:
+                pass
+        raise PipelineStopped()
+
+    def get(self, q):
+        while not self._stop.is_set():
+            try:
+                return q.get(timeout=0.5)
+            except queue.Empty:
+                pass
+        raise PipelineStopped()
+
+    def fail(self, error):
+        if self._error is None:
+            self._error = error
+        self._stop.set()
+
+    def _fetch(self, urls, outbox, stats):
+        async def fetch_all():
+            loop = asyncio.get_running_loop()
+            async for page in self.crawler.iter_pages(urls):
+                stats.items_in += 1
+                if page.ok:
+                    # put() blocks when extraction falls behind, which stops new requests being issued
+                    await loop.run_in_executor(None, self.put, outbox, page)
+                    stats.items_out += 1
+                elif page.status is not None:
+                    print(f"Failed to retrieve {page.url} (status {page.status})")
+
+        stats.started = time.monotonic()
+        try:
+            asyncio.run(fetch_all())
+            self.put(outbox, _DONE)
+        except PipelineStopped:
+            pass
+        except Exception as e:
+            self.fail(e)
+        stats.finished = time.monotonic()
+        stats.busy = stats.finished - stats.started
+
+    def _extract(self, page):
+        return [page_to_document(page, stripper=self.stripper)]
+
+    def _split(self, document):
+        return self.splitter.split_documents([document])
+
+    def _extract_and_split(self, page):
+        return self._pool.submit(extract_and_split, page).result()
+
+    def _dedup(self, chunk):
+        chunk.id = str(uuid.uuid4())
+        if self.dedup_filter is None:
+            return [chunk]
+        kept_id = self.dedup_filter.add(chunk.id, chunk.page_content)
+        if kept_id is None:
+            return [chunk]
+        # Near-duplicate of a chunk already indexed or on its way there: only remember where else it appears
+        sources = self.aliases.setdefault(kept_id, [])
+        if chunk.metadata.get("source") not in sources:
+            sources.append(chunk.metadata.get("source"))
+        return []
+
+    def _apply_aliases(self):
+        self.aliases = apply_aliases(self.vector_store.docstore, self.aliases)
+
+    def _embed(self, chunks):
+        texts = [chunk.page_content for chunk in chunks]
+        vectors = self.embedder.embed_documents(texts)
+        return [(chunks, vectors)]
+
+    def _index(self, batch):
+        chunks, vectors = batch
+        text_embeddings = list(zip([chunk.page_content for chunk in chunks], vectors))
+        metadatas = [chunk.metadata for chunk in chunks]
+        ids = [chunk.id for chunk in chunks]
+        if self.vector_store is None:
+            self.vector_store = FAISS.from_embeddings(text_embeddings, self.embedder, metadatas=metadatas, ids=ids)
+        else:
+            self.vector_store.add_embeddings(text_embeddings, metadatas=metadatas, ids=ids)
+        return []
+
+    def _create_stages(self, pages):
+        documents = queue.Queue(self.queue_size)
+        chunks = queue.Queue(self.queue_size * 8)
+        unique_chunks = queue.Queue(self.queue_size * 8)
+        embedded = queue.Queue(4)
+        if self._pool is not None:
+            # One thread per worker process keeps every process busy while the GIL is released
+            extract_stages = [
+                Stage(self, "extract", self._extract_and_split, pages, chunks, workers=self.extract_processes),
+            ]
+        else:
+            extract_stages = [
+                Stage(self, "extract", self._extract, pages, documents),
+                Stage(self, "split", self._split, documents, chunks),
+            ]
+        return extract_stages + [
+            Stage(self, "dedup", self._dedup, chunks, unique_chunks),
+            Stage(self, "embed", self._embed, unique_chunks, embedded, workers=self.embed_workers, batch_size=self.embed_batch_size),
+            Stage(self, "index", self._index, embedded, None),
+        ]
+
+    def report(self):
+        return "\n".join(stats.report() for stats in [self.fetch_stats] + [stage.stats for stage in self.stages])
+
+    def run(self, urls):
+        pages = queue.Queue(self.queue_size)
+        if self.extract_processes > 1:
+            self._pool = ProcessPoolExecutor(self.extract_processes, initializer=_init_worker, initargs=(self.splitter, self.stripper))
+        self.fetch_stats = StageStats("fetch")
+        self.stages = self._create_stages(pages)
+        fetcher = threading.Thread(target=self._fetch, args=(urls, pages, self.fetch_stats), name="fetch", daemon=True)
+
+        try:
+            fetcher.start()
+            for stage in self.stages:
+                stage.start()
+            fetcher.join()
+            for stage in self.stages:
+                stage.join()
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown(cancel_futures=True)
+                self._pool = None
+
+        print(self.report())
+        if self._error is not None:
+            raise self._error
+        if self.vector_store is not None:
+            self._apply_aliases()
+        return self.vector_store
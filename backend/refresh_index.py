@@ -0,0 +1,141 @@
+import argparse
+import os
+import uuid
+
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+from boilerplate import BoilerplateStripper
+from crawler import AsyncWebCrawler, page_to_document
+from database import VectorDB
+from sharded_index import is_sharded
+from dedup import DEDUP_FILE, NearDuplicateFilter
+from manifest import Manifest, content_hash
+from catalogue import CATALOGUE_PATH, GONE_STATUSES, load_urls, record_statuses
+
+
+def load_dedup_filter(vector_db):
+    # The filter the index was built with, without chunks deleted since; indexes built before it was saved
+    # get one from their docstore
+    path = os.path.join(vector_db.vector_path, DEDUP_FILE)
+    if not os.path.exists(path):
+        return NearDuplicateFilter.from_vector_store(vector_db.vector_store)
+    dedup_filter = NearDuplicateFilter.load(path)
+    live_ids = set(vector_db.vector_store.index_to_docstore_id.values())
+    dedup_filter.discard([doc_id for doc_id in dedup_filter.keys() if doc_id not in live_ids])
+    return dedup_filter
+
+
+def refresh_index(vector_db, urls, catalogue=None):
+    # With a catalogue, pages that are gone are marked there so later builds and refreshes skip them
+    manifest = Manifest.for_index(vector_db.vector_path)
+    if not len(manifest):
+        manifest.seed_from_vector_store(vector_db.vector_store)
+    dedup_filter = load_dedup_filter(vector_db)
+    splitter = RecursiveCharacterTextSplitter()
+    stripper = BoilerplateStripper.load()
+    urls = list(dict.fromkeys(urls))
+
+    # A chunk shared by several pages (near-duplicates dropped at build or refresh time) is only deleted
+    # once none of them contains it any more
+    references = manifest.chunk_references()
+    stale_ids = []
+    new_documents = []
+    new_ids = []
+    stats = {"unchanged": 0, "changed": 0, "removed": 0, "failed": 0, "duplicates": 0}
+    gone = {}
+
+    def release(doc_ids):
+        released = []
+        for doc_id in doc_ids:
+            references[doc_id] -= 1
+            if references[doc_id] <= 0:
+                released.append(doc_id)
+        # New text is no longer matched against chunks that are about to be deleted
+        dedup_filter.discard(released)
+        stale_ids.extend(released)
+
+    def remove(url):
+        entry = manifest.remove(url)
+        if entry:
+            release(entry["chunks"].values())
+            stats["removed"] += 1
+
+    for url in set(manifest.urls()) - set(urls):
+        remove(url)
+
+    for page in AsyncWebCrawler().fetch(urls, headers_for=manifest.conditional_headers):
+        if page.status == 304:
+            stats["unchanged"] += 1
+            continue
+        if str(page.status) in GONE_STATUSES:
+            remove(page.url)
+            gone[page.url] = page.status
+            continue
+        if not page.ok:
+            # Transient failures keep whatever is already indexed for the page
+            stats["failed"] += 1
+            continue
+
+        document = page_to_document(page, stripper=stripper)
+        text_hash = content_hash(document.page_content)
+        entry = manifest.get(page.url) or {"content_hash": None, "chunks": {}}
+        etag, last_modified = page.headers.get("ETag"), page.headers.get("Last-Modified")
+        if entry["content_hash"] == text_hash:
+            manifest.update(page.url, etag, last_modified)
+            stats["unchanged"] += 1
+            continue
+
+        # Changed page: keep chunks whose text is identical, embed only the new ones
+        old_chunks = entry["chunks"]
+        chunks = {}
+        new_chunks = []
+        for chunk in splitter.split_documents([document]):
+            chunk_hash = content_hash(chunk.page_content)
+            if chunk_hash in chunks:
+                continue
+            chunks[chunk_hash] = old_chunks.get(chunk_hash)
+            if chunk_hash not in old_chunks:
+                new_chunks.append((chunk_hash, chunk))
+        release(doc_id for chunk_hash, doc_id in old_chunks.items() if chunk_hash not in chunks)
+        # New chunks go through the build's dedup filter: a near-duplicate of a chunk already indexed for
+        # another page maps to that chunk instead of being embedded again
+        for chunk_hash, chunk in new_chunks:
+            doc_id = str(uuid.uuid4())
+            kept_id = dedup_filter.add(doc_id, chunk.page_content)
+            if kept_id is None:
+                new_documents.append(chunk)
+                new_ids.append(doc_id)
+            else:
+                stats["duplicates"] += 1
+            chunks[chunk_hash] = kept_id or doc_id
+            references[chunks[chunk_hash]] += 1
+        manifest.update(page.url, etag, last_modified, text_hash, chunks)
+        stats["changed"] += 1
+
+    if stale_ids:
+        vector_db.delete_documents(stale_ids, save=False)
+    if new_documents:
+        vector_db.add_documents(new_documents, ids=new_ids, save=False)
+    vector_db.save()
+    dedup_filter.save(os.path.join(vector_db.vector_path, DEDUP_FILE))
+    manifest.save()
+    if catalogue:
+        record_statuses(gone, catalogue)
+
+    print(
+        f"Refreshed {vector_db.vector_path}: {stats['changed']} changed, {stats['unchanged']} unchanged, "
+        f"{stats['removed']} removed, {stats['failed']} failed pages; "
+        f"embedded {len(new_documents)} chunks, {stats['duplicates']} near-duplicates, deleted {len(stale_ids)}"
+    )
+    return stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Re-ingest only the pages that changed since the last refresh")
+    parser.add_argument("--index", default="Swinburne_Chat_Bot")
+    args = parser.parse_args()
+
+    if is_sharded(args.index):
+        # The manifest, dedup filter and new chunks would all have to be split across the shards
+        parser.error(f"{args.index} is sharded; refresh the monolithic index and split it again with sharded_index.py")
+    refresh_index(VectorDB(vector_path=args.index), load_urls(), catalogue=CATALOGUE_PATH)
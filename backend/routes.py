@@ -1,24 +1,58 @@
-from fastapi import APIRouter, HTTPException
-from models import ChatRequest, ChatResponse, AddDataRequest, AddTopicRequest, SimilarTopicRequest, SimilarTopicResponse
-from database import VectorDB
+import asyncio
+import hmac
+import json
+import os
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from models import ChatRequest, ChatResponse, AddDataRequest, AddTopicRequest, SimilarTopicRequest, SimilarTopicResponse, ReloadRequest
+from database import ReloadableVectorDB
+from sharded_index import ShardedVectorDB, open_vector_db
 from chatbot import ChatBot
 from utils import update_topic_count, get_most_frequent_topics
 from langchain_core.documents import Document
 
 router = APIRouter()
 
-vector_db = VectorDB(vector_path='Swinburne_Chat_Bot')
-vector_db_topic = VectorDB(vector_path='Swinburne_Chat_Bot_Topics')
-chatbot = ChatBot(vector_db)
+vector_db = open_vector_db(vector_path='Swinburne_Chat_Bot')
+vector_db_topic = ReloadableVectorDB(vector_path='Swinburne_Chat_Bot_Topics')
+chatbot = ChatBot(vector_db, topics_db=vector_db_topic)
 
 @router.post("/chat", response_model=ChatResponse)
 async def chat(request: ChatRequest):
     try:
-        answer, similar_questions = chatbot.process_user_input(request.query)
-        return ChatResponse(answer=answer, similar_questions=similar_questions)
+        session = chatbot.sessions.session(request.session_id)
+        answer, similar_questions = await chatbot.aprocess_user_input(request.query, session)
+        return ChatResponse(answer=answer, similar_questions=similar_questions, session_id=session)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"An error occurred: {str(e)}")
 
+def _sse(event, data):
+    # JSON keeps newlines in the data escaped, so every event is exactly one event line and one data line
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+# Same as /chat, but streams the answer as Server-Sent Events while it is generated:
+#   event: token              data: "<text>"   (repeated)
+#   event: similar_questions  data: "q1*q2*..."
+#   event: done               data: {"session_id": "..."} (last, to send back with the next question)
+#   event: error              data: "<message>" (instead of the rest, if generation fails)
+@router.post("/chat/stream")
+async def chat_stream(request: ChatRequest):
+    session = chatbot.sessions.session(request.session_id)
+
+    async def events():
+        try:
+            async for event, data in chatbot.astream_user_input(request.query, session):
+                yield _sse(event, data)
+        except Exception as e:
+            yield _sse("error", f"An error occurred: {str(e)}")
+            return
+        yield _sse("done", {"session_id": session})
+
+    # No caching or proxy buffering, so each token reaches the browser as soon as it is sent
+    headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    return StreamingResponse(events(), media_type="text/event-stream", headers=headers)
+
 @router.get("/health")
 def health_check():
     return {"status": "OK"}
@@ -28,7 +62,7 @@ def health_check():
 async def add_data(request: AddDataRequest):
     try:
         documents = [Document(page_content=text) for text in request.documents]
-        vector_db.add_documents(documents)
+        await run_in_threadpool(vector_db.add_documents, documents)
         return {"message": "Documents added successfully"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"An error occurred while adding data: {str(e)}")
@@ -37,11 +71,13 @@ async def add_data(request: AddDataRequest):
 @router.post("/add-topic")
 async def add_topic(request: AddTopicRequest):
     try:
-        topics=[(chatbot.checkQuerySpelling(topic)).strip('\"') for topic in request.topics]
+        # Awaited, not called inline: the spelling checks are LLM round-trips and would block every other request
+        checked = await asyncio.gather(*(chatbot.acheckQuerySpelling(topic) for topic in request.topics))
+        topics = [topic.strip('\"') for topic in checked]
         print(topics)
         new_documents = [Document(page_content=topic) for topic in topics]
-        vector_db_topic.add_documents(new_documents)
-        update_topic_count(topics)
+        await run_in_threadpool(vector_db_topic.add_documents, new_documents)
+        await run_in_threadpool(update_topic_count, topics)
         return {"message": "Topics added successfully"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"An error occurred while adding topics: {str(e)}")
@@ -50,16 +86,33 @@ async def add_topic(request: AddTopicRequest):
 async def get_similar_topics(request: SimilarTopicRequest):
     try:
         if request.query:
-
-            # Get result from OpenAI if there is a chat history
-            chatbotResponse= chatbot.generate_similar_questionsWithFormat(request.query)
-            similar_topics = chatbotResponse
-            # Get result from db
-            # search_results = vector_db_topic.similarity_search(request.query, k=4)
-            # similar_topics = [doc.page_content for doc in search_results]
+            # Nearest popular past questions from the topics index; the LLM only fills in if too few are close
+            similar_topics = await chatbot.suggestions.asuggest(request.query)
         else:
             
             similar_topics = get_most_frequent_topics()
         return SimilarTopicResponse(topics=similar_topics)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"An error occurred: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"An error occurred: {str(e)}")
+
+# Swaps in the current (or given) version of an index without a restart; needs the ADMIN_TOKEN env var
+@router.post("/admin/reload")
+async def reload_index(request: ReloadRequest, x_admin_token: str | None = Header(default=None)):
+    admin_token = os.getenv('ADMIN_TOKEN')
+    if not admin_token or not hmac.compare_digest(x_admin_token or "", admin_token):
+        raise HTTPException(status_code=403, detail="Forbidden")
+    indexes = {"chat": vector_db, "topics": vector_db_topic}
+    if request.index not in indexes:
+        raise HTTPException(status_code=400, detail=f"Unknown index {request.index}, expected one of {', '.join(indexes)}")
+    index = indexes[request.index]
+    if request.shard and not isinstance(index, ShardedVectorDB):
+        raise HTTPException(status_code=400, detail=f"The {request.index} index is not sharded")
+    try:
+        if request.shard:
+            # Only this shard is swapped; the others keep serving what they had
+            version = await run_in_threadpool(index.reload_shard, request.shard, request.version)
+        else:
+            version = await run_in_threadpool(index.reload, request.version)
+        return {"message": "Index reloaded successfully", "version": version}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"An error occurred while reloading the index: {str(e)}")
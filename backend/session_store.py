@@ -0,0 +1,147 @@
+import os
+import re
+import secrets
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+SESSION_MAX_TURNS = int(os.getenv('SESSION_MAX_TURNS', "10"))
+SESSION_MAX_TOKENS = int(os.getenv('SESSION_MAX_TOKENS', "2000"))
+SESSION_IDLE_TIMEOUT = float(os.getenv('SESSION_IDLE_TIMEOUT', "1800"))
+SESSION_MAX_SESSIONS = int(os.getenv('SESSION_MAX_SESSIONS', "10000"))
+# Unset keeps sessions in memory only; a path keeps them across restarts and workers
+SESSION_DB_PATH = os.getenv('SESSION_DB_PATH')
+
+
+# What secrets.token_urlsafe(32) returns
+_SESSION_ID_RE = re.compile(r"[A-Za-z0-9_-]{43}")
+
+
+def _estimate_tokens(text):
+    # About four characters per token for English; only used to bound the window, so no tokenizer needed
+    return len(text) // 4 + 1
+
+
+class SessionStore:
+    # Conversation history per session id (see session). Each session keeps at most max_turns turns and
+    # max_tokens of text, oldest dropped first, so the prompt a request sends only depends on its own
+    # conversation. Sessions idle for longer than idle_timeout are evicted, least recently used first.
+    def __init__(self, max_turns=SESSION_MAX_TURNS, max_tokens=SESSION_MAX_TOKENS, idle_timeout=SESSION_IDLE_TIMEOUT,
+                 max_sessions=SESSION_MAX_SESSIONS, path=SESSION_DB_PATH):
+        self.max_turns = max_turns
+        self.max_tokens = max_tokens
+        self.idle_timeout = idle_timeout
+        self.max_sessions = max_sessions
+        # session -> (last used, [(question, answer), ...]), least recently used first; with a path the
+        # turns live in SQLite instead
+        self.sessions = OrderedDict()
+        self._lock = threading.Lock()
+        self._connection = None
+        self._purged = 0.0
+        # Seconds between sweeps of the SQLite store for idle sessions and sessions past max_sessions
+        self.purge_interval = 60
+        if path:
+            self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS turns (session TEXT NOT NULL, position INTEGER NOT NULL, question TEXT NOT NULL, "
+                "answer TEXT NOT NULL, created REAL NOT NULL, PRIMARY KEY (session, position))"
+            )
+            self._connection.commit()
+
+    def _window(self, turns):
+        # Newest turns that fit both limits
+        kept, tokens = [], 0
+        for question, answer in reversed(turns[-self.max_turns:] if self.max_turns else []):
+            tokens += _estimate_tokens(question) + _estimate_tokens(answer)
+            if tokens > self.max_tokens and kept:
+                break
+            kept.append((question, answer))
+        return kept[::-1]
+
+    def _evict(self, now):
+        while self.sessions:
+            session, (last_used, _) = next(iter(self.sessions.items()))
+            if now - last_used <= self.idle_timeout and len(self.sessions) <= self.max_sessions:
+                break
+            del self.sessions[session]
+        if self._connection is not None and now - self._purged >= self.purge_interval:
+            self._purged = now
+            self._connection.execute(
+                "DELETE FROM turns WHERE session IN (SELECT session FROM turns GROUP BY session HAVING MAX(created) < ?)",
+                (now - self.idle_timeout,),
+            )
+            # Every turn of a session is rewritten when it is used, so MAX(created) is when it was last used
+            self._connection.execute(
+                "DELETE FROM turns WHERE session IN (SELECT session FROM turns GROUP BY session ORDER BY MAX(created) DESC "
+                "LIMIT -1 OFFSET ?)",
+                (self.max_sessions,),
+            )
+            self._connection.commit()
+
+    def _turns(self, session, now):
+        if self._connection is not None:
+            # Read from disk every time: another worker may have answered this session's last turn
+            rows = self._connection.execute(
+                "SELECT question, answer, created FROM turns WHERE session = ? ORDER BY position", (session,)
+            ).fetchall()
+            if not rows or now - rows[-1][2] > self.idle_timeout:
+                return []
+            return [(question, answer) for question, answer, _ in rows]
+        # Not marked as used here: append() does that once the turn is answered, keeping the order by time
+        if session not in self.sessions:
+            return []
+        return self.sessions[session][1]
+
+    def session(self, session_id):
+        # The session a request continues. Ids are random and issued here, never made up by the client, so one
+        # caller cannot ask for another's conversation: an id this store does not hold (missing, malformed,
+        # never issued or evicted) starts a new session.
+        if session_id is not None and _SESSION_ID_RE.fullmatch(session_id):
+            with self._lock:
+                now = time.time()
+                self._evict(now)
+                if self._turns(session_id, now):
+                    return session_id
+        return secrets.token_urlsafe(32)
+
+    def history(self, session):
+        # Messages to send as chat_history; a request without a session gets none
+        if session is None:
+            return []
+        with self._lock:
+            now = time.time()
+            self._evict(now)
+            turns = self._turns(session, now)
+        messages = []
+        for question, answer in turns:
+            messages += [HumanMessage(content=question), AIMessage(content=answer)]
+        return messages
+
+    def append(self, session, question, answer):
+        if session is None:
+            return
+        with self._lock:
+            now = time.time()
+            turns = self._window(self._turns(session, now) + [(question, answer)])
+            if self._connection is None:
+                self.sessions[session] = (now, turns)
+                self.sessions.move_to_end(session)
+            else:
+                # Only the window is kept on disk too
+                self._connection.execute("DELETE FROM turns WHERE session = ?", (session,))
+                self._connection.executemany(
+                    "INSERT INTO turns (session, position, question, answer, created) VALUES (?, ?, ?, ?, ?)",
+                    [(session, position, question, answer, now) for position, (question, answer) in enumerate(turns)],
+                )
+                self._connection.commit()
+
+    def clear(self, session):
+        with self._lock:
+            self.sessions.pop(session, None)
+            if self._connection is not None:
+                self._connection.execute("DELETE FROM turns WHERE session = ?", (session,))
+                self._connection.commit()
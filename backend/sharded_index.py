@@ -0,0 +1,264 @@
+import argparse
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+
+import numpy as np
+
+from database import ReloadableVectorDB, SnapshotRetriever, fused_order, reciprocal_rank_fusion
+from embedding_cache import embed_queries
+from metadata_index import _value_matches, document_fields
+
+# A sharded index directory holds one complete index directory per shard and a shards.json saying how
+# documents are routed to them:
+#   Swinburne_Chat_Bot/shards.json                  {"by": "domain", "shards": [...], "default": "..."}
+#   Swinburne_Chat_Bot/www.swinburne.edu.au/        index.faiss, ... (may itself be versioned)
+#   Swinburne_Chat_Bot/www.swinburneonline.edu.au/
+SHARDS_FILE = "shards.json"
+SHARD_FIELDS = ("domain", "section")
+
+
+def shard_name(value):
+    # Directory name for a shard value: domains as they are, "/course/postgraduate" as "course-postgraduate"
+    return value.strip("/").replace("/", "-") or "root"
+
+
+def is_sharded(root):
+    return os.path.exists(os.path.join(root, SHARDS_FILE))
+
+
+def index_paths(root):
+    # The index directories under root: one per shard, or root itself
+    if not is_sharded(root):
+        return [root]
+    return [os.path.join(root, shard["name"]) for shard in read_shard_manifest(root)["shards"]]
+
+
+def read_shard_manifest(root):
+    with open(os.path.join(root, SHARDS_FILE)) as file:
+        return json.load(file)
+
+
+def write_shard_manifest(root, by, values, default=None):
+    shards = [{"name": shard_name(value), "value": value} for value in values]
+    manifest = {"by": by, "shards": shards, "default": default or shards[0]["name"]}
+    path = os.path.join(root, SHARDS_FILE)
+    with open(f"{path}.tmp", 'w') as file:
+        json.dump(manifest, file, indent=2)
+    os.replace(f"{path}.tmp", path)
+    return manifest
+
+
+def route(manifest, fields):
+    # Name of the shard a document with these domain/section fields belongs to
+    by = manifest["by"]
+    for shard in manifest["shards"]:
+        if _value_matches(by, shard["value"], fields[by]):
+            return shard["name"]
+    return manifest["default"]
+
+
+class ShardedVectorDB:
+    # One VectorDB per shard, searched in parallel on a thread pool and merged into a single top-k, so a
+    # query costs about as much as a search of the largest shard. FAISS and numpy release the GIL while
+    # searching. Each shard is a ReloadableVectorDB and can be rebuilt and reloaded on its own.
+    def __init__(self, vector_path, max_workers=None, **options):
+        self.root = vector_path
+        self.manifest = read_shard_manifest(vector_path)
+        self.shards = {
+            shard["name"]: ReloadableVectorDB(os.path.join(vector_path, shard["name"]), **options)
+            for shard in self.manifest["shards"]
+        }
+        self.executor = ThreadPoolExecutor(max_workers=max_workers or len(self.shards), thread_name_prefix="shard-search")
+        self._write_lock = threading.Lock()
+
+    @property
+    def embeddings(self):
+        return next(iter(self.shards.values())).vector_store.embeddings
+
+    @contextmanager
+    def _snapshots(self):
+        # Each shard's current snapshot, taken once and kept open for the whole query, so a shard reloading
+        # mid-query is searched consistently
+        with ExitStack() as stack:
+            yield [stack.enter_context(shard.snapshot()) for shard in self.shards.values()]
+
+    def _fan_out(self, search, snapshots):
+        futures = [self.executor.submit(search, vector_db) for vector_db in snapshots]
+        return [future.result() for future in futures]
+
+    def similarity_search_batch_with_score(self, queries, k=5, filter=None):
+        if not queries:
+            return []
+        vectors = np.array(embed_queries(self.embeddings, list(queries)), dtype=np.float32)
+        return self.search_vectors(vectors, k, filter)
+
+    def search_vectors(self, vectors, k=5, filter=None):
+        # All shards use the same embedding model and metric, so their distances compare directly
+        with self._snapshots() as snapshots:
+            per_shard = self._fan_out(lambda vector_db: vector_db.search_vectors(vectors, k, filter), snapshots)
+        merged = []
+        for query in range(len(vectors)):
+            results = [result for shard_results in per_shard for result in shard_results[query]]
+            merged.append(sorted(results, key=lambda result: result[1])[:k])
+        return merged
+
+    def similarity_search_batch(self, queries, k=5, filter=None):
+        return [[document for document, _ in results] for results in self.similarity_search_batch_with_score(queries, k, filter)]
+
+    def similarity_search(self, query, k=5, filter=None):
+        return self.similarity_search_batch([query], k=k, filter=filter)[0]
+
+    def hybrid_search(self, query, k=5, fetch_k=20, rrf_k=60, filter=None):
+        # Fused scores are only comparable within one ranking, so each shard returns its raw BM25 and vector
+        # rankings, the merged rankings are cut to fetch_k and fused once over all shards. BM25 scores use each
+        # shard's own document frequencies, which is close enough to order them by.
+        vector = self.embeddings.embed_query(query)
+        with self._snapshots() as snapshots:
+            per_shard = self._fan_out(
+                lambda vector_db: (vector_db, vector_db.hybrid_rankings(query, fetch_k, filter, vector=vector)), snapshots
+            )
+            owners = {}
+            vector_ranking, lexical_ranking, exact = [], [], set()
+            for vector_db, (shard_vector, shard_lexical, shard_exact) in per_shard:
+                for doc_id, _ in shard_vector + shard_lexical:
+                    owners[doc_id] = vector_db
+                vector_ranking += shard_vector
+                lexical_ranking += shard_lexical
+                exact |= shard_exact
+            rankings = [
+                sorted(vector_ranking, key=lambda result: result[1])[:fetch_k],
+                sorted(lexical_ranking, key=lambda result: -result[1])[:fetch_k],
+            ]
+            fused = reciprocal_rank_fusion(rankings, rrf_k)
+            best = fused_order(fused, exact)[:k]
+            documents = {}
+            for doc_id in best:
+                documents.update(owners[doc_id].documents([doc_id]))
+        return [documents[doc_id] for doc_id in best if doc_id in documents]
+
+    def retrieve(self, query, k=1, filter=None):
+        shards = [shard.current for shard in self.shards.values()]
+        if all(vector_db.hybrid and vector_db.lexical is not None for vector_db in shards):
+            return self.hybrid_search(query, k=k, filter=filter)
+        return self.similarity_search(query, k=k, filter=filter)
+
+    def get_retriever(self, filter=None):
+        return SnapshotRetriever(vector_db=self, k=1, filter=filter)
+
+    def add_documents(self, documents, ids=None, save=True):
+        # Each document goes to the shard its domain/section routes to; ids keep the caller's order
+        if not documents:
+            return []
+        ids = list(ids) if ids else [None] * len(documents)
+        groups = {}
+        for position, document in enumerate(documents):
+            groups.setdefault(route(self.manifest, document_fields(document.metadata)), []).append(position)
+        assigned = [None] * len(documents)
+        with self._write_lock:
+            for name, positions in groups.items():
+                group_ids = [ids[position] for position in positions]
+                new_ids = self.shards[name].add_documents(
+                    [documents[position] for position in positions],
+                    ids=group_ids if all(group_ids) else None,
+                    save=save,
+                )
+                for position, doc_id in zip(positions, new_ids):
+                    assigned[position] = doc_id
+        return assigned
+
+    def delete_documents(self, ids, save=True):
+        # Every shard drops the ids it has and ignores the rest
+        with self._write_lock:
+            return [doc_id for shard in self.shards.values() for doc_id in shard.delete_documents(ids, save=save)]
+
+    def save(self):
+        for shard in self.shards.values():
+            shard.save()
+
+    def reload(self, version=None):
+        # A version name belongs to one shard, so reloading every shard always takes their current versions
+        if version:
+            raise ValueError("Pass the shard to reload a specific version of a sharded index")
+        return {name: shard.reload() for name, shard in self.shards.items()}
+
+    def reload_shard(self, name, version=None):
+        if name not in self.shards:
+            raise ValueError(f"{self.root} has no shard {name}, expected one of {', '.join(self.shards)}")
+        return self.shards[name].reload(version)
+
+
+def open_vector_db(vector_path, **options):
+    # The API serves whichever layout is on disk: sharded, versioned or a plain index directory
+    if is_sharded(vector_path):
+        return ShardedVectorDB(vector_path, **options)
+    return ReloadableVectorDB(vector_path, **options)
+
+
+def split_index(vector_db, output, by="domain", values=None, docstore="sqlite"):
+    # Splits a loaded monolithic index into shards without re-crawling or re-embedding. With no values every
+    # distinct domain gets a shard; with values, whatever none of them covers goes to an "other" shard.
+    from langchain_community.docstore.in_memory import InMemoryDocstore
+    from langchain_community.vectorstores.faiss import FAISS
+    import faiss
+
+    from ann_index import create_index_config
+    from build_index import save_vector_store
+
+    vector_store = vector_db.vector_store
+    doc_ids = [doc_id for _, doc_id in sorted(vector_store.index_to_docstore_id.items())]
+    documents = [vector_store.docstore.search(doc_id) for doc_id in doc_ids]
+    fields = [document_fields(document.metadata) for document in documents]
+    if not values:
+        values = sorted({row_fields[by] for row_fields in fields})
+    manifest = {"by": by, "shards": [{"name": shard_name(value), "value": value} for value in values], "default": "other"}
+    rows_by_shard = {}
+    for row, row_fields in enumerate(fields):
+        rows_by_shard.setdefault(route(manifest, row_fields), []).append(row)
+    # A shard with nothing in it would be listed in shards.json without a directory to load
+    empty = [value for value in values if shard_name(value) not in rows_by_shard]
+    if empty:
+        print(f"Skipping {', '.join(empty)}: no chunks have {by} {' or '.join(empty)}")
+    values = [value for value in values if shard_name(value) in rows_by_shard]
+    if "other" in rows_by_shard:
+        values.append("other")
+    if not values:
+        raise ValueError(f"{vector_db.vector_path} has no chunks to split")
+
+    vectors = vector_store.index.reconstruct_n(0, vector_store.index.ntotal)
+    # Build parameters that depend on the index size (nlist) are worked out again per shard
+    config = {key: value for key, value in vector_db.index_config.items() if key not in ("type", "nlist")}
+    os.makedirs(output, exist_ok=True)
+    for name, rows in rows_by_shard.items():
+        index = faiss.IndexFlat(vectors.shape[1], vector_store.index.metric_type)
+        index.add(vectors[rows])
+        shard_store = FAISS(
+            vector_store.embeddings,
+            index,
+            InMemoryDocstore({doc_ids[row]: documents[row] for row in rows}),
+            {position: doc_ids[row] for position, row in enumerate(rows)},
+        )
+        save_vector_store(shard_store, os.path.join(output, name), create_index_config(vector_db.index_config["type"], **config), docstore)
+        print(f"Wrote {len(rows)} chunks to shard {name}")
+    return write_shard_manifest(output, by, values, default="other" if "other" in rows_by_shard else None)
+
+
+if __name__ == "__main__":
+    # python sharded_index.py --index Swinburne_Chat_Bot --output Swinburne_Chat_Bot_Sharded
+    # python sharded_index.py --index Swinburne_Chat_Bot --output Swinburne_Chat_Bot_Sharded --by section --values /news /course
+    from database import VectorDB
+
+    parser = argparse.ArgumentParser(description="Split an index into one shard per domain or path section")
+    parser.add_argument("--index", default="Swinburne_Chat_Bot")
+    parser.add_argument("--output", required=True)
+    parser.add_argument("--by", choices=SHARD_FIELDS, default="domain")
+    parser.add_argument("--values", nargs="+", help="shard values; anything they do not cover goes to an 'other' shard")
+    args = parser.parse_args()
+
+    if args.by == "section" and not args.values:
+        parser.error("--by section needs --values, e.g. --values /news /course")
+    if is_sharded(args.index):
+        parser.error(f"{args.index} is already sharded")
+    split_index(VectorDB(vector_path=args.index), args.output, args.by, args.values)
@@ -0,0 +1,197 @@
+import argparse
+import json
+import os
+import sqlite3
+import threading
+from collections.abc import MutableMapping
+
+import numpy as np
+from langchain_community.docstore.base import AddableMixin, Docstore
+from langchain_core.documents import Document
+
+DOCSTORE_FILE = "docstore.sqlite"
+IDS_FILE = "index.ids.npy"
+
+
+def connect(path):
+    connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("CREATE TABLE IF NOT EXISTS documents (id TEXT PRIMARY KEY, page_content TEXT NOT NULL, metadata TEXT NOT NULL)")
+    connection.commit()
+    return connection
+
+
+class SQLiteDocstore(Docstore, AddableMixin):
+    # Chunk text and metadata on disk, read by id only for the k results of a search.
+    # Same contract as InMemoryDocstore, so LangChain's FAISS store can use it unchanged.
+    def __init__(self, connection, lock=None):
+        self.connection = connection
+        self.lock = lock or threading.Lock()
+
+    def search(self, search):
+        with self.lock:
+            row = self.connection.execute("SELECT page_content, metadata FROM documents WHERE id = ?", (search,)).fetchone()
+        if row is None:
+            return f"ID {search} not found."
+        return Document(page_content=row[0], metadata=json.loads(row[1]))
+
+    def add(self, texts):
+        with self.lock:
+            placeholders = ",".join("?" * len(texts))
+            overlapping = self.connection.execute(f"SELECT id FROM documents WHERE id IN ({placeholders})", list(texts)).fetchall()
+            if overlapping:
+                raise ValueError(f"Tried to add ids that already exist: {set(row[0] for row in overlapping)}")
+        self.write(texts)
+
+    def write(self, texts):
+        # add() without the check, for rewriting documents a save already wrote before it was interrupted
+        with self.lock:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO documents (id, page_content, metadata) VALUES (?, ?, ?)",
+                [(doc_id, document.page_content, json.dumps(document.metadata)) for doc_id, document in texts.items()],
+            )
+            self.connection.commit()
+
+    def delete(self, ids):
+        with self.lock:
+            self.connection.executemany("DELETE FROM documents WHERE id = ?", [(doc_id,) for doc_id in ids])
+            self.connection.commit()
+
+    def __len__(self):
+        with self.lock:
+            return self.connection.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+
+class PendingDocstore(Docstore, AddableMixin):
+    # The documents added and deleted since the last save, in memory over the SQLite docstore. Every worker
+    # applies the logged writes to its own copy; only the one saving the index writes them to docstore.sqlite.
+    def __init__(self, docstore):
+        self.docstore = docstore
+        self.added = {}
+        self.deleted = set()
+
+    def search(self, search):
+        if search in self.added:
+            return self.added[search]
+        if search in self.deleted:
+            return f"ID {search} not found."
+        return self.docstore.search(search)
+
+    def add(self, texts):
+        self.added.update(texts)
+        self.deleted.difference_update(texts)
+
+    def delete(self, ids):
+        for doc_id in ids:
+            self.added.pop(doc_id, None)
+            self.deleted.add(doc_id)
+
+    def write_added(self):
+        # Before the save commits: a document nothing points at yet is harmless if the save never finishes
+        self.docstore.write(self.added)
+        self.added = {}
+
+    def write_deleted(self):
+        # After the save commits, once the saved row mapping no longer points at them
+        self.docstore.delete(self.deleted)
+        self.deleted = set()
+
+    def close(self):
+        self.docstore.close()
+
+
+class IndexIds(MutableMapping):
+    # FAISS row position -> docstore id, the part of index.pkl that FAISS looks up per result. Rows up to the
+    # last save come from index.ids.npy, memory-mapped and only ever replaced by a rename, so a worker still
+    # searching an older save keeps reading the ids that match its vectors. Rows added since are kept here.
+    def __init__(self, ids):
+        self.ids = ids
+        self.added = {}
+
+    def __getitem__(self, position):
+        position = int(position)
+        if 0 <= position < len(self.ids):
+            return self.ids[position].decode("utf-8")
+        return self.added[position]
+
+    def __setitem__(self, position, doc_id):
+        self.added[int(position)] = doc_id
+
+    def __delitem__(self, position):
+        del self.added[int(position)]
+
+    def __iter__(self):
+        return iter(range(len(self)))
+
+    def __len__(self):
+        return len(self.ids) + len(self.added)
+
+    def items(self):
+        return list(enumerate(self.values()))
+
+    def values(self):
+        return [doc_id.decode("utf-8") for doc_id in self.ids.tolist()] + [self.added[position] for position in sorted(self.added)]
+
+
+def write_ids(vector_path, doc_ids):
+    path = os.path.join(vector_path, IDS_FILE)
+    tmp_path = f"{path}.{os.getpid()}.tmp.npy"
+    np.save(tmp_path, np.array([doc_id.encode("utf-8") for doc_id in doc_ids], dtype=bytes))
+    os.replace(tmp_path, path)
+
+
+def load_index_ids(vector_path, connection=None):
+    path = os.path.join(vector_path, IDS_FILE)
+    if os.path.exists(path):
+        return IndexIds(np.load(path, mmap_mode="r"))
+    # Exported before index.ids.npy: the mapping is in the index_map table until the next save writes the file
+    if connection is None or not connection.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'index_map'").fetchone():
+        return IndexIds(np.array([], dtype=bytes))
+    rows = connection.execute("SELECT doc_id FROM index_map ORDER BY position").fetchall()
+    return IndexIds(np.array([row[0].encode("utf-8") for row in rows], dtype=bytes))
+
+
+def open_docstore(vector_path):
+    connection = connect(os.path.join(vector_path, DOCSTORE_FILE))
+    return PendingDocstore(SQLiteDocstore(connection)), load_index_ids(vector_path, connection)
+
+
+def export_docstore(vector_store, vector_path):
+    # Writes the store's docstore to docstore.sqlite and its row mapping to index.ids.npy, replacing any existing ones
+    path = os.path.join(vector_path, DOCSTORE_FILE)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    doc_ids = [doc_id for _, doc_id in sorted(vector_store.index_to_docstore_id.items())]
+    connection = connect(tmp_path)
+    connection.executemany(
+        "INSERT INTO documents (id, page_content, metadata) VALUES (?, ?, ?)",
+        (
+            (doc_id, document.page_content, json.dumps(document.metadata))
+            for doc_id, document in ((doc_id, vector_store.docstore.search(doc_id)) for doc_id in doc_ids)
+        ),
+    )
+    connection.commit()
+    connection.execute("PRAGMA journal_mode=DELETE")
+    connection.close()
+    write_ids(vector_path, doc_ids)
+    os.replace(tmp_path, path)
+
+
+if __name__ == "__main__":
+    # One-off conversion of an existing index: python sqlite_docstore.py --index Swinburne_Chat_Bot
+    from langchain_community.vectorstores.faiss import FAISS
+    from embedding_cache import create_embedder
+
+    parser = argparse.ArgumentParser(description="Move a FAISS index's pickled docstore into SQLite")
+    parser.add_argument("--index", default="Swinburne_Chat_Bot")
+    parser.add_argument("--remove-pickle", action="store_true")
+    args = parser.parse_args()
+
+    vector_store = FAISS.load_local(args.index, create_embedder(), index_name="index", allow_dangerous_deserialization=True)
+    export_docstore(vector_store, args.index)
+    if args.remove_pickle:
+        os.remove(os.path.join(args.index, "index.pkl"))
+    print(f"Wrote {os.path.join(args.index, DOCSTORE_FILE)} and {os.path.join(args.index, IDS_FILE)}")
@@ -0,0 +1,84 @@
+import asyncio
+import os
+import re
+import threading
+
+from database import SEARCH_EXECUTOR
+from utils import load_topic_counts, topics_file
+
+# Squared L2 distance between unit-length OpenAI embeddings, i.e. 2 - 2 * cosine; past it a past question is
+# too far from the query to suggest
+SUGGESTION_MAX_DISTANCE = float(os.getenv('SUGGESTION_MAX_DISTANCE', "0.6"))
+# Times a question must have been asked (topics.csv) before it is suggested to other students: a question asked
+# only once may carry one student's personal details
+SUGGESTION_MIN_COUNT = int(os.getenv('SUGGESTION_MIN_COUNT', "3"))
+# Set to 0 to never call the LLM for suggestions, returning fewer (or none) instead
+SUGGESTION_LLM_FALLBACK = os.getenv('SUGGESTION_LLM_FALLBACK', '1') != '0'
+
+_BULLET_RE = re.compile(r"^\s*(?:[-*•]|\d+[.)])\s*")
+
+
+def _normalize(question):
+    return " ".join(question.lower().split()).rstrip("?.! ")
+
+
+class SuggestionEngine:
+    # Suggests follow-up questions from the ones students actually asked: the nearest questions in the topics
+    # index, most asked first (counts from topics.csv). One embedding and one FAISS search, no LLM call; the
+    # LLM (`fallback`, an async function of the query) only fills in when too few past questions are close.
+    def __init__(self, vector_db_topic, fallback=None, k=4, fetch_k=20, max_distance=SUGGESTION_MAX_DISTANCE,
+                 min_count=SUGGESTION_MIN_COUNT, llm_fallback=SUGGESTION_LLM_FALLBACK):
+        self.vector_db_topic = vector_db_topic
+        self.fallback = fallback if llm_fallback else None
+        self.k = k
+        self.fetch_k = fetch_k
+        self.max_distance = max_distance
+        self.min_count = min_count
+        self._counts = {}
+        self._counts_mtime = None
+        self._counts_lock = threading.Lock()
+
+    def _topic_counts(self):
+        # Re-read only when /add-topic has rewritten the file
+        try:
+            mtime = os.path.getmtime(topics_file)
+        except OSError:
+            return self._counts
+        with self._counts_lock:
+            if mtime != self._counts_mtime:
+                try:
+                    self._counts = {_normalize(topic): count for topic, count in load_topic_counts().items()}
+                    self._counts_mtime = mtime
+                except (OSError, ValueError, KeyError) as e:
+                    # Caught mid-rewrite; the previous counts do until the next call
+                    print(f"Could not read {topics_file}: {e}")
+            return self._counts
+
+    def suggest_from_topics(self, query, k=None):
+        k = k or self.k
+        results = self.vector_db_topic.similarity_search_batch_with_score([query], k=self.fetch_k)[0]
+        counts = self._topic_counts()
+        seen = {_normalize(query)}
+        candidates = []
+        for document, distance in results:
+            key = _normalize(document.page_content)
+            count = counts.get(key, 0)
+            if distance > self.max_distance or key in seen or count < self.min_count:
+                continue
+            seen.add(key)
+            candidates.append((document.page_content.strip(), distance, count))
+        # The 2k nearest, most popular first; among equally popular questions the nearer one wins
+        candidates = sorted(candidates[:2 * k], key=lambda candidate: (-candidate[2], candidate[1]))
+        return [question for question, _, _ in candidates[:k]]
+
+    async def asuggest(self, query, k=None):
+        k = k or self.k
+        suggestions = await asyncio.get_running_loop().run_in_executor(SEARCH_EXECUTOR, self.suggest_from_topics, query, k)
+        if len(suggestions) < k and self.fallback is not None:
+            seen = {_normalize(question) for question in suggestions}
+            for question in await self.fallback(query):
+                question = _BULLET_RE.sub("", question).strip()
+                if question and _normalize(question) not in seen and len(suggestions) < k:
+                    seen.add(_normalize(question))
+                    suggestions.append(question)
+        return suggestions
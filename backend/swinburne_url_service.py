@@ -1,5 +1,18 @@
+import gzip
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
 import requests
 from bs4 import BeautifulSoup
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
+from requests.adapters import HTTPAdapter
+
+from catalogue import save_catalogue
+
+SITEMAP_URLS = [
+    "https://www.swinburne.edu.au/sitemap.xml",
+    "https://www.swinburneonline.edu.au/sitemap_index.xml",
+]
 
 def parse_sitemap(url):
     response = requests.get(url)
@@ -21,23 +34,94 @@ def parse_sitemap(url):
 
     return extracted_urls
 
-def save_urls_to_file(urls, filename):
-    urls_string = "urls = [\n"
-    for url in urls:
-        urls_string += f"    '{url}',\n"
-    urls_string += "]\n"
+def create_session(pool_size=16):
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=3)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
 
-    with open(filename, 'w') as file:
-        file.write(urls_string)
+def _local_name(tag):
+    return tag.rsplit('}', 1)[-1]
 
-if __name__ == "__main__":
-    sitemap_url = "https://www.swinburne.edu.au/sitemap.xml"
-    all_urls = parse_sitemap(sitemap_url)
-    sitemap_url2 = 'https://www.swinburneonline.edu.au/sitemap_index.xml'
-    all_urls.extend(parse_sitemap(sitemap_url2))
+# What a sitemap cut off mid-download raises: the body read straight from the socket fails in urllib3, a
+# truncated .gz in gzip and a truncated document in the parser
+SITEMAP_ERRORS = (requests.RequestException, ProtocolError, ReadTimeoutError, OSError, EOFError, ET.ParseError)
 
+def stream_sitemap(session, url):
+    # Parses the response incrementally and drops each <url> element once read,
+    # so memory does not depend on the size of the sitemap
+    entries = []
+    child_sitemaps = []
+    with session.get(url, stream=True, timeout=30) as response:
+        if response.status_code != 200:
+            print(f"Failed to retrieve {url}")
+            return entries, child_sitemaps
 
-    save_urls_to_file(all_urls, 'urls_list.py')
+        response.raw.decode_content = True
+        source = gzip.GzipFile(fileobj=response.raw) if url.endswith(".gz") else response.raw
+        # Open elements, so a finished <url> can be removed from its parent and not just emptied
+        parents = []
+        for event, element in ET.iterparse(source, events=("start", "end")):
+            if event == "start":
+                parents.append(element)
+                continue
+            parents.pop()
+            name = _local_name(element.tag)
+            if name == "url":
+                fields = {_local_name(child.tag): (child.text or "").strip() for child in element}
+                entries.append({
+                    "url": fields.get("loc"),
+                    "lastmod": fields.get("lastmod"),
+                    "changefreq": fields.get("changefreq"),
+                    "priority": fields.get("priority"),
+                })
+            elif name == "sitemap":
+                fields = {_local_name(child.tag): (child.text or "").strip() for child in element}
+                child_sitemaps.append(fields.get("loc"))
+            else:
+                continue
+            element.clear()
+            if parents:
+                parents[-1].remove(element)
+    return entries, child_sitemaps
+
+def discover_urls(sitemap_urls=SITEMAP_URLS, max_workers=16):
+    session = create_session(max_workers)
+    results = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {executor.submit(stream_sitemap, session, url): url for url in sitemap_urls}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                url = pending.pop(future)
+                try:
+                    results[url] = future.result()
+                except SITEMAP_ERRORS as e:
+                    print(f"Failed to retrieve {url}: {e}")
+                    results[url] = ([], [])
+                for child in results[url][1]:
+                    if child not in results and child not in pending.values():
+                        pending[executor.submit(stream_sitemap, session, child)] = child
+
+    # Assemble in the same depth-first order parse_sitemap produces
+    entries = []
+    visited = set()
+    def collect(url):
+        if url in visited:
+            return
+        visited.add(url)
+        found, child_sitemaps = results[url]
+        entries.extend(found)
+        for child in child_sitemaps:
+            collect(child)
+    for url in sitemap_urls:
+        collect(url)
+    return entries
+
+if __name__ == "__main__":
+    entries = discover_urls(SITEMAP_URLS)
+    save_catalogue(entries)
     
     #for url in all_urls:
         #print(url)
@@ -0,0 +1,36 @@
+import os
+import sys
+import threading
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+# The backend modules import each other by bare name, as they do when run from backend/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Read at import time by create_vector_store and the OpenAI clients; the tests never call the API
+os.environ.setdefault("USER_AGENT", "swinburne-chatbot-tests")
+os.environ.setdefault("OPENAI_API_KEY", "test")
+
+
+@pytest.fixture
+def http_server():
+    # Starts a local HTTP server for a BaseHTTPRequestHandler class; handlers reach shared state through
+    # self.server, so tests set it on the returned server. Shut down after the test.
+    servers = []
+
+    def start(handler):
+        # Without the per-request log lines on stderr
+        quiet = type(handler.__name__, (handler,), {"log_message": lambda self, *args: None})
+        server = ThreadingHTTPServer(("127.0.0.1", 0), quiet)
+        server.url = lambda path="": f"http://127.0.0.1:{server.server_port}{path}"
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        servers.append((server, thread))
+        return server
+
+    yield start
+    for server, thread in servers:
+        server.shutdown()
+        server.server_close()
+        thread.join()
@@ -0,0 +1,42 @@
+import faiss
+import numpy as np
+
+from ann_index import RerankIndex, create_index, create_index_config
+from mmap_index import export_vectors
+
+
+def _flat(vectors):
+    index = faiss.IndexFlatL2(vectors.shape[1])
+    index.add(vectors)
+    return index
+
+
+def exact_search(vectors, query, k):
+    return ((vectors - query) ** 2).sum(axis=1).argsort()[:k]
+
+
+def test_rerank_index_writes_keep_the_file_mapped(tmp_path):
+    generator = np.random.default_rng(0)
+    vectors = generator.standard_normal((200, 16)).astype(np.float32)
+    export_vectors(str(tmp_path), _flat(vectors))
+    index = RerankIndex.load(create_index(vectors, create_index_config("sq8")), str(tmp_path), factor=50)
+
+    added = generator.standard_normal((30, 16)).astype(np.float32)
+    for row in added:
+        index.add(row[None])
+    index.remove_ids(np.array([0, 5, 150, 210]))
+    # The mmap'd file is never copied onto the heap
+    assert isinstance(index.vectors, np.memmap)
+
+    live = np.delete(np.concatenate([vectors, added]), [0, 5, 150, 210], axis=0)
+    assert index.ntotal == len(live)
+    np.testing.assert_array_equal(index.reconstruct_n(0, index.ntotal), live)
+    for query in generator.standard_normal((5, 16)).astype(np.float32):
+        _, labels = index.search(query[None], 5)
+        np.testing.assert_array_equal(labels[0], exact_search(live, query, 5))
+
+    index.save_vectors(str(tmp_path))
+    index.reopen(str(tmp_path))
+    np.testing.assert_array_equal(np.asarray(index.vectors), live)
+    _, labels = index.search(live[7][None], 1)
+    assert labels[0][0] == 7
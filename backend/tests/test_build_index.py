@@ -0,0 +1,133 @@
+import json
+import os
+import uuid
+
+import pytest
+from langchain_community.vectorstores.faiss import FAISS
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+import build_index
+from build_index import IndexBuilder
+from catalogue import load_urls, save_catalogue
+from dedup import DEDUP_FILE, NearDuplicateFilter
+from pipeline import apply_aliases
+
+EMBEDDER = DeterministicFakeEmbedding(size=16)
+
+
+def page_text(url):
+    return " ".join(f"page{url.rsplit('/', 1)[-1]}word{n}" for n in range(10))
+
+
+class FakePipeline:
+    # Stands in for the crawl + embed pipeline: each url becomes one chunk (its text from `texts`) unless it
+    # is listed as failing, and near-duplicates are dropped with the given filter
+    def __init__(self, failing, texts, dedup_filter):
+        self.failing = failing
+        self.texts = texts
+        self.dedup_filter = dedup_filter
+        self.aliases = {}
+        self.crawler = type("Crawler", (), {"failures": {}})()
+
+    def run(self, urls):
+        fetched = []
+        for url in urls:
+            if url in self.failing:
+                self.crawler.failures[url] = self.failing[url]
+                continue
+            doc_id, text = str(uuid.uuid4()), self.texts.get(url, page_text(url))
+            kept_id = self.dedup_filter.add(doc_id, text)
+            if kept_id is None:
+                fetched.append((doc_id, url, text))
+            else:
+                self.aliases.setdefault(kept_id, []).append(url)
+        if not fetched:
+            return None
+        ids, urls, texts = zip(*fetched)
+        vector_store = FAISS.from_texts(list(texts), EMBEDDER, metadatas=[{"source": url} for url in urls], ids=list(ids))
+        self.aliases = apply_aliases(vector_store.docstore, self.aliases)
+        return vector_store
+
+
+@pytest.fixture
+def builder(tmp_path, monkeypatch):
+    failing = {}
+    texts = {}
+    monkeypatch.setattr(build_index, "create_pipeline", lambda dedup_filter: FakePipeline(failing, texts, dedup_filter))
+    monkeypatch.setattr(build_index, "load_index", lambda path: FAISS.load_local(path, EMBEDDER, allow_dangerous_deserialization=True))
+    urls = [f"https://www.swinburne.edu.au/page/{i}" for i in range(6)]
+    builder = IndexBuilder(urls, str(tmp_path / "index"), shard_size=3, docstore="pickle")
+    builder.texts = texts
+    return builder, failing
+
+
+def sources(vector_store):
+    return sorted(vector_store.docstore.search(doc_id).metadata["source"] for doc_id in vector_store.index_to_docstore_id.values())
+
+
+def test_failed_urls_are_retried_on_resume(builder):
+    builder, failing = builder
+    failing[builder.urls[1]] = 429
+    failing[builder.urls[4]] = None
+    # A 404 is final: it is not recorded for retry and does not block the build
+    failing[builder.urls[5]] = 404
+    with pytest.raises(RuntimeError):
+        builder.build()
+    with open(builder.checkpoint_path) as file:
+        checkpoint = json.load(file)
+    assert checkpoint["shards"]["00000-00002"]["failed"] == [builder.urls[1]]
+    assert checkpoint["shards"]["00003-00005"]["failed"] == [builder.urls[4]]
+
+    del failing[builder.urls[1]], failing[builder.urls[4]]
+    vector_store = builder.build()
+    assert sources(vector_store) == builder.urls[:5]
+
+
+def test_checkpoint_is_removed_after_merge(builder):
+    builder, failing = builder
+    builder.build()
+    assert not os.path.exists(builder.shards_dir)
+    # A second build of the same urls fetches everything again instead of reusing old shards
+    failing[builder.urls[0]] = 404
+    assert sources(builder.build()) == builder.urls[1:]
+
+
+def test_allow_failures_merges_without_failed_urls(builder):
+    builder, failing = builder
+    failing[builder.urls[2]] = 503
+    assert sources(builder.build(allow_failures=True)) == builder.urls[:2] + builder.urls[3:]
+
+
+def test_nothing_indexed_is_a_clear_error(builder):
+    builder, failing = builder
+    failing.update({url: 404 for url in builder.urls})
+    with pytest.raises(ValueError, match="nothing to merge"):
+        builder.build()
+
+
+def test_gone_urls_are_marked_in_the_catalogue(builder, tmp_path):
+    builder, failing = builder
+    builder.catalogue = str(tmp_path / "urls.csv.gz")
+    save_catalogue([{"url": url} for url in builder.urls], builder.catalogue)
+    failing[builder.urls[1]] = 404
+    failing[builder.urls[3]] = 410
+    builder.build()
+    assert load_urls(builder.catalogue) == [builder.urls[0], builder.urls[2]] + builder.urls[4:]
+    assert len(load_urls(builder.catalogue, include_gone=True)) == 6
+
+
+def test_near_duplicates_are_dropped_across_shards(builder):
+    builder, failing = builder
+    text = "Swinburne students can apply for a scholarship through the online portal before the closing date each year"
+    builder.texts[builder.urls[0]] = text
+    builder.texts[builder.urls[4]] = text + "."
+    # Shard 00003-00005 is retried after the first shard's chunks are in the saved filter
+    failing[builder.urls[5]] = 503
+    with pytest.raises(RuntimeError):
+        builder.build()
+    del failing[builder.urls[5]]
+    vector_store = builder.build()
+    assert sources(vector_store) == [url for url in builder.urls if url != builder.urls[4]]
+    [owner] = [document for document in vector_store.docstore._dict.values() if document.page_content == text]
+    assert owner.metadata["aliases"] == [builder.urls[4]]
+    assert len(NearDuplicateFilter.load(os.path.join(builder.output, DEDUP_FILE))) == 5
@@ -0,0 +1,61 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from chatbot import ChatBot
+from database import SnapshotRetriever
+
+
+class VectorDB:
+    def get_retriever(self):
+        return SnapshotRetriever(vector_db=self)
+
+
+@pytest.fixture
+def chatbot(monkeypatch):
+    # Answers at once; similar questions take far longer than the deadline
+    chatbot = ChatBot(VectorDB())
+    chatbot.similar_questions_deadline = 0.2
+    released = threading.Event()
+
+    async def answer(query, chat_history):
+        return "The Hawthorn campus library opens at 8am."
+
+    async def slow_suggestions(query):
+        await asyncio.sleep(30)
+        return ["Where is the library?"]
+
+    def slow_similar_questions(query):
+        released.wait(30)
+        return "Where is the library?"
+
+    class Chain:
+        async def astream(self, inputs):
+            for token in ("The Hawthorn ", "campus library"):
+                yield {"answer": token}
+
+    monkeypatch.setattr(chatbot, "aprocess_chat", answer)
+    monkeypatch.setattr(chatbot, "asuggest_questions", slow_suggestions)
+    monkeypatch.setattr(chatbot, "process_chat", lambda query, chat_history: "The Hawthorn campus library opens at 8am.")
+    monkeypatch.setattr(chatbot, "process_chat_with_similar_questions", slow_similar_questions)
+    monkeypatch.setattr(chatbot, "chain", Chain())
+    yield chatbot
+    released.set()
+
+
+def test_answer_is_returned_without_similar_questions_past_the_deadline(chatbot):
+    start = time.monotonic()
+    assert asyncio.run(chatbot.aprocess_user_input("library hours")) == ("The Hawthorn campus library opens at 8am.", "")
+    assert chatbot.process_user_input("library hours") == ("The Hawthorn campus library opens at 8am.", "")
+    assert time.monotonic() - start < 5
+
+
+def test_stream_sends_empty_similar_questions_past_the_deadline(chatbot):
+    async def collect():
+        return [event async for event in chatbot.astream_user_input("library hours")]
+
+    start = time.monotonic()
+    assert asyncio.run(collect()) == [("token", "The Hawthorn "), ("token", "campus library"), ("similar_questions", "")]
+    assert time.monotonic() - start < 5
@@ -0,0 +1,86 @@
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+from crawler import AsyncWebCrawler
+
+PAGE = b"<html><head><title>Fixture</title></head><body><p>Swinburne fixture page</p></body></html>"
+
+
+class CrawlHandler(BaseHTTPRequestHandler):
+    # Records how often each path was requested and when each request arrived
+    def do_GET(self):
+        with self.server.lock:
+            hits = self.server.hits[self.path] = self.server.hits.get(self.path, 0) + 1
+            self.server.times.append(time.monotonic())
+        if self.path.startswith("/ok/") or (self.path == "/rate-limited" and hits > 2):
+            self._send(200, PAGE, {"Content-Type": "text/html"})
+        elif self.path == "/rate-limited":
+            # 429 twice, then the page
+            self._send(429, b"", {"Retry-After": "0"})
+        elif self.path == "/unavailable":
+            self._send(503, b"", {"Retry-After": "0"})
+        else:
+            self._send(404, b"", {})
+
+    def _send(self, status, body, headers):
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server(http_server):
+    server = http_server(CrawlHandler)
+    server.lock = threading.Lock()
+    server.hits = {}
+    server.times = []
+    return server
+
+
+def test_retries_rate_limited_page(server):
+    crawler = AsyncWebCrawler(delay=0, retries=3)
+    [page] = crawler.fetch([server.url("/rate-limited")])
+    assert page.ok
+    assert server.hits["/rate-limited"] == 3
+    assert crawler.failures == {}
+
+
+def test_server_errors_are_reported_after_retries(server):
+    crawler = AsyncWebCrawler(delay=0, retries=3)
+    documents = crawler.load([server.url("/unavailable"), server.url("/missing"), server.url("/ok/a")])
+    assert [document.metadata["source"] for document in documents] == [server.url("/ok/a")]
+    assert server.hits["/unavailable"] == 3
+    # 404 is final and not retried
+    assert server.hits["/missing"] == 1
+    assert crawler.failures == {server.url("/unavailable"): 503, server.url("/missing"): 404}
+
+
+def test_unreachable_host_is_reported():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    crawler = AsyncWebCrawler(delay=0, retries=1)
+    [page] = crawler.fetch([f"http://127.0.0.1:{port}/"])
+    assert page.status is None and page.retryable
+    assert crawler.failures == {f"http://127.0.0.1:{port}/": None}
+
+
+def test_zero_retries_still_fetches_once(server):
+    [page] = AsyncWebCrawler(delay=0, retries=0).fetch([server.url("/ok/a")])
+    assert page is not None and page.ok
+
+
+def test_per_host_delay(server):
+    crawler = AsyncWebCrawler(concurrency=16, per_host=8, delay=0.2)
+    pages = crawler.fetch([server.url(f"/ok/{i}") for i in range(5)])
+    assert all(page.ok for page in pages)
+    gaps = [later - earlier for earlier, later in zip(server.times, server.times[1:])]
+    assert len(gaps) == 4
+    assert min(gaps) >= 0.18
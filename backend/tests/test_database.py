@@ -0,0 +1,187 @@
+import os
+import threading
+import time
+
+import pytest
+from langchain_community.vectorstores.faiss import FAISS
+from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+import database
+from ann_index import create_index_config
+from build_index import save_vector_store
+from database import ReloadableVectorDB, StaleIndexError, VectorDB, fused_order, reciprocal_rank_fusion
+from index_versions import publish_version
+
+EMBEDDER = DeterministicFakeEmbedding(size=16)
+
+
+def page(name):
+    return Document(page_content=f"{name} chunk text", metadata={"source": f"https://www.swinburne.edu.au/{name}"})
+
+
+@pytest.fixture
+def index_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(database, "create_embedder", lambda: EMBEDDER)
+    monkeypatch.setenv("VECTOR_DB_COMPACT_INTERVAL", "3600")
+    path = str(tmp_path / "index")
+    vector_store = FAISS.from_documents([page("placeholder")], EMBEDDER)
+    save_vector_store(vector_store, path, create_index_config("flat"))
+    return path
+
+
+def wait_for(condition, timeout=10):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def contents(vector_db):
+    return sorted(document.page_content for document in vector_db.similarity_search("chunk", k=10))
+
+
+def test_workers_follow_the_log_and_one_save_keeps_every_write(index_path):
+    # Two VectorDBs on one directory stand in for two uvicorn workers
+    first, second = VectorDB(index_path), VectorDB(index_path)
+    [alpha] = first.add_documents([page("alpha")])
+    assert second.documents([alpha])[alpha].page_content == "alpha chunk text"
+    second.add_documents([page("beta")])
+    second.delete_documents([alpha])
+    assert contents(first) == contents(second) == ["beta chunk text", "placeholder chunk text"]
+
+    first.save()
+    # The save folded in the second worker's writes; that worker now has to reload before writing again
+    assert second.stale() and not first.stale()
+    with pytest.raises(StaleIndexError):
+        second.add_documents([page("gamma")])
+    assert contents(VectorDB(index_path)) == ["beta chunk text", "placeholder chunk text"]
+
+
+def test_reloadable_store_picks_up_another_workers_save(index_path):
+    served, other = ReloadableVectorDB(index_path), VectorDB(index_path)
+    other.add_documents([page("alpha")])
+    other.save()
+    snapshot = served._current
+    # The first request after the save starts the reload; it finishes on the old snapshot
+    assert served.current is snapshot
+    wait_for(lambda: served._current is not snapshot)
+    served.add_documents([page("beta")])
+    assert contents(other) == ["alpha chunk text", "beta chunk text", "placeholder chunk text"]
+
+
+def test_every_worker_follows_a_published_version(index_path):
+    root = os.path.dirname(index_path)
+    os.rename(index_path, os.path.join(root, "v1"))
+    vector_store = FAISS.from_documents([page("rebuilt")], EMBEDDER)
+    save_vector_store(vector_store, os.path.join(root, "v2"), create_index_config("flat"))
+    publish_version(root, "v1")
+    workers = [ReloadableVectorDB(root), ReloadableVectorDB(root)]
+    with workers[0].snapshot() as in_flight:
+        publish_version(root, "v2")
+        for worker in workers:
+            worker.current
+        wait_for(lambda: all(worker._current.version == "v2" for worker in workers))
+        # A request that started on v1 keeps it open until it is done
+        assert contents(in_flight) == ["placeholder chunk text"]
+        assert not in_flight.closed
+    wait_for(lambda: in_flight.closed)
+    assert [contents(worker) for worker in workers] == [["rebuilt chunk text"]] * 2
+
+    # A rollback through one worker is published, so the other follows it too
+    workers[0].reload("v1")
+    wait_for(lambda: workers[1].current.version == "v1")
+
+
+def test_searches_run_while_the_index_is_written(index_path):
+    vector_db = VectorDB(index_path)
+    errors = []
+    done = threading.Event()
+
+    def search():
+        while not done.is_set():
+            try:
+                for document in vector_db.similarity_search("chunk", k=5):
+                    assert document.page_content.endswith("chunk text")
+                vector_db.hybrid_search("chunk", k=5)
+            except Exception as e:
+                errors.append(e)
+                return
+
+    threads = [threading.Thread(target=search) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    try:
+        for round in range(20):
+            ids = vector_db.add_documents([page(f"page{round}-{n}") for n in range(5)])
+            vector_db.delete_documents(ids[:2])
+            if round % 5 == 4:
+                vector_db.save()
+    finally:
+        done.set()
+        for thread in threads:
+            thread.join()
+    assert not errors
+    assert len(contents(VectorDB(index_path))) == 10
+
+
+@pytest.mark.parametrize("code", ["COS7", "COS42", "COS300"])
+def test_hybrid_retrieval_finds_a_unit_code_the_vector_search_misses(tmp_path, monkeypatch, code):
+    monkeypatch.setattr(database, "create_embedder", lambda: EMBEDDER)
+    monkeypatch.setenv("VECTOR_DB_HYBRID", "1")
+    path = str(tmp_path / "index")
+    documents = [page(f"page{n}") for n in range(200)]
+    documents.append(Document(page_content=f"{code} covers the unit outline and assessments", metadata={"source": "unit"}))
+    save_vector_store(FAISS.from_documents(documents, EMBEDDER), path, create_index_config("flat"))
+    vector_db = VectorDB(path)
+    query = f"what is {code} about"
+    # The case at issue: the unit's chunk is BM25's first result and not among the vector search's
+    assert vector_db.lexical.search(query, k=1)[0][0] == vector_db.vector_store.index_to_docstore_id[200]
+    assert not any(document.metadata["source"] == "unit" for document in vector_db.similarity_search(query, k=20))
+    [document] = vector_db.retrieve(query, k=1)
+    assert document.page_content.startswith(code)
+
+
+def test_fusion_ties_keep_the_vector_order():
+    fused = reciprocal_rank_fusion([[("vector", 0.1)], [("lexical", 9.0)]])
+    assert fused_order(fused) == ["vector", "lexical"]
+    # ...unless the BM25 result contains the code the query names
+    assert fused_order(fused, {"lexical"}) == ["lexical", "vector"]
+
+
+def test_a_write_that_fails_to_apply_is_not_left_in_the_log(index_path, monkeypatch):
+    vector_db = VectorDB(index_path)
+    [alpha] = vector_db.add_documents([page("alpha")])
+
+    def refuse(self, ids):
+        raise RuntimeError("remove_ids not implemented for this type of index")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(VectorDB, "_apply_delete", refuse)
+        with pytest.raises(RuntimeError):
+            vector_db.delete_documents([alpha])
+    # Every later load replays the log; the failed delete is not in it
+    reloaded = VectorDB(index_path)
+    assert contents(reloaded) == ["alpha chunk text", "placeholder chunk text"]
+    reloaded.delete_documents([alpha])
+    assert contents(VectorDB(index_path)) == contents(vector_db) == ["placeholder chunk text"]
+
+
+@pytest.mark.parametrize("index_type", ["flat", "hnsw", "ivf"])
+def test_each_index_type_builds_searches_and_deletes(tmp_path, monkeypatch, index_type):
+    monkeypatch.setattr(database, "create_embedder", lambda: EMBEDDER)
+    path = str(tmp_path / index_type)
+    names = [f"page{n}" for n in range(40)]
+    save_vector_store(FAISS.from_documents([page(name) for name in names], EMBEDDER), path, create_index_config(index_type))
+    vector_db = VectorDB(path)
+    assert vector_db.similarity_search("page7 chunk text", k=1)[0].page_content == "page7 chunk text"
+
+    ids = dict(zip(names, vector_db.vector_store.index_to_docstore_id.values()))
+    vector_db.delete_documents([ids["page7"], ids["page30"]])
+    expected = sorted(f"{name} chunk text" for name in names if name not in ("page7", "page30"))
+    for loaded in (vector_db, VectorDB(path)):
+        assert loaded.vector_store.index.ntotal == 38
+        assert "page7 chunk text" not in [document.page_content for document in loaded.similarity_search("page7 chunk text", k=5)]
+    vector_db.save()
+    saved = VectorDB(path)
+    assert sorted(document.page_content for document in saved.similarity_search("chunk", k=40)) == expected
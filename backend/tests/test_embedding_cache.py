@@ -0,0 +1,41 @@
+import os
+
+from langchain_community.embeddings import DeterministicFakeEmbedding
+
+from embedding_cache import CachedEmbeddings
+
+
+class CountingEmbedding(DeterministicFakeEmbedding):
+    calls: int = 0
+
+    def embed_documents(self, texts):
+        self.calls += len(texts)
+        return super().embed_documents(texts)
+
+
+def test_queries_never_touch_the_sqlite_cache(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    embeddings = CachedEmbeddings(CountingEmbedding(size=8), cache_path=str(path))
+    first = embeddings.embed_query("What courses are on offer?")
+    assert embeddings.embed_query("What  courses are on offer?") == first
+    assert embeddings.embedder.calls == 1
+    assert not os.path.exists(path)
+
+
+def test_query_cache_is_bounded(tmp_path):
+    embeddings = CachedEmbeddings(CountingEmbedding(size=8), cache_path=str(tmp_path / "cache.sqlite"), query_cache_size=2)
+    embeddings.embed_queries(["a", "b", "c", "a"])
+    assert len(embeddings._queries) == 2
+    embeddings.embed_query("c")
+    assert embeddings.embedder.calls == 3
+    # "a" was the least recently used, so it is embedded again
+    embeddings.embed_query("a")
+    assert embeddings.embedder.calls == 4
+
+
+def test_documents_are_cached_on_disk(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    CachedEmbeddings(CountingEmbedding(size=8), cache_path=path).embed_documents(["a", "b"])
+    embeddings = CachedEmbeddings(CountingEmbedding(size=8), cache_path=path)
+    embeddings.embed_documents(["a", "b", "c"])
+    assert embeddings.embedder.calls == 1
@@ -0,0 +1,36 @@
+from lexical_index import LexicalIndex
+
+TEXTS = [
+    "COS30049 computing technology innovation project",
+    "Apply for a scholarship before the closing date",
+    "Hawthorn campus parking permits and fees",
+    "Scholarship results are released in January",
+    "Library opening hours at the Hawthorn campus",
+]
+
+
+def test_one_at_a_time_matches_a_single_add(tmp_path):
+    bulk = LexicalIndex()
+    bulk.add([str(i) for i in range(len(TEXTS))], TEXTS)
+    incremental = LexicalIndex()
+    for i, text in enumerate(TEXTS):
+        incremental.add([str(i)], [text])
+    for query in ("scholarship", "hawthorn campus", "COS30049"):
+        assert incremental.search(query) == bulk.search(query)
+
+    incremental.delete(["1"])
+    incremental.save(str(tmp_path))
+    loaded = LexicalIndex.load(str(tmp_path))
+    assert [doc_id for doc_id, _ in loaded.search("scholarship")] == ["3"]
+    # Loaded postings grow again on the next add
+    loaded.add(["5"], ["Scholarship interviews"])
+    assert sorted(doc_id for doc_id, _ in loaded.search("scholarship")) == ["3", "5"]
+
+
+def test_deleted_documents_do_not_count_towards_idf(tmp_path):
+    index = LexicalIndex()
+    index.add([str(i) for i in range(len(TEXTS))], TEXTS)
+    index.delete(["1"])
+    index.save(str(tmp_path))
+    # Scores before the save that drops the deleted postings match the ones after it
+    assert index.search("scholarship hawthorn") == LexicalIndex.load(str(tmp_path)).search("scholarship hawthorn")
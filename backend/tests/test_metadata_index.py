@@ -0,0 +1,24 @@
+import numpy as np
+
+from metadata_index import MetadataIndex
+
+URLS = [f"https://www.swinburne.edu.au/{path}" for path in ("course/a", "news/b", "course/c", "about/d", "news/e")] * 5
+
+
+def test_one_at_a_time_matches_a_single_add(tmp_path):
+    bulk = MetadataIndex()
+    bulk.add([{"source": url} for url in URLS])
+    incremental = MetadataIndex()
+    for url in URLS:
+        incremental.add([{"source": url}])
+    for expression in ("page_type:course", "not page_type:news", "section:/about or page_type:news"):
+        np.testing.assert_array_equal(incremental.select(expression)[1], bulk.select(expression)[1])
+
+    incremental.delete_rows([0, 1])
+    incremental.add([{"source": URLS[0]}])
+    incremental.save(str(tmp_path))
+    loaded = MetadataIndex.load(str(tmp_path))
+    bits = np.unpackbits(loaded.select("page_type:course")[1], count=loaded.rows, bitorder="little")
+    remaining = URLS[2:] + URLS[:1]
+    assert loaded.rows == len(remaining)
+    assert list(np.flatnonzero(bits)) == [row for row, url in enumerate(remaining) if "/course/" in url]
@@ -0,0 +1,89 @@
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+from langchain_community.vectorstores.faiss import FAISS
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+import database
+import refresh_index
+from ann_index import create_index_config
+from build_index import save_vector_store
+from crawler import AsyncWebCrawler
+from database import VectorDB
+from manifest import Manifest
+from refresh_index import refresh_index as refresh
+
+EMBEDDER = DeterministicFakeEmbedding(size=16)
+SCHOLARSHIP = ("Swinburne students can apply for a scholarship through the online portal before the closing date "
+               "each year and hear back within four weeks of applying")
+
+
+class PageHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        text = self.server.pages.get(self.path)
+        if text is None:
+            self.send_error(404)
+            return
+        body = f"<html><body><p>{text}</p></body></html>".encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def site(http_server):
+    server = http_server(PageHandler)
+    server.pages = {}
+    return server
+
+
+@pytest.fixture
+def vector_db(tmp_path, monkeypatch):
+    monkeypatch.setattr(database, "create_embedder", lambda: EMBEDDER)
+    monkeypatch.setattr(refresh_index, "AsyncWebCrawler", lambda: AsyncWebCrawler(delay=0))
+    path = str(tmp_path / "index")
+    vector_store = FAISS.from_texts(["placeholder"], EMBEDDER, metadatas=[{"source": "http://127.0.0.1/old"}])
+    save_vector_store(vector_store, path, create_index_config("flat"))
+    return VectorDB(vector_path=path)
+
+
+def chunks_of(vector_db, url):
+    return set(Manifest.for_index(vector_db.vector_path).get(url)["chunks"].values())
+
+
+def stored_ids(vector_db):
+    return set(vector_db.vector_store.index_to_docstore_id.values())
+
+
+def test_near_duplicate_pages_share_a_chunk_until_both_are_gone(site, vector_db):
+    a, b, c = (f"http://127.0.0.1:{site.server_port}{path}" for path in ("/a", "/b", "/c"))
+    site.pages.update({"/a": SCHOLARSHIP, "/b": SCHOLARSHIP + ".", "/c": "Parking on the Hawthorn campus is limited"})
+    stats = refresh(vector_db, [a, b, c])
+    assert stats["duplicates"] == 1
+    assert chunks_of(vector_db, a) == chunks_of(vector_db, b)
+    assert stored_ids(vector_db) == chunks_of(vector_db, a) | chunks_of(vector_db, c)
+
+    # The page that owned the chunk goes away; its alias still contains it
+    del site.pages["/a"]
+    refresh(vector_db, [a, b, c])
+    assert chunks_of(vector_db, b) <= stored_ids(vector_db)
+
+    refresh(vector_db, [c])
+    assert stored_ids(vector_db) == chunks_of(vector_db, c)
+    # Once deleted, the text is indexed again rather than matched to the deleted chunk
+    site.pages["/b"] = SCHOLARSHIP
+    stats = refresh(vector_db, [b, c])
+    assert stats["duplicates"] == 0
+    assert stored_ids(vector_db) == chunks_of(vector_db, b) | chunks_of(vector_db, c)
+
+
+def test_manifest_is_seeded_with_alias_pages():
+    vector_store = FAISS.from_texts(
+        [SCHOLARSHIP], EMBEDDER, metadatas=[{"source": "https://a.example/", "aliases": ["https://b.example/"]}], ids=["kept"]
+    )
+    manifest = Manifest("unused.json")
+    manifest.seed_from_vector_store(vector_store)
+    assert manifest.get("https://b.example/")["chunks"] == manifest.get("https://a.example/")["chunks"]
+    assert manifest.chunk_references() == {"kept": 2}
@@ -0,0 +1,78 @@
+import importlib
+import json
+import sys
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from langchain_community.vectorstores.faiss import FAISS
+from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+import database
+from ann_index import create_index_config
+from build_index import save_vector_store
+
+EMBEDDER = DeterministicFakeEmbedding(size=16)
+
+
+@pytest.fixture
+def routes(tmp_path, monkeypatch):
+    # routes.py opens its indexes from the working directory when it is imported
+    monkeypatch.setattr(database, "create_embedder", lambda: EMBEDDER)
+    monkeypatch.chdir(tmp_path)
+    for path in ("Swinburne_Chat_Bot", "Swinburne_Chat_Bot_Topics"):
+        vector_store = FAISS.from_documents([Document(page_content="placeholder", metadata={"source": "placeholder"})], EMBEDDER)
+        save_vector_store(vector_store, path, create_index_config("flat"))
+    sys.modules.pop("routes", None)
+    module = importlib.import_module("routes")
+    yield module
+    sys.modules.pop("routes", None)
+
+
+def client(routes):
+    app = FastAPI()
+    app.include_router(routes.router)
+    return TestClient(app)
+
+
+def events(response):
+    assert response.headers["content-type"].startswith("text/event-stream")
+    parsed = []
+    for block in response.text.split("\n\n")[:-1]:
+        event, data = block.split("\n")
+        parsed.append((event.removeprefix("event: "), json.loads(data.removeprefix("data: "))))
+    return parsed
+
+
+def test_stream_sends_tokens_then_similar_questions_then_done(routes, monkeypatch):
+    sessions = []
+
+    async def stream(query, session):
+        sessions.append(session)
+        routes.chatbot.sessions.append(session, query, "Hawthorn campus")
+        yield "token", "Hawthorn\n"
+        yield "token", "campus"
+        yield "similar_questions", "Where is Hawthorn?*How do I park?"
+
+    monkeypatch.setattr(routes.chatbot, "astream_user_input", stream)
+    first = events(client(routes).post("/chat/stream", json={"query": "where"}))
+    assert first[:-1] == [
+        ("token", "Hawthorn\n"), ("token", "campus"), ("similar_questions", "Where is Hawthorn?*How do I park?"),
+    ]
+    assert first[-1] == ("done", {"session_id": sessions[0]})
+
+    # The id from done continues the same session
+    second = events(client(routes).post("/chat/stream", json={"query": "and parking", "session_id": sessions[0]}))
+    assert sessions[1] == sessions[0] and second[-1] == ("done", {"session_id": sessions[0]})
+
+
+def test_stream_ends_with_an_error_event_when_generation_fails(routes, monkeypatch):
+    async def stream(query, session):
+        yield "token", "Partial"
+        raise RuntimeError("rate limited")
+
+    monkeypatch.setattr(routes.chatbot, "astream_user_input", stream)
+    assert events(client(routes).post("/chat/stream", json={"query": "where"})) == [
+        ("token", "Partial"), ("error", "An error occurred: rate limited"),
+    ]
@@ -0,0 +1,75 @@
+import pytest
+
+import session_store
+from session_store import SessionStore
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(session_store, "time", clock)
+    return clock
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path, clock):
+    def create(**options):
+        store = SessionStore(path=str(tmp_path / "sessions.sqlite") if request.param == "sqlite" else None, **options)
+        store.purge_interval = 0
+        return store
+    return create
+
+
+def turns(store, session):
+    return [message.content for message in store.history(session)]
+
+
+def test_history_keeps_the_newest_turns_within_both_limits(store):
+    sessions = store(max_turns=2, max_tokens=20)
+    session = sessions.session(None)
+    for n in range(3):
+        sessions.append(session, f"question {n}", f"answer {n}")
+    assert turns(sessions, session) == ["question 1", "answer 1", "question 2", "answer 2"]
+    # A long turn pushes the older ones out of the token budget
+    sessions.append(session, "question 3", "x" * 60)
+    assert turns(sessions, session) == ["question 3", "x" * 60]
+
+
+def test_idle_and_least_recently_used_sessions_are_evicted(store, clock):
+    sessions = store(idle_timeout=100, max_sessions=2)
+    first, second, third = (sessions.session(None) for _ in range(3))
+    for session in (first, second):
+        sessions.append(session, "question", "answer")
+        clock.now += 1
+    clock.now += 99
+    sessions.append(third, "question", "answer")
+    # first is idle for 100s; second is still within the timeout
+    assert turns(sessions, first) == []
+    assert turns(sessions, second) == ["question", "answer"]
+
+    clock.now += 1
+    fourth = sessions.session(None)
+    sessions.append(fourth, "question", "answer")
+    # Three sessions for max_sessions=2: the least recently used goes
+    assert turns(sessions, second) == []
+    assert turns(sessions, third) == turns(sessions, fourth) == ["question", "answer"]
+
+
+def test_only_ids_the_store_holds_continue_a_session(store):
+    sessions = store()
+    issued = sessions.session(None)
+    assert len(issued) == 43 and sessions.session(None) != issued
+    # Not used yet, so nothing to continue
+    assert sessions.session(issued) != issued
+    sessions.append(issued, "question", "answer")
+    assert sessions.session(issued) == issued
+    for session_id in ("1:2", issued[:-1], issued + "x", "A" * 43):
+        assert sessions.session(session_id) != session_id
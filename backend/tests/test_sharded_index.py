@@ -0,0 +1,56 @@
+import os
+
+import pytest
+from langchain_community.vectorstores.faiss import FAISS
+from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+import database
+from ann_index import create_index_config
+from build_index import save_vector_store
+from database import VectorDB
+from sharded_index import ShardedVectorDB, read_shard_manifest, route, split_index
+
+EMBEDDER = DeterministicFakeEmbedding(size=16)
+PATHS = ["news/a", "news/b", "course/c", "course/d", "about/e", "about/f"]
+
+
+def page(path, text=None):
+    return Document(page_content=text or f"{path} chunk text", metadata={"source": f"https://www.swinburne.edu.au/{path}"})
+
+
+@pytest.fixture
+def sharded(tmp_path, monkeypatch):
+    monkeypatch.setattr(database, "create_embedder", lambda: EMBEDDER)
+    monkeypatch.setenv("VECTOR_DB_HYBRID", "1")
+    path = str(tmp_path / "index")
+    documents = [page(path) for path in PATHS] + [page("course/g", "COS30049 unit outline")]
+    save_vector_store(FAISS.from_documents(documents, EMBEDDER), path, create_index_config("flat"))
+    output = str(tmp_path / "sharded")
+    split_index(VectorDB(path), output, by="section", values=["/news", "/course", "/events"])
+    return output
+
+
+def test_route_matches_values_and_falls_back_to_the_default():
+    manifest = {"by": "section", "shards": [{"name": "news", "value": "/news"}], "default": "other"}
+    assert route(manifest, {"section": "/news/2024"}) == "news"
+    assert route(manifest, {"section": "/newsletter"}) == "other"
+
+
+def test_split_skips_values_without_chunks(sharded):
+    manifest = read_shard_manifest(sharded)
+    # /events matches nothing, so it gets neither a directory nor a place in shards.json
+    assert [shard["name"] for shard in manifest["shards"]] == ["news", "course", "other"]
+    assert all(os.path.isdir(os.path.join(sharded, shard["name"])) for shard in manifest["shards"])
+    assert manifest["default"] == "other"
+
+
+def test_searches_merge_results_across_shards(sharded):
+    vector_db = ShardedVectorDB(sharded)
+    contents = sorted(document.page_content for document in vector_db.similarity_search("chunk", k=10))
+    assert contents == sorted([f"{path} chunk text" for path in PATHS] + ["COS30049 unit outline"])
+    assert [document.page_content for document in vector_db.retrieve("what is COS30049", k=1)] == ["COS30049 unit outline"]
+
+    [doc_id] = vector_db.add_documents([page("news/h")])
+    assert doc_id in vector_db.shards["news"].vector_store.index_to_docstore_id.values()
+    assert "news/h chunk text" in [document.page_content for document in vector_db.similarity_search("chunk", k=10)]
@@ -0,0 +1,67 @@
+import asyncio
+import csv
+
+import pytest
+from langchain_core.documents import Document
+
+from suggestions import SuggestionEngine
+
+COUNTS = {
+    "How do I apply for a scholarship?": 12,
+    "When are scholarship results released?": 5,
+    "Can I defer my scholarship?": 5,
+    "What scholarships can I get with student id 1234567?": 1,
+    "Where is the Hawthorn library?": 40,
+}
+
+
+class TopicsIndex:
+    # The nearest past questions and their distances, in the order a FAISS search returns them
+    def __init__(self, results):
+        self.results = results
+
+    def similarity_search_batch_with_score(self, queries, k=5):
+        return [[(Document(page_content=question), distance) for question, distance in self.results][:k]]
+
+
+@pytest.fixture(autouse=True)
+def topics_csv(tmp_path, monkeypatch):
+    # topics.csv is read from the working directory
+    monkeypatch.chdir(tmp_path)
+    with open("topics.csv", "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["topic", "count"])
+        writer.writerows(COUNTS.items())
+
+
+def test_popular_questions_come_first_and_the_query_is_not_suggested_back():
+    engine = SuggestionEngine(TopicsIndex([
+        ("how do I apply for a scholarship", 0.0),
+        ("Can I defer my scholarship?", 0.1),
+        ("When are scholarship results released?", 0.2),
+        ("How do I apply for a scholarship?", 0.3),
+        ("Where is the Hawthorn library?", 0.9),
+    ]), k=3)
+    assert engine.suggest_from_topics("How do I apply for a scholarship?") == [
+        # Equally asked questions go nearest first; the query itself is left out however it is written
+        "Can I defer my scholarship?", "When are scholarship results released?",
+    ]
+
+
+def test_questions_asked_too_rarely_are_never_suggested():
+    engine = SuggestionEngine(TopicsIndex([
+        ("What scholarships can I get with student id 1234567?", 0.05),
+        ("When are scholarship results released?", 0.2),
+    ]))
+    assert engine.suggest_from_topics("scholarships") == ["When are scholarship results released?"]
+
+
+def test_the_llm_fills_in_below_k_without_repeats():
+    async def fallback(query):
+        return ["- When are scholarship results released?", "1. Who can apply for a scholarship?", "", "* Are scholarships taxed?"]
+
+    engine = SuggestionEngine(TopicsIndex([("When are scholarship results released?", 0.2)]), fallback=fallback, k=3)
+    assert asyncio.run(engine.asuggest("scholarships")) == [
+        "When are scholarship results released?", "Who can apply for a scholarship?", "Are scholarships taxed?",
+    ]
+    assert asyncio.run(SuggestionEngine(TopicsIndex([]), fallback=fallback, llm_fallback=False).asuggest("scholarships")) == []
@@ -0,0 +1,55 @@
+import gzip
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+from swinburne_url_service import discover_urls
+
+NS = 'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"'
+
+
+def urlset(*paths):
+    entries = "".join(f"<url><loc>https://example.edu{path}</loc><lastmod>2024-01-01</lastmod></url>" for path in paths)
+    return f'<?xml version="1.0"?><urlset {NS}>{entries}</urlset>'.encode()
+
+
+class SitemapHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        base = f"http://127.0.0.1:{self.server.server_port}"
+        if self.path == "/sitemap.xml":
+            children = "".join(f"<sitemap><loc>{base}{path}</loc></sitemap>"
+                               for path in ("/pages.xml", "/cut.xml", "/cut.xml.gz", "/broken.xml.gz"))
+            self._send(f'<?xml version="1.0"?><sitemapindex {NS}>{children}</sitemapindex>'.encode())
+        elif self.path == "/pages.xml":
+            self._send(urlset("/a", "/b"))
+        elif self.path == "/cut.xml":
+            # The connection closes before the promised length arrives
+            body = urlset("/c", "/d")
+            self._send(body[:len(body) // 2], length=len(body))
+        elif self.path == "/cut.xml.gz":
+            body = gzip.compress(urlset("/e", "/f"))
+            self._send(body[:len(body) // 2])
+        elif self.path == "/broken.xml.gz":
+            self._send(b"not gzip at all")
+        else:
+            self.send_error(404)
+
+    def _send(self, body, length=None):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/xml")
+        self.send_header("Content-Length", str(length or len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        self.wfile.flush()
+        self.close_connection = True
+
+
+@pytest.fixture
+def server(http_server):
+    return http_server(SitemapHandler).url()
+
+
+def test_truncated_sitemaps_do_not_abort_discovery(server):
+    entries = discover_urls([f"{server}/sitemap.xml"], max_workers=4)
+    assert [entry["url"] for entry in entries] == ["https://example.edu/a", "https://example.edu/b"]
+    assert entries[0]["lastmod"] == "2024-01-01"
@@ -1,6039 +0,0 @@
-urls = [
-    'https://www.swinburne.edu.au/about/our-structure/elections/',
-    'https://www.swinburne.edu.au/about/policies-regulations/academic-courses/',
-    'https://www.swinburne.edu.au/about/policies-regulations/social-media/',
-    'https://www.swinburne.edu.au/about/policies-regulations/courses-awards/',
-    'https://www.swinburne.edu.au/about/policies-regulations/governance/',
-    'https://www.swinburne.edu.au/about/policies-regulations/glossary/',
-    'https://www.swinburne.edu.au/about/our-university/rankings-ratings/',
-    'https://www.swinburne.edu.au/about/policies-regulations/',
-    'https://www.swinburne.edu.au/about/policies-regulations/research-training/',
-    'https://www.swinburne.edu.au/about/giving-to-swinburne/student-impact-stories/',
-    'https://www.swinburne.edu.au/about/giving-to-swinburne/',
-    'https://www.swinburne.edu.au/about/policies-regulations/academic-credit/',
-    'https://www.swinburne.edu.au/about/policies-regulations/assessment-results/',
-    'https://www.swinburne.edu.au/about/policies-regulations/admissions-enrolment/',
-    'https://www.swinburne.edu.au/about/our-university/our-values/swinburne-stories/',
-    'https://www.swinburne.edu.au/about/our-structure/elections/notice-of-election/',
-    'https://www.swinburne.edu.au/about/our-structure/organisational-structure/schools-departments/school-social-sciences-media-film-education/department-film-games-animation/awards/',
-    'https://www.swinburne.edu.au/about/our-structure/',
-    'https://www.swinburne.edu.au/about/policies-regulations/research-training-regulations/',
-    'https://www.swinburne.edu.au/about/our-university/',
-    'https://www.swinburne.edu.au/about/policies-regulations/policy-framework/',
-    'https://www.swinburne.edu.au/about/strategy-initiatives/industry-4-0/',
-    'https://www.swinburne.edu.au/about/',
-    'https://www.swinburne.edu.au/about/policies-regulations/people-culture-integrity/',
-    'https://www.swinburne.edu.au/about/our-structure/leadership-governance/executive-team/',
-    'https://www.swinburne.edu.au/about/strategy-initiatives/equity-diversity/',
-    'https://www.swinburne.edu.au/about/our-structure/leadership-governance/',
-    'https://www.swinburne.edu.au/about/strategy-initiatives/sustainability-environment/net-zero-pathway/',
-    'https://www.swinburne.edu.au/about/policies-regulations/election/',
-    'https://www.swinburne.edu.au/about/policies-regulations/student-administration/',
-    'https://www.swinburne.edu.au/about/strategy-initiatives/equity-diversity/science-in-australia-gender-equity/',
-    'https://www.swinburne.edu.au/about/policies-regulations/academic-partnerships/',
-    'https://www.swinburne.edu.au/about/our-university/30-years-young/stories-for-brighter-tomorrow/',
-    'https://www.swinburne.edu.au/about/policies-regulations/improper-conduct/',
-    'https://www.swinburne.edu.au/about/strategy-initiatives/annual-report/past-annual-reports/',
-    'https://www.swinburne.edu.au/about/giving-to-swinburne/meet-our-donors/',
-    'https://www.swinburne.edu.au/about/giving-to-swinburne/support-student-life-scholarships/',
-    'https://www.swinburne.edu.au/about/our-structure/organisational-structure/schools-departments/',
-    'https://www.swinburne.edu.au/about/strategy-initiatives/',
-    'https://www.swinburne.edu.au/about/our-university/30-years-young/',
-    'https://www.swinburne.edu.au/about/policies-regulations/finance/',
-    'https://www.swinburne.edu.au/about/strategy-initiatives/preventing-sexual-assault-harassment/',
-    'https://www.swinburne.edu.au/about/policies-regulations/libraries/',
-    'https://www.swinburne.edu.au/about/strategy-initiatives/moondani-toombadool-centre/',
-    'https://www.swinburne.edu.au/about/our-university/our-history/',
-    'https://www.swinburne.edu.au/about/policies-regulations/support-for-students-policy/',
-    'https://www.swinburne.edu.au/about/policies-regulations/student-general-misconduct/',
-    'https://www.swinburne.edu.au/about/policies-regulations/reviews-appeals/',
-    'https://www.swinburne.edu.au/about/strategy-initiatives/moondani-toombadool-centre/engagement/annual-barak-wonga-oration/',
-    'https://www.swinburne.edu.au/about/policies-regulations/academic-senate/',
-    'https://www.swinburne.edu.au/about/policies-regulations/academic-progress/',
-    'https://www.swinburne.edu.au/about/policies-regulations/student-academic-misconduct/',
-    'https://www.swinburne.edu.au/about/policies-regulations/complaints-management/',
-    'https://www.swinburne.edu.au/about/our-structure/leadership-governance/executive-team/professor-qing-long-han/',
-    'https://www.swinburne.edu.au/about/strategy-initiatives/national-centre-reconciliation-practice/',
-    'https://www.swinburne.edu.au/about/policies-regulations/academic-student-affairs/',
-    'https://www.swinburne.edu.au/about/policies-regulations/people-culture-integrity/integrity/',
-    'https://www.swinburne.edu.au/about/our-structure/leadership-governance/executive-team/werner-van-der-merwe/',
-    'https://www.swinburne.edu.au/about/strategy-initiatives/moondani-toombadool-centre/engagement/',
-    'https://www.swinburne.edu.au/about/our-structure/elections/board-member-commitments/',
-    'https://www.swinburne.edu.au/about/giving-to-swinburne/support-our-areas-of-greatest-need/',
-    'https://www.swinburne.edu.au/about/giving-to-swinburne/meet-our-donors/avanade/',
-    'https://www.swinburne.edu.au/about/our-structure/leadership-governance/executive-team/alan-duffy/',
-    'https://www.swinburne.edu.au/about/policies-regulations/student-administration-regulations/',
-    'https://www.swinburne.edu.au/about/policies-regulations/intellectual-property/',
-    'https://www.swinburne.edu.au/about/our-structure/organisational-structure/schools-departments/school-social-sciences-media-film-education/department-film-games-animation/',
-    'https://www.swinburne.edu.au/about/strategy-initiatives/cultural-diversity/',
-    'https://www.swinburne.edu.au/about/strategy-initiatives/moondani-toombadool-centre/indigenous-teaching-learning/',
-    'https://www.swinburne.edu.au/about/strategy-initiatives/annual-report/',
-    'https://www.swinburne.edu.au/about/giving-to-swinburne/support-research-with-impact/',
-    'https://www.swinburne.edu.au/about/giving-to-swinburne/student-impact-stories/noah-htet/',
-    'https://www.swinburne.edu.au/about/giving-to-swinburne/student-impact-stories/jacob-stanford/',
-    'https://www.swinburne.edu.au/about/our-university/our-values/',
-    'https://www.swinburne.edu.au/about/giving-to-swinburne/student-impact-stories/grace-lawrence/',
-    'https://www.swinburne.edu.au/about/our-university/30-years-young/stories-for-brighter-tomorrow/michael-giles/',
-    'https://www.swinburne.edu.au/about/strategy-initiatives/moondani-toombadool-centre/our-team/',
-    'https://www.swinburne.edu.au/about/our-university/our-values/swinburne-stories/anita-kocsis/',
-    'https://www.swinburne.edu.au/about/strategy-initiatives/learning-teaching-at-swinburne/',
-    'https://www.swinburne.edu.au/about/strategy-initiatives/cultural-diversity/diverse-community-events/',
-    'https://www.swinburne.edu.au/about/policies-regulations/it-acceptable-use/',
-    'https://www.swinburne.edu.au/about/policies-regulations/people-culture-integrity/unacceptable-behaviour/',
-    'https://www.swinburne.edu.au/about/our-structure/leadership-governance/council/',
-    'https://www.swinburne.edu.au/about/our-structure/organisational-structure/',
-    'https://www.swinburne.edu.au/about/strategy-initiatives/child-safety/',
-    'https://www.swinburne.edu.au/about/policies-regulations/governance-administration/',
-    'https://www.swinburne.edu.au/about/our-university/our-values/swinburne-stories/leonie-walsh/',
-    'https://www.swinburne.edu.au/about/strategy-initiatives/2025-strategic-plan/',
-    'https://www.swinburne.edu.au/about/our-structure/leadership-governance/executive-team/professor-john-evans/',
-    'https://www.swinburne.edu.au/about/policies-regulations/academic-dress/',
-    'https://www.swinburne.edu.au/about/our-structure/leadership-governance/executive-team/professor-lau-hieng-ho/',
-    'https://www.swinburne.edu.au/about/our-university/our-values/swinburne-stories/kath-watson/',
-    'https://www.swinburne.edu.au/about/our-university/quality-compliance/',
-    'https://www.swinburne.edu.au/about/strategy-initiatives/industry-4-0/what-is-industry-4-0/',
-    'https://www.swinburne.edu.au/about/strategy-initiatives/moondani-toombadool-centre/acknowledgement/',
-    'https://www.swinburne.edu.au/about/strategy-initiatives/submissions-to-government/',
-    'https://www.swinburne.edu.au/about/strategy-initiatives/equity-diversity/accessability-action-plan/',
-    'https://www.swinburne.edu.au/about/our-structure/leadership-governance/executive-team/dr-douglas-proctor/',
-    'https://www.swinburne.edu.au/about/our-university/our-values/swinburne-stories/jeanne-pratt/',
-    'https://www.swinburne.edu.au/about/our-university/rankings-ratings/more-than-our-rank/',
-    'https://www.swinburne.edu.au/about/giving-to-swinburne/meet-our-donors/barbara-dicker-brain-sciences-foundation/',
-    'https://www.swinburne.edu.au/about/our-university/our-values/swinburne-stories/matthew-bailes/',
-    'https://www.swinburne.edu.au/about/policies-regulations/qualifications-awards/',
-    'https://www.swinburne.edu.au/about/our-university/our-values/swinburne-stories/murray-gillin/',
-    'https://www.swinburne.edu.au/about/policies-regulations/people-culture-integrity/compliance/',
-    'https://www.swinburne.edu.au/about/strategy-initiatives/sustainability-environment/',
-    'https://www.swinburne.edu.au/about/our-university/our-values/swinburne-stories/bruce-mcdonald/',
-    'https://www.swinburne.edu.au/about/our-university/our-values/swinburne-stories/andrew-peters/',
-    'https://www.swinburne.edu.au/about/our-structure/leadership-governance/executive-team/simon-ridings/',
-    'https://www.swinburne.edu.au/about/our-university/our-values/swinburne-stories/phillip-ting/',
-    'https://www.swinburne.edu.au/about/our-university/our-values/swinburne-stories/iain-wallace/',
-    'https://www.swinburne.edu.au/about/our-university/our-values/swinburne-stories/emily-petroff/',
-    'https://www.swinburne.edu.au/about/our-university/our-values/swinburne-stories/michael-and-terrence-yap/',
-    'https://www.swinburne.edu.au/about/our-university/our-values/swinburne-stories/bill-scales/',
-    'https://www.swinburne.edu.au/about/strategy-initiatives/cultural-diversity/approach/',
-    'https://www.swinburne.edu.au/about/our-university/30-years-young/stories-for-brighter-tomorrow/grainne-oates/',
-    'https://www.swinburne.edu.au/about/strategy-initiatives/equity-diversity/gender-equality-action-plan/',
-    'https://www.swinburne.edu.au/about/our-university/our-values/swinburne-stories/enzo-palombo/',
-    'https://www.swinburne.edu.au/about/our-structure/organisational-structure/schools-departments/school-social-sciences-media-film-education/department-media-communication/',
-    'https://www.swinburne.edu.au/about/our-university/30-years-young/stories-for-brighter-tomorrow/matt-levy/',
-    'https://www.swinburne.edu.au/about/our-structure/leadership-governance/vice-chancellor/',
-    'https://www.swinburne.edu.au/about/giving-to-swinburne/meet-our-donors/pio-iovenitti-engineering-excellence-scholarship/',
-    'https://www.swinburne.edu.au/about/policies-regulations/work-integrated-learning/',
-    'https://www.swinburne.edu.au/about/our-university/our-values/swinburne-stories/judith-kinnear/',
-    'https://www.swinburne.edu.au/about/policies-regulations/honorary-degrees/',
-    'https://www.swinburne.edu.au/about/our-university/30-years-young/stories-for-brighter-tomorrow/noriko-wynn/',
-    'https://www.swinburne.edu.au/about/our-structure/organisational-structure/schools-departments/pathways-vocational-education/department-health-science-community/',
-    'https://www.swinburne.edu.au/about/policies-regulations/students-with-a-disability-carer/',
-    'https://www.swinburne.edu.au/about/giving-to-swinburne/meet-our-donors/rotary-club-of-camberwell/',
-    'https://www.swinburne.edu.au/about/our-university/our-values/swinburne-stories/zoe-warne/',
-    'https://www.swinburne.edu.au/about/our-structure/leadership-governance/executive-team/nancy-collins-cfo-coo/',
-    'https://www.swinburne.edu.au/about/our-structure/leadership-governance/academic-senate/',
-    'https://www.swinburne.edu.au/about/our-structure/organisational-structure/schools-departments/school-business-law-entrepreneurship/department-management-marketing/',
-    'https://www.swinburne.edu.au/about/giving-to-swinburne/meet-our-donors/graham-family-foundation/',
-    'https://www.swinburne.edu.au/about/our-structure/leadership-governance/executive-team/bronte-neyland/',
-    'https://www.swinburne.edu.au/about/our-university/30-years-young/stories-for-brighter-tomorrow/michael-and-terence-yap/',
-    'https://www.swinburne.edu.au/about/our-structure/organisational-structure/subsidiaries-entities/',
-    'https://www.swinburne.edu.au/about/our-structure/organisational-structure/schools-departments/school-engineering/department-mechanical-engineering-product-design-engineering/',
-    'https://www.swinburne.edu.au/about/giving-to-swinburne/meet-our-donors/georgina-tan/',
-    'https://www.swinburne.edu.au/about/policies-regulations/people-culture-integrity/our-culture/',
-    'https://www.swinburne.edu.au/about/our-university/our-values/swinburne-stories/michael-gilding/',
-    'https://www.swinburne.edu.au/about/our-structure/organisational-structure/schools-departments/school-design-architecture/',
-    'https://www.swinburne.edu.au/about/our-structure/organisational-structure/schools-departments/school-business-law-entrepreneurship/',
-    'https://www.swinburne.edu.au/about/our-university/30-years-young/stories-for-brighter-tomorrow/mitchell-welch/',
-    'https://www.swinburne.edu.au/about/policies-regulations/people-culture-integrity/business-continuity/',
-    'https://www.swinburne.edu.au/about/giving-to-swinburne/gifts-in-wills/',
-    'https://www.swinburne.edu.au/about/our-structure/organisational-structure/schools-departments/pathways-vocational-education/department-trades-engineering-technologies/',
-    'https://www.swinburne.edu.au/about/strategy-initiatives/national-centre-reconciliation-practice/team/',
-    'https://www.swinburne.edu.au/about/our-university/our-values/swinburne-stories/jeffrey-smart/',
-    'https://www.swinburne.edu.au/about/our-university/30-years-young/stories-for-brighter-tomorrow/grace-lawrence/',
-    'https://www.swinburne.edu.au/about/our-structure/organisational-structure/schools-departments/school-business-law-entrepreneurship/department-business-technology-entrepreneurship/',
-    'https://www.swinburne.edu.au/about/our-structure/organisational-structure/schools-departments/school-health-sciences/department-health-sciences-biostatistics/',
-    'https://www.swinburne.edu.au/about/our-university/our-values/swinburne-stories/sarah-wickham/',
-    'https://www.swinburne.edu.au/about/our-structure/leadership-governance/chancellor/',
-    'https://www.swinburne.edu.au/about/our-structure/leadership-governance/executive-team/karen-hapgood/',
-    'https://www.swinburne.edu.au/about/our-structure/organisational-structure/schools-departments/pathways-vocational-education/department-business-design-media-ict/',
-    'https://www.swinburne.edu.au/about/giving-to-swinburne/meet-our-donors/collier-charitable-trust/',
-    'https://www.swinburne.edu.au/about/our-structure/organisational-structure/schools-departments/school-health-sciences/department-nursing-allied-health/',
-    'https://www.swinburne.edu.au/about/policies-regulations/university-foundations/',
-    'https://www.swinburne.edu.au/about/our-university/30-years-young/stories-for-brighter-tomorrow/brendan-doidge/',
-    'https://www.swinburne.edu.au/about/our-university/30-years-young/stories-for-brighter-tomorrow/neane-carter/',
-    'https://www.swinburne.edu.au/about/strategy-initiatives/national-centre-reconciliation-practice/reconciliation-action-plan/',
-    'https://www.swinburne.edu.au/about/our-university/our-values/swinburne-stories/daniel-eastwood-whitaker/',
-    'https://www.swinburne.edu.au/about/strategy-initiatives/equity-diversity/science-in-australia-gender-equity/swinburne-womens-academic-network/',
-    'https://www.swinburne.edu.au/about/strategy-initiatives/moondani-toombadool-centre/engagement/aunty-dot-peters-flowering-grasslands/',
-    'https://www.swinburne.edu.au/about/our-university/our-values/swinburne-stories/nathan-nankervis/',
-    'https://www.swinburne.edu.au/about/giving-to-swinburne/meet-our-donors/anna-cairo/',
-    'https://www.swinburne.edu.au/about/our-structure/organisational-structure/schools-departments/pathways-vocational-education/',
-    'https://www.swinburne.edu.au/about/giving-to-swinburne/student-impact-stories/matt-and-keith/',
-    'https://www.swinburne.edu.au/about/our-university/30-years-young/stories-for-brighter-tomorrow/abubakar-sadiq/',
-    'https://www.swinburne.edu.au/about/our-structure/leadership-governance/executive-team/associate-professor-llew-mann/',
-    'https://www.swinburne.edu.au/about/our-structure/organisational-structure/schools-departments/school-science-computing-engineering-technologies/department-physics-astronomy/',
-    'https://www.swinburne.edu.au/about/our-university/our-values/swinburne-stories/sharon-rice/',
-    'https://www.swinburne.edu.au/about/our-structure/organisational-structure/schools-departments/school-health-sciences/',
-    'https://www.swinburne.edu.au/about/our-structure/organisational-structure/subsidiaries-entities/swinburne-student-life/',
-    'https://www.swinburne.edu.au/about/strategy-initiatives/learning-teaching-at-swinburne/digital-literacies/',
-    'https://www.swinburne.edu.au/about/our-structure/organisational-structure/schools-departments/school-science-computing-engineering-technologies/department-chemistry-biotechnology/',
-    'https://www.swinburne.edu.au/about/policies-regulations/people-culture-integrity/premises/',
-    'https://www.swinburne.edu.au/about/our-structure/organisational-structure/schools-departments/school-engineering/department-civil-construction-engineering/',
-    'https://www.swinburne.edu.au/about/our-structure/organisational-structure/schools-departments/school-business-law-entrepreneurship/department-accounting-economics-finance/',
-    'https://www.swinburne.edu.au/about/our-university/30-years-young/stories-for-brighter-tomorrow/visnja-brdar/',
-    'https://www.swinburne.edu.au/about/our-university/30-years-young/stories-for-brighter-tomorrow/wesa-chau/',
-    'https://www.swinburne.edu.au/about/strategy-initiatives/equity-diversity/science-in-australia-gender-equity/panel-pledge/',
-    'https://www.swinburne.edu.au/about/our-structure/organisational-structure/schools-departments/school-engineering/',
-    'https://www.swinburne.edu.au/about/our-structure/organisational-structure/schools-departments/school-social-sciences-media-film-education/department-humanities-social-sciences/',
-    'https://www.swinburne.edu.au/about/strategy-initiatives/sustainability-environment/carbon-literacy-training/',
-    'https://www.swinburne.edu.au/about/our-university/30-years-young/stories-for-brighter-tomorrow/brad-foot/',
-    'https://www.swinburne.edu.au/about/our-university/30-years-young/stories-for-brighter-tomorrow/leonie-walsh/',
-    'https://www.swinburne.edu.au/about/our-structure/organisational-structure/schools-departments/school-health-sciences/department-psychological-sciences/',
-    'https://www.swinburne.edu.au/about/our-structure/organisational-structure/schools-departments/school-science-computing-engineering-technologies/',
-    'https://www.swinburne.edu.au/about/our-university/30-years-young/stories-for-brighter-tomorrow/amy-schultz/',
-    'https://www.swinburne.edu.au/about/our-structure/organisational-structure/schools-departments/school-health-sciences/department-nursing-allied-health/food-literacy-in-social-housing-estates/',
-    'https://www.swinburne.edu.au/about/our-structure/organisational-structure/schools-departments/school-business-law-entrepreneurship/swinburne-law-school/',
-    'https://www.swinburne.edu.au/about/strategy-initiatives/sustainability-environment/net-zero-pathway/carbon-neutral/',
-    'https://www.swinburne.edu.au/about/our-structure/leadership-governance/executive-team/laura-anne-bull/',
-    'https://www.swinburne.edu.au/about/our-structure/organisational-structure/schools-departments/school-design-architecture/department-architectural-industrial-design/',
-    'https://www.swinburne.edu.au/about/our-university/30-years-young/stories-for-brighter-tomorrow/nicole-lamond/',
-    'https://www.swinburne.edu.au/about/our-university/our-values/swinburne-stories/matthew-levy/',
-    'https://www.swinburne.edu.au/about/our-university/30-years-young/stories-for-brighter-tomorrow/sue-bolton/',
-    'https://www.swinburne.edu.au/about/our-structure/organisational-structure/schools-departments/school-social-sciences-media-film-education/',
-    'https://www.swinburne.edu.au/about/policies-regulations/people-culture-integrity/intellectual-property/',
-    'https://www.swinburne.edu.au/about/our-university/30-years-young/stories-for-brighter-tomorrow/jen-sharpe/',
-    'https://www.swinburne.edu.au/about/our-university/30-years-young/stories-for-brighter-tomorrow/Jefferson-harcourt/',
-    'https://www.swinburne.edu.au/about/our-structure/organisational-structure/schools-departments/school-engineering/department-aviation/',
-    'https://www.swinburne.edu.au/about/policies-regulations/people-culture-integrity/our-research/',
-    'https://www.swinburne.edu.au/about/our-university/30-years-young/stories-for-brighter-tomorrow/aimee-stanton/',
-    'https://www.swinburne.edu.au/about/strategy-initiatives/national-centre-reconciliation-practice/advisory-board/',
-    'https://www.swinburne.edu.au/about/our-structure/organisational-structure/schools-departments/school-science-computing-engineering-technologies/department-mathematics/',
-    'https://www.swinburne.edu.au/about/our-structure/organisational-structure/schools-departments/school-science-computing-engineering-technologies/department-engineering-technologies/',
-    'https://www.swinburne.edu.au/about/strategy-initiatives/learning-teaching-at-swinburne/digital-literacies/in-curriculum/',
-    'https://www.swinburne.edu.au/about/giving-to-swinburne/student-impact-stories/the-swinburne-staff-and-community-scholarship/',
-    'https://www.swinburne.edu.au/about/policies-regulations/people-culture-integrity/student-charter/',
-    'https://www.swinburne.edu.au/about/our-structure/organisational-structure/schools-departments/school-social-sciences-media-film-education/department-education/',
-    'https://www.swinburne.edu.au/about/policies-regulations/ssaa-foundation/',
-    'https://www.swinburne.edu.au/about/strategy-initiatives/moondani-toombadool-centre/engagement/community-partnerships/',
-    'https://www.swinburne.edu.au/about/our-structure/organisational-structure/schools-departments/school-science-computing-engineering-technologies/department-computing-technologies/',
-    'https://www.swinburne.edu.au/about/policies-regulations/claire-sorati-scholarships-foundation/',
-    'https://www.swinburne.edu.au/about/our-university/30-years-young/stories-for-brighter-tomorrow/peter-nguyen-brown/',
-    'https://www.swinburne.edu.au/about/our-university/30-years-young/stories-for-brighter-tomorrow/nathan-nankervis/',
-    'https://www.swinburne.edu.au/about/our-structure/organisational-structure/schools-departments/school-design-architecture/department-communication-design/',
-    'https://www.swinburne.edu.au/about/policies-regulations/kath-watson-foundation/',
-    'https://www.swinburne.edu.au/about/policies-regulations/swinburne-foundation/',
-    'https://www.swinburne.edu.au/about/policies-regulations/people-culture-integrity/representing-swinburne/',
-    'https://www.swinburne.edu.au/about/our-university/30-years-young/stories-for-brighter-tomorrow/lim-jim-hong/',
-    'https://www.swinburne.edu.au/about/strategy-initiatives/learning-teaching-at-swinburne/digital-literacies/adobe-digital-coaches/',
-    'https://www.swinburne.edu.au/about/our-structure/leadership-governance/executive-team/professor-tara-magdalinski/',
-    'https://www.swinburne.edu.au/about/policies-regulations/people-culture-integrity/health-safety/',
-    'https://www.swinburne.edu.au/about/our-university/30-years-young/stories-for-brighter-tomorrow/andrew-peters/',
-    'https://www.swinburne.edu.au/about/our-university/30-years-young/stories-for-brighter-tomorrow/iain-wallace/',
-    'https://www.swinburne.edu.au/about/our-university/30-years-young/stories-for-brighter-tomorrow/jesse-leeworthy/',
-    'https://www.swinburne.edu.au/about/strategy-initiatives/learning-teaching-at-swinburne/digital-literacies/projects/',
-    'https://www.swinburne.edu.au/about/policies-regulations/people-culture-integrity/facilities-services/',
-    'https://www.swinburne.edu.au/about/our-university/30-years-young/stories-for-brighter-tomorrow/jacqueline-savage/',
-    'https://www.swinburne.edu.au/about/our-university/30-years-young/stories-for-brighter-tomorrow/justin-trounson/',
-    'https://www.swinburne.edu.au/about/policies-regulations/barbara-dicker-brain-science-foundation/',
-    'https://www.swinburne.edu.au/about/strategy-initiatives/equity-diversity/diversity-inclusion-strategy-framework/',
-    'https://www.swinburne.edu.au/about/our-university/30-years-young/stories-for-brighter-tomorrow/trevor-barry/',
-    'https://www.swinburne.edu.au/about/policies-regulations/titles-for-people-associated-with-the-university/',
-    'https://www.swinburne.edu.au/about/our-structure/organisational-structure/schools-departments/school-health-sciences/department-nursing-allied-health/addressing-the-skeleton-in-the-university-closet/',
-    'https://www.swinburne.edu.au/about/our-university/30-years-young/stories-for-brighter-tomorrow/phillip-withers/',
-    'https://www.swinburne.edu.au/about/our-university/30-years-young/stories-for-brighter-tomorrow/phui-jing-ling/',
-    'https://www.swinburne.edu.au/alumni/update/',
-    'https://www.swinburne.edu.au/alumni/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/placements-internships/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/contact-us/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/school-programs/workshop-events/national-science-week/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/opportunities/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/employ-a-student/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/school-programs/australian-synchrotron-science-education/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/school-programs/primesci-science-education/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/research-engagement/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/placements-internships/accreditation-placements/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/workforce-training/meet-our-facilitators/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/facilities-and-equipment/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/school-programs/workshop-events/school-holiday-workshops/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/student-projects/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/school-programs/workshop-events/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/school-programs/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/workforce-training/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/opportunities/our-vision/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/school-programs/workshop-events/primary-school-incursions/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/school-programs/professional-learning-teachers/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/opportunities/why-partner-with-swinburne/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/statistical-services/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/research-engagement/sirab/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/placements-internships/partner-stories/city-of-yarra/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/opportunities/achievements-success-stories/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/placements-internships/partner-stories/accru/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/workforce-training/meet-our-consultants/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/placements-internships/partner-stories/nab/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/placements-internships/partner-stories/metro-trains/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/placements-internships/benefits-of-working-with-our-students/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/employ-a-student/apprenticeships-traineeships/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/opportunities/achievements-success-stories/position-promo/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/placements-internships/partner-stories/cobalt-design/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/opportunities/four-simple-steps-to-setting-up-a-partnership/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/opportunities/achievements-success-stories/mental-health-help/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/workforce-training/training-needs-analysis/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/school-programs/knox-innovation-opportunity-sustainability-centre/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/school-programs/work-experience/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/placements-internships/partner-stories/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/placements-internships/partner-stories/melbourne-water/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/placements-internships/partner-stories/decmil/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/opportunities/achievements-success-stories/richmond-partnership/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/workforce-training/hybrid-working-solutions/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/placements-internships/accreditation-placements/nursing/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/school-programs/workshop-events/family-science-nights/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/school-programs/workshop-events/childrens-university/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/placements-internships/accreditation-placements/youth-work/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/workforce-training/meet-our-leadership-management-team/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/placements-internships/accreditation-placements/community-services/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/placements-internships/partner-stories/the-royal-melbourne-hospital/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/placements-internships/hosting-a-student-with-disabilities/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/school-programs/workshop-events/immersion-days/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/placements-internships/partner-stories/optimising/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/placements-internships/accreditation-placements/allied-health-assistance/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/placements-internships/accreditation-placements/teacher-education-preparation/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/placements-internships/accreditation-placements/emergency-health-care/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/placements-internships/accreditation-placements/individual-support/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/placements-internships/accreditation-placements/early-childhood-education-and-care/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/opportunities/achievements-success-stories/medibank-partnership/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/placements-internships/accreditation-placements/health-services-assistance/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/placements-internships/accreditation-placements/school-based-education-support/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/placements-internships/accreditation-placements/mental-health/',
-    'https://www.swinburne.edu.au/collaboration-partnerships/opportunities/achievements-success-stories/successful-spin-offs/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-computer-science/software-development/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-computer-science/data-science/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-computer-science/cybersecurity/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-computer-science/artificial-intelligence/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-computer-science/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-computer-science/games-development/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-computer-science/internet-of-things/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-business/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-aviation/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-business-information-technology-professional/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-aviation-management/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-business-analytics-and-analysis/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-arts-professional/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-business-professional/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-engineering-honours/product-design/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-engineering-honours/mechanical/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-engineering-honours/civil/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-engineering-honours/software/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-engineering-honours/robotics-and-mechatronics/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-engineering-honours/electrical-and-electronic/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-engineering-honours/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-engineering-honours/biomedical/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-engineering-honours/architectural/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-education-studies/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-exercise-and-sport-science/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-education-early-childhood-teaching/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-education-early-childhood-and-primary/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-education-primary/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-digital-construction-management/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-design-industrial-design-honours/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-engineering-honours-professional/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-design/photomedia/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-design/motion-design/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-design/branded-environments/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-design/communication-design/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-design/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-design/ux-interaction-design/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-computer-science-professional/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-design-communication-design-honours/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-criminal-justice-and-criminology/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-design-interior-architecture-honours/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-design-architecture/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-cyber-security/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-data-science/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-science-professional/physics/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-information-and-communication-technology/information-technology/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-information-and-communication-technology/network-technology/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-information-and-communication-technology/software-technology/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-business/logistics-and-supply-chain-management/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-business/management/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-business/marketing/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-business-analytics-and-analysis/business-analytics/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-business-analytics-and-analysis/business-analysis/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-business/finance/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-business/accounting/',
-    'https://www.swinburne.edu.au/course/degree-pathway/diploma-of-information-technology-unilink-dp-ict1/',
-    'https://www.swinburne.edu.au/course/degree-pathway/diploma-of-science-unilink-dp-sci/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-aviation-and-piloting/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-science-professional/',
-    'https://www.swinburne.edu.au/course/tafe/diploma-of-information-technology-ict50220/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-nursing/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-science/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-psychological-sciences/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-psychology-honours/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-screen-production/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-iii-in-individual-support-ageing-and-disability-chc33021/',
-    'https://www.swinburne.edu.au/course/tafe/diploma-of-sport-sis50321-diploma-of-leadership-and-management-bsb50420/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-iii-in-early-childhood-education-and-care-chc30121/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-iii-in-bricklaying-and-blocklaying-cpc33020/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-iii-in-engineering-mechanical-trade-mem30219/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-iii-in-electrotechnology-electrician-uee30820/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-iii-in-non-emergency-patient-transport-hlt31120/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-iii-in-carpentry-cpc30220/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-iii-in-plumbing-cpc32420/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-iii-in-general-education-for-adults-22474vic/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-iii-in-health-services-assistance-hlt33115/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-iii-in-pathology-assistance-hlt37415/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-iii-in-engineering-fabrication-trade-mem30319/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-science/biochemistry/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-science/biotechnology/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-science/applied-mathematics/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-science/chemistry/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-science/physics/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-science/environmental-science/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-i-in-general-education-for-adults-22472vic/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-ii-in-electrotechnology-career-start-uee22020/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-ii-in-plumbing-pre-apprenticeship-22569vic/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-ii-in-general-education-for-adults-22473vic/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-i-in-general-education-for-adults-introductory-22476vic/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-business/business-administration/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-business/sports-management/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-business/human-resource-management/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-business/business-analytics-and-analysis/',
-    'https://www.swinburne.edu.au/course/tafe/diploma-of-accounting-fns50222/',
-    'https://www.swinburne.edu.au/course/tafe/diploma-of-business-fast-track-bsb50120/',
-    'https://www.swinburne.edu.au/course/tafe/diploma-of-building-and-construction-building-cpc50220/',
-    'https://www.swinburne.edu.au/course/tafe/diploma-of-accounting-and-finance-dp-accfin/',
-    'https://www.swinburne.edu.au/course/tafe/diploma-of-accounting-online-fns50222/',
-    'https://www.swinburne.edu.au/course/tafe/diploma-of-business-bsb50120/',
-    'https://www.swinburne.edu.au/course/tafe/diploma-of-applied-technologies-dp-apptec/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-iv-in-screen-and-media-online-cua41220/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-iv-in-screen-and-media-cua41220/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-iv-in-science-22608vic/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-iv-in-school-based-education-support-chc40221/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-iv-in-work-health-and-safety-fast-track-bsb41419/',
-    'https://www.swinburne.edu.au/course/tafe/diploma-of-information-technology-game-art-and-design-game-programming-ict50220/',
-    'https://www.swinburne.edu.au/course/tafe/diploma-of-information-technology-advanced-networking-cyber-security-cyber-academy-ict50220/',
-    'https://www.swinburne.edu.au/course/tafe/diploma-of-interior-design-msf50222/',
-    'https://www.swinburne.edu.au/course/tafe/diploma-of-human-resources-management-fast-track-bsb50320/',
-    'https://www.swinburne.edu.au/course/tafe/diploma-of-information-technology-advanced-networking-cyber-security-ict50220/',
-    'https://www.swinburne.edu.au/course/tafe/diploma-of-emergency-health-care-hlt51020/',
-    'https://www.swinburne.edu.au/course/tafe/diploma-of-event-management-sit50322/',
-    'https://www.swinburne.edu.au/course/tafe/diploma-of-early-childhood-education-and-care-chc50121/',
-    'https://www.swinburne.edu.au/course/tafe/diploma-of-community-services-chc52021/',
-    'https://www.swinburne.edu.au/course/tafe/diploma-of-graphic-design-cua50720/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-iv-leadership-and-management-fast-track-bsb40520/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-iv-in-engineering-mem40119/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-iv-in-mental-health-chc43315/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-iv-in-information-technology-gaming-development-ict40120/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-iv-in-professional-writing-and-editing-cua40118/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-iv-in-mental-health-peer-work-chc43515/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-iv-in-plumbing-and-services-operations-cpc40920/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-iv-in-photography-and-digital-imaging-cua41120/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-iv-project-management-practice-fast-track-bsb40920/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-iv-in-design-cua40720/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-iv-in-circus-arts-10824nat/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-iv-in-cyber-security-22603vic/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-iv-in-community-services-chc42015/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-iv-in-building-and-construction-building-cpc40120/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-iv-in-accounting-and-bookkeeping-fns40222/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-iv-in-accounting-and-bookkeeping-online-fns40222/',
-    'https://www.swinburne.edu.au/course/tafe/advanced-diploma-of-screen-and-media-film-and-television-cua60620/',
-    'https://www.swinburne.edu.au/course/degree-pathway/diploma-of-business-unilink-dp-bus1/',
-    'https://www.swinburne.edu.au/course/degree-pathway/diploma-of-health-science-unilink-dp-hsc1/',
-    'https://www.swinburne.edu.au/course/degree-pathway/diploma-of-design-unilink-dp-des1/',
-    'https://www.swinburne.edu.au/course/degree-pathway/diploma-of-arts-and-communication-unilink-dp-artcom/',
-    'https://www.swinburne.edu.au/course/degree-pathway/diploma-of-engineering-unilink-dp-eng1/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-health-science/neuroscience/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-health-science/psychology-and-forensic-science/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-health-science/nutrition/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-health-science/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-health-science/psychology-and-psychophysiology/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-health-science/clinical-technologies/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-health-science/public-health-promotion/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-health-science/biomedical-science/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-media-and-communication/cinema-screen-studies/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-media-and-communication/advertising/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-media-and-communication/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-media-and-communication/immersive-media/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-media-and-communication/creative-writing-and-publishing/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-media-and-communication/journalism/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-media-and-communication/public-relations/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-media-and-communication/social-media/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-media-and-communication-professional/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-media-and-communication-professional/creative-writing-and-publishing/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-information-and-communication-technology/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-film-and-television-honours/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-health-science-professional/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-laws/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-information-and-communication-technology-professional/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-games-and-interactivity/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-iv-in-youth-work-chc40421/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-arts/literature-and-creative-writing/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-arts/screen-studies-and-popular-culture/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-arts/politics-power-and-technology/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-arts/indigenous-studies/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-arts/climate-and-social-justice/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-arts/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-arts/criminology/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-arts/ethics-and-technology/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-arts/perspectives-on-globalisation/',
-    'https://www.swinburne.edu.au/course/tafe/advanced-diploma-of-graphic-design-cua60320/',
-    'https://www.swinburne.edu.au/course/tafe/advanced-diploma-of-engineering-technology-mechanical-engineering-design-22479vic/',
-    'https://www.swinburne.edu.au/course/tafe/advanced-diploma-of-screen-and-media-animation-cua60620/',
-    'https://www.swinburne.edu.au/course/tafe/advanced-diploma-of-engineering-technology-mechatronics-engineering-design-22479vic/',
-    'https://www.swinburne.edu.au/course/tafe/advanced-diploma-of-engineering-technology-civil-engineering-design-22479vic/',
-    'https://www.swinburne.edu.au/course/tafe/advanced-diploma-of-interior-design-msf60122/',
-    'https://www.swinburne.edu.au/course/tafe/diploma-of-leadership-and-management-fast-track-bsb50420/',
-    'https://www.swinburne.edu.au/course/tafe/diploma-of-library-and-information-services-online-bsb50520/',
-    'https://www.swinburne.edu.au/course/tafe/diploma-of-justice-online-22594vic/',
-    'https://www.swinburne.edu.au/course/tafe/diploma-of-laboratory-technology-msl50118/',
-    'https://www.swinburne.edu.au/course/tafe/diploma-of-library-and-information-services-bsb50520/',
-    'https://www.swinburne.edu.au/course/tafe/diploma-of-nursing-hlt54121/',
-    'https://www.swinburne.edu.au/course/tafe/diploma-of-justice-22594vic/',
-    'https://www.swinburne.edu.au/course/tafe/diploma-of-screen-and-media-film-and-television-cua51020/',
-    'https://www.swinburne.edu.au/course/tafe/diploma-of-screen-and-media-animation-cua51020/',
-    'https://www.swinburne.edu.au/course/tafe/diploma-of-screen-and-media-sports-media-cua51020/',
-    'https://www.swinburne.edu.au/course/tafe/diploma-of-photography-and-digital-imaging-cua50920/',
-    'https://www.swinburne.edu.au/course/tafe/diploma-of-teacher-education-preparation-22602vic/',
-    'https://www.swinburne.edu.au/course/tafe/diploma-of-social-media-marketing-10904nat/',
-    'https://www.swinburne.edu.au/course/tafe/diploma-of-visual-arts-cua51120/',
-    'https://www.swinburne.edu.au/course/tafe/diploma-of-project-management-fast-track-bsb50820/',
-    'https://www.swinburne.edu.au/course/tafe/diploma-of-professional-writing-and-editing-cua50118/',
-    'https://www.swinburne.edu.au/course/tafe/diploma-of-work-health-and-safety-fast-track-bsb51319/',
-    'https://www.swinburne.edu.au/course/tafe/diploma-of-quality-auditing-fast-track-bsb50920/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-accounting/accounting/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-accounting/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-accounting-and-business-information-technology-professional/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-animation/',
-    'https://www.swinburne.edu.au/course/tafe/diploma-of-sport-development-online-sis50321/',
-    'https://www.swinburne.edu.au/course/tafe/diploma-of-vocational-education-and-training-tae50116-diploma-of-training-design-and-development-online-tae50216/',
-    'https://www.swinburne.edu.au/course/research/master-of-arts-research/',
-    'https://www.swinburne.edu.au/course/research/master-of-engineering-research/',
-    'https://www.swinburne.edu.au/course/research/master-of-design-research/',
-    'https://www.swinburne.edu.au/course/research/master-of-science-research/',
-    'https://www.swinburne.edu.au/course/research/master-of-information-and-communication-technologies-research/',
-    'https://www.swinburne.edu.au/course/research/master-of-business-research/',
-    'https://www.swinburne.edu.au/course/research/master-of-health-sciences-research/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-diploma-of-information-technology/mobile-and-cloud-computing/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-diploma-of-information-technology/software-development/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-diploma-of-information-technology/data-analytics/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-diploma-of-information-technology/information-systems/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-of-applied-statistics/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-of-aviation-piloting/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-of-aviation/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-of-business-administration/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-in-applied-business/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-of-business-administration-swinburne-online/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-of-business-information-systems/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-business-information-systems/business-analytics/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-business-information-systems/accounting/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-business-information-systems/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-business-information-systems/digital-marketing/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-business-information-systems/finance/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-business-information-systems/international-business/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-counselling/couple-counselling/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-counselling/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-counselling/forensic-counselling/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-counselling/human-services-counselling/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-business-information-systems/financial-technologies/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-business-information-systems/human-resource-management/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-construction-management-practice/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-construction-and-infrastructure-management/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-aviation/',
-    'https://www.swinburne.edu.au/course/short-courses/industrial-training-course-psse-module-1/',
-    'https://www.swinburne.edu.au/course/short-courses/industrial-training-course-psse-module-2/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-education-early-childhood-teaching-online/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-education-early-childhood-primary-teaching-online/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-education-primary-teaching-online/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-health-science-honours/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-laws-online/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-engineering-honours-civil-and-infrastructure-uobaghdad/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-accounting-online/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-business-online/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-criminal-justice-and-criminology-online/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-computer-science-honours/',
-    'https://www.swinburne.edu.au/course/undergraduate/associate-degree-of-engineering/',
-    'https://www.swinburne.edu.au/course/undergraduate/associate-degree-of-applied-technologies/advanced-manufacturing/',
-    'https://www.swinburne.edu.au/course/undergraduate/associate-degree-of-applied-technologies/',
-    'https://www.swinburne.edu.au/course/undergraduate/associate-degree-of-applied-technologies/civil-infrastructure/',
-    'https://www.swinburne.edu.au/course/undergraduate/associate-degree-of-applied-technologies/building-information-modelling/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-of-engineering/advanced-manufacturing/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-of-engineering/structural-engineering/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-of-engineering/civil-engineering/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-of-engineering/mechanical-engineering/',
-    'https://www.swinburne.edu.au/course/research/doctor-of-philosophy-and-graduate-certificate-of-research-and-innovation-management-science/',
-    'https://www.swinburne.edu.au/course/research/doctor-of-philosophy-and-graduate-certificate-of-research-and-innovation-management-law/',
-    'https://www.swinburne.edu.au/course/research/doctor-of-psychology-clinical-and-forensic-psychology/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-diploma-of-early-childhood-teaching-swinburne-online/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-of-writing/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-diploma-of-applied-statistics/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-diploma-of-aviation/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-diploma-of-cyber-security/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-diploma-of-counselling/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-of-urban-informatics/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-diploma-in-clinical-supervision/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-diploma-of-environmental-health-practice/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-professional-engineering/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-teaching-primary-swinburne-online/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-psychology-clinical-psychology/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-science-network-systems/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-teaching-secondary-swinburne-online/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-urban-design/',
-    'https://www.swinburne.edu.au/course/degree-pathway/unilink-bridging-program-te-ubp/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-psychological-sciences-online/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-laws-graduate-entry/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-media-and-communication-online/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-laws-graduate-entry-online/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-science-honours/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-social-science-online/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-circus-arts/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-psychological-sciences-honours/',
-    'https://www.swinburne.edu.au/course/short-courses/stress-aware-self-care/',
-    'https://www.swinburne.edu.au/course/short-courses/stress-management-resilience-mindfulness/',
-    'https://www.swinburne.edu.au/course/short-courses/negotiation-skills/',
-    'https://www.swinburne.edu.au/course/short-courses/new-supervisor/',
-    'https://www.swinburne.edu.au/course/short-courses/masterclass-transformational-leadership/',
-    'https://www.swinburne.edu.au/course/short-courses/agile-project-management/',
-    'https://www.swinburne.edu.au/course/short-courses/microsoft-excel-advanced/',
-    'https://www.swinburne.edu.au/course/short-courses/leader-as-coach/',
-    'https://www.swinburne.edu.au/course/short-courses/mediation-training/',
-    'https://www.swinburne.edu.au/course/short-courses/lead-innovative-thinking-and-practice/',
-    'https://www.swinburne.edu.au/course/short-courses/mental-health-first-aid/',
-    'https://www.swinburne.edu.au/course/short-courses/develop-leadership-qualities/',
-    'https://www.swinburne.edu.au/course/short-courses/how-to-have-difficult-conversations/',
-    'https://www.swinburne.edu.au/course/short-courses/business-writing-skills/',
-    'https://www.swinburne.edu.au/course/short-courses/business-analysis/',
-    'https://www.swinburne.edu.au/course/short-courses/managing-for-maximum-performance/',
-    'https://www.swinburne.edu.au/course/short-courses/financial-fundamentals-for-managers/',
-    'https://www.swinburne.edu.au/course/short-courses/develop-breakthrough-business-strategy/',
-    'https://www.swinburne.edu.au/course/short-courses/contract-management-essentials/',
-    'https://www.swinburne.edu.au/course/short-courses/change-management/',
-    'https://www.swinburne.edu.au/course/short-courses/empowering-women/',
-    'https://www.swinburne.edu.au/course/short-courses/confident-communication/',
-    'https://www.swinburne.edu.au/course/short-courses/conflict-resolution/',
-    'https://www.swinburne.edu.au/course/short-courses/project-management-fundamentals/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-marketing/project-management/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-marketing/business-analytics/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-marketing/accounting/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-marketing/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-marketing/financial-technologies/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-marketing/business-information-systems/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-marketing/finance/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-marketing/international-business/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-marketing/social-media/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-marketing/supply-chain-innovation/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-marketing/research/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-supply-chain-innovation/project-management/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-supply-chain-innovation/business-analytics/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-supply-chain-innovation/accounting/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-supply-chain-innovation/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-supply-chain-innovation/digital-marketing/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-supply-chain-innovation/financial-technologies/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-supply-chain-innovation/human-resource-management/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-supply-chain-innovation/finance/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-supply-chain-innovation/international-business/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-supply-chain-innovation/research/',
-    'https://www.swinburne.edu.au/course/research/doctor-of-philosophy-technology-innovation-health-arts-and-design/',
-    'https://www.swinburne.edu.au/course/research/doctor-of-philosophy-technology-innovation-business-and-law/',
-    'https://www.swinburne.edu.au/course/research/doctor-of-philosophy-and-graduate-certificate-of-research-and-innovation-management-business/',
-    'https://www.swinburne.edu.au/course/research/doctor-of-philosophy-science/',
-    'https://www.swinburne.edu.au/course/research/doctor-of-philosophy-technology-innovation-science-engineering-and-technology/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-in-clinical-supervision/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-of-counselling/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-in-construction-management/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-of-cybersecurity-management-swinburne-online/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-of-data-science/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-of-design/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-in-client-assessment-and-case-management/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-of-cyber-security/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-engineering-practice/electrical-engineering/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-engineering-practice/industry-4-and-automation/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-engineering-practice/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-engineering-practice/advanced-manufacturing/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-engineering-practice/structural-engineering/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-engineering-practice/mechanical-engineering/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-engineering-practice/electronics-and-telecommunications/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-engineering-practice/civil-engineering/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-engineering-science/electrical-engineering/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-engineering-science/industry-4-and-automation/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-engineering-science/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-engineering-science/advanced-manufacturing/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-engineering-science/structural-engineering/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-engineering-science/mechanical-engineering/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-engineering-science/electronics-and-telecommunications/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-engineering-science/civil-engineering/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-engineering-practice-master-of-construction-management-practice/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-engineering-practice-master-of-construction-management-practice/structural-engineering/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-engineering-practice-master-of-construction-management-practice/civil-engineering/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-dietetics/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-data-science/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-counselling-advanced/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-cyber-security/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-design/',
-    'https://www.swinburne.edu.au/course/research/doctor-of-philosophy-health-sciences/',
-    'https://www.swinburne.edu.au/course/research/doctor-of-philosophy-law/',
-    'https://www.swinburne.edu.au/course/research/doctor-of-philosophy-business-integrated/',
-    'https://www.swinburne.edu.au/course/research/doctor-of-philosophy-information-and-communication-technology/',
-    'https://www.swinburne.edu.au/course/research/doctor-of-philosophy-clinical-psychology/',
-    'https://www.swinburne.edu.au/course/research/doctor-of-philosophy-information-systems/',
-    'https://www.swinburne.edu.au/course/research/doctor-of-philosophy-information-and-communication-technology-integrated/',
-    'https://www.swinburne.edu.au/course/research/doctor-of-philosophy-science-integrated/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-diploma-of-forensic-behavioural-science/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-diploma-of-information-technology/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-diploma-in-forensic-psychology/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-diploma-of-forensic-mental-health-nursing/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-information-technology-professional-computing/mobile-and-cloud-computing/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-information-technology-professional-computing/software-development/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-information-technology-professional-computing/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-information-technology-professional-computing/data-analytics/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-information-technology-professional-computing/information-systems/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-information-technology/mobile-and-cloud-computing/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-information-technology/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-information-technology/data-analytics/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-information-technology/information-systems/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-writing/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-science-biotechnology/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-forensic-behavioural-science/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-information-technology/software-development/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-science-astronomy/',
-    'https://www.swinburne.edu.au/course/research/doctor-of-philosophy-and-graduate-certificate-of-research-and-innovation-management-information-and-communication-technology/',
-    'https://www.swinburne.edu.au/course/research/doctor-of-philosophy-and-graduate-certificate-of-research-and-innovation-management-information-systems/',
-    'https://www.swinburne.edu.au/course/research/doctor-of-philosophy-and-graduate-certificate-of-research-and-innovation-management-humanities-arts-and-social-sciences/',
-    'https://www.swinburne.edu.au/course/research/doctor-of-philosophy-and-graduate-certificate-of-research-and-innovation-management-engineering/',
-    'https://www.swinburne.edu.au/course/research/doctor-of-philosophy-and-graduate-certificate-of-research-and-innovation-management-health-sciences/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-of-engineering/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-of-educational-studies-non-teaching-swinburne-online/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-of-human-resource-management/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-of-financial-technologies/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-of-forensic-psychiatric-practice/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-in-forensic-mental-health-nursing/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-of-entrepreneurship-and-innovation/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-in-forensic-behavioural-science/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-professional-accounting-extended/business-analytics/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-professional-accounting-extended/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-professional-accounting-extended/finance/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-media-and-communication/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-occupational-therapy/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-physiotherapy/',
-    'https://www.swinburne.edu.au/course/research/graduate-certificate-of-research-and-innovation-management/',
-    'https://www.swinburne.edu.au/course/research/doctor-of-philosophy-and-graduate-certificate-of-research-and-innovation-management-design/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-of-engineering/electrical-engineering/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-of-engineering/electronics-and-telecommunications-engineering/',
-    'https://www.swinburne.edu.au/course/research/doctor-of-philosophy-health-sciences-integrated/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-of-urban-design/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-of-professional-data-analytics-bootcamp-swinburne-online/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-of-supply-chain-innovation/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-of-science-astronomy/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-of-programming-and-development-bootcamp-swinburne-online/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-of-project-management/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-of-social-impact/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-of-project-management-swinburne-online/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-business-administration/project-management/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-business-administration/business-analytics/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-business-administration/accounting/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-business-administration/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-business-administration/digital-marketing/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-business-administration/financial-technologies/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-business-administration/business-information-systems/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-business-administration/human-resource-management/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-business-administration/finance/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-business-administration/international-business/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-business-administration/supply-chain-innovation/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-business-administration/research/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-business-administration-swinburne-online/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-iv-in-laboratory-techniques-msl40122/',
-    'https://www.swinburne.edu.au/course/short-courses/microsoft-excel-introduction/',
-    'https://www.swinburne.edu.au/course/short-courses/mental-health-for-people-leaders/',
-    'https://www.swinburne.edu.au/course/short-courses/positive-leadership/',
-    'https://www.swinburne.edu.au/course/short-courses/microsoft-excel-intermediate/',
-    'https://www.swinburne.edu.au/course/short-courses/mental-health-fundamentals/',
-    'https://www.swinburne.edu.au/course/short-courses/lead-in-hybrid-environment/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-games-and-interactivity-bachelor-of-computer-science/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-screen-production-bachelor-of-applied-innovation/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-health-science-bachelor-of-science/',
-    'https://www.swinburne.edu.au/course/research/master-of-law-research/',
-    'https://www.swinburne.edu.au/course/research/master-of-research-health-sciences/',
-    'https://www.swinburne.edu.au/course/research/master-of-research-design/',
-    'https://www.swinburne.edu.au/course/research/master-of-research-information-and-communication-technology/',
-    'https://www.swinburne.edu.au/course/research/doctor-of-philosophy-business-practice-based-research/',
-    'https://www.swinburne.edu.au/course/research/doctor-of-philosophy-humanities-arts-and-social-sciences-integrated/',
-    'https://www.swinburne.edu.au/course/research/doctor-of-philosophy-design/',
-    'https://www.swinburne.edu.au/course/research/doctor-of-philosophy-humanities-arts-and-social-sciences/',
-    'https://www.swinburne.edu.au/course/research/doctor-of-philosophy-engineering/',
-    'https://www.swinburne.edu.au/course/research/doctor-of-philosophy-design-integrated/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-diploma-of-project-management-swinburne-online/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-diploma-of-science-biotechnology/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-architecture/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-diploma-of-professional-accounting/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-diploma-of-writing/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-diploma-of-science-astronomy/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-diploma-of-psychology-swinburne-online/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-architecture-and-urban-design/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-diploma-of-psychology-advanced-swinburne-online/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-of-information-technology/mobile-and-cloud-computing/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-of-information-technology/software-development/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-of-information-technology/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-of-information-technology/data-analytics/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-of-information-technology/information-systems/',
-    'https://www.swinburne.edu.au/course/research/doctor-of-philosophy-business/',
-    'https://www.swinburne.edu.au/course/research/master-of-research-humanities-arts-and-social-sciences/',
-    'https://www.swinburne.edu.au/course/research/master-of-research-business/',
-    'https://www.swinburne.edu.au/course/research/master-of-research-science/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-in-learning-and-teaching-higher-education/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-of-media-and-communication/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-of-professional-accounting/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-of-marketing/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-of-management-workplace-transformation-swinburne-online/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-in-organisational-coaching/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-of-management-swinburne-online/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-project-management/business-analytics/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-project-management/accounting/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-project-management/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-project-management/digital-marketing/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-project-management/financial-technologies/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-project-management/business-information-systems/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-project-management/human-resource-management/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-project-management/finance/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-project-management/international-business/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-project-management/supply-chain-innovation/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-project-management/research/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-finance/project-management/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-finance/business-analytics/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-finance/accounting/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-finance/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-finance/digital-marketing/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-finance/financial-technologies/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-finance/business-information-systems/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-finance/human-resource-management/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-finance/supply-chain-innovation/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-finance/research/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-human-resource-management/project-management/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-human-resource-management/accounting/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-human-resource-management/financial-technologies/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-human-resource-management/finance/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-human-resource-management/international-business/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-human-resource-management/research/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-human-resource-management/supply-chain-innovation/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-financial-technologies/entrepreneurship-and-innovation/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-financial-technologies/accounting/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-financial-technologies/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-financial-technologies/finance/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-financial-technologies/research/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-financial-technologies/business-information-systems/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-financial-technologies/project-management/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-financial-technologies/business-analytics/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-financial-technologies/digital-marketing/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-financial-technologies/human-resource-management/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-financial-technologies/international-business/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-financial-technologies/supply-chain-innovation/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-human-resource-management/business-analytics/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-human-resource-management/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-human-resource-management/business-information-systems/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-criminal-justice-and-criminology-bachelor-of-applied-innovation/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-business-administration/social-impact/',
-    'https://www.swinburne.edu.au/course/degree-pathway/elicos-english-language-intensive-course/',
-    'https://www.swinburne.edu.au/course/degree-pathway/swinburne-foundation-program/',
-    'https://www.swinburne.edu.au/course/degree-pathway/maths-methods-bridging-program/',
-    'https://www.swinburne.edu.au/course/degree-pathway/undergraduate-certificate-of-criminal-justice-and-criminology/',
-    'https://www.swinburne.edu.au/course/degree-pathway/undergraduate-certificate-of-business/',
-    'https://www.swinburne.edu.au/course/inbound/study-abroad-two-semesters-exchange/',
-    'https://www.swinburne.edu.au/course/inbound/one-semester-exchange/',
-    'https://www.swinburne.edu.au/course/inbound/two-semesters-exchange/',
-    'https://www.swinburne.edu.au/course/inbound/study-abroad-one-semester-exchange/',
-    'https://www.swinburne.edu.au/course/secondary/vce-victorian-certificate-of-education-vocational-major-vce0000001/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-diploma-of-early-childhood-teaching/',
-    'https://www.swinburne.edu.au/course/degree-pathway/postgraduate-qualifying-program/',
-    'https://www.swinburne.edu.au/course/short-courses/lead-auditor-training/',
-    'https://www.swinburne.edu.au/course/short-courses/psychosocial-recovery-coach/',
-    'https://www.swinburne.edu.au/course/short-courses/executive-coaching-program/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-psychological-sciences-bachelor-of-criminal-justice-and-criminology/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-laws-bachelor-of-cyber-security/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-criminal-justice-and-criminology-bachelor-of-cyber-security/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-games-and-interactivity-bachelor-of-applied-innovation/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-computer-science-bachelor-of-applied-innovation/software-development/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-computer-science-bachelor-of-applied-innovation/data-science/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-computer-science-bachelor-of-applied-innovation/artificial-intelligence/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-computer-science-bachelor-of-applied-innovation/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-computer-science-bachelor-of-applied-innovation/games-development/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-computer-science-bachelor-of-applied-innovation/internet-of-things/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-engineering-honours-bachelor-of-computer-science/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-science-bachelor-of-applied-innovation/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-animation-bachelor-of-applied-innovation/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-business-analytics-and-analysis-bachelor-of-cyber-security/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-arts-bachelor-of-applied-innovation/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-accounting-bachelor-of-applied-innovation/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-media-and-communication-bachelor-of-business/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-laws-bachelor-of-science/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-health-science-bachelor-of-applied-innovation/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-arts-bachelor-of-business/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-computer-science-bachelor-of-applied-innovation/cyber-security/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-design-bachelor-of-media-and-communication/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-arts-bachelor-of-psychological-sciences/literature-and-creative-writing/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-arts-bachelor-of-psychological-sciences/screen-studies-and-popular-culture/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-arts-bachelor-of-psychological-sciences/politics-power-and-technology/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-arts-bachelor-of-psychological-sciences/indigenous-studies/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-arts-bachelor-of-psychological-sciences/criminology/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-arts-bachelor-of-psychological-sciences/perspectives-on-globalisation/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-arts-bachelor-of-psychological-sciences/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-arts-bachelor-of-psychological-sciences/ethics-and-technology/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-arts-bachelor-of-psychological-sciences/climate-social-justice/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-arts-bachelor-of-science/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-health-science-bachelor-of-media-and-communication/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-laws-bachelor-of-business-analytics-and-analysis/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-business-analytics-and-analysis-bachelor-of-applied-innovation/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-laws-bachelor-of-media-and-communication/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-aviation-management-bachelor-of-business/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-health-science-bachelor-of-arts/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-engineering-honours-bachelor-of-business/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-business-bachelor-of-applied-innovation/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-design-bachelor-of-applied-innovation/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-aviation-bachelor-of-business/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-engineering-honours-bachelor-of-applied-innovation/electrical-and-electronic/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-engineering-honours-bachelor-of-applied-innovation/civil/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-aviation-management-bachelor-of-applied-innovation/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-health-science-bachelor-of-business/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-engineering-honours-bachelor-of-arts/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-engineering-honours-bachelor-of-applied-innovation/robotics-and-mechatronics/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-engineering-honours-bachelor-of-applied-innovation/product-design/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-engineering-honours-bachelor-of-applied-innovation/mechanical/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-engineering-honours-bachelor-of-applied-innovation/software/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-engineering-honours-bachelor-of-applied-innovation/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-laws-bachelor-of-computer-science/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-media-and-communication-bachelor-of-applied-innovation/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-engineering-honours-bachelor-of-science/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-laws-bachelor-of-engineering-honours/product-design/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-laws-bachelor-of-engineering-honours/mechanical/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-laws-bachelor-of-engineering-honours/civil/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-laws-bachelor-of-engineering-honours/software/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-laws-bachelor-of-engineering-honours/robotics-and-mechatronics/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-laws-bachelor-of-engineering-honours/electrical-and-electronic/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-laws-bachelor-of-engineering-honours/biomedical/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-laws-bachelor-of-engineering-honours/architectural/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-engineering-honours-bachelor-of-applied-innovation/architectural/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-engineering-honours-bachelor-of-applied-innovation/biomedical/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-laws-bachelor-of-business/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-laws-bachelor-of-engineering-honours/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-business-analytics-and-analysis-bachelor-of-business/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-design-bachelor-of-business/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-laws-bachelor-of-arts/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-human-resource-management/social-impact/',
-    'https://www.swinburne.edu.au/course/tafe/diploma-of-laboratory-technology-msl50122/',
-    'https://www.swinburne.edu.au/course/short-courses/digital-manufacturing/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-marketing/social-impact/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-business-information-systems/project-management/',
-    'https://www.swinburne.edu.au/course/short-courses/design-thinking-principles/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-laws-bachelor-of-criminal-justice-and-criminology/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-information-and-communication-technology-bachelor-of-applied-innovation/information-technology/',
-    'https://www.swinburne.edu.au/course/tafe/advanced-diploma-of-building-design-architectural-22627vic/',
-    'https://www.swinburne.edu.au/course/short-courses/emotional-intelligence-training/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-information-and-communication-technology-bachelor-of-applied-innovation/',
-    'https://www.swinburne.edu.au/course/tafe/diploma-of-digital-marketing-10931nat/',
-    'https://www.swinburne.edu.au/course/tafe/advanced-diploma-of-engineering-technology-electrical/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-business-information-systems/research/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-ii-in-building-and-construction-carpentry-22614vic/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-ii-in-building-and-construction-bricklaying-22614vic/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-finance/social-impact/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-iv-in-training-and-assessment-fast-track-tae40122/',
-    'https://www.swinburne.edu.au/course/tafe/course-in-eal-22637vic/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-iv-in-training-and-assessment-tae40122/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-iv-in-information-technology-programming-ict40120/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-iii-in-information-technology/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-iii-in-eal-access-22640vic/',
-    'https://www.swinburne.edu.au/course/tafe/course-in-initial-eal-22636vic/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-human-resource-management/digital-marketing/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-II-in-eal-access-22639vic/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-professional-accounting/business-analytics/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-professional-accounting/finance/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-professional-accounting/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-i-in-eal-access-22638vic/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-iv-in-leisure-and-health-chc43415/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-teaching-primary/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-engineering-technology/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-business/entrepreneurship-and-innovation/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-diploma-of-entrepreneurship/',
-    'https://www.swinburne.edu.au/course/short-courses/critical-thinking-problem-solving/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-business-information-systems/supply-chain-innovation/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-marketing/human-resource-management/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-supply-chain-innovation/social-impact/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-social-impact/entrepreneurship-and-innovation/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-social-impact/supply-chain-innovation/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-social-impact/human-resource-management/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-social-impact/international-business/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-social-impact/financial-technologies/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-social-impact/project-management/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-social-impact/research/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-social-impact/finance/',
-    'https://www.swinburne.edu.au/course/short-courses/industrial-training-course-psssincal-module1/',
-    'https://www.swinburne.edu.au/course/degree-pathway/further-maths-general/',
-    'https://www.swinburne.edu.au/course/tafe/diploma-of-nursing-hlt54121-online/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-engineering-technology/software-engineering/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-engineering-technology/mechanical-engineering/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-engineering-technology/robotics-and-mechatronic/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-iv-in-allied-health-assistance-hlt43021/',
-    'https://www.swinburne.edu.au/course/tafe/diploma-of-digital-marketing-online-10931nat/',
-    'https://www.swinburne.edu.au/course/tafe/diploma-of-business-operations-swinburne-online-bsb50120/',
-    'https://www.swinburne.edu.au/course/tafe/diploma-of-business-swinburne-online-bsb50120/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-iv-in-training-and-assessment-fast-track-tae40116/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-business-information-systems/social-impact/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-project-management/social-impact/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-social-impact/digital-marketing/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-social-impact/business-information-systems/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-social-impact/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-social-impact/business-analytics/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-social-impact/accounting/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-marketing/entrepreneurship/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-human-resource-management/entrepreneurship/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-project-management/entrepreneurship/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-finance/entrepreneurship/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-supply-chain-innovation/entrepreneurship/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-business-information-systems/entrepreneurship/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-business-administration/entrepreneurship/',
-    'https://www.swinburne.edu.au/course/postgraduate/graduate-certificate-of-entrepreneurship/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-design-fashion/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-nutrition/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-information-and-communication-technology-online/',
-    'https://www.swinburne.edu.au/course/tafe/certificate-iv-in-laboratory-techniques-msl40118/',
-    'https://www.swinburne.edu.au/course/tafe/advanced-diploma-of-engineering-technology-electrical-uee62111/',
-    'https://www.swinburne.edu.au/course/tafe/advanced-diploma-of-building-design-architectural-22477vic/',
-    'https://www.swinburne.edu.au/course/undergraduate/bachelor-of-biomedical-science/',
-    'https://www.swinburne.edu.au/course/short-courses/workplace-storytelling/',
-    'https://www.swinburne.edu.au/course/postgraduate/master-of-cybersecurity-management/',
-    'https://www.swinburne.edu.au/courses/planning-your-future/early-entry-program/',
-    'https://www.swinburne.edu.au/courses/fees/student-services-amenities-fee/',
-    'https://www.swinburne.edu.au/courses/fees/',
-    'https://www.swinburne.edu.au/courses/',
-    'https://www.swinburne.edu.au/courses/planning-your-future/admission-requirements/',
-    'https://www.swinburne.edu.au/courses/fees/indicative-fees/',
-    'https://www.swinburne.edu.au/courses/planning-your-future/',
-    'https://www.swinburne.edu.au/courses/fees/fees-for-local-students/paying-your-fees/',
-    'https://www.swinburne.edu.au/courses/find-a-course/download-course-guide/',
-    'https://www.swinburne.edu.au/courses/visas/',
-    'https://www.swinburne.edu.au/courses/applying/how-to-apply-research-degree/entry-requirements/',
-    'https://www.swinburne.edu.au/courses/orientation/',
-    'https://www.swinburne.edu.au/courses/find-a-course/',
-    'https://www.swinburne.edu.au/courses/fees/fees-for-local-students/',
-    'https://www.swinburne.edu.au/courses/visas/applying-for-your-visa/',
-    'https://www.swinburne.edu.au/courses/fees/flying-training-fees/',
-    'https://www.swinburne.edu.au/courses/enrolling/course-transition-for-oua/',
-    'https://www.swinburne.edu.au/courses/applying/how-to-apply-local/',
-    'https://www.swinburne.edu.au/courses/find-a-course/science/astronomy/',
-    'https://www.swinburne.edu.au/courses/find-a-course/business/',
-    'https://www.swinburne.edu.au/courses/find-a-course/design/building-design/',
-    'https://www.swinburne.edu.au/courses/enrolling/',
-    'https://www.swinburne.edu.au/courses/find-a-course/games-animation/',
-    'https://www.swinburne.edu.au/courses/planning-your-future/vocational-education-tafe/one-on-one/',
-    'https://www.swinburne.edu.au/courses/find-a-course/media-communication/immersive-media/',
-    'https://www.swinburne.edu.au/courses/planning-your-future/career-practitioners/',
-    'https://www.swinburne.edu.au/courses/find-a-course/design/',
-    'https://www.swinburne.edu.au/courses/scholarships/scholarship-conditions/',
-    'https://www.swinburne.edu.au/courses/fees/loans-discounts-local-students/',
-    'https://www.swinburne.edu.au/courses/find-a-course/business/project-management/',
-    'https://www.swinburne.edu.au/courses/study-levels-explained/traineeships/',
-    'https://www.swinburne.edu.au/courses/browse-course-units/',
-    'https://www.swinburne.edu.au/courses/enrolling/taking-time-off-from-study/',
-    'https://www.swinburne.edu.au/courses/find-a-course/information-technology/',
-    'https://www.swinburne.edu.au/courses/find-a-course/health/',
-    'https://www.swinburne.edu.au/courses/find-a-course/aviation/',
-    'https://www.swinburne.edu.au/courses/fees/loans-discounts-local-students/vet-student-loan/',
-    'https://www.swinburne.edu.au/courses/find-a-course/business/management/',
-    'https://www.swinburne.edu.au/courses/planning-your-future/vocational-education-tafe/',
-    'https://www.swinburne.edu.au/courses/planning-your-future/entry-into-research-degrees/',
-    'https://www.swinburne.edu.au/courses/find-a-course/science/physics/',
-    'https://www.swinburne.edu.au/courses/applying/',
-    'https://www.swinburne.edu.au/courses/find-a-course/science/',
-    'https://www.swinburne.edu.au/courses/find-a-course/design/photography/',
-    'https://www.swinburne.edu.au/courses/applying/supporting-documentation/',
-    'https://www.swinburne.edu.au/courses/find-a-course/business/social-impact-philanthropy/',
-    'https://www.swinburne.edu.au/courses/study-levels-explained/bachelor-degrees/',
-    'https://www.swinburne.edu.au/courses/intakes/semester-1/',
-    'https://www.swinburne.edu.au/courses/find-a-course/engineering/',
-    'https://www.swinburne.edu.au/courses/study-levels-explained/',
-    'https://www.swinburne.edu.au/courses/find-a-course/information-technology/data-analysis/',
-    'https://www.swinburne.edu.au/courses/study-levels-explained/double-degrees/',
-    'https://www.swinburne.edu.au/courses/fees/fee-sponsorship/',
-    'https://www.swinburne.edu.au/courses/course-delivery-options/',
-    'https://www.swinburne.edu.au/courses/find-a-course/law/',
-    'https://www.swinburne.edu.au/courses/study-levels-explained/trades-short-courses/',
-    'https://www.swinburne.edu.au/courses/fees/miscellaneous-fees/',
-    'https://www.swinburne.edu.au/courses/fees/fees-for-international-students/',
-    'https://www.swinburne.edu.au/courses/find-a-course/design/visual-arts/',
-    'https://www.swinburne.edu.au/courses/find-a-course/trades-apprenticeships/',
-    'https://www.swinburne.edu.au/courses/course-delivery-options/study-online/',
-    'https://www.swinburne.edu.au/courses/find-a-course/arts-humanities-social-sciences/sociology/',
-    'https://www.swinburne.edu.au/courses/find-a-course/nursing/',
-    'https://www.swinburne.edu.au/courses/study-levels-explained/associate-degrees/',
-    'https://www.swinburne.edu.au/courses/enrolling/credit-for-prior-study-experience/',
-    'https://www.swinburne.edu.au/courses/find-a-course/podcast/',
-    'https://www.swinburne.edu.au/courses/fees/loans-discounts-local-students/hecs-help-loan/',
-    'https://www.swinburne.edu.au/courses/enrolling/your-letter-of-offer/',
-    'https://www.swinburne.edu.au/courses/fees/fees-for-local-students/refunds/',
-    'https://www.swinburne.edu.au/courses/enrolling/understanding-your-offer/how-to-accept/how-to-accept-your-offer-vtac-vocational-education-student/',
-    'https://www.swinburne.edu.au/courses/applying/how-to-apply-international/',
-    'https://www.swinburne.edu.au/courses/enrolling/how-to-enrol/',
-    'https://www.swinburne.edu.au/courses/find-a-course/psychology/',
-    'https://www.swinburne.edu.au/courses/scholarships/international-scholarships/',
-    'https://www.swinburne.edu.au/courses/enrolling/setting-up-your-class-timetable/',
-    'https://www.swinburne.edu.au/courses/enrolling/planning-your-course-structure/',
-    'https://www.swinburne.edu.au/courses/study-levels-explained/short-courses/',
-    'https://www.swinburne.edu.au/courses/find-a-course/arts-humanities-social-sciences/philosophy/',
-    'https://www.swinburne.edu.au/courses/find-a-course/health/community-services/',
-    'https://www.swinburne.edu.au/courses/study-levels-explained/apprenticeships/',
-    'https://www.swinburne.edu.au/courses/find-a-course/information-technology/computer-science/',
-    'https://www.swinburne.edu.au/courses/fees/loans-discounts-local-students/free-tafe-for-priority-courses/',
-    'https://www.swinburne.edu.au/courses/planning-your-future/career-practitioners/course-guide-resources/',
-    'https://www.swinburne.edu.au/courses/find-a-course/film-television/',
-    'https://www.swinburne.edu.au/courses/study-levels-explained/pre-apprenticeships/',
-    'https://www.swinburne.edu.au/courses/visas/overseas-student-health-cover/',
-    'https://www.swinburne.edu.au/courses/study-levels-explained/diplomas/',
-    'https://www.swinburne.edu.au/courses/find-a-course/business/accounting/',
-    'https://www.swinburne.edu.au/courses/find-a-course/design/motion-design/',
-    'https://www.swinburne.edu.au/courses/find-a-course/applied-innovation/',
-    'https://www.swinburne.edu.au/courses/enrolling/change-your-units/',
-    'https://www.swinburne.edu.au/courses/find-a-course/media-communication/',
-    'https://www.swinburne.edu.au/courses/visas/renewing-your-visa/',
-    'https://www.swinburne.edu.au/courses/find-a-course/business/information-management/',
-    'https://www.swinburne.edu.au/courses/enrolling/understanding-your-offer/how-to-accept/',
-    'https://www.swinburne.edu.au/courses/find-a-course/design/branded-environments/',
-    'https://www.swinburne.edu.au/courses/intakes/',
-    'https://www.swinburne.edu.au/courses/find-a-course/built-environment-architecture/',
-    'https://www.swinburne.edu.au/courses/applying/application-portal/',
-    'https://www.swinburne.edu.au/courses/find-a-course/engineering/civil-engineering/',
-    'https://www.swinburne.edu.au/courses/find-a-course/design/ux-design/',
-    'https://www.swinburne.edu.au/courses/applying/how-to-apply-research-degree/',
-    'https://www.swinburne.edu.au/courses/enrolling/paying-your-deposit/',
-    'https://www.swinburne.edu.au/courses/find-a-course/built-environment-architecture/architecture/',
-    'https://www.swinburne.edu.au/courses/course-delivery-options/study-online/autism-mooc/',
-    'https://www.swinburne.edu.au/courses/visas/attendance-requirements/',
-    'https://www.swinburne.edu.au/courses/find-a-course/design/industrial-product-design/',
-    'https://www.swinburne.edu.au/courses/find-a-course/design/innovation-design/',
-    'https://www.swinburne.edu.au/courses/study-levels-explained/elicos/',
-    'https://www.swinburne.edu.au/courses/enrolling/withdrawing-from-your-course/',
-    'https://www.swinburne.edu.au/courses/find-a-course/design/communication-graphic-design/',
-    'https://www.swinburne.edu.au/courses/intakes/semester-1/',
-    'https://www.swinburne.edu.au/courses/fees/student-services-amenities-fee/2019-allocation/',
-    'https://www.swinburne.edu.au/courses/fees/fees-for-international-students/refunds/',
-    'https://www.swinburne.edu.au/courses/find-a-course/education/general-education-training/',
-    'https://www.swinburne.edu.au/courses/find-a-course/arts-humanities-social-sciences/criminology/',
-    'https://www.swinburne.edu.au/courses/enrolling/understanding-your-offer/',
-    'https://www.swinburne.edu.au/courses/study-levels-explained/certificates/',
-    'https://www.swinburne.edu.au/courses/enrolling/key-timetable-dates/',
-    'https://www.swinburne.edu.au/courses/enrolling/understanding-your-offer/how-to-accept/how-to-accept-your-offer-vtac-higher-education-student/',
-    'https://www.swinburne.edu.au/courses/find-a-course/media-communication/creative-writing-literature/',
-    'https://www.swinburne.edu.au/courses/find-a-course/information-technology/software-engineering/',
-    'https://www.swinburne.edu.au/courses/planning-your-future/university-pathways/',
-    'https://www.swinburne.edu.au/courses/enrolling/planning-your-course-structure/summer-winter-terms/',
-    'https://www.swinburne.edu.au/courses/find-a-course/education/',
-    'https://www.swinburne.edu.au/courses/course-delivery-options/studying-on-campus/',
-    'https://www.swinburne.edu.au/courses/study-levels-explained/graduate-diploma-courses/',
-    'https://www.swinburne.edu.au/courses/find-a-course/business/logistics-supply-chain-management/',
-    'https://www.swinburne.edu.au/courses/find-a-course/information-technology/business-analysis/',
-    'https://www.swinburne.edu.au/courses/find-a-course/engineering/mechanical-engineering/',
-    'https://www.swinburne.edu.au/courses/fees/loans-discounts-local-students/sa-help-loan/',
-    'https://www.swinburne.edu.au/courses/study-levels-explained/doctor-of-philosophy/',
-    'https://www.swinburne.edu.au/courses/planning-your-future/study-abroad-in-melbourne/',
-    'https://www.swinburne.edu.au/courses/fees/loans-discounts-local-students/skills-first-program/',
-    'https://www.swinburne.edu.au/courses/planning-your-future/direct-entry-into-university/',
-    'https://www.swinburne.edu.au/courses/find-a-course/arts-humanities-social-sciences/climate-social-justice/',
-    'https://www.swinburne.edu.au/courses/find-a-course/media-communication/cinema-screen-studies/',
-    'https://www.swinburne.edu.au/courses/find-a-course/engineering/skills-competencies/',
-    'https://www.swinburne.edu.au/courses/find-a-course/engineering/advanced-manufacturing-technology/',
-    'https://www.swinburne.edu.au/courses/course-delivery-options/studying-outside-australia/',
-    'https://www.swinburne.edu.au/courses/find-a-course/design/interior-architecture-design/',
-    'https://www.swinburne.edu.au/courses/applying/how-to-apply-research-degree/offshore-phd-programs/',
-    'https://www.swinburne.edu.au/courses/fees/loans-discounts-local-students/fee-help-loan/',
-    'https://www.swinburne.edu.au/courses/find-a-course/trades-apprenticeships/engineering-turner-and-fitter/',
-    'https://www.swinburne.edu.au/courses/planning-your-future/returning-to-study/',
-    'https://www.swinburne.edu.au/courses/find-a-course/engineering/robotics-mechatronics/',
-    'https://www.swinburne.edu.au/courses/find-a-course/trades-apprenticeships/plumbing/',
-    'https://www.swinburne.edu.au/courses/find-a-course/business/startup-eoi/',
-    'https://www.swinburne.edu.au/courses/study-levels-explained/graduate-certificate-courses/',
-    'https://www.swinburne.edu.au/courses/planning-your-future/university-pathways/guaranteed-pathways-from-tafe/',
-    'https://www.swinburne.edu.au/courses/find-a-course/engineering/product-design-engineering/',
-    'https://www.swinburne.edu.au/courses/enrolling/planning-your-course-structure/summer-winter-terms/undergraduate/',
-    'https://www.swinburne.edu.au/courses/enrolling/taking-time-off-from-study/local-students/',
-    'https://www.swinburne.edu.au/courses/find-a-course/trades-apprenticeships/electrical/',
-    'https://www.swinburne.edu.au/courses/enrolling/understanding-your-offer/how-to-accept/how-to-accept-your-offer-vtac-unilink-student/',
-    'https://www.swinburne.edu.au/courses/fees/fees-for-international-students/refunds/post-census/',
-    'https://www.swinburne.edu.au/courses/find-a-course/arts-humanities-social-sciences/politics-international-relations/',
-    'https://www.swinburne.edu.au/courses/find-a-course/arts-humanities-social-sciences/',
-    'https://www.swinburne.edu.au/courses/find-a-course/information-technology/information-technology/',
-    'https://www.swinburne.edu.au/courses/planning-your-future/vocational-education-training-secondary-students/',
-    'https://www.swinburne.edu.au/courses/planning-your-future/career-practitioners/resources/',
-    'https://www.swinburne.edu.au/courses/planning-your-future/entry-into-university-from-vce/year-11-12-students/',
-    'https://www.swinburne.edu.au/courses/applying/asylum-seeker-refugee-support/',
-    'https://www.swinburne.edu.au/courses/planning-your-future/university-pathways/unilink/',
-    'https://www.swinburne.edu.au/courses/find-a-course/business/entrepreneurship-innovation/',
-    'https://www.swinburne.edu.au/courses/planning-your-future/entry-into-university-from-vce/',
-    'https://www.swinburne.edu.au/courses/find-a-course/education/english-language-skills/',
-    'https://www.swinburne.edu.au/courses/fees/student-services-amenities-fee/2023-allocation/',
-    'https://www.swinburne.edu.au/courses/applying/applicant-declaration/',
-    'https://www.swinburne.edu.au/courses/study-levels-explained/university-certificates/',
-    'https://www.swinburne.edu.au/courses/fees/loans-discounts-local-students/fee-concessions-for-vocational-students/',
-    'https://www.swinburne.edu.au/courses/fees/fees-for-international-students/paying-your-fees/',
-    'https://www.swinburne.edu.au/courses/study-levels-explained/master-degrees/',
-    'https://www.swinburne.edu.au/courses/planning-your-future/switching-to-swinburne/',
-    'https://www.swinburne.edu.au/courses/find-a-course/trades-apprenticeships/building-and-construction/',
-    'https://www.swinburne.edu.au/courses/enrolling/withdrawing-from-your-course/student-transfer-request-assessment-guidelines/',
-    'https://www.swinburne.edu.au/courses/find-a-course/arts-humanities-social-sciences/perspectives-globalisation/',
-    'https://www.swinburne.edu.au/courses/enrolling/taking-time-off-from-study/international-students/',
-    'https://www.swinburne.edu.au/courses/enrolling/how-to-enrol-phd-master-degree-student/',
-    'https://www.swinburne.edu.au/courses/planning-your-future/entry-into-university-from-vce/atar/',
-    'https://www.swinburne.edu.au/courses/enrolling/planning-your-course-structure/study-online-units/',
-    'https://www.swinburne.edu.au/courses/enrolling/planning-your-course-structure/summer-winter-terms/postgraduate/',
-    'https://www.swinburne.edu.au/courses/planning-your-future/study-abroad-in-melbourne/sending-your-students-to-swinburne/',
-    'https://www.swinburne.edu.au/courses/enrolling/receive-your-confirmation-of-enrolment/',
-    'https://www.swinburne.edu.au/courses/fees/fees-for-local-students/refunds/post-census-remission-of-debt/',
-    'https://www.swinburne.edu.au/courses/applying/information-on-vtac/',
-    'https://www.swinburne.edu.au/courses/find-a-course/arts-humanities-social-sciences/indigenous-studies/',
-    'https://www.swinburne.edu.au/courses/planning-your-future/pathways-from-the-workforce-recognition-of-prior-learning/',
-    'https://www.swinburne.edu.au/courses/planning-your-future/study-abroad-in-melbourne/apply-international-exchange-to-swinburne/',
-    'https://www.swinburne.edu.au/courses/fees/loans-discounts-local-students/vet-student-loan/language-literacy-numeracy-assessment/',
-    'https://www.swinburne.edu.au/courses/find-a-course/education/how-to-become-a-teacher/literacy-numeracy-test-initial-teacher-education-students/',
-    'https://www.swinburne.edu.au/library/search/databases/',
-    'https://www.swinburne.edu.au/library/about/opening-hours/',
-    'https://www.swinburne.edu.au/library/about/locations/',
-    'https://www.swinburne.edu.au/library/about/contact-us/',
-    'https://www.swinburne.edu.au/library/about/opening-hours/hawthorn/',
-    'https://www.swinburne.edu.au/library/about/opening-hours/hawthorn-library-latelab/',
-    'https://www.swinburne.edu.au/library/referencing/references-endnote/endnote/endnote-enquiry/',
-    'https://www.swinburne.edu.au/library/search/referencing-guides/endnote/',
-    'https://www.swinburne.edu.au/library/search/',
-    'https://www.swinburne.edu.au/library/',
-    'https://www.swinburne.edu.au/library/about/',
-    'https://www.swinburne.edu.au/library/about/borrow/by-mail/postal-request/',
-    'https://www.swinburne.edu.au/library/search/study-assignment-help/find-use-ebooks/',
-    'https://www.swinburne.edu.au/library/services/borrowing/',
-    'https://www.swinburne.edu.au/library/about/opening-hours/wantirna/',
-    'https://www.swinburne.edu.au/library/services/',
-    'https://www.swinburne.edu.au/library/search/referencing-guides/',
-    'https://www.swinburne.edu.au/library/services/wifi-it-help-services/',
-    'https://www.swinburne.edu.au/library/about/opening-hours/croydon/',
-    'https://www.swinburne.edu.au/library/search/referencing-guides/apa-style-guide/',
-    'https://www.swinburne.edu.au/library/search/referencing-guides/aglc4/',
-    'https://www.swinburne.edu.au/library/services/services-for-researchers/',
-    'https://www.swinburne.edu.au/library/services/disability-support/',
-    'https://www.swinburne.edu.au/library/services/services-for-teachers/',
-    'https://www.swinburne.edu.au/library/search/study-assignment-help/',
-    'https://www.swinburne.edu.au/library/about/opening-hours/croydon-library-latelab/',
-    'https://www.swinburne.edu.au/library/about/opening-hours/wantirna-library-latelab/',
-    'https://www.swinburne.edu.au/library/services/study-spaces/',
-    'https://www.swinburne.edu.au/library/services/liaison-librarians/',
-    'https://www.swinburne.edu.au/library/about/memberships/',
-    'https://www.swinburne.edu.au/library/search/special-collections/',
-    'https://www.swinburne.edu.au/library/services/wifi-it-help-services/print-copy-scan/',
-    'https://www.swinburne.edu.au/library/search/special-collections/past-exam-papers/',
-    'https://www.swinburne.edu.au/library/services/services-for-researchers/inter-library-loans/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/study-learning-support/learning-academic-skills/assignment-writing-guides-samples/',
-    'https://www.swinburne.edu.au/life-at-swinburne/study-abroad-exchange/studying-a-semester-abroad/',
-    'https://www.swinburne.edu.au/life-at-swinburne/',
-    'https://www.swinburne.edu.au/life-at-swinburne/work-integrated-learning/placements/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/',
-    'https://www.swinburne.edu.au/life-at-swinburne/locations/your-safety-at-swinburne/',
-    'https://www.swinburne.edu.au/life-at-swinburne/study-abroad-exchange/overseas-internships/',
-    'https://www.swinburne.edu.au/life-at-swinburne/living-in-melbourne/plan-your-arrival/',
-    'https://www.swinburne.edu.au/life-at-swinburne/study-abroad-exchange/virtual-overseas-programs/',
-    'https://www.swinburne.edu.au/life-at-swinburne/work-integrated-learning/',
-    'https://www.swinburne.edu.au/life-at-swinburne/work-integrated-learning/internships/',
-    'https://www.swinburne.edu.au/life-at-swinburne/locations/wantirna-campus/',
-    'https://www.swinburne.edu.au/life-at-swinburne/locations/hawthorn-campus/',
-    'https://www.swinburne.edu.au/life-at-swinburne/locations/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/special-consideration-assistance/',
-    'https://www.swinburne.edu.au/life-at-swinburne/work-integrated-learning/real-industry-experience-stories/',
-    'https://www.swinburne.edu.au/life-at-swinburne/international-students/',
-    'https://www.swinburne.edu.au/life-at-swinburne/study-abroad-exchange/',
-    'https://www.swinburne.edu.au/life-at-swinburne/locations/croydon-campus/',
-    'https://www.swinburne.edu.au/life-at-swinburne/getting-started-at-swinburne/',
-    'https://www.swinburne.edu.au/life-at-swinburne/next-gen-experience/',
-    'https://www.swinburne.edu.au/life-at-swinburne/why-choose-swinburne/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/studenthq/',
-    'https://www.swinburne.edu.au/life-at-swinburne/careers-employment/career-services/',
-    'https://www.swinburne.edu.au/life-at-swinburne/study-abroad-exchange/fee-help-scholarships-for-studying-overseas/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/support-for-international-students/',
-    'https://www.swinburne.edu.au/life-at-swinburne/study-abroad-exchange/study-tours/',
-    'https://www.swinburne.edu.au/life-at-swinburne/why-choose-swinburne/chat-to-our-international-team/',
-    'https://www.swinburne.edu.au/life-at-swinburne/locations/sarawak-malaysia-campus/',
-    'https://www.swinburne.edu.au/life-at-swinburne/sport-fitness/',
-    'https://www.swinburne.edu.au/life-at-swinburne/living-in-melbourne/',
-    'https://www.swinburne.edu.au/life-at-swinburne/work-integrated-learning/student-stories/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/indigenous-student-services/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/health-wellbeing/services/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/study-learning-support/salna/',
-    'https://www.swinburne.edu.au/life-at-swinburne/volunteering/volunteering-in-the-community/',
-    'https://www.swinburne.edu.au/life-at-swinburne/careers-employment/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/study-learning-support/student-systems-hardware-software/',
-    'https://www.swinburne.edu.au/life-at-swinburne/work-integrated-learning/professional-degrees/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/accommodation/contact/',
-    'https://www.swinburne.edu.au/life-at-swinburne/volunteering/emerging-leaders-program/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/study-learning-support/',
-    'https://www.swinburne.edu.au/life-at-swinburne/volunteering/',
-    'https://www.swinburne.edu.au/life-at-swinburne/study-abroad-exchange/studying-a-semester-abroad/applying/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/legal-advice-for-students/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/childcare-for-the-swinburne-community/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/health-wellbeing/health-information-advice/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/financial-support-advice/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/accommodation/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/swinburne-skills-jobs-centre/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/lgbtiq-support-services/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/spiritual-care/',
-    'https://www.swinburne.edu.au/life-at-swinburne/living-in-melbourne/getting-around-melbourne/',
-    'https://www.swinburne.edu.au/life-at-swinburne/locations/your-safety-at-swinburne/sexual-assault-harassment/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/elite-athletes/',
-    'https://www.swinburne.edu.au/life-at-swinburne/clubs-societies-student-organisations/',
-    'https://www.swinburne.edu.au/life-at-swinburne/work-integrated-learning/get-paid-to-podcast/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/accessibility-services/',
-    'https://www.swinburne.edu.au/life-at-swinburne/locations/your-safety-at-swinburne/report-an-incident/',
-    'https://www.swinburne.edu.au/life-at-swinburne/why-choose-swinburne/why-study-in-australia/',
-    'https://www.swinburne.edu.au/life-at-swinburne/locations/your-safety-at-swinburne/safety-through-prevention/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/study-learning-support/student-systems-hardware-software/how-to-use-citrix/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/study-learning-support/student-success-coach/',
-    'https://www.swinburne.edu.au/life-at-swinburne/work-integrated-learning/industry-linked-projects/',
-    'https://www.swinburne.edu.au/life-at-swinburne/living-in-melbourne/arriving-in-melbourne/',
-    'https://www.swinburne.edu.au/life-at-swinburne/getting-started-at-swinburne/email-wifi-password-help/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/asylum-seeker-refugee-support/',
-    'https://www.swinburne.edu.au/life-at-swinburne/volunteering/become-a-mentor/',
-    'https://www.swinburne.edu.au/life-at-swinburne/living-in-melbourne/costs-banking/',
-    'https://www.swinburne.edu.au/life-at-swinburne/study-abroad-exchange/contact-us/',
-    'https://www.swinburne.edu.au/life-at-swinburne/locations/your-safety-at-swinburne/cyber-harassment/',
-    'https://www.swinburne.edu.au/life-at-swinburne/international-students/information-for-agents/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/study-learning-support/get-help-from-other-students/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/care-leaver-support/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/health-wellbeing/',
-    'https://www.swinburne.edu.au/life-at-swinburne/locations/your-safety-at-swinburne/family-violence/',
-    'https://www.swinburne.edu.au/life-at-swinburne/locations/your-safety-at-swinburne/what-to-do-in-an-emergency/',
-    'https://www.swinburne.edu.au/life-at-swinburne/getting-started-at-swinburne/student-card-online-access/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/independent-advocacy-for-students/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/accommodation/compare-your-options/',
-    'https://www.swinburne.edu.au/life-at-swinburne/locations/your-safety-at-swinburne/stalking/',
-    'https://www.swinburne.edu.au/life-at-swinburne/locations/croydon-campus/getting-to-the-croydon-campus/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/accommodation/on-campus-accommodation/',
-    'https://www.swinburne.edu.au/life-at-swinburne/getting-started-at-swinburne/student-discounts-concessions/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/accommodation/homestays/',
-    'https://www.swinburne.edu.au/life-at-swinburne/work-integrated-learning/future-work-lab/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/study-learning-support/learning-academic-skills/',
-    'https://www.swinburne.edu.au/life-at-swinburne/careers-employment/improve-your-employability/',
-    'https://www.swinburne.edu.au/life-at-swinburne/getting-started-at-swinburne/changing-personal-details/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/health-wellbeing/register-make-an-appointment/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/assault-reporting-help/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/accommodation/resources-for-renting/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/study-learning-support/learning-academic-skills/develop-your-english-language-skills/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/study-learning-support/student-systems-hardware-software/adobe-creative-cloud/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/find-a-mentor/',
-    'https://www.swinburne.edu.au/life-at-swinburne/study-abroad-exchange/students-currently-overseas/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/health-wellbeing/services/health-services-near-swinburne/',
-    'https://www.swinburne.edu.au/life-at-swinburne/locations/hawthorn-campus/getting-to-the-hawthorn-campus/',
-    'https://www.swinburne.edu.au/life-at-swinburne/work-integrated-learning/student-stories/alex-engineering/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/alternate-assessment-arrangements/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/study-learning-support/thesis-writing-research-skills/',
-    'https://www.swinburne.edu.au/life-at-swinburne/careers-employment/professional-purpose/',
-    'https://www.swinburne.edu.au/life-at-swinburne/study-abroad-exchange/overseas-internships/academic-credit-from-overseas-internships/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/student-feedback-surveys/',
-    'https://www.swinburne.edu.au/life-at-swinburne/study-abroad-exchange/studying-a-semester-abroad/partner-universities/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/accessibility-services/register/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/study-learning-support/get-study-advice/',
-    'https://www.swinburne.edu.au/life-at-swinburne/locations/wantirna-campus/things-to-do-in-wantirna/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/health-wellbeing/medical-discounts-benefits/',
-    'https://www.swinburne.edu.au/life-at-swinburne/work-integrated-learning/student-stories/ruby-education/',
-    'https://www.swinburne.edu.au/life-at-swinburne/work-integrated-learning/placements/accreditation-placements/',
-    'https://www.swinburne.edu.au/life-at-swinburne/international-students/international-student-stories/',
-    'https://www.swinburne.edu.au/life-at-swinburne/locations/your-safety-at-swinburne/bullying/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/accommodation/short-term-crisis-accommodation/',
-    'https://www.swinburne.edu.au/life-at-swinburne/locations/wantirna-campus/getting-to-the-wantirna-campus/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/health-wellbeing/health-information-advice/learn-to-unlearn/',
-    'https://www.swinburne.edu.au/life-at-swinburne/locations/hawthorn-campus/things-to-do-in-hawthorn/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/support-for-students-policy/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/health-wellbeing/h-squad/',
-    'https://www.swinburne.edu.au/life-at-swinburne/locations/your-safety-at-swinburne/discrimination-harassment-vilification/',
-    'https://www.swinburne.edu.au/life-at-swinburne/clubs-societies-student-organisations/stem-student-groups/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/accommodation/student-accommodation-hostels/',
-    'https://www.swinburne.edu.au/life-at-swinburne/living-in-melbourne/things-to-do-melbourne/',
-    'https://www.swinburne.edu.au/life-at-swinburne/locations/croydon-campus/things-to-do-in-croydon/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/study-learning-support/mathematics-statistics-help-centre/',
-    'https://www.swinburne.edu.au/life-at-swinburne/living-in-melbourne/plan-your-arrival/bringing-your-family-to-melbourne/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/health-wellbeing/psychology-counselling-services/',
-    'https://www.swinburne.edu.au/life-at-swinburne/work-integrated-learning/student-stories/osama-design/',
-    'https://www.swinburne.edu.au/life-at-swinburne/work-integrated-learning/student-stories/freya-media-communication/',
-    'https://www.swinburne.edu.au/life-at-swinburne/work-integrated-learning/student-stories/murphy-media-communications/',
-    'https://www.swinburne.edu.au/life-at-swinburne/work-integrated-learning/student-stories/michelle-health-science/',
-    'https://www.swinburne.edu.au/life-at-swinburne/study-abroad-exchange/overseas-internships/malaysia-business-law-internship-summer/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/study-learning-support/student-systems-hardware-software/apps-on-demand-user-guide/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/study-learning-support/student-systems-hardware-software/mobile-apps/',
-    'https://www.swinburne.edu.au/life-at-swinburne/clubs-societies-student-organisations/student-staff-consultative-committee/',
-    'https://www.swinburne.edu.au/life-at-swinburne/study-abroad-exchange/fee-help-scholarships-for-studying-overseas/new-colombo-plan-funding/',
-    'https://www.swinburne.edu.au/life-at-swinburne/work-integrated-learning/student-stories/thishara-business/',
-    'https://www.swinburne.edu.au/life-at-swinburne/work-integrated-learning/student-stories/isaac-physics/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/swinburne-skills-jobs-centre/job-ready-resources/',
-    'https://www.swinburne.edu.au/life-at-swinburne/clubs-societies-student-organisations/student-representative-council/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/equitable-assessment-arrangements/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/indigenous-student-services/indigenous-academic-success-program/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/accessibility-services/use-the-accessability-careers-hub/',
-    'https://www.swinburne.edu.au/life-at-swinburne/clubs-societies-student-organisations/student-representative-council/src-committees-boards/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/health-wellbeing/free-immunisations/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/health-wellbeing/health-information-advice/go-deeper/',
-    'https://www.swinburne.edu.au/life-at-swinburne/work-integrated-learning/student-stories/katrina-law/',
-    'https://www.swinburne.edu.au/life-at-swinburne/student-support-services/accessibility-services/rights-responsibilities/',
-    'https://www.swinburne.edu.au/life-at-swinburne/work-integrated-learning/placements/tips-for-your-professional-placement/',
-    'https://www.swinburne.edu.au/life-at-swinburne/work-integrated-learning/placements/6-reasons-to-try-a-professional-placement/',
-    'https://www.swinburne.edu.au/news/law/',
-    'https://www.swinburne.edu.au/news/science/',
-    'https://www.swinburne.edu.au/news/health/',
-    'https://www.swinburne.edu.au/news/aviation/',
-    'https://www.swinburne.edu.au/news/trades/',
-    'https://www.swinburne.edu.au/news/business/',
-    'https://www.swinburne.edu.au/news/design/',
-    'https://www.swinburne.edu.au/news/education/',
-    'https://www.swinburne.edu.au/news/politics/',
-    'https://www.swinburne.edu.au/news/astronomy/',
-    'https://www.swinburne.edu.au/news/social-affairs/',
-    'https://www.swinburne.edu.au/news/technology/',
-    'https://www.swinburne.edu.au/news/engineering/',
-    'https://www.swinburne.edu.au/news/film-television/',
-    'https://www.swinburne.edu.au/news/university/',
-    'https://www.swinburne.edu.au/news/2023/02/professor-alan-duffy-to-lead-flagship-initiatives-as-swinburne/',
-    'https://www.swinburne.edu.au/news/2024/07/construction-simulation-hub-opening/',
-    'https://www.swinburne.edu.au/news/sustainability/',
-    'https://www.swinburne.edu.au/news/2013/05/swinburnes-babylab-researches-effects-of-touch-screens-on-toddlers/',
-    'https://www.swinburne.edu.au/news/2017/03/app-will-teach-infants-with-cochlear-implants-to-speak/',
-    'https://www.swinburne.edu.au/news/2014/03/galaxies-in-the-early-universe-mature-beyond-their-years/',
-    'https://www.swinburne.edu.au/news/2014/10/turnbull-outlines-the-plans-for-new-laws-on-metadata-retention/',
-    'https://www.swinburne.edu.au/news/2015/06/swinburne-students-receive-10000-to-practice-grant-making/',
-    'https://www.swinburne.edu.au/news/2021/12/knowledge-sharing-will-be-the-focus-of-new-partnership/',
-    'https://www.swinburne.edu.au/news/2021/06/students-put-talent-to-the-test-at-worldskills/',
-    'https://www.swinburne.edu.au/news/2022/12/film-students-bring-hollywood-to-hawthorn-in-premiere-showcase/',
-    'https://www.swinburne.edu.au/news/2024/01/innovative-approaches-to-teaching-learning-funded-by-adobe/',
-    'https://www.swinburne.edu.au/news/2020/11/swinburne-design-alumnus-wins-prestigious-good-design-gold-award/',
-    'https://www.swinburne.edu.au/news/2019/08/swinburne-researchers-hand-picked-for-indonesian-research-symposium/',
-    'https://www.swinburne.edu.au/news/2019/04/analysing-data-to-predict-the-evolution-of-technologies/',
-    'https://www.swinburne.edu.au/news/2018/04/interest-based-learning-engages-older-australians-in-the-digital-world/',
-    'https://www.swinburne.edu.au/news/2022/07/indigenous-student-art-calls-for-us-to-stand-up/',
-    'https://www.swinburne.edu.au/news/2024/05/swinburne-is-committed-to-reconciliation-now-more-than-ever/',
-    'https://www.swinburne.edu.au/news/2019/06/top-10-finish-for-swinburne-at-indigenous-nationals/',
-    'https://www.swinburne.edu.au/news/2020/06/australian-business-leader-invests-in-swinburne-students-facing-adversity/',
-    'https://www.swinburne.edu.au/news/2015/03/what-designers-can-learn-from-aboriginal-possum-skin-cloaks/',
-    'https://www.swinburne.edu.au/news/2015/01/design-students-meet-with-australian-ambassador-to-vietnam/',
-    'https://www.swinburne.edu.au/news/2020/10/centre-for-design-innovation-continues-partnership-with-scope/',
-    'https://www.swinburne.edu.au/news/2021/09/new-report-highlights-alarming-lack-of-hydrogen-training/',
-    'https://www.swinburne.edu.au/news/2016/04/professor-aleks-subic-joins-prime-ministers-industry-40-taskforce/',
-    'https://www.swinburne.edu.au/news/2015/02/how-will-data-retention-laws-cope-with-the-internet-of-things/',
-    'https://www.swinburne.edu.au/news/2016/10/indigenous-trade-program-teaches-skills-needed-to-build-communities/',
-    'https://www.swinburne.edu.au/news/2024/08/swinburne-hosts-xprize-wildfire-summit/',
-    'https://www.swinburne.edu.au/news/2015/11/future-fellowship-funding-brings-researcher-back-to-swinburne/',
-    'https://www.swinburne.edu.au/news/2021/11/Swinburne-alum-wins-VIVID-design-awards/',
-    'https://www.swinburne.edu.au/news/2020/03/work-experience-on-digital-platforms-the-way-of-the-future/',
-    'https://www.swinburne.edu.au/news/2020/10/world-teachers-day-2020/',
-    'https://www.swinburne.edu.au/news/2015/05/book-launch-the-untold-story-of-lemnos/',
-    'https://www.swinburne.edu.au/news/2014/11/proceeds-of-crime-how-polymer-banknotes-were-invented/',
-    'https://www.swinburne.edu.au/news/2016/09/libertarian-or-green-what-chances-do-third-parties-have-in-2016/',
-    'https://www.swinburne.edu.au/news/2018/12/health-check-when-should-you-throw-away-leftovers/',
-    'https://www.swinburne.edu.au/news/2019/12/award-winning-year-for-swinburne-conservation-and-land-management-students/',
-    'https://www.swinburne.edu.au/news/2017/09/taking-the-pulse-of-a-city-melbournes-vital-signs/',
-    'https://www.swinburne.edu.au/news/2022/02/How-I-survived-and-thrived-as-a-lady-tradie/',
-    'https://www.swinburne.edu.au/news/2016/06/how-to-beat-the-winter-blues-as-the-season-changes/',
-    'https://www.swinburne.edu.au/news/2018/01/virtual-reality-app-launches-at-swinburne-sarawak/',
-    'https://www.swinburne.edu.au/news/2022/06/ambulance-victoria-workers-want-to-quit-as-they-reach-peak-burnout/',
-    'https://www.swinburne.edu.au/news/2015/12/fulbright-scholarship-allows-stephane-shepherd-to-learn-from-the-usa/',
-    'https://www.swinburne.edu.au/news/2021/02/chief-scientist-rounds-up-five-stories-to-inspire-young-female-scientists/',
-    'https://www.swinburne.edu.au/news/2022/01/one-year-since-blast-off-for-space-institute/',
-    'https://www.swinburne.edu.au/news/2020/06/expedition-earth/',
-    'https://www.swinburne.edu.au/news/2023/07/students-skewer-publishing-world-in-new-truce-films-web-series/',
-    'https://www.swinburne.edu.au/news/2014/09/new-technique-could-benefit-alzheimers-diagnosis-1/',
-    'https://www.swinburne.edu.au/news/2020/04/five-tips-for-staying-active-in-isolation/',
-    'https://www.swinburne.edu.au/news/2021/04/swinburne-brings-people-and-technology-together-to-build-a-better-world/',
-    'https://www.swinburne.edu.au/news/2023/11/swinburne-and-oracle-partner-to-enhance-student-employability/',
-    'https://www.swinburne.edu.au/news/2014/06/new-appointment-to-lead-engineering-education-accreditation/',
-    'https://www.swinburne.edu.au/news/2019/05/swinburne-film-exploring-sport-in-migrant-communities-wins-at-vmc-film-festival/',
-    'https://www.swinburne.edu.au/news/2018/10/school-of-design-invites-industry-and-partners-to-design-week/',
-    'https://www.swinburne.edu.au/news/2017/02/young-women-gear-up-for-first-robotics-competition/',
-    'https://www.swinburne.edu.au/news/2014/05/ibd-online-clinic/',
-    'https://www.swinburne.edu.au/news/2021/08/swinburne-early-career-researchers-win-funding/',
-    'https://www.swinburne.edu.au/news/2022/03/space-awards-recognise-the-stars-among-us/',
-    'https://www.swinburne.edu.au/news/2017/07/a-new-look-at-a-lost-dinosaur-dig-in-the-australian-outback/',
-    'https://www.swinburne.edu.au/news/2019/03/swinburne-success-at-2019-melbourne-international-flower-and-garden-show/',
-    'https://www.swinburne.edu.au/news/2015/08/new-swinburne-university-of-technology-enterprise-agreement/',
-    'https://www.swinburne.edu.au/news/2018/02/youth-photography-exhibition-backed-by-swinburne-research/',
-    'https://www.swinburne.edu.au/news/2020/10/cmh-hope-seminar-2020/',
-    'https://www.swinburne.edu.au/news/2020/05/eight-swinburne-academics-in-the-top-200-computer-science-scholars-in-australia/',
-    'https://www.swinburne.edu.au/news/2020/12/andrews-supporters-will-lose-faith-when-the-coronavirus-money-runs-out/',
-    'https://www.swinburne.edu.au/news/2022/05/autumn-sun-shines-on-melbourne-international-flower-and-garden-show/',
-    'https://www.swinburne.edu.au/news/2014/04/stop-the-pirates-behind-brandis-copyright-crusade/',
-    'https://www.swinburne.edu.au/news/2021/10/swinburnes-air-hub-to-drive-the-future-of-aerospace/',
-    'https://www.swinburne.edu.au/news/2023/08/Swinburne-researchers-celebrate-ARC-early-career-funding-success/',
-    'https://www.swinburne.edu.au/news/2014/10/vcal-students-short-film-success/',
-    'https://www.swinburne.edu.au/news/2014/01/dont-blame-the-booze-its-zero-tolerance-on-violence-thats-needed/',
-    'https://www.swinburne.edu.au/news/2022/04/swinburne-finalists-shine-at-premiers-design-awards/',
-    'https://www.swinburne.edu.au/news/2018/11/swinburne-phd-student-wins-fulbright-nehru-fellowship/',
-    'https://www.swinburne.edu.au/news/2021/03/wtfn-internships-open-the-door-to-film-and-tv-careers/',
-    'https://www.swinburne.edu.au/news/2023/06/from-the-streets-to-social-entrepreneur-the-swinburne-alum-giving-hope/',
-    'https://www.swinburne.edu.au/news/2024/04/addressing-casual-payments-at-Swinburne/',
-    'https://www.swinburne.edu.au/news/2022/11/nica-celebrates-21-years-of-spectacular-circus/',
-    'https://www.swinburne.edu.au/news/2020/07/vale-dr-jean-mcleod/',
-    'https://www.swinburne.edu.au/news/2022/09/stem-journalist-and-broadcaster-appointed-to-swinburne-council/',
-    'https://www.swinburne.edu.au/news/2017/04/swinburne-and-tel-aviv-university-formalise-data-science-partnership/',
-    'https://www.swinburne.edu.au/news/2023/04/new-air-hub-partnership-driving-innovation-and-industry-engagement/',
-    'https://www.swinburne.edu.au/news/2023/03/design-alum-turns-side-hustle-into-high-end-architectural-products-business/',
-    'https://www.swinburne.edu.au/news/2016/11/swinburne-launches-master-of-media-and-communication/',
-    'https://www.swinburne.edu.au/news/2016/05/perfect-landing-inflatable-space-stations-and-space-sweeteners/',
-    'https://www.swinburne.edu.au/news/2023/09/Swinburne-climbs-into-top-250-global-university-rankings/',
-    'https://www.swinburne.edu.au/news/2015/08/chew-more-stress-less/',
-    'https://www.swinburne.edu.au/news/2018/08/what-is-a-mobile-network-anyway-this-is-5g-boiled-down/',
-    'https://www.swinburne.edu.au/news/2015/04/hubble-in-pictures-astronomers-top-picks/',
-    'https://www.swinburne.edu.au/news/2019/09/what-has-the-search-for-extraterrestrial-life-actually-yielded-and-how-does-it-work/',
-    'https://www.swinburne.edu.au/news/2021/05/swinburnes-new-academic-schools-structure-designed-to-power-horizon-2025-strategy/',
-    'https://www.swinburne.edu.au/news/2014/08/vietnamese-youth-compete-for-swinburne-scholarship/',
-    'https://www.swinburne.edu.au/news/2016/12/2016-the-year-in-space-and-astronomy/',
-    'https://www.swinburne.edu.au/news/2019/11/why-the-hype-about-graphene/',
-    'https://www.swinburne.edu.au/news/2018/09/swinburne-ranks-top-450-in-times-higher-education-world-university-rankings/',
-    'https://www.swinburne.edu.au/news/2016/03/negative-interest-rates--are-there-any-positives/',
-    'https://www.swinburne.edu.au/news/2014/12/hanson-gets-the-band-back-together--can-she-make-an-impact/',
-    'https://www.swinburne.edu.au/news/2017/12/creative-solutions-improve-lives-of-12-australians/',
-    'https://www.swinburne.edu.au/news/2014/02/unilink-a-boon-to-motivated-students/',
-    'https://www.swinburne.edu.au/news/2020/08/motion-design-melbourne-water/',
-    'https://www.swinburne.edu.au/news/2021/07/swinburne-ARC-grant-success-highlights-industry-connection/',
-    'https://www.swinburne.edu.au/news/2015/03/big-blue-bus-next-stop-swinburne/',
-    'https://www.swinburne.edu.au/news/2015/05/being-greens/',
-    'https://www.swinburne.edu.au/news/2016/07/the-mysterious-missing-magnetic-monopole/',
-    'https://www.swinburne.edu.au/news/2021/11/2021-gradx-re-silience/',
-    'https://www.swinburne.edu.au/news/2016/03/vale-professor-don-iverson/',
-    'https://www.swinburne.edu.au/news/2014/05/older-workers-doing-the-heavy-lifting/',
-    'https://www.swinburne.edu.au/news/2019/10/fostering-cultural-diversity-inclusiveness-and-belonging-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2014/05/insect-wings-beat-superbugs/',
-    'https://www.swinburne.edu.au/news/2018/02/recycling-carbon-dioxide/',
-    'https://www.swinburne.edu.au/news/2023/12/what-will-you-read-on-the-beach-this-summer-we-asked-6-avid-readers/',
-    'https://www.swinburne.edu.au/news/2017/01/galaxy-murder-mystery/',
-    'https://www.swinburne.edu.au/news/2021/01/swinburnes-new-space-institute-blasts-off/',
-    'https://www.swinburne.edu.au/news/2017/12/celebrating-our-history/',
-    'https://www.swinburne.edu.au/news/2022/08/week-long-staff-student-and-alumni-exhibit-takes-over-acmi/',
-    'https://www.swinburne.edu.au/news/2014/07/swinburne-open-day-2014/',
-    'https://www.swinburne.edu.au/news/2016/09/could-clinton-win-utah/',
-    'https://www.swinburne.edu.au/news/2019/07/private-renters-are-doing-it-tough-in-outer-suburbs-of-sydney-and-melbourne/',
-    'https://www.swinburne.edu.au/news/2014/12/professor-min-gu-named-ieee-fellow/',
-    'https://www.swinburne.edu.au/news/2016/05/models-reduce-traffic-mayhem/',
-    'https://www.swinburne.edu.au/news/2014/06/sublime-design-lego/',
-    'https://www.swinburne.edu.au/news/2020/02/neil-degrasse-tyson-visits-swinburne/',
-    'https://www.swinburne.edu.au/news/2016/11/cancer-cell-structure-decoded/',
-    'https://www.swinburne.edu.au/news/2020/08/mia-lindgren-staff-profile/',
-    'https://www.swinburne.edu.au/news/2016/02/saulius-juodkazis-recognised-for-research-/',
-    'https://www.swinburne.edu.au/news/2015/12/just-the-ticket/',
-    'https://www.swinburne.edu.au/news/2017/11/queensland-sauropod-digs-reveal-exciting-secrets/',
-    'https://www.swinburne.edu.au/news/2016/06/garden-helps-young-mums-grow/',
-    'https://www.swinburne.edu.au/news/2023/05/new-247-Latelab-on-the-way-in-Swinburnes-next-gen-campus-redevelopment/',
-    'https://www.swinburne.edu.au/news/2020/08/staff-profile-bruce-thompson/',
-    'https://www.swinburne.edu.au/news/2015/08/abbotts-end-game/',
-    'https://www.swinburne.edu.au/news/2017/01/what-are-executive-orders-and-what-force-do-they-have-in-us-politics/',
-    'https://www.swinburne.edu.au/news/2018/06/abc-stargazing-live-awarded-david-allen-prize/',
-    'https://www.swinburne.edu.au/news/2015/07/swinburne-creates-professional-development-program-for-international-partners/',
-    'https://www.swinburne.edu.au/news/2023/01/protecting-our-night-sky/',
-    'https://www.swinburne.edu.au/news/2020/10/swinburne-barak-wonga-oration-2020/',
-    'https://www.swinburne.edu.au/news/2020/09/australian-renewable-energy-agency-funds-swinburne-solar-panel-recycling-project/',
-    'https://www.swinburne.edu.au/news/2022/07/new-deans-announced/',
-    'https://www.swinburne.edu.au/news/2016/02/yes-we-have-no-bananas/',
-    'https://www.swinburne.edu.au/news/2019/01/swinburne-professor-named-prestigious-ieee-fellow/',
-    'https://www.swinburne.edu.au/news/2017/05/review-wonder-woman-reinvigorates-tired-superhero-conventions/',
-    'https://www.swinburne.edu.au/news/2018/05/swinburne-students-and-staff-celebrate-diversity-and-inclusion-at-iftar-dinner/',
-    'https://www.swinburne.edu.au/news/2014/07/peter-mares-almost-migrants/',
-    'https://www.swinburne.edu.au/news/2022/10/aerospace-partnership-offers-sky-high-opportunities/',
-    'https://www.swinburne.edu.au/news/2015/04/the-dark-matter-conspiracy/',
-    'https://www.swinburne.edu.au/news/2020/06/eating-well-during-winter/',
-    'https://www.swinburne.edu.au/news/2016/01/swinburne-celebrates-australia-day-2016/',
-    'https://www.swinburne.edu.au/news/2016/02/the-streaming-wars/',
-    'https://www.swinburne.edu.au/news/2016/07/five-visible-planets-align/',
-    'https://www.swinburne.edu.au/news/2018/03/swinburne-welcome-scholarships-provide-new-opportunities/',
-    'https://www.swinburne.edu.au/news/2020/09/staff-profile-jonathan-kingsley/',
-    'https://www.swinburne.edu.au/news/2022/06/Swinburne-beyond-the-fault-lines-liffman-fellowship/',
-    'https://www.swinburne.edu.au/news/2016/04/growing-our-social-economy/',
-    'https://www.swinburne.edu.au/news/2017/08/change-agents-stopping-japanese-whaling/',
-    'https://www.swinburne.edu.au/news/2015/09/swinburne-again-ranked-in-worlds-top-400-universities-by-times-higher-education/',
-    'https://www.swinburne.edu.au/news/2017/02/phd-candidate-martin-bush-wins-mike-smith-student-prize/',
-    'https://www.swinburne.edu.au/news/2018/07/organic-grass-fed-and-hormone-free-does-this-make-red-meat-any-healthier/',
-    'https://www.swinburne.edu.au/news/2014/10/funding-boost-for-kiosc-welcomed/',
-    'https://www.swinburne.edu.au/news/2018/11/dr-nishar-hameed-wins-2018-young-tall-poppy-award/',
-    'https://www.swinburne.edu.au/news/2021/12/Swinburne-holiday-gift-guide/',
-    'https://www.swinburne.edu.au/news/2015/09/normal-transmission/',
-    'https://www.swinburne.edu.au/news/2014/02/swinburne-student-byron-bound/',
-    'https://www.swinburne.edu.au/news/2014/07/noted-works-after-homosexual/',
-    'https://www.swinburne.edu.au/news/2016/03/swinburne-launches-living-lab/',
-    'https://www.swinburne.edu.au/news/2016/07/damping-down-annoying-office-vibes/',
-    'https://www.swinburne.edu.au/news/2018/07/training-to-take-naplan-online/',
-    'https://www.swinburne.edu.au/news/2023/10/swinburne-abroad-going-to-sarawak/',
-    'https://www.swinburne.edu.au/news/2017/05/patterns-of-creation/',
-    'https://www.swinburne.edu.au/news/2021/11/stem-program-inspires-rural-students/',
-    'https://www.swinburne.edu.au/news/2014/12/gold-nanorods-target-cancer-cells/',
-    'https://www.swinburne.edu.au/news/2015/10/condom-packaging-competition-winners-announced/',
-    'https://www.swinburne.edu.au/news/2014/08/training-event-in-vietnam/',
-    'https://www.swinburne.edu.au/news/2022/02/celebrating-lunar-new-year/',
-    'https://www.swinburne.edu.au/news/2017/10/swinburne-celebrates-25th-anniversary/',
-    'https://www.swinburne.edu.au/news/2022/06/epic-new-chapter-syrian-engineer/',
-    'https://www.swinburne.edu.au/news/2017/04/guide-dogs-offer-much-more-than-mobility/',
-    'https://www.swinburne.edu.au/news/2020/09/staff-profile-jason-and-jessica-pallant/',
-    'https://www.swinburne.edu.au/news/2016/07/beating-heart-of-crab-nebula/',
-    'https://www.swinburne.edu.au/news/2015/07/the-name-game/',
-    'https://www.swinburne.edu.au/news/2023/10/swinburne-helps-pasifika-youth-thrive/',
-    'https://www.swinburne.edu.au/news/2014/12/bill-scales-ao-awarded-honorary-doctorate/',
-    'https://www.swinburne.edu.au/news/2020/03/walk-quality-improvement-project-gets-arc-linkage-grant/',
-    'https://www.swinburne.edu.au/news/2021/12/2021-vice-chancellors-award-winners/',
-    'https://www.swinburne.edu.au/news/2015/02/democracy-at-work/',
-    'https://www.swinburne.edu.au/news/2024/09/bringing-transformative-education-down-under/',
-    'https://www.swinburne.edu.au/news/2014/07/behind-the-mulga-curtain/',
-    'https://www.swinburne.edu.au/news/2014/02/older-adults-love-online-dating/',
-    'https://www.swinburne.edu.au/news/2022/08/swinburne-pride-2022-events/',
-    'https://www.swinburne.edu.au/news/2015/03/back-to-base/',
-    'https://www.swinburne.edu.au/news/2016/03/dealing-with-mr-erdogan/',
-    'https://www.swinburne.edu.au/news/2019/04/top-law-graduate-awarded-supreme-court-prize/',
-    'https://www.swinburne.edu.au/news/2015/06/understanding-ramadan/',
-    'https://www.swinburne.edu.au/news/2019/11/taking-care-of-business/',
-    'https://www.swinburne.edu.au/news/2020/09/swinburne-good-design-awards-2020/',
-    'https://www.swinburne.edu.au/news/2022/10/celebrating-world-space-week/',
-    'https://www.swinburne.edu.au/news/2016/07/fast-track-to-legal-practice/',
-    'https://www.swinburne.edu.au/news/2014/06/einstein-vs-quantum-mechanics/',
-    'https://www.swinburne.edu.au/news/2019/06/our-very-own-great-polling-disaster/',
-    'https://www.swinburne.edu.au/news/2014/05/jupiters-great-red-spot-shrinking/',
-    'https://www.swinburne.edu.au/news/2015/02/where-can-an-early-childhood-diploma-take-you/',
-    'https://www.swinburne.edu.au/news/2020/01/updates-on-coronavirus/',
-    'https://www.swinburne.edu.au/news/2024/07/Vygo-Support-at-students-fingertips/',
-    'https://www.swinburne.edu.au/news/2023/11/swinburne-celebrates-60-years-of-wil/',
-    'https://www.swinburne.edu.au/news/2015/02/fast-track-your-construction-career--get-qualified/',
-    'https://www.swinburne.edu.au/news/2020/08/linda-legacy-shape-future/',
-    'https://www.swinburne.edu.au/news/2017/07/the-great-galactic-recession/',
-    'https://www.swinburne.edu.au/news/2020/08/student-designed-tiny-homes-win-big/',
-    'https://www.swinburne.edu.au/news/2015/09/unhappy-little-vegemites/',
-    'https://www.swinburne.edu.au/news/2016/06/swinburnes-dr-alan-duffy-concludes-alumni-astro-tour/',
-    'https://www.swinburne.edu.au/news/2019/12/analysis-pr-disasters-of-2019/',
-    'https://www.swinburne.edu.au/news/2015/02/dr-gerald-murphys-legacy-lives-on/',
-    'https://www.swinburne.edu.au/news/2016/07/vale-the-honourable-alan-goldberg-ao-qc/',
-    'https://www.swinburne.edu.au/news/2015/03/new-online-treatment-for-insomnia/',
-    'https://www.swinburne.edu.au/news/2014/10/australians-embrace-vpns/',
-    'https://www.swinburne.edu.au/news/2017/06/change-agents-amee-meredith-and-caterina-politi-on-reforming-one-punch-laws/',
-    'https://www.swinburne.edu.au/news/2015/04/debts-and-other-legacies/',
-    'https://www.swinburne.edu.au/news/2020/09/dfm-prototyping-kits-for-learning-at-home/',
-    'https://www.swinburne.edu.au/news/2022/09/Tyson-bull-master-of-physiotherapy/',
-    'https://www.swinburne.edu.au/news/2022/08/Swinburne-science-week-events-2022/',
-    'https://www.swinburne.edu.au/news/2017/11/swinburnes-alan-duffy-wins-2017-tall-poppy-award/',
-    'https://www.swinburne.edu.au/news/2020/11/barak-wonga-oration-2020-enduring-legacies/',
-    'https://www.swinburne.edu.au/news/2014/10/rocket-explodes-just-seconds-after-launch/',
-    'https://www.swinburne.edu.au/news/2024/03/Renowned-former-Australian-defence-leaders-make-up-Swinburnes-Defence-Advisory-Board/',
-    'https://www.swinburne.edu.au/news/2023/10/Swinburnes-AIR-Hub-achieves-hydrogen-flight/',
-    'https://www.swinburne.edu.au/news/2017/06/grand-challenges-for-smart-cities/',
-    'https://www.swinburne.edu.au/news/2020/11/barbara-dicker-oration-2020/',
-    'https://www.swinburne.edu.au/news/2015/10/merkels-high-stakes-stand/',
-    'https://www.swinburne.edu.au/news/2016/07/new-dimensions-in-data-storage/',
-    'https://www.swinburne.edu.au/news/2016/03/batman-v-superman/',
-    'https://www.swinburne.edu.au/news/2024/06/Unchartered-waters-Swinburne-explores-how-virtual-sailing-could-treat-major-depressive-disorder-in-world-first-trial/',
-    'https://www.swinburne.edu.au/news/2017/11/aunty-dots-life-in-film/',
-    'https://www.swinburne.edu.au/news/2014/09/will-the-next-coach-please-stand-up/',
-    'https://www.swinburne.edu.au/news/2020/08/uk-based-online-education-provider-42coursescom-to-back-advertising-capstone-challenge-2020/',
-    'https://www.swinburne.edu.au/news/2022/07/startup-program-unearths-new-talent/',
-    'https://www.swinburne.edu.au/news/2016/04/nica-announces-new-head-of-circus-studies/',
-    'https://www.swinburne.edu.au/news/2019/10/qa-garry-foran/',
-    'https://www.swinburne.edu.au/news/2022/02/swinburne-alum-noriko-wynn/',
-    'https://www.swinburne.edu.au/news/2014/06/un-doing-misappropriation/',
-    'https://www.swinburne.edu.au/news/2020/10/swinburne-world-kitchen-2020/',
-    'https://www.swinburne.edu.au/news/2014/06/swinburne-launches-its-first-industry-open-day/',
-    'https://www.swinburne.edu.au/news/2020/05/video-tips-with-dr-dan-golding/',
-    'https://www.swinburne.edu.au/news/2016/05/the-radical-dao-experiment/',
-    'https://www.swinburne.edu.au/news/2020/08/film-festival-in-lockdown/',
-    'https://www.swinburne.edu.au/news/2021/09/swinburne-alumni-impact-awards-2021/',
-    'https://www.swinburne.edu.au/news/2016/08/world-first-adobe-major-launches-students-careers/',
-    'https://www.swinburne.edu.au/news/2018/03/innovation-week-takes-over-swinburne/',
-    'https://www.swinburne.edu.au/news/2024/02/New-JWST-low-mass-galaxy-observations-could-help-settle-scientific-debate-about-early-universe-origins/',
-    'https://www.swinburne.edu.au/news/2016/07/separating-milk-fats-from-fiction/',
-    'https://www.swinburne.edu.au/news/2016/07/dr-alan-duffy-named-a-eureka-prize-finalist/',
-    'https://www.swinburne.edu.au/news/2016/08/the-rise-of-the-fitbit-kids-a-good-move-or-a-step-too-far/',
-    'https://www.swinburne.edu.au/news/2017/06/why-were-designed-to-move/',
-    'https://www.swinburne.edu.au/news/2015/01/cosmic-radio-burst-caught-red-handed/',
-    'https://www.swinburne.edu.au/news/2019/04/indulging-at-easter/',
-    'https://www.swinburne.edu.au/news/2014/05/unseating-the-chair/',
-    'https://www.swinburne.edu.au/news/2021/07/billionaires-space-race-could-help-our-planet/',
-    'https://www.swinburne.edu.au/news/2023/10/overseas-internships-open-new-doors/',
-    'https://www.swinburne.edu.au/news/2022/05/Swinburne_IRL_according_to_Fraser/',
-    'https://www.swinburne.edu.au/news/2015/10/autism-mooc-at-melbourne-knowledge-week/',
-    'https://www.swinburne.edu.au/news/2014/04/swinburne-debuts-new-3d-film---telescope/',
-    'https://www.swinburne.edu.au/news/2018/02/we-need-a-tertiary-master-plan/',
-    'https://www.swinburne.edu.au/news/2015/12/last-best-meteor-shower-of-2015/',
-    'https://www.swinburne.edu.au/news/2018/04/incubating-data-for-better-health-care/',
-    'https://www.swinburne.edu.au/news/2014/07/did-the-networks-kill-homicide/',
-    'https://www.swinburne.edu.au/news/2019/04/swinburnes-superhero-expert-dr-liam-burke-/',
-    'https://www.swinburne.edu.au/news/2019/02/student-health-and-diet-the-focus-of-new-documentary/',
-    'https://www.swinburne.edu.au/news/2019/03/starting-again-in-australia/',
-    'https://www.swinburne.edu.au/news/2019/04/giving-back-with-chocolate/',
-    'https://www.swinburne.edu.au/news/2024/08/gold-standard-for-curious-students/',
-    'https://www.swinburne.edu.au/news/2021/04/swinburnes-2020-23-elevate-rap-launched/',
-    'https://www.swinburne.edu.au/news/2020/10/beauty-industry-shutdown-covid-19/',
-    'https://www.swinburne.edu.au/news/2014/05/bringing-the-abc-back-home/',
-    'https://www.swinburne.edu.au/news/2018/02/eye-tracking-might-help-reduce-driver-drowsiness/',
-    'https://www.swinburne.edu.au/news/2015/10/fred-rose-communist-scientist-lover-spy/',
-    'https://www.swinburne.edu.au/news/2020/10/cutting-jobseeker-rental-stress/',
-    'https://www.swinburne.edu.au/news/2022/06/swinburne-irl-according-to-Josh/',
-    'https://www.swinburne.edu.au/news/2019/05/facilitating-the-30-minute-city/',
-    'https://www.swinburne.edu.au/news/2015/02/galactic-dinosaurs-not-extinct/',
-    'https://www.swinburne.edu.au/news/2017/03/girls-only-robocats-team-win-at-first-robotics-competition/',
-    'https://www.swinburne.edu.au/news/2014/04/nasas-ladee-crashes-dark-side-of-the-moon/',
-    'https://www.swinburne.edu.au/news/2014/06/unlawful-deliveries/',
-    'https://www.swinburne.edu.au/news/2019/09/closing-the-skills-awareness-gap/',
-    'https://www.swinburne.edu.au/news/2022/07/study-reveals-possible-cause-of-long-covid-brain-fog/',
-    'https://www.swinburne.edu.au/news/2019/06/swinburne-student-named-among-adobes-top-talent/',
-    'https://www.swinburne.edu.au/news/2014/12/mediterranean-diet-the-10-day-switch/',
-    'https://www.swinburne.edu.au/news/2024/05/award-winning-student-game-makes-waves-tackles-climate-change/',
-    'https://www.swinburne.edu.au/news/2022/08/International-student-afnan-siddique-WIL/',
-    'https://www.swinburne.edu.au/news/2014/05/new-innovation-in-food-safety-testing/',
-    'https://www.swinburne.edu.au/news/2014/07/theres-something-about-victoria/',
-    'https://www.swinburne.edu.au/news/2022/07/women-paid-new-cloud-technology-diploma/',
-    'https://www.swinburne.edu.au/news/2022/02/Give-me-some-space-tradies/',
-    'https://www.swinburne.edu.au/news/2016/02/dancing-the-donation-tango/',
-    'https://www.swinburne.edu.au/news/2016/01/swinburnes-atar-score-for-law-soars/',
-    'https://www.swinburne.edu.au/news/2014/04/more-seniorpreneurs-please/',
-    'https://www.swinburne.edu.au/news/2015/07/norma-redpaths-final-sculpture-calls-swinburne-home/',
-    'https://www.swinburne.edu.au/news/2018/06/victoria-ideal-home-for-new-space-agency/',
-    'https://www.swinburne.edu.au/news/2023/06/professor-geoff-brooks-wins-bessemer-gold-medal/',
-    'https://www.swinburne.edu.au/news/2023/10/historical-armour-inspires-contemporary-architecture/',
-    'https://www.swinburne.edu.au/news/2014/12/central-european-business-forum-2014/',
-    'https://www.swinburne.edu.au/news/2016/06/setting-standards-in-concrete/',
-    'https://www.swinburne.edu.au/news/2015/03/community-attitudes-to-stalking/',
-    'https://www.swinburne.edu.au/news/2020/06/swinburne-climbs-in-qs-rankings/',
-    'https://www.swinburne.edu.au/news/2018/01/trust-me-im-an-expert-risk/',
-    'https://www.swinburne.edu.au/news/2022/04/helping-young-men-accept-rejection-online/',
-    'https://www.swinburne.edu.au/news/2016/04/something-new-under-a-dead-sun/',
-    'https://www.swinburne.edu.au/news/2017/06/architecture-makes-its-way-to-swinburne/',
-    'https://www.swinburne.edu.au/news/2020/08/staff-profile-dan-golding/',
-    'https://www.swinburne.edu.au/news/2019/03/what-5g-means-for-our-health/',
-    'https://www.swinburne.edu.au/news/2019/06/croydon-unveils-new-heart-of-campus/',
-    'https://www.swinburne.edu.au/news/2022/07/stem-hub-for-girls-receives-funding-boost/',
-    'https://www.swinburne.edu.au/news/2020/06/swinburne-early-entry-program-supports-disrupted-year-12-students/',
-    'https://www.swinburne.edu.au/news/2016/03/building-social-harmony-through-books/',
-    'https://www.swinburne.edu.au/news/2017/02/swinburne-tipping-computer-backs-womens-afl/',
-    'https://www.swinburne.edu.au/news/2017/09/sport-science-comes-to-swinburne/',
-    'https://www.swinburne.edu.au/news/2019/03/vc-professor-linda-kristjanson-ao-to-lead-until-2021/',
-    'https://www.swinburne.edu.au/news/2015/07/fossil-star-clusters-reveal-their-age/',
-    'https://www.swinburne.edu.au/news/2017/05/swinburne-alumnus-releases-new-childrens-book/',
-    'https://www.swinburne.edu.au/news/2017/08/could-gaming-change-the-way-students-learn/',
-    'https://www.swinburne.edu.au/news/2015/04/no-more-science-fiction-3d-holographic-images/',
-    'https://www.swinburne.edu.au/news/2017/10/surface-explosion-may-trigger-stellar-death/',
-    'https://www.swinburne.edu.au/news/2021/02/launching-students-ideas-into-space/',
-    'https://www.swinburne.edu.au/news/2014/11/new-degrees-for-aspiring-teachers/',
-    'https://www.swinburne.edu.au/news/2019/01/swinburne-alumna-designs-final-lunar-new-year-stamps/',
-    'https://www.swinburne.edu.au/news/2020/06/us-burns-but-we-just-turn-away/',
-    'https://www.swinburne.edu.au/news/2014/07/and-the-rest-say-no/',
-    'https://www.swinburne.edu.au/news/2015/08/book-review-of-chinas-political-model/',
-    'https://www.swinburne.edu.au/news/2014/04/black-hole-makes-string-of-pearls-clusters/',
-    'https://www.swinburne.edu.au/news/2014/09/dementia-care-meets-virtual-reality-1/',
-    'https://www.swinburne.edu.au/news/2015/01/black-holes-follow-the-rules/',
-    'https://www.swinburne.edu.au/news/2021/08/Is-space-infinite-we-asked-5-experts/',
-    'https://www.swinburne.edu.au/news/2015/07/sports-betting-becoming-normal-may-lead-to-risky-gambling/',
-    'https://www.swinburne.edu.au/news/2014/03/swinburne-partners-with-croydon-mens-shed/',
-    'https://www.swinburne.edu.au/news/2023/04/australias-first-adobe-creative-campus-goes-pro/',
-    'https://www.swinburne.edu.au/news/2015/07/fakers-makers-and-takers/',
-    'https://www.swinburne.edu.au/news/2017/01/lunar-new-year-stamps-designed-by-graduate/',
-    'https://www.swinburne.edu.au/news/2015/01/un-doing-development-bloat/',
-    'https://www.swinburne.edu.au/news/2016/02/graduate-designs-stamps-to-celebrate-lunar-new-year/',
-    'https://www.swinburne.edu.au/news/2020/07/gender-equity-covid-19/',
-    'https://www.swinburne.edu.au/news/2014/11/swinburne-astronomy-alumnus-named-nsw-young-tall-poppy/',
-    'https://www.swinburne.edu.au/news/2022/04/Run-the-tan-physically-empty-mindful/',
-    'https://www.swinburne.edu.au/news/2023/08/Introducing-Swinburnes-next-gen-Campus-Heart/',
-    'https://www.swinburne.edu.au/news/2014/07/germany-on-song/',
-    'https://www.swinburne.edu.au/news/2018/03/unis-should-develop-atar-alternatives/',
-    'https://www.swinburne.edu.au/news/2019/03/end-victorian-era-of-court-secrecy/',
-    'https://www.swinburne.edu.au/news/2015/12/new-colombo-plan-scholarship-sends-austin-wyatt-to-korea/',
-    'https://www.swinburne.edu.au/news/2019/12/2019-vice-chancellors-award-winners/',
-    'https://www.swinburne.edu.au/news/2015/02/swinburne-offers-free-course-on-autism/',
-    'https://www.swinburne.edu.au/news/2017/04/outreachwhy-reach-out/',
-    'https://www.swinburne.edu.au/news/2018/03/former-chief-justice-marilyn-warren-urges-courage-under-fire/',
-    'https://www.swinburne.edu.au/news/2018/10/urban-policy-and-climate-change/',
-    'https://www.swinburne.edu.au/news/2014/12/forget-the-number-follow-your-passion/',
-    'https://www.swinburne.edu.au/news/2016/04/nano-control-of-light-pioneers-new-paths/',
-    'https://www.swinburne.edu.au/news/2016/07/hubble-explores-the-final-frontier/',
-    'https://www.swinburne.edu.au/news/2017/06/swinburne-wins-two-future-fellowships/',
-    'https://www.swinburne.edu.au/news/2016/06/swinburne-to-host-international-ocd-forum/',
-    'https://www.swinburne.edu.au/news/2021/04/swinburne-responds-to-data-breach/',
-    'https://www.swinburne.edu.au/news/2016/03/reducing-indigenous-prison-rates/',
-    'https://www.swinburne.edu.au/news/2022/12/Student-climate-change-podcast-goes-global/',
-    'https://www.swinburne.edu.au/news/2014/02/sitting-phat-re-designing-obesity-and-chairs/',
-    'https://www.swinburne.edu.au/news/2020/09/swinburne-researchers-win-global-ig-nobel-award/',
-    'https://www.swinburne.edu.au/news/2019/05/smart-citizens-and-smart-cities/',
-    'https://www.swinburne.edu.au/news/2020/11/swinburnes-daniel-huppatz-on-design-the-key-concepts/',
-    'https://www.swinburne.edu.au/news/2022/10/Swinburne-2022-alumni-impact-award-winners/',
-    'https://www.swinburne.edu.au/news/2017/03/professor-sally-mcarthur-to-lead-research-team-at-csiro/',
-    'https://www.swinburne.edu.au/news/2017/07/the-future-of-smart-cities/',
-    'https://www.swinburne.edu.au/news/2015/02/generational-change-in-timor-leste/',
-    'https://www.swinburne.edu.au/news/2016/06/happiness-attracts-tourists/',
-    'https://www.swinburne.edu.au/news/2022/09/giving-australian-workplaces-the-edge/',
-    'https://www.swinburne.edu.au/news/2024/05/swinburne-leads-world-first-medical-cannabis-driving-trial--/',
-    'https://www.swinburne.edu.au/news/2017/11/swinburne-students-made-top-20-in-james-dyson-award/',
-    'https://www.swinburne.edu.au/news/2016/09/swinburne-students-secure-new-colombo-plan-grants/',
-    'https://www.swinburne.edu.au/news/2015/08/peter-mares-wins-migrant-and-settlement-award/',
-    'https://www.swinburne.edu.au/news/2022/09/intern-helps-bring-lasers-to-labs/',
-    'https://www.swinburne.edu.au/news/2018/08/professor-karl-glazebrook-named-arc-laureate-fellow/',
-    'https://www.swinburne.edu.au/news/2020/11/victoria-fellowship-for-swinburnes-dr-ali-yavari/',
-    'https://www.swinburne.edu.au/news/2014/08/professor-dan-hunter-appointed-dean-of-swinburne-law-school/',
-    'https://www.swinburne.edu.au/news/2017/02/baby-galaxies-light-up-the-universe/',
-    'https://www.swinburne.edu.au/news/2017/07/swinburne-joins-open-house-melbourne/',
-    'https://www.swinburne.edu.au/news/2015/02/chief-justice-to-launch-swinburne-law-school/',
-    'https://www.swinburne.edu.au/news/2023/06/sustainable-design-turns-waste-into-wonder/',
-    'https://www.swinburne.edu.au/news/2019/05/swinburne-alumnus-works-his-magic/',
-    'https://www.swinburne.edu.au/news/2021/11/Swinburne-alum-aria-nomination-2021/',
-    'https://www.swinburne.edu.au/news/2014/04/re-designing-food-systems--1/',
-    'https://www.swinburne.edu.au/news/2022/07/swinburne-continues-global-climb/',
-    'https://www.swinburne.edu.au/news/2016/03/swinburne-teams-up-with-croydon-football-club/',
-    'https://www.swinburne.edu.au/news/2018/08/swinburne-receives-funding-for-aged-care-mental-health-trial/',
-    'https://www.swinburne.edu.au/news/2019/10/four-day-working-week-movement-gathers-momentum--/',
-    'https://www.swinburne.edu.au/news/2021/12/swinburne-sarawak-reagan-entigu-linton-covid-test-lab/',
-    'https://www.swinburne.edu.au/news/2022/06/swinburne-climbs-25-places-to-top-300-globally/',
-    'https://www.swinburne.edu.au/news/2016/07/book-launch-the-untold-story-of-lemnos/',
-    'https://www.swinburne.edu.au/news/2020/12/top-five-social-media-moments-2020/',
-    'https://www.swinburne.edu.au/news/2022/04/Swinburne-climbs-in-qs-subject-rankings/',
-    'https://www.swinburne.edu.au/news/2014/09/turning-winery-waste-into-biofuels/',
-    'https://www.swinburne.edu.au/news/2019/07/slapping-down-myths-about-online-learning/',
-    'https://www.swinburne.edu.au/news/2021/09/tall-poppies-growing-to-orbit/',
-    'https://www.swinburne.edu.au/news/2018/03/swinburne-technology-helps-develop-world-first-hearing-aid/',
-    'https://www.swinburne.edu.au/news/2018/07/swinburne-success-in-new-colombo-plan-program/',
-    'https://www.swinburne.edu.au/news/2014/11/celebrating-gender-equality/',
-    'https://www.swinburne.edu.au/news/2014/09/loan-limits-only-way-to-stop-gouging/',
-    'https://www.swinburne.edu.au/news/2016/04/start-up-bondi-labs-to-join-swinburne/',
-    'https://www.swinburne.edu.au/news/2018/08/professor-of-urban-design-marcus-white-shares-raia-accolades/',
-    'https://www.swinburne.edu.au/news/2019/06/advertising-tracking-is-broken/',
-    'https://www.swinburne.edu.au/news/2014/08/swinburne-maths-support-centre-finds-new-home-in-amdc/',
-    'https://www.swinburne.edu.au/news/2019/10/good-universities-guide-2020-gives-swinburne-five-stars/',
-    'https://www.swinburne.edu.au/news/2022/08/swinburne-responds-to-false-nteu-claims/',
-    'https://www.swinburne.edu.au/news/2014/11/its-in-your-hands-victorians/',
-    'https://www.swinburne.edu.au/news/2020/03/swinburne-and-aalto-university-joint-phd/',
-    'https://www.swinburne.edu.au/news/2014/04/swinburne-supports-keep-it-clever-campaign/',
-    'https://www.swinburne.edu.au/news/2021/07/expert-tips-for-your-winter-gardening/',
-    'https://www.swinburne.edu.au/news/2016/10/recalibrating-views-on-body-image-illness/',
-    'https://www.swinburne.edu.au/news/2021/06/do-aliens-exist-we-asked-five-experts/',
-    'https://www.swinburne.edu.au/news/2023/02/distant-galaxy-mirrors-the-early-milky-way/',
-    'https://www.swinburne.edu.au/news/2024/04/NASAs-JWST-probes-an-extreme-starburst-galaxy/',
-    'https://www.swinburne.edu.au/news/2020/03/release-super-to-boost-economy/',
-    'https://www.swinburne.edu.au/news/2022/12/Professor-Brian-Cox-honoured-at-Swinburne/',
-    'https://www.swinburne.edu.au/news/2017/10/engaging-older-adults-through-touch-tablets/',
-    'https://www.swinburne.edu.au/news/2015/11/the-deadly-truth-about-loneliness/',
-    'https://www.swinburne.edu.au/news/2017/11/ozgrav-rides-gravitational-waves-to-launch/',
-    'https://www.swinburne.edu.au/news/2021/07/future-of-work-lab-drives-tech-innovation/',
-    'https://www.swinburne.edu.au/news/2017/01/law-students-embark-on-myanmar-study-tour/',
-    'https://www.swinburne.edu.au/news/2015/06/star-professor-awarded-fellowship/',
-    'https://www.swinburne.edu.au/news/2019/07/opinion-why-we-should-deport-criminals/',
-    'https://www.swinburne.edu.au/news/2014/11/the-psychology-of-humour/',
-    'https://www.swinburne.edu.au/news/2020/02/transparency-can-work-both-ways/',
-    'https://www.swinburne.edu.au/news/2015/10/hair-samples-reveal-effects-of-ecstasy-use/',
-    'https://www.swinburne.edu.au/news/2014/09/huge-solar-storms-to-hit-earth-this-weekend/',
-    'https://www.swinburne.edu.au/news/2018/04/former-myer-ceo-guides-future-of-retail-experience/',
-    'https://www.swinburne.edu.au/news/2020/08/swinburne-unveils-swintopia/',
-    'https://www.swinburne.edu.au/news/2014/11/swinburne-research-shows-lemon-balm-improves-mood/',
-    'https://www.swinburne.edu.au/news/2018/04/new-electoral-law-could-still-hobble-charities/',
-    'https://www.swinburne.edu.au/news/2020/10/gatekeepers-should-have-picked-up-australia-post-asic-sooner/',
-    'https://www.swinburne.edu.au/news/2016/06/mathematics-support-tutorial-hits-110000-youtube-views/',
-    'https://www.swinburne.edu.au/news/2017/11/no-we-arent-running-out-of-new-ideas/',
-    'https://www.swinburne.edu.au/news/2014/09/toilet-phobia-study-begins-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2014/09/un-doing-disrespect-women--design/',
-    'https://www.swinburne.edu.au/news/2016/10/who-stole-all-the-stars/',
-    'https://www.swinburne.edu.au/news/2021/06/tax-time-tips-in-a-covid-19-year/',
-    'https://www.swinburne.edu.au/news/2015/11/swinburne-awarded-33-million-arc-funding-boost/',
-    'https://www.swinburne.edu.au/news/2020/03/prestigious-qs-ranking-recognises-swinburne-in-12-subject-areas/',
-    'https://www.swinburne.edu.au/news/2016/08/sustainable-solutions-for-wine-waste/',
-    'https://www.swinburne.edu.au/news/2022/12/celebrating-our-values-in-action/',
-    'https://www.swinburne.edu.au/news/2015/04/new-program-encourages-women-to-study-trades/',
-    'https://www.swinburne.edu.au/news/2017/09/gravitational-waves-arrive-in-europe/',
-    'https://www.swinburne.edu.au/news/2015/08/swinburne-research-finds-energy-costs-hit-low-income-households-hardest/',
-    'https://www.swinburne.edu.au/news/2017/05/migrants-can-no-longer-afford-gateway-suburbs/',
-    'https://www.swinburne.edu.au/news/2015/08/turning-food-waste-into-food-nourishment-onsite-composting-study/',
-    'https://www.swinburne.edu.au/news/2020/09/swinburne-upskills-aqr-group-in-partnership/',
-    'https://www.swinburne.edu.au/news/2016/09/swinburne-teams-up-with-richmond-football-club/',
-    'https://www.swinburne.edu.au/news/2021/09/ellie-mckenzies-advice-for-kicking-life-goals/',
-    'https://www.swinburne.edu.au/news/2014/07/swinburne-future-fellows-awarded-25-million/',
-    'https://www.swinburne.edu.au/news/2015/04/the-real-leadership-challenge/',
-    'https://www.swinburne.edu.au/news/2018/04/swinburne-stem-cell-technology-aids-3d-printed-cartilage-repair/',
-    'https://www.swinburne.edu.au/news/2020/10/tiktok-teachers-go-viral-in-these-COVID-19-times/',
-    'https://www.swinburne.edu.au/news/2016/05/afl-vilification-policy-whats-working-whats-not/',
-    'https://www.swinburne.edu.au/news/2021/06/swinburne-rises-in-arwu-global-subject-rankings/',
-    'https://www.swinburne.edu.au/news/2015/09/australias-strong-acceptance-of-gay-men/',
-    'https://www.swinburne.edu.au/news/2022/05/swinburne-to-co-host-student-run-election-night-radio-broadcast/',
-    'https://www.swinburne.edu.au/news/2016/03/brian-greene-yes-but-string-theory-no/',
-    'https://www.swinburne.edu.au/news/2022/12/alum-success-in-communication-design/',
-    'https://www.swinburne.edu.au/news/2021/07/swintopia-is-back-discover-our-virtual-world/',
-    'https://www.swinburne.edu.au/news/2019/07/swinburne-buys-invicta-house-in-melbourne-cbd/',
-    'https://www.swinburne.edu.au/news/2020/01/celebrating-lunar-new-year-around-the-world/',
-    'https://www.swinburne.edu.au/news/2016/03/dr-alan-duffy-to-host-evening-with-brian-greene/',
-    'https://www.swinburne.edu.au/news/2014/02/free-health-advice-at-headspace-hawthorn/',
-    'https://www.swinburne.edu.au/news/2016/08/forged-by-the-sun/',
-    'https://www.swinburne.edu.au/news/2019/06/tackling-business-waste-with-aspire/',
-    'https://www.swinburne.edu.au/news/2021/10/can-butterfly-wings-help-detect-COVID-19-faster/',
-    'https://www.swinburne.edu.au/news/2022/10/early-career-researchers-set-to-impress/',
-    'https://www.swinburne.edu.au/news/2023/01/Youre-about-to-see-a-growing-trend-of-laptop-workers-in-cafes-new-research-reveals-why/',
-    'https://www.swinburne.edu.au/news/2019/04/swinburne-researcher-wins-saleem-shah-early-career-award/',
-    'https://www.swinburne.edu.au/news/2016/03/angela-merkels-line-in-the-sand/',
-    'https://www.swinburne.edu.au/news/2019/06/swinburne-expands-reach-in-malaysia/',
-    'https://www.swinburne.edu.au/news/2020/01/setting-language-goals-for-womens-sport/',
-    'https://www.swinburne.edu.au/news/2023/08/celebrate-pride-week-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2015/07/a-mobile-app-to-ease-loneliness/',
-    'https://www.swinburne.edu.au/news/2016/05/swinburne-law-school-to-re-launch-legal-history/',
-    'https://www.swinburne.edu.au/news/2019/11/lipstick-queen-poppy-kings-top-tips-for-entrepreneurs/',
-    'https://www.swinburne.edu.au/news/2016/03/super-tuesday-sees-trump-and-clinton-triumph/',
-    'https://www.swinburne.edu.au/news/2017/09/struggling-students-smash-the-avo-myth/',
-    'https://www.swinburne.edu.au/news/2019/05/graduating-straight-into-deloitte/',
-    'https://www.swinburne.edu.au/news/2016/05/swinburnes-living-lab-awarded-membership/',
-    'https://www.swinburne.edu.au/news/2014/01/swinburne-graduate-creates-app-to-help-students-get-organised--/',
-    'https://www.swinburne.edu.au/news/2016/05/swinburne-helps-job-seekers-shop-for-skills/',
-    'https://www.swinburne.edu.au/news/2020/08/swinburne-win-in-b-and-t-30-under-30-awards/',
-    'https://www.swinburne.edu.au/news/2022/04/inspiring-pasifika-youth-to-next-gen-careers/',
-    'https://www.swinburne.edu.au/news/2015/08/smart-dressings-speed-healing-of-chronic-wounds/',
-    'https://www.swinburne.edu.au/news/2015/11/senses-reawakened-at-out--about-fun-day/',
-    'https://www.swinburne.edu.au/news/2014/05/australias-best-and-worst-mortgage-lenders/',
-    'https://www.swinburne.edu.au/news/2015/12/the-joy-of-experiential-giving/',
-    'https://www.swinburne.edu.au/news/2016/05/apple-pay-no-sure-thing-in-mobile-payments-race/',
-    'https://www.swinburne.edu.au/news/2014/08/lets-be-sure-education-changes-take-off/',
-    'https://www.swinburne.edu.au/news/2017/05/change-agents-ending-the-gay-panic-defence/',
-    'https://www.swinburne.edu.au/news/2021/05/dr-douglas-proctor-appointed-pro-vice-chancellor-global-engagement/',
-    'https://www.swinburne.edu.au/news/2015/07/swinburne-receives-13m-from-tafe-back-to-work-fund/',
-    'https://www.swinburne.edu.au/news/2020/02/swinburne-appoints-new-cmo-to-lead-brand-vision/',
-    'https://www.swinburne.edu.au/news/2014/03/katie-wykes-swinburne-student-and-cfa-volunteer/',
-    'https://www.swinburne.edu.au/news/2015/04/the-numbers-game/',
-    'https://www.swinburne.edu.au/news/2023/02/swinburne-alums-hollywood-screen-success/',
-    'https://www.swinburne.edu.au/news/2021/02/how-our-students-celebrate-lunar-new-year/',
-    'https://www.swinburne.edu.au/news/2016/04/swinburne-ranks-as-a-top-100-university-under-50-years-old/',
-    'https://www.swinburne.edu.au/news/2016/10/donald-trump-makes-disparaging-remarks-about-women/',
-    'https://www.swinburne.edu.au/news/2020/10/creating-a-safer-online-community/',
-    'https://www.swinburne.edu.au/news/2016/05/professor-alan-kin-tak-lau-elected-to-european-think-tank/',
-    'https://www.swinburne.edu.au/news/2018/11/swinburne-design-takes-centre-stage-in-hong-kong/',
-    'https://www.swinburne.edu.au/news/2021/12/Swinburne-appoints-two-new-academic-leaders/',
-    'https://www.swinburne.edu.au/news/2015/10/watching-water-helps-with-climate-change/',
-    'https://www.swinburne.edu.au/news/2017/12/new-pilot-pathway-program-takes-off-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2014/05/cyber-security-student-challenge/',
-    'https://www.swinburne.edu.au/news/2018/01/australia-day-list-honours-swinburne-smart-city-leaders/',
-    'https://www.swinburne.edu.au/news/2022/06/swinburne-launches-3m-space-tech-hub-with-ey/',
-    'https://www.swinburne.edu.au/news/2014/03/australias-first-solar-electric-hybrid-sports-car/',
-    'https://www.swinburne.edu.au/news/2015/05/tv-2025-rethinking-small-screen-media-in-australia/',
-    'https://www.swinburne.edu.au/news/2018/05/modern-asian-design-by-swinburne-author-daniel-huppatz/',
-    'https://www.swinburne.edu.au/news/2019/05/origami-inspired-materials-could-toughen-up-trains/',
-    'https://www.swinburne.edu.au/news/2019/12/top-five-moments-in-australian-sport-2019/',
-    'https://www.swinburne.edu.au/news/2022/09/Swinburne-alumni-impact-award-finalists-2022/',
-    'https://www.swinburne.edu.au/news/2019/12/swinburne-student-wins-node-fest-award-for-motion-design/',
-    'https://www.swinburne.edu.au/news/2021/11/swinburne-predicts-traffic-jams-60-minutes-before-they-happen/',
-    'https://www.swinburne.edu.au/news/2020/01/swinburne-experiences-give-law-graduate-a-career-kick-start/',
-    'https://www.swinburne.edu.au/news/2022/08/social-science-seek-comes-to-swinburne/',
-    'https://www.swinburne.edu.au/news/2022/08/new-centre-to-drive-next-gen-architecture/',
-    'https://www.swinburne.edu.au/news/2017/12/swinburne-students-win-international-student-game-award-in-la/',
-    'https://www.swinburne.edu.au/news/2016/09/swinburne-tipping-computer-predicts-sydney-swans-will-win-grand-final/',
-    'https://www.swinburne.edu.au/news/2018/07/heres-how-we-teach-young-drivers-truck-safety/',
-    'https://www.swinburne.edu.au/news/2022/08/funding-boost-to-prevent-family-violence/',
-    'https://www.swinburne.edu.au/news/2015/08/hospitality-for-asylum-seekers-think-again/',
-    'https://www.swinburne.edu.au/news/2014/02/new-zealands-bondi-bludger-and-other-australian-myths/',
-    'https://www.swinburne.edu.au/news/2014/10/swinburnes-young-mums-program-calls-for-support/',
-    'https://www.swinburne.edu.au/news/2018/09/its-time-to-tax-the-family-home/',
-    'https://www.swinburne.edu.au/news/2016/10/who-won-todays-vice-presidential-debate-does-it-matter/',
-    'https://www.swinburne.edu.au/news/2020/11/new-trans-pacific-partnership-in-thermal-spray/',
-    'https://www.swinburne.edu.au/news/2018/08/making-community-connections/',
-    'https://www.swinburne.edu.au/news/2014/07/swinburne-student-among-victims-of-mh17-tragedy/',
-    'https://www.swinburne.edu.au/news/2017/05/swinburne-tipping-computer-remembers-long-time-rival-lou-richards/',
-    'https://www.swinburne.edu.au/news/2018/05/swinburne-students-attend-their-first-afl-match/',
-    'https://www.swinburne.edu.au/news/2018/12/swinburne-secures-18-million-in-nhmrc-funding/',
-    'https://www.swinburne.edu.au/news/2014/06/photo-imaging-students-photograph-for-sass--bide/',
-    'https://www.swinburne.edu.au/news/2015/03/swinburne-multimedia-alumnus-lands-job-at-amazon/',
-    'https://www.swinburne.edu.au/news/2014/05/india-design-futures-of-everyday-pluralism/',
-    'https://www.swinburne.edu.au/news/2016/11/advances-in-holograph-technology/',
-    'https://www.swinburne.edu.au/news/2016/07/swinburne-recognises-naidoc-award-winner/',
-    'https://www.swinburne.edu.au/news/2018/05/swinburne-takes-action-to-correct-payroll-issue/',
-    'https://www.swinburne.edu.au/news/2019/08/opinion-justice-the-new-barbie-stopper/',
-    'https://www.swinburne.edu.au/news/2022/05/chief-scientist-celebrates-women-in-maths/',
-    'https://www.swinburne.edu.au/news/2015/04/swinburne-computer-kicks-off-its-predictions/',
-    'https://www.swinburne.edu.au/news/2021/10/swinburne-alums-luxury-robe-business-gets-global-attention/',
-    'https://www.swinburne.edu.au/news/2023/06/swinburne-rises-in-qs-world-university-rankings/',
-    'https://www.swinburne.edu.au/news/2024/09/Swinburne-students-win-top-award-in-international-film-contest/',
-    'https://www.swinburne.edu.au/news/2014/01/leading-swinburne-photonics-scientist-min-gu-awarded-ian-wark-medal/',
-    'https://www.swinburne.edu.au/news/2014/10/melbourne-research-into-pilot-behaviour-leading-to-safer-skies/',
-    'https://www.swinburne.edu.au/news/2015/03/new-board-chair-for-swinburne-leadership-institute/',
-    'https://www.swinburne.edu.au/news/2014/04/swinburne-students-showcase-their-budding-talent-at-flower-show/',
-    'https://www.swinburne.edu.au/news/2016/10/swinburne-lecturers-release-book-about-gender-in-gaming/',
-    'https://www.swinburne.edu.au/news/2018/10/eyes-on-the-sky/',
-    'https://www.swinburne.edu.au/news/2016/12/how-blockchain-will-transform-our-cities/',
-    'https://www.swinburne.edu.au/news/2023/02/5m-green-energy-research-hub-coming-to-swinburne/',
-    'https://www.swinburne.edu.au/news/2023/09/how-to-respond-when-your-child-swears/',
-    'https://www.swinburne.edu.au/news/2024/04/Swinburne-Rock-Muncher-takes-part-in-Australian-Rover-Challenge/',
-    'https://www.swinburne.edu.au/news/2019/11/swinburne-students-use-design-to-help-prevent-violence-against-women/',
-    'https://www.swinburne.edu.au/news/2020/02/human-centred-design-for-future-mobility/',
-    'https://www.swinburne.edu.au/news/2018/09/the-new-efficient-payments-system-means-more-efficient-fraud/',
-    'https://www.swinburne.edu.au/news/2022/09/swinburne-students-are-co-designing-the-next-gen-student-experience/',
-    'https://www.swinburne.edu.au/news/2023/04/pasifika-youth-kick-off-creative-careers-with-nrl/',
-    'https://www.swinburne.edu.au/news/2019/03/bushfire-proof-swinburne-designed-skylight-wins-good-design-award/',
-    'https://www.swinburne.edu.au/news/2023/04/reducing-depression-in-home-based-aged-care/',
-    'https://www.swinburne.edu.au/news/2020/12/top-five-film-and-tv-highlights-2020/',
-    'https://www.swinburne.edu.au/news/2016/07/vice-chancellor-to-chair-victorian-cancer-centre-board/',
-    'https://www.swinburne.edu.au/news/2022/10/computer-science-winner-in-subject-rankings/',
-    'https://www.swinburne.edu.au/news/2018/09/mosquito-zapper-recognised-by-james-dyson-awards/',
-    'https://www.swinburne.edu.au/news/2017/05/new-institute-pursues-innovation-in-health/',
-    'https://www.swinburne.edu.au/news/2019/12/swinburne-based-startup-scriibi-and-students-help-each-other-grow/',
-    'https://www.swinburne.edu.au/news/2017/10/alan-duffy-to-join-australias-science-channel/',
-    'https://www.swinburne.edu.au/news/2019/06/swinburne-improves-position-in-qs-rankings-/',
-    'https://www.swinburne.edu.au/news/2019/08/new-research-shows-how-hangovers-reduce-brain-function/',
-    'https://www.swinburne.edu.au/news/2014/06/explore-space-at-swinburne-these-school-holidays/',
-    'https://www.swinburne.edu.au/news/2018/03/swinburne-welcomes-hong-kong-design-delegates/',
-    'https://www.swinburne.edu.au/news/2022/04/sarawak-alum-and-tech-entrepreneur-develops-covid-app/',
-    'https://www.swinburne.edu.au/news/2024/05/swinburne-soars-into-top-25-in-young-university-rankings/',
-    'https://www.swinburne.edu.au/news/2015/07/celebrate-indigenous-culture-on-naidoc-week/',
-    'https://www.swinburne.edu.au/news/2017/03/new-ownership-model-for-online-education-services/',
-    'https://www.swinburne.edu.au/news/2017/09/gay-rights-pioneer-to-lead-swinburne-pride-day-march/',
-    'https://www.swinburne.edu.au/news/2021/03/swinburne-opens-new-location-at-ho-chi-minh-city/',
-    'https://www.swinburne.edu.au/news/2017/11/swinburne-installs-cutting-edge-hp-3d-printing-system/',
-    'https://www.swinburne.edu.au/news/2019/08/revamped-library-latelab-opens-at-hawthorn-campus/',
-    'https://www.swinburne.edu.au/news/2018/10/swinburne-partners-with-iit-hyderabad/',
-    'https://www.swinburne.edu.au/news/2015/09/swinburne-part-of-giving-australia-project/',
-    'https://www.swinburne.edu.au/news/2022/12/what-is-quantum-technology/',
-    'https://www.swinburne.edu.au/news/2015/11/the-politics-of-industry-policy/',
-    'https://www.swinburne.edu.au/news/2020/11/curious-kids-could-dinosaurs-evolve-back-into-existence/',
-    'https://www.swinburne.edu.au/news/2021/03/new-research-into-soil-used-for-building/',
-    'https://www.swinburne.edu.au/news/2022/06/swinburne-earns-bronze-pride-in-sport-award/',
-    'https://www.swinburne.edu.au/news/2021/06/new-digital-tool-to-improve-visitors-museum-experience/',
-    'https://www.swinburne.edu.au/news/2022/02/swinburne-confirms-top-50-spot-for-young-universities/',
-    'https://www.swinburne.edu.au/news/2022/05/shaping-sound-in-architectural-spaces/',
-    'https://www.swinburne.edu.au/news/2017/04/david-singleton-to-chair-smart-cities-research-institute-board/',
-    'https://www.swinburne.edu.au/news/2017/07/swinburne-to-host-52nd-annual-camberwell-art-show/',
-    'https://www.swinburne.edu.au/news/2016/04/making-waves-in-global-forecasting/',
-    'https://www.swinburne.edu.au/news/2016/12/rental-housing-policies-trap-children-in-poverty/',
-    'https://www.swinburne.edu.au/news/2017/12/swinburne-hosts-inaugural-presidents-forum/',
-    'https://www.swinburne.edu.au/news/2020/06/commemorating-national-sorry-day-together/',
-    'https://www.swinburne.edu.au/news/2015/03/its-too-late-to-debate-metadata/',
-    'https://www.swinburne.edu.au/news/2019/10/helen-kapalos-named-vcs-fellow-for-multicultural-engagement/',
-    'https://www.swinburne.edu.au/news/2019/11/swinburne-begins-search-for-next-vice-chancellor/',
-    'https://www.swinburne.edu.au/news/2021/01/top-tips-to-build-your-mental-resilience/',
-    'https://www.swinburne.edu.au/news/2016/06/swinburnes-civil-engineering-research-ranks-as-world-class/',
-    'https://www.swinburne.edu.au/news/2019/02/community-bank-at-swinburne-puts-people-first/',
-    'https://www.swinburne.edu.au/news/2018/03/biometric-backpacks-record-human-health-at-sugar/',
-    'https://www.swinburne.edu.au/news/2020/02/bushfire-research-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2020/09/with-democracy-paused-big-brother-runs-victoria/',
-    'https://www.swinburne.edu.au/news/2021/06/professor-bronwyn-fox-appointed-csiro-chief-scientist/',
-    'https://www.swinburne.edu.au/news/2014/03/will-more-business-like-social-enterprises-improve-care/',
-    'https://www.swinburne.edu.au/news/2024/03/Swinburne-accelerates-in-demand-tech-research-in-Southeast-Asia/',
-    'https://www.swinburne.edu.au/news/2021/01/swinburne-adopts-freedom-of-speech-model-code/',
-    'https://www.swinburne.edu.au/news/2022/09/national-day-of-mourning/',
-    'https://www.swinburne.edu.au/news/2019/03/ultrathin-graphene-film-offers-new-concept-for-solar-energy/',
-    'https://www.swinburne.edu.au/news/2021/06/levelling-up-student-spaces-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2022/08/dont-blame-women-for-low-libido/',
-    'https://www.swinburne.edu.au/news/2014/09/heavy-haul-rail-study-earns-swinburne-researcher-technical-prize/',
-    'https://www.swinburne.edu.au/news/2017/10/swinburne-student-wins-competition-with-touching-anti-gambling-ad/',
-    'https://www.swinburne.edu.au/news/2019/09/swinburne-student-puts-learning-into-practice-at-bendigo-bank/',
-    'https://www.swinburne.edu.au/news/2014/02/mooc-to-seize-the-day-and-transform-learning/',
-    'https://www.swinburne.edu.au/news/2014/11/swinburne-welcomes-funding-boost-from-arc-grants/',
-    'https://www.swinburne.edu.au/news/2016/03/the-health-benefits-of-dark-chocolate/',
-    'https://www.swinburne.edu.au/news/2017/03/shaping-swinburnes-future-2025-vision-and-strategy/',
-    'https://www.swinburne.edu.au/news/2017/04/the-health-benefits-of-dark-chocolate/',
-    'https://www.swinburne.edu.au/news/2018/11/recycling-its-complicated/',
-    'https://www.swinburne.edu.au/news/2014/03/game-based-learning-to-reduce-carbon-footprint/',
-    'https://www.swinburne.edu.au/news/2023/06/kings-birthday-honours-for-swinburne-community/',
-    'https://www.swinburne.edu.au/news/2015/09/chemical-messengers-how-hormones-help-us-sleep/',
-    'https://www.swinburne.edu.au/news/2016/10/swinburne-law-students-compete-in-moot-court-grand-final/',
-    'https://www.swinburne.edu.au/news/2018/08/what-do-next-generation-condoms-look-like-/',
-    'https://www.swinburne.edu.au/news/2022/10/high-school-students-design-plant-based-experiment-for-space/',
-    'https://www.swinburne.edu.au/news/2014/08/swinburne-study-uncovers-why-people-suffer-body-dysmorphia-disorder/',
-    'https://www.swinburne.edu.au/news/2015/09/fact-over-fiction-on-the-apocalyptic-super-blood-moon/',
-    'https://www.swinburne.edu.au/news/2015/02/scott-morrisons-unfinished-business/',
-    'https://www.swinburne.edu.au/news/2017/06/a-soft-touch-for-mending-broken-bones/',
-    'https://www.swinburne.edu.au/news/2014/04/end-super-distortions-before-raising-pension-age/',
-    'https://www.swinburne.edu.au/news/2016/09/experts-respond-to-first-us-presidential-debate/',
-    'https://www.swinburne.edu.au/news/2018/03/hundreds-sign-up-to-trial-online-bipolar-resources--/',
-    'https://www.swinburne.edu.au/news/2018/08/new-industry-partner-joins-repair-bot-project-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2024/01/Your-next-gen-campus-Indigenous-Learning-Circles-are-complete/',
-    'https://www.swinburne.edu.au/news/2018/04/where-has-melbournes-political-graffiti-gone/',
-    'https://www.swinburne.edu.au/news/2023/10/donor-scholarship-sets-student-on-cyber-security-path/',
-    'https://www.swinburne.edu.au/news/2016/02/iowa-caucus-scholars-around-the-globe-react/',
-    'https://www.swinburne.edu.au/news/2021/09/world-leading-swinburne-research-will-influence-climate-modelling/',
-    'https://www.swinburne.edu.au/news/2018/05/regulators-want-commonwealth-bank-to-fix-itself/',
-    'https://www.swinburne.edu.au/news/2016/08/film-victoria-funds-swinburne-games-graduates-and-staff/',
-    'https://www.swinburne.edu.au/news/2022/07/greening-the-greyfields/',
-    'https://www.swinburne.edu.au/news/2022/07/cancer-councils-new-research-led-support-resources/',
-    'https://www.swinburne.edu.au/news/2019/10/photomedia-students-experimental-image-wins-adobe-top-talent-award/',
-    'https://www.swinburne.edu.au/news/2022/11/deliberately-different-35-years-of-wantirna/',
-    'https://www.swinburne.edu.au/news/2019/08/dr-jackie-huggins-am-named-vcs-fellow-for-indigenous-leadership/',
-    'https://www.swinburne.edu.au/news/2021/08/youtube-silences-sky-news-but-normal-programming-will-resume/',
-    'https://www.swinburne.edu.au/news/2022/11/swinburne-journalism-students-to-host-live-state-election-broadcast/',
-    'https://www.swinburne.edu.au/news/2023/06/others-matter-building-a-brighter-future/',
-    'https://www.swinburne.edu.au/news/2016/06/study-shows-growth-in-social-enterprise-sector/',
-    'https://www.swinburne.edu.au/news/2017/12/next-generation-condom-named-medtech-finalist/',
-    'https://www.swinburne.edu.au/news/2016/10/swinburnes-success-at-plumbing-and-fire-industry-awards/',
-    'https://www.swinburne.edu.au/news/2021/07/small-houses-build-careers-for-swinburne-trade-students/',
-    'https://www.swinburne.edu.au/news/2015/03/piers-fowler-scholarships-for-aviation/',
-    'https://www.swinburne.edu.au/news/2016/07/orthorexia-study-launches-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2017/09/swinburne-students-to-access-new-colombo-plan-grants/',
-    'https://www.swinburne.edu.au/news/2019/10/swinburne-pathways-student-wins-learn-local-award/',
-    'https://www.swinburne.edu.au/news/2014/08/swinburnes-lgbti-community-comes-out/',
-    'https://www.swinburne.edu.au/news/2016/07/joining-the-nations-leading-researchers-in-risk-think-tank/',
-    'https://www.swinburne.edu.au/news/2023/06/swinburnes-welcome-scholarships-opens-new-doors/',
-    'https://www.swinburne.edu.au/news/2016/05/partnership-for-hi-tech-manufacturing-future/',
-    'https://www.swinburne.edu.au/news/2017/03/the-evolving-language-of-gay-men/',
-    'https://www.swinburne.edu.au/news/2016/04/ten-tech-schools-inspired-by-kiosc-at-swinburne-wantirna/',
-    'https://www.swinburne.edu.au/news/2016/10/banks-make-millions-in-delaying-interest-rate-cuts/',
-    'https://www.swinburne.edu.au/news/2017/10/accounting-for-unchartered-waters/',
-    'https://www.swinburne.edu.au/news/2020/09/high-court-likely-to-free-covids-political-prisoners/',
-    'https://www.swinburne.edu.au/news/2021/08/Swinburne-Law-student-develops-legal-tech-solution-for-Spotify/',
-    'https://www.swinburne.edu.au/news/2024/01/biggest-swinburne-space-stories-of-2023/',
-    'https://www.swinburne.edu.au/news/2018/08/swinburnes-alan-duffy-wins-eureka-prize-for-promoting-science/',
-    'https://www.swinburne.edu.au/news/2021/08/Swinburne-startup-uses-smart-shoe-sensors-to-detect-health-issues/',
-    'https://www.swinburne.edu.au/news/2014/04/book-review-rupert-murdoch--a-reassessment/',
-    'https://www.swinburne.edu.au/news/2015/05/plant-extracts-offer-hope-against-diabetes-and-cancer/',
-    'https://www.swinburne.edu.au/news/2021/09/Swinburne-lecturer-hires-mba-students-as-new-ceo/',
-    'https://www.swinburne.edu.au/news/2017/11/swinburne-leads-creation-of-world-first-trademark-database-platform/',
-    'https://www.swinburne.edu.au/news/2018/09/swinburne-co-hosts-central-european-business-forum/',
-    'https://www.swinburne.edu.au/news/2016/09/clinton-trump-tied-heres-why-you-should-ignore-polls/',
-    'https://www.swinburne.edu.au/news/2015/09/re-designing-the-conference/',
-    'https://www.swinburne.edu.au/news/2016/05/thanks-super-new-moon-for-a-great-meteor-shower/',
-    'https://www.swinburne.edu.au/news/2016/06/swinburne-wins-manufacturing-hall-of-fame-award/',
-    'https://www.swinburne.edu.au/news/2019/08/engineering-innovation-in-timor-leste/',
-    'https://www.swinburne.edu.au/news/2016/09/swinburne-ranks-in-worlds-top-400-universities/',
-    'https://www.swinburne.edu.au/news/2023/10/young-swinburne-designers-help-build-luxury-brand/',
-    'https://www.swinburne.edu.au/news/2022/11/stemm-competition-urges-students-to-start-talking/',
-    'https://www.swinburne.edu.au/news/2016/04/swinburne-talks-tourism-appeal-of-central-europe/',
-    'https://www.swinburne.edu.au/news/2019/01/swinburne-receives-funding-to-stop-smart-home-devices-getting-hacked/',
-    'https://www.swinburne.edu.au/news/2020/03/swinburne-team-guide-helps-transition-mental-health-consultations-online/',
-    'https://www.swinburne.edu.au/news/2014/08/swinburne-strengthens-top-400-ranking-in-prestige-global-table/',
-    'https://www.swinburne.edu.au/news/2015/10/remixing-indian-design-anthropology/',
-    'https://www.swinburne.edu.au/news/2015/04/using-digital-technology-for-mental-health/',
-    'https://www.swinburne.edu.au/news/2015/01/anorexia-sufferers-see-things-differently/',
-    'https://www.swinburne.edu.au/news/2022/09/Swinburne-senior-leaders-2022-Sarawak-visit/',
-    'https://www.swinburne.edu.au/news/2021/12/How-to-ex-seed-your-garden-expectations-this-summer/',
-    'https://www.swinburne.edu.au/news/2024/08/scholarships-open-up-Asia-Pacific-for-swinburne-engineering-students/',
-    'https://www.swinburne.edu.au/news/2016/04/young-university-big-research-impact/',
-    'https://www.swinburne.edu.au/news/2016/07/retail-partnership-a-win-for-students/',
-    'https://www.swinburne.edu.au/news/2018/10/playable-art-tram-runs-through-melbourne-international-games-week-/',
-    'https://www.swinburne.edu.au/news/2016/05/a-celebration-of-writing-at-swinburnes-writers-festival/',
-    'https://www.swinburne.edu.au/news/2016/09/what-happened-when-the-woz-came-to-town/',
-    'https://www.swinburne.edu.au/news/2022/03/avanade-extends-swinburne-women-in-stem-program/',
-    'https://www.swinburne.edu.au/news/2018/02/swinburne-hosts-first-alumni-event-in-san-francisco/',
-    'https://www.swinburne.edu.au/news/2022/06/swinburne-travel-entirely-carbon-neutral/',
-    'https://www.swinburne.edu.au/news/2018/07/phd-candidate-greg-kennedy-honoured-for-alzheimers-research/',
-    'https://www.swinburne.edu.au/news/2017/06/swinburne-researchers-develop-new-cricket-ball-to-optimise-training/',
-    'https://www.swinburne.edu.au/news/2023/07/Swinburne-students-co-creating-next-gen_campus/',
-    'https://www.swinburne.edu.au/news/2014/11/on-interstellar-and-real-physics/',
-    'https://www.swinburne.edu.au/news/2015/03/new-online-centre-for-bipolar-disorder-sufferers/',
-    'https://www.swinburne.edu.au/news/2021/10/Post-lockdown-hitlist-top-seven-freedom-activities/',
-    'https://www.swinburne.edu.au/news/2016/08/do-you-shy-away-from-public-toilets/',
-    'https://www.swinburne.edu.au/news/2017/06/design-student-wins-grand-prize-of-disney-emoji-competition/',
-    'https://www.swinburne.edu.au/news/2017/04/lets-stop-kicking-the-innovation-football-around/',
-    'https://www.swinburne.edu.au/news/2016/03/safe-schools-review-findings-experts-respond/',
-    'https://www.swinburne.edu.au/news/2020/12/swinburne-student-tests-remote-learning-boundaries/',
-    'https://www.swinburne.edu.au/news/2022/09/global-tech-and-digital-leader-joins-swinburnes-council/',
-    'https://www.swinburne.edu.au/news/2023/06/swinburne-scores-second-highest-student-experience-ratings-in-victoria/',
-    'https://www.swinburne.edu.au/news/2015/10/swinburnes-michael-daffern-made-a-fellow-of-the-aps/',
-    'https://www.swinburne.edu.au/news/2016/04/hidden-stars-baby-planets-and-blowup-spaceships/',
-    'https://www.swinburne.edu.au/news/2015/02/reddit-tackles-revenge-porn-and-celebrity-nudes/',
-    'https://www.swinburne.edu.au/news/2019/03/rebeccas-journey-to-swinburne/',
-    'https://www.swinburne.edu.au/news/2021/06/staying-entertained-and-active-this-winter/',
-    'https://www.swinburne.edu.au/news/2014/04/film-students-win-awards-at-international-film-festival/',
-    'https://www.swinburne.edu.au/news/2014/07/swinburne-and-nicta-launch-new-software-innovation-lab/',
-    'https://www.swinburne.edu.au/news/2024/05/swinburne-founded-software-startup-fluency-launches-first-product-suite/',
-    'https://www.swinburne.edu.au/news/2015/10/an-old-school-satchel-for-the-digital-era/',
-    'https://www.swinburne.edu.au/news/2020/07/new-facility-to-put-swinburne-and-csiro-at-forefront-of-manufacturing-digitalisation/',
-    'https://www.swinburne.edu.au/news/2021/06/milestone-discovery-of-two-neutron-star-black-hole-collisions/',
-    'https://www.swinburne.edu.au/news/2014/08/swinburne-research-calls-last-drinks-on-alcohol-misuse/',
-    'https://www.swinburne.edu.au/news/2014/04/partial-solar-eclipse-at-sunset-around-australia/',
-    'https://www.swinburne.edu.au/news/2017/11/vice-chancellor-appointed-to-aged-care-taskforce/',
-    'https://www.swinburne.edu.au/news/2021/12/swinburne-students-use-zombies-in-road-safety-campaign/',
-    'https://www.swinburne.edu.au/news/2015/07/different-questions-for-qa/',
-    'https://www.swinburne.edu.au/news/2020/03/our-milky-way-has-been-reverse-engineered/',
-    'https://www.swinburne.edu.au/news/2021/08/Dean-Mia-Lindgren-on-ACMI-podcasting-and-Horizon-2025/',
-    'https://www.swinburne.edu.au/news/2014/08/policy-online-wins-2014-australia-and-new-zealand-internet-awards/',
-    'https://www.swinburne.edu.au/news/2019/12/reflections-on-a-2019-abc-top-5-media-residency/',
-    'https://www.swinburne.edu.au/news/2021/08/new-stars-create-space-pollution-research-confirms/',
-    'https://www.swinburne.edu.au/news/2022/03/swinburne-ready-to-act-national-student-safety-survey-released/',
-    'https://www.swinburne.edu.au/news/2017/09/self-driving-cars-could-dramatically-reduce-the-road-toll/',
-    'https://www.swinburne.edu.au/news/2022/01/celebrities-vs-influencers-new-research-determines-a-winner/',
-    'https://www.swinburne.edu.au/news/2015/03/celebrating-international-womens-day/',
-    'https://www.swinburne.edu.au/news/2020/02/can-new-snapchat-features-help-troubled-teens/',
-    'https://www.swinburne.edu.au/news/2015/03/why-fee-deregulation-is-flawed/',
-    'https://www.swinburne.edu.au/news/2018/05/astronomy-inspires-artists-/',
-    'https://www.swinburne.edu.au/news/2018/03/architecture-joins-a-future-ready-school-of-design/',
-    'https://www.swinburne.edu.au/news/2020/12/swinburne-astronomers-review-space-news-highlights-of-2020/',
-    'https://www.swinburne.edu.au/news/2022/02/swinburne-academic-raises-crucial-funds-for-tongan-relief-efforts/',
-    'https://www.swinburne.edu.au/news/2015/04/the-pale-blue-dot-and-other-selfies-of-earth/',
-    'https://www.swinburne.edu.au/news/2018/05/design-factory-melbourne-moves-to-renovated-fire-station/',
-    'https://www.swinburne.edu.au/news/2015/01/ha-lfs-kooriography-shines-at-the-wominjeka-festival/',
-    'https://www.swinburne.edu.au/news/2020/05/remorse-and-sentencing-we-cant-treat-terror-like-tax/',
-    'https://www.swinburne.edu.au/news/2017/06/launch-camp-takes-off-at-swinburne-in-university-first/',
-    'https://www.swinburne.edu.au/news/2019/04/from-art-director-to-gin-distiller/',
-    'https://www.swinburne.edu.au/news/2022/11/newest-google-recruit-a-swinburne-success-story/',
-    'https://www.swinburne.edu.au/news/2024/08/swinburne-students-bring-home-two-beta-alpha-psi-award-wins/',
-    'https://www.swinburne.edu.au/news/2018/03/communicating-with-dementia/',
-    'https://www.swinburne.edu.au/news/2014/06/melinda-lethbridge-named-swinburnes-apprentice-of-the-year--1/',
-    'https://www.swinburne.edu.au/news/2017/06/optical-combs-bring-quantum-smartphones-a-step-closer/',
-    'https://www.swinburne.edu.au/news/2021/12/Bendigo-bank-placement-leads-to-industry-success/',
-    'https://www.swinburne.edu.au/news/2014/03/getting-local-government-to-embrace-social-media/',
-    'https://www.swinburne.edu.au/news/2018/06/swinburne-graduate-awarded-at-st-kilda-film-festival/',
-    'https://www.swinburne.edu.au/news/2020/02/west-gate-tunnel-delays-show-risks-of-mega-projects/',
-    'https://www.swinburne.edu.au/news/2015/01/queue-jumping-the-view-from-afar/',
-    'https://www.swinburne.edu.au/news/2017/01/older-gay-mens-concerns-are-about-more-than-sexuality/',
-    'https://www.swinburne.edu.au/news/2019/05/a-guiding-hand-for-swinburne-startups/',
-    'https://www.swinburne.edu.au/news/2018/11/we-asked-five-experts-are-light-dairy-products-better/',
-    'https://www.swinburne.edu.au/news/2020/10/what-is-low-carbon-steel/',
-    'https://www.swinburne.edu.au/news/2016/04/swinburne-plays-starring-role-at-worldfest-houston/',
-    'https://www.swinburne.edu.au/news/2017/12/swinburne-students-access-financial-services-as-cost-of-living-rises/',
-    'https://www.swinburne.edu.au/news/2016/07/swinburne-and-csiro-cement-new-partnership/',
-    'https://www.swinburne.edu.au/news/2017/03/qs-ranks-swinburne-design-in-the-top-100/',
-    'https://www.swinburne.edu.au/news/2018/07/whats-really-driving-the-future-of-retail/',
-    'https://www.swinburne.edu.au/news/2021/12/swinburne-in-real-life-just-got-even-better/',
-    'https://www.swinburne.edu.au/news/2023/04/pre-accelerator-program-nurtures-early-stage-ideas/',
-    'https://www.swinburne.edu.au/news/2015/02/swinburne-apprentices-help-build-new-school-in-india/',
-    'https://www.swinburne.edu.au/news/2021/10/soundtrack-your-day-with-these-interstellar-space-songs/',
-    'https://www.swinburne.edu.au/news/2022/12/skys-the-limit-for-swintopia-20k-winner/',
-    'https://www.swinburne.edu.au/news/2021/08/comment-internet-of-space-things-will-create-new-industries/',
-    'https://www.swinburne.edu.au/news/2023/02/meet-the-swinburne-alum-making-real-social-impact/',
-    'https://www.swinburne.edu.au/news/2016/09/does-instagram-make-you-a-narcissist/',
-    'https://www.swinburne.edu.au/news/2020/05/turning-wine-industry-waste-into-premium-products/',
-    'https://www.swinburne.edu.au/news/2016/02/memobottle-takes-its-place-on-the-global-stage/',
-    'https://www.swinburne.edu.au/news/2020/07/curious-kids-what-does-the-suns-core-look-like/',
-    'https://www.swinburne.edu.au/news/2023/01/australia-day-honours-for-swinburne-community/',
-    'https://www.swinburne.edu.au/news/2023/03/medtechvic-wheelchair-workshops-upskill-ots/',
-    'https://www.swinburne.edu.au/news/2021/09/expert-tips-being-sustainable-at-home/',
-    'https://www.swinburne.edu.au/news/2023/12/one-swinburne-celebrating-our-values-in-action/',
-    'https://www.swinburne.edu.au/news/2015/06/swinburnes-meg-is-helping-epilepsy-patients/',
-    'https://www.swinburne.edu.au/news/2018/07/swinburne--the-most-open-of-open-days/',
-    'https://www.swinburne.edu.au/news/2023/09/destination-korea-an-industry-linked-study-tour/',
-    'https://www.swinburne.edu.au/news/2014/09/earths-close-shave-with-an-asteroid/',
-    'https://www.swinburne.edu.au/news/2016/02/fiftyfifty-vision-the-pollsters-preference-problem/',
-    'https://www.swinburne.edu.au/news/2016/10/why-health-implants-should-have-open-source-code/',
-    'https://www.swinburne.edu.au/news/2018/10/australian-scientists-double-known-number-of-mysterious-fast-radio-bursts/',
-    'https://www.swinburne.edu.au/news/2022/07/indigenous-teens-explore-uni-life-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2016/02/what-is-safe-schools-coalition/',
-    'https://www.swinburne.edu.au/news/2022/05/Simones-career-reboot-from-IT-to-nursing/',
-    'https://www.swinburne.edu.au/news/2022/08/Swinburne-launches-gender-equality-action-plan/',
-    'https://www.swinburne.edu.au/news/2023/08/next-gen-campus-Listening-Posts-draw-Swinburne-students-into-co-creation-process/',
-    'https://www.swinburne.edu.au/news/2014/05/crunch-time-is-the-abc-really-spread-too-thinly/',
-    'https://www.swinburne.edu.au/news/2014/07/a-night-at-the-keck---free-public-lecture/',
-    'https://www.swinburne.edu.au/news/2019/07/swinburne-win-top-honours-at-national-design-awards/',
-    'https://www.swinburne.edu.au/news/2019/09/heads-in-the-cloud/',
-    'https://www.swinburne.edu.au/news/2017/08/gamified-learning-app-wins-higher-education-award/',
-    'https://www.swinburne.edu.au/news/2021/09/school-kids-develop-smart-bins-for-better-waste-management/',
-    'https://www.swinburne.edu.au/news/2014/05/commission-of-audit-report-released-experts-respond/',
-    'https://www.swinburne.edu.au/news/2014/07/swinburne-online-celebrates-three-years/',
-    'https://www.swinburne.edu.au/news/2018/03/qs-ranks-swinburne-design-in-the-top-40/',
-    'https://www.swinburne.edu.au/news/2018/10/online-mental-health-service-from-swinburne-offers-video-therapy/',
-    'https://www.swinburne.edu.au/news/2021/10/how-do-we-decolonise-news-reporting/',
-    'https://www.swinburne.edu.au/news/2022/10/moon-telescope-could-light-up-the-cosmic-dark-ages/',
-    'https://www.swinburne.edu.au/news/2015/05/how-gay-marriage-fell-victim-to-labors-stockholm-syndrome/',
-    'https://www.swinburne.edu.au/news/2021/03/swinburne-extends-partnership-with-acmi/',
-    'https://www.swinburne.edu.au/news/2015/09/fall-of-the-mad-monk/',
-    'https://www.swinburne.edu.au/news/2014/08/first-online-wellbeing-program-for-gay-and-lesbian-youth/',
-    'https://www.swinburne.edu.au/news/2015/10/swinburne-and-tongji-university-form-joint-research-centre/',
-    'https://www.swinburne.edu.au/news/2020/09/covid-19-survey-mental-health-aged-care/',
-    'https://www.swinburne.edu.au/news/2021/10/frances-burke-designer-of-modern-textiles-released/',
-    'https://www.swinburne.edu.au/news/2020/09/first-ever-detection-of-monster-black-hole-collision/',
-    'https://www.swinburne.edu.au/news/2021/10/swinburne-alumni-impact-awards-winners-2021/',
-    'https://www.swinburne.edu.au/news/2018/09/neutron-star-merger-launched-superfast-jet-of-materials/',
-    'https://www.swinburne.edu.au/news/2014/07/retail-shop-pops-up-at-swinburnes-wantirna-campus/',
-    'https://www.swinburne.edu.au/news/2015/12/what-superheroes-looked-like-in-2015/',
-    'https://www.swinburne.edu.au/news/2019/09/message-from-the-vice-chancellor-global-climate-strike/',
-    'https://www.swinburne.edu.au/news/2022/03/swinburne-hosts-record-number-of-new-gen-thinkers/',
-    'https://www.swinburne.edu.au/news/2017/08/swinburne-to-deliver-offshore-phds-in-hong-kong/',
-    'https://www.swinburne.edu.au/news/2023/11/swinburne-alum-thrives-in-ever-changing-australian-tech-industry/',
-    'https://www.swinburne.edu.au/news/2014/02/food-for-thought-a-free-public-lecture/',
-    'https://www.swinburne.edu.au/news/2017/06/how-modern-brand-devotion-connects-people-online/',
-    'https://www.swinburne.edu.au/news/2019/02/quantum-optical-micro-combs-enable-breakthroughs-in-quantum-world/',
-    'https://www.swinburne.edu.au/news/2021/07/swinburne-alum-matt-levy-competes-in-fifth-paralympics/',
-    'https://www.swinburne.edu.au/news/2014/04/holy-birthday-batman-sizing-up-the-caped-crusader-at-75/',
-    'https://www.swinburne.edu.au/news/2019/05/moondani-toombadool-centre-works-with-students-on-new-logo/',
-    'https://www.swinburne.edu.au/news/2021/11/Swinburne-graduates-thrive-at-supply-chain-company-efm-Logistics/',
-    'https://www.swinburne.edu.au/news/2021/05/swinburnes-executive-mba-ranked-best-in-australia/',
-    'https://www.swinburne.edu.au/news/2020/05/astronomers-see-cosmic-ring-of-fire-11-billion-years-ago/',
-    'https://www.swinburne.edu.au/news/2021/01/swinburne-renews-sponsorship-deal-with-richmonds-aflw-team/',
-    'https://www.swinburne.edu.au/news/2022/08/researchers-turn-martian-air-dirt-and-sunlight-into-iron/',
-    'https://www.swinburne.edu.au/news/2014/04/peter-mares-new-ways-to-dud-kiwis-1/',
-    'https://www.swinburne.edu.au/news/2021/07/Indigenous-designs-shine-in-naidoc-week-competition/',
-    'https://www.swinburne.edu.au/news/2022/11/swinburne-alum-reshaping-furniture-design-in-steel/',
-    'https://www.swinburne.edu.au/news/2014/06/swinburne-youth-parliament-team-wants-graduates-work-ready/',
-    'https://www.swinburne.edu.au/news/2016/09/shining-a-light-on-alzheimers-disease/',
-    'https://www.swinburne.edu.au/news/2018/05/swinburne-design-helps-teenage-girls-to-improve-pelvic-floor-health/',
-    'https://www.swinburne.edu.au/news/2018/08/the-growing-demand-for-data-science/',
-    'https://www.swinburne.edu.au/news/2022/09/truth-telling-takes-the-stage-this-reconciliation-lecture/',
-    'https://www.swinburne.edu.au/news/2016/11/swinburne-and-tel-aviv-university-launch-data-science-research-centre/',
-    'https://www.swinburne.edu.au/news/2024/02/celebrating-over-50-years-of-service-of-bruce-mcdonald/',
-    'https://www.swinburne.edu.au/news/2021/08/Swinburnes-three-minute-thesis-winner-explores-space-contruction/',
-    'https://www.swinburne.edu.au/news/2016/10/swinburne-supports-boroondara-white-ribbon-day/',
-    'https://www.swinburne.edu.au/news/2016/10/pride-day-celebrations-honour-lgbtiq-community-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2021/06/Video-show-construction-of-swinburne-library-50-years-ago/',
-    'https://www.swinburne.edu.au/news/2015/02/are-sport-broadcast-rights-worth-the-money/',
-    'https://www.swinburne.edu.au/news/2015/05/dr-raghunth-anant-mashelkar-awarded-honorary-doctorate/',
-    'https://www.swinburne.edu.au/news/2014/10/curcumin-a-spice-extract-that-reduces-fatigue/',
-    'https://www.swinburne.edu.au/news/2020/11/swinburne-launches-new-industry-4-0-program/',
-    'https://www.swinburne.edu.au/news/2014/03/fashioning-blue-collars-chambray-shirts-and-indigo-dyed-workwear/',
-    'https://www.swinburne.edu.au/news/2014/10/straw-poll-finds-victorian-politicians-not-well-known/',
-    'https://www.swinburne.edu.au/news/2015/11/smart-sensor-detects-single-molecule-in-chemical-compounds/',
-    'https://www.swinburne.edu.au/news/2016/04/swinburne-and-boroondara-city-council-partner-up/',
-    'https://www.swinburne.edu.au/news/2016/07/techdiversity-awards-recognise-dr-therese-keane/',
-    'https://www.swinburne.edu.au/news/2018/05/swinburne-space-experiment-blasts-off-to-international-space-station/',
-    'https://www.swinburne.edu.au/news/2016/02/digital-payment-providers-yet-to-win-war-on-cash/',
-    'https://www.swinburne.edu.au/news/2019/01/australia-day-list-honours-swinburne-community/',
-    'https://www.swinburne.edu.au/news/2022/02/Next-gen-lightning-strike-protection-devices-to-save-lives/',
-    'https://www.swinburne.edu.au/news/2016/08/swinburne-scholarship-for-way-to-olympia-peak-winner/',
-    'https://www.swinburne.edu.au/news/2021/10/dr-louise-olsen-kettle-awarded-veski-inspiring-women-career-recovery-grant/',
-    'https://www.swinburne.edu.au/news/2015/12/swinburne-graduates-develop-software-that-trained-over-2000-carers/',
-    'https://www.swinburne.edu.au/news/2017/11/the-most-ancient-spiral-galaxy-confirmed-using-cutting-edge-technique/',
-    'https://www.swinburne.edu.au/news/2019/05/designing-future-living-spaces-for-smart-cities/',
-    'https://www.swinburne.edu.au/news/2022/03/new-vice-president-innovation-and-enterprise/',
-    'https://www.swinburne.edu.au/news/2023/08/swinburne-help-drive-change-mental-health-system/',
-    'https://www.swinburne.edu.au/news/2015/04/final-chance-to-register-for-swinburnes-autism-mooc/',
-    'https://www.swinburne.edu.au/news/2015/11/swinburne-ranked-in-worlds-top-100-young-universities/',
-    'https://www.swinburne.edu.au/news/2022/05/the-colours-of-hydrogen-explained/',
-    'https://www.swinburne.edu.au/news/2024/03/Celebrating-our-new-Indigenous-Learning-Circles/',
-    'https://www.swinburne.edu.au/news/2022/03/Childrens-University-Swinburne-the-next-gen-of-STEM/',
-    'https://www.swinburne.edu.au/news/2024/07/future-of-national-institute-of-circus-arts-NICA-secured/',
-    'https://www.swinburne.edu.au/news/2014/09/please-un-do-booty-pop-videos/',
-    'https://www.swinburne.edu.au/news/2020/11/swinburne-celebrates-12-researchers-on-highly-cited-researchers-2020-list/',
-    'https://www.swinburne.edu.au/news/2021/07/students-use-technology-to-make-banking-more-inclusive/',
-    'https://www.swinburne.edu.au/news/2014/09/higgs-will-not-destroy-the-universe/',
-    'https://www.swinburne.edu.au/news/2020/10/wild-animal-inspired-road-safety-campaign-launches-in-Melbourne/',
-    'https://www.swinburne.edu.au/news/2015/06/psychologys-role-in-closing-the-mental-health-gap/',
-    'https://www.swinburne.edu.au/news/2015/10/swinburnes-inaugural-moot-court-competition/',
-    'https://www.swinburne.edu.au/news/2015/07/swinburne-students-score-with-new-colombo-plan-grants/',
-    'https://www.swinburne.edu.au/news/2016/08/can-we-predict-who-will-turn-to-crime/',
-    'https://www.swinburne.edu.au/news/2016/10/do-we-thank-science-for-all-our-prosperity/',
-    'https://www.swinburne.edu.au/news/2018/12/swinburne-aces-in2science-mentor-awards/',
-    'https://www.swinburne.edu.au/news/2019/06/learning-on-the-dulux-factory-floor/',
-    'https://www.swinburne.edu.au/news/2021/02/googles-threat-proves-legislation-matters/',
-    'https://www.swinburne.edu.au/news/2021/08/faster-higher-stronger-together-social-change-and-the-olympic-games/',
-    'https://www.swinburne.edu.au/news/2015/08/apprentice-of-the-year-finalist/',
-    'https://www.swinburne.edu.au/news/2016/01/the-g-in-5g-how-mobile-generations-have-evolved/',
-    'https://www.swinburne.edu.au/news/2020/06/towards-ultra-sensitive-diagnostic-chips/',
-    'https://www.swinburne.edu.au/news/2021/09/swinburnes-dr-rebecca-allen-wins-young-tall-poppy-science-award/',
-    'https://www.swinburne.edu.au/news/2022/09/apo-says-information-must-be-free-on-20th-anniversary/',
-    'https://www.swinburne.edu.au/news/2021/01/q-and-a-with-vc-award-winner-dr-amie-hayley/',
-    'https://www.swinburne.edu.au/news/2021/01/pave-staff-honoured-cfa-chief-officers-commendation-award/',
-    'https://www.swinburne.edu.au/news/2021/10/carmens-kitchen-founder-carolyn-creswells-biggest-lessons/',
-    'https://www.swinburne.edu.au/news/2023/06/appreciating-aging-in-everyday-products/',
-    'https://www.swinburne.edu.au/news/2017/05/the-gender-pay-gap-is-hurting-productivity/',
-    'https://www.swinburne.edu.au/news/2019/07/swinburne-and-coviu-deliver-real-time-chat-mental-health-support/',
-    'https://www.swinburne.edu.au/news/2016/04/how-living-museums-are-waking-up-sleeping-artefacts/',
-    'https://www.swinburne.edu.au/news/2019/04/dear-baby-boomers-australian-philanthropy-needs-your-help/',
-    'https://www.swinburne.edu.au/news/2016/08/australias-stance-on-nuclear-deterrence/',
-    'https://www.swinburne.edu.au/news/2018/07/swinburne-students-empower-people-on-dialysis-to-travel/',
-    'https://www.swinburne.edu.au/news/2018/09/swinburne-secures-5-star-good-universities-guide-ratings/',
-    'https://www.swinburne.edu.au/news/2014/03/swinburne-academic-named-patron-of-families-for-vacro/',
-    'https://www.swinburne.edu.au/news/2016/10/swinburne-offers-stem-fellowships-for-women/',
-    'https://www.swinburne.edu.au/news/2018/05/swinburnes-annual-research-impact-award---marngo-designing-futures/',
-    'https://www.swinburne.edu.au/news/2019/06/wattle-program-turns-attention-to-professional-staff/',
-    'https://www.swinburne.edu.au/news/2016/09/swinburne-ranks-in-worlds-top-100-young-universities/',
-    'https://www.swinburne.edu.au/news/2021/01/swinburne-alumni-make-the-2021-australia-day-honours-list/',
-    'https://www.swinburne.edu.au/news/2021/02/pet-inclusive-housing-will-help-tenants-and-landlords/',
-    'https://www.swinburne.edu.au/news/2021/07/online-art-show-shines-spotlight-on-swinburne-students/',
-    'https://www.swinburne.edu.au/news/2015/01/swinburne-celebrates-australia-day-2015-honours/',
-    'https://www.swinburne.edu.au/news/2023/05/swinburne-graduate-uses-art-to-explore-her-cultural-identity/',
-    'https://www.swinburne.edu.au/news/2014/05/industry-head-start-for-swinburne-it-graduates/',
-    'https://www.swinburne.edu.au/news/2016/05/coffee-more-than-just-a-drink-for-swinburne-engineers/',
-    'https://www.swinburne.edu.au/news/2016/08/get-inspired-by-the-small-business-festival-victoria/',
-    'https://www.swinburne.edu.au/news/2021/06/Students-create-3D-virtual-building-tour-at-Swinburne/',
-    'https://www.swinburne.edu.au/news/2019/08/community-bank-partnership-gives-back-to-swinburne/',
-    'https://www.swinburne.edu.au/news/2014/07/swinburne-moves-to-close-the-gender-gap/',
-    'https://www.swinburne.edu.au/news/2017/08/sexual-assault-and-sexual-harassment-survey-results-released/',
-    'https://www.swinburne.edu.au/news/2022/08/swinburne-continues-global-rankings-rise/',
-    'https://www.swinburne.edu.au/news/2015/06/why-cant-we-have-a-sensible-debate-about-refugees/',
-    'https://www.swinburne.edu.au/news/2018/11/swinburne-updates-human-resources-course-to-address-changing-business-needs/',
-    'https://www.swinburne.edu.au/news/2021/04/swinburne-researchers-contribute-to-world-first-approach-to-cleaning-waterways/',
-    'https://www.swinburne.edu.au/news/2019/10/a-driving-force-for-change/',
-    'https://www.swinburne.edu.au/news/2015/09/ultrathin-lens-could-revolutionise-next-gen-devices/',
-    'https://www.swinburne.edu.au/news/2015/09/swinburne-to-take-part-in-gender-equity-pilot-program/',
-    'https://www.swinburne.edu.au/news/2018/12/take-the-tram-into-a-more-playable-city/',
-    'https://www.swinburne.edu.au/news/2019/03/robot-3d-prints-replacement-bracket-onto-automotive-part/',
-    'https://www.swinburne.edu.au/news/2020/03/swinburne-announces-next-vice-chancellor/',
-    'https://www.swinburne.edu.au/news/2020/10/canberra-must-slice-hezbollah-tentacles/',
-    'https://www.swinburne.edu.au/news/2021/10/Swinburne-researchers-clean-up-at-2021-good-design-awards/',
-    'https://www.swinburne.edu.au/news/2023/02/nasas-webb-uncovers-new-details-in-pandoras-cluster/',
-    'https://www.swinburne.edu.au/news/2014/08/family-violence-response-must-tackle-all-forms-of-abuse/',
-    'https://www.swinburne.edu.au/news/2016/02/who-gets-to-be-australian/',
-    'https://www.swinburne.edu.au/news/2017/02/health-check-do-cold-showers-cool-you-down/',
-    'https://www.swinburne.edu.au/news/2016/10/swinburnes-jacqueline-savage-wins-in-telstra-awards/',
-    'https://www.swinburne.edu.au/news/2014/01/atar-rises-for-entry-into-degrees-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2016/06/swinburne-researchers-mimic-butterfly-wing-for-compact-new-technology/',
-    'https://www.swinburne.edu.au/news/2017/03/first-of-its-kind-australian-psychology-handbook-released/',
-    'https://www.swinburne.edu.au/news/2017/09/alan-duffy-welcomes-announcement-of-new-national-space-agency/',
-    'https://www.swinburne.edu.au/news/2024/07/supreme-court-prize-awarded-to-top-swinburne-graduate/',
-    'https://www.swinburne.edu.au/news/2014/03/engineering-pioneer-inducted-into-victorian-honour-roll-of-women/',
-    'https://www.swinburne.edu.au/news/2021/09/Swinburne-grad-enhancing-lives-through-work-in-MedTech/',
-    'https://www.swinburne.edu.au/news/2019/07/swinburne-student-residences-adopt-chickens-as-pets/',
-    'https://www.swinburne.edu.au/news/2015/05/degrowth-japan-models-design-for-steady-state-economies/',
-    'https://www.swinburne.edu.au/news/2014/06/could-devastating-floods-help-bosnians-heal-their-war-wounds/',
-    'https://www.swinburne.edu.au/news/2015/07/arc-linkage-projects-success-for-swinburne/',
-    'https://www.swinburne.edu.au/news/2021/03/swinburne-and-medibank-extend-first-of-its-kind-partnership/',
-    'https://www.swinburne.edu.au/news/2016/08/poor-psychological-services-for-aged-care-residents/',
-    'https://www.swinburne.edu.au/news/2017/11/swinburne-team-wins-engineering-prize-for-structural-testing-system/',
-    'https://www.swinburne.edu.au/news/2016/07/dr-alan-duffy-named-a-finalist-for-club-melbourne-fellowship/',
-    'https://www.swinburne.edu.au/news/2014/02/dont-fall-for-the-happiness-trap/',
-    'https://www.swinburne.edu.au/news/2017/07/smart-grid-to-address-balance-of-power/',
-    'https://www.swinburne.edu.au/news/2017/08/swinburne-hosts-central-european-business-forum/',
-    'https://www.swinburne.edu.au/news/2019/10/swinburne-student-examines-most-complete-winged-reptile-discovery-in-queensland/',
-    'https://www.swinburne.edu.au/news/2020/06/swinburne-law-students-create-innovative-legal-tech-solutions-on-global-scale/',
-    'https://www.swinburne.edu.au/news/2021/01/deplatforming-work-trumps-twitter-ban-is-long-overdue/',
-    'https://www.swinburne.edu.au/news/2018/08/digital-projection-lights-up-melbourne-knowledge-week/',
-    'https://www.swinburne.edu.au/news/2024/07/Swinburne-will-Keep-the-Fire-Burning-for-NAIDOC-Week-2024/',
-    'https://www.swinburne.edu.au/news/2021/06/swinburne-rises-in-qs-world-university-rankings-2022/',
-    'https://www.swinburne.edu.au/news/2021/08/reliving-rsv-aurora-australis-last-voyage-to-antractica-in-vr/',
-    'https://www.swinburne.edu.au/news/2023/03/motion-art-captures-city-life-and-multiple-design-awards/',
-    'https://www.swinburne.edu.au/news/2024/07/swinburne-achieves-first-cygnet-award-through-sage-athena-swan-program/',
-    'https://www.swinburne.edu.au/news/2019/05/melbourne-korean-war-memorial-opens-in-maribyrnong/',
-    'https://www.swinburne.edu.au/news/2019/08/analysis--policy-observatory-appoints-new-director/',
-    'https://www.swinburne.edu.au/news/2014/05/white-face--some-notes-from-a-fair-skinned-aboriginal-1/',
-    'https://www.swinburne.edu.au/news/2015/02/managing-board-level-tensions-in-social-enterprises/',
-    'https://www.swinburne.edu.au/news/2016/08/an-innovative-solution-to-satisfy-melbournes-housing-demand/',
-    'https://www.swinburne.edu.au/news/2021/08/Swinburne-expands-atar-free-entry-for-covid-class-of-21/',
-    'https://www.swinburne.edu.au/news/2017/10/swinburnes-sarah-graham-named-among-top-50-chief-marketing-officers/',
-    'https://www.swinburne.edu.au/news/2014/05/swinburne-takes-out-third-prize-in-national-online-education-awards/',
-    'https://www.swinburne.edu.au/news/2014/11/swinburne-professor-leon-sterling-appointed-rec-chair-for-era-2015/',
-    'https://www.swinburne.edu.au/news/2021/06/High-achieving-swinburne-graduate-receives-top-law-prize/',
-    'https://www.swinburne.edu.au/news/2021/12/Four-Swinburne-students-secure-New-Colombo-Plan-Scholarships/',
-    'https://www.swinburne.edu.au/news/2022/04/swinburne-research-finds-robots-are-coming-for-our-influencers/',
-    'https://www.swinburne.edu.au/news/2016/11/indigenous-women-in-sport-documentary-released/',
-    'https://www.swinburne.edu.au/news/2016/07/new-research-into-women-in-retirement-begins-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2018/10/swinburne-architecture-professor-co-edits-flow/',
-    'https://www.swinburne.edu.au/news/2019/03/thesis-exploring-child-to-parent-abuse-awarded-maconochie-prize/',
-    'https://www.swinburne.edu.au/news/2022/05/Kulari-from-KIOSC-helps-school-students-tackle-global-problems/',
-    'https://www.swinburne.edu.au/news/2015/07/grant-awarded-to-the-swinburne-babylab/',
-    'https://www.swinburne.edu.au/news/2021/04/women-losing-trust-in-politcal-leaders-shows-new-swinburne-research/',
-    'https://www.swinburne.edu.au/news/2022/03/swinburne-design-alum-visnja-brdar-swinburne-to-new-york/',
-    'https://www.swinburne.edu.au/news/2018/11/swinburne-recruits-for-women-only-architecture-role/',
-    'https://www.swinburne.edu.au/news/2015/03/un-doing-youth-alienation-designs-for-belonging/',
-    'https://www.swinburne.edu.au/news/2015/06/the-downward-stickiness-of-credit-card-interest-rates/',
-    'https://www.swinburne.edu.au/news/2016/06/stephane-shepherd-honoured-with-young-scholar-award/',
-    'https://www.swinburne.edu.au/news/2022/03/swinburne-law-students-build-crucial-tech-skills-with-agl/',
-    'https://www.swinburne.edu.au/news/2014/04/web-based-program-had-limited-effect-on-students-drinking/',
-    'https://www.swinburne.edu.au/news/2015/02/should-queensland-go-back-to-the-future/',
-    'https://www.swinburne.edu.au/news/2018/02/the-inaugural-sports-leadership-and-management-class-of-17/',
-    'https://www.swinburne.edu.au/news/2018/06/times-higher-education-ranks-swinburne-in-top-65-young-universities/',
-    'https://www.swinburne.edu.au/news/2022/10/student-designers-gamify-neuroscience-to-grow-young-minds/',
-    'https://www.swinburne.edu.au/news/2022/11/cosmic-detective-dr-sara-webb-becomes-a-superstar-of-stem/',
-    'https://www.swinburne.edu.au/news/2016/12/why-the-world-needs-superheroes/',
-    'https://www.swinburne.edu.au/news/2018/07/cinnamon-oil-could-be-key-in-preventing-superbugs/',
-    'https://www.swinburne.edu.au/news/2019/09/swinburnes-venture-cup-backs-next-generation-of-startups/',
-    'https://www.swinburne.edu.au/news/2020/09/swinburne-researcher-selected-for-abc-media-residency-program/',
-    'https://www.swinburne.edu.au/news/2017/11/speed-dating-for-phd-students-and-industry/',
-    'https://www.swinburne.edu.au/news/2016/10/shrinking-mercury-is-all-its-cracked-up-to-be/',
-    'https://www.swinburne.edu.au/news/2017/07/explore-the-most-open-of-open-days/',
-    'https://www.swinburne.edu.au/news/2019/02/celebrating-women-and-girls-in-science/',
-    'https://www.swinburne.edu.au/news/2014/05/graphene-photonics-breakthrough-promises-fast-speed-low-cost-communications/',
-    'https://www.swinburne.edu.au/news/2015/08/swinburne-researches-effective-use-of-robots-in-schools/',
-    'https://www.swinburne.edu.au/news/2018/03/sorry-burning-our-recyclables-isnt-the-solution/',
-    'https://www.swinburne.edu.au/news/2020/10/swinburne-law-academic-wins-victorian-premiers-history-award/',
-    'https://www.swinburne.edu.au/news/2016/10/new-program-to-boost-career-success-for-secondary-students/',
-    'https://www.swinburne.edu.au/news/2019/10/flying-high-on-aviation-scholarship-for-women/',
-    'https://www.swinburne.edu.au/news/2021/06/Peter-mac-placement-launches-swinburne-graduates-stem-career/',
-    'https://www.swinburne.edu.au/news/2014/12/landmark-discovery-in-gold-nanorod-instability/',
-    'https://www.swinburne.edu.au/news/2020/06/swinburne-dean-of-design-wins-prestigious-architecture-teaching-award/',
-    'https://www.swinburne.edu.au/news/2015/09/how-we-plan-to-bring-dark-matter-to-light/',
-    'https://www.swinburne.edu.au/news/2022/02/Students-help-design-futuristic-outdoor-play-in-melbourne-cbd/',
-    'https://www.swinburne.edu.au/news/2022/10/Global-leaders-use-hydrogen-to-reduce-aviation-emissions/',
-    'https://www.swinburne.edu.au/news/2014/06/swinburne-helps-local-retailers--1/',
-    'https://www.swinburne.edu.au/news/2017/07/fire-station-renovation-heats-up-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2018/02/the-hi-tech-future-of-automotive-plastic-repairs/',
-    'https://www.swinburne.edu.au/news/2020/10/2020-australian-graduate-of-the-year-awards/',
-    'https://www.swinburne.edu.au/news/2022/08/snowpiercer-tv-series-inspires-new-chip-that-could-replace-gps/',
-    'https://www.swinburne.edu.au/news/2024/08/swinburne-physicists-enjoy-early-career-funding-success/',
-    'https://www.swinburne.edu.au/news/2014/08/new-colombo-plan-scholarship-for-swinburne-student/',
-    'https://www.swinburne.edu.au/news/2021/08/national-science-week-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2021/10/cyber-academy-to-help-grow-cybersecurity-workforce/',
-    'https://www.swinburne.edu.au/news/2022/04/student-movie-moguls-curate-films-for-acmis-streaming-service/',
-    'https://www.swinburne.edu.au/news/2015/05/nothing-has-changed-since-indigenous-higher-ed-review/',
-    'https://www.swinburne.edu.au/news/2016/08/so-what-do-we-really-know-about-entrepreneurship/',
-    'https://www.swinburne.edu.au/news/2014/11/swinburne-wins-2014-australasian-green-gown-award/',
-    'https://www.swinburne.edu.au/news/2017/03/cultural-diversity-now-showing-at-federation-square/',
-    'https://www.swinburne.edu.au/news/2014/11/historic-landing-on-a-comet/',
-    'https://www.swinburne.edu.au/news/2019/08/opinion-stiffer-penalties-wont-bring-bankers-to-account/',
-    'https://www.swinburne.edu.au/news/2024/04/swinburne-ushers-in-new-era-of-student-representation/',
-    'https://www.swinburne.edu.au/news/2015/06/swinburne-astrotours-celebrate-25000-visitors/',
-    'https://www.swinburne.edu.au/news/2021/11/Pop-culture-podcasts-and-student-centred-learning/',
-    'https://www.swinburne.edu.au/news/2019/12/swinburne-experts-relive-the-best-space-news-of-2019/',
-    'https://www.swinburne.edu.au/news/2017/01/demand-for-swinburne-courses-soars-in-2017/',
-    'https://www.swinburne.edu.au/news/2019/03/new-optical-pulse-seen-in-micro-combs-may-unlock-practical-applications/',
-    'https://www.swinburne.edu.au/news/2020/06/new-partnership-in-lightning-protection/',
-    'https://www.swinburne.edu.au/news/2022/09/swinburne-launches-trimble-technology-lab-to-create-next-gen-workforce/',
-    'https://www.swinburne.edu.au/news/2023/02/swinburne-alum-pioneering-human-centred-design/',
-    'https://www.swinburne.edu.au/news/2014/01/swinburne-journalism-students-put-vcat-under-the-spotlight/',
-    'https://www.swinburne.edu.au/news/2018/08/swinburne-young-mums-apply-for-victorian-government-grant/',
-    'https://www.swinburne.edu.au/news/2019/10/swinburne-graduate-sue-bolton-drives-global-change-at-netflix/',
-    'https://www.swinburne.edu.au/news/2019/10/water-engineer-secures-vcs-research-fellowship-for-women-in-stem/',
-    'https://www.swinburne.edu.au/news/2015/08/the-resolutely-unpredictable-rolf-de-heer/',
-    'https://www.swinburne.edu.au/news/2015/10/young-researcher-heads-to-china-for-exchange-program/',
-    'https://www.swinburne.edu.au/news/2015/12/rainwater-tanks-save-melbourne-households-137-litres-of-water-per-day/',
-    'https://www.swinburne.edu.au/news/2018/07/new-engineering-program-strives-for-gender-equity/',
-    'https://www.swinburne.edu.au/news/2019/01/swinburne-research-shows-cannabis-use-in-teens-associated-with-brain-volume/',
-    'https://www.swinburne.edu.au/news/2022/11/history-and-heritage-inspire-creativity/',
-    'https://www.swinburne.edu.au/news/2018/08/swinburne-and-ceva-collaborate-to-deliver-supply-chain-course/',
-    'https://www.swinburne.edu.au/news/2021/12/swinburne-astronomers-with-front-row-seat-to-scientific-history/',
-    'https://www.swinburne.edu.au/news/2017/08/afternoon-slump-or-the-brains-expectations-at-work/',
-    'https://www.swinburne.edu.au/news/2014/12/a-tribute-to-george-collins/',
-    'https://www.swinburne.edu.au/news/2017/05/swinburne-partners-with-richmond-football-club/',
-    'https://www.swinburne.edu.au/news/2017/10/swinburne-vcal-students-connect-with-local-community/',
-    'https://www.swinburne.edu.au/news/2020/11/swinburne-launches-face-mask-range-with-bespoke-indigenous-designs/',
-    'https://www.swinburne.edu.au/news/2022/11/award-winning-interior-design-tackles-social-issues/',
-    'https://www.swinburne.edu.au/news/2015/09/how-marketers-condition-us-to-buy-more-junk-food/',
-    'https://www.swinburne.edu.au/news/2017/03/exploring-the-art-of-writing-with-australias-best/',
-    'https://www.swinburne.edu.au/news/2017/09/how-shopping-centres-are-changing-to-fight-online-shopping/',
-    'https://www.swinburne.edu.au/news/2019/07/mediterranean-diet-and-exercise-research-secures-177-million-funding/',
-    'https://www.swinburne.edu.au/news/2015/04/swinburne-leadership-survey-launched/',
-    'https://www.swinburne.edu.au/news/2016/04/robots-can-help-young-patients-engage-in-rehab/',
-    'https://www.swinburne.edu.au/news/2020/02/swinburne-student-gains-valuable-insight-into-future-work-at-siemens/',
-    'https://www.swinburne.edu.au/news/2016/01/who-is-afraid-of-pegida/',
-    'https://www.swinburne.edu.au/news/2018/05/the-sound-that-light-makes-connecting-architecture-to-nature/',
-    'https://www.swinburne.edu.au/news/2022/02/The-legacy-of-Pio-Swinburne-scholarship-supporting-our-next-gen-engineers/',
-    'https://www.swinburne.edu.au/news/2014/02/un-designing-apathy-designs-for-systems-of-caring/',
-    'https://www.swinburne.edu.au/news/2015/01/campbell-newman-and-the-ghost-of-joh-bjelke-petersen/',
-    'https://www.swinburne.edu.au/news/2016/10/gold-for-swinburne-at-worldskills/',
-    'https://www.swinburne.edu.au/news/2017/01/australia-day-honours-for-swinburne-community/',
-    'https://www.swinburne.edu.au/news/2019/05/every-generation-has-a-legend/',
-    'https://www.swinburne.edu.au/news/2019/04/three-years-in-is-the-aflw-kicking-goals/',
-    'https://www.swinburne.edu.au/news/2020/03/australians-urged-to-come-together-online-to-beat-covid-19/',
-    'https://www.swinburne.edu.au/news/2020/08/who-is-kamala-harris-joe-bidens-pick-for-vice-president/',
-    'https://www.swinburne.edu.au/news/2018/03/swinburne-to-establish-world-first-industry-40-testlab/',
-    'https://www.swinburne.edu.au/news/2023/01/what-are-gravitational-waves/',
-    'https://www.swinburne.edu.au/news/2014/04/swinburne-scientist-keeps-afl-players-up-to-speed-1/',
-    'https://www.swinburne.edu.au/news/2019/11/swinburne-physicist-professor-margaret-reid-wins-moyal-medal/',
-    'https://www.swinburne.edu.au/news/2014/05/star-swinburne-film-and-television-grad-headed-to-hollywood/',
-    'https://www.swinburne.edu.au/news/2015/06/swinburne-celebrates-queens-birthday-honours-2015/',
-    'https://www.swinburne.edu.au/news/2017/04/the-monster-galaxy-that-grew-up-too-fast/',
-    'https://www.swinburne.edu.au/news/2018/10/react-video-humanises-truck-drivers-as-they-share-experiences/',
-    'https://www.swinburne.edu.au/news/2017/07/spiral-arms-allow-school-children-to-weigh-black-holes/',
-    'https://www.swinburne.edu.au/news/2015/09/want-your-kids-to-learn-another-language-teach-them-code/',
-    'https://www.swinburne.edu.au/news/2015/11/swinburne-students-work-on-international-drone-project/',
-    'https://www.swinburne.edu.au/news/2018/07/we-asked-five-experts-is-cheese-bad-for-you/',
-    'https://www.swinburne.edu.au/news/2021/10/swinburne-sarawak-alum-nayeem-yeasir-grocery-business/',
-    'https://www.swinburne.edu.au/news/2017/12/award-winning-swinburne-thesis-explores-gender-in-stem-management/',
-    'https://www.swinburne.edu.au/news/2019/07/most-adults-have-never-heard-of-tiktok-thats-by-design/',
-    'https://www.swinburne.edu.au/news/2023/03/study-shows-garden-appreciation-boosts-wellbeing/',
-    'https://www.swinburne.edu.au/news/2016/01/the-hateful-eight-review-and-cast-interview/',
-    'https://www.swinburne.edu.au/news/2017/06/swinburne-continues-to-rise-in-qs-world-university-rankings/',
-    'https://www.swinburne.edu.au/news/2018/08/next-generation-condom-secures-1-million-government-funding/',
-    'https://www.swinburne.edu.au/news/2022/08/wi-fi-patchy-swinburne-researchers-could-have-the-5g-solution/',
-    'https://www.swinburne.edu.au/news/2015/11/the-moment-i-knew-swinburne-was-right-for-me/',
-    'https://www.swinburne.edu.au/news/2016/06/swinburne-continues-its-commitment-to-support-refugees/',
-    'https://www.swinburne.edu.au/news/2017/08/swinburne-graduates-make-their-venice-film-festival-debut/',
-    'https://www.swinburne.edu.au/news/2017/02/swinburne-celebrates-industry-research-success-in-crc-projects-stream/',
-    'https://www.swinburne.edu.au/news/2017/10/reward-system-broken-for-those-with-bipolar-disorder/',
-    'https://www.swinburne.edu.au/news/2020/06/students-lead-the-be-a-better-human-campaign-online/',
-    'https://www.swinburne.edu.au/news/2022/10/a-seven-million-dollar-grant-to-grow-stem-cell-research/',
-    'https://www.swinburne.edu.au/news/2019/07/unique-swinburne-short-courses-offer-skills-for-the-space-industry/',
-    'https://www.swinburne.edu.au/news/2019/11/swinburne-business-subjects-leap-in-times-higher-education-rankings/',
-    'https://www.swinburne.edu.au/news/2014/03/ultracold-research-paves-the-way-to-discover-new-phenomena/',
-    'https://www.swinburne.edu.au/news/2016/07/swinburne-to-offer-new-bachelor-of-nursing/',
-    'https://www.swinburne.edu.au/news/2016/11/study-confirms-partner-violence-leading-health-risk-factor-for-women/',
-    'https://www.swinburne.edu.au/news/2018/04/new-wm-keck-observatory-remote-viewing-facility-opens-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2019/05/what-now-for-game-of-thrones-multimedia-fans/',
-    'https://www.swinburne.edu.au/news/2019/07/sports-science-embraces-virtual-technology-at-swinburne-open-day/',
-    'https://www.swinburne.edu.au/news/2014/01/medical-imaging-breakthrough-may-lead-to-early-cancer-detection/',
-    'https://www.swinburne.edu.au/news/2017/10/healthy-food-is-key-to-a-healthy-mind/',
-    'https://www.swinburne.edu.au/news/2023/05/phd-student-goes-to-the-2023-un-water-conference/',
-    'https://www.swinburne.edu.au/news/2023/08/new-5-2m-supercomputer-enhances-high-impact-research-around-Australia/',
-    'https://www.swinburne.edu.au/news/2023/10/cultural-impacts-of-australian-kid-tv-last-for-decades/',
-    'https://www.swinburne.edu.au/news/2016/03/celebrating-cultural-diversity-through-food/',
-    'https://www.swinburne.edu.au/news/2016/08/eating-a-mediterranean-diet-can-improve-your-mind/',
-    'https://www.swinburne.edu.au/news/2018/06/swinburne-ranks-in-top-50-of-young-universities/',
-    'https://www.swinburne.edu.au/news/2015/04/film-students-take-on-bollywood-for-study-tour-/',
-    'https://www.swinburne.edu.au/news/2014/01/swinburne-sends-first-honours-student-to-italian-synchrotron/',
-    'https://www.swinburne.edu.au/news/2020/10/education-in-the-new-space-industry/',
-    'https://www.swinburne.edu.au/news/2020/12/swinburne-2020-design-graduate-folios-online/',
-    'https://www.swinburne.edu.au/news/2018/03/swinburne-launches-11-m-cisco-networking-academy-teaching-facility/',
-    'https://www.swinburne.edu.au/news/2018/06/village-cinemas-teams-with-swinburne-for-unscene-film-festival/',
-    'https://www.swinburne.edu.au/news/2018/12/new-project-to-advance-women-and-girls-in-stem/',
-    'https://www.swinburne.edu.au/news/2014/04/dori-tunstall-un-doing-white-privilege-a-love-letter/',
-    'https://www.swinburne.edu.au/news/2017/10/swinburne-and-immerse-art-festival-take-over-the-east/',
-    'https://www.swinburne.edu.au/news/2015/03/swinburne-turning-phds-on-their-head/',
-    'https://www.swinburne.edu.au/news/2015/08/the-science-and-fiction-behind-blade-runner/',
-    'https://www.swinburne.edu.au/news/2017/06/swinburne-design-graduate-named-best-of-the-year/',
-    'https://www.swinburne.edu.au/news/2017/09/xero-and-swinburne-spearhead-new-learning-platform/',
-    'https://www.swinburne.edu.au/news/2018/03/swinburnes-professor-timos-sellis-wins-prestigious-impact-award/',
-    'https://www.swinburne.edu.au/news/2014/05/swinburne-alumni-return-to-talk-to-current-advertising-students/',
-    'https://www.swinburne.edu.au/news/2018/11/swinburne-lecturer-wins-screen-producers-australia-lifetime-award/',
-    'https://www.swinburne.edu.au/news/2019/03/finding-a-home-in-australia/',
-    'https://www.swinburne.edu.au/news/2021/02/melbhenge-sunset-spectacle-offers-rare-photo-opportunity/',
-    'https://www.swinburne.edu.au/news/2017/05/budgets-good-debt-underpins-70b-plus-infrastructure-program/',
-    'https://www.swinburne.edu.au/news/2017/10/swinburne-sponsored-f1-school-team-wins-world-championship/',
-    'https://www.swinburne.edu.au/news/2019/08/delivering-new-concepts-for-urban-citizens/',
-    'https://www.swinburne.edu.au/news/2023/08/swinburne-alum-enables-ten-inaugural-study-abroad-scholarships/',
-    'https://www.swinburne.edu.au/news/2014/05/monster-black-holes-supersize-their-galactic-greed/',
-    'https://www.swinburne.edu.au/news/2019/04/new-dean-brings-media-experience-to-arts-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2019/06/swinburne-students-take-a-stand-against-bullying/',
-    'https://www.swinburne.edu.au/news/2020/04/global-database-for-water-use-efficiency-compiled-from-tree-ring-data/',
-    'https://www.swinburne.edu.au/news/2016/09/seeing-epilepsy-with-surgical-precision/',
-    'https://www.swinburne.edu.au/news/2023/02/swinburne-film-and-tv-research-leads-new-zombie-exhibit/',
-    'https://www.swinburne.edu.au/news/2014/01/margaret-wertheim-the-heart-of-innovation/',
-    'https://www.swinburne.edu.au/news/2014/06/on-the-costs-of-mega-science-projects/',
-    'https://www.swinburne.edu.au/news/2017/07/the-inside-of-cells-as-never-seen-before/',
-    'https://www.swinburne.edu.au/news/2021/03/swinburne-students-driving-innovative-science-research-to-market/',
-    'https://www.swinburne.edu.au/news/2015/12/people-with-high-autistic-tendencies-see-the-world-very-differently/',
-    'https://www.swinburne.edu.au/news/2018/02/new-partnership-aims-to-raise-early-childhood-education-workforce-quality/',
-    'https://www.swinburne.edu.au/news/2023/12/swinburne-students-take-off-with-new-colombo-plan-scholarships/',
-    'https://www.swinburne.edu.au/news/2018/10/swinburne-researcher-develops-coating-to-prevent-corrosion-on-ships/',
-    'https://www.swinburne.edu.au/news/2019/07/ddb-and-mcdonalds-join-advertising-capstone-challenge-australia/',
-    'https://www.swinburne.edu.au/news/2020/07/festo-tum-swinburne-mou/',
-    'https://www.swinburne.edu.au/news/2021/08/swinburne-climbs-global-academic-rankings/',
-    'https://www.swinburne.edu.au/news/2015/01/more-offers-higher-entry-scores-for-degrees-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2016/06/swinburne-helps-shape-higher-education-teaching/',
-    'https://www.swinburne.edu.au/news/2017/07/lifesaving-wheelbarrow-redesign-praised-by-sir-james-dyson/',
-    'https://www.swinburne.edu.au/news/2017/12/swinburne-student-wins-national-award-for-motion-graphics-/',
-    'https://www.swinburne.edu.au/news/2018/10/advanced-manufacturing-industry-40-hub-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2019/11/the-impact-of-landmark-images-in-mobile-mapping-apps/',
-    'https://www.swinburne.edu.au/news/2017/02/exchange-between-nica-and-the-beijing-international-arts-school/',
-    'https://www.swinburne.edu.au/news/2017/06/swinburne-to-lead-pulsar-timing-instrument-design/',
-    'https://www.swinburne.edu.au/news/2017/06/swinburne-studentsmake-digital-stories-for-aged-cared-residents/',
-    'https://www.swinburne.edu.au/news/2018/05/report-backs-online-education-for-student-teachers/',
-    'https://www.swinburne.edu.au/news/2014/10/swinburne-releases-its-first-sustainability-report/',
-    'https://www.swinburne.edu.au/news/2016/06/new-app-is-changing-the-game-for-soccer-referees/',
-    'https://www.swinburne.edu.au/news/2017/05/more-philanthropy-means-more-risk-taking--and-thats-good/',
-    'https://www.swinburne.edu.au/news/2017/06/swinburne-continues-to-rise-the-qs-world-university-rankings/',
-    'https://www.swinburne.edu.au/news/2021/11/NHMRC-ideas-grants-awarded-swinburne-researchers/',
-    'https://www.swinburne.edu.au/news/2016/05/meet-cleverman-our-first-aboriginal-screen-superhero/',
-    'https://www.swinburne.edu.au/news/2015/05/swinburne-partners-with-tongji-university/',
-    'https://www.swinburne.edu.au/news/2016/02/parts-and-components-trade-may-well-save-the-economy/',
-    'https://www.swinburne.edu.au/news/2016/09/astronomers-find-diversity-in-ancient-universe/',
-    'https://www.swinburne.edu.au/news/2020/01/putting-humanitarian-work-on-the-map/',
-    'https://www.swinburne.edu.au/news/2020/07/public-relations-lockdown/',
-    'https://www.swinburne.edu.au/news/2014/10/swinburne-film-and-television-hits-the-big-time/',
-    'https://www.swinburne.edu.au/news/2019/05/swinburne-students-smash-top-spin-design-competition/',
-    'https://www.swinburne.edu.au/news/2014/01/stop-worrying-and-learn-to-love-online-retail/',
-    'https://www.swinburne.edu.au/news/2014/10/swinburne-robotics-students-win-autocrc-award-1/',
-    'https://www.swinburne.edu.au/news/2015/08/swinburnes-kate-herbert-a-finalist-in-victorian-training-awards/',
-    'https://www.swinburne.edu.au/news/2014/07/revaluating-craft-in-australia-and-india/',
-    'https://www.swinburne.edu.au/news/2020/11/swinburne-students-examine-the-old-adage-boys-will-be-boys-to-raise-awareness-around-the-prevention-of-family-violence/',
-    'https://www.swinburne.edu.au/news/2014/11/victorian-lead-scientist-leonie-walsh-honoured-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2020/04/reconceptualising-hands-on-design/',
-    'https://www.swinburne.edu.au/news/2021/11/swinburne-welcomes-international-students-back-to-campus/',
-    'https://www.swinburne.edu.au/news/2016/05/new-partnership-with-university-of-malaya/',
-    'https://www.swinburne.edu.au/news/2020/11/seeing-dark-matter-in-a-new-light/',
-    'https://www.swinburne.edu.au/news/2022/08/swinburne-students-provide-tech-talent-for-non-profits/',
-    'https://www.swinburne.edu.au/news/2022/11/swinburne-staff-vote-in-landmark-vet-enterprise-agreement/',
-    'https://www.swinburne.edu.au/news/2016/10/graduate-designs-wearable-device-to-monitor-core-body-temperature/',
-    'https://www.swinburne.edu.au/news/2020/04/swinburne-appoints-new-deputy-vice-chancellor-research-and-enterprise/',
-    'https://www.swinburne.edu.au/news/2021/04/Swinburne-lecturer-creates-lego-stop-motion-animations-to-teach-maths/',
-    'https://www.swinburne.edu.au/news/2014/04/a-hot-new-model-at-the-australian-indigenous-fashion-week-1/',
-    'https://www.swinburne.edu.au/news/2019/04/swinburne-researchers-use-blockchain-technology-to-prevent-art-forgery/',
-    'https://www.swinburne.edu.au/news/2023/02/New-research-from-CSIRO-and-Swinburne-on-UN-International-Day-of-Women-and-Girls-in-Science/',
-    'https://www.swinburne.edu.au/news/2019/09/swinburne-comic-artist-begins-abc-residency-/',
-    'https://www.swinburne.edu.au/news/2019/02/swinburne-takes-digital-school-in-a-van-to-pakistan/',
-    'https://www.swinburne.edu.au/news/2015/04/graphene-champions-the-next-generation-3d-display-technology/',
-    'https://www.swinburne.edu.au/news/2015/04/un-doing-awareness-do-smart-watches-make-dumb-humans/',
-    'https://www.swinburne.edu.au/news/2016/09/swinburne-ranks-in-worlds-top-200-universities-for-science/',
-    'https://www.swinburne.edu.au/news/2017/06/swinburne-alumnus-garth-davis-receives-accolades-for-his-debut-film-lion/',
-    'https://www.swinburne.edu.au/news/2014/03/swinburne-student-wins-overall-graduate-of-the-year-award/',
-    'https://www.swinburne.edu.au/news/2021/08/highlights-from-the-tokyo-2020-olympics/',
-    'https://www.swinburne.edu.au/news/2022/01/swinburne-extends-aflw-partnership-with-richmond-fc-to-2024/',
-    'https://www.swinburne.edu.au/news/2016/08/new-transport-innovation-centre-opens-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2019/12/leading-criminal-justice-scholar-appointed-new-dean-of-swinburne-law-school/',
-    'https://www.swinburne.edu.au/news/2020/05/providing-free-meals-for-our-international-and-local-students/',
-    'https://www.swinburne.edu.au/news/2023/09/swinburne-business-and-carpentry-alum-building-up-apprentices/',
-    'https://www.swinburne.edu.au/news/2014/04/on-global-warming-settled-science-and-george-brandis/',
-    'https://www.swinburne.edu.au/news/2015/12/indigenous-trade-program-teaches-skills-needed-to-build-communities/',
-    'https://www.swinburne.edu.au/news/2016/05/road-safety-campaign-award-for-swinburne-student-chloe-young/',
-    'https://www.swinburne.edu.au/news/2022/09/next-gen-materials-take-flight-with-swinburne-research/',
-    'https://www.swinburne.edu.au/news/2014/02/swinburne-signs-deal-to-develop-electric-buses-for-malaysia/',
-    'https://www.swinburne.edu.au/news/2021/03/swinburne-joins-new-sustainability-and-waste-consortium/',
-    'https://www.swinburne.edu.au/news/2018/09/how-the-housing-boom-has-driven-rising-inequality/',
-    'https://www.swinburne.edu.au/news/2019/04/dual-sector-vcs-call-for-more-connection-between-two-systems/',
-    'https://www.swinburne.edu.au/news/2019/06/swinburnes-new-not-for-profit-professional-placement-model-funds-first-student/',
-    'https://www.swinburne.edu.au/news/2021/03/q-and-a-with-professor-jean-brodie/',
-    'https://www.swinburne.edu.au/news/2015/09/yes-google-has-a-new-logo--but-why/',
-    'https://www.swinburne.edu.au/news/2014/05/first-measurement-of-a-day-on-alien-planet/',
-    'https://www.swinburne.edu.au/news/2018/03/tributes-pour-in-for-stephen-hawking/',
-    'https://www.swinburne.edu.au/news/2020/12/pave-staff-member-honoured-with-lifetime-achievement-award/',
-    'https://www.swinburne.edu.au/news/2016/03/world-renowned-for-design-qs-ranks-swinburne-in-top-50/',
-    'https://www.swinburne.edu.au/news/2018/08/swinburne-hosts-first-australian-node-in-iaac-global-summer-school/',
-    'https://www.swinburne.edu.au/news/2014/08/catching-the-renewable-energy-wave/',
-    'https://www.swinburne.edu.au/news/2016/07/swinburnes-civil-engineering-lab-tests-real-world-construction/',
-    'https://www.swinburne.edu.au/news/2016/07/loneliness-can-lead-to-poor-mental-health/',
-    'https://www.swinburne.edu.au/news/2019/04/swinburne-students-foster-respectful-campus-culture/',
-    'https://www.swinburne.edu.au/news/2020/07/providing-mental-health-support-for-youths-affected-by-covid-19/',
-    'https://www.swinburne.edu.au/news/2014/11/ageing-well-with-harvard-universitys-professor-george-vaillant/',
-    'https://www.swinburne.edu.au/news/2019/11/stem-students-compete-in-new-start-talking-public-speaking-competition-/',
-    'https://www.swinburne.edu.au/news/2015/08/swinburne-makes-grand-final-of-microsoft-protege-competition-/',
-    'https://www.swinburne.edu.au/news/2017/05/swinburne-and-leo-cussen-to-accelerate-graduates-into-legal-practice/',
-    'https://www.swinburne.edu.au/news/2022/02/australia-imposes-economic-sanctions-on-russia/',
-    'https://www.swinburne.edu.au/news/2022/04/healthy-hearts-for-an-overlooked-group/',
-    'https://www.swinburne.edu.au/news/2018/02/online-course-to-support-new-higher-education-teachers/',
-    'https://www.swinburne.edu.au/news/2022/07/Swinburne-continues-expansion-vietnam/',
-    'https://www.swinburne.edu.au/news/2022/10/solving-cyber-fraud-in-four-days-an-innovation-masterclass/',
-    'https://www.swinburne.edu.au/news/2016/05/thermo-fisher-scientific-joins-swinburnes-factory-of-the-future/',
-    'https://www.swinburne.edu.au/news/2016/06/the-next-solar-revolution-replacing-fossil-fuels-----/',
-    'https://www.swinburne.edu.au/news/2018/10/delivering-innovative-supply-chain-education-with-coca-cola-amatil/',
-    'https://www.swinburne.edu.au/news/2017/09/swinburne-ranks-top-420-in-times-higher-education-world-university-rankings/',
-    'https://www.swinburne.edu.au/news/2020/06/dr-emma-lee-joins-national-co-design-group-for-indigenous-voice/',
-    'https://www.swinburne.edu.au/news/2021/10/swinburne-launches-college-at-prestigious-sdust-uni-in-China/',
-    'https://www.swinburne.edu.au/news/2023/11/Industry-connections-and-experience/',
-    'https://www.swinburne.edu.au/news/2020/02/brain-temperature-can-now-be-measured-using-light/',
-    'https://www.swinburne.edu.au/news/2015/11/white-ribbon-day-let-the-world-know-where-you-stand/',
-    'https://www.swinburne.edu.au/news/2016/11/trials-for-smartphone-app-to-combat-loneliness-begin/',
-    'https://www.swinburne.edu.au/news/2018/01/students-on-path-to-combat-youth-mental-health-statistics/',
-    'https://www.swinburne.edu.au/news/2020/05/looking-after-the-mental-health-of-older-australians/',
-    'https://www.swinburne.edu.au/news/2023/08/australian-businesses-at-risk-due-to-poor-information-governance/',
-    'https://www.swinburne.edu.au/news/2014/06/oneworld-summit-a-conference-to-change-the-world-1/',
-    'https://www.swinburne.edu.au/news/2015/07/new-research-on-treating-trichotillomania/',
-    'https://www.swinburne.edu.au/news/2017/01/empowering-the-next-wave-of-entrepreneurs/',
-    'https://www.swinburne.edu.au/news/2021/07/improving-safety-barriers-to-reduce-road-deaths-and-serious-injuries/',
-    'https://www.swinburne.edu.au/news/2022/09/swinburne-support-for-under-represented-students-wins-good-design-award/',
-    'https://www.swinburne.edu.au/news/2016/03/it-students-click-with-schools-in-india/',
-    'https://www.swinburne.edu.au/news/2017/06/swinburne-researcher-says-women-have-a-natural-advantage-in-the-sciences/',
-    'https://www.swinburne.edu.au/news/2019/05/how-doping-boosts-next-gen-solar-cells-towards-commercialisation/',
-    'https://www.swinburne.edu.au/news/2017/06/the-atm-celebrates-50-years-but-were-using-it-less/',
-    'https://www.swinburne.edu.au/news/2015/06/swinburne-creates-new-online-media-course-for-indigenous-australians/',
-    'https://www.swinburne.edu.au/news/2017/11/makers-team-up-in-race-to-create-prototypes-in-72-hours/',
-    'https://www.swinburne.edu.au/news/2015/12/swinburnes-school-of-design-partners-with-yonsei-university/',
-    'https://www.swinburne.edu.au/news/2018/05/swinburne-students-win-motorola-solutions-2018-public-safety-hackathon/',
-    'https://www.swinburne.edu.au/news/2019/12/gender-equity-driving-cultural-change-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2015/05/laser-technique-for-low-cost-self-assembly-of-nanostructures/',
-    'https://www.swinburne.edu.au/news/2015/09/swinburne-law-scholar-receives-state-library-of-victoria-fellowship/',
-    'https://www.swinburne.edu.au/news/2017/12/social-phobia-linked-to-autism-and-schizophrenia/',
-    'https://www.swinburne.edu.au/news/2014/11/life-saving-bushfire-shelter-developed-in-melbourne/',
-    'https://www.swinburne.edu.au/news/2015/12/creating-a-career-in-fashion/',
-    'https://www.swinburne.edu.au/news/2017/06/order-of-australia-for-swinburne-vice-chancellor/',
-    'https://www.swinburne.edu.au/news/2019/09/communication-design-students-take-road-safety-campaign-to-transurban/',
-    'https://www.swinburne.edu.au/news/2014/04/swinburne-research-exposes-servo-swindle/',
-    'https://www.swinburne.edu.au/news/2014/06/new-technique-controls-fluids-at-the-nanoscale/',
-    'https://www.swinburne.edu.au/news/2014/09/from-northern-frontier-to-front-door/',
-    'https://www.swinburne.edu.au/news/2015/12/13-million-in-future-fellowships-awarded-to-swinburne/',
-    'https://www.swinburne.edu.au/news/2019/07/clever-ideas-to-reduce-tyre-dust-in-our-waterways/',
-    'https://www.swinburne.edu.au/news/2022/05/remarkable-cosmic-telescope-reveals-inner-workings-of-two-proto-galaxies/',
-    'https://www.swinburne.edu.au/news/2015/12/new-partnership-brings-innovative-technology-to-wine-production/',
-    'https://www.swinburne.edu.au/news/2017/06/swinburne-graduate-creates-a-new-video-game-called-putty-pals/',
-    'https://www.swinburne.edu.au/news/2020/03/bendable-safe-long-lasting-and-green-cement-free-concrete-developed-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2024/05/Everyone-has-the-same-24-hours-each-day-new-research-reveals-how-much-of-this-time-you-should-spend-sitting-sleeping-standing-and-being-active-for-optimal-health/',
-    'https://www.swinburne.edu.au/news/2015/09/swinburne-partners-with-lido-cinemas-to-screen-alumni-films/',
-    'https://www.swinburne.edu.au/news/2016/09/measuring-aggression-in-mental-health-patients/',
-    'https://www.swinburne.edu.au/news/2017/05/road-safety-campaign-focuses-on-the-morning-after-drinking/',
-    'https://www.swinburne.edu.au/news/2018/06/swinburne-continues-to-rise-in-qs-rankings/',
-    'https://www.swinburne.edu.au/news/2020/08/ultra-thin-lens-breakthrough-could-revolutionise-miniature-cameras/',
-    'https://www.swinburne.edu.au/news/2015/12/nao-the-humanoid-robot-will-assist-in-paediatric-rehabilitation/',
-    'https://www.swinburne.edu.au/news/2016/01/first-preferences-up-scholarship-offers-up-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2017/12/unlocking-the-brain-at-swinburnes-centre-for-mental-health/',
-    'https://www.swinburne.edu.au/news/2019/03/leading-the-way-in-industry-40/',
-    'https://www.swinburne.edu.au/news/2016/06/swinburne-students-learn-in-a-mock-shop/',
-    'https://www.swinburne.edu.au/news/2021/09/swinburne-first-australian-uni-in-world-retail-congress-contest/',
-    'https://www.swinburne.edu.au/news/2021/10/swinburne-welcomes-international-students-return-plan/',
-    'https://www.swinburne.edu.au/news/2014/11/efficiency-breakthrough-for-state-of-the-art-solar-devices/',
-    'https://www.swinburne.edu.au/news/2015/03/what-safeguards-are-in-australias-data-retention-plans/',
-    'https://www.swinburne.edu.au/news/2015/08/swinburne-conducts-research-into-auditory-verbal-hallucinations/',
-    'https://www.swinburne.edu.au/news/2015/09/lets-keep-this-refugee-announcement-in-perspective/',
-    'https://www.swinburne.edu.au/news/2018/02/swinburne-aviation-experts-launch-book-on-airline-operations/',
-    'https://www.swinburne.edu.au/news/2019/01/vtac-offers-show-growing-demand-for-swinburne-professional-degrees/',
-    'https://www.swinburne.edu.au/news/2014/01/to-each-their-own-no-longer-applies-to-china/',
-    'https://www.swinburne.edu.au/news/2019/09/swinburne-software-engineer-named-most-influential-asian-australian-under-40/',
-    'https://www.swinburne.edu.au/news/2023/04/five-reasons-to-study-overseas-in-2023/',
-    'https://www.swinburne.edu.au/news/2014/12/swinburne-student-daniel-eastwood-whitaker-wins-trip-of-a-lifetime/',
-    'https://www.swinburne.edu.au/news/2015/09/refugees-its-a-question-of-dignity/',
-    'https://www.swinburne.edu.au/news/2014/10/beyond-deterrence-reframing-the-asylum-seeker-debate/',
-    'https://www.swinburne.edu.au/news/2020/08/swinburne-face-masks-designed-to-encourage-social-connection/',
-    'https://www.swinburne.edu.au/news/2014/08/australias-un-doing-of-voter-intimidation/',
-    'https://www.swinburne.edu.au/news/2019/03/swinburne-researchers-develop-skin-tissue-to-advance-bandage-technology/',
-    'https://www.swinburne.edu.au/news/2019/07/regional-policy-problems-the-case-of-timor-leste/',
-    'https://www.swinburne.edu.au/news/2022/05/what-new-data-on-leadership-trends-reveals-about-australians/',
-    'https://www.swinburne.edu.au/news/2023/01/swinburne-master-students-success-at-the-idea-gala/',
-    'https://www.swinburne.edu.au/news/2015/07/greeces-humiliation-a-terrible-result-for-germany/',
-    'https://www.swinburne.edu.au/news/2022/06/comic-tackles-climate-change-through-hydrogen-education/',
-    'https://www.swinburne.edu.au/news/2015/06/researchers-develop-a-guide-to-kids-educational-apps/',
-    'https://www.swinburne.edu.au/news/2016/10/happy-30th-anniversary-to-au-domains--what-comes-next/',
-    'https://www.swinburne.edu.au/news/2017/08/gamified-learning-app-named-finalist-in-higher-education-awards/',
-    'https://www.swinburne.edu.au/news/2017/11/charles-herschel-fellow-adam-elliot-mentoring-animation-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2018/08/exploring-indigenous-culture-in-north-america/',
-    'https://www.swinburne.edu.au/news/2018/12/swinburne-joins-national-industry-40-testlabs-pilot-program/',
-    'https://www.swinburne.edu.au/news/2019/06/prominent-lawyer-appointed-to-swinburne-council/',
-    'https://www.swinburne.edu.au/news/2015/05/unique-facility-opens-at-swinburne-for-testing-built-structures/',
-    'https://www.swinburne.edu.au/news/2017/04/swinburne-to-release-results-on-sexual-assault-survey/',
-    'https://www.swinburne.edu.au/news/2018/01/multigrain-wholegrain-wholemeal-which-bread-is-best/',
-    'https://www.swinburne.edu.au/news/2018/07/workers-remain-at-centre-of-digital-disruption/',
-    'https://www.swinburne.edu.au/news/2023/06/eyes-in-the-sky-space-weather-forecasting/',
-    'https://www.swinburne.edu.au/news/2024/04/swinburne-appoints-new-director-of-innovative-planet-research-institute/',
-    'https://www.swinburne.edu.au/news/2014/03/unlocking-the-genetic-secrets-of-wheat/',
-    'https://www.swinburne.edu.au/news/2015/06/swinburne-building-students-successful-at-2015-master-builders-awards/',
-    'https://www.swinburne.edu.au/news/2015/12/to-deliver-high-growth-startups-we-need-an-entrepreneurship-system/',
-    'https://www.swinburne.edu.au/news/2016/03/swinburne-creates-innovation-precinct/',
-    'https://www.swinburne.edu.au/news/2022/10/pioneering-markforged-3d-printer-makes-australian-debut/',
-    'https://www.swinburne.edu.au/news/2014/07/swinburne-study-investigates-youth-homelessness-in-yarra-ranges-shire/',
-    'https://www.swinburne.edu.au/news/2016/03/record-setting-leap-towards-ultra-secure-communication/',
-    'https://www.swinburne.edu.au/news/2019/06/swinburne-subjects-debut-in-global-ranking-of-academic-subjects-2019/',
-    'https://www.swinburne.edu.au/news/2015/05/swinburne-wins-university-research-of-the-year-for-spice-research/',
-    'https://www.swinburne.edu.au/news/2019/05/national-sorry-day-and-reconciliation-week-explained/',
-    'https://www.swinburne.edu.au/news/2021/04/Swinburne-supports-remote-communities-to-develop-trade-skills/',
-    'https://www.swinburne.edu.au/news/2022/03/space-junk-is-dangerous-but-its-also-an-opportunity/',
-    'https://www.swinburne.edu.au/news/2023/03/Swinburne-celebrates-international-womens-day/',
-    'https://www.swinburne.edu.au/news/2021/02/can-i-have-a-pet-and-be-housed-too-it-all-depends/',
-    'https://www.swinburne.edu.au/news/2015/10/swinburne-wins-industry-engagement-prize-at-afr-higher-education-awards/',
-    'https://www.swinburne.edu.au/news/2018/10/convenient-access-to-high-quality-teaching/',
-    'https://www.swinburne.edu.au/news/2020/01/australia-day-honours-for-swinburne-community/',
-    'https://www.swinburne.edu.au/news/2020/02/high-tech-shortages-loom-as-coronavirus-shutdowns-hit-manufacturers/',
-    'https://www.swinburne.edu.au/news/2020/02/why-government-needs-to-take-lead-role-in-decarbonisation/',
-    'https://www.swinburne.edu.au/news/2017/09/swinburne-awards-scholarship-to-way-to-olympia-peak-winner/',
-    'https://www.swinburne.edu.au/news/2016/08/swinburne-apprentice-wins-2016-victorian-apprentice-of-the-year/',
-    'https://www.swinburne.edu.au/news/2018/06/swinburne-launches-sports-media-course-with-partner-richmond-football-club/',
-    'https://www.swinburne.edu.au/news/2018/09/re-thinking-the-electronic-waste-problem/',
-    'https://www.swinburne.edu.au/news/2018/09/are-we-treating-body-dysmorphic-disorder-the-wrong-way-/',
-    'https://www.swinburne.edu.au/news/2019/09/new-report-shows-many-australians-cant-afford-digital-services/',
-    'https://www.swinburne.edu.au/news/2019/10/communicating-key-health-messages-to-support-culturally-diverse-women/',
-    'https://www.swinburne.edu.au/news/2021/04/Swinburne-film-student-creates-private-functions-best-music-video/',
-    'https://www.swinburne.edu.au/news/2015/08/swinburne-receives-five-stars-from-the-good-universities-guide-2016/',
-    'https://www.swinburne.edu.au/news/2016/07/swinburne-to-offer-new-bachelor-of-screen-production/',
-    'https://www.swinburne.edu.au/news/2017/09/bacteria-busters-capture-eureka-prize-for-swinburne/',
-    'https://www.swinburne.edu.au/news/2019/08/swinburne-student-awarded-women-in-water-scholarship/',
-    'https://www.swinburne.edu.au/news/2024/01/swinburne-community-receive-australia-day-honours/',
-    'https://www.swinburne.edu.au/news/2014/03/thousands-of-new-students-start-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2014/04/swinburne-college-students-given-real-workplace-experience/',
-    'https://www.swinburne.edu.au/news/2016/03/swinburne-offers-new-occupational-therapy-course/',
-    'https://www.swinburne.edu.au/news/2022/12/racism-infects-all-else-mcavoys-powerful-words-at-barak-wonga/',
-    'https://www.swinburne.edu.au/news/2021/08/swinburne-scores-world-leading-tech-for-space-manufacturing/',
-    'https://www.swinburne.edu.au/news/2022/07/nature-celebrates-thirty-years-of-innovation-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2022/11/2022-gradx-evolve-showcases-design-and-architecture-talent/',
-    'https://www.swinburne.edu.au/news/2016/11/digital-place-making-in-the-northern-territory/',
-    'https://www.swinburne.edu.au/news/2017/03/fact-check-what-laws-are-there-to-protect-me/',
-    'https://www.swinburne.edu.au/news/2022/11/how-entrepreneurship-saved-aussie-lives-when-covid-19-hit/',
-    'https://www.swinburne.edu.au/news/2024/08/swinburne-appoints-new-director-of-social-innovation-research-institute/',
-    'https://www.swinburne.edu.au/news/2015/06/swinburne-comes-out-for-marriage-equality/',
-    'https://www.swinburne.edu.au/news/2018/10/dr-nishar-hameed-wins-phillip-law-postdoctoral-award-for-physical-sciences/',
-    'https://www.swinburne.edu.au/news/2019/09/swinburne-rises-in-times-higher-education-world-university-rankings/',
-    'https://www.swinburne.edu.au/news/2022/03/two-year-anniversary-of-working-from-home/',
-    'https://www.swinburne.edu.au/news/2019/05/swinburne-research-investigates-making-water-into-clean-fuels/',
-    'https://www.swinburne.edu.au/news/2016/11/higher-property-prices-linked-to-income-inequality-study/',
-    'https://www.swinburne.edu.au/news/2018/02/schizophrenia-a-side-effect-of-human-development/',
-    'https://www.swinburne.edu.au/news/2018/05/swinburne-young-achiever-wins-inspirational-tafe-student-award/',
-    'https://www.swinburne.edu.au/news/2019/03/swinburne-startups-make-their-mark-in-india/',
-    'https://www.swinburne.edu.au/news/2023/05/co-designing-assistive-technologies-with-those-living-with-disabilities/',
-    'https://www.swinburne.edu.au/news/2017/05/defence-brings-together-industry-and-academia/',
-    'https://www.swinburne.edu.au/news/2019/06/swinburne-researchers-are-training-robots-to-relieve-chronic-pain/',
-    'https://www.swinburne.edu.au/news/2020/05/building-better-resilience-through-industry-40/',
-    'https://www.swinburne.edu.au/news/2014/10/whats-in-cough-syrup-that-could-help-with-down-syndrome/',
-    'https://www.swinburne.edu.au/news/2016/10/retirement-will-be-harder-for-future-australians/',
-    'https://www.swinburne.edu.au/news/2017/06/farmers-come-together-at-swinburne-to-share-their-experience-of-rural-suicide/',
-    'https://www.swinburne.edu.au/news/2018/05/pioneering-social-impact-educator-honoured-at-inaugural-liffman-lecture/',
-    'https://www.swinburne.edu.au/news/2020/11/professor-bronwyn-fox-awarded-prestigious-science-medal/',
-    'https://www.swinburne.edu.au/news/2023/01/Student-videos-guide-cancer-patients-through-treatment/',
-    'https://www.swinburne.edu.au/news/2024/08/swinburne-supports-acusensus-to-develop-innovative-road-worker-safety-device/',
-    'https://www.swinburne.edu.au/news/2014/11/latin-america-the-overlooked-trade-giant-of-australias-g20/',
-    'https://www.swinburne.edu.au/news/2015/08/be-rooted-learning-from-aboriginal-dyeing-and-weaving/',
-    'https://www.swinburne.edu.au/news/2019/07/swinburne-builds-on-high-australian-research-council-funding-success-rate/',
-    'https://www.swinburne.edu.au/news/2019/07/mash-turns-30-a-celebration-of-swinburnes-maths-and-stats-help-centre/',
-    'https://www.swinburne.edu.au/news/2019/10/lean-and-sustainable-lighting-by-swinburne-industrial-design-graduate/',
-    'https://www.swinburne.edu.au/news/2021/09/sustainability-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2024/08/campus-upgrades-everything-you-need-to-know/',
-    'https://www.swinburne.edu.au/news/2015/02/the-febrile-world-of-australian-politics-turnbull-vs-abbott/',
-    'https://www.swinburne.edu.au/news/2018/08/food-democracy-and-socially-responsible-design-features-in-new-book/',
-    'https://www.swinburne.edu.au/news/2020/03/self-confessed-space-nerd-earns-coveted-place-in-nasa-training-program/',
-    'https://www.swinburne.edu.au/news/2021/06/eleven-swinburne-computer-scientists-make-guide2researchs-top-200/',
-    'https://www.swinburne.edu.au/news/2017/01/8-reasons-to-look-into-outer-space-in-2017/',
-    'https://www.swinburne.edu.au/news/2019/07/the-financial-fallout-of-separation-issues/',
-    'https://www.swinburne.edu.au/news/2017/05/why-the-kpis-on-university-engagement-need-more-thought/',
-    'https://www.swinburne.edu.au/news/2017/10/swinburne-researchers-led-australian-efforts-to-study-gravitational-wave-event/',
-    'https://www.swinburne.edu.au/news/2023/03/swinburne-on-show-at-avalon/',
-    'https://www.swinburne.edu.au/news/2014/08/ithamar-avnon-remembered-at-swinburne-service-for-mh17-victims/',
-    'https://www.swinburne.edu.au/news/2015/06/swinburne-report-highlights-why-mid-life-women-are-facing-housing-insecurity/',
-    'https://www.swinburne.edu.au/news/2020/09/swinburne-student-reigns-third-worldwide-in-world-first-unisport-fifa-tournament/',
-    'https://www.swinburne.edu.au/news/2023/03/Latrobe-City-Council-and-Swinburne-University-of-Technology-collaborate-on-future-of-clean-green-air-mobility/',
-    'https://www.swinburne.edu.au/news/2022/12/students-show-how-sustainability-is-more-than-recycling/',
-    'https://www.swinburne.edu.au/news/2014/06/5-star-advanced-manufacturing-and-design-centre-opens-its-doors/',
-    'https://www.swinburne.edu.au/news/2016/09/barbara-dicker-oration-on-memory-and-dementia/',
-    'https://www.swinburne.edu.au/news/2024/04/tedx-is-coming-to-swinburne/',
-    'https://www.swinburne.edu.au/news/2017/05/a-short-history-of-anaesthesia/',
-    'https://www.swinburne.edu.au/news/2023/03/air-hub-welcomes-victorian-government-focus-on-advanced-air-mobility/',
-    'https://www.swinburne.edu.au/news/2024/06/Decorate-your-next-gen_campus-student-design-competition/',
-    'https://www.swinburne.edu.au/news/2015/06/swinburnes-myles-russell-cook-appointed-a-member-of-the-aiatsis/',
-    'https://www.swinburne.edu.au/news/2017/01/swinburne-success-at-the-california-film-awards/',
-    'https://www.swinburne.edu.au/news/2017/10/young-gay-men-prepare-for-retirement-better-than-their-predecessors/',
-    'https://www.swinburne.edu.au/news/2020/12/swinburne-wattle-symposium/',
-    'https://www.swinburne.edu.au/news/2024/01/aussie-led-international-team-develop-groundbreaking-new-platform-to-fast-track-lifesaving-brain-research/',
-    'https://www.swinburne.edu.au/news/2015/10/design-factory-students-head-to-stanford-university/',
-    'https://www.swinburne.edu.au/news/2016/10/swinburne-celebrates-five-year-anniversary-of-multi-faith-facility/',
-    'https://www.swinburne.edu.au/news/2018/08/inaugural-tom--university-launches-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2015/05/rohingya-boat-people-crisis-demands-regional-response/',
-    'https://www.swinburne.edu.au/news/2015/08/kiosc-careers-of-the-future-launched-at-swinburnes-wantirna-campus/',
-    'https://www.swinburne.edu.au/news/2020/07/ceramic-skins-insulate-buildings/',
-    'https://www.swinburne.edu.au/news/2015/05/making-a-practical-choice-to-study-vcal-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2020/05/bringing-post-fascist-rome-to-life-with-new-technologies/',
-    'https://www.swinburne.edu.au/news/2022/12/swinburne-vet-showcases-talent-at-worldskills/',
-    'https://www.swinburne.edu.au/news/2024/01/student-life-awards-celebrate-swinburnes-people-and-clubs/',
-    'https://www.swinburne.edu.au/news/2024/07/Swinburne-alum-launches-zine-celebrating-Asian-Australian-art-and-identity/',
-    'https://www.swinburne.edu.au/news/2016/10/swinburne-launches-advanced-manufacturing-research-centre-in-weihai/',
-    'https://www.swinburne.edu.au/news/2017/10/ozgrav-director-congratulates-2017-nobel-physics-prize-winners/',
-    'https://www.swinburne.edu.au/news/2020/05/getting-creative-with-at-home-exercise-routines-during-isolation/',
-    'https://www.swinburne.edu.au/news/2023/10/swinburne-is-leading-the-way-in-multi-cloud-architecture-education/',
-    'https://www.swinburne.edu.au/news/2024/04/ozgrav-20-a-new-era-of-astrophysics-launched-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2015/11/nightingales-sustainability-song-falls-on-deaf-ears/',
-    'https://www.swinburne.edu.au/news/2016/09/the-robots-are-polarising-how-we-consume-news/',
-    'https://www.swinburne.edu.au/news/2017/05/finding-a-voice-of-reason-amongst-schizophrenia/',
-    'https://www.swinburne.edu.au/news/2017/11/what-is-the-impact-of-impact-investing/',
-    'https://www.swinburne.edu.au/news/2019/08/the-gold-at-the-end-of-a-cosmic-ray/',
-    'https://www.swinburne.edu.au/news/2014/06/with-shaw-suspended-victoria-has-averted-crisis--for-now/',
-    'https://www.swinburne.edu.au/news/2016/11/swinburne-awarded-56-m-in-research-funding-from-arc-and-nhmrc/',
-    'https://www.swinburne.edu.au/news/2019/04/addressing-the-emerging-tech-skills-shortage-in-business-leaders/',
-    'https://www.swinburne.edu.au/news/2019/08/reporters-shouldnt-censor-what-they-report-on-twitter/',
-    'https://www.swinburne.edu.au/news/2016/08/urban-farming-futures-so-bright-our-produce-is-wearing-shades/',
-    'https://www.swinburne.edu.au/news/2017/05/swinburne-and-hawthorn-aquatic-and-leisure-centre-partner-up/',
-    'https://www.swinburne.edu.au/news/2018/09/swinburne-it-for-social-impact-project-wins-international-education-award/',
-    'https://www.swinburne.edu.au/news/2016/02/australias-digital-divide-is-narrowing-but-getting-deeper/',
-    'https://www.swinburne.edu.au/news/2016/07/astrotours-to-educate-and-entertain-visitors-at-open-day/',
-    'https://www.swinburne.edu.au/news/2016/11/flash-of-invisible-light-helps-astronomers-map-the-cosmic-web/',
-    'https://www.swinburne.edu.au/news/2019/10/business-without-borders-swinburne-is-making-a-social-impact/',
-    'https://www.swinburne.edu.au/news/2017/10/online-research-program-aims-to-help-those-with-bipolar/',
-    'https://www.swinburne.edu.au/news/2018/03/richard-maddock-fosterpartners-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2020/03/swinburne-celebrates-international-womens-day-2020/',
-    'https://www.swinburne.edu.au/news/2020/04/swinburne-partners-with-scope3-on-world-first-logistics-emissions-project/',
-    'https://www.swinburne.edu.au/news/2022/07/swinburne-pilots-international-buddy-program/',
-    'https://www.swinburne.edu.au/news/2014/06/professor-john-grundy-receives-education-award/',
-    'https://www.swinburne.edu.au/news/2016/06/secondary-students-engineer-their-own-success-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2018/05/swinburne-law-school-secures-research-fellowships/',
-    'https://www.swinburne.edu.au/news/2018/08/664-collins-st-media-wall-lights-up-with-swinburne-digital-design/',
-    'https://www.swinburne.edu.au/news/2018/10/new-aviation-scholarship-for-women-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2019/01/swinburne-addresses-demand-for-qualified-financial-planners-with-new-course/',
-    'https://www.swinburne.edu.au/news/2016/04/kitchen-science-bacteria-and-fungi-are-your-foody-friends/',
-    'https://www.swinburne.edu.au/news/2016/05/double-peanut-shell-shaped-feature-of-a-galaxy-discovered/',
-    'https://www.swinburne.edu.au/news/2017/06/swinburne-team-researching-the-use-of-humanoid-robotics-in-education/',
-    'https://www.swinburne.edu.au/news/2021/12/Swinburne-researcher-recognised-among-science-and-innovation-leaders/',
-    'https://www.swinburne.edu.au/news/2023/06/swinburne-professor-saving-decades-of-digital-artefacts/',
-    'https://www.swinburne.edu.au/news/2014/12/swinburne-students-take-out-all-awards-in-student-cinematography-category-at-australian-cinematography-society-awards/',
-    'https://www.swinburne.edu.au/news/2018/04/research-reveals-autism-and-schizophrenia-share-common-traits/',
-    'https://www.swinburne.edu.au/news/2022/05/swinburnes-master-of-fintech-partners-with-industry-leaders/',
-    'https://www.swinburne.edu.au/news/2014/03/swinburne-student-wins-overall-graduate-of-the-year-award-1/',
-    'https://www.swinburne.edu.au/news/2015/07/domestic-violence-perpetrators-deprive-victims-even-of-roof-overhead/',
-    'https://www.swinburne.edu.au/news/2016/05/huge-solar-storms-may-be-key-to-life-on-earth/',
-    'https://www.swinburne.edu.au/news/2017/03/why-brazil-is-a-country-to-watch-in-2017/',
-    'https://www.swinburne.edu.au/news/2018/07/swinburne-subjects-debut-in-global-ranking-of-academic-subjects/',
-    'https://www.swinburne.edu.au/news/2018/10/swinburne-young-mums-secures-victorian-government-grant/',
-    'https://www.swinburne.edu.au/news/2020/01/factory-of-the-futures-innovative-take-on-digital-twins/',
-    'https://www.swinburne.edu.au/news/2014/05/new-grants-to-promote-creative-aviation-research-projects/',
-    'https://www.swinburne.edu.au/news/2015/10/five-reasons-to-teach-robotics-in-schools/',
-    'https://www.swinburne.edu.au/news/2024/05/mchart-redefines-mental-health-service-planning-through-cutting-edge-data-analytics/',
-    'https://www.swinburne.edu.au/news/2014/06/swinburne-film-students-depart-for-asiabound-funded-bollywood-study-tour/',
-    'https://www.swinburne.edu.au/news/2022/05/Interactive-dummies-deliver-the-smarts-for-next-gen-nurses/',
-    'https://www.swinburne.edu.au/news/2021/03/progress-but-were-not-there-yet/',
-    'https://www.swinburne.edu.au/news/2018/02/swinburne-and-medibank-forge-health-partnership/',
-    'https://www.swinburne.edu.au/news/2020/01/easy-wheezy--a-straightforward-passage-to-asthma-control/',
-    'https://www.swinburne.edu.au/news/2017/08/oscar-winner-mentors-swinburne-animation-students/',
-    'https://www.swinburne.edu.au/news/2017/11/sporting-sector-may-be-key-to-reducing-violence-against-women/',
-    'https://www.swinburne.edu.au/news/2018/05/swinburne-launches-innovative-postgraduate-course-in-supply-chain/',
-    'https://www.swinburne.edu.au/news/2014/08/what-metadata-does-the-government-want-about-you/',
-    'https://www.swinburne.edu.au/news/2015/10/the-guy-who-didnt-listen-when-people-said-its-all-over/',
-    'https://www.swinburne.edu.au/news/2016/11/swinburne-students-head-overseas-with-new-colombo-plan-scholarships/',
-    'https://www.swinburne.edu.au/news/2015/11/a-secure-future-for-circus-arts-in-australia/',
-    'https://www.swinburne.edu.au/news/2015/12/seven-ways-the-pms-innovation-policy-could-change-australia/',
-    'https://www.swinburne.edu.au/news/2017/03/building-a-safer-more-sustainable-society-through-digital-social-innovation/',
-    'https://www.swinburne.edu.au/news/2021/01/the-university-that-leans-into-disruption/',
-    'https://www.swinburne.edu.au/news/2014/06/napthine-government-stares-into-the-political-abyss/',
-    'https://www.swinburne.edu.au/news/2016/01/the-universe-one-millisecond-at-a-time/',
-    'https://www.swinburne.edu.au/news/2016/04/path-forward-for-electric-vehicles-in-australia/',
-    'https://www.swinburne.edu.au/news/2017/09/the-rise-of-the-corporate-campus/',
-    'https://www.swinburne.edu.au/news/2020/08/global-success-for-swinburne-student-filmmaker/',
-    'https://www.swinburne.edu.au/news/2015/08/swinburnes-success-at-the-2015-victorian-training-awards/',
-    'https://www.swinburne.edu.au/news/2021/04/swinburnes-mho-team-launches-vr-mindfulness-experiences/',
-    'https://www.swinburne.edu.au/news/2014/06/private-schools-and-their-moral-failings/',
-    'https://www.swinburne.edu.au/news/2015/12/research-finds-games-on-tablets-transfer-to-real-life-skills/',
-    'https://www.swinburne.edu.au/news/2016/10/swinburne-student-wins-victorian-apprentice-of-the-year/',
-    'https://www.swinburne.edu.au/news/2021/05/swinburne-advertising-campaign-to-get-graduates-a-job/',
-    'https://www.swinburne.edu.au/news/2022/03/swinburne-students-get-job-offers-before-they-graduate/',
-    'https://www.swinburne.edu.au/news/2014/05/international-grant-sends-swinburne-design-anthropology-researchers-to-asia/',
-    'https://www.swinburne.edu.au/news/2016/05/swinburne-and-india-partner-to-address-health-issues/',
-    'https://www.swinburne.edu.au/news/2017/03/professor-mark-burry-to-lead-swinburnes-smart-cities-research-institute/',
-    'https://www.swinburne.edu.au/news/2021/06/swinburne-film-and-tv-graduates-shine-behind-the-screen/',
-    'https://www.swinburne.edu.au/news/2018/03/limelite-lights-the-way-for-3d-printing-in-production/',
-    'https://www.swinburne.edu.au/news/2019/06/swinburne-alumni-sonny-tilders-wins-a-tony-for-king-kong/',
-    'https://www.swinburne.edu.au/news/2021/07/using-data-and-technology-to-keep-young-drivers-safer/',
-    'https://www.swinburne.edu.au/news/2015/12/you-yourself-not-you-your-atar/',
-    'https://www.swinburne.edu.au/news/2020/05/a-lifeline-in-remote-learning-for-migrant-english-students/',
-    'https://www.swinburne.edu.au/news/2020/12/swinburne-partners-with-avanade-australia-to-help-close-gender-gap-in-STEM/',
-    'https://www.swinburne.edu.au/news/2022/11/the-world-of-deepfake-advertising-is-coming-this-decade/',
-    'https://www.swinburne.edu.au/news/2015/12/the-advantage-of-being-a-swinburne-graduate/',
-    'https://www.swinburne.edu.au/news/2016/04/swinburne-sponsors-steve-wozniaks-australian-tour/',
-    'https://www.swinburne.edu.au/news/2016/09/journalism-students-go-behind-the-scenes-of-royal-melbourne-show/',
-    'https://www.swinburne.edu.au/news/2018/03/co-designing-the-future-of-cinema/',
-    'https://www.swinburne.edu.au/news/2020/01/opinion-lets-slash-indigenous-jail-terms-by-a-quarter/',
-    'https://www.swinburne.edu.au/news/2022/06/new-ai-platform-for-people-with-genetic-disorders/',
-    'https://www.swinburne.edu.au/news/2017/03/how-australians-are-giving-to-charity/',
-    'https://www.swinburne.edu.au/news/2017/07/swinburne-and-sarawak-establish-strategic-research-alliance/',
-    'https://www.swinburne.edu.au/news/2020/11/swinburne-researchers-celebrate-success-in-national-funding/',
-    'https://www.swinburne.edu.au/news/2014/06/nearby-satellite-galaxies-challenge-standard-model-of-galaxy-formation/',
-    'https://www.swinburne.edu.au/news/2017/04/mysterious-bursts-of-energy-do-come-from-outer-space/',
-    'https://www.swinburne.edu.au/news/2018/05/mastering-the-art-of-dietetics/',
-    'https://www.swinburne.edu.au/news/2020/07/halo-concept-airport-checkpoint/',
-    'https://www.swinburne.edu.au/news/2015/01/swinburne-academic-awarded-john-hughes-distinguished-service-award/',
-    'https://www.swinburne.edu.au/news/2015/01/extending-einsteins-spooky-action-for-use-in-quantum-networks/',
-    'https://www.swinburne.edu.au/news/2016/05/swinburne-steps-closer-to-a-sustainable-future/',
-    'https://www.swinburne.edu.au/news/2020/06/curious-kids---is-time-travel-possible-for-humans/',
-    'https://www.swinburne.edu.au/news/2021/02/swinburne-students-soar-with-community-bank-support/',
-    'https://www.swinburne.edu.au/news/2015/03/un-masking-the-five-faces-of-oppression/',
-    'https://www.swinburne.edu.au/news/2022/11/motion-and-volumetric-capture-animation-tech-breaks-barriers/',
-    'https://www.swinburne.edu.au/news/2022/04/marketing-students-gain-valuable-industry-insights-with-cpm/',
-    'https://www.swinburne.edu.au/news/2015/05/swinburne-graduate-promotes-australian-fashion-with-new-store-lelulah-boutique/',
-    'https://www.swinburne.edu.au/news/2018/03/swinburne-sponsored-secondary-students-excel-at-robotics-competition/',
-    'https://www.swinburne.edu.au/news/2018/10/professor-john-pollaers-oam-appointed-new-swinburne-chancellor/',
-    'https://www.swinburne.edu.au/news/2014/07/scholarship-sends-swinburnes-liz-rodriguez-to-south-east-asia-symposium-1/',
-    'https://www.swinburne.edu.au/news/2015/11/refuting-the-censorship-argument-is-childs-play/',
-    'https://www.swinburne.edu.au/news/2016/09/swinburne-and-the-conversation-launch-podcast/',
-    'https://www.swinburne.edu.au/news/2021/10/space-week-swinburne-picks-for-movies-and-tv/',
-    'https://www.swinburne.edu.au/news/2016/07/giving-farmers-the-tools-to-share-their-personal-stories/',
-    'https://www.swinburne.edu.au/news/2017/06/return-to-the-fold-for-super-strong-structures/',
-    'https://www.swinburne.edu.au/news/2022/09/government-workers-prioritise-wellbeing-over-pay/',
-    'https://www.swinburne.edu.au/news/2017/12/charity-regulators-should-not-assume-that-donors-always-know-best/',
-    'https://www.swinburne.edu.au/news/2021/08/swinburne-researchers-shaping-the-future-of-aussie-kids-tv/',
-    'https://www.swinburne.edu.au/news/2022/11/scholarships-help-swinburne-students-connect-in-indo-pacific/',
-    'https://www.swinburne.edu.au/news/2023/04/swinburne-calls-for-fundamental-changes-in-uni-funding/',
-    'https://www.swinburne.edu.au/news/2023/10/new-Swinburne-industry-partners-transforms-business-students-career/',
-    'https://www.swinburne.edu.au/news/2024/05/celebrating-our-amazing-nursing-students-and-alumni-/',
-    'https://www.swinburne.edu.au/news/2019/09/swinburne-drone-teaching-methods-taking-off/',
-    'https://www.swinburne.edu.au/news/2024/05/Mechanical-engineering-gets-a-next-gen-campus-transformation/',
-    'https://www.swinburne.edu.au/news/2014/03/hawthorn-hawks-will-be-number-one-in-2014-swinburne-computer/',
-    'https://www.swinburne.edu.au/news/2014/07/silhouettes-of-early-galaxies-reveal-few-seeds-for-new-stars/',
-    'https://www.swinburne.edu.au/news/2018/11/new-australian-research-reveals-health-toll-of-increasing-loneliness/',
-    'https://www.swinburne.edu.au/news/2019/11/swinburne-students-gain-unique-advertising-agency-experience/',
-    'https://www.swinburne.edu.au/news/2020/10/astronomers-discover-metal-poor-globular-cluster/',
-    'https://www.swinburne.edu.au/news/2014/02/violence-and-mental-illness-harsh-reality-demands-sensitive-answers/',
-    'https://www.swinburne.edu.au/news/2014/05/is-facebook-finally-taking-anonymity-seriously/',
-    'https://www.swinburne.edu.au/news/2014/11/australias-newest-law-school-ready-for-students-in-2015/',
-    'https://www.swinburne.edu.au/news/2018/09/swinburne-partnership-with-richmond-off-to-a-roaring-start/',
-    'https://www.swinburne.edu.au/news/2014/05/federal-budget-update-for-swinburne-students/',
-    'https://www.swinburne.edu.au/news/2017/02/microsoft-data-leader-launches-swinburne-data-science-institute/',
-    'https://www.swinburne.edu.au/news/2019/07/village-cinemas-and-swinburne-seek-next-generation-of-filmmakers/',
-    'https://www.swinburne.edu.au/news/2020/01/initiative-led-by-swinburne-researcher-helps-increase-breast-cancer-screening/',
-    'https://www.swinburne.edu.au/news/2018/03/celebrating-international-womens-day-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2019/09/centre-for-national-unification-design-selected-for-global-grad-show/',
-    'https://www.swinburne.edu.au/news/2020/02/developing-a-new-vision-for-post-secondary-education/',
-    'https://www.swinburne.edu.au/news/2021/05/Swinburne-student-wins-best-short-documentary-at-prestigious-film-festival/',
-    'https://www.swinburne.edu.au/news/2015/12/swinburne-researchers-develop-next-generation-of-condoms/',
-    'https://www.swinburne.edu.au/news/2016/04/swinburne-big-winner-at-defence-materials-technology-centre-awards/',
-    'https://www.swinburne.edu.au/news/2017/10/the-blacksmiths-tree-brings-bushfire-victims-together/',
-    'https://www.swinburne.edu.au/news/2021/07/Swinburne-survey-finds-COVID-19-changes-lockdown-learners-attitudes-to-uni/',
-    'https://www.swinburne.edu.au/news/2021/12/mallrat-cxloe-and-jxn-take-the-stage-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2016/01/the-ideas-boom--where-to-from-here-on/',
-    'https://www.swinburne.edu.au/news/2019/10/huge-clawed-predatory-dinosaur-discovery-in-victoria/',
-    'https://www.swinburne.edu.au/news/2019/10/swinburne-creates-new-role-to-embed-indigenous-knowledges-into-curriculums/',
-    'https://www.swinburne.edu.au/news/2020/04/top-tips-to-maintain-a-healthy-routine/',
-    'https://www.swinburne.edu.au/news/2021/09/swinburne-sweeps-lets-torque-public-speaking-competition/',
-    'https://www.swinburne.edu.au/news/2021/03/professor-brendan-murphy-among-leaders-given-prestigious-swinburne-awards/',
-    'https://www.swinburne.edu.au/news/2022/02/5g-garbage-trucks-driving-the-future-of-smart-cities/',
-    'https://www.swinburne.edu.au/news/2023/10/announcing-the-2023-swinburne-alumni-impact-awards-winners/',
-    'https://www.swinburne.edu.au/news/2014/05/finnish-ambassador-to-australia-discusses-the-value-of-design-in-business/',
-    'https://www.swinburne.edu.au/news/2014/05/the-land-of-smiles-is-calling-for-australian-students/',
-    'https://www.swinburne.edu.au/news/2016/03/survey-shows-students-want-course-flexibility-and-career-development/',
-    'https://www.swinburne.edu.au/news/2019/05/new-academics-support-hybrid-studies-in-built-environment-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2024/02/using-AI-to-enhance-satellite-imagery-to-monitor-our-planet/',
-    'https://www.swinburne.edu.au/news/2020/02/the-rise-of-renters-by-choice/',
-    'https://www.swinburne.edu.au/news/2021/06/Swinburne-software-engineering-graduate-nominated-for-space-award/',
-    'https://www.swinburne.edu.au/news/2023/05/students-design-food-systems-of-the-future/',
-    'https://www.swinburne.edu.au/news/2023/10/swinburne-welcomes-new-national-skills-agreement/',
-    'https://www.swinburne.edu.au/news/2017/11/swinburne-debuts-in-physical-sciences-times-higher-education-rankings/',
-    'https://www.swinburne.edu.au/news/2017/07/significant-dinosaur-find-in-outback-queensland/',
-    'https://www.swinburne.edu.au/news/2019/04/swinburne-law-students-take-on-the-world-in-oxford/',
-    'https://www.swinburne.edu.au/news/2022/12/advertising-students-vaporise-the-competition-to-win-big/',
-    'https://www.swinburne.edu.au/news/2015/05/table-top-extreme-uv-laser-system-heralds-imaging-at-the-nanoscale/',
-    'https://www.swinburne.edu.au/news/2015/09/swinburne-in-2015-qs-world-university-rankings/',
-    'https://www.swinburne.edu.au/news/2018/07/one-year-on-sexual-assault-and-sexual-harassment/',
-    'https://www.swinburne.edu.au/news/2014/10/new-collaboration-aids-tropical-cyclone-data-collection/',
-    'https://www.swinburne.edu.au/news/2016/08/swinburne-students-to-participate-in-national-survey-on-sexual-assault/',
-    'https://www.swinburne.edu.au/news/2018/10/swinburne-pride-puts-the-focus-on-intersex-rights/',
-    'https://www.swinburne.edu.au/news/2014/09/cap-help-loans-to-protect-students-from-unsustainable-fee-increases/',
-    'https://www.swinburne.edu.au/news/2015/10/swinburne-partners-with-midsumma-festival/',
-    'https://www.swinburne.edu.au/news/2016/03/gardens-set-to-blossom-at-flower-and-garden-show/',
-    'https://www.swinburne.edu.au/news/2017/08/communication-design-student-wins-road-safety-campaign-competition/',
-    'https://www.swinburne.edu.au/news/2023/07/design-for-change-winner-solar-distillation-solutions/',
-    'https://www.swinburne.edu.au/news/2016/07/swinburne-hosts-hawthorn-voices-of-a-generation-final/',
-    'https://www.swinburne.edu.au/news/2017/05/jane-burry-is-crafting-the-future-of-design-swinburne/',
-    'https://www.swinburne.edu.au/news/2020/09/checking-in-on-a-colleague-associate-professor-mahnaz-shafiei/',
-    'https://www.swinburne.edu.au/news/2020/10/neurodiversity-at-work-benefits-everyone/',
-    'https://www.swinburne.edu.au/news/2014/08/taylor-swift-is-the-great-white-shark-of-pop-music/',
-    'https://www.swinburne.edu.au/news/2023/05/swinburne-appoints-defence-head-to-tackle-crucial-and-complex-landscape/',
-    'https://www.swinburne.edu.au/news/2022/07/first-pictures-from-the-14-billion-dollar-james-webb-space-telescope/',
-    'https://www.swinburne.edu.au/news/2022/08/Underground-lab-plunges-researchers-into-the-dark-matter/',
-    'https://www.swinburne.edu.au/news/2022/10/aboriginal-partnership-improving-child-care-and-career-outcomes/',
-    'https://www.swinburne.edu.au/news/2015/08/astronomers-discover-full-glory-of-the-universe/',
-    'https://www.swinburne.edu.au/news/2018/05/the-science-behind-our-obsession-with-food-on-tv/',
-    'https://www.swinburne.edu.au/news/2019/04/radical-disaster-relief-shelter-design-for-azraq-and-beyond/',
-    'https://www.swinburne.edu.au/news/2019/04/world-kitchen-celebrating-swinburnes-diversity---/',
-    'https://www.swinburne.edu.au/news/2020/02/love-for-science-leads-to-lifelong-learning/',
-    'https://www.swinburne.edu.au/news/2021/04/swinburne-and-sutton-tools-to-launch-joint-smart-manufacturing-centre/',
-    'https://www.swinburne.edu.au/news/2021/07/atar-boost-for-young-entrepreneurs-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2022/12/students-integral-to-codesigning-swinburnes-next-gen-now-experience/',
-    'https://www.swinburne.edu.au/news/2015/12/revolutionary-technique-gives-new-hope-to-focal-epilepsy-sufferers/',
-    'https://www.swinburne.edu.au/news/2014/05/the-problem-with-the-way-we-educate-economists/',
-    'https://www.swinburne.edu.au/news/2017/06/a-swinburne-professor-balances-work-and-family-life-by-being-highly-organised/',
-    'https://www.swinburne.edu.au/news/2019/09/swinburne-school-of-design-academics-share-expertise-in-vietnam/',
-    'https://www.swinburne.edu.au/news/2019/10/increasing-gender-equity-by-supporting-parents/',
-    'https://www.swinburne.edu.au/news/2015/04/last-chance-to-see-lunar-eclipse-in-australia-until-2018/',
-    'https://www.swinburne.edu.au/news/2015/06/swinburne-names-two-students-as-apprentice-of-the-year/',
-    'https://www.swinburne.edu.au/news/2017/01/buying-more-stuff-isnt-always-the-answer-to-happiness/',
-    'https://www.swinburne.edu.au/news/2018/06/swinburne-marketing-students-pitch-digital-platforms-at-facebook/',
-    'https://www.swinburne.edu.au/news/2020/06/scientists-find-mysterious-astrophysical-object-in-black-hole-collision/',
-    'https://www.swinburne.edu.au/news/2016/12/swinburne-partners-with-jetstar-for-cadet-pilot-program-/',
-    'https://www.swinburne.edu.au/news/2017/07/live-streaming-of-sexual-assault-and-harassment-survey-results/',
-    'https://www.swinburne.edu.au/news/2024/05/swinburne-appoints-new-deputy-vice-chancellor-external-engagement/',
-    'https://www.swinburne.edu.au/news/2014/07/asylum-seekers-and-the-dignity-of-work/',
-    'https://www.swinburne.edu.au/news/2015/07/swinburnes-work-integrated-learning-advantage/',
-    'https://www.swinburne.edu.au/news/2016/05/swinburne-research-highlights-irregular-pricing-movements-in-everyday-living-costs/',
-    'https://www.swinburne.edu.au/news/2020/07/swinburne-open-day-goes-pixel/',
-    'https://www.swinburne.edu.au/news/2021/01/digital-and-innovation-leader-joins-swinburne-council/',
-    'https://www.swinburne.edu.au/news/2014/07/digital-learning-on-show-at-swinburne-1/',
-    'https://www.swinburne.edu.au/news/2020/07/understanding-and-celebrating-naidoc-week/',
-    'https://www.swinburne.edu.au/news/2014/06/no-the-ipa-is-not-secretly-running-australia/',
-    'https://www.swinburne.edu.au/news/2016/05/budget-does-little-to-help-transition-the-economy/',
-    'https://www.swinburne.edu.au/news/2018/02/immersive-science-ii-revealing-the-invisible-universe/',
-    'https://www.swinburne.edu.au/news/2019/02/swinburne-receives-funding-to-stop-data-leaks-and-optimise-industrial-innovation/',
-    'https://www.swinburne.edu.au/news/2020/05/shift-to-online-learning-offers-risl-students-a-unique-experience/',
-    'https://www.swinburne.edu.au/news/2022/11/swinburne-carpentry-community-gives-back-in-backyard-blitz/',
-    'https://www.swinburne.edu.au/news/2023/07/First-look-at-new-student-designed-Latelab-and-student-hub/',
-    'https://www.swinburne.edu.au/news/2023/07/australia-proves-its-a-world-leader-in-astronomy/',
-    'https://www.swinburne.edu.au/news/2014/10/next-stop-hollywood-for-swinburne-film-and-tv-alumnus-nick-kozakis/',
-    'https://www.swinburne.edu.au/news/2016/04/our-future-as-an-innovation-nation/',
-    'https://www.swinburne.edu.au/news/2014/05/learning-the-lessons-of-corruption/',
-    'https://www.swinburne.edu.au/news/2016/04/agility-and-dynamism-the-key-to-successful-social-enterprises/',
-    'https://www.swinburne.edu.au/news/2017/08/swinburne-extends-key-astronomy-research-partnership-with-caltech/',
-    'https://www.swinburne.edu.au/news/2019/12/could-congestion-pricing-provide-a-panacea-for-melbournes-gridlock/',
-    'https://www.swinburne.edu.au/news/2021/04/swinburne-students-land-dream-jobs-at-the-abc-following-internships/',
-    'https://www.swinburne.edu.au/news/2015/10/swinburne-supports-new-knowledge-and-innovation-hub/',
-    'https://www.swinburne.edu.au/news/2019/06/swinburne-alumna-looks-towards-the-future-of-flexible-work/',
-    'https://www.swinburne.edu.au/news/2019/08/forest-study-shows-how-plants-adapt-to-rising-carbon-dioxide-/',
-    'https://www.swinburne.edu.au/news/2020/12/global-expansion-for-swinburne-venture-cup-in-2020/',
-    'https://www.swinburne.edu.au/news/2014/07/handwritings-relevance-in-a-digital-world/',
-    'https://www.swinburne.edu.au/news/2015/02/how-to-stop-the-leadership-turnstile/',
-    'https://www.swinburne.edu.au/news/2015/07/managing-safety-in-the-construction-industry/',
-    'https://www.swinburne.edu.au/news/2017/04/times-higher-education-ranks-swinburne-as-a-top-young-university/',
-    'https://www.swinburne.edu.au/news/2015/01/swinburne-university-scholarship-numbers-soar/',
-    'https://www.swinburne.edu.au/news/2018/04/how-to-stop-haemorrhaging-data-on-facebook/',
-    'https://www.swinburne.edu.au/news/2023/06/swinburne-announces-new-senior-deputy-vice-chancellor-and-chief-academic-officer/',
-    'https://www.swinburne.edu.au/news/2023/08/swinburne-alumni-impact-awards-finalists-driving-positive-change/',
-    'https://www.swinburne.edu.au/news/2014/05/new-partnership-strengthens-circus-arts-education-pathway/',
-    'https://www.swinburne.edu.au/news/2017/08/a-short-history-of-the-office/',
-    'https://www.swinburne.edu.au/news/2019/12/opinion-heres-why-we-must-not-trust-reformed-terrorists/',
-    'https://www.swinburne.edu.au/news/2020/02/using-storytelling-to-reduce-ageism-in-the-community/',
-    'https://www.swinburne.edu.au/news/2014/08/swinburne-offers-an-ocd-treatment-program-for-sufferers/',
-    'https://www.swinburne.edu.au/news/2015/06/swinburne-students-to-build-sustainability-centre-in-cambodia/',
-    'https://www.swinburne.edu.au/news/2018/05/viewpoints-should-the-government-intervene-to-fix-low-wages/',
-    'https://www.swinburne.edu.au/news/2022/08/swinburne-students-set-to-find-themselves-at-the-junction/',
-    'https://www.swinburne.edu.au/news/2019/09/swinburne-supported-startup-lifting-writing-skills-of-primary-students/',
-    'https://www.swinburne.edu.au/news/2019/11/swinburne-cybersecurity-project-receives-arc-funding/',
-    'https://www.swinburne.edu.au/news/2020/06/overwhelming-staff-generosity-helps-students-stand-strong-through-covid-19/',
-    'https://www.swinburne.edu.au/news/2016/02/controlling-ultrafast-electrons-in-motion/',
-    'https://www.swinburne.edu.au/news/2016/10/change-agents-australias-most-radical-reform-of-local-government/',
-    'https://www.swinburne.edu.au/news/2017/04/swinburne-rated-as-top-3-victorian-university-for-student-satisfaction/',
-    'https://www.swinburne.edu.au/news/2018/07/tabletop-game-introduces-students-to-life-as-a-lawyer/',
-    'https://www.swinburne.edu.au/news/2021/10/meet-the-swinburne-student-nurses-helping-keep-our-community-safe/',
-    'https://www.swinburne.edu.au/news/2024/04/students-get-first-shot-in-victoria-at-entrepreneurial-swinburne-startup-year/',
-    'https://www.swinburne.edu.au/news/2014/07/swinburne-student-recognised-for-community-volunteer-work/',
-    'https://www.swinburne.edu.au/news/2021/02/engineering-student-races-into-motorsport-career/',
-    'https://www.swinburne.edu.au/news/2022/11/australian-first-hydrogen-drone-to-turn-the-skies-green/',
-    'https://www.swinburne.edu.au/news/2016/12/change-agents-the-push-to-legalise-medicinal-cannabis/',
-    'https://www.swinburne.edu.au/news/2017/02/short-term-funding-restricts-support-for-homeless-indigenous-australians/',
-    'https://www.swinburne.edu.au/news/2018/07/science-meets-music-at-splendour-in-the-grass/',
-    'https://www.swinburne.edu.au/news/2019/07/what-is-an-astrophysicist/',
-    'https://www.swinburne.edu.au/news/2023/11/Swinburne-students-win-third-consecutive-Advertising-Capstone-Challenge/',
-    'https://www.swinburne.edu.au/news/2016/02/victoria-latin-america-scholarship-recipient-to-study-coastal-erosion/',
-    'https://www.swinburne.edu.au/news/2021/08/Isnt-being-an-Olympian-enough-the-curious-case-of-Peter-Bol/',
-    'https://www.swinburne.edu.au/news/2014/09/university-deregulationfee-free-for-all-risky-strategy/',
-    'https://www.swinburne.edu.au/news/2017/06/visual-retraining-program-to-help-people-with-body-dysmorphic-disorder/',
-    'https://www.swinburne.edu.au/news/2019/07/farming-tool-reduces-time-and-labour-for-organic-farmers/',
-    'https://www.swinburne.edu.au/news/2020/08/fabricate-2020-making-resilient-architecture/',
-    'https://www.swinburne.edu.au/news/2018/08/rethinking-the-health-and-weight-debate/',
-    'https://www.swinburne.edu.au/news/2022/07/swinburne-confers-new-honorary-positions-as-it-turns-30-years-young/',
-    'https://www.swinburne.edu.au/news/2023/07/swinburne-teaching-the-future-of-hydrogen/',
-    'https://www.swinburne.edu.au/news/2016/04/why-australia-should-have-built-a-fast-rail-decades-ago/',
-    'https://www.swinburne.edu.au/news/2017/02/government-support-remains-critical-to-funding-homelessness-services/',
-    'https://www.swinburne.edu.au/news/2018/01/new-swinburne-courses-met-with-high-demand-in-2018/',
-    'https://www.swinburne.edu.au/news/2019/06/a-history-of-intellectual-property-in-50-objects/',
-    'https://www.swinburne.edu.au/news/2015/04/why-its-time-for-companies-to-give-us-back-our-data/',
-    'https://www.swinburne.edu.au/news/2016/05/aspiring-journalists-get-newsroom-experience/',
-    'https://www.swinburne.edu.au/news/2020/09/Swinburne-researchers-among-australias-top-achievers/',
-    'https://www.swinburne.edu.au/news/2021/11/Swinburne-partners-with-judo-bank-to-advance-FinTech-courses/',
-    'https://www.swinburne.edu.au/news/2017/08/135-million-grant-to-digitalise-swinburnes-factory-of-the-future/',
-    'https://www.swinburne.edu.au/news/2019/10/swinburne-vietnam-officially-launches/',
-    'https://www.swinburne.edu.au/news/2020/05/nationally-recognised-teaching-program-looks-to-an-online-future/',
-    'https://www.swinburne.edu.au/news/2020/10/we-vibrated-earthworms-to-learn-about-safely-connecting-human-brains-to-computers/',
-    'https://www.swinburne.edu.au/news/2017/11/online-tool-determines-the-right-rainwater-tank-size-for-water-needs/',
-    'https://www.swinburne.edu.au/news/2014/06/has-dust-clouded-the-discovery-of-gravitational-waves/',
-    'https://www.swinburne.edu.au/news/2015/07/professor-sarah-maddison-appointed-dean-of-science-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2018/03/future-of-tertiary-education-across-a-spectrum-of-learning/',
-    'https://www.swinburne.edu.au/news/2018/12/fossil-from-the-big-bang-discovered-with-giant-telescope/',
-    'https://www.swinburne.edu.au/news/2015/11/swinburne-design-factory-end-of-year-gala-shows-off-innovative-design-thinking/',
-    'https://www.swinburne.edu.au/news/2019/10/how-hr-professionals-can-help-organisations-thrive/',
-    'https://www.swinburne.edu.au/news/2018/06/swinburne-named-in-times-higher-education-asia-pacific-university-rankings/',
-    'https://www.swinburne.edu.au/news/2022/10/solar-solutions-reducing-carbon-footprint-on-campus-and-beyond/',
-    'https://www.swinburne.edu.au/news/2020/05/boundless-opportunities-put-swinburne-law-graduate-on-top/',
-    'https://www.swinburne.edu.au/news/2020/12/swinburne-student-starts-placement-with-bendigo-bank/',
-    'https://www.swinburne.edu.au/news/2017/09/swinburne-student-wins-engineering-prize-for-ev-battery-packaging-design-review/',
-    'https://www.swinburne.edu.au/news/2019/10/swinburne-student-shines-in-science-communication/',
-    'https://www.swinburne.edu.au/news/2020/02/supporting-transgender-and-gender-diverse-students-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2020/11/swinburnes-waterwise-team-wins-global-innovation-challenge-prize/',
-    'https://www.swinburne.edu.au/news/2020/12/swinburne-and-up-education-to-deliver-in-demand-vocational-education-courses-online/',
-    'https://www.swinburne.edu.au/news/2022/03/Swinburne-VET-students-support-bushfire-affected-communities-in-East-Gippsland/',
-    'https://www.swinburne.edu.au/news/2015/02/how-much-will-australias-metadata-retention-plan-really-cost/',
-    'https://www.swinburne.edu.au/news/2017/11/swinburne-lecturer-named-australias-best-public-relations-teacher/',
-    'https://www.swinburne.edu.au/news/2023/01/zero-emissions-aviation-the-focus-for-first-founder-in-residence/',
-    'https://www.swinburne.edu.au/news/2024/01/quantum-physicist-and-former-mp-appointed-to-swinburne-council/',
-    'https://www.swinburne.edu.au/news/2014/11/crunch-time-for-higher-education-reform-as-legislation-faces-an-unstable-senate-1/',
-    'https://www.swinburne.edu.au/news/2016/04/1-million-for-swinburne-to-boost-learning-support/',
-    'https://www.swinburne.edu.au/news/2016/08/this-little-known-pioneering-educator-put-coding-in-the-classroom/',
-    'https://www.swinburne.edu.au/news/2016/08/occupational-therapy-students-begin-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2019/05/difference-between-tax-cheats-and-killers-not-much-in-victoria/',
-    'https://www.swinburne.edu.au/news/2015/03/collaboration-needed-to-bring-manufacturing-into-the-next-era/',
-    'https://www.swinburne.edu.au/news/2015/07/reducing-depression-in-nursing-homes-requires-more-than-just-antidepressants/',
-    'https://www.swinburne.edu.au/news/2016/04/swinburne-hosts-australia-china-research-centre-in-maritime-engineering/',
-    'https://www.swinburne.edu.au/news/2017/05/swinburne-english-educator-releases-book-recounting-migrant-experiences/',
-    'https://www.swinburne.edu.au/news/2019/05/using-novel-nanotechnology-to-monitor-our-health-and-environment/',
-    'https://www.swinburne.edu.au/news/2021/06/swinburne-and-amaero-to-work-together-on-space-technology/',
-    'https://www.swinburne.edu.au/news/2014/11/swinburne-builds-on-commitment-to-early-learning/',
-    'https://www.swinburne.edu.au/news/2015/05/electric-vehicle-projects-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2016/10/how-is-the-american-president-elected/',
-    'https://www.swinburne.edu.au/news/2020/10/keeping-the-faith-in-aviation/',
-    'https://www.swinburne.edu.au/news/2015/01/why-cash-and-copyright-are-bad-news-for-creativity/',
-    'https://www.swinburne.edu.au/news/2015/05/swinburne-alumnus-josh-farmelo-awarded-national-cinematography-award/',
-    'https://www.swinburne.edu.au/news/2017/10/swinburne-activist-founding-member-of-nobel-peace-prize-organisation-/',
-    'https://www.swinburne.edu.au/news/2018/01/fossil-bone-tissues-shed-light-on-australias-polar-dinosaurs/',
-    'https://www.swinburne.edu.au/news/2015/01/can-a-natural-supplement-improve-hyperactivity-in-boys/',
-    'https://www.swinburne.edu.au/news/2015/07/edward-weary-dunlop-scholarship-awarded-to-swinburnes-danielle-brown/',
-    'https://www.swinburne.edu.au/news/2015/08/lightsapp-partnership-offers-new-opportunities-for-swinburne-students/',
-    'https://www.swinburne.edu.au/news/2015/09/swinburnes-nicki-wragg-awarded-acuads-distinguished-teaching-award/',
-    'https://www.swinburne.edu.au/news/2015/11/swinburne-world-ranked-for-graduate-employability/',
-    'https://www.swinburne.edu.au/news/2016/06/swinburne-celebrates-queens-birthday-honours-2016/',
-    'https://www.swinburne.edu.au/news/2017/05/talented-blacksmith-wins-swinburne-apprentice-of-the-year-award/',
-    'https://www.swinburne.edu.au/news/2016/03/explainer-whats-the-link-between-insomnia-and-mental-illness/',
-    'https://www.swinburne.edu.au/news/2017/04/why-glamorising-narco-culture-on-screen-is-wrong/',
-    'https://www.swinburne.edu.au/news/2018/11/swinburne-subjects-debut-in-times-higher-education-world-university-rankings/',
-    'https://www.swinburne.edu.au/news/2018/11/five-projects-that-are-harnessing-big-data-for-good/',
-    'https://www.swinburne.edu.au/news/2019/07/swinburne-goes-underground-in-search-for-dark-matter/',
-    'https://www.swinburne.edu.au/news/2018/08/skills-and-jobs-centre-launches-at-swinburne-wantirna/',
-    'https://www.swinburne.edu.au/news/2019/07/examining-pop-culture-in-the-digital-age/',
-    'https://www.swinburne.edu.au/news/2021/12/strategy-absent-from-hybrid-working-approaches-new-research/',
-    'https://www.swinburne.edu.au/news/2022/11/innovative-hydrogen-research-to-advance-sustainable-steel/',
-    'https://www.swinburne.edu.au/news/2019/05/how-australian-roads-could-be-made-safer-for-more-cyclists/',
-    'https://www.swinburne.edu.au/news/2016/10/swinburnes-jacqueline-savage-named-finalist-in-telstra-awards/',
-    'https://www.swinburne.edu.au/news/2023/08/beware-the-big-unis-push-for-two-tiered-research-system/',
-    'https://www.swinburne.edu.au/news/2014/04/book-reveals-industry-experience-is-critical-to-success/',
-    'https://www.swinburne.edu.au/news/2014/09/melba-support-services-to-move-adult-training-support-to-ex-swinburne-campus/',
-    'https://www.swinburne.edu.au/news/2015/04/swinburne-ranked-in-the-times-higher-education-top-100-under-50/',
-    'https://www.swinburne.edu.au/news/2016/11/accc-rejects-the-banks-colluding-to-bargain-on-apple-pay/',
-    'https://www.swinburne.edu.au/news/2021/12/global-innovator-to-chair-innovation-precinct-advisory-board/',
-    'https://www.swinburne.edu.au/news/2015/06/the-thorny-politics-of-indigenous-recognition/',
-    'https://www.swinburne.edu.au/news/2016/07/swinburne-aviation-management-students-ace-global-online-tournament/',
-    'https://www.swinburne.edu.au/news/2018/10/victorian-medtech-sector-set-to-benefit-from-launchvic-funding/',
-    'https://www.swinburne.edu.au/news/2019/05/its-tough-to-have-lung-disease--new-australian-data-shows/',
-    'https://www.swinburne.edu.au/news/2021/08/offering-support-for-those-affected-by-the-afghan-crisis/',
-    'https://www.swinburne.edu.au/news/2022/09/swinburne-alumni-develop-smoke-alarm-for-the-bush/',
-    'https://www.swinburne.edu.au/news/2022/11/ozgrav-makes-waves-with-35m-to-understand-the-universe/',
-    'https://www.swinburne.edu.au/news/2014/05/the-universe-broke-its-rising-fever-about-11-billion-years-ago/',
-    'https://www.swinburne.edu.au/news/2014/05/film-and-television-student-living-the-dream-studying-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2015/12/excellence-in-research-australia-2015-swinburne-continues-its-rapid-rise/',
-    'https://www.swinburne.edu.au/news/2022/11/deliberate-and-dynamic-startup-ideas-for-next-gen/',
-    'https://www.swinburne.edu.au/news/2024/06/swinburne-students-shine-in-lighting-design-collaboration/',
-    'https://www.swinburne.edu.au/news/2015/07/how-hiring-for-the-right-look-influences-retail-shoppers/',
-    'https://www.swinburne.edu.au/news/2017/10/how-marketers-use-algorithms-to-try-to-read-your-mind/',
-    'https://www.swinburne.edu.au/news/2020/10/its-in-the-national-interest-to-fund-research/',
-    'https://www.swinburne.edu.au/news/2023/08/adaptable-creativity-alum-success-from-furniture-to-food/',
-    'https://www.swinburne.edu.au/news/2018/02/swinburne-commitment-to-gender-equality-recognised-for-ninth-consecutive-year/',
-    'https://www.swinburne.edu.au/news/2018/11/swinburne-committed-to-the-elimination-of-violence-against-women/',
-    'https://www.swinburne.edu.au/news/2017/10/virtual-puzzles-can-teach-kids-to-solve-real-world-problems/',
-    'https://www.swinburne.edu.au/news/2017/12/swinburne-redesigns-the-student-learning-experience/',
-    'https://www.swinburne.edu.au/news/2018/08/inspiring-swinburnes-research-community-and-beyond/',
-    'https://www.swinburne.edu.au/news/2021/07/the-it-business-full-of-swinburne-graduates/',
-    'https://www.swinburne.edu.au/news/2022/11/bug-zapper-combatting-bacterial-rust-with-electricity/',
-    'https://www.swinburne.edu.au/news/2023/05/swinburne-supports-first-national-quantum-strategy/',
-    'https://www.swinburne.edu.au/news/2017/06/catholic-schools-alternative-to-safe-schools-isnt-that-alternative/',
-    'https://www.swinburne.edu.au/news/2021/10/biomarkers-could-spell-the-end-of-anorexia-nervosa/',
-    'https://www.swinburne.edu.au/news/2021/11/celebrating-swinburnes-2021-highly-cited-researchers/',
-    'https://www.swinburne.edu.au/news/2019/07/promoting-humanitarian-action-in-a-digital-world/',
-    'https://www.swinburne.edu.au/news/2020/09/fun-school-holiday-activities-for-melbourne-lockdown/',
-    'https://www.swinburne.edu.au/news/2021/05/High-school-stars-at-swinburne-published-in-international-space-journal/',
-    'https://www.swinburne.edu.au/news/2019/11/five-swinburne-students-awarded-prestigious-colombo-plan-scholarships/',
-    'https://www.swinburne.edu.au/news/2022/09/gloria-tackles-climate-challenge-in-china-through-virtual-study-tour/',
-    'https://www.swinburne.edu.au/news/2016/10/swinburne-leads-arc-centre-of-excellence-gravitation-wave-discovery/',
-    'https://www.swinburne.edu.au/news/2017/05/governance-training-in-full-swing-for-kimberley-community/',
-    'https://www.swinburne.edu.au/news/2017/11/pelvic-floor-health-campaign-launched-with-victorian-government-support/',
-    'https://www.swinburne.edu.au/news/2019/05/new-clues-about-how-ancient-galaxies-lit-up-the-universe/',
-    'https://www.swinburne.edu.au/news/2017/05/karl-glazebrook-elected-to-australian-academy-of-science/',
-    'https://www.swinburne.edu.au/news/2018/02/swinburne-astronomers-to-help-solve-mystery-of-the-universe/',
-    'https://www.swinburne.edu.au/news/2018/08/designers-at-swinburne-create-3d-printed-pendant-lights-for-limelite/',
-    'https://www.swinburne.edu.au/news/2018/11/swinburne-and-bwm-dentsu-group-launch-indigenous-internship-program/',
-    'https://www.swinburne.edu.au/news/2019/02/swinburne-to-explore-industry-40-opportunities-with-defence-industry/',
-    'https://www.swinburne.edu.au/news/2014/03/swinburne-serves-secondary-students-a-taste-for-skills/',
-    'https://www.swinburne.edu.au/news/2017/11/funding-success-boost-to-swinburne-urban-research/',
-    'https://www.swinburne.edu.au/news/2018/02/swinburne-inspires-the-next-generation-of-female-coders/',
-    'https://www.swinburne.edu.au/news/2019/04/siemens-australia-ceo-jeff-connolly-named-adjunct-professor-of-swinburne/',
-    'https://www.swinburne.edu.au/news/2015/01/sinhalese-asylum-seekers-on-water-claims-accepted-by-un/',
-    'https://www.swinburne.edu.au/news/2016/05/new-appointment-to-boost-digital-innovation-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2014/12/screencheat-runner-up-for-australian-game-of-the-year/',
-    'https://www.swinburne.edu.au/news/2016/04/why-australia-must-forge-a-future-in-chinas-age-of-steel/',
-    'https://www.swinburne.edu.au/news/2018/10/swinburne-trials-first-smart-urban-forest-management-system/',
-    'https://www.swinburne.edu.au/news/2022/06/swinburne-learning-and-teaching-approaches-awarded-adobe-innovation-grants/',
-    'https://www.swinburne.edu.au/news/2019/05/swinburne-backs-uluru-statement-from-the-heart/',
-    'https://www.swinburne.edu.au/news/2020/11/swinburne-consolidates-standing-in-global-rankings/',
-    'https://www.swinburne.edu.au/news/2022/11/swinburne-researchers-recognised-as-national-leaders/',
-    'https://www.swinburne.edu.au/news/2014/01/workshops-to-improve-maths-science-and-technology-teaching-skills/',
-    'https://www.swinburne.edu.au/news/2014/02/swinburne-alumna-hiske-descheppers-accounting-career-has-motored-ahead/',
-    'https://www.swinburne.edu.au/news/2014/04/optus-apology-on-coverage-highlights-multi-network-problem/',
-    'https://www.swinburne.edu.au/news/2016/01/swinburne-ranked-as-one-of-worlds-most-international-universities/',
-    'https://www.swinburne.edu.au/news/2016/11/cosmic-barcode-from-distant-galaxy-confirms-natures-constancy/',
-    'https://www.swinburne.edu.au/news/2017/06/swinburne-leads-commitment-to-child-safe-standards-in-higher-education/',
-    'https://www.swinburne.edu.au/news/2020/09/reducing-carbon-emissions-in-astronomy/',
-    'https://www.swinburne.edu.au/news/2015/12/5-minutes-with-assistant-minister-for-innovation-wyatt-roy/',
-    'https://www.swinburne.edu.au/news/2019/08/swinburne-industry-40-initiative-wins-australian-business-award/',
-    'https://www.swinburne.edu.au/news/2014/01/swinburne-offers-scholarships-to-talented-vce-students/',
-    'https://www.swinburne.edu.au/news/2019/02/giant-dinosaur-trackway-discovered-in-queensland/',
-    'https://www.swinburne.edu.au/news/2014/07/sublime-design-the-kickstart-moneymaker-pump-1/',
-    'https://www.swinburne.edu.au/news/2015/03/swinburne-has-finalists-in-byron-bay-international-film-festival/',
-    'https://www.swinburne.edu.au/news/2017/09/we-are-all-of-the-same-starstuff/',
-    'https://www.swinburne.edu.au/news/2018/02/myer-has-lost-sight-of-who-its-customers-are/',
-    'https://www.swinburne.edu.au/news/2015/01/australias-road-obsession-is-holding-back-productivity/',
-    'https://www.swinburne.edu.au/news/2017/03/december-media-and-swinburne-release-the-search-for-life-in-space/',
-    'https://www.swinburne.edu.au/news/2017/12/swinburne-and-access-launch-support-program-for-women-facing-trauma/',
-    'https://www.swinburne.edu.au/news/2018/01/swinburne-graduate-designs-australia-posts-year-of-the-dog-stamps/',
-    'https://www.swinburne.edu.au/news/2017/02/black-holes-are-even-stranger-than-you-can-imagine/',
-    'https://www.swinburne.edu.au/news/2021/08/four-arc-future-fellowships-for-swinburne-researchers/',
-    'https://www.swinburne.edu.au/news/2021/09/providing-industry-engaged-learning-with-vet-ict-partnerships/',
-    'https://www.swinburne.edu.au/news/2023/11/swinburne-commits-to-improving-international-student-employment-outcomes/',
-    'https://www.swinburne.edu.au/news/2014/05/on-the-creation-of-higher-education-cartels/',
-    'https://www.swinburne.edu.au/news/2014/11/swinburne-hosts-launch-of-boroondara-cares-foundation/',
-    'https://www.swinburne.edu.au/news/2018/06/co-creation-can-help-our-companies-compete-with-global-giants/',
-    'https://www.swinburne.edu.au/news/2018/10/business-ict-leaders-celebrate-three-decades-of-innovative-it-program/',
-    'https://www.swinburne.edu.au/news/2019/04/backlash-against-notre-dame-donors-could-redefine-philanthropy/',
-    'https://www.swinburne.edu.au/news/2019/05/associate-professor-nicole-wragg-is-new-chair-of-communication-design/',
-    'https://www.swinburne.edu.au/news/2024/05/yarra-trams-feature-women-in-trades-campaign-designed-by-swinburne-students/',
-    'https://www.swinburne.edu.au/news/2014/05/generosity-at-the-core-of-scholarship-grants/',
-    'https://www.swinburne.edu.au/news/2019/05/professor-john-pollaers-oam-installed-as-swinburne-chancellor/',
-    'https://www.swinburne.edu.au/news/2019/07/protolab-opens-to-provide-large-scale-digital-fabrication-capability/',
-    'https://www.swinburne.edu.au/news/2020/10/new-members-appointed-to-swinburne-innovation-precinct-board/',
-    'https://www.swinburne.edu.au/news/2024/07/victorian-students-drive-green-energy-transition-through-international-hydrogen-competition/',
-    'https://www.swinburne.edu.au/news/2015/10/aviations-emerging-leaders-sought-for-first-leadership-summit/',
-    'https://www.swinburne.edu.au/news/2019/02/swinburne-commitment-to-gender-equality-recognised-for-tenth-consecutive-year/',
-    'https://www.swinburne.edu.au/news/2014/05/boom-or-bust-but-seniorpreneurs-are-going-gangbusters/',
-    'https://www.swinburne.edu.au/news/2015/01/gravitational-wave-discovery-still-clouded-by-galactic-dust/',
-    'https://www.swinburne.edu.au/news/2018/08/growling-grass-frog-animation-creates-awareness-of-endangered-species/',
-    'https://www.swinburne.edu.au/news/2018/09/a-community-fix-for-the-affordable-housing-crisis/',
-    'https://www.swinburne.edu.au/news/2019/12/were-still-fighting-city-freeways-after-half-a-century/',
-    'https://www.swinburne.edu.au/news/2016/02/on-detecting-gravitational-waves-landmark-science-and-the-media/',
-    'https://www.swinburne.edu.au/news/2018/08/design-sprint-teaches-students-to-problem-solve-in-five-days/',
-    'https://www.swinburne.edu.au/news/2021/10/Swinburne-students-win-2021-advertising-capstone-challenge/',
-    'https://www.swinburne.edu.au/news/2023/04/swinburne-researchers-secure-funding-grant-for-bioinspired-nanomaterials/',
-    'https://www.swinburne.edu.au/news/2014/05/troy-gudgeon-wins-2014-master-builders-diploma-student-of-the-year/',
-    'https://www.swinburne.edu.au/news/2016/08/swinburne-study-measures-australias-digital-divide/',
-    'https://www.swinburne.edu.au/news/2020/10/justice-demands-we-follow-vatican-money-trail-on-cardinal-pell-case/',
-    'https://www.swinburne.edu.au/news/2019/04/seek-and-design-factory-melbourne-partner-in-innovation-challenge/',
-    'https://www.swinburne.edu.au/news/2020/01/prominent-scientist-leonie-walsh-appointed-to-swinburne-council/',
-    'https://www.swinburne.edu.au/news/2015/03/swinburne-survey-explores-the-impact-of-media-on-renovation-practices/',
-    'https://www.swinburne.edu.au/news/2015/04/australians-to-our-leaders-lift-your-game-and-think-long-term/',
-    'https://www.swinburne.edu.au/news/2016/04/swinburne-experts-influence-royal-commission-findings-on-family-violence/',
-    'https://www.swinburne.edu.au/news/2017/07/community-sector-offers-a-solid-platform-for-fair-social-housing/',
-    'https://www.swinburne.edu.au/news/2017/12/radio-observations-illuminate-gravitational-wave-event/',
-    'https://www.swinburne.edu.au/news/2019/01/enhancing-student-employability/',
-    'https://www.swinburne.edu.au/news/2019/07/opinion-prisoners-are-breaking-the-bank--lets-think-smarter/',
-    'https://www.swinburne.edu.au/news/2019/06/peak-human-potential-preparing-workers-for-the-digital-economy/',
-    'https://www.swinburne.edu.au/news/2020/03/graphene-solar-heating-film-offers-new-opportunity-for-efficient-thermal-energy-harvesting/',
-    'https://www.swinburne.edu.au/news/2014/08/swinburne-study-captures-brain-activity-in-children-suffering-emergence-delirium/',
-    'https://www.swinburne.edu.au/news/2015/05/new-colombo-plan-scholar-interning-at-top-research-facility-in-singapore/',
-    'https://www.swinburne.edu.au/news/2018/05/legumes-for-a-sustainable-farming-future/',
-    'https://www.swinburne.edu.au/news/2022/08/swinburne-alum-bringing-clarity-to-the-complex/',
-    'https://www.swinburne.edu.au/news/2023/01/swinburne-alum-designs-playgrounds-for-a-living/',
-    'https://www.swinburne.edu.au/news/2015/09/swinburne-students-recognised-at-endeavour-australia-cheung-kong-awards/',
-    'https://www.swinburne.edu.au/news/2015/08/indigenous-community-designs-itself-a-brighter-future/',
-    'https://www.swinburne.edu.au/news/2015/11/swinburne-film-and-television-graduates-take-out-top-atom-award/',
-    'https://www.swinburne.edu.au/news/2021/05/bees-with-backpacks-inspires-students-to-use-data/',
-    'https://www.swinburne.edu.au/news/2021/10/vocational-Student-of-the-Year-finalist-boosts-mental-health/',
-    'https://www.swinburne.edu.au/news/2014/05/un-doing-the-traditional-ballroom-lead-and-follow/',
-    'https://www.swinburne.edu.au/news/2015/07/an-uber-for-apartments-could-solve-some-common-housing-problem/',
-    'https://www.swinburne.edu.au/news/2014/10/swinburne-presents-options-to-keep-higher-ed-fees-in-check-1/',
-    'https://www.swinburne.edu.au/news/2019/06/swinburne-partners-with-world-first-crowdsourced-delivery-company/',
-    'https://www.swinburne.edu.au/news/2020/06/coronavirus-victoria-cant-blame-bad-luck-for-coronavirus-failures/',
-    'https://www.swinburne.edu.au/news/2014/01/high-temperature-processing-symposium/',
-    'https://www.swinburne.edu.au/news/2014/06/swinburne-university-joins-adobe-as-a-partner-by-design/',
-    'https://www.swinburne.edu.au/news/2014/07/swinburne-announces-fee-guarantee-for-2014-enrolments-/',
-    'https://www.swinburne.edu.au/news/2018/04/swinburne-to-transform-art-industry-using-blockchain-technology/',
-    'https://www.swinburne.edu.au/news/2015/06/immigrant-ambassadors-open-doors-for-australia-across-asia/',
-    'https://www.swinburne.edu.au/news/2021/12/Swinburne-venture-cup-bottomless-ideas-for-a-better-world/',
-    'https://www.swinburne.edu.au/news/2015/01/swinburne-students-success-at-international-film-festival/',
-    'https://www.swinburne.edu.au/news/2016/10/journey-into-outer-space-with-swinburne-graduates-earthlight/',
-    'https://www.swinburne.edu.au/news/2017/12/research-into-cleaner-batteries-backed-by-345m-government-grant/',
-    'https://www.swinburne.edu.au/news/2019/07/swinburne-and-bendigo-bank-lead-the-fintech-revolution/',
-    'https://www.swinburne.edu.au/news/2014/10/swinburnes-new-2-million-scholarship-program-to-support-more-than-250-students/',
-    'https://www.swinburne.edu.au/news/2016/01/graphene-aids-lens-technology-breakthrough/',
-    'https://www.swinburne.edu.au/news/2016/05/why-a-healthy-heart-can-reduce-the-risk-of-dementia/',
-    'https://www.swinburne.edu.au/news/2018/10/mapping-wellbeing-in-the-workplace/',
-    'https://www.swinburne.edu.au/news/2020/04/blackmagic-design-partners-with-swinburne-to-broadcast-pause-fest-2020/',
-    'https://www.swinburne.edu.au/news/2020/09/behind-the-screens-success-for-professional-placement-student/',
-    'https://www.swinburne.edu.au/news/2020/11/swinburne-partners-with-clontarf-foundation/',
-    'https://www.swinburne.edu.au/news/2015/09/swinburnes-factory-of-the-future-claims-excellence-in-timber-use-award/',
-    'https://www.swinburne.edu.au/news/2018/11/kendo-experience-and-smart-technology-create-a-winning-combination/',
-    'https://www.swinburne.edu.au/news/2015/11/leading-swinburne-nanophotonics-researcher-awarded-walter-boas-medal/',
-    'https://www.swinburne.edu.au/news/2016/10/do-american-voters-really-have-a-say-on-election-day/',
-    'https://www.swinburne.edu.au/news/2017/06/internet-of-things-solutions-for-smarter-factories-and-cities/',
-    'https://www.swinburne.edu.au/news/2021/02/swinburne-drives-food-delivery-training-for-international-students/',
-    'https://www.swinburne.edu.au/news/2023/06/swinburne-alum-champions-sustainable-travel/',
-    'https://www.swinburne.edu.au/news/2023/08/air-pass-program-accelerating-success-for-aerospace-ventures/',
-    'https://www.swinburne.edu.au/news/2014/05/most-accurate-recreation-of-the-universe-created/',
-    'https://www.swinburne.edu.au/news/2014/08/student-reporters-to-uncover-the-missed-and-untold-election-stories/',
-    'https://www.swinburne.edu.au/news/2014/10/will-australia-learn-from-nzs-mistakes-in-higher-education/',
-    'https://www.swinburne.edu.au/news/2016/10/us-election-what-impact-do-celebrity-endorsements-really-have/',
-    'https://www.swinburne.edu.au/news/2022/05/swinburne-study-reveals-psychological-challenges-facing-music-and-performing-arts/',
-    'https://www.swinburne.edu.au/news/2014/05/closing-the-gap---swinburne-develops-reconciliation-action-plan/',
-    'https://www.swinburne.edu.au/news/2019/12/swinburne-experts-share-smart-cities-insights-with-delegation-from-vietnam/',
-    'https://www.swinburne.edu.au/news/2015/10/first-cohort-of-students-graduate-from-swinburne-nawaloka-college/',
-    'https://www.swinburne.edu.au/news/2016/07/factcheck-indigenous-women-and-domestic-violence/',
-    'https://www.swinburne.edu.au/news/2019/02/swinburne-commended-for-its-commitment-to-shaping-melbournes-future/',
-    'https://www.swinburne.edu.au/news/2022/01/a-cosmic-romance-written-in-the-stars/',
-    'https://www.swinburne.edu.au/news/2016/11/new-partnership-to-advance-smart-manufacturing/',
-    'https://www.swinburne.edu.au/news/2017/06/screening-for-family-violence-does-not-always-meet-clients-needs/',
-    'https://www.swinburne.edu.au/news/2020/05/dreamtime-at-the-g-reflections/',
-    'https://www.swinburne.edu.au/news/2017/05/what-happens-next-for-journalists-when-they-leave-newsrooms/',
-    'https://www.swinburne.edu.au/news/2021/03/q-and-a-with-swinburne-superstar-of-stem-dr-dana-rezazadegan/',
-    'https://www.swinburne.edu.au/news/2021/11/Swinburne-students-work-with-truce-films-to-create-web-series/',
-    'https://www.swinburne.edu.au/news/2023/12/order-of-australia-foundation-scholarship-opens-doors-for-swinburne-student/',
-    'https://www.swinburne.edu.au/news/2017/03/how-diverse-societies-can-do-better-than-passive-tolerance/',
-    'https://www.swinburne.edu.au/news/2017/03/why-venezuela-is-a-country-to-watch-in-2017/',
-    'https://www.swinburne.edu.au/news/2019/10/swinburne-engineer-helps-toyotas-nascar-team-find-racing-success/',
-    'https://www.swinburne.edu.au/news/2014/02/electric-vehicle-expo-gives-public-chance-to-explore-transport-alternatives/',
-    'https://www.swinburne.edu.au/news/2014/05/indian-innovation-champion-visits-swinburne/',
-    'https://www.swinburne.edu.au/news/2017/07/supercool-breakthrough-brings-new-quantum-benchmark/',
-    'https://www.swinburne.edu.au/news/2017/12/swinburne-bachelor-of-nursing-accredited-to-train-a-new-generation/',
-    'https://www.swinburne.edu.au/news/2014/09/digital-aquarium-set-to-improve-teaching-and-learning-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2015/07/swinburne-reaffirms-commitment-to-sustainability-on-release-of-2014-report/',
-    'https://www.swinburne.edu.au/news/2017/05/poor-health-experienced-by-those-undergoing-chronic-homelessness/',
-    'https://www.swinburne.edu.au/news/2014/02/swinburnes-new-security-and-welfare-app-makes-swinburne-a-safer-campus-for-students-1/',
-    'https://www.swinburne.edu.au/news/2017/03/swinburne-journalists-shortlisted-for-2016-quill-awards/',
-    'https://www.swinburne.edu.au/news/2017/06/world-leading-approach-to-engineering-education/',
-    'https://www.swinburne.edu.au/news/2019/02/why-australians-are-falling-in-love-with-american-football/',
-    'https://www.swinburne.edu.au/news/2019/10/opinion-tehran-grabs-australians-to-taunt-us-into-a-deal/',
-    'https://www.swinburne.edu.au/news/2020/08/australias-dual-sector-universities-call-for-a-more-coherent-post-secondary-system/',
-    'https://www.swinburne.edu.au/news/2021/03/dealing-with-bloody-taboos-in-advertising/',
-    'https://www.swinburne.edu.au/news/2015/11/swinburne-phd-student-nathan-kotlarewski-receives-international-design-award/',
-    'https://www.swinburne.edu.au/news/2017/01/destroying-research-embryos-within-14-days-limits-breakthroughs/',
-    'https://www.swinburne.edu.au/news/2017/03/swinburnes-health-sciences-internship-program-expands/',
-    'https://www.swinburne.edu.au/news/2023/03/Swinburne-enters-the-metaverse-with-Factory-of-Future-digital-twin/',
-    'https://www.swinburne.edu.au/news/2014/05/cosmic-explosion-spotted-in-neighbouring-galaxy/',
-    'https://www.swinburne.edu.au/news/2020/07/three-swinburne-subjects-debut-in-global-ranking-of-academic-subjects-2020/',
-    'https://www.swinburne.edu.au/news/2015/08/doors-2-jobs-supporting-indigenous-employment-in-australia/',
-    'https://www.swinburne.edu.au/news/2016/01/growing-challenges-are-disrupting-old-ways-of-getting-around-cities/',
-    'https://www.swinburne.edu.au/news/2018/12/professor-bronwyn-fox-recognised-with-2018-gcmm-research-leadership-award/',
-    'https://www.swinburne.edu.au/news/2014/09/3d-imax-film-hidden-universe-recognised-at-research-commercialisation-awards-1/',
-    'https://www.swinburne.edu.au/news/2015/05/swinburne-welcomes-prahran-secondary-school-site-announcement/',
-    'https://www.swinburne.edu.au/news/2016/11/report-uncovers-complexity-of-cyber-safety-in-remote-communities/',
-    'https://www.swinburne.edu.au/news/2019/07/examining-pop-culture-in-the-digital-age-1/',
-    'https://www.swinburne.edu.au/news/2022/06/honouring-swinburne-engineers-this-international-women-in-engineering-day/',
-    'https://www.swinburne.edu.au/news/2019/06/team-swinburne-takes-on-gendered-marketing-in-europe/',
-    'https://www.swinburne.edu.au/news/2019/08/rna-anniversary-swinburne-continues-to-strengthen-support/',
-    'https://www.swinburne.edu.au/news/2020/02/small-world-atom-scale-materials-are-the-next-tech-frontier/',
-    'https://www.swinburne.edu.au/news/2017/05/biggest-emitters-opt-to-wait-and-see-over-emissions-reduction-fund/',
-    'https://www.swinburne.edu.au/news/2018/06/better-physical-fitness-and-lower-aortic-stiffness-key-to-slower-brain-ageing/',
-    'https://www.swinburne.edu.au/news/2016/10/augmented-reality-game-to-launch-in-melbourne-international-games-week/',
-    'https://www.swinburne.edu.au/news/2018/02/four-breakthroughs-that-will-revolutionise-long-haul-flights-in-10-years/',
-    'https://www.swinburne.edu.au/news/2020/04/preparing-our-nursing-students-to-help-with-the-fight-against-coronavirus/',
-    'https://www.swinburne.edu.au/news/2014/12/renewed-focus-on-training-welcome-as-part-of-federal-ministerial-changes/',
-    'https://www.swinburne.edu.au/news/2021/06/swinburne-community-members-named-in-the-queens-birthday-2021-honours-list/',
-    'https://www.swinburne.edu.au/news/2022/05/new-research-shows-the-way-families-watch-TV-is-changing/',
-    'https://www.swinburne.edu.au/news/2023/08/free-events-at-swinburne-to-celebrate-national-science-week-2023/',
-    'https://www.swinburne.edu.au/news/2014/05/heavens-above-what-made-the-cosmic-flash-that-lit-earth-today/',
-    'https://www.swinburne.edu.au/news/2014/06/super-six-awarded-swinburne-excellence-in-sustainable-product-design-award/',
-    'https://www.swinburne.edu.au/news/2014/08/sleep-apnoea-prevention-system-in-the-running-for-prestigious-design-award/',
-    'https://www.swinburne.edu.au/news/2015/09/the-koorie-heritage-trust-re-centres-indigenous-communities-by-design/',
-    'https://www.swinburne.edu.au/news/2015/10/preferred-respondent-announced-for-lilydale/',
-    'https://www.swinburne.edu.au/news/2018/10/swinburne-researcher-contributes-to-the-development-of-new-50-dollar-note/',
-    'https://www.swinburne.edu.au/news/2019/10/swinburne-stem-subjects-soar-in-times-higher-education-world-university-rankings/',
-    'https://www.swinburne.edu.au/news/2016/03/victorias-future-industries-start-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2016/06/students-in-national-semi-finals-of-microsoft-protege-competition/',
-    'https://www.swinburne.edu.au/news/2019/04/swinburne-joins-australias-multi-billion-dollar-smart-satellite-revolution/',
-    'https://www.swinburne.edu.au/news/2017/08/stopping-the-skills-shortage-in-remote-communities/',
-    'https://www.swinburne.edu.au/news/2018/05/swinburne-to-offer-postgraduate-research-scholarships-for-pakistani-students/',
-    'https://www.swinburne.edu.au/news/2018/05/swinburne-rated-in-top-three-victorian-universities-for-student-satisfaction/',
-    'https://www.swinburne.edu.au/news/2015/03/is-it-possible-to-circumvent-metadata-retention-and-retain-your-privacy/',
-    'https://www.swinburne.edu.au/news/2019/10/swinburne-and-medical-connect-democratise-air-travel/',
-    'https://www.swinburne.edu.au/news/2015/10/professor-jacqueline-hitchon-visits-swinburne/',
-    'https://www.swinburne.edu.au/news/2016/06/computers-may-be-evolving-but-are-they-intelligent/',
-    'https://www.swinburne.edu.au/news/2016/06/swinburne-design-students-partner-with-city-of-boroondara/',
-    'https://www.swinburne.edu.au/news/2017/05/the-insecurity-of-private-renters--how-do-they-manage-it/',
-    'https://www.swinburne.edu.au/news/2021/07/expanding-indigenous-spaces-across-swinburne/',
-    'https://www.swinburne.edu.au/news/2024/03/Swinburne-supporting-regional-communities-through-early-childhood-teaching/',
-    'https://www.swinburne.edu.au/news/2024/07/Swinburne-among-worlds-top-15-universities-for-scientific-impact/',
-    'https://www.swinburne.edu.au/news/2014/03/alan-duffy-joins-swinburne-as-research-fellow-and-science-communicator/',
-    'https://www.swinburne.edu.au/news/2015/02/too-much-at-stake-for-weasel-words-on-submarines/',
-    'https://www.swinburne.edu.au/news/2016/12/supporting-refugees-to-access-higher-education/',
-    'https://www.swinburne.edu.au/news/2017/08/less-rem-sleep-is-tied-to-greater-risk-of-dementia/',
-    'https://www.swinburne.edu.au/news/2018/04/opening-the-front-door-to-innovation-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2019/02/our-journey-film-tells-stories-of-time-away-from-remote-communities/',
-    'https://www.swinburne.edu.au/news/2017/10/swinburne-game-developer-wins-melbourne-knowledge-fellowship/',
-    'https://www.swinburne.edu.au/news/2018/12/swinburne-awarded-for-gender-equity-action/',
-    'https://www.swinburne.edu.au/news/2014/09/melbourne-students-unite-for-youth-humanitarian-festival/',
-    'https://www.swinburne.edu.au/news/2016/10/clinton-and-trump-meet-in-final-presidential-debate-experts-respond/',
-    'https://www.swinburne.edu.au/news/2014/05/a-message-to-students-from-vice-chancellor-professor-linda-kristjanson/',
-    'https://www.swinburne.edu.au/news/2014/06/swinburne-alumnus-thom-neal-named-emerging-cinematographer-of-the-year/',
-    'https://www.swinburne.edu.au/news/2015/11/three-things-universities-can-do-to-link-with-business/',
-    'https://www.swinburne.edu.au/news/2017/08/swinburnes-reconciliation-action-plan-achieves-elevate-status/',
-    'https://www.swinburne.edu.au/news/2017/09/swinburnes-brightest-compete-in-three-minute-thesis-competition/',
-    'https://www.swinburne.edu.au/news/2023/11/swinburne-shines-in-arwu-global-ranking-of-academic-subjects-2023/',
-    'https://www.swinburne.edu.au/news/2017/10/swinburne-to-host-the-worlds-first-graphene-certification-centre/',
-    'https://www.swinburne.edu.au/news/2022/10/swinburne-welcomes-made-in-victoria-2030-manufacturing-statement/',
-    'https://www.swinburne.edu.au/news/2023/04/will-ai-ever-reach-human-level-intelligence-we-asked-five-experts/',
-    'https://www.swinburne.edu.au/news/2015/03/hackers-kit-bag-the-tools-that-terrorise-the-internet/',
-    'https://www.swinburne.edu.au/news/2015/10/its-back-to-school-for-facebook-and-its-personal/',
-    'https://www.swinburne.edu.au/news/2016/11/how-the-tobacco-industry-is-gaming-australian-health-regulations/',
-    'https://www.swinburne.edu.au/news/2018/11/swinburne-hosts-victorian-first-lego-league-championships/',
-    'https://www.swinburne.edu.au/news/2014/03/swinburne-apprentice-nathan-frauenfelder-wins-world-plumbing-day-skills-competition/',
-    'https://www.swinburne.edu.au/news/2015/08/student-reporters-to-uncover-the-missed-and-untold-election-stories/',
-    'https://www.swinburne.edu.au/news/2019/05/swinburne-and-lexus-broadcast-a-message-to-space-/',
-    'https://www.swinburne.edu.au/news/2023/11/astronomers-baffled-by-repeat-explosions/',
-    'https://www.swinburne.edu.au/news/2014/09/swinburne-secures-11-million-in-grants-for-optical-it-research-projects-with-china/',
-    'https://www.swinburne.edu.au/news/2017/12/nostalgic-summer-day-story-wins-swinburne-microfiction-challenge/',
-    'https://www.swinburne.edu.au/news/2019/04/ab-rogers-shares-25-projects-at-the-school-of-design/',
-    'https://www.swinburne.edu.au/news/2019/12/new-research-highlights-lack-of-affordable-rentals-for-low-income-australians/',
-    'https://www.swinburne.edu.au/news/2022/03/empowering-students-with-disability-to-better-manage-their-careers/',
-    'https://www.swinburne.edu.au/news/2022/06/swinburne-alum-gaming-app-transforms-education-and-training/',
-    'https://www.swinburne.edu.au/news/2016/11/72-hour-makeathon-aims-to-improve-everyday-life-of-the-disabled/',
-    'https://www.swinburne.edu.au/news/2017/05/swinburne-leading-the-way-for-financial-inclusion/',
-    'https://www.swinburne.edu.au/news/2017/10/nhrmc-fellowship-awarded-to-swinburne-mental-health-researcher/',
-    'https://www.swinburne.edu.au/news/2020/11/giuseppe-pagano-and-design-for-social-change-in-fascist-italy/',
-    'https://www.swinburne.edu.au/news/2022/03/52-million-boost-to-supercharged-australian-space-manufacturing-network/',
-    'https://www.swinburne.edu.au/news/2016/07/transforming-quantum-theories-into-quantum-technologies/',
-    'https://www.swinburne.edu.au/news/2017/02/deeper-wider-faster-program-seeks-to-make-new-discoveries-in-astronomy/',
-    'https://www.swinburne.edu.au/news/2017/12/swinburne-professor-appointed-chief-adviser-to-sarawak-government/',
-    'https://www.swinburne.edu.au/news/2021/12/STEMM-students-propose-sustainability-solutions/',
-    'https://www.swinburne.edu.au/news/2015/11/closet-cleanout-wins-premiers-sustainability-award/',
-    'https://www.swinburne.edu.au/news/2019/04/swinburne-receives-grant-to-develop-graduates-for-future-automotive-industry/',
-    'https://www.swinburne.edu.au/news/2020/05/university-and-industry-co-creation-key-to-covid-19-recovery/',
-    'https://www.swinburne.edu.au/news/2024/08/swinburne-led-fungi-experiment-blasts-off-to-the-international-space-station/',
-    'https://www.swinburne.edu.au/news/2016/06/antibacterial-solutions-inspired-by-nature/',
-    'https://www.swinburne.edu.au/news/2018/09/swinburnes-agse-hears-from-business-leader-and-entrepreneur/',
-    'https://www.swinburne.edu.au/news/2018/11/mit-senseable-city-lab-and-smart-cities-research-institute-collaborate/',
-    'https://www.swinburne.edu.au/news/2022/11/swinburne-awarded-best-in-class-for-equity-and-access/',
-    'https://www.swinburne.edu.au/news/2016/10/swinburne-students-win-visual-merchandising-competition/',
-    'https://www.swinburne.edu.au/news/2019/06/how-a-repair-economy-creates-a-kinder-more-caring-community/',
-    'https://www.swinburne.edu.au/news/2020/01/swinburne-innovation-recognised-at-global-awards/',
-    'https://www.swinburne.edu.au/news/2020/10/swinburne-welcome-scholarship-paves-new-opportunities-for-students/',
-    'https://www.swinburne.edu.au/news/2018/08/architectural-design-focus-on-materials-and-making/',
-    'https://www.swinburne.edu.au/news/2015/05/swinburne-hosts-poster-exhibtion-as-part-of-melbourne-international-design-week/',
-    'https://www.swinburne.edu.au/news/2016/05/swinburne-partners-with-brazil-to-focus-on-smart-industries/',
-    'https://www.swinburne.edu.au/news/2016/05/swinburne-is-tracking-the-entire-journey-of-bodys-immune-cells/',
-    'https://www.swinburne.edu.au/news/2015/07/swinburne-unveils-australian-first-electric-bus/',
-    'https://www.swinburne.edu.au/news/2016/11/centre-for-design-innovation-launches-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2020/10/checking-in-with-a-colleague-rachel-gilder/',
-    'https://www.swinburne.edu.au/news/2022/07/live-leadership-data-for-anyone-who-needs-it/',
-    'https://www.swinburne.edu.au/news/2023/08/vice-chancellor-professor-pascale-quester-reappointed-for-second-term/',
-    'https://www.swinburne.edu.au/news/2024/02/swinburne-chancellor-reappointed-for-second-term/',
-    'https://www.swinburne.edu.au/news/2024/09/Seven-Swinburne-startups-to-watch-in-2024/',
-    'https://www.swinburne.edu.au/news/2015/04/swinburne-partners-with-the-brainary-to-deliver-robotics-workshops/',
-    'https://www.swinburne.edu.au/news/2016/07/more-financial-assistance-for-regional-and-rural-students/',
-    'https://www.swinburne.edu.au/news/2017/08/cultural-engagement-lowers-reoffending-rate-of-indigenous-prisoners/',
-    'https://www.swinburne.edu.au/news/2014/08/why-australians-should-back-turnbull-in-the-stoush-over-copyright/',
-    'https://www.swinburne.edu.au/news/2014/11/blocking-piracy-websites-is-bad-for-australias-digital-future/',
-    'https://www.swinburne.edu.au/news/2014/12/professor-margaret-reid-has-spent-her-life-studying-tiny-particles/',
-    'https://www.swinburne.edu.au/news/2015/12/swinburne-leads-development-of-australian-made-electric-buses/',
-    'https://www.swinburne.edu.au/news/2018/11/the-benefits--and-pitfalls--of-working-in-isolation/',
-    'https://www.swinburne.edu.au/news/2020/08/swinburne-celebrates-astronomy-as-part-of-national-science-week/',
-    'https://www.swinburne.edu.au/news/2021/12/are-charities-being-silenced-why-new-law-is-alarming-activists-and-could-scuttle-their-election-campaigns/',
-    'https://www.swinburne.edu.au/news/2023/11/Students-start-talking-for-global-sustainable-changes/',
-    'https://www.swinburne.edu.au/news/2018/12/leaving-traces-2-symposium-planned-for-melbourne-in-2019/',
-    'https://www.swinburne.edu.au/news/2022/11/flexible-work-supports-mental-wellbeing-but-only-with-good-leadership/',
-    'https://www.swinburne.edu.au/news/2014/11/swinburne-alumnus-liz-rodriguez-recognised-for-exemplary-humanitarian-service/',
-    'https://www.swinburne.edu.au/news/2021/09/how-big-companies-are-targeting-middle-income-countries-to-boost-ultra-processed-food-sales/',
-    'https://www.swinburne.edu.au/news/2014/03/training-police-to-better-respond-to-people-with-mental-illness/',
-    'https://www.swinburne.edu.au/news/2016/04/swinburne-research-highlights-the-cognitive-benefits-of-curcumin/',
-    'https://www.swinburne.edu.au/news/2016/08/swinburne-and-coventry-university-form-partnership/',
-    'https://www.swinburne.edu.au/news/2018/08/swinburne-to-host-2018-apprentices-skills-competition/',
-    'https://www.swinburne.edu.au/news/2019/09/digital-literacy-australian-first---swinburne-becomes-an-adobe-creative-campus/',
-    'https://www.swinburne.edu.au/news/2021/07/swinburne-celebrates-women-astronomers/',
-    'https://www.swinburne.edu.au/news/2022/02/new-supercomputer-to-herald-next-generation-of-discoveries/',
-    'https://www.swinburne.edu.au/news/2016/03/innovation-breakfast-with-finnish-delegation/',
-    'https://www.swinburne.edu.au/news/2021/07/Swinburne-student-helps-financially-empower-pacific-islander-women/',
-    'https://www.swinburne.edu.au/news/2014/03/1st-impressions-of-class-designs-on-life-in-melbourne/',
-    'https://www.swinburne.edu.au/news/2015/03/the-tenuous-link-between-population-and-prosperity/',
-    'https://www.swinburne.edu.au/news/2015/06/a-celebration-of-writing-at-the-inaugural-swinburne-writers-festival-2015/',
-    'https://www.swinburne.edu.au/news/2020/02/australias-dual-sector-universities-renew-call-for-education-reform/',
-    'https://www.swinburne.edu.au/news/2022/02/industry-leaders-to-boost-centre-for-the-new-workforce/',
-    'https://www.swinburne.edu.au/news/2022/06/vic-set-to-boost-medtech-under-program-launched-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2015/03/expert-panel-give-their-thoughts-on-metadata-retention-report/',
-    'https://www.swinburne.edu.au/news/2020/12/swinburne-researcher-funded-to-help-reduce-the-impact-of-drug-affected-driving/',
-    'https://www.swinburne.edu.au/news/2015/12/excellence-in-research-australia-2015-physics-research-strongly-recognised/',
-    'https://www.swinburne.edu.au/news/2016/10/new-entrepreneurship-and-innovation-driven-courses-with-agse-re-launch/',
-    'https://www.swinburne.edu.au/news/2015/05/sir-reginald-ansett-scholarship-for-aviation-winner-announced/',
-    'https://www.swinburne.edu.au/news/2015/09/immigrations-disappearing-visa-applicants/',
-    'https://www.swinburne.edu.au/news/2017/09/swinburne-students-shortlisted-for-james-dyson-award/',
-    'https://www.swinburne.edu.au/news/2018/12/new-awards-new-ambassador-australian-women-in-stem-look-to-2019/',
-    'https://www.swinburne.edu.au/news/2018/07/bmw-funds-smart-melbourne-scholarship-for-swinburne-students/',
-    'https://www.swinburne.edu.au/news/2014/01/cinema-classics-five-of-the-best-science-and-technology-films/',
-    'https://www.swinburne.edu.au/news/2021/02/leftist-mob-bullying-should-be-designated-a-hate-speech-crime/',
-    'https://www.swinburne.edu.au/news/2015/04/manufacturing-research-at-crossroads/',
-    'https://www.swinburne.edu.au/news/2016/07/mercer-investments-selected-as-swinburnes-new-investment-manager/',
-    'https://www.swinburne.edu.au/news/2018/01/swinburne-partners-with-csiro-to-launch-silicon-valley-presence/',
-    'https://www.swinburne.edu.au/news/2018/03/surfing-stars-and-science-sway-swinburnes-newest-astronomer/',
-    'https://www.swinburne.edu.au/news/2021/02/new-swinburne-hydrogen-hub-to-advance-a-net-zero-emission-future/',
-    'https://www.swinburne.edu.au/news/2021/07/swinburne-researchers-investigate-effects-of-medicinal-cannabis-on-drivers/',
-    'https://www.swinburne.edu.au/news/2021/09/new-swinburne-hub-co-creating-the-medical-technologies-of-the-future/',
-    'https://www.swinburne.edu.au/news/2021/11/swinburne-welcomes-young-children-through-childrens-university/',
-    'https://www.swinburne.edu.au/news/2015/04/putting-students-first-in-the-case-for-higher-education-reform/',
-    'https://www.swinburne.edu.au/news/2018/06/swinburne-interior-architecture-student-wins-australian-graduate-of-the-year/',
-    'https://www.swinburne.edu.au/news/2019/04/designing-for-change-encourages-strategic-foresight-through-play/',
-    'https://www.swinburne.edu.au/news/2020/08/new-directors-appointed-to-swinburne-research-institutes/',
-    'https://www.swinburne.edu.au/news/2023/08/swinburne-scholarship-recipient-at-the-cutting-edge-of-engineering/',
-    'https://www.swinburne.edu.au/news/2016/06/professor-neville-owen-appointed-distinguished-professor-in-health-sciences-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2017/12/swinburne-receives-grant-to-lead-the-charge-on-industry-40/',
-    'https://www.swinburne.edu.au/news/2024/08/academic-discovery-and-cultural-exchange-during-vietnam-tour/',
-    'https://www.swinburne.edu.au/news/2017/03/swinburne-launches-first-charter-of-cultural-diversity-/',
-    'https://www.swinburne.edu.au/news/2017/07/business-without-borders-helps-young-mums-program-to-develop-a-micro-business/',
-    'https://www.swinburne.edu.au/news/2022/04/swinburne-ignites-travel-bug-with-20k-travel-prize/',
-    'https://www.swinburne.edu.au/news/2017/07/swinburne-in-top-of-times-higher-education-asia-pacific-university-rankings/',
-    'https://www.swinburne.edu.au/news/2018/05/level-3-autonomous-technology-the-deadliest-stage-in-self-driving-development/',
-    'https://www.swinburne.edu.au/news/2020/12/swinburne-offers-real-industry-experience-to-all-undergraduate-students-from-2021/',
-    'https://www.swinburne.edu.au/news/2022/06/swinburne-congratulates-new-minister-for-education/',
-    'https://www.swinburne.edu.au/news/2023/07/swinburne-continues-to-climb-in-young-university-rankings/',
-    'https://www.swinburne.edu.au/news/2014/05/reaching-for-the-stars-in-australia/',
-    'https://www.swinburne.edu.au/news/2018/08/innovative-program-provides-housing-for-homeless/',
-    'https://www.swinburne.edu.au/news/2018/11/swinburne-pave-director-helps-shape-the-future-of-aged-care-services/',
-    'https://www.swinburne.edu.au/news/2019/03/swinburne-awards-honorary-doctorates-to-three-inspiring-trailblazers/',
-    'https://www.swinburne.edu.au/news/2020/05/swinburne-committed-to-supporting-vulnerable-students-through-covid-19/',
-    'https://www.swinburne.edu.au/news/2021/10/swinburne-start-up-receives-backing-to-make-mining-environmentally-safer/',
-    'https://www.swinburne.edu.au/news/2023/04/three-swinburne-students-win-prestigious-university-medal/',
-    'https://www.swinburne.edu.au/news/2019/05/a-new-social-connection-tool-helps-us-invest-in-our-relationships/',
-    'https://www.swinburne.edu.au/news/2022/01/swinburne-appoints-inaugural-pro-vice-chancellor-indigenous-engagement/',
-    'https://www.swinburne.edu.au/news/2016/02/we-must-celebrate-gender-and-sexual-diversity-in-our-schools/',
-    'https://www.swinburne.edu.au/news/2017/02/swinburne-to-offer-bachelor-of-engineering-practice-honours-degree/',
-    'https://www.swinburne.edu.au/news/2018/05/loneliness-is-a-health-issue-and-needs-targeted-solutions/',
-    'https://www.swinburne.edu.au/news/2021/02/dream-come-true-for-swinburne-astrophysics-student/',
-    'https://www.swinburne.edu.au/news/2015/06/swinburne-partners-with-university-of-baghdad-on-dual-engineering-degree/',
-    'https://www.swinburne.edu.au/news/2016/10/ideas-and-start-ups-will-form-in-future-innovation-precinct/',
-    'https://www.swinburne.edu.au/news/2021/03/swinburne-comes-out-on-top-for-student-experience-employer-satisfaction/',
-    'https://www.swinburne.edu.au/news/2015/04/who-bears-the-cost-when-your-uber-or-airbnb-turns-bad/',
-    'https://www.swinburne.edu.au/news/2015/12/research-into-mystery-signals-at-parkes-ranks-in-altmetric-top-100/',
-    'https://www.swinburne.edu.au/news/2016/12/swinburne-partners-with-wipro-to-pioneer-digital-innovation/',
-    'https://www.swinburne.edu.au/news/2018/04/formula-e-racing-puts-power-in-the-hands-of-fans/',
-    'https://www.swinburne.edu.au/news/2024/06/Richmond-and-Swinburne-partnership-to-reach-beyond-a-decade/',
-    'https://www.swinburne.edu.au/news/2014/07/swinburne-develops-online-clinic-for-gastroparesis-sufferers/',
-    'https://www.swinburne.edu.au/news/2016/11/swinburne-to-host-tom-makeathon-for-assistive-technology/',
-    'https://www.swinburne.edu.au/news/2016/12/swinburne-sweeps-in2science-mentor-awards/',
-    'https://www.swinburne.edu.au/news/2017/05/swinburne-partners-with-global-leader-in-technology-innovation/',
-    'https://www.swinburne.edu.au/news/2019/08/opinion-jailing-bosses-for-wage-theft-no-payback-for-dudded-workers/',
-    'https://www.swinburne.edu.au/news/2020/08/checking-in-with-a-colleague-professor-sally-mcarthur/',
-    'https://www.swinburne.edu.au/news/2021/11/four-swinburne-researchers-named-leaders-in-their-field-in-australia/',
-    'https://www.swinburne.edu.au/news/2018/11/dxc-technology-and-swinburne-open-dxc-digital-transformation-centre-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2019/11/message-from-the-vc-sustainability-and-climate-action/',
-    'https://www.swinburne.edu.au/news/2023/05/revenge-excitement-or-profit-why-do-people-commit-arson/',
-    'https://www.swinburne.edu.au/news/2014/11/swinburne-and-kildonan-unitingcare-partner-to-tackle-financial-hardship/',
-    'https://www.swinburne.edu.au/news/2015/05/support-for-trichotillomania-sufferers/',
-    'https://www.swinburne.edu.au/news/2015/07/introducing-swinburnes-new-centre-for-forensic-behavioural-science/',
-    'https://www.swinburne.edu.au/news/2019/11/ten-swinburne-academics-named-highly-cited-researchers-in-eleven-disciplines-in-2019/',
-    'https://www.swinburne.edu.au/news/2024/01/swinburne-and-scope-design-accessible-usb-sticks-to-improve-lives/',
-    'https://www.swinburne.edu.au/news/2015/06/migrants-and-refugees-building-their-futures/',
-    'https://www.swinburne.edu.au/news/2016/08/how-temporary-migration-is-changing-australia--and-the-world/',
-    'https://www.swinburne.edu.au/news/2020/09/checking-in-with-a-colleague-dr-jessica-mackelprang/',
-    'https://www.swinburne.edu.au/news/2016/08/how-australia-can-protect-consumers-from-untested-stem-cell-treatments/',
-    'https://www.swinburne.edu.au/news/2017/10/connecting-indigenous-students-with-university-through-design-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2016/03/swinburne-pledges-commitment-to-migrant-community/',
-    'https://www.swinburne.edu.au/news/2016/09/direct-action-plan-not-as-motivating-as-the-carbon-tax/',
-    'https://www.swinburne.edu.au/news/2015/09/professor-bronwyn-fox-appointed-factory-of-the-future-director-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2019/10/learnings-from-pakistan-brought-to-dandenong/',
-    'https://www.swinburne.edu.au/news/2023/10/new-energy-hub-helps-Victoria-build-a-renewables-ready-grid/',
-    'https://www.swinburne.edu.au/news/2015/10/building-the-skills-for-an-innovative-economy/',
-    'https://www.swinburne.edu.au/news/2015/11/immune-cells-research-receives-national-health-and-medical-research-council-funding/',
-    'https://www.swinburne.edu.au/news/2016/09/swinburne-signs-agreement-with-harvard-on-global-philanthropy-report/',
-    'https://www.swinburne.edu.au/news/2020/11/dr-nisa-salim-recognised-for-high-quality-approach-to-science/',
-    'https://www.swinburne.edu.au/news/2015/02/why-more-and-more-australians-are-voting-before-election-day/',
-    'https://www.swinburne.edu.au/news/2017/08/innovative-approach-to-3d-concrete-printing-recognised/',
-    'https://www.swinburne.edu.au/news/2017/11/understanding-the-triggers-for-filicide-will-help-prevent-it/',
-    'https://www.swinburne.edu.au/news/2019/05/swinburne-and-amazon-web-services-start-australian-first-cloud-innovation-centre/',
-    'https://www.swinburne.edu.au/news/2014/03/swinburne-online-celebrates-first-graduating-class/',
-    'https://www.swinburne.edu.au/news/2016/02/jupiter-to-outshine-all-other-objects-in-the-night-sky/',
-    'https://www.swinburne.edu.au/news/2017/10/swinburne-ranks-in-top-250-for-the-engineering-and-technology/',
-    'https://www.swinburne.edu.au/news/2020/11/vice-chancellor-professor-pascale-quester-reflects-on-first-100-days/',
-    'https://www.swinburne.edu.au/news/2014/07/swinburne-student-named-international-student-of-the-year-1/',
-    'https://www.swinburne.edu.au/news/2016/12/why-we-should-no-longer-consider-last-tango-in-paris-a-classic/',
-    'https://www.swinburne.edu.au/news/2022/09/yes-you-can-reheat-food-more-than-once-heres-why/',
-    'https://www.swinburne.edu.au/news/2014/04/swinburne-recognised-as-big-mover-in-scientific-research-by-journal-nature/',
-    'https://www.swinburne.edu.au/news/2014/10/nationwide-research-project-to-shed-light-on-australias-social-enterprise-sector/',
-    'https://www.swinburne.edu.au/news/2017/02/spontaneous-dust-traps--the-missing-link-in-how-planets-form/',
-    'https://www.swinburne.edu.au/news/2020/06/the-housing-boom-propelled-inequality-but-a-coronavirus-housing-bust-will-skyrocket-it/',
-    'https://www.swinburne.edu.au/news/2017/04/reshaping-what-it-means-to-be-a-contemporary-lawyer/',
-    'https://www.swinburne.edu.au/news/2017/08/jeffrey-bleich-democracies-in-crisis-as-truth-takes-a-backseat/',
-    'https://www.swinburne.edu.au/news/2017/12/marngo-designing-futures-program-connects-students-to-culture/',
-    'https://www.swinburne.edu.au/news/2018/05/swinburne-and-tableau-collaborate-to-deliver-digital-business-management-course/',
-    'https://www.swinburne.edu.au/news/2015/09/australias-resettlement-of-syrian-refugees-is-tinged-with-deja-vu/',
-    'https://www.swinburne.edu.au/news/2016/04/the-cost-of-youth-homelessness-in-australia/',
-    'https://www.swinburne.edu.au/news/2017/10/swinburne-students-impress-7-eleven-with-advertising-pitch/',
-    'https://www.swinburne.edu.au/news/2017/11/royal-commission-chair-blames-abuse-on-disregard-for-childrens-rights/',
-    'https://www.swinburne.edu.au/news/2018/06/swinburne-commits-to-united-nations-sustainable-development-goals/',
-    'https://www.swinburne.edu.au/news/2019/04/swinburne-courses-to-be-offered-in-vietnam/',
-    'https://www.swinburne.edu.au/news/2019/09/swinburne-students-at-iaac-global-summer-school-progress-work-with-mycelium/',
-    'https://www.swinburne.edu.au/news/2020/08/swinburne-rises-in-prestigious-academic-ranking-of-world-universities-2020/',
-    'https://www.swinburne.edu.au/news/2021/08/Animated-films-bring-indigenous-students-experiences-to-life-at-acmi/',
-    'https://www.swinburne.edu.au/news/2014/09/swinburne-in-the-top-three-australian-unis-for-cyber-security/',
-    'https://www.swinburne.edu.au/news/2016/04/twisted-light-could-dramatically-improve-internet-speeds/',
-    'https://www.swinburne.edu.au/news/2023/03/swinburne-students-craft-garden-of-the-future/',
-    'https://www.swinburne.edu.au/news/2019/09/swinburne-graduate-among-worlds-best-young-tradespeople-at-skill-olympics/',
-    'https://www.swinburne.edu.au/news/2014/03/expressions-of-interest-open-for-former-lilydale-campus/',
-    'https://www.swinburne.edu.au/news/2015/09/the-rise-of-the-senior-entrepreneur/',
-    'https://www.swinburne.edu.au/news/2015/12/effects-of-seasonality-in-australian-house-and-unit-prices/',
-    'https://www.swinburne.edu.au/news/2017/11/worthy-it-educator-recognised-for-leadership-and-service/',
-    'https://www.swinburne.edu.au/news/2019/02/swinburne-and-victorian-chamber-of-commerce-launch-businesses-into-space/',
-    'https://www.swinburne.edu.au/news/2022/10/coldquanta-swinburne-centre-to-turbocharge-quantum-tech/',
-    'https://www.swinburne.edu.au/news/2014/08/good-universities-guide-2015-swinburne-rates-five-stars-for-graduate-satisfaction-1/',
-    'https://www.swinburne.edu.au/news/2015/11/swinburne-and-hong-kong-poly-university-partner-to-offer-joint-phd-program/',
-    'https://www.swinburne.edu.au/news/2020/01/swinburne-supports-climate-emergency/',
-    'https://www.swinburne.edu.au/news/2015/05/swinburnes-professor-nita-cherry-releases-a-new-book-on-energising-leadership/',
-    'https://www.swinburne.edu.au/news/2015/11/driverless-cars-will-change-the-way-we-think-of-car-ownership/',
-    'https://www.swinburne.edu.au/news/2016/01/how-to-stop-the-sexual-harassment-of-women-in-science/',
-    'https://www.swinburne.edu.au/news/2015/04/swinburne-students-organise-faces-of-melbourne-exhibition/',
-    'https://www.swinburne.edu.au/news/2017/08/professor-tom-spurling-awarded-anzaas-medal-for-scientific-achievement/',
-    'https://www.swinburne.edu.au/news/2018/11/3d-concrete-printing-could-free-the-world-from-boring-buildings/',
-    'https://www.swinburne.edu.au/news/2014/12/team-swinburne-ready-to-take-on-fsae-competition-at-calder-park/',
-    'https://www.swinburne.edu.au/news/2017/10/offering-kids-healthy-snacks-at-junior-sport-promotes-healthy-habits/',
-    'https://www.swinburne.edu.au/news/2024/01/swinburne-graduate-wins-in2science-communication-award/',
-    'https://www.swinburne.edu.au/news/2014/09/with-apple-pay-apple-just-took-payment-security-to-the-banks/',
-    'https://www.swinburne.edu.au/news/2016/05/swinburnes-new-health-innovation-research-institute/',
-    'https://www.swinburne.edu.au/news/2020/04/opinion-its-time-to-strengthen-our-connection-to-others/',
-    'https://www.swinburne.edu.au/news/2016/06/swinburnes-success-at-international-higher-education-awards/',
-    'https://www.swinburne.edu.au/news/2019/01/consumer-led-research-giving-a-voice-to-the-disadvantaged/',
-    'https://www.swinburne.edu.au/news/2019/12/driving-force-for-reconciliation-receives-swinburne-lifetime-achievement-award/',
-    'https://www.swinburne.edu.au/news/2020/04/coronavirus-fighting-copper-printed-and-installed-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2016/02/locating-mysterious-bursts-places-universe-on-the-scales/',
-    'https://www.swinburne.edu.au/news/2018/08/swinburnes-get-talking-app-teaches-hearing-impaired-infants-to-speak/',
-    'https://www.swinburne.edu.au/news/2019/03/swinburne-establishes-new-neuroimaging-facility/',
-    'https://www.swinburne.edu.au/news/2021/04/the-stella-shortlist-your-guide-to-2021s-powerful-emotional-books/',
-    'https://www.swinburne.edu.au/news/2019/03/preventing-attacks-remains-tricky-in-liberal-democracies/',
-    'https://www.swinburne.edu.au/news/2019/03/swinburne-and-medibank-examine-how-virtual-reality-can-treat-chronic-pain/',
-    'https://www.swinburne.edu.au/news/2019/12/swinburne-researchers-awarded-over-66-million-in-arc-funding/',
-    'https://www.swinburne.edu.au/news/2020/01/design-factory-melbourne-aligns-design-science-and-tech-in-philadelphia/',
-    'https://www.swinburne.edu.au/news/2022/05/robots-can-improve-the-flow-of-blood-donations/',
-    'https://www.swinburne.edu.au/news/2018/07/swinburne-filmmaker-captures-the-lives-of-those-living-with-parkinsons/',
-    'https://www.swinburne.edu.au/news/2021/05/Swinburnes-bim-translator-on-the-future-of-digital-engineering/',
-    'https://www.swinburne.edu.au/news/2021/05/Meet-the-enterprising-graduate-behind-Swinburnes-Leadership-Hub/',
-    'https://www.swinburne.edu.au/news/2021/07/swinburne-researcher-asks-why-more-women-dont-study-computer-science/',
-    'https://www.swinburne.edu.au/news/2014/02/industry-has-a-role-in-funding-alternative-medicine-research/',
-    'https://www.swinburne.edu.au/news/2014/10/confronted-by-begging-for-spare-change-vouchers-might-be-better/',
-    'https://www.swinburne.edu.au/news/2016/04/economists-should-step-out-of-their-bubble-more-often/',
-    'https://www.swinburne.edu.au/news/2017/03/swinburne-to-play-starring-role-in-live-abcbbc-astronomical-event/',
-    'https://www.swinburne.edu.au/news/2017/03/app-first-developed-at-swinburne-receives-international-recognition/',
-    'https://www.swinburne.edu.au/news/2018/06/from-back-office-to-boardroom-accountants-step-up-in-climate-risk-management/',
-    'https://www.swinburne.edu.au/news/2018/07/swinburne-and-richmond-launch-sports-development-program-in-albury-wodonga/',
-    'https://www.swinburne.edu.au/news/2019/05/swinburne-joins-forces-with-bendigo-bank-to-establish-fintech-degree/',
-    'https://www.swinburne.edu.au/news/2021/12/First-year-apprentice-of-the-year-award-recognises-new-talent/',
-    'https://www.swinburne.edu.au/news/2016/08/swinburne-partners-with-access-health-and-community/',
-    'https://www.swinburne.edu.au/news/2014/04/building-a-financial-system-for-a-cashless-age/',
-    'https://www.swinburne.edu.au/news/2017/12/how-social-enterprises-are-building-a-more-inclusive-australian-economy/',
-    'https://www.swinburne.edu.au/news/2014/05/swinburnes-professor-janet-hiller-calls-for-change-in-health-care-focus/',
-    'https://www.swinburne.edu.au/news/2021/08/Swinburne-in2science-mentors-inspire-the-next-gen-of-stem-innovators/',
-    'https://www.swinburne.edu.au/news/2024/03/from-humble-beginnings-to-global-impact-what-quitch-did-next/',
-    'https://www.swinburne.edu.au/news/2014/10/cnia-president-awarded-honorary-doctorate-from-swinburne/',
-    'https://www.swinburne.edu.au/news/2015/07/swinburne-recognised-for-astronomy-outreach/',
-    'https://www.swinburne.edu.au/news/2019/02/black-saturday-documentary-shows-communitys-response-to-devastation-/',
-    'https://www.swinburne.edu.au/news/2020/11/checking-in-with-a-colleague-elliot-walsh/',
-    'https://www.swinburne.edu.au/news/2015/11/workplace-gender-equality-agency-names-swinburne-as-employer-of-choice-for-gender-equality/',
-    'https://www.swinburne.edu.au/news/2016/05/the-herd-driven-housing-bubble-that-could-trigger-an-apartment-bust/',
-    'https://www.swinburne.edu.au/news/2014/09/swinburne-finalist-in-prestigious-2014-green-gown-awards-australasia/',
-    'https://www.swinburne.edu.au/news/2017/10/jobs-tax-and-politics-three-ways-electric-vehicles-will-change-our-world/',
-    'https://www.swinburne.edu.au/news/2019/09/place-makers-review-tapestries-interweave-traditions-with-a-new-sense-of-place/',
-    'https://www.swinburne.edu.au/news/2020/06/swinburne-community-recognised-in-queens-birthday-2020-honours-list/',
-    'https://www.swinburne.edu.au/news/2022/08/ukrainian-president-speaks-directly-to-swinburne-students/',
-    'https://www.swinburne.edu.au/news/2015/11/bipolar-research-receives-1-million-in-funding-from-national-health-and-medical-research-council/',
-    'https://www.swinburne.edu.au/news/2017/10/swinburne-and-adobe-open-the-door-for-marketing-professionals-to-upskill/',
-    'https://www.swinburne.edu.au/news/2019/03/swinburnes-reputation-rises-in-national-assessment-of-research-excellence/',
-    'https://www.swinburne.edu.au/news/2021/08/swinburne-open-nights-providing-clarity-for-students-and-parents/',
-    'https://www.swinburne.edu.au/news/2021/10/hybrid-or-the-highway-for-Australian-workers-Swinburne-research/',
-    'https://www.swinburne.edu.au/news/2023/11/green-partnership-to-accelerate-swinburnes-research-impact/',
-    'https://www.swinburne.edu.au/news/2015/09/not-as-easy-as-it-looks/',
-    'https://www.swinburne.edu.au/news/2016/05/australian-organisations-band-together-to-support-financial-inclusion/',
-    'https://www.swinburne.edu.au/news/2017/12/professor-hung-nguyen-am-to-lead-faculty-of-science-engineering-and-technology/',
-    'https://www.swinburne.edu.au/news/2018/06/to-appreciate-its-power-think-of-design-as-a-drug/',
-    'https://www.swinburne.edu.au/news/2014/09/sack-the-coach-wait-theres-more-to-fixing-a-club-than-that/',
-    'https://www.swinburne.edu.au/news/2016/11/swinburne-commits-to-supporting-students-experiencing-financial-hardship/',
-    'https://www.swinburne.edu.au/news/2017/12/international-spie-nanophotonics-forum-takes-over-swinburne/',
-    'https://www.swinburne.edu.au/news/2014/05/the-state-of-australia-science-innovation-and-research/',
-    'https://www.swinburne.edu.au/news/2022/10/sustainable-shopping-students-develop-products-with-fungi/',
-    'https://www.swinburne.edu.au/news/2015/11/empowering-young-migrants-and-refugees-through-education/',
-    'https://www.swinburne.edu.au/news/2018/06/swinburne-community-recognised-in-queens-birthday-2018-honours-list/',
-    'https://www.swinburne.edu.au/news/2020/10/swinburne-researcher-makes-history-with-first-ever-videogame-aria-award-nomination/',
-    'https://www.swinburne.edu.au/news/2014/02/planning-for-the-ict-jobs-of-the-future/',
-    'https://www.swinburne.edu.au/news/2016/07/community-service-rewarded-with-weary-dunlop-scholarship/',
-    'https://www.swinburne.edu.au/news/2018/05/tax-increases-on-cigarettes-will-trigger-black-market-boom-of-tainted-tobacco/',
-    'https://www.swinburne.edu.au/news/2021/03/indigenous-voice-co-design-for-community-representation/',
-    'https://www.swinburne.edu.au/news/2022/09/two-million-dollar-future-fellowships-awarded-to-star-powered-researchers/',
-    'https://www.swinburne.edu.au/news/2022/10/eminent-investigative-journalist-named-inaugural-recipient-of-new-fellowship/',
-    'https://www.swinburne.edu.au/news/2020/10/swinburne-partners-with-the-alannah-and-madeline-foundation-to-address-online-safety/',
-    'https://www.swinburne.edu.au/news/2021/03/australian-first-international-partnership-to-drive-green-hydrogen-supply-chain-development/',
-    'https://www.swinburne.edu.au/news/2014/10/new-development-in-data-storage-imaging-and-telecommunication/',
-    'https://www.swinburne.edu.au/news/2017/06/home-ownership-remains-strong-in-australia-but-it-masks-other-problems/',
-    'https://www.swinburne.edu.au/news/2018/10/nobel-winning-science-is-key-to-australian-ultra-fast-laser-physics-research/',
-    'https://www.swinburne.edu.au/news/2019/10/swinburne-joins-arc-centre-to-explore-safe-use-of-decision-making-technologies/',
-    'https://www.swinburne.edu.au/news/2015/10/crossed-wires-isps-are-already-struggling-to-retain-our-metadata/',
-    'https://www.swinburne.edu.au/news/2019/06/swinburne-community-recognised-in-queens-birthday-2019-honours-list/',
-    'https://www.swinburne.edu.au/news/2022/07/swinburne-to-be-theme-leader-in-multimillion-dollar-maritime-project/',
-    'https://www.swinburne.edu.au/news/2014/03/visiting-belgium-researcher-at-swinburne-to-find-ways-of-extracting-precious-metals-from-our-waste/',
-    'https://www.swinburne.edu.au/news/2015/05/an-education-for-the-21st-century-means-teaching-coding-in-schools/',
-    'https://www.swinburne.edu.au/news/2017/05/data-availability-report-presents-compromised-rights-for-consumers/',
-    'https://www.swinburne.edu.au/news/2017/10/swinburne-researchers-work-with-victoria-police-to-win-gold-at-crime-prevention-awards/',
-    'https://www.swinburne.edu.au/news/2023/02/more-than-1mil-in-funding-for-swinburne-industry-linked-projects/',
-    'https://www.swinburne.edu.au/news/2019/02/suite-of-swinburne-courses-to-be-offered-in-sydney/',
-    'https://www.swinburne.edu.au/news/2019/06/australian-led-team-of-astronomers-make-history-in-a-split-second/',
-    'https://www.swinburne.edu.au/news/2022/12/learn-beyond-the-classroom-at-childrens-university-swinburne/',
-    'https://www.swinburne.edu.au/news/2015/03/the-art-of-misinterpreting-election-victories/',
-    'https://www.swinburne.edu.au/news/2015/07/swinburne-launches-its-advanced-manufacturing-and-design-centre/',
-    'https://www.swinburne.edu.au/news/2018/03/australia-on-its-own-when-managing-foreign-influence-on-australian-soil/',
-    'https://www.swinburne.edu.au/news/2020/01/swinburne-digital-artist-documenting-antarctic-research-vessels-last-voyage/',
-    'https://www.swinburne.edu.au/news/2021/12/astrophysicists-launch-colouring-book-for-future-scientists/',
-    'https://www.swinburne.edu.au/news/2014/05/swinburne-aviation-industry-conference/',
-    'https://www.swinburne.edu.au/news/2015/03/australian-children-foreign-parents-and-the-right-to-stay/',
-    'https://www.swinburne.edu.au/news/2015/11/blocking-out-the-noise-about-choosing-a-university/',
-    'https://www.swinburne.edu.au/news/2017/03/swinburne-awards-emeritus-professorship-to-jeremy-mould/',
-    'https://www.swinburne.edu.au/news/2014/11/business-heading-to-swinburne-for-big-ideas-at-industry-open-day/',
-    'https://www.swinburne.edu.au/news/2017/11/womens-pay-lags-behind-mens-in-tourism-and-hospitality/',
-    'https://www.swinburne.edu.au/news/2019/03/news-outlets-shouldnt-repost-new-zealand-mosque-shooters-livestream/',
-    'https://www.swinburne.edu.au/news/2022/03/swinburnes-strength-in-sport-innovation-and-technology-grows/',
-    'https://www.swinburne.edu.au/news/2022/11/swinburne-researchers-share-in-221-million-for-arc-discovery-projects/',
-    'https://www.swinburne.edu.au/news/2014/05/horses-decorated-by-swinburne-visual-merchandising-students-head-to-eastland/',
-    'https://www.swinburne.edu.au/news/2015/09/ashley-madison-and-the-identity-protection-racket/',
-    'https://www.swinburne.edu.au/news/2017/04/the-excitement-is-in-that-enabling-of-people-to-connect/',
-    'https://www.swinburne.edu.au/news/2020/03/encouraging-conversations-about-climate-change/',
-    'https://www.swinburne.edu.au/news/2021/02/first-exercise-and-sport-science-graduates-land-roles-with-industry-partner-kieser/',
-    'https://www.swinburne.edu.au/news/2022/07/criminal-justice-criminology-students-spotlight-victim-focused-reforms/',
-    'https://www.swinburne.edu.au/news/2015/12/a-european-union-australia-trade-deal-may-heal-a-troubled-history/',
-    'https://www.swinburne.edu.au/news/2016/01/the-challenges-faced-on-the-road-to-migration/',
-    'https://www.swinburne.edu.au/news/2016/02/making-a-murderer-why-innocent-people-confess-under-interrogation/',
-    'https://www.swinburne.edu.au/news/2024/03/Your-new-Latelab-and-student-hub-is-on-the-way/',
-    'https://www.swinburne.edu.au/news/2014/07/swinburne-accounting-student-taekhyun-ji-selected-for-prestigious-graduate-program/',
-    'https://www.swinburne.edu.au/news/2015/10/show-us-your-smarts-a-very-brief-history-of-intelligence-testing/',
-    'https://www.swinburne.edu.au/news/2016/05/earths-magnetic-heartbeat-a-thinner-past-and-new-alien-worlds/',
-    'https://www.swinburne.edu.au/news/2016/10/trump-claims-the-election-is-rigged--is-it/',
-    'https://www.swinburne.edu.au/news/2014/07/what-the-police-can-get-from-mobile-phone-tower-data/',
-    'https://www.swinburne.edu.au/news/2016/04/swinburne-forges-strategic-partnerships-with-israel/',
-    'https://www.swinburne.edu.au/news/2017/09/research-highlights-student-and-lecturer-experiences-with-lecture-recording/',
-    'https://www.swinburne.edu.au/news/2018/12/supporting-aspiring-leaders-through-the-women-attaining-leadership-program/',
-    'https://www.swinburne.edu.au/news/2018/12/swinburne-stem-superstars-announced/',
-    'https://www.swinburne.edu.au/news/2016/11/aboriginal-communities-embrace-technology-but-face-cyber-safety-challenges/',
-    'https://www.swinburne.edu.au/news/2017/07/swinburne-students-compete-in-indigenous-university-games-for-the-first-time/',
-    'https://www.swinburne.edu.au/news/2019/08/swinburne-climbs-in-academic-ranking-of-world-universities/',
-    'https://www.swinburne.edu.au/news/2020/09/swinburne-learning-and-adapting-in-a-changing-world/',
-    'https://www.swinburne.edu.au/news/2014/01/students-to-aid-sustainability-program-in-vietnam/',
-    'https://www.swinburne.edu.au/news/2016/05/professor-sally-mcarthur-honoured-at-biomelbourne-network-awards/',
-    'https://www.swinburne.edu.au/news/2021/09/five-things-that-set-swinburnes-new-bachelor-of-arts-apart/',
-    'https://www.swinburne.edu.au/news/2021/10/Swinburne-animation-stars-in-melbourne-international-animation-festival/',
-    'https://www.swinburne.edu.au/news/2021/11/state-of-the-art-trimble-technology-lab-coming-to-swinburne/',
-    'https://www.swinburne.edu.au/news/2015/02/queensland-why-the-pollsters-and-most-pundits-were-wrong/',
-    'https://www.swinburne.edu.au/news/2015/06/design-the-packaging-and-branding-for-next-generation-of-condoms/',
-    'https://www.swinburne.edu.au/news/2020/12/swinburne-led-consortium-to-enhance-nsw-mental-health-responsiveness/',
-    'https://www.swinburne.edu.au/news/2014/08/swinburne-social-researcher-peter-brent-on-the-political-polling-industry/',
-    'https://www.swinburne.edu.au/news/2017/08/from-charlottesville-to-nazi-germany-sometimes-monuments-have-to-fall/',
-    'https://www.swinburne.edu.au/news/2017/10/swinburne-lecturer-nominated-for-public-relations-educator-of-the-year/',
-    'https://www.swinburne.edu.au/news/2019/09/flexible-working-the-neglected-congestion-busting-solution-for-our-cities/',
-    'https://www.swinburne.edu.au/news/2020/02/anonymous-sperm-donors-are-connecting-with-their-donor-offspring/',
-    'https://www.swinburne.edu.au/news/2020/07/why-covid-19-might-not-change-our-cities/',
-    'https://www.swinburne.edu.au/news/2015/03/swinburne-teacher-recognised-for-assisting-cyclone-affected-communities/',
-    'https://www.swinburne.edu.au/news/2018/05/design-factory-melbourne-concepts-protect-the-planet-and-improve-health/',
-    'https://www.swinburne.edu.au/news/2020/05/swinburne-researchers-to-examine-public-trust-in-genomics-in-health-care/',
-    'https://www.swinburne.edu.au/news/2020/08/swinburne-success-at-the-national-innovation-games/',
-    'https://www.swinburne.edu.au/news/2017/08/dragonfly-wings-capture-place-for-swinburne-researchers-in-prestigious-award/',
-    'https://www.swinburne.edu.au/news/2019/05/setting-a-precedent-in-the-use-of-artificial-intelligence/',
-    'https://www.swinburne.edu.au/news/2024/02/how-ai-can-fast-track-the-developments-our-aviation-sector-desperately-needs/',
-    'https://www.swinburne.edu.au/news/2015/03/swinburne-students-all-the-buzz-at-melbourne-international-flower-and-garden-show/',
-    'https://www.swinburne.edu.au/news/2017/07/step-by-step-were-tackling-gender-equity-in-australian-astronomy/',
-    'https://www.swinburne.edu.au/news/2019/05/advancing-on-education-with-vietnam/',
-    'https://www.swinburne.edu.au/news/2022/04/Getting-on-the-same-wavelength-with-community-mental-health/',
-    'https://www.swinburne.edu.au/news/2014/02/swinburne-developing-life-saving-armour-to-be-used-on-the-bushmaster/',
-    'https://www.swinburne.edu.au/news/2014/03/swinburne-visual-merchandising-students-create-display-for-eastland/',
-    'https://www.swinburne.edu.au/news/2015/03/swinburnes-success-in-the-vichealth-alcohol-innovation-challenge/',
-    'https://www.swinburne.edu.au/news/2021/11/a-warm-welcome-back-to-campus-from-the-Vice-Chancellor/',
-    'https://www.swinburne.edu.au/news/2016/09/measuring-the-road-to-success-with-the-csiro/',
-    'https://www.swinburne.edu.au/news/2018/06/remember-turnbulls-2015-ideas-boom-were-still-only-part-way-there/',
-    'https://www.swinburne.edu.au/news/2019/03/driving-gender-equity-in-the-workplace-and-beyond/',
-    'https://www.swinburne.edu.au/news/2021/09/supporting-the-roadmap-to-reopening-returning-to-campus/',
-    'https://www.swinburne.edu.au/news/2023/11/swinburne-researchers-succeed-in-latest-arc-discovery-projects/',
-    'https://www.swinburne.edu.au/news/2016/10/the-mood-and-cognitive-effects-of-curcumin-from-turmeric/',
-    'https://www.swinburne.edu.au/news/2019/09/swinburne-extends-partnership-with-richmond-and-backs-tigers-aflw-team/',
-    'https://www.swinburne.edu.au/news/2021/07/swinburnes-bachelor-of-exercise-and-sport-science-kicks-off-careers/',
-    'https://www.swinburne.edu.au/news/2022/08/swinburne-partners-with-zero-living-on-sustainable-housing-project/',
-    'https://www.swinburne.edu.au/news/2014/02/swinburne-croydon-apprentices-are-cambodia-bound-1/',
-    'https://www.swinburne.edu.au/news/2015/03/family-ties-why-political-dynasties-rule-in-americas-democracy/',
-    'https://www.swinburne.edu.au/news/2017/01/sarawak-deputy-vice-chancellor-appointed-principal-fellow-of-prestigious-academy/',
-    'https://www.swinburne.edu.au/news/2019/08/new-dean-of-science-committed-to-creating-opportunities/',
-    'https://www.swinburne.edu.au/news/2014/05/swinburne-reassures-international-students-on-fees/',
-    'https://www.swinburne.edu.au/news/2019/12/message-from-the-vc-bolstering-our-commitment-to-sustainability/',
-    'https://www.swinburne.edu.au/news/2022/05/clinicians-reimagine-healthcare-in-new-innovation-program/',
-    'https://www.swinburne.edu.au/news/2024/06/Dissociation-is-a-common-trauma-response-among-many-who-seek-therapy-but-only-one-in-five-psychologists-can-accurately-identify-symptoms/',
-    'https://www.swinburne.edu.au/news/2015/01/high-achieving-students-receive-offers-to-study-law-at-swinburne-law-school/',
-    'https://www.swinburne.edu.au/news/2017/10/colliding-stars-reveal-their-gravitational-wave-secrets/',
-    'https://www.swinburne.edu.au/news/2015/08/the-honourable-alan-goldberg-ao-qc-awarded-honorary-doctorate-from-swinburne/',
-    'https://www.swinburne.edu.au/news/2018/07/connecting-indigenous-students-with-university-through-design-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2016/08/australian-interior-design-awards-recognise-swinburne-graduates/',
-    'https://www.swinburne.edu.au/news/2014/06/is-facelock-the-password-alternative-weve-been-waiting-for/',
-    'https://www.swinburne.edu.au/news/2015/05/swinburne-wins-12-awards-at-the-48th-worldfest-houston-international-film-festival/',
-    'https://www.swinburne.edu.au/news/2016/06/mapping-australias-digital-footprint-to-bridge-the-digital-divide/',
-    'https://www.swinburne.edu.au/news/2018/01/swinburne-deepens-university-of-california-santa-cruz-relationship/',
-    'https://www.swinburne.edu.au/news/2018/06/swinburne-researchers-recognised-for-bridge-engineering-research/',
-    'https://www.swinburne.edu.au/news/2019/11/swinburnes-science-achievements-boost-times-higher-education-ranking/',
-    'https://www.swinburne.edu.au/news/2019/08/swinburne-uses-ai-to-detect-fast-radio-bursts-in-real-time/',
-    'https://www.swinburne.edu.au/news/2020/01/improving-detection-and-treatment-of-depression-in-people-with-ms/',
-    'https://www.swinburne.edu.au/news/2023/05/swinburne-ready-to-kick-goals-with-yarra-junior-football-league-partnership/',
-    'https://www.swinburne.edu.au/news/2023/07/5m-awarded-for-swinburne-led-arc-research-hub-for-future-digital-manufacturing/',
-    'https://www.swinburne.edu.au/news/2014/07/smartphones-and-metadata--a-question-of-privacy/',
-    'https://www.swinburne.edu.au/news/2017/06/high-achieving-students-recognised-in-swinburne-prize-ceremonies/',
-    'https://www.swinburne.edu.au/news/2017/10/social-innovation-research-institute-appoints-advisory-committee-chair/',
-    'https://www.swinburne.edu.au/news/2017/12/swinburne-and-wise-to-offer-more-support-for-disabled-students/',
-    'https://www.swinburne.edu.au/news/2019/02/swinburne-partners-with-raising-expectations/',
-    'https://www.swinburne.edu.au/news/2014/05/leadership-what-it-is-and-isnt/',
-    'https://www.swinburne.edu.au/news/2015/06/swinburne-report-into-couch-surfing-secondary-students-highlights-key-role-teachers-play-in-tackling-young-homelessness/',
-    'https://www.swinburne.edu.au/news/2017/08/makeathon-to-find-innovative-solutions-for-the-disabled/',
-    'https://www.swinburne.edu.au/news/2017/12/swinburne-and-clayton-utz-collaborate-to-launch-new-master-of-corporate-governance/',
-    'https://www.swinburne.edu.au/news/2014/09/swinburne-academics-rewarded-for-teaching-excellence/',
-    'https://www.swinburne.edu.au/news/2018/11/venture-cup-winner-combines-research-and-tech-to-tackle-jet-lag/',
-    'https://www.swinburne.edu.au/news/2020/10/swinburne-staff-awarded-adobe-innovation-grants-for-new-approaches-to-learning-and-teaching/',
-    'https://www.swinburne.edu.au/news/2022/02/unlocking-the-secrets-of-healthier-and-safer-rice/',
-    'https://www.swinburne.edu.au/news/2023/09/the-voice-how-do-other-countries-represent-indigenous-voices-in-government/',
-    'https://www.swinburne.edu.au/news/2024/06/Inaugural-Swinburne-CSIRO-Indigenous-Research-Fellow-joins-national-water-quality-forecasting-project/',
-    'https://www.swinburne.edu.au/news/2014/01/swinburne-engineering-academic-says-congestion-to-rise-with-state-trapped-by-rating-obsession/',
-    'https://www.swinburne.edu.au/news/2014/09/world-war-1-how-jingoistic-bluster-encouraged-our-boys-to-enlist/',
-    'https://www.swinburne.edu.au/news/2014/10/cisco-and-swinburne-to-partner-on-research/',
-    'https://www.swinburne.edu.au/news/2016/08/superfast-charging-everlasting-batteries/',
-    'https://www.swinburne.edu.au/news/2019/07/offloading-liquor-and-pokies-will-cost-woolworths-but-deliver-lasting-benefits/',
-    'https://www.swinburne.edu.au/news/2020/01/unbuilding-cities-as-high-rises-reach-their-use-by-date/',
-    'https://www.swinburne.edu.au/news/2014/02/government-should-step-up-on-infrastructure-funding-in-australia/',
-    'https://www.swinburne.edu.au/news/2018/06/creating-research-value-needs-more-than-just-science--arts-can-help/',
-    'https://www.swinburne.edu.au/news/2021/03/breaking-barriers-in-the-construction-industry/',
-    'https://www.swinburne.edu.au/news/2015/02/photo-imaging--how-this-modern-skill-set-can-open-new-doors/',
-    'https://www.swinburne.edu.au/news/2016/09/how-does-ice-use-affect-families-and-what-can-they-do/',
-    'https://www.swinburne.edu.au/news/2019/07/learning-from-indigenous-cultures-around-the-world/',
-    'https://www.swinburne.edu.au/news/2017/10/swinburne-partners-with-instructure-to-offer-advanced-learning-system/',
-    'https://www.swinburne.edu.au/news/2015/04/qs-ranks-swinburne-as-one-of-the-worlds-top-design-schools/',
-    'https://www.swinburne.edu.au/news/2020/04/swinburne-graduates-bag-for-sustainable-living-wins-at-alessi-awards/',
-    'https://www.swinburne.edu.au/news/2020/05/dont-blame-covid-19-targets-decline-is-part-of-a-deeper-trend/',
-    'https://www.swinburne.edu.au/news/2015/05/swinburne-vice-chancellor-appointed-to-future-industries-ministerial-advisory-council/',
-    'https://www.swinburne.edu.au/news/2015/04/electric-vehicles-in-all-shapes-and-sizes-on-display-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2015/12/product-design-engineering-2015-graduate-exhibition/',
-    'https://www.swinburne.edu.au/news/2016/08/swinburne-welcomes-reform-of-vocational-education/',
-    'https://www.swinburne.edu.au/news/2019/09/brutalism-how-to-love-a-concrete-beast/',
-    'https://www.swinburne.edu.au/news/2020/03/swinburne-astronomer-awarded-pawsey-medal-for-scientific-excellence/',
-    'https://www.swinburne.edu.au/news/2024/06/virtual-reality-might-help-treat-auditory-hallucinations/',
-    'https://www.swinburne.edu.au/news/2018/06/kaspersky-lab-and-swinburne-collaborate-to-bridge-cybersecurity-shortage/',
-    'https://www.swinburne.edu.au/news/2024/02/World-first-project-could-see-EVs-charge-wirelessly-on-the-road/',
-    'https://www.swinburne.edu.au/news/2024/07/the-future-of-fashion-Swinburne-launches-groundbreaking-tech-focused-fashion-course/',
-    'https://www.swinburne.edu.au/news/2014/02/google-and-the-european-anti-trust-deal--what-does-it-mean/',
-    'https://www.swinburne.edu.au/news/2021/03/this-is-how-we-create-the-age-friendly-smart-city/',
-    'https://www.swinburne.edu.au/news/2022/12/stars-fatal-encounter-with-black-hole-creates-rare-luminous-flash/',
-    'https://www.swinburne.edu.au/news/2023/09/swinburne-alum-and-global-hr-leader-unlocking-peoples-inner-hero/',
-    'https://www.swinburne.edu.au/news/2014/05/when-gough-whitlam-helped-out-with-the-woodchopping/',
-    'https://www.swinburne.edu.au/news/2017/09/agse-relaunch-invigorates-swinburne-and-pitcher-partners-partnership/',
-    'https://www.swinburne.edu.au/news/2021/05/professor-virginia-kilborn-appointed-inaugural-swinburne-chief-scientist/',
-    'https://www.swinburne.edu.au/news/2024/01/what-does-the-common-good-actually-mean/',
-    'https://www.swinburne.edu.au/news/2015/03/swinburne-start-eases-the-transition-to-vocational-education-and-training/',
-    'https://www.swinburne.edu.au/news/2020/05/reducing-our-carbon-footprint-in-a-100-per-cent-renewable-electricity-deal/',
-    'https://www.swinburne.edu.au/news/2022/02/new-retail-incubation-space-for-swinburne-student-and-alumni-entrepreneurs/',
-    'https://www.swinburne.edu.au/news/2016/05/swinburne-inspires-managers-at-department-of-education-and-training/',
-    'https://www.swinburne.edu.au/news/2016/09/congratulations-to-our-swinburne-olympians/',
-    'https://www.swinburne.edu.au/news/2020/01/swinburne-partnership-to-develop-blockchain-based-solutions-for-australian-businesses/',
-    'https://www.swinburne.edu.au/news/2015/04/how-country-of-origin-can-influence-the-way-designers-work/',
-    'https://www.swinburne.edu.au/news/2015/09/swinburne-hosts-microsoft-more-personal-computing-hackathon/',
-    'https://www.swinburne.edu.au/news/2022/08/swinburne-honorary-doctorates-announced/',
-    'https://www.swinburne.edu.au/news/2017/05/swinburne-takes-responsible-investment-action/',
-    'https://www.swinburne.edu.au/news/2017/11/students-take-game-to-the-next-level-at-leading-australian-conference/',
-    'https://www.swinburne.edu.au/news/2018/03/swinburne-launches-advanced-manufacturing-centre-in-weihai-shandong/',
-    'https://www.swinburne.edu.au/news/2022/11/swinburne-highly-cited-researchers-rise-to-the-top-in-2022/',
-    'https://www.swinburne.edu.au/news/2022/07/swinburne-launches-prototyping-program-for-aerospace-startups/',
-    'https://www.swinburne.edu.au/news/2014/10/swinburne-and-pitcher-partners-collaborate-in-an-ambitious-study-of-family-business-planning/',
-    'https://www.swinburne.edu.au/news/2021/12/Rewarding-internships-amplify-classroom-learning/',
-    'https://www.swinburne.edu.au/news/2023/11/swinburne-and-wm-keck-observatory-form-historic-scientific-partnership/',
-    'https://www.swinburne.edu.au/news/2018/12/vice-chancellors-end-of-year-message/',
-    'https://www.swinburne.edu.au/news/2019/10/swinburne-young-mums-launch-skincare-microbusiness/',
-    'https://www.swinburne.edu.au/news/2021/12/new-swinburne-university-of-technology-executives-announced/',
-    'https://www.swinburne.edu.au/news/2022/04/the-six-steps-for-retail-and-service-sectors-to-survive/',
-    'https://www.swinburne.edu.au/news/2014/12/why-slow-and-steady-approach-to-crowd-funding-may-pay-off/',
-    'https://www.swinburne.edu.au/news/2016/12/stem-cell-researcher-awarded-prestigious-victoria-fellowship/',
-    'https://www.swinburne.edu.au/news/2016/04/professor-qing-long-han-appointed-pro-vice-chancellor-research-quality-and-distinguished-professor/',
-    'https://www.swinburne.edu.au/news/2018/03/diplomacy-and-internal-defence-is-half-the-battle/',
-    'https://www.swinburne.edu.au/news/2022/03/swinburne-international-alum-inspiring-change-together-with-her-guide-dog-elke/',
-    'https://www.swinburne.edu.au/news/2015/03/data-retention-plan-amended-for-journalists-but-is-it-enough/',
-    'https://www.swinburne.edu.au/news/2016/01/as-the-us-presidential-primary-season-begins-does-iowa-really-matter/',
-    'https://www.swinburne.edu.au/news/2016/03/melbourne-mini-maker-faire-encourages-innovation-and-creativity/',
-    'https://www.swinburne.edu.au/news/2021/11/Swinburne-students-pitch-to-make-the-world-a-better-place/',
-    'https://www.swinburne.edu.au/news/2016/08/reading-between-the-lines-of-big-data-and-data-analytics/',
-    'https://www.swinburne.edu.au/news/2019/11/opinion-its-not-just-jail-for-george-pell-this-is-torture/',
-    'https://www.swinburne.edu.au/news/2015/10/breakthrough-brain-anaesthesia-response-device-recognised-by-tga/',
-    'https://www.swinburne.edu.au/news/2019/05/swinburne-and-epworth-partner-to-improve-health-technologies/',
-    'https://www.swinburne.edu.au/news/2019/05/industry-40-poised-to-deliver-growth-and-change-through-workforce-transformation/',
-    'https://www.swinburne.edu.au/news/2019/07/swinburne-teaches-leadership-with-master-builders-victoria/',
-    'https://www.swinburne.edu.au/news/2023/06/swinburne-student-nominated-for-prestigious-journalism-award/',
-    'https://www.swinburne.edu.au/news/2017/08/barak-wonga-oration-on-the-future-of-reconciliation/',
-    'https://www.swinburne.edu.au/news/2020/08/researchers-design-and-fabricate-timber-funicular-pavilion-structure/',
-    'https://www.swinburne.edu.au/news/2018/11/six-things-australia-needs-to-progress-innovation-with-industry-40/',
-    'https://www.swinburne.edu.au/news/2019/08/opinion-it-is-time-to-move-sentencing-beyond-the-dark-ages/',
-    'https://www.swinburne.edu.au/news/2024/01/swinburnes-venture-cup-unveils-pioneering-startups-as-entrepreneurs-take-centre-stage/',
-    'https://www.swinburne.edu.au/news/2017/12/awards-for-teaching-excellence-recognise-swinburne-talent-/',
-    'https://www.swinburne.edu.au/news/2024/02/Quantum-research-sheds-light-on-the-mystery-of-high-temperature-superconductivity/',
-    'https://www.swinburne.edu.au/news/2014/04/show-business-can-be-risky-charity-business-1/',
-    'https://www.swinburne.edu.au/news/2017/03/reducing-dependency-on-drugs-like-valium-with-alternative-therapies/',
-    'https://www.swinburne.edu.au/news/2018/03/banking-royal-commission-has-some-thinking-its-the-customers-fault/',
-    'https://www.swinburne.edu.au/news/2018/08/swinburne-design-and-boroondara-council-improve-customer-experience/',
-    'https://www.swinburne.edu.au/news/2019/10/swinburne-researchers-recognised-as-leaders-in-their-field/',
-    'https://www.swinburne.edu.au/news/2020/03/australian-police-are-using-the-clearview-ai-facial-recognition-system-with-no-accountability/',
-    'https://www.swinburne.edu.au/news/2021/09/swinburne-games-experts-on-what-you-should-play-next/',
-    'https://www.swinburne.edu.au/news/2023/11/your-next-gen-campus-on-the-way-as-construction-begins/',
-    'https://www.swinburne.edu.au/news/2015/08/the-great-war-brought-us-tragedy-but-it-also-birthed-australian-science/',
-    'https://www.swinburne.edu.au/news/2016/10/industry-research-advisory-committee-established/',
-    'https://www.swinburne.edu.au/news/2019/12/swinburne-student-wins-innovation-competition-with-pitch-for-solar-powered-steel-processing/',
-    'https://www.swinburne.edu.au/news/2018/09/swinburne-reflects-on-reconciliation-at-rap-halfway-mark/',
-    'https://www.swinburne.edu.au/news/2019/12/melbourne-cbd-abandoned-spaces-redesigned-for-those-experiencing-homelessness/',
-    'https://www.swinburne.edu.au/news/2023/08/5-star-ratings-for-swinburne-in-good-universities-guide-2024/',
-    'https://www.swinburne.edu.au/news/2023/10/swinburne-alum-puts-people-at-the-heart-of-marketing/',
-    'https://www.swinburne.edu.au/news/2023/11/Swinburne-and-CSIRO-launch-state-of-the-art-renewable-hydrogen-refuelling-station/',
-    'https://www.swinburne.edu.au/news/2015/04/up-up-and-away-the-future-of-the-comic-book-movie/',
-    'https://www.swinburne.edu.au/news/2020/08/navigating-leadership-challenges-during-a-crisis/',
-    'https://www.swinburne.edu.au/news/2015/11/dont-listen-to-people-with-opinions-about-your-atar-heres-why/',
-    'https://www.swinburne.edu.au/news/2023/08/Swinburne-students-take-home-first-prize-in-international-Beta-Alpha-Psi-competitions-in-Las-Vegas/',
-    'https://www.swinburne.edu.au/news/2016/09/inventing-apprenticeships-for-the-future/',
-    'https://www.swinburne.edu.au/news/2014/12/grooming-the-next-generation-forensics-researchers/',
-    'https://www.swinburne.edu.au/news/2018/08/pioneering-housing-construction-with-3d-concrete-printers-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2021/05/new-study-explores-healthcare-experiences-of-people-with-body-dysmorphic-disorder/',
-    'https://www.swinburne.edu.au/news/2014/11/swinburne-students-reach-start-up-success-with-that-dapper-chap-and-humble-body/',
-    'https://www.swinburne.edu.au/news/2017/07/matt-canavan-and-the-process-of-obtaining-italian-citizenship/',
-    'https://www.swinburne.edu.au/news/2018/07/swinburne-researcher-receives-victorian-cancer-agency-funding/',
-    'https://www.swinburne.edu.au/news/2018/07/times-higher-education-asia-pacific-university-rankings-2018-students-need-digital-immersion/',
-    'https://www.swinburne.edu.au/news/2018/08/new-839-million-training-centre-in-surface-engineering-for-advanced-materials/',
-    'https://www.swinburne.edu.au/news/2018/11/making-a-fairer-society-through-technological-innovation/',
-    'https://www.swinburne.edu.au/news/2019/12/vice-chancellors-end-of-year-message/',
-    'https://www.swinburne.edu.au/news/2014/03/politicians-must-change-if-they-are-to-earn-our-respect/',
-    'https://www.swinburne.edu.au/news/2018/04/research-finds-loneliness-is-a-serious-risk-to-our-health/',
-    'https://www.swinburne.edu.au/news/2018/10/swinburne-trials-mental-health-program-for-students-with-medibank-and-uprise/',
-    'https://www.swinburne.edu.au/news/2016/07/swinburne-finalist-for-victorian-apprentice-of-the-year/',
-    'https://www.swinburne.edu.au/news/2019/08/improving-hospital-emergency-department-design-for-mental-health-presentations/',
-    'https://www.swinburne.edu.au/news/2019/10/from-monologue-to-dialogue-towards-playable-cities/',
-    'https://www.swinburne.edu.au/news/2020/12/student-voices-represented-at-stem-public-speaking-competition/',
-    'https://www.swinburne.edu.au/news/2022/01/national-funding-success-for-swinburne-researchers/',
-    'https://www.swinburne.edu.au/news/2015/12/einsteins-spooky-steering-needed-for-secure-quantum-teleportation/',
-    'https://www.swinburne.edu.au/news/2019/11/from-fold-up-furniture-to-homes-for-bees-industrial-design-on-show/',
-    'https://www.swinburne.edu.au/news/2015/04/living-at-the-wrong-end-of-the-queue/',
-    'https://www.swinburne.edu.au/news/2024/05/defence-science-and-technology-group-placements-set-students-up-for-success/',
-    'https://www.swinburne.edu.au/news/2014/07/olt-grant-allows-swinburne-to-improve-online-education-practices-for-all-universities/',
-    'https://www.swinburne.edu.au/news/2014/12/swinburne-launches-accessability-action-plan/',
-    'https://www.swinburne.edu.au/news/2016/09/swinburne-ranks-as-top-450-university-in-qs-world-university-rankings/',
-    'https://www.swinburne.edu.au/news/2021/05/most-outstanding-undergraduate-lands-engineering-job-with-rail-p/',
-    'https://www.swinburne.edu.au/news/2022/02/academic-and-research-integrity-to-be-upheld/',
-    'https://www.swinburne.edu.au/news/2017/09/when-a-good-death-was-often-painful-euthanasia-through-the-ages/',
-    'https://www.swinburne.edu.au/news/2016/09/international-leader-in-engineering-education-joins-swinburne/',
-    'https://www.swinburne.edu.au/news/2018/06/the-academic-college-of-tel-aviv-yaffo-and-swinburne-drive-research-training-for-impact-/',
-    'https://www.swinburne.edu.au/news/2022/03/swinburne-launches-victorian-first-bachelor-of-applied-innovation/',
-    'https://www.swinburne.edu.au/news/2017/01/what-workspaces-are-the-best-for-freelance-workers/',
-    'https://www.swinburne.edu.au/news/2021/09/swinburne-international-reputation-continues-to-grow/',
-    'https://www.swinburne.edu.au/news/2022/06/swinburne-launches-australian-first-reconciliation-centre/',
-    'https://www.swinburne.edu.au/news/2024/02/Swinburne-welcomes-australian-universities-accord-final-report-in-promise-for-new-era-of-education/',
-    'https://www.swinburne.edu.au/news/2022/12/supporting-future-student-success-with-clontarf-academy/',
-    'https://www.swinburne.edu.au/news/2015/05/swinburne-film-and-tv-community-collaborates-for-st-kilda-film-festival-2015/',
-    'https://www.swinburne.edu.au/news/2019/01/swinburne-imcrc-and-sleep-corp-look-to-advance-australian-manufacturing/',
-    'https://www.swinburne.edu.au/news/2019/01/clement-meadmore-exhibition-a-culmination-of-ten-years-of-research/',
-    'https://www.swinburne.edu.au/news/2019/12/swinburne-welcome-scholarship-recipient-shines-in-stem/',
-    'https://www.swinburne.edu.au/news/2015/05/swinburne-study-shows-link-between-gambling-debt-and-drug-crimes-committed-by-vietnamese-women/',
-    'https://www.swinburne.edu.au/news/2019/10/loneliness-and-social-isolation-a-growing-health-risk-for-young-australians/',
-    'https://www.swinburne.edu.au/news/2016/02/gravitational-waves-discovered-top-scientists-respond/',
-    'https://www.swinburne.edu.au/news/2018/03/swinburne-supercomputer-to-be-one-of-the-most-powerful-in-australia/',
-    'https://www.swinburne.edu.au/news/2019/05/swinburne-researchers-repurpose-manufacturing-technology-to-create-new-materials/',
-    'https://www.swinburne.edu.au/news/2021/04/Swinburne-law-students-take-out-top-prize-oxford-mooting-competiton/',
-    'https://www.swinburne.edu.au/news/2017/10/submarine-corrosion-research-receives-high-commendation/',
-    'https://www.swinburne.edu.au/news/2018/08/swinburne-researcher-awarded-nhmrc-research-fellowship/',
-    'https://www.swinburne.edu.au/news/2021/08/swinburne-continues-to-strengthen-safety-and-support-initiatives/',
-    'https://www.swinburne.edu.au/news/2016/03/swinburne-partners-with-brazilian-research-funding-agency/',
-    'https://www.swinburne.edu.au/news/2016/08/swinburne-recognises-leading-contributors-to-australian-society/',
-    'https://www.swinburne.edu.au/news/2018/07/digital-innovations-in-urban-transport-shaping-the-future-of-smart-mobility/',
-    'https://www.swinburne.edu.au/news/2015/08/swinburne-celebrates-the-small-business-festival-victoria/',
-    'https://www.swinburne.edu.au/news/2016/07/blockchain-technology-could-be-game-changer-for-developing-communities/',
-    'https://www.swinburne.edu.au/news/2017/04/swinburne-graduate-recognised-with-top-honour-from-design-institute-of-australia/',
-    'https://www.swinburne.edu.au/news/2022/02/the-games-from-your-childhood-are-making-a-comeback/',
-    'https://www.swinburne.edu.au/news/2023/10/swinburne-climbs-in-times-higher-education-world-university-rankings-by-subject-2024/',
-    'https://www.swinburne.edu.au/news/2014/04/in-the-frontline-of-the-war-against-boredom/',
-    'https://www.swinburne.edu.au/news/2017/06/melbournes-love-hate-relationship-with-being-a-street-art-capital/',
-    'https://www.swinburne.edu.au/news/2018/11/four-ways-our-cities-can-cut-transport-emissions-in-a-hurry/',
-    'https://www.swinburne.edu.au/news/2022/04/swinburne-signs-up-to-upgrade-enrolment-tech-experience-with-technologyone/',
-    'https://www.swinburne.edu.au/news/2021/06/meet-the-startups-from-the-2021-swinburne-accelerator-program/',
-    'https://www.swinburne.edu.au/news/2017/11/neurodiversity-hub-to-create-opportunities-for-students-with-autism/',
-    'https://www.swinburne.edu.au/news/2021/06/supporting-pasifika-youth-with-new-research-collaboration/',
-    'https://www.swinburne.edu.au/news/2018/11/swinburne-researchers-awarded-36-million-in-national-competitive-funding/',
-    'https://www.swinburne.edu.au/news/2020/06/international-scientists-collaborate-for-online-stem-educational-game/',
-    'https://www.swinburne.edu.au/news/2015/02/good-sleep-gets-harder-as-we-age-but-mindfulness-could-help/',
-    'https://www.swinburne.edu.au/news/2017/06/swinburne-announces-women-in-stem-research-fellowship-recipients/',
-    'https://www.swinburne.edu.au/news/2018/11/tom--university-outcomes-to-be-developed-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2018/12/research-reveals-how-aussie-journalists-are-faring-after-redundancy/',
-    'https://www.swinburne.edu.au/news/2020/12/new-approaches-to-learning-and-teaching-at-swinburne-funded-by-adobe/',
-    'https://www.swinburne.edu.au/news/2017/08/argentine-congress-honours-swinburne-academics-for-promoting-bilateral-relationship/',
-    'https://www.swinburne.edu.au/news/2017/09/entrepreneurial-spirit-alive-and-well-in-australia/',
-    'https://www.swinburne.edu.au/news/2017/11/climate-experts-discuss-how-to-transition-to-low-carbon-living/',
-    'https://www.swinburne.edu.au/news/2018/06/swinburne-hosts-astronomical-society-of-australia-conference/',
-    'https://www.swinburne.edu.au/news/2022/02/A-neuropsychologists-top-5-tips-on-returning-to-campus/',
-    'https://www.swinburne.edu.au/news/2022/11/5-star-swinburne-educators-and-exceptional-student-experience-recognised-in-good-universities-guide-2023/',
-    'https://www.swinburne.edu.au/news/2015/06/hattah-lakes-restoration-project-receives-swinburne-excellence-in-sustainable-design-award/',
-    'https://www.swinburne.edu.au/news/2015/09/how-making-revenge-porn-a-federal-crime-would-combat-its-rise/',
-    'https://www.swinburne.edu.au/news/2020/12/us-pulls-out-big-gun-against-facebook-and-google/',
-    'https://www.swinburne.edu.au/news/2014/09/swinburne-awards-community-leaders-with-honorary-doctorate/',
-    'https://www.swinburne.edu.au/news/2014/12/graham-goldsmith-installed-as-swinburnes-chancellor/',
-    'https://www.swinburne.edu.au/news/2017/11/government-must-not-punish-students-for-failed-legislation/',
-    'https://www.swinburne.edu.au/news/2021/02/new-partnership-to-bring-back-the-hawthorn-hotel-in-2021/',
-    'https://www.swinburne.edu.au/news/2018/10/the-moral-machine-navigating-the-ethical-rules-of-autonomous-vehicles/',
-    'https://www.swinburne.edu.au/news/2020/03/coronavirus-puts-casual-workers-at-risk-of-homelessness-unless-they-get-more-support/',
-    'https://www.swinburne.edu.au/news/2023/01/International-students-share-their-experience-advice-on-working-in-Australia/',
-    'https://www.swinburne.edu.au/news/2019/03/jobs-support-for-swinburne-students-with-disability/',
-    'https://www.swinburne.edu.au/news/2016/03/asia-pacific-association-for-international-education-visits-swinburne/',
-    'https://www.swinburne.edu.au/news/2014/03/swinburne-international-student-welcomes-travel-concessions/',
-    'https://www.swinburne.edu.au/news/2018/07/tackling-the-financial-future-of-australians-through-design/',
-    'https://www.swinburne.edu.au/news/2018/12/swinburne-student-among-australias-brightest-to-receive-scholarship/',
-    'https://www.swinburne.edu.au/news/2021/08/swinburne-led-research-improving-health-outcomes-for-pancreatic-cancer-patients/',
-    'https://www.swinburne.edu.au/news/2019/02/survey-finds-transparency-and-accountability-are-key-in-leadership/',
-    'https://www.swinburne.edu.au/news/2020/04/coronavirus-lessons-from-past-crises-how-wwi-and-wwii-spurred-scientific-innovation-in-australia/',
-    'https://www.swinburne.edu.au/news/2017/09/three-reasons-why-pacemakers-are-vulnerable-to-hacking/',
-    'https://www.swinburne.edu.au/news/2018/01/artificial-intelligence-to-enhance-australian-judiciary-system/',
-    'https://www.swinburne.edu.au/news/2017/05/australian-copyright-laws-have-questionable-benefits/',
-    'https://www.swinburne.edu.au/news/2017/05/swinburne-research-institutes-foundation-directors-appointed/',
-    'https://www.swinburne.edu.au/news/2017/12/victorian-social-enterprises-are-important-contributors-to-the-state-economy/',
-    'https://www.swinburne.edu.au/news/2018/06/swinburne-research-receives-australian-research-council-funding/',
-    'https://www.swinburne.edu.au/news/2014/08/swinburne-signs-up-for-future-research-partnerships-with-national-institute-of-design/',
-    'https://www.swinburne.edu.au/news/2024/06/submarines-in-the-future-could-self-identify-cracks-and-self-heal-thanks-to-Swinburne-researcher/',
-    'https://www.swinburne.edu.au/news/2015/07/international-awards-for-swinburne-high-temperature-processing-group/',
-    'https://www.swinburne.edu.au/news/2018/10/university-journalism-programs-launch-new-storytelling-platform/',
-    'https://www.swinburne.edu.au/news/2020/09/how-might-covid-19-change-what-australians-want-from-their-homes/',
-    'https://www.swinburne.edu.au/news/2017/06/swinburne-community-recognised-in-queens-birthday-2017-honours-list/',
-    'https://www.swinburne.edu.au/news/2016/10/rd-tax-incentives-need-to-be-simple-and-underpin-investor-confidence/',
-    'https://www.swinburne.edu.au/news/2020/07/brave-john-kerr-judgment-followed-letter-of-law/',
-    'https://www.swinburne.edu.au/news/2015/05/constructing-new-tools-to-tackle-alcohol-and-drug-awareness-at-work/',
-    'https://www.swinburne.edu.au/news/2019/04/emerging-technologies-are-changing-the-future-of-financial-services/',
-    'https://www.swinburne.edu.au/news/2021/10/swinburnes-associate-degree-of-engineering-gains-full-accreditation/',
-    'https://www.swinburne.edu.au/news/2015/02/professor-ian-young-ao-to-join-australias-leading-research-centre-for-ocean-engineering-science-and-technology/',
-    'https://www.swinburne.edu.au/news/2015/05/commuters-paradise-a-success-for-swinburne-event-management-students/',
-    'https://www.swinburne.edu.au/news/2023/07/collaboration-the-key-to-assistive-technology-design-and-manufacture/',
-    'https://www.swinburne.edu.au/news/2023/07/high-schoolers-reach-for-the-stars-to-design-space-mission/',
-    'https://www.swinburne.edu.au/news/2016/06/closing-the-digital-divide-for-australias-indigenous-communities/',
-    'https://www.swinburne.edu.au/news/2019/12/how-an-indigenous-study-tour-is-promoting-reconciliation/',
-    'https://www.swinburne.edu.au/news/2015/05/swinburne-graduates-soar-at-2014-dia-victoria-tasmania-graduate-of-the-year-awards/',
-    'https://www.swinburne.edu.au/news/2018/03/design-and-health-researchers-meet-at-design4health/',
-    'https://www.swinburne.edu.au/news/2017/12/what-consumers-need-from-the-accc-inquiry-into-google-and-facebook/',
-    'https://www.swinburne.edu.au/news/2018/05/swinburne-digital-works-for-media-wall-at-mirvac-and-grimshaw-development/',
-    'https://www.swinburne.edu.au/news/2019/07/arts-social-sciences-and-humanities-in-the-age-of-disruption/',
-    'https://www.swinburne.edu.au/news/2020/02/buildings-kill-millions-of-birds-heres-how-to-reduce-the-toll/',
-    'https://www.swinburne.edu.au/news/2016/03/swinburne-partners-with-polytechnic-university-of-turin-in-italy/',
-    'https://www.swinburne.edu.au/news/2019/05/australias-ethnic-face-is-changing-and-so-are-our-blood-types/',
-    'https://www.swinburne.edu.au/news/2015/05/swinburne-and-nawaloka-college-of-higher-studies-partner-with-cal-state-university-monterey-bay/',
-    'https://www.swinburne.edu.au/news/2016/09/swinburne-a-finalist-in-national-disability-awards/',
-    'https://www.swinburne.edu.au/news/2020/12/swinburne-researcher-honoured-for-services-to-multicultural-community/',
-    'https://www.swinburne.edu.au/news/2022/03/swinburne-introduces-ungrading-for-greater-creative-risks/',
-    'https://www.swinburne.edu.au/news/2023/08/a-spectacular-fireball-just-streaked-across-melbourne-but-astronomers-didnt-see-it-coming/',
-    'https://www.swinburne.edu.au/news/2017/06/a-swinburne-professor-hopes-to-dig-for-dinosaur-bones-in-south-gippsland/',
-    'https://www.swinburne.edu.au/news/2024/04/New-JWST-observations-reveal-black-holes-rapidly-shut-off-star-formation-in-massive-galaxies/',
-    'https://www.swinburne.edu.au/news/2019/03/investigating-how-robot-surgical-systems-could-extend-surgeons-careers/',
-    'https://www.swinburne.edu.au/news/2019/04/swinburne-and-acmi-women-are-changing-the-face-of-media-technology/',
-    'https://www.swinburne.edu.au/news/2020/08/swinburne-siemens-partnership-is-building-the-workforce-of-the-future/',
-    'https://www.swinburne.edu.au/news/2019/08/swinburne-design-student-holly-barbour-on-using-her-creative-skills-to-help-others/',
-    'https://www.swinburne.edu.au/news/2019/07/swinburne-launches-australian-leadership-index/',
-    'https://www.swinburne.edu.au/news/2023/12/swinburne-researchers-to-help-reduce-burden-of-cardiovascular-diseases-and-diabetes-across-europe/',
-    'https://www.swinburne.edu.au/news/2014/03/einsteins-scepticism-about-quantum-mechanics-may-lead-to-ultra-secure-internet/',
-    'https://www.swinburne.edu.au/news/2014/05/controlled-sun-could-lead-to-better-processing-of-australias-mineral-exports/',
-    'https://www.swinburne.edu.au/news/2014/06/user-generated-content-media-can-learn-from-the-wild-west/',
-    'https://www.swinburne.edu.au/news/2017/01/professor-geoff-brooks-honoured-with-distinguished-lecturer-award/',
-    'https://www.swinburne.edu.au/news/2017/01/health-check-does-my-brain-really-freeze-when-i-eat-ice-cream/',
-    'https://www.swinburne.edu.au/news/2018/06/swinburne-researchers-contribute-to-newly-launched-fleet-centre/',
-    'https://www.swinburne.edu.au/news/2014/04/swinburne-students-benefit-from-westpac-philanthropy/',
-    'https://www.swinburne.edu.au/news/2021/06/how-covid-19-is-disrupting-and-transforming-the-future-of-sport/',
-    'https://www.swinburne.edu.au/news/2022/02/swinburne-secures-close-to-one-million-dollars-for-new-colombo-plan-program/',
-    'https://www.swinburne.edu.au/news/2016/11/swinburne-wins-at-australian-technologies-competition-awards/',
-    'https://www.swinburne.edu.au/news/2017/06/microbiologist-at-swinburne-discovers-antibacterial-properties-of-insect-wings/',
-    'https://www.swinburne.edu.au/news/2018/12/3d-construction-printing-conference-draws-researchers-from-across-the-globe/',
-    'https://www.swinburne.edu.au/news/2019/07/swinburne-3d-printing-technology-is-shaking-up-personalised-hearing-aids-and-earphones/',
-    'https://www.swinburne.edu.au/news/2016/03/swinburne-takes-pledge-for-parity-for-international-womens-day/',
-    'https://www.swinburne.edu.au/news/2021/07/swinburne-led-project-receives-mrff-funding-develop-new-model-of-care-for-cancer-patients/',
-    'https://www.swinburne.edu.au/news/2014/01/third-green-photonics-symposium-advances-research-development/',
-    'https://www.swinburne.edu.au/news/2017/09/swinburne-lecturers-recognised-among-australias-best-teachers/',
-    'https://www.swinburne.edu.au/news/2018/03/signal-detected-from-the-first-stars-in-the-universe/',
-    'https://www.swinburne.edu.au/news/2018/05/michael-kirby-talks-about-the-publics-changing-attitudes-to-queer-australians/',
-    'https://www.swinburne.edu.au/news/2022/03/Gender-matters-according-to-an-environmental-DNA-researcher/',
-    'https://www.swinburne.edu.au/news/2014/03/team-swinburne-fsae-motor-racing-team-at-benalla-for-engineering-our-future-program/',
-    'https://www.swinburne.edu.au/news/2014/05/reaping-the-benefits-of-an-ageing-population-1/',
-    'https://www.swinburne.edu.au/news/2017/09/beth-webster-elected-to-academy-of-the-social-sciences-in-australia/',
-    'https://www.swinburne.edu.au/news/2016/02/the-workplace-according-to-autocomplete/',
-    'https://www.swinburne.edu.au/news/2016/07/swinburne-student-to-present-at-united-nations-forum-in-new-york/',
-    'https://www.swinburne.edu.au/news/2019/06/the-benefits-of-mentoring-advice-from-the-experts-/',
-    'https://www.swinburne.edu.au/news/2023/04/swinburne-brickie-matt-obrien-shares-skills-with-arnhem-land-communities/',
-    'https://www.swinburne.edu.au/news/2024/08/Multi-million-dollar-MedTech-and-supercomputer-facilities-at-Swinburne-on-show/',
-    'https://www.swinburne.edu.au/news/2016/10/what-is-rapunzel-syndrome-and-why-do-some-people-eat-hair/',
-    'https://www.swinburne.edu.au/news/2017/01/explainer-what-are-the-limits-to-charities-advancing-political-causes/',
-    'https://www.swinburne.edu.au/news/2014/09/swinburne-research-to-support-australias-senior-entrepreneurs----/',
-    'https://www.swinburne.edu.au/news/2016/03/refugee-run-school-in-indonesia-a-model-for-governments-to-emulate/',
-    'https://www.swinburne.edu.au/news/2015/12/how-i-didnt-let-my-year-12-score-stop-my-dreams/',
-    'https://www.swinburne.edu.au/news/2016/09/australia-to-embrace-the-new-era-of-gravitational-wave-astronomy/',
-    'https://www.swinburne.edu.au/news/2018/08/road-safety-message-a-winner-for-swinburne-film-and-tv-student/',
-    'https://www.swinburne.edu.au/news/2019/05/dr-elaine-saunders-leads-the-charge-for-digital-health-and-innovation-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2021/06/virtual-overseas-internships-offer-students-valuable-work-experience/',
-    'https://www.swinburne.edu.au/news/2024/07/High-school-students-work-with-Swinburne-astronomers-on-the-future-of-space/',
-    'https://www.swinburne.edu.au/news/2016/11/policy-uncertainty-continues-to-hamper-carbon-emissions-management/',
-    'https://www.swinburne.edu.au/news/2017/06/breakthrough-technology-at-swinburne-makes-batteries-safe-and-sustainable/',
-    'https://www.swinburne.edu.au/news/2017/09/a-medically-supervised-injection-facility-matters-for-victoria/',
-    'https://www.swinburne.edu.au/news/2020/04/time-well-spent-not-wasted-video-games-are-boosting-well-being-during-the-coronavirus-lockdown/',
-    'https://www.swinburne.edu.au/news/2020/10/swinburne-launches-cloud-technologies-degree-to-prepare-students-for-in-demand-careers/',
-    'https://www.swinburne.edu.au/news/2024/05/back--more-than-our-rank--because-universities-are-more-than-a-n/',
-    'https://www.swinburne.edu.au/news/2014/04/science-progress-collaboration-and-inter-disciplinary-research/',
-    'https://www.swinburne.edu.au/news/2018/08/commissioner-shines-light-on-reconciliation-through-treaty/',
-    'https://www.swinburne.edu.au/news/2022/08/how-5-key-tenancy-reforms-are-affecting-renterss-and-landlords-around-australia/',
-    'https://www.swinburne.edu.au/news/2016/11/indigenous-employment-program-receives-national-award/',
-    'https://www.swinburne.edu.au/news/2017/11/breakthrough-discovery-could-have-impact-on-neurodegenerative-diseases/',
-    'https://www.swinburne.edu.au/news/2018/03/swinburne-students-blossom-at-2018-melbourne-international-flower-and-garden-show/',
-    'https://www.swinburne.edu.au/news/2020/09/swinburnes-emerging-leaders-program-celebrates-student-success/',
-    'https://www.swinburne.edu.au/news/2017/04/understanding-reoffending-to-improve-community-safety/',
-    'https://www.swinburne.edu.au/news/2020/07/swinburne-and-able-australia-develop-3d-printed-swin-shields/',
-    'https://www.swinburne.edu.au/news/2021/09/swinburne-experts-on-what-to-do-these-school-holidays/',
-    'https://www.swinburne.edu.au/news/2018/04/swinburnes-financial-planning-courses-receive-accreditation/',
-    'https://www.swinburne.edu.au/news/2019/05/enough-with-the-pilot-programs-we-need-to-kickstart-innovation-in-australia/',
-    'https://www.swinburne.edu.au/news/2021/12/swinburne-celebrates-indigenous-technology-with-adnate-art/',
-    'https://www.swinburne.edu.au/news/2015/04/australians-to-our-leaders-lift-your-game-and-think-long-term-1/',
-    'https://www.swinburne.edu.au/news/2016/04/childhood-and-the-touchscreen-revolution/',
-    'https://www.swinburne.edu.au/news/2015/02/swinburne-study-into-youth-homelessness-reveals-majority-spent-time-in-out-of-home-care/',
-    'https://www.swinburne.edu.au/news/2014/02/australia-trafficks-and-abuses-asylum-seeker-children-1/',
-    'https://www.swinburne.edu.au/news/2014/03/women-in-film-and-tv-celebrating-the-success-of-swinburnes-female-filmmakers/',
-    'https://www.swinburne.edu.au/news/2017/03/welcome-scholarship-recipients-commence-their-studies-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2024/08/Australias-urgent-lack-of-hydrogen-skills-addressed-by-new-Swinburne-micro-credentials/',
-    'https://www.swinburne.edu.au/news/2014/08/swinburnes-dori-tunstall-and-karen-hughes-receive-grant-from-australia-china-council/',
-    'https://www.swinburne.edu.au/news/2017/10/workers-exposed-to-traumatic-events-to-benefit-from-new-funding/',
-    'https://www.swinburne.edu.au/news/2014/06/swinburne-aviation-industry-conference-2014/',
-    'https://www.swinburne.edu.au/news/2019/09/best-on-ground-why-australians-think-sporting-bodies-provide-strongest-leadership-for-public-good/',
-    'https://www.swinburne.edu.au/news/2021/11/swinburne-joins-tech-council-of-australia-to-solve-the-tech-talent-crisis/',
-    'https://www.swinburne.edu.au/news/2020/06/reflecting-on-reconciliation-with-senator-pat-dodson/',
-    'https://www.swinburne.edu.au/news/2020/10/swinburne-student-outshine-competition-in-kpmg-graduate-program/',
-    'https://www.swinburne.edu.au/news/2018/10/discussing-the-future-of-manufacturing-at-graphene/',
-    'https://www.swinburne.edu.au/news/2019/09/swinburnes-oldest-phd-student-says-youre-never-too-old-to-learn/',
-    'https://www.swinburne.edu.au/news/2022/08/new-on-campus-cafe-to-support-indigenous-training-and-employment/',
-    'https://www.swinburne.edu.au/news/2023/11/congratulations-to-swinburnes-2023-highly-cited-researchers/',
-    'https://www.swinburne.edu.au/news/2016/05/confusion-over-googles-paid-services-could-land-it-in-trouble-again/',
-    'https://www.swinburne.edu.au/news/2019/05/swinburne-and-partners-win-award-for-excellence-in-manufacturing-skills-development/',
-    'https://www.swinburne.edu.au/news/2019/05/introducing-swinburnes-indigenous-student-services-team/',
-    'https://www.swinburne.edu.au/news/2019/06/architecture-is-too-important-to-be-left-to-architects/',
-    'https://www.swinburne.edu.au/news/2023/05/students-shaping-industry-development-from-across-the-globe/',
-    'https://www.swinburne.edu.au/news/2024/03/Transforming-passion-into-careers-the-power-of-TAFE-in-Australias-skills-revolution/',
-    'https://www.swinburne.edu.au/news/2024/05/the-number-of-indigenous-afl-players-has-plunged/',
-    'https://www.swinburne.edu.au/news/2014/04/the-ageing-of-the-australian-population-triumph-or-disaster/',
-    'https://www.swinburne.edu.au/news/2015/06/swinburne-research-uncovers-challenges-and-opportunities-facing-australias-social-enterprise-sector/',
-    'https://www.swinburne.edu.au/news/2022/08/new-research-into-optimising-health-equity-and-safety-for-people-in-social-housing/',
-    'https://www.swinburne.edu.au/news/2020/08/law-students-get-hands-on-with-the-technologies-changing-the-legal-industry/',
-    'https://www.swinburne.edu.au/news/2016/10/the-ford-plant-closure-is-sad-loss-of-manufacturing-know-how/',
-    'https://www.swinburne.edu.au/news/2016/12/swinburne-and-binus-university-collaborate-on-disaster-relief---/',
-    'https://www.swinburne.edu.au/news/2019/10/swinburne-venture-cup-winner-aims-to-improve-breast-milk-expressing-experience-for-mums/',
-    'https://www.swinburne.edu.au/news/2020/12/new-report-tracks-key-working-from-home-trends-emerging-from-covid-19/',
-    'https://www.swinburne.edu.au/news/2018/03/swinburnes-james-ogloff-recognised-with-international-award/',
-    'https://www.swinburne.edu.au/news/2018/05/why-are-feminine-crafts-like-basket-weaving-disparaged-by-politicians/',
-    'https://www.swinburne.edu.au/news/2019/10/deputy-vice-chancellor-professor-aleksandar-subic-addresses-national-press-club-on-the-future-of-industry-40/',
-    'https://www.swinburne.edu.au/news/2014/12/parents-should-help-not-hinder-when-it-comes-to-study/',
-    'https://www.swinburne.edu.au/news/2018/11/coffee-consumers-in-university-settings-and-planetary-health/',
-    'https://www.swinburne.edu.au/news/2014/02/personality-differences-trolls-and-cyberstalkers-arent-the-same/',
-    'https://www.swinburne.edu.au/news/2016/02/swinburne-nawaloka-college-partnership-thrives/',
-    'https://www.swinburne.edu.au/news/2024/04/Swinburne-and-UIIN-showcase-university-industry-collaboration/',
-    'https://www.swinburne.edu.au/news/2017/11/why-some-people-see-dumpster-diving-as-the-ethical-way-to-eat/',
-    'https://www.swinburne.edu.au/news/2018/05/hope-and-fear-surround-emerging-technologies-but-all-of-us-must-contribute-to-stronger-governance/',
-    'https://www.swinburne.edu.au/news/2019/05/campaign-silence-as-we-face-the-gravest-security-threats-in-decades/',
-    'https://www.swinburne.edu.au/news/2020/10/swinburne-and-officeworks-skilling-students-for-the-future-of-supply-chain/',
-    'https://www.swinburne.edu.au/news/2023/05/swinburne-reaffirms-support-for-voice-to-parliament/',
-    'https://www.swinburne.edu.au/news/2015/07/swinburne-students-working-with-indigenous-communities/',
-    'https://www.swinburne.edu.au/news/2017/03/swinburne-invests-in-innovation-to-support-startups/',
-    'https://www.swinburne.edu.au/news/2021/01/new-catalyst-produces-green-hydrogen-from-seawater/',
-    'https://www.swinburne.edu.au/news/2022/08/internship-at-the-heart-of-groundbreaking-coronary-tech/',
-    'https://www.swinburne.edu.au/news/2016/08/swinburne-hosts-australian-government-fellowship-awardees/',
-    'https://www.swinburne.edu.au/news/2017/05/universities-uniquely-equipped-to-support-innovation/',
-    'https://www.swinburne.edu.au/news/2023/05/swinburne-alum-taking-environmentalism-to-the-streets/',
-    'https://www.swinburne.edu.au/news/2015/08/swinburne-named-as-a-finalist-in-kca-2015-research-commercialisation-awards/',
-    'https://www.swinburne.edu.au/news/2016/11/what-is-exposure-therapy-and-how-can-it-treat-social-anxiety-1/',
-    'https://www.swinburne.edu.au/news/2020/05/swinburne-superhero-documentary-wins-international-recognition/',
-    'https://www.swinburne.edu.au/news/2020/08/swinburne-welcomes-new-vice-chancellor/',
-    'https://www.swinburne.edu.au/news/2014/02/swinburne-alumna-appointed-humanitarian-affairs-youth-ambassador/',
-    'https://www.swinburne.edu.au/news/2015/05/national-product-design-engineering-challenge/',
-    'https://www.swinburne.edu.au/news/2017/02/swinburne-hosts-international-delegation-from-argentina/',
-    'https://www.swinburne.edu.au/news/2016/10/race-gender-and-the-future-of-the-republican-party/',
-    'https://www.swinburne.edu.au/news/2017/07/migrants-are-healthier-than-the-average-australian/',
-    'https://www.swinburne.edu.au/news/2014/05/astronomers-are-steering-hawaiis-keck-telescopes-from-swinburnes-hawthorn-campus-1/',
-    'https://www.swinburne.edu.au/news/2016/06/indigenous-design-program-creates-educational-aspirations/',
-    'https://www.swinburne.edu.au/news/2017/10/attitudes-to-medium-density-living-are-changing-in-sydney-and-melbourne/',
-    'https://www.swinburne.edu.au/news/2022/06/new-swinburne-edge-research-shows-flexible-work-is-here-to-stay/',
-    'https://www.swinburne.edu.au/news/2023/07/photographic-project-to-reveal-history-of-Ngarrindjeri-people/',
-    'https://www.swinburne.edu.au/news/2015/08/vietnamese-students-compete-for-swinburne-scholarship/',
-    'https://www.swinburne.edu.au/news/2024/04/swinburnes-social-innovation-institute-backs-projects/',
-    'https://www.swinburne.edu.au/news/2024/05/anita-faggs-journey-studying-community-services-at-swinburne-university/',
-    'https://www.swinburne.edu.au/news/2019/09/opinion-determining-likelihood-of-re-offending-shouldnt-be-a-judicial-guess/',
-    'https://www.swinburne.edu.au/news/2021/09/swinburne-welcomes-vic-governments-international-education-resilience-fund/',
-    'https://www.swinburne.edu.au/news/2016/09/how-to-survive-the-switch-to-daylight-saving/',
-    'https://www.swinburne.edu.au/news/2017/12/swinburne-students-among-australias-brightest-to-receive-scholarships/',
-    'https://www.swinburne.edu.au/news/2020/06/student-adobe-digital-coaches-are-using-storytelling-to-improve-digital-literacy/',
-    'https://www.swinburne.edu.au/news/2022/10/australian-leadership-index-public-support-for-federal-government-up-since-election/',
-    'https://www.swinburne.edu.au/news/2023/08/best-in-australia-three-swinburne-vet-students-win-gold-at-worldskills-national-championships/',
-    'https://www.swinburne.edu.au/news/2020/05/surviving-a-crisis-what-virgin-australia-staff-can-learn-from-ex-ansett-workers/',
-    'https://www.swinburne.edu.au/news/2023/06/swinburne-innovations-are-addressing-the-housing-crisis-by-developing-sustainable-affordable-and-energy-efficient-housing-materials/',
-    'https://www.swinburne.edu.au/news/2018/07/swinburne-astronomer-helps-test-einsteins-theory-of-general-relativity/',
-    'https://www.swinburne.edu.au/news/2019/10/4-metre-flying-reptile-unearthed-in-queensland-is-our-best-pterosaur-fossil-yet/',
-    'https://www.swinburne.edu.au/news/2023/09/swinburne-design-alum-changing-the-world-one-idea-at-a-time/',
-    'https://www.swinburne.edu.au/news/2014/04/for-want-of-industry-policy-our-living-standards-are-set-to-fall/',
-    'https://www.swinburne.edu.au/news/2019/05/comic-how-to-have-better-arguments-about-the-environment-or-anything-else/',
-    'https://www.swinburne.edu.au/news/2022/04/swinburne-celebrates-indigenous-student-success/',
-    'https://www.swinburne.edu.au/news/2020/12/new-partnership-boosts-industry-engagement-and-employability-for-mba-students/',
-    'https://www.swinburne.edu.au/news/2021/09/building-trust-with-migrant-and-refugee-communities-is-crucial-for-public-health-measures-to-work/',
-    'https://www.swinburne.edu.au/news/2018/07/an-interior-designers-tips-to-create-the-illusion-of-space/',
-    'https://www.swinburne.edu.au/news/2021/09/Swinburne-grad-revolutionises-food-ordering-with-hungryhungry/',
-    'https://www.swinburne.edu.au/news/2022/03/meet-the-swinburne-indigenous-academics-driving-innovative-change/',
-    'https://www.swinburne.edu.au/news/2014/03/swinburne-visual-merchandising-students-create-display-for-eastland-1/',
-    'https://www.swinburne.edu.au/news/2014/06/swinburne-research-links-non-work-presenteeism-with-boredom-and-procrastination/',
-    'https://www.swinburne.edu.au/news/2023/12/Swinburne-extends-research-and-education-partnership-with-Yarra-Junior-Football-League/',
-    'https://www.swinburne.edu.au/news/2014/11/professor-beth-webster-joins-swinburne-as-director-of-the-centre-for-transformative-innovation/',
-    'https://www.swinburne.edu.au/news/2020/05/swinburne-and-girls-academy-extend-partnership-to-support-education-for-indigenous-girls/',
-    'https://www.swinburne.edu.au/news/2021/05/Swinburne-welcomed-into-the-CFA-Institute-University-Affiliation-Program/',
-    'https://www.swinburne.edu.au/news/2014/03/every-law-not-based-on-wisdom-is-a-menace-to-the-state/',
-    'https://www.swinburne.edu.au/news/2014/12/the-5-really-important-things-to-consider-when-choosing-a-degree/',
-    'https://www.swinburne.edu.au/news/2015/12/manufacturing-given-a-new-spin-in-swinburnes-factory-of-the-future/',
-    'https://www.swinburne.edu.au/news/2018/01/graduate-film-debuts-at-berlin-international-film-festival/',
-    'https://www.swinburne.edu.au/news/2020/11/swinburnes-professor-alan-duffy-recognised-at-inaugural-australian-space-awards/',
-    'https://www.swinburne.edu.au/news/2014/09/three-eyes-on-the-sky-track-laws-of-nature-10-billion-years-ago/',
-    'https://www.swinburne.edu.au/news/2020/06/swinburne-ranks-as-a-top-university-under-the-age-of-50/',
-    'https://www.swinburne.edu.au/news/2016/12/swinburne-student-soars-in-australian-aerobatics-championships/',
-    'https://www.swinburne.edu.au/news/2020/04/virgin-australia-gets-a-lifeline-but-will-it-be-enough/',
-    'https://www.swinburne.edu.au/news/2020/12/swinburne-reflects-on-a-year-of-reconciliation/',
-    'https://www.swinburne.edu.au/news/2023/09/nouiblez-jamais-a-student-film-on-the-lived-experiences-of-wwii/',
-    'https://www.swinburne.edu.au/news/2014/06/backing-australias-future-through-great-vocational-education/',
-    'https://www.swinburne.edu.au/news/2016/09/new-arc-centre-of-excellence-for-gravitational-wave-discovery-announced/',
-    'https://www.swinburne.edu.au/news/2015/10/melbourne-international-games-week-launches-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2016/11/swinburne-academics-in-the-conversation-yearbook/',
-    'https://www.swinburne.edu.au/news/2023/04/adobe-digital-coaches-help-bring-your-study-and-research-to-life/',
-    'https://www.swinburne.edu.au/news/2024/06/Expert-opinion-Nuclear-power-has-merits-but-investing-in-renewable-ensures-long-term-energy-security/',
-    'https://www.swinburne.edu.au/news/2015/02/forensics-researcher-awarded-a-fulbright-scholarship/',
-    'https://www.swinburne.edu.au/news/2015/10/pulling-out-your-hair-in-frustration-what-you-need-to-know-about-trichotillomania/',
-    'https://www.swinburne.edu.au/news/2018/11/smartphone-storytelling-unlocking-creativity-at-mobile-film-festival/',
-    'https://www.swinburne.edu.au/news/2014/07/in-the-senate-below-or-above-the-line-you-decide/',
-    'https://www.swinburne.edu.au/news/2019/08/opinion-dissenting-judge-gives-pell-reason-to-clutch-at-high-court-lifeline/',
-    'https://www.swinburne.edu.au/news/2021/05/behind-the-scenes-with-cinema-and-screen-studies-lecuter-dr-jessica-balanzategui/',
-    'https://www.swinburne.edu.au/news/2021/05/surf-sounds-study-to-investigate-bubble-size-data-for-industrial-and-environmental-use/',
-    'https://www.swinburne.edu.au/news/2018/04/swinburne-graduates-recognised-by-design-institute-of-australia/',
-    'https://www.swinburne.edu.au/news/2019/11/this-laundry-is-changing-the-vicious-cycle-of-unemployment-and-mental-illness/',
-    'https://www.swinburne.edu.au/news/2018/11/chinese-migrants-follow-australians-giant-ecological-footprints/',
-    'https://www.swinburne.edu.au/news/2014/03/exploding-stars-prove-newtons-law-of-gravity-unchanged-over-cosmic-time/',
-    'https://www.swinburne.edu.au/news/2016/04/northern-territory-students-success-at-apprenticeship-awards/',
-    'https://www.swinburne.edu.au/news/2020/01/future-proofing-australias-smaller-manufacturers/',
-    'https://www.swinburne.edu.au/news/2024/06/the-missed-opportunity-in-the-Australian-Universities-Accord/',
-    'https://www.swinburne.edu.au/news/2017/11/swinburne-early-career-researchers-share-in-58-million-australian-research-council-funding/',
-    'https://www.swinburne.edu.au/news/2021/03/q-and-a-with-accomplished-social-innovation-research-institue-member-associate-professor-anthony-mccosker/',
-    'https://www.swinburne.edu.au/news/2019/10/swinburne-entrepreneurship-graduate-makes-waves-in-los-angeles-digital-marketing-industry/',
-    'https://www.swinburne.edu.au/news/2014/07/graham-goldsmith-appointed-chancellor-of-swinburne-university-of-technology/',
-    'https://www.swinburne.edu.au/news/2015/08/virtual-dementia-experience-allows-users-to-see-through-the-eyes-of-people-with-dementia/',
-    'https://www.swinburne.edu.au/news/2016/02/not-dead-yet-how-email-has-survived-and-continues-to-thrive/',
-    'https://www.swinburne.edu.au/news/2016/12/swinburne-awards-passionate-educator-with-honorary-doctorate/',
-    'https://www.swinburne.edu.au/news/2014/03/skinny-solution-how-sound-waves-are-being-used-to-separate-fat-from-milk/',
-    'https://www.swinburne.edu.au/news/2020/04/global-study-to-investigate-the-impact-of-covid-19-social-restrictions-on-health-and-wellbeing/',
-    'https://www.swinburne.edu.au/news/2020/04/look-whos-talking-australias-telcos-banks-and-supermarkets-granted-exemption-to-cartel-laws/',
-    'https://www.swinburne.edu.au/news/2014/10/australia-and-asia-perfectly-placed-for-last-lunar-eclipse-of-2014/',
-    'https://www.swinburne.edu.au/news/2015/05/attention-governments-and-the-taxman-everyone-deserves-a-second-chance-at-education/',
-    'https://www.swinburne.edu.au/news/2020/03/morrison-compassion-and-coronavirus-when-crisis-refines-leadership/',
-    'https://www.swinburne.edu.au/news/2015/04/swinburne-constructs-partnership-with-building-product-manufacturers-casafico/',
-    'https://www.swinburne.edu.au/news/2019/02/celebrating-outstanding-contributions-to-student-learning/',
-    'https://www.swinburne.edu.au/news/2016/04/interstellar-travel-galactic-cannibalism-and-martian-beer/',
-    'https://www.swinburne.edu.au/news/2017/01/summer-reading-guide-from-the-conversations-business--economics-writers/',
-    'https://www.swinburne.edu.au/news/2019/09/accessability-careers-hub-for-students-with-disability-celebrates-first-successes/',
-    'https://www.swinburne.edu.au/news/2018/11/one-in-four-australians-are-lonely-which-affects-their-physical-and-mental-health/',
-    'https://www.swinburne.edu.au/news/2015/05/how-changing-our-bank-account-numbering-system-will-be-a-win-for-customers/',
-    'https://www.swinburne.edu.au/news/2019/06/students-create-awareness-campaign-for-debilitating-collapsing-condition-/',
-    'https://www.swinburne.edu.au/news/2019/09/engineering-practice-model-guides-swinburnes-stem-transformation/',
-    'https://www.swinburne.edu.au/news/2024/07/from-solar-panel-recycling-to-AI-in-net-zero-building-Swinburne-partners-in-new-ARC-Industrial-Transformation-Research-Hubs/',
-    'https://www.swinburne.edu.au/news/2015/05/swinburne-students-test-their-skills-on-a-world-championship-grand-prix-car/',
-    'https://www.swinburne.edu.au/news/2015/09/winners-announced-for-national-product-design-engineering-challenge/',
-    'https://www.swinburne.edu.au/news/2019/05/homelessness-soars-in-our-biggest-cities-driven-by-rising-inequality-since-2001/',
-    'https://www.swinburne.edu.au/news/2019/07/its-your-childs-screen-experience-that-matters-not-screen-time/',
-    'https://www.swinburne.edu.au/news/2015/12/swinburne-is-working-to-improve-homelessness-and-housing-affordability/',
-    'https://www.swinburne.edu.au/news/2016/05/erectile-dysfunction-has-a-psychological-basis/',
-    'https://www.swinburne.edu.au/news/2018/02/no-science-minister-and-its-unclear-where-science-fits-in-australia/',
-    'https://www.swinburne.edu.au/news/2020/02/australia-we-need-to-talk-about-who-governs-our-city-states/',
-    'https://www.swinburne.edu.au/news/2014/09/swinburne-researchers-investigating-occupational-stress-of-working-australians/',
-    'https://www.swinburne.edu.au/news/2014/10/fighting-tiny-microbes-that-have-the-potential-to-sink-a-ship/',
-    'https://www.swinburne.edu.au/news/2016/02/fulbright-recipient-to-shine-spotlight-on-apprenticeships/',
-    'https://www.swinburne.edu.au/news/2014/11/swinburne-welcomes-oppositions-commitment-to-lilydale/',
-    'https://www.swinburne.edu.au/news/2019/02/design-and-the-city-urban-futures-lab-at-business-of-design-week/',
-    'https://www.swinburne.edu.au/news/2024/05/dylan-alcott-foundation-scholarship-opens-doors-for-young-people-living-with-a-disability/',
-    'https://www.swinburne.edu.au/news/2019/12/sustainable-student-pavilion-design-shortlisted-in-wonderfruit-competition/',
-    'https://www.swinburne.edu.au/news/2020/07/understanding-how-pandemic-conditions-affects-individuals-with-mood-disorders/',
-    'https://www.swinburne.edu.au/news/2022/12/IERF-program-transforms-international-student-experience/',
-    'https://www.swinburne.edu.au/news/2023/08/professor-laura-anne-bull-appointed-deputy-vice-chancellor-education-experience-and-employability/',
-    'https://www.swinburne.edu.au/news/2014/06/swinburne-researchers-investigating-brain-and-cardiovascular-health-of-older-australians/',
-    'https://www.swinburne.edu.au/news/2019/12/forging-unique-paths-in-design---a-tale-of-two-graduates/',
-    'https://www.swinburne.edu.au/news/2014/11/explainer-five-key-seats-to-watch-in-the-victorian-election/',
-    'https://www.swinburne.edu.au/news/2016/10/collapse-of-australian-car-manufacturing-industry/',
-    'https://www.swinburne.edu.au/news/2019/07/how-a-robot-helped-school-children-bring-an-aboriginal-language-back-to-life/',
-    'https://www.swinburne.edu.au/news/2019/08/felicity-furey-is-helping-more-girls-discover-the-power-of-engineering/',
-    'https://www.swinburne.edu.au/news/2014/10/biological-psychiatry-australia-appoints-new-president/',
-    'https://www.swinburne.edu.au/news/2021/09/swinburne-design-students-collaborate-with-london-college-of-communication/',
-    'https://www.swinburne.edu.au/news/2015/02/a-faster-response-needed-to-see-fast-radio-bursts-in-the-universe/',
-    'https://www.swinburne.edu.au/news/2016/05/swinburne-researchers-join-the-underground-hunt-for-the-universes-dark-side/',
-    'https://www.swinburne.edu.au/news/2019/06/swinburne-research-is-transforming-vaginal-and-reproductive-health/',
-    'https://www.swinburne.edu.au/news/2018/03/swinburne-launches-australias-first-postgraduate-course-in-fintech/',
-    'https://www.swinburne.edu.au/news/2021/08/chocolate-yoga-and-sunshine-body-chemistry-can-bring-some-light-to-lockdown/',
-    'https://www.swinburne.edu.au/news/2017/12/religious-faith-can-help-people-to-build-better-cities--heres-how/',
-    'https://www.swinburne.edu.au/news/2018/02/how-universities-can-make-graduates-employable-with-connections-to-industry/',
-    'https://www.swinburne.edu.au/news/2023/12/Less-than-three-per-cent-of-aged-care-residents-access-mental-health-services-a-pilot-initiative-is-giving-the-sector-hope/',
-    'https://www.swinburne.edu.au/news/2016/09/australian-small-businesses-could-be-stretched-by-changes-to-commercial-credit-cards/',
-    'https://www.swinburne.edu.au/news/2016/12/makeathon-for-assistive-technology-crosses-finish-line/',
-    'https://www.swinburne.edu.au/news/2022/11/why-elon-musks-first-week-as-twitter-owner-has-users-flocking-elsewhere/',
-    'https://www.swinburne.edu.au/news/2019/09/swinburne-pride-celebrating-gender-diversity-and-inclusivity/',
-    'https://www.swinburne.edu.au/news/2020/11/swinburne-students-design-solutions-in-australia-council-for-the-arts-national-innovation-games/',
-    'https://www.swinburne.edu.au/news/2021/12/space-loving-students-find-milky-way-to-grow-yoghurt-in-orbit/',
-    'https://www.swinburne.edu.au/news/2022/06/automated-composting-system-wins-swinburnes-design-for-change-competition/',
-    'https://www.swinburne.edu.au/news/2023/04/study-abroad-experience-enriches-students-professional-purpose/',
-    'https://www.swinburne.edu.au/news/2015/07/outstanding-horticulture-student-ben-cleverdon-recognised-by-knox-rotary-club-and-swinburne/',
-    'https://www.swinburne.edu.au/news/2017/11/swinburne-game-up-for-best-student-game-at-the-game-awards-2017/',
-    'https://www.swinburne.edu.au/news/2020/11/pandemic-widens-gap-between-government-and-australians-view-of-education/',
-    'https://www.swinburne.edu.au/news/2017/10/vice-chancellor-and-advanced-manufacturing-industry-leader-named-atse-fellows/',
-    'https://www.swinburne.edu.au/news/2020/11/swinburne-pride-week-celebrates-inclusion-and-awareness-with-the-lgbtiq-community/',
-    'https://www.swinburne.edu.au/news/2014/05/price-of-resettling-refugees-should-not-be-our-silence-on-cambodia-1/',
-    'https://www.swinburne.edu.au/news/2024/01/magazines-were-supposed-to-die-in-the-digital-age-why-havent-they/',
-    'https://www.swinburne.edu.au/news/2014/05/interior-design-and-visual-merchandising-students-collaborate-with-springvale-homemaker-centre--1/',
-    'https://www.swinburne.edu.au/news/2015/04/professor-linda-kristjanson-reappointed-as-vice-chancellor-of-swinburne/',
-    'https://www.swinburne.edu.au/news/2020/05/swinburne-welcomes-victorian-government-support-for-universities/',
-    'https://www.swinburne.edu.au/news/2019/07/centre-for-astrophysics-and-supercomputing-recruits-new-director-from-the-us/',
-    'https://www.swinburne.edu.au/news/2019/10/swinburnes-dr-elaine-saunders-named-a-fellow-of-australian-academy-of-technology-and-engineering/',
-    'https://www.swinburne.edu.au/news/2023/06/rocket-launch-alert-a-uni-club-that-lets-you-send-tech-to-space/',
-    'https://www.swinburne.edu.au/news/2017/04/swinburne-and-university-of-stuttgart-combine-advanced-manufacturing-expertise/',
-    'https://www.swinburne.edu.au/news/2023/09/swinburne-and-breakthrough-victoria-creates-18-million-investment-partnership-to-support-swinburne-spinouts/',
-    'https://www.swinburne.edu.au/news/2018/08/swinburne-and-wipro-establish-chair-of-artificial-intelligence/',
-    'https://www.swinburne.edu.au/news/2019/08/first-home-buyer-schemes-arent-enough-to-meet-young-adults-housing-aspirations/',
-    'https://www.swinburne.edu.au/news/2020/01/three-swinburne-scholars-awarded-fulbright-scholarships/',
-    'https://www.swinburne.edu.au/news/2024/06/Swinburnes-Luminate-Pitch-Night-2024-advances-innovative-ideas-for-a-better-world/',
-    'https://www.swinburne.edu.au/news/2020/09/mdetect-spins-out-from-swinburne-taking-deep-tech-to-new-depths/',
-    'https://www.swinburne.edu.au/news/2015/10/educating-young-refugees-and-asylum-seekers-the-smart-thing-to-do/',
-    'https://www.swinburne.edu.au/news/2022/10/top-5-destinations-to-study-and-intern-abroad-in-2023/',
-    'https://www.swinburne.edu.au/news/2019/12/aviation-expert-recognised-for-lifetime-achievement-at-swinburne/',
-    'https://www.swinburne.edu.au/news/2015/11/women-get-a-much-needed-boost-in-research-funding-gender-equity-plan/',
-    'https://www.swinburne.edu.au/news/2019/11/phd-candidate-wins-prestigious-green-talents-award-for-contribution-to-sustainable-development-/',
-    'https://www.swinburne.edu.au/news/2014/08/swinburnes-gender-equality-strategic-action-plan-aims-to-deliver--gender-pay-equality-by-2020/',
-    'https://www.swinburne.edu.au/news/2015/05/australias-transitioning-economy-and-the-myth-of-digital-disruption/',
-    'https://www.swinburne.edu.au/news/2021/05/university-is-getting-an-upgrade-swinburne-guarantees-industry-experience-for-students/',
-    'https://www.swinburne.edu.au/news/2023/05/homelessness-today-sees-workers-and-families-with-nowhere-stable-to-live-no-wonder-their-health-is-suffering/',
-    'https://www.swinburne.edu.au/news/2015/08/swinburne-researchers-recommend-redesign-of-apartment-market-to-improve-affordability-and-supply/',
-    'https://www.swinburne.edu.au/news/2015/12/swinburne-at-the-forefront-of-dementia-research/',
-    'https://www.swinburne.edu.au/news/2016/11/how-did-we-get-the-result-of-the-us-election-so-wrong/',
-    'https://www.swinburne.edu.au/research/facilities-equipment/babylab/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/',
-    'https://www.swinburne.edu.au/research/platforms-initiatives/factory-of-the-future/',
-    'https://www.swinburne.edu.au/research/institutes/innovative-planet/',
-    'https://www.swinburne.edu.au/research/',
-    'https://www.swinburne.edu.au/research/ethics-integrity/',
-    'https://www.swinburne.edu.au/research/institutes/iverson-health-innovation/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/centre-for-mental-health/our-research/',
-    'https://www.swinburne.edu.au/research/global-health-equity/',
-    'https://www.swinburne.edu.au/research/institutes/social-innovation/',
-    'https://www.swinburne.edu.au/research/institutes/',
-    'https://www.swinburne.edu.au/research/platforms-initiatives/ihub-network/',
-    'https://www.swinburne.edu.au/research/global-health-equity/contact-us/',
-    'https://www.swinburne.edu.au/research/platforms-initiatives/air-hub/',
-    'https://www.swinburne.edu.au/research/chief-scientist/',
-    'https://www.swinburne.edu.au/research/facilities-equipment/',
-    'https://www.swinburne.edu.au/research/indigenous-research/',
-    'https://www.swinburne.edu.au/research/institutes/space-technology-industry/',
-    'https://www.swinburne.edu.au/research/platforms-initiatives/',
-    'https://www.swinburne.edu.au/research/platforms-initiatives/victorian-hydrogen-hub/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/centre-for-mental-health/voices-clinic/publications/',
-    'https://www.swinburne.edu.au/research/contact-us/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/wellbeing-clinic/',
-    'https://www.swinburne.edu.au/research/platforms-initiatives/industry-4-0-testlab/',
-    'https://www.swinburne.edu.au/research/platforms-initiatives/manufacturing-futures/',
-    'https://www.swinburne.edu.au/research/facilities-equipment/smart-structures-laboratory/',
-    'https://www.swinburne.edu.au/research/platforms-initiatives/innovation-studio/',
-    'https://www.swinburne.edu.au/research/institutes/social-innovation/society-4-0/2019/',
-    'https://www.swinburne.edu.au/research/achievements-recognition/',
-    'https://www.swinburne.edu.au/research/global-health-equity/our-research-projects/beatcovid19now/',
-    'https://www.swinburne.edu.au/research/strengths-achievements/strategic-initiatives/industrial-digital-transformation-hub/events/',
-    'https://www.swinburne.edu.au/research/ethics-integrity/biosafety-defence/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/centre-for-transformative-innovation/',
-    'https://www.swinburne.edu.au/research/ethics-integrity/human-research/',
-    'https://www.swinburne.edu.au/research/platforms-initiatives/digital-capability/',
-    'https://www.swinburne.edu.au/research/facilities-equipment/babylab/toddler-children-research/',
-    'https://www.swinburne.edu.au/research/institutes/social-innovation/society-4-0/2018/',
-    'https://www.swinburne.edu.au/research/platforms-initiatives/innovation-studio/elevate-program/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/centre-for-mental-health/',
-    'https://www.swinburne.edu.au/research/global-health-equity/our-people/',
-    'https://www.swinburne.edu.au/research/platforms-initiatives/energy-transition/',
-    'https://www.swinburne.edu.au/research/achievements-recognition/research-impact/research-impact-magazine/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/centre-for-transformative-innovation/our-research/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/centre-for-astrophysics-supercomputing/',
-    'https://www.swinburne.edu.au/research/facilities-equipment/nano-lab/',
-    'https://www.swinburne.edu.au/research/facilities-equipment/virtual-design-lab/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/partnered-research-centres-hubs/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/centre-for-urban-transitions/our-research/',
-    'https://www.swinburne.edu.au/research/achievements-recognition/research-impact/lessons-on-diabetes/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/centre-for-transformative-innovation/our-publications/',
-    'https://www.swinburne.edu.au/research/facilities-equipment/swinburne-neuroimaging-facility/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/centre-for-urban-transitions/',
-    'https://www.swinburne.edu.au/research/institutes/social-innovation/society-4-0/',
-    'https://www.swinburne.edu.au/research/institutes/iverson-health-innovation/digital-health-science/',
-    'https://www.swinburne.edu.au/research/indigenous-research/projects/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/optical-sciences-centre/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/centre-for-transformative-innovation/our-people/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/centre-for-social-impact-swinburne/',
-    'https://www.swinburne.edu.au/research/achievements-recognition/research-impact/',
-    'https://www.swinburne.edu.au/research/facilities-equipment/virtual-reality-theatre/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/centre-for-forensic-behavioural-science/',
-    'https://www.swinburne.edu.au/research/institutes/iverson-health-innovation/personalised-health-care/',
-    'https://www.swinburne.edu.au/research/facilities-equipment/supercomputer/',
-    'https://www.swinburne.edu.au/research/platforms-initiatives/medtechvic/',
-    'https://www.swinburne.edu.au/research/ethics-integrity/data-management/',
-    'https://www.swinburne.edu.au/research/institutes/iverson-health-innovation/bioengineering-solutions/',
-    'https://www.swinburne.edu.au/research/facilities-equipment/babylab/infant-research/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/centre-for-mental-health/voices-clinic/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/swinburne-psychology-clinic/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/centre-for-urban-transitions/our-research/housing-futures/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/centre-for-design-innovation/',
-    'https://www.swinburne.edu.au/research/facilities-equipment/advanced-manufacturing-design-centre/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/centre-for-design-innovation/our-research/',
-    'https://www.swinburne.edu.au/research/facilities-equipment/babylab/parent-research/',
-    'https://www.swinburne.edu.au/research/facilities-equipment/anff-vic-biointerface-engineering-hub/',
-    'https://www.swinburne.edu.au/research/platforms-initiatives/digital-innovation-lab/',
-    'https://www.swinburne.edu.au/research/platforms-initiatives/siemens-swinburne-energy-transition-hub/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/centre-for-human-psychopharmacology/',
-    'https://www.swinburne.edu.au/research/ethics-integrity/funding-from-tobacco-companies/',
-    'https://www.swinburne.edu.au/research/institutes/iverson-health-innovation/chronic-disease-disability/',
-    'https://www.swinburne.edu.au/research/strengths-achievements/strategic-initiatives/industrial-digital-transformation-hub/our-program/',
-    'https://www.swinburne.edu.au/research/institutes/social-innovation/public-interest-technology/',
-    'https://www.swinburne.edu.au/research/global-health-equity/about/alumni-stories/',
-    'https://www.swinburne.edu.au/research/platforms-initiatives/innovation-studio/our-people/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/centre-for-mental-health/our-people/',
-    'https://www.swinburne.edu.au/research/facilities-equipment/cisco-networking-laboratory/',
-    'https://www.swinburne.edu.au/research/global-health-equity/get-involved/',
-    'https://www.swinburne.edu.au/research/facilities-equipment/microanalytical-microfabrication-facility/',
-    'https://www.swinburne.edu.au/research/global-health-equity/training-events/',
-    'https://www.swinburne.edu.au/research/strengths-achievements/strategic-initiatives/industrial-digital-transformation-hub/',
-    'https://www.swinburne.edu.au/research/ethics-integrity/animal-research/',
-    'https://www.swinburne.edu.au/research/strengths-achievements/specialist-facilities/electric-vehicle-laboratory/',
-    'https://www.swinburne.edu.au/research/platforms-initiatives/digital-capability/the-internet-of-things-lab/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/customer-experience-insight-research-group/',
-    'https://www.swinburne.edu.au/research/platforms-initiatives/factory-of-the-future/our-partners/',
-    'https://www.swinburne.edu.au/research/platforms-initiatives/digital-capability/intelligent-data-analytics-lab/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/social-environmental-sustainability-research-group/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/centre-for-urban-transitions/our-people/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/centre-for-design-innovation/our-research/human-centred-product-development/',
-    'https://www.swinburne.edu.au/research/platforms-initiatives/australian-technical-evaluation-network/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/centre-for-mental-health/national-etherapy-centre/',
-    'https://www.swinburne.edu.au/research/facilities-equipment/keck-observatory/',
-    'https://www.swinburne.edu.au/research/ethics-integrity/intellectual-property/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/centre-for-transformative-innovation/our-study-options/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/centre-for-urban-transitions/our-research/regenerating-our-cities/',
-    'https://www.swinburne.edu.au/research/platforms-initiatives/digital-capability/software-systems-lab/',
-    'https://www.swinburne.edu.au/research/facilities-equipment/geotechnical-laboratory/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/centre-for-sustainable-infrastructure-digital-construction/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/centre-for-design-innovation/our-research/human-centred-product-development/timberfy/',
-    'https://www.swinburne.edu.au/research/platforms-initiatives/victorian-hydrogen-hub/advisory-council/',
-    'https://www.swinburne.edu.au/research/strengths-achievements/specialist-facilities/direct-metal-deposition-facility/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/centre-for-design-innovation/our-research/urban-design-architecture/safe-successful-places/',
-    'https://www.swinburne.edu.au/research/global-health-equity/about/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/centre-for-mental-health/voices-clinic/amethyst-trial/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/centre-for-urban-transitions/our-research/new-ways-of-urban-living/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/centre-for-sustainable-infrastructure-digital-construction/our-research/',
-    'https://www.swinburne.edu.au/research/platforms-initiatives/digital-capability/blockchain-innovation-lab/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/centre-for-urban-transitions/our-research/healthy-cities-transitions/',
-    'https://www.swinburne.edu.au/research/global-health-equity/ophelia-and-questionnaires/',
-    'https://www.swinburne.edu.au/research/platforms-initiatives/digital-capability/cybersecurity-lab/',
-    'https://www.swinburne.edu.au/research/global-health-equity/our-research-projects/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/centre-for-design-innovation/our-research/human-centred-product-development/atlite-skylights/',
-    'https://www.swinburne.edu.au/research/platforms-initiatives/digital-capability/advanced-visualisation-lab/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/centre-for-design-innovation/our-research/urban-design-architecture/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/centre-for-transformative-innovation/our-research/social-network-analysis/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/centre-for-design-innovation/our-research/future-self-living-lab/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/centre-for-design-innovation/our-research/human-centred-product-development/limelite/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/centre-for-transformative-innovation/our-research/economics-of-innovation/',
-    'https://www.swinburne.edu.au/research/strengths-achievements/specialist-facilities/digital-construction-lab/',
-    'https://www.swinburne.edu.au/research/facilities-equipment/solar-facility/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/centre-for-urban-transitions/our-research/just-cities-transitions/',
-    'https://www.swinburne.edu.au/research/strengths-achievements/strategic-initiatives/industrial-digital-transformation-hub/about-us/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/centre-for-forensic-behavioural-science/our-consulting-services/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/centre-for-urban-transitions/our-research/productive-cities-transitions/',
-    'https://www.swinburne.edu.au/research/global-health-equity/our-research-projects/health-literacy-equity-social-housing/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/centre-for-sustainable-infrastructure-digital-construction/our-people/',
-    'https://www.swinburne.edu.au/research/centres-groups-clinics/centre-for-astrophysics-supercomputing/our-people/equality-diversity/',
-    'https://www.swinburne.edu.au/study/options/find/minors/',
-    'https://www.swinburne.edu.au/study/options/find/start-dates/',
-    'https://www.swinburne.edu.au/study/course/bachelor-of-laws-bachelor-of-psychological-sciences/',
-    'https://www.swinburne.edu.au/study/options/scholarships/list/',
-    'https://www.swinburne.edu.au/study/course/international/bachelor-of-laws-bachelor-of-psychological-sciences/',
-    'https://www.swinburne.edu.au/study/options/scholarships/',
-    'https://www.swinburne.edu.au/study/options/pathways-to-further-study/pathway-planner/',
-    'https://www.swinburne.edu.au/study/international/apply/entry-requirements/',
-    'https://www.swinburne.edu.au/study/options/pathways-to-further-study/credit-calculator/',
-    'https://www.swinburne.edu.au/study/options/scholarships/216/chilean-bicentennial-fund-scholarships/',
-    'https://www.swinburne.edu.au/study/options/scholarships/214/research-training-program-stipend---rtps/',
-    'https://www.swinburne.edu.au/study/options/scholarships/56/kath-watson-scholarship-for-women-2025/',
-    'https://www.swinburne.edu.au/study/options/scholarships/404/dr-tuan-luu-scholarship--for-women/',
-    'https://www.swinburne.edu.au/study/options/scholarships/410/sir-reginald-ansett-scholarship---business-2025/',
-    'https://www.swinburne.edu.au/study/options/scholarships/29/vice-chancellors-excellence-scholarship-2025/',
-    'https://www.swinburne.edu.au/study/options/scholarships/508/mandala-prize-for-law-2025/',
-    'https://www.swinburne.edu.au/study/options/scholarships/468/ju-fen-scholarship-2025/',
-    'https://www.swinburne.edu.au/study/options/scholarships/16/swinburne-student-achievement-awards/',
-    'https://www.swinburne.edu.au/study/options/scholarships/510/swinburne-research-stipend-scholarships/',
-    'https://www.swinburne.edu.au/study/options/scholarships/531/patricia-stanley-bolch-scholarship-2024/',
-    'https://www.swinburne.edu.au/study/options/scholarships/374/ford-blue-oval-scholarship-2025/',
-    'https://www.swinburne.edu.au/study/options/scholarships/375/claire-sorati-scholarship-for-women-2025/',
-    'https://www.swinburne.edu.au/study/options/scholarships/66/sir-edward-weary-dunlop-scholarship/',
-    'https://www.swinburne.edu.au/study/options/scholarships/418/jean-barry-scholarship-for-women-2025/',
-    'https://www.swinburne.edu.au/study/options/scholarships/472/nica---s-indigenous-scholarship/',
-    'https://www.swinburne.edu.au/study/options/scholarships/498/rotary-club-of-camberwell-scholarship-2025/',
-    'https://www.swinburne.edu.au/study/options/scholarships/221/swinburne-university-postgraduate-research-award/',
-    'https://www.swinburne.edu.au/study/options/scholarships/81/study-and-living-support-grants/',
-    'https://www.swinburne.edu.au/study/options/scholarships/491/ceva-logistics-supply-chain-management-scholarship/',
-    'https://www.swinburne.edu.au/study/options/scholarships/61/sir-reginald-ansett-scholarship---aviation-2025/',
-    'https://www.swinburne.edu.au/study/options/scholarships/94/pratt-foundation-scholarship-2025/',
-    'https://www.swinburne.edu.au/study/options/scholarships/45/access-scholarship-for-refugees-2025---vtac/',
-    'https://www.swinburne.edu.au/study/options/scholarships/387/carsales-foundation-women-in-stem-scholarship/',
-    'https://www.swinburne.edu.au/study/options/scholarships/503/dylan-alcott-foundation-scholarships-2025/',
-    'https://www.swinburne.edu.au/study/options/scholarships/54/indigenous-commonwealth-scholarships--icecs-and-icas-/',
-    'https://www.swinburne.edu.au/study/options/scholarships/419/swinburne-cpa-australia-member-scholarship/',
-    'https://www.swinburne.edu.au/study/options/scholarships/394/care-leaver-bursary/',
-    'https://www.swinburne.edu.au/study/options/scholarships/430/joan-mcpherson-welcome-scholarship-2025/',
-    'https://www.swinburne.edu.au/study/options/scholarships/541/medibank-next_gen-scholarship-2024/',
-    'https://www.swinburne.edu.au/study/options/scholarships/58/rosemary-simpson-scholarship-2025/',
-    'https://www.swinburne.edu.au/study/options/scholarships/334/swinburne-welcome-scholarships-2025/',
-    'https://www.swinburne.edu.au/study/options/scholarships/413/len-bettess-memorial-scholarship-2025/',
-    'https://www.swinburne.edu.au/study/options/scholarships/469/greig-connell-memorial-scholarship-2025/',
-    'https://www.swinburne.edu.au/study/options/scholarships/436/charlie-selman-sustainability-award-2024/',
-    'https://www.swinburne.edu.au/study/options/scholarships/359/malcolm-styles-local-government-scholarship/',
-    'https://www.swinburne.edu.au/study/options/scholarships/412/yeap-scholarship/',
-    'https://www.swinburne.edu.au/study/options/scholarships/313/new-colombo-plan-scholarship/',
-    'https://www.swinburne.edu.au/study/options/scholarships/222/talentia-fellowship-program/',
-    'https://www.swinburne.edu.au/study/options/scholarships/545/peter-and-vaclav-havlicek-chemistry-scholarship-2024/',
-    'https://www.swinburne.edu.au/study/options/scholarships/538/indigenous-rise-scholarship--pg-/',
-    'https://www.swinburne.edu.au/study/options/scholarships/391/stanley-liebich-memorial-scholarship-2025/',
-    'https://www.swinburne.edu.au/study/options/scholarships/382/pakistan---the-higher-education-commission--hec--scholarship/',
-    'https://www.swinburne.edu.au/study/options/scholarships/231/sheila-fitzgerald-scholarship/',
-    'https://www.swinburne.edu.au/study/options/scholarships/462/vet-digital-scholarship/',
-    'https://www.swinburne.edu.au/study/options/scholarships/515/swinburne-community-bank-leadership-scholarship-2024/',
-    'https://www.swinburne.edu.au/study/options/scholarships/533/indigenous-rise-scholarship--ug-/',
-    'https://www.swinburne.edu.au/study/options/scholarships/478/bruce-mcdonald-accountancy-alumni-scholarship-2025/',
-    'https://www.swinburne.edu.au/study/options/scholarships/532/ethel-swinburne-society-scholarship-in-nursing-2025/',
-    'https://www.swinburne.edu.au/study/options/scholarships/517/ambassador-pete-peterson-scholarships/',
-    'https://www.swinburne.edu.au/study/options/scholarships/193/piers-fowler-flight-instructor-scholarship/',
-    'https://www.swinburne.edu.au/study/options/scholarships/385/international-aviation-womens-association--iawa--scholarship/',
-    'https://www.swinburne.edu.au/study/options/scholarships/47/george-alexander-foundation-scholarship-2025/',
-    'https://www.swinburne.edu.au/study/options/scholarships/298/infrabuild-steel-scholarship-2025/',
-    'https://www.swinburne.edu.au/study/options/scholarships/512/snxg-engineering-scholarships-2025/',
-    'https://www.swinburne.edu.au/study/options/scholarships/435/pio-iovenitti-engineering-excellence-scholarship/',
-    'https://www.swinburne.edu.au/study/options/scholarships/142/judith-kinnear-student-travel-scholarship-2025/',
-    'https://www.swinburne.edu.au/study/options/scholarships/474/women-in-finance-and-economics-scholarship-program/',
-    'https://www.swinburne.edu.au/study/options/scholarships/529/swinburne-staff-and-community-scholarships-fund-2025/',
-    'https://www.swinburne.edu.au/study/options/scholarships/63/pathways-access-scholarship-2024/',
-    'https://www.swinburne.edu.au/study/options/scholarships/421/freemasons-foundation-victoria-scholarship-2025/',
-    'https://www.swinburne.edu.au/study/options/scholarships/302/joe-manders-scholarship-for-part-time-students-2025/',
-    'https://www.swinburne.edu.au/study/options/scholarships/535/indigenous-rise-scholarship--vet-/',
-    'https://www.swinburne.edu.au/study/options/scholarships/219/research-training-program-fees-offset--domestic---formerly-research-training-scheme-/',
-    'https://www.swinburne.edu.au/study/options/scholarships/344/violet-louise-bonner-postgraduate-scholarship-for-women-2025/',
-    'https://www.swinburne.edu.au/study/options/scholarships/338/australia-awards-scholarship/',
-    'https://www.swinburne.edu.au/study/options/scholarships/449/indigenous-laptop-scholarship/',
-    'https://www.swinburne.edu.au/study/options/scholarships/534/indigenous-technology-and-engagement-scholarship/',
-    'https://www.swinburne.edu.au/study/options/scholarships/437/indigenous-relocation-scholarship---vet-/',
-    'https://www.swinburne.edu.au/study/options/scholarships/223/tuition-fee-scholarship/',
-    'https://www.swinburne.edu.au/study/options/scholarships/438/indigenous-relocation-scholarship--higher-education-/',
-    'https://www.swinburne.edu.au/study/options/scholarships/191/piers-fowler-exchange-scholarship/',
-    'https://www.swinburne.edu.au/study/options/scholarships/539/indigenous-financial-assistance-grant-/',
-    'https://www.swinburne.edu.au/study/options/scholarships/536/indigenous-completions-scholarship-for-postgraduate-students/',
-    'https://www.swinburne.edu.au/study/options/scholarships/341/achievement-cleaning-humanitarian-welcome-scholarships/',
-    'https://www.swinburne.edu.au/study/options/scholarships/440/indigenous-transition-scholarship--vet-/',
-    'https://www.swinburne.edu.au/study/options/scholarships/493/adrian-di-marco-women-in-software-development-scholarship-2025/',
-    'https://www.swinburne.edu.au/study/options/scholarships/280/sustainable-consumption-and-digital-media/',
-    'https://www.swinburne.edu.au/study/options/scholarships/546/swinburne-indigenous-advancement-scholarships--vocational-education-/',
-    'https://www.swinburne.edu.au/study/options/scholarships/524/siemens-healthineers-engineering-technology--electrical--scholarship-2025/',
-    'https://www.swinburne.edu.au/study/options/scholarships/537/indigenous-residential-accommodation-scholarship/',
-    'https://www.swinburne.edu.au/study/options/scholarships/118/apollo-fund---first-in-family-scholarship-for-business-2025/',
-    'https://www.swinburne.edu.au/study/options/scholarships/519/steve-ashton-scholarship-for-the-architectural-profession--sasap--2024/',
-    'https://www.swinburne.edu.au/study/options/scholarships/511/access-scholarship-for-first-year-undergraduates-2024---direct-applications/',
-    'https://www.swinburne.edu.au/study/options/scholarships/217/research-training-program-fee-offset--international---formerly-international-postgraduate-research-/',
-    'https://www.swinburne.edu.au/study/options/scholarships/502/giles-family-foundation-study-abroad-program-2024--travel-in-2025-/',
-    'https://www.swinburne.edu.au/study/options/scholarships/544/moondani-toombadool-centre-hdr-scholarship-for-indigenous-candidates/',
-    'https://www.swinburne.edu.au/study/options/scholarships/470/citipower-powercor-and-united-energy-women-in-engineering-scholarship-2025/',
-    'https://www.swinburne.edu.au/study/options/scholarships/list/?refine=category&amp;residency=local&amp;student_type=future&amp;level=&amp;study_areas=&amp;filter_tags=3&amp;application_status=Both&amp;scholarship_name=',
-    'https://www.swinburne.edu.au/study/options/scholarships/59/access-scholarship-for-first-year-undergraduates-2025--relocated-rural---regional-areas----vtac/',
-    'https://www.swinburne.edu.au/study/options/scholarships/list/?refine=category&amp;residency=local&amp;student_type=future&amp;level=&amp;study_areas=&amp;filter_tags=3&amp;application_status=Open&amp;scholarship_name=',
-    'https://www.swinburne.edu.au/study/options/scholarships/460/inaugural-dean-of-health-sciences-professor-janet-hiller-scholarship-2024/',
-    'https://www.swinburne.edu.au/study/options/scholarships/414/merna-mattsson-scholarship-for-women-in-the-arts-social-sciences-and-humanities-2025/',
-    'https://www.swinburne.edu.au/study/options/scholarships/207/access-scholarship-for-students-who-are-care-leavers-from-aus-state-or-foster-care-2025---vtac/',
-    'https://www.swinburne.edu.au/swinburne-professional/professional-development/',
-    'https://www.swinburne.edu.au/swinburne-professional/professional-development/live-online-online-courses/',
-    'https://www.swinburne.edu.au/swinburne-professional/professional-development/qualifications-for-professional-development/',
-    'https://www.swinburneonline.edu.au/how-plan-study/',
-    'https://www.swinburneonline.edu.au/soft-skills-you-never-knew-you-had/',
-    'https://www.swinburneonline.edu.au/stopping-procrastination-it-stops-you/',
-    'https://www.swinburneonline.edu.au/travelling-student/',
-    'https://www.swinburneonline.edu.au/how-stay-informed-post-factual-era/',
-    'https://www.swinburneonline.edu.au/showcase-your-soft-skills-and-secure-job/',
-    'https://www.swinburneonline.edu.au/regain-your-study-motivation/',
-    'https://www.swinburneonline.edu.au/studies-abroad-swinburne-online/',
-    'https://www.swinburneonline.edu.au/top-5-in-demand-skills-employers-look-for/',
-    'https://www.swinburneonline.edu.au/the-best-way-to-approach-your-first-assignment/',
-    'https://www.swinburneonline.edu.au/the-best-way-to-recharge-between-teaching-periods/',
-    'https://www.swinburneonline.edu.au/how-concentrate-studies-long-hours/',
-    'https://www.swinburneonline.edu.au/guest-blog-managing-study-during-the-current-crisis/',
-    'https://www.swinburneonline.edu.au/emerging-as-a-leader-with-the-student-mentor-program/',
-    'https://www.swinburneonline.edu.au/new-educational-requirements-for-financial-planners/',
-    'https://www.swinburneonline.edu.au/inspiring-story-kates-life-learning-the-juggling-act/',
-    'https://www.swinburneonline.edu.au/tips-for-women-to-start-a-career-change/',
-    'https://www.swinburneonline.edu.au/making-a-new-years-resolution-that-sticks/',
-    'https://www.swinburneonline.edu.au/what-is-an-undergraduate-degree/',
-    'https://www.swinburneonline.edu.au/what-to-consider-when-choosing-a-postgraduate-degree/',
-    'https://www.swinburneonline.edu.au/how-keep-top-your-study-load-whilst-living-overseas/',
-    'https://www.swinburneonline.edu.au/new-years-resolution-planner/',
-    'https://www.swinburneonline.edu.au/keep-your-kids-busy-so-you-can-keep-studying/',
-    'https://www.swinburneonline.edu.au/why-introverts-thrive-online-learning-environments/',
-    'https://www.swinburneonline.edu.au/get-ahead-financial-planning-degree/',
-    'https://www.swinburneonline.edu.au/top-tips-from-our-graduates/',
-    'https://www.swinburneonline.edu.au/5-tips-for-graduates-on-the-job-hunt/',
-    'https://www.swinburneonline.edu.au/skills-gained-project-management/',
-    'https://www.swinburneonline.edu.au/mba-management-leadership-roles/',
-    'https://www.swinburneonline.edu.au/career-ready-criminal-justice/',
-    'https://www.swinburneonline.edu.au/how-curiosity-can-fuel-creativity/',
-    'https://www.swinburneonline.edu.au/why-study-a-graduate-diploma-of-project-management/',
-    'https://www.swinburneonline.edu.au/communicate-more-clearly-these-four-tips/',
-    'https://www.swinburneonline.edu.au/lets-get-started-with-online-study/',
-    'https://www.swinburneonline.edu.au/my-pandemic-study-story-rachelle/',
-    'https://www.swinburneonline.edu.au/improve-productivity-25-minutes/',
-    'https://www.swinburneonline.edu.au/enhancing-your-career-easy-listening/',
-    'https://www.swinburneonline.edu.au/how-to-make-your-resume-stand-out/',
-    'https://www.swinburneonline.edu.au/how-to-start-studying-online/',
-    'https://www.swinburneonline.edu.au/living-dubai-studying-australian-degree/',
-    'https://www.swinburneonline.edu.au/new-vet-study-model/',
-    'https://www.swinburneonline.edu.au/gain-ict-industry-experience/',
-    'https://www.swinburneonline.edu.au/volunteer-work-inspires-online-student/',
-    'https://www.swinburneonline.edu.au/online-tafe-university/',
-    'https://www.swinburneonline.edu.au/the-flexibility-of-completing-a-masters-degree-abroad/',
-    'https://www.swinburneonline.edu.au/gearing-life-after-rugby/',
-    'https://www.swinburneonline.edu.au/taking-the-next-step-alice-springs-to-bright/',
-    'https://www.swinburneonline.edu.au/swinburne-onlines-first-connections-event/',
-    'https://www.swinburneonline.edu.au/graduate-compares-online-and-on-campus-study/',
-    'https://www.swinburneonline.edu.au/meet-the-team-assessors/',
-    'https://www.swinburneonline.edu.au/lew-jenkins-award-recipient-for-the-highest-score-in-auditing-beth-opens-up-about-the-commitment-underlying-her-online-study-success/',
-    'https://www.swinburneonline.edu.au/why-you-should-study-a-business-management-degree/',
-    'https://www.swinburneonline.edu.au/podcasts-to-enhance-your-learning/',
-    'https://www.swinburneonline.edu.au/how-to-maintain-a-healthy-routine-during-times-of-disruption/',
-    'https://www.swinburneonline.edu.au/your-online-study-essentials/',
-    'https://www.swinburneonline.edu.au/top-interview-tips/',
-    'https://www.swinburneonline.edu.au/career-experience-built-into-law-degree/',
-    'https://www.swinburneonline.edu.au/how-vr-technology-is-preparing-pre-service-teachers-for-the-classroom/',
-    'https://www.swinburneonline.edu.au/swinburne-online-launches-new-mobile-app/',
-    'https://www.swinburneonline.edu.au/studying-psychology-snowy-mountains/',
-    'https://www.swinburneonline.edu.au/career-change-insurance-teaching/',
-    'https://www.swinburneonline.edu.au/career-change-from-accountant-to-teacher/',
-    'https://www.swinburneonline.edu.au/common-online-study-myths/',
-    'https://www.swinburneonline.edu.au/create-productive-home-study-space/',
-    'https://www.swinburneonline.edu.au/dynamic-learning-community/',
-    'https://www.swinburneonline.edu.au/becoming-a-classroom-music-teacher/',
-    'https://www.swinburneonline.edu.au/the-benefits-of-online-study/',
-    'https://www.swinburneonline.edu.au/graduating-your-mum/',
-    'https://www.swinburneonline.edu.au/gain-valuable-support-with-the-student-mentor-program/',
-    'https://www.swinburneonline.edu.au/recipe-success/',
-    'https://www.swinburneonline.edu.au/how-re-enter-workforce/',
-    'https://www.swinburneonline.edu.au/super-mum-studies-on-the-move/',
-    'https://www.swinburneonline.edu.au/career-change-acting-psychology/',
-    'https://www.swinburneonline.edu.au/make-friends-studying-online/',
-    'https://www.swinburneonline.edu.au/getting-back-into-the-workforce-with-online-study/',
-    'https://www.swinburneonline.edu.au/psychology-student-marks-study-tips-for-stressful-times/',
-    'https://www.swinburneonline.edu.au/manage-time-study-planner/',
-    'https://www.swinburneonline.edu.au/top-10-quick-recipes-for-time-poor-students/',
-    'https://www.swinburneonline.edu.au/micro-units-explained-bite-sized-future-focused-learning/',
-    'https://www.swinburneonline.edu.au/roi-your-university-degree/',
-    'https://www.swinburneonline.edu.au/advancing-career-early-childhood-education/',
-    'https://www.swinburneonline.edu.au/a-pressing-need-for-cybersecurity-leadership-in-australia-and-abroad-2/',
-    'https://www.swinburneonline.edu.au/three-exercises-combat-stress/',
-    'https://www.swinburneonline.edu.au/athlete-spotlight-matildas-star-stephanie-catley/',
-    'https://www.swinburneonline.edu.au/q-visiting-quarantine-cemetery-north-head/',
-    'https://www.swinburneonline.edu.au/upskill-from-anywhere-with-online-study/',
-    'https://www.swinburneonline.edu.au/use-your-diploma-as-a-pathway-to-your-degree/',
-    'https://www.swinburneonline.edu.au/tips-boosting-your-creativity/',
-    'https://www.swinburneonline.edu.au/how-social-science-degree-prepares-post-covid-world/',
-    'https://www.swinburneonline.edu.au/applying-social-science-course-content-in-your-career/',
-    'https://www.swinburneonline.edu.au/best-apps-for-studying/',
-    'https://www.swinburneonline.edu.au/career-opportunities-through-media-communications-degree/',
-    'https://www.swinburneonline.edu.au/careers-expo-career-development-with-online-study/',
-    'https://www.swinburneonline.edu.au/education-a-home-run-for-future-focused-athletes/',
-    'https://www.swinburneonline.edu.au/future-communication-jobs/',
-    'https://www.swinburneonline.edu.au/guide-to-careers-in-logistics-and-supply-chain-management/',
-    'https://www.swinburneonline.edu.au/how-get-job-creative-industries/',
-    'https://www.swinburneonline.edu.au/how-stay-motivated-during-exams/',
-    'https://www.swinburneonline.edu.au/how-study-more-effectively/',
-    'https://www.swinburneonline.edu.au/how-studying-online-sets-you-up-for-remote-work-in-the-future/',
-    'https://www.swinburneonline.edu.au/how-to-maintain-your-studies-over-the-break/',
-    'https://www.swinburneonline.edu.au/improve-your-cover-letter/',
-    'https://www.swinburneonline.edu.au/introducing-swinburne-student-life/',
-    'https://www.swinburneonline.edu.au/iq-vs-eq-which-more-important/',
-    'https://www.swinburneonline.edu.au/keeping-evolution-job-interviews/',
-    'https://www.swinburneonline.edu.au/learning-experience-manager/',
-    'https://www.swinburneonline.edu.au/online-study-and-life-commitments-maryanns-story/',
-    'https://www.swinburneonline.edu.au/prioritising-people-the-key-to-a-successful-business/',
-    'https://www.swinburneonline.edu.au/student-stories-design-student-melinda/',
-    'https://www.swinburneonline.edu.au/studying-from-the-emerald-isle/',
-    'https://www.swinburneonline.edu.au/tech-support-online-students/',
-    'https://www.swinburneonline.edu.au/time-saving-tips-online-students/',
-    'https://www.swinburneonline.edu.au/top-five-tips-rebuild-study-motivation/',
-    'https://www.swinburneonline.edu.au/upskill-while-you-work-with-a-diploma/',
-    'https://www.swinburneonline.edu.au/time-management-busy-parents/',
-    'https://www.swinburneonline.edu.au/job-interview-tips/',
-    'https://www.swinburneonline.edu.au/swinburne-online-launches-bachelor-of-ict/',
-    'https://www.swinburneonline.edu.au/effective-cybersecurity-risk-management-comes-from-the-top/',
-    'https://www.swinburneonline.edu.au/cybersecurity-professionals-fighting-online-crime/',
-    'https://www.swinburneonline.edu.au/redefining-the-cybersecurity-playing-field/',
-    'https://www.swinburneonline.edu.au/untangling-terms-swinburne-online-glossary/',
-    'https://www.swinburneonline.edu.au/study-breaks-fight-study-fatigue/',
-    'https://www.swinburneonline.edu.au/psychology-understanding-human-behaviour/',
-    'https://www.swinburneonline.edu.au/quick-study-tips-setting-goals/',
-    'https://www.swinburneonline.edu.au/graduate-diploma-psychology-career/',
-    'https://www.swinburneonline.edu.au/study-focus-tips/',
-    'https://www.swinburneonline.edu.au/dream-career-online-study/',
-    'https://www.swinburneonline.edu.au/careers-in-criminology-and-criminal-justice/',
-    'https://www.swinburneonline.edu.au/online-study-success-stories/',
-    'https://www.swinburneonline.edu.au/skills-needed-career-psychology/',
-    'https://www.swinburneonline.edu.au/careers-media-communication/',
-    'https://www.swinburneonline.edu.au/best-budgeting-apps-for-students/',
-    'https://www.swinburneonline.edu.au/why-study-a-graduate-certificate-or-graduate-diploma/',
-    'https://www.swinburneonline.edu.au/master-teaching-secondary-school-teachers/',
-    'https://www.swinburneonline.edu.au/psychology-technology-future/',
-    'https://www.swinburneonline.edu.au/workplace-ready-business-degree/',
-    'https://www.swinburneonline.edu.au/bachelor-education-teaching-journey/',
-    'https://www.swinburneonline.edu.au/online-bootcamps-career-skill-graduate-certificates/',
-    'https://www.swinburneonline.edu.au/benefits-studying-with-pet/',
-    'https://www.swinburneonline.edu.au/tips-focus-study-tasks/',
-    'https://www.swinburneonline.edu.au/career-change-best-careers-future/',
-    'https://www.swinburneonline.edu.au/study-online-bachelor-psychological-sciences/',
-    'https://www.swinburneonline.edu.au/millennial-nab-manager-chooses-online-study/',
-    'https://www.swinburneonline.edu.au/meet-swinburne-online-media-studies-student-alice/',
-    'https://www.swinburneonline.edu.au/online-management-student-thrives-in-new-career/',
-    'https://www.swinburneonline.edu.au/changing-careers-from-finance-to-teaching/',
-    'https://www.swinburneonline.edu.au/not-your-average-mba-student/',
-    'https://www.swinburneonline.edu.au/marnies-big-move-from-insurance-to-primary-teaching/',
-    'https://www.swinburneonline.edu.au/singing-teacher-follows-her-passion-with-postgraduate-study/',
-    'https://www.swinburneonline.edu.au/qualities-of-communication-officer/',
-    'https://www.swinburneonline.edu.au/business-management-vs-business-administration/',
-    'https://www.swinburneonline.edu.au/study-gifts-online-students/',
-    'https://www.swinburneonline.edu.au/best-study-snacks-melbourne/',
-    'https://www.swinburneonline.edu.au/workforce-ready-with-online-study/',
-    'https://www.swinburneonline.edu.au/how-to-become-a-ceo-in-australia/',
-    'https://www.swinburneonline.edu.au/financial-planner-vs-financial-advisor/',
-    'https://www.swinburneonline.edu.au/what-jobs-can-you-do-with-a-business-degree/',
-    'https://www.swinburneonline.edu.au/how-to-finance-your-masters-degree/',
-    'https://www.swinburneonline.edu.au/degree-you-need-to-start-a-business/',
-    'https://www.swinburneonline.edu.au/how-to-become-an-accountant/',
-    'https://www.swinburneonline.edu.au/postgraduate-study-first-degree/',
-    'https://www.swinburneonline.edu.au/how-to-do-a-masters-without-a-degree/',
-    'https://www.swinburneonline.edu.au/types-of-business-degrees/',
-    'https://www.swinburneonline.edu.au/effective-leadership-management-skills/',
-    'https://www.swinburneonline.edu.au/mba-benefits-while-working-full-time/',
-    'https://www.swinburneonline.edu.au/how-to-become-professional-in-early-childhood-education/',
-    'https://www.swinburneonline.edu.au/career-path-for-administration-jobs/',
-    'https://www.swinburneonline.edu.au/how-to-ask-for-a-promotion/',
-    'https://www.swinburneonline.edu.au/three-things-know-about-hecs-help/',
-    'https://www.swinburneonline.edu.au/supportive-community/',
-    'https://www.swinburneonline.edu.au/super-quick-study-tips-busy-parents/',
-    'https://www.swinburneonline.edu.au/outcome-focused/',
-    'https://www.swinburneonline.edu.au/online-classroom-2/',
-    'https://www.swinburneonline.edu.au/assignment-support-resources-available-to-you/',
-    'https://www.swinburneonline.edu.au/melbournes-best-study-spots/',
-    'https://www.swinburneonline.edu.au/taking-the-hassle-out-of-referencing/',
-    'https://www.swinburneonline.edu.au/problem-solving-in-the-programming-industry/',
-    'https://www.swinburneonline.edu.au/the-impact-of-communication-professionals-in-global-business/',
-    'https://www.swinburneonline.edu.au/into-the-wild-exploring-adventure-therapy-and-ecopsychology-careers-in-the-australian-outdoors/',
-    'https://www.swinburneonline.edu.au/all-you-need-to-know-about-becoming-a-mental-health-support-worker-in-ustralia/',
-    'https://www.swinburneonline.edu.au/beyond-the-couch-exploring-alternative-psychology-career-paths-in-australia/',
-    'https://www.swinburneonline.edu.au/should-i-become-a-primary-school-teacher/',
-    'https://www.swinburneonline.edu.au/primary-school-teacher-complete-guide/',
-    'https://www.swinburneonline.edu.au/5-reasons-why-you-should-become-a-primary-teacher/',
-    'https://www.swinburneonline.edu.au/what-career-opportunities-are-there-in-early-childhood-education/',
-    'https://www.swinburneonline.edu.au/the-benefits-of-studying-early-childhood-education/',
-    'https://www.swinburneonline.edu.au/linkedin-tips/',
-    'https://www.swinburneonline.edu.au/tips-maintaining-mental-health/',
-    'https://www.swinburneonline.edu.au/playlists-for-exam-preparation/',
-    'https://www.swinburneonline.edu.au/a-network-technology-degree-5-skills-employers-cant-resist/',
-    'https://www.swinburneonline.edu.au/the-mind-matters/',
-    'https://www.swinburneonline.edu.au/journalism-vs-communication-choosing-your-path-in-2024/',
-    'https://www.swinburneonline.edu.au/your-2024-guide-to-success-in-media-communication/',
-    'https://www.swinburneonline.edu.au/the-future-of-psychology-exciting-career-pathways/',
-    'https://www.swinburneonline.edu.au/your-guide-to-school-counselling-with-swinburne-onlines-psychology-courses/',
-    'https://www.swinburneonline.edu.au/career-change-guide-for-teaching/',
-    'https://www.swinburneonline.edu.au/how-to-decide-what-subject-to-teach/',
-    'https://www.swinburneonline.edu.au/difference-between-primary-and-secondary-teaching/',
-    'https://www.swinburneonline.edu.au/study-habits-study-schedule/',
-    'https://www.swinburneonline.edu.au/help-support-online-learning-advisors/',
-    'https://www.swinburneonline.edu.au/new-online-advertising-major-taught-industry/',
-    'https://www.swinburneonline.edu.au/graduate-spotlight-my-journey-becoming-teacher/',
-    'https://www.swinburneonline.edu.au/my-olympic-experience/',
-    'https://www.swinburneonline.edu.au/taught-by-experts/',
-    'https://www.swinburneonline.edu.au/married-couple-studies-same-degree/',
-    'https://www.swinburneonline.edu.au/how-maintain-gold-star-streak-while-studying-online/',
-    'https://www.swinburneonline.edu.au/real-world-experiences-bring-learning-life/',
-    'https://www.swinburneonline.edu.au/cold-case-exploration-with-swinburne-online/',
-    'https://www.swinburneonline.edu.au/get-exam-ready/',
-    'https://www.swinburneonline.edu.au/meet-your-online-tutors/',
-    'https://www.swinburneonline.edu.au/preparing-teachers-placement-support/',
-    'https://www.swinburneonline.edu.au/how-to-become-a-financial-advisor/',
-    'https://www.swinburneonline.edu.au/tips-for-a-career-change/',
-    'https://www.swinburneonline.edu.au/swinburne-online-media-communication-degree/',
-    'https://www.swinburneonline.edu.au/the-benefits-of-a-bachelor-of-information-and-communication-technology-in-australia/',
-    'https://www.swinburneonline.edu.au/curious-minds-are-a-force-for-change-want-to-know-why/',
-    'https://www.swinburneonline.edu.au/how-you-can-get-more-out-of-your-law-degree/',
-    'https://www.swinburneonline.edu.au/father-two-returns-study/',
-    'https://www.swinburneonline.edu.au/why-postgraduate-study-with-swinburne-online-is-right-for-you/',
-    'https://www.swinburneonline.edu.au/humans-of-swinburne-online-coreys-story/',
-    'https://www.swinburneonline.edu.au/humans-of-swinburne-online-marks-story/',
-    'https://www.swinburneonline.edu.au/humans-of-swinburne-online-allys-story/',
-    'https://www.swinburneonline.edu.au/how-to-choose-a-career-thats-right-for-you/',
-    'https://www.swinburneonline.edu.au/humans-of-swinburne-online-traceys-story/',
-    'https://www.swinburneonline.edu.au/humans-of-swinburne-online-amberleys-story/',
-    'https://www.swinburneonline.edu.au/humans-of-swinburne-online-genevieves-story/',
-    'https://www.swinburneonline.edu.au/humans-of-swinburne-online-minas-story/',
-    'https://www.swinburneonline.edu.au/humans-of-swinburne-online-kathryns-story/',
-    'https://www.swinburneonline.edu.au/humans-of-swinburne-online-kates-story/',
-    'https://www.swinburneonline.edu.au/humans-of-swinburne-online-nialls-story/',
-    'https://www.swinburneonline.edu.au/what-course-should-i-do/',
-    'https://www.swinburneonline.edu.au/transferable-customer-service-skills/',
-    'https://www.swinburneonline.edu.au/why-study-business/',
-    'https://www.swinburneonline.edu.au/vet-to-higher-education/',
-    'https://www.swinburneonline.edu.au/humans-of-swinburne-online-graces-story/',
-    'https://www.swinburneonline.edu.au/humans-of-swinburne-online-annabelles-story/',
-    'https://www.swinburneonline.edu.au/humans-of-swinburne-online-justins-story/',
-    'https://www.swinburneonline.edu.au/humans-of-swinburne-online-chelseas-story/',
-    'https://www.swinburneonline.edu.au/humans-of-swinburne-online-marisas-story/',
-    'https://www.swinburneonline.edu.au/',
-    'https://www.swinburneonline.edu.au/bootcamp-graduate-certificate/',
-    'https://www.swinburneonline.edu.au/education-setting-resource-centre/placement-information/',
-    'https://www.swinburneonline.edu.au/education-setting-resource-centre/resources/build-your-mind-map/',
-    'https://www.swinburneonline.edu.au/how-guides/how-work-video/uploading-videos-your-computer/',
-    'https://www.swinburneonline.edu.au/how-guides/how-work-video/',
-    'https://www.swinburneonline.edu.au/how-guides/how-work-video/recording-video-on-your-computer-webcam/',
-    'https://www.swinburneonline.edu.au/how-guides/how-work-video/transferring-video-camera-usb-pc-mac/',
-    'https://www.swinburneonline.edu.au/how-guides/how-work-video/recording-video-on-your-computers-webcam-pc-swinburne-online/',
-    'https://www.swinburneonline.edu.au/how-guides/how-work-video/recording-video-smartphonetablet-or-digital-camera/',
-    'https://www.swinburneonline.edu.au/how-guides/how-record-and-share-audio-soundcloud/uploading-audio/',
-    'https://www.swinburneonline.edu.au/how-guides/how-record-and-share-audio-soundcloud/how-record-and-share-audio-soundcloud-sharing-your-audio/',
-    'https://www.swinburneonline.edu.au/how-guides/how-record-and-share-audio-soundcloud/recording-audio/',
-    'https://www.swinburneonline.edu.au/how-guides/how-record-and-share-audio-soundcloud/how-record-and-share-audio-soundcloud-sign-soundcloud/',
-    'https://www.swinburneonline.edu.au/how-guides/how-create-group-presentations-prezi/log-prezi/',
-    'https://www.swinburneonline.edu.au/how-guides/how-create-group-presentations-prezi/sign-up-for-prezi/',
-    'https://www.swinburneonline.edu.au/how-guides/how-create-group-presentations-prezi/share-your-prezi/',
-    'https://www.swinburneonline.edu.au/how-guides/how-create-group-presentations-prezi/add-content-your-prezi/',
-    'https://www.swinburneonline.edu.au/how-guides/how-create-group-presentations-prezi/collaborate-prezi/',
-    'https://www.swinburneonline.edu.au/how-guides/how-create-group-presentations-prezi/create-prezi/',
-    'https://www.swinburneonline.edu.au/how-guides/mindmapping-bubbleus/',
-    'https://www.swinburneonline.edu.au/how-guides/mindmapping-bubbleus/share-your-mind-map/',
-    'https://www.swinburneonline.edu.au/how-guides/mindmapping-bubbleus/signup-and-create-your-first-mindmap/',
-    'https://www.swinburneonline.edu.au/how-guides/mindmapping-bubbleus/create-your-first-mind-map/',
-    'https://www.swinburneonline.edu.au/how-guides/how-create-assessment-folio-evernote/install-webclipper/',
-    'https://www.swinburneonline.edu.au/how-guides/how-create-assessment-folio-evernote/sign/',
-    'https://www.swinburneonline.edu.au/how-guides/how-create-assessment-folio-evernote/build-your-folio-browser/',
-    'https://www.swinburneonline.edu.au/how-guides/how-create-assessment-folio-evernote/build-your-folio-android-device/',
-    'https://www.swinburneonline.edu.au/how-guides/how-create-assessment-folio-evernote/build-your-folio-ios-iphoneipad-device/',
-    'https://www.swinburneonline.edu.au/how-guides/how-create-assessment-folio-evernote/your-folio-getting-started/',
-    'https://www.swinburneonline.edu.au/how-guides/how-create-narrated-powerpoint-presentation/export-your-presentation-video/',
-    'https://www.swinburneonline.edu.au/how-guides/how-create-narrated-powerpoint-presentation/record-your-narration/',
-    'https://www.swinburneonline.edu.au/how-guides/how-use-tumblr/exploring-tumblr/',
-    'https://www.swinburneonline.edu.au/how-guides/how-use-tumblr/editing-and-deleting-tumblr-posts/',
-    'https://www.swinburneonline.edu.au/how-guides/how-use-tumblr/how-sign-and-create-your-tumblr-blog/',
-    'https://www.swinburneonline.edu.au/how-guides/how-use-tumblr/get-social/',
-    'https://www.swinburneonline.edu.au/how-guides/how-use-tumblr/posting-your-blog/',
-    'https://www.swinburneonline.edu.au/how-guides/how-use-tumblr/customise-look-your-blog/',
-    'https://www.swinburneonline.edu.au/how-guides/how-use-tumblr/your-tumblr-dashboard/',
-    'https://www.swinburneonline.edu.au/how-guides/how-use-tumblr/creating-additional-blogs/',
-    'https://www.swinburneonline.edu.au/how-guides/how-create-narrated-powerpoint-presentation/',
-    'https://www.swinburneonline.edu.au/how-guides/how-use-tumblr/',
-    'https://www.swinburneonline.edu.au/how-guides/how-create-assessment-folio-evernote/',
-    'https://www.swinburneonline.edu.au/fees/fee-assistance/',
-    'https://www.swinburneonline.edu.au/apply/credit-transfers/',
-    'https://www.swinburneonline.edu.au/apply/certification-documents/',
-    'https://www.swinburneonline.edu.au/bachelor-education-primary/',
-    'https://www.swinburneonline.edu.au/combine/',
-    'https://www.swinburneonline.edu.au/current-students/current-student-support/',
-    'https://www.swinburneonline.edu.au/policies/feedback-complaints/',
-    'https://www.swinburneonline.edu.au/contact-us/teamviewer/',
-    'https://www.swinburneonline.edu.au/future-students/future-students-update-your-skills/',
-    'https://www.swinburneonline.edu.au/about-us/media-centre/media-releases/online-students-head-canberra/',
-    'https://www.swinburneonline.edu.au/about-us/media-centre/media-releases/calling-australias-future-security-corps/',
-    'https://www.swinburneonline.edu.au/future-students/graduation-beyond/',
-    'https://www.swinburneonline.edu.au/study-planner/',
-    'https://www.swinburneonline.edu.au/careers/latest-role-opportunities/',
-    'https://www.swinburneonline.edu.au/current-students/myquest/',
-    'https://www.swinburneonline.edu.au/support/university-student-support/assignment-assistance/',
-    'https://www.swinburneonline.edu.au/how-guides/how-create-group-presentations-prezi/rearrange-order-your-prezi/',
-    'https://www.swinburneonline.edu.au/policies/enrolment-policies/',
-    'https://www.swinburneonline.edu.au/policies/information-packs/',
-    'https://www.swinburneonline.edu.au/policies/internal-course-transfer/',
-    'https://www.swinburneonline.edu.au/submission-professional-portfolio/',
-    'https://www.swinburneonline.edu.au/single-units/studying-a-single-unit/',
-    'https://www.swinburneonline.edu.au/future-students/future-students-advance-your-career/',
-    'https://www.swinburneonline.edu.au/future-students/graduation-beyond/beyond-alumni-resources/',
-    'https://www.swinburneonline.edu.au/future-students/study-outcomes/find-job/',
-    'https://www.swinburneonline.edu.au/future-students/study-outcomes/',
-    'https://www.swinburneonline.edu.au/future-students/',
-    'https://www.swinburneonline.edu.au/future-students/graduation-beyond/grade-point-average/',
-    'https://www.swinburneonline.edu.au/current-students/help/',
-    'https://www.swinburneonline.edu.au/current-students/australian-citizens-studying-overseas/',
-    'https://www.swinburneonline.edu.au/education-setting-resource-centre/feedback-form/',
-    'https://www.swinburneonline.edu.au/flexibility/',
-    'https://www.swinburneonline.edu.au/short-courses/faqs-micro-units/',
-    'https://www.swinburneonline.edu.au/short-courses/professional-development-courses/faqs-professional-development-courses/',
-    'https://www.swinburneonline.edu.au/about-us/media-centre/media-releases/',
-    'https://www.swinburneonline.edu.au/policies/refund-rules/',
-    'https://www.swinburneonline.edu.au/student-login/',
-    'https://www.swinburneonline.edu.au/master-teaching-primary/',
-    'https://www.swinburneonline.edu.au/national-priority-courses/',
-    'https://www.swinburneonline.edu.au/hub/',
-    'https://www.swinburneonline.edu.au/policies/recruitment-agent-agreements/',
-    'https://www.swinburneonline.edu.au/current-students/vet-student-support/',
-    'https://www.swinburneonline.edu.au/policies/withdrawing-your-course/',
-    'https://www.swinburneonline.edu.au/about-us/media-centre/media-releases/swinburne-online-welcomes-focus-innovation-and/',
-    'https://www.swinburneonline.edu.au/how-online-study-works/',
-    'https://www.swinburneonline.edu.au/about-us/media-centre/media-releases/online-students-win-university-wide-video/',
-    'https://www.swinburneonline.edu.au/about-us/media-centre/media-releases/learn-teach-swinburne-online/',
-    'https://www.swinburneonline.edu.au/about-us/media-centre/media-releases/100-years-excellence-swinburne/',
-    'https://www.swinburneonline.edu.au/fees/vet-student-loans/',
-    'https://www.swinburneonline.edu.au/how-guides/how-record-and-share-audio-soundcloud/',
-    'https://www.swinburneonline.edu.au/about-us/media-centre/media-releases/swinburne-online-celebrates-three-years/',
-    'https://www.swinburneonline.edu.au/about-us/media-centre/media-releases/study-at-a-leadin-australian-university-in-your-home-country/',
-    'https://www.swinburneonline.edu.au/about-us/media-centre/media-releases/swinburne-online-launches-first-advertising-degree/',
-    'https://www.swinburneonline.edu.au/linkedin-learning/',
-    'https://www.swinburneonline.edu.au/policies-student-charter-and-netiquette/',
-    'https://www.swinburneonline.edu.au/alicia-molik/',
-    'https://www.swinburneonline.edu.au/support/student-benefits/swinburne-emerging-leaders-award/',
-    'https://www.swinburneonline.edu.au/future-students/graduation-beyond/graduation/',
-    'https://www.swinburneonline.edu.au/support/student-benefits/indigenous-programs/',
-    'https://www.swinburneonline.edu.au/support/student-benefits/support-student-benefits-study-loans/',
-    'https://www.swinburneonline.edu.au/apply/how-apply/',
-    'https://www.swinburneonline.edu.au/support/counselling/',
-    'https://www.swinburneonline.edu.au/about-us/media-centre/media-releases/7-fascinating-ways-music-can-affect-your-emotions/',
-    'https://www.swinburneonline.edu.au/how-guides/how-write-essay/',
-    'https://www.swinburneonline.edu.au/about-us/media-centre/media-releases/swinburne-online-alumni-grow-graduation/',
-    'https://www.swinburneonline.edu.au/how-guides/how-use-tumblr/choosing-and-customising-theme/',
-    'https://www.swinburneonline.edu.au/sa-government-schools-claim-payment/',
-    'https://www.swinburneonline.edu.au/about-us/media-centre/media-releases/study-ski-study-repeat/',
-    'https://www.swinburneonline.edu.au/policies/assessment-appeals/',
-    'https://www.swinburneonline.edu.au/support/student-benefits/swinburne-student-life-2/',
-    'https://www.swinburneonline.edu.au/support/student-benefits/swinburne-abroad/',
-    'https://www.swinburneonline.edu.au/support/student-benefits/swinburne-student-life/',
-    'https://www.swinburneonline.edu.au/support/student-benefits/',
-    'https://www.swinburneonline.edu.au/exam-materials-submission/',
-    'https://www.swinburneonline.edu.au/careers/latest-role-opportunities/student-advisors/',
-    'https://www.swinburneonline.edu.au/your-results/',
-    'https://www.swinburneonline.edu.au/about-us/swinburne-university/',
-    'https://www.swinburneonline.edu.au/about-us/media-centre/',
-    'https://www.swinburneonline.edu.au/admissions-at-swinburne/',
-    'https://www.swinburneonline.edu.au/alumni-network-resources/',
-    'https://www.swinburneonline.edu.au/study-journey/virtual-classroom/',
-    'https://www.swinburneonline.edu.au/placement-payment-claim-form/',
-    'https://www.swinburneonline.edu.au/placement-feedback/',
-    'https://www.swinburneonline.edu.au/international-students/entry-requirements/',
-    'https://www.swinburneonline.edu.au/international-students/english-language-requirements/',
-    'https://www.swinburneonline.edu.au/calendar/',
-    'https://www.swinburneonline.edu.au/support/university-student-support/support-team/',
-    'https://www.swinburneonline.edu.au/about-us/our-team/',
-    'https://www.swinburneonline.edu.au/how-guides/how-create-group-presentations-prezi/',
-    'https://www.swinburneonline.edu.au/flexible-study/',
-    'https://www.swinburneonline.edu.au/application-form-thank-you/',
-    'https://www.swinburneonline.edu.au/bachelor-education-early-childhood/',
-    'https://www.swinburneonline.edu.au/become-standout-graduate/',
-    'https://www.swinburneonline.edu.au/careers/',
-    'https://www.swinburneonline.edu.au/contact-us/request-information/',
-    'https://www.swinburneonline.edu.au/enquiry/',
-    'https://www.swinburneonline.edu.au/experience-better-education/',
-    'https://www.swinburneonline.edu.au/graduate-diploma-of-psychology-advanced-application/',
-    'https://www.swinburneonline.edu.au/how-guides/',
-    'https://www.swinburneonline.edu.au/ineligible-for-free-tafe/',
-    'https://www.swinburneonline.edu.au/international-eligibility/',
-    'https://www.swinburneonline.edu.au/make-playlist-presentation/',
-    'https://www.swinburneonline.edu.au/micro-units-thank-you/',
-    'https://www.swinburneonline.edu.au/next-level-business/',
-    'https://www.swinburneonline.edu.au/our-graduates/',
-    'https://www.swinburneonline.edu.au/placement-education-setting/',
-    'https://www.swinburneonline.edu.au/policies/',
-    'https://www.swinburneonline.edu.au/professional-experience-partnerships/',
-    'https://www.swinburneonline.edu.au/professional-experience-partnerships/faqs/',
-    'https://www.swinburneonline.edu.au/record-presentation/',
-    'https://www.swinburneonline.edu.au/request-for-extension-of-time-to-complete-course/',
-    'https://www.swinburneonline.edu.au/same-qualification-campus-students/',
-    'https://www.swinburneonline.edu.au/short-courses/',
-    'https://www.swinburneonline.edu.au/six-word-scholarship/',
-    'https://www.swinburneonline.edu.au/study-journey/enrolment/',
-    'https://www.swinburneonline.edu.au/study-journey/student-advisors/',
-    'https://www.swinburneonline.edu.au/study-journey/student-hub/',
-    'https://www.swinburneonline.edu.au/terms-use/',
-    'https://www.swinburneonline.edu.au/thank-you-for-booking-a-call/',
-    'https://www.swinburneonline.edu.au/webforms/',
-    'https://www.swinburneonline.edu.au/webforms/ela/',
-    'https://www.swinburneonline.edu.au/webforms/ela/webforms-ela-bulk_results_amen-php/',
-    'https://www.swinburneonline.edu.au/why-us/',
-    'https://www.swinburneonline.edu.au/single-units/',
-    'https://www.swinburneonline.edu.au/ready-for-more/',
-    'https://www.swinburneonline.edu.au/short-courses/micro-units/',
-    'https://www.swinburneonline.edu.au/international-students/',
-    'https://www.swinburneonline.edu.au/compare-courses-tool/',
-    'https://www.swinburneonline.edu.au/apply/what-type-student-am-i/',
-    'https://www.swinburneonline.edu.au/fees/additional-fee-information/',
-    'https://www.swinburneonline.edu.au/fees/hecs-help/',
-    'https://www.swinburneonline.edu.au/about-us/',
-    'https://www.swinburneonline.edu.au/future-students/graduation-beyond/employment-statistics/',
-    'https://www.swinburneonline.edu.au/international-students/international-course-fees/',
-    'https://www.swinburneonline.edu.au/fees/fraser-foundation-scholarship/',
-    'https://www.swinburneonline.edu.au/technology-requirements-bachelor-design/',
-    'https://www.swinburneonline.edu.au/bachelor-education-studies/',
-    'https://www.swinburneonline.edu.au/goal-getters/',
-    'https://www.swinburneonline.edu.au/enrolment-terms-and-conditions/',
-    'https://www.swinburneonline.edu.au/eligibility-checker/',
-    'https://www.swinburneonline.edu.au/call-arnold/',
-    'https://www.swinburneonline.edu.au/call-jake/',
-    'https://www.swinburneonline.edu.au/call-hayley/',
-    'https://www.swinburneonline.edu.au/call-jakob/',
-    'https://www.swinburneonline.edu.au/call-shelton/',
-    'https://www.swinburneonline.edu.au/call-stephen/',
-    'https://www.swinburneonline.edu.au/call-taylor/',
-    'https://www.swinburneonline.edu.au/call-alexandra/',
-    'https://www.swinburneonline.edu.au/call-michael/',
-    'https://www.swinburneonline.edu.au/call-nicholas/',
-    'https://www.swinburneonline.edu.au/call-cloyd/',
-    'https://www.swinburneonline.edu.au/call-bridgett/',
-    'https://www.swinburneonline.edu.au/call-shane/',
-    'https://www.swinburneonline.edu.au/call-valentina/',
-    'https://www.swinburneonline.edu.au/call-rhys/',
-    'https://www.swinburneonline.edu.au/contact-us/request-information/thank-you/',
-    'https://www.swinburneonline.edu.au/thanks-master-teaching-secondary/',
-    'https://www.swinburneonline.edu.au/apply-complete/',
-    'https://www.swinburneonline.edu.au/book-a-call/',
-    'https://www.swinburneonline.edu.au/call-sebastian/',
-    'https://www.swinburneonline.edu.au/education-setting-resource-centre/assessments/',
-    'https://www.swinburneonline.edu.au/education-setting-resource-centre/frequently-asked-questions/',
-    'https://www.swinburneonline.edu.au/education-setting-resource-centre/how-placements-work/',
-    'https://www.swinburneonline.edu.au/education-setting-resource-centre/centre-claim-payment-0/',
-    'https://www.swinburneonline.edu.au/education-setting-resource-centre/',
-    'https://www.swinburneonline.edu.au/education-setting-resource-centre/support/',
-    'https://www.swinburneonline.edu.au/thank-you-for-registering-your-interest/',
-    'https://www.swinburneonline.edu.au/skillsrecognitionpathway-education/',
-    'https://www.swinburneonline.edu.au/seek/',
-    'https://www.swinburneonline.edu.au/contact-us/request-information/thank-you-rpl/',
-    'https://www.swinburneonline.edu.au/thank-you-enrolment/',
-    'https://www.swinburneonline.edu.au/call-robert/',
-    'https://www.swinburneonline.edu.au/call-yusuf/',
-    'https://www.swinburneonline.edu.au/careers/latest-role-opportunities/online-learning-advisor/',
-    'https://www.swinburneonline.edu.au/fees/',
-    'https://www.swinburneonline.edu.au/contact-us/request-information/complete/',
-    'https://www.swinburneonline.edu.au/policies-tafe-withdrawal-policy/',
-    'https://www.swinburneonline.edu.au/future-students/exams/',
-    'https://www.swinburneonline.edu.au/electives/',
-    'https://www.swinburneonline.edu.au/short-courses/professional-development-courses/',
-    'https://www.swinburneonline.edu.au/master-teaching-secondary-apply/',
-    'https://www.swinburneonline.edu.au/how-guides/how-work-video/upload-videos-youtube-smartphone-or-tablet/',
-    'https://www.swinburneonline.edu.au/faqs/',
-    'https://www.swinburneonline.edu.au/contact-us/',
-    'https://www.swinburneonline.edu.au/student-support-services/',
-    'https://www.swinburneonline.edu.au/support/tafe-support/',
-    'https://www.swinburneonline.edu.au/support/tafe-support/health/',
-    'https://www.swinburneonline.edu.au/your-study-journey/student-coaches/',
-    'https://www.swinburneonline.edu.au/study-journey/',
-    'https://www.swinburneonline.edu.au/about-us/our-team/online-learning-advisors/',
-    'https://www.swinburneonline.edu.au/support/',
-    'https://www.swinburneonline.edu.au/support/student-benefits/accessability/',
-    'https://www.swinburneonline.edu.au/support/university-student-support/',
-    'https://www.swinburneonline.edu.au/support/university-student-support/virtual-classroom/',
-    'https://www.swinburneonline.edu.au/support/university-student-support/study-groups/',
-    'https://www.swinburneonline.edu.au/online-courses/',
-    'https://www.swinburneonline.edu.au/key-dates/higher-education-key-dates/',
-    'https://www.swinburneonline.edu.au/education-setting-resource-centre/resources/',
-    'https://www.swinburneonline.edu.au/blog/',
-    'https://www.swinburneonline.edu.au/call-david/',
-    'https://www.swinburneonline.edu.au/support/university-student-support/online-orientation/',
-    'https://www.swinburneonline.edu.au/casper/',
-    'https://www.swinburneonline.edu.au/current-students/',
-    'https://www.swinburneonline.edu.au/learning-success-plan/',
-    'https://www.swinburneonline.edu.au/apply/',
-    'https://www.swinburneonline.edu.au/key-dates/',
-    'https://www.swinburneonline.edu.au/about-us/media-centre/media-releases/remote-workforces-how-keep-your-team-engaged/',
-    'https://www.swinburneonline.edu.au/for-business/',
-    'https://www.swinburneonline.edu.au/key-dates/vet-nursing-key-dates/',
-    'https://www.swinburneonline.edu.au/online-courses/bachelor-of-media-and-communications/',
-    'https://www.swinburneonline.edu.au/online-courses/education-courses/',
-    'https://www.swinburneonline.edu.au/online-courses/information-technology-courses/',
-    'https://www.swinburneonline.edu.au/online-courses/media-and-communication-courses/',
-    'https://www.swinburneonline.edu.au/online-courses/bootcamp-graduate-certificate/',
-    'https://www.swinburneonline.edu.au/online-courses/postgraduate-courses/',
-    'https://www.swinburneonline.edu.au/online-courses/psychology-courses/',
-    'https://www.swinburneonline.edu.au/online-courses/social-science-courses/',
-    'https://www.swinburneonline.edu.au/online-courses/undergraduate-degrees/',
-    'https://www.swinburneonline.edu.au/online-courses/law-courses/',
-    'https://www.swinburneonline.edu.au/online-courses/bachelor-of-business/',
-    'https://www.swinburneonline.edu.au/online-courses/bachelor-of-social-science/',
-    'https://www.swinburneonline.edu.au/online-courses/business-courses/',
-    'https://www.swinburneonline.edu.au/online-courses/business-courses/bachelor-business-management/',
-    'https://www.swinburneonline.edu.au/online-courses/business-courses/bachelor-business-sports-management/',
-    'https://www.swinburneonline.edu.au/online-courses/business-courses/master-business-administration-mba-online/',
-    'https://www.swinburneonline.edu.au/online-courses/information-technology-courses/graduate-certificate-programming-and-development/',
-    'https://www.swinburneonline.edu.au/online-courses/information-technology-courses/graduate-certificate-professional-data-analytics/',
-    'https://www.swinburneonline.edu.au/online-courses/law-courses/bachelor-criminal-justice-and-criminology/',
-    'https://www.swinburneonline.edu.au/online-courses/law-courses/bachelor-laws/',
-    'https://www.swinburneonline.edu.au/online-courses/law-courses/bachelor-of-laws-graduate-entry/',
-    'https://www.swinburneonline.edu.au/online-courses/media-and-communication-courses/bachelor-media-communication-advertising/',
-    'https://www.swinburneonline.edu.au/online-courses/media-and-communication-courses/bachelor-media-communication-media-studies/',
-    'https://www.swinburneonline.edu.au/online-courses/psychology-courses/bachelor-psychological-sciences/',
-    'https://www.swinburneonline.edu.au/online-courses/social-science-courses/bachelor-social-science-criminology/',
-    'https://www.swinburneonline.edu.au/online-courses/social-science-courses/bachelor-social-science-security-and-counter-terrorism/',
-    'https://www.swinburneonline.edu.au/online-courses/social-science-courses/bachelor-social-science-security-and-international-relations/',
-    'https://www.swinburneonline.edu.au/online-courses/business-courses/bachelor-business-logistics-and-supply-chain-management/',
-    'https://www.swinburneonline.edu.au/online-courses/business-courses/bachelor-business-business-administration/',
-    'https://www.swinburneonline.edu.au/online-courses/psychology-courses/graduate-diploma-psychology/',
-    'https://www.swinburneonline.edu.au/online-courses/law-courses/undergraduate-certificate-of-business/',
-    'https://www.swinburneonline.edu.au/online-courses/law-courses/undergraduate-certificate-of-criminal-justice-and-criminology/',
-    'https://www.swinburneonline.edu.au/online-courses/social-science-courses/bachelor-social-science-behavioural-studies/',
-    'https://www.swinburneonline.edu.au/online-courses/education-courses/bachelor-education-early-childhood-teaching/',
-    'https://www.swinburneonline.edu.au/online-courses/education-courses/graduate-certificate-educational-studies/',
-    'https://www.swinburneonline.edu.au/online-courses/education-courses/graduate-diploma-early-childhood-teaching/',
-    'https://www.swinburneonline.edu.au/online-courses/education-courses/bachelor-education-early-childhood-primary/',
-    'https://www.swinburneonline.edu.au/online-courses/education-courses/bachelor-education-primary/',
-    'https://www.swinburneonline.edu.au/online-courses/education-courses/master-teaching-primary/',
-    'https://www.swinburneonline.edu.au/online-courses/education-courses/master-teaching-secondary/',
-    'https://www.swinburneonline.edu.au/online-courses/psychology-courses/graduate-diploma-psychology-advanced/',
-    'https://www.swinburneonline.edu.au/online-courses/psychology-courses/graduate-certificate-of-psychology/',
-    'https://www.swinburneonline.edu.au/online-courses/business-courses/bachelor-of-business-human-resource-management/',
-    'https://www.swinburneonline.edu.au/online-courses/business-courses/graduate-certificate-management/',
-    'https://www.swinburneonline.edu.au/online-courses/business-courses/graduate-certificate-project-management/',
-    'https://www.swinburneonline.edu.au/online-courses/business-courses/graduate-diploma-project-management/',
-    'https://www.swinburneonline.edu.au/online-courses/business-courses/bachelor-business-finance/',
-    'https://www.swinburneonline.edu.au/online-courses/business-courses/bachelor-business-financial-planning/',
-    'https://www.swinburneonline.edu.au/online-courses/business-courses/bachelor-business-accounting/',
-    'https://www.swinburneonline.edu.au/online-courses/business-courses/bachelor-accounting/',
-    'https://www.swinburneonline.edu.au/online-courses/business-courses/graduate-certificate-business-administration/',
-    'https://www.swinburneonline.edu.au/online-courses/business-courses/bachelor-business-marketing/',
-    'https://www.swinburneonline.edu.au/online-courses/business-courses/graduate-certificate-cybersecurity-management/',
-    'https://www.swinburneonline.edu.au/online-courses/information-technology-courses/bachelor-of-information-and-communication-technology-software-technology/',
-    'https://www.swinburneonline.edu.au/online-courses/information-technology-courses/bachelor-of-information-and-communication-technology-network-technology/',
-    'https://www.swinburneonline.edu.au/online-courses/media-and-communication-courses/bachelor-media-communication-public-relations/',
-    'https://www.swinburneonline.edu.au/online-courses/units/test/',
-    'https://www.swinburneonline.edu.au/online-courses/units/sta70007-analysis-of-variance-and-regression/',
-    'https://www.swinburneonline.edu.au/online-courses/units/acc80003-company-auditing/',
-    'https://www.swinburneonline.edu.au/online-courses/units/dco10001-concepts-and-narratives/',
-    'https://www.swinburneonline.edu.au/online-courses/units/pol20011-conflict-resolution/',
-    'https://www.swinburneonline.edu.au/online-courses/units/connecting-with-culture-indigenous-australian-experiences/',
-    'https://www.swinburneonline.edu.au/online-courses/units/his30007-war-and-peace-in-the-20th-century/',
-    'https://www.swinburneonline.edu.au/online-courses/units/dco20009-typography-print-and-interactive/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu10003-world-maths/',
-    'https://www.swinburneonline.edu.au/online-courses/units/teaching-technologies/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu30010-teaching-literacy/',
-    'https://www.swinburneonline.edu.au/online-courses/units/teaching-english/',
-    'https://www.swinburneonline.edu.au/online-courses/units/acc80012-taxation-principles-and-planning/',
-    'https://www.swinburneonline.edu.au/online-courses/units/dco10002-digital-design/',
-    'https://www.swinburneonline.edu.au/online-courses/units/eco80001-economics/',
-    'https://www.swinburneonline.edu.au/online-courses/units/psy20016-social-psychology/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mda10003-screen-studies-movies-television-and-ourselves/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mda30006-media-and-communications-project-a/',
-    'https://www.swinburneonline.edu.au/online-courses/units/acc80008-managerial-accounting/',
-    'https://www.swinburneonline.edu.au/online-courses/units/acc20014-management-decision-making/',
-    'https://www.swinburneonline.edu.au/online-courses/units/art20002-experimental-image-making-processes/',
-    'https://www.swinburneonline.edu.au/online-courses/units/acc80006-financial-reporting/',
-    'https://www.swinburneonline.edu.au/online-courses/units/fundamentals-of-criminology/',
-    'https://www.swinburneonline.edu.au/online-courses/units/inb60003-fin30013-international-trade-and-investment/',
-    'https://www.swinburneonline.edu.au/online-courses/units/2545-2/',
-    'https://www.swinburneonline.edu.au/online-courses/units/org30002-leadership-context/',
-    'https://www.swinburneonline.edu.au/online-courses/units/leading-complex-projects/',
-    'https://www.swinburneonline.edu.au/online-courses/units/jou10007-media-content-creation/',
-    'https://www.swinburneonline.edu.au/online-courses/units/org80008-leadership-for-innovation/',
-    'https://www.swinburneonline.edu.au/online-courses/units/fin30019-retirement-and-estate-planning/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu80060-secondary-curriculum-and-pedagogy-2/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mkt10007-fundamentals-marketing/',
-    'https://www.swinburneonline.edu.au/online-courses/units/acc10008-financial-information-systems/',
-    'https://www.swinburneonline.edu.au/online-courses/units/fin20014-financial-management/',
-    'https://www.swinburneonline.edu.au/online-courses/units/fin30014-financial-risk-management/',
-    'https://www.swinburneonline.edu.au/online-courses/units/fin30016-management-of-investment-portfolios/',
-    'https://www.swinburneonline.edu.au/online-courses/units/finance-law/',
-    'https://www.swinburneonline.edu.au/online-courses/units/fin30017-investment-planning/',
-    'https://www.swinburneonline.edu.au/online-courses/units/acc30008-accounting-theory/',
-    'https://www.swinburneonline.edu.au/online-courses/units/org20003-organisational-behaviour/',
-    'https://www.swinburneonline.edu.au/online-courses/units/scm20002-procurement-management/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mkt20025-consumer-behaviour/',
-    'https://www.swinburneonline.edu.au/online-courses/units/pub30001-events-management/',
-    'https://www.swinburneonline.edu.au/online-courses/units/acc30010-auditing/',
-    'https://www.swinburneonline.edu.au/online-courses/units/psy30010-abnormal-psychology/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu10024-academic-skills-for-success/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu10024-academic-skills-for-success-2/',
-    'https://www.swinburneonline.edu.au/online-courses/units/acc60006-accounting-information-systems/',
-    'https://www.swinburneonline.edu.au/online-courses/units/acc60005-accounting-principles/',
-    'https://www.swinburneonline.edu.au/online-courses/units/accounting-systems-and-reporting/',
-    'https://www.swinburneonline.edu.au/online-courses/units/adv30002-advertising-management-and-campaigns-project/',
-    'https://www.swinburneonline.edu.au/online-courses/units/pol10001-australian-politics/',
-    'https://www.swinburneonline.edu.au/online-courses/units/fin20013-banking-operations-and-governance/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mgt20006-business-and-society/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mda20001-business-of-media/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mgt80002-business-strategy/',
-    'https://www.swinburneonline.edu.au/online-courses/units/ddd30047-communication-design-capstone/',
-    'https://www.swinburneonline.edu.au/online-courses/units/designing-for-change/',
-    'https://www.swinburneonline.edu.au/online-courses/units/project-management-for-innovative-outcomes/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mkt60010-marketing-management/',
-    'https://www.swinburneonline.edu.au/online-courses/units/strategic-project-management/',
-    'https://www.swinburneonline.edu.au/online-courses/units/risk-management-spectrum/',
-    'https://www.swinburneonline.edu.au/online-courses/units/insurance-and-estate-planning/',
-    'https://www.swinburneonline.edu.au/online-courses/units/data-science-with-python/',
-    'https://www.swinburneonline.edu.au/online-courses/units/law-and-social-science/',
-    'https://www.swinburneonline.edu.au/online-courses/units/land-law/',
-    'https://www.swinburneonline.edu.au/online-courses/units/introduction-to-australian-law-statutory-interpretation/',
-    'https://www.swinburneonline.edu.au/online-courses/units/juvenile-justice-and-crime/',
-    'https://www.swinburneonline.edu.au/online-courses/units/law-social-science/',
-    'https://www.swinburneonline.edu.au/online-courses/units/law20019-law-commerce/',
-    'https://www.swinburneonline.edu.au/online-courses/units/law30005-law-of-enforcement/',
-    'https://www.swinburneonline.edu.au/online-courses/units/spo30001-leading-sport-organisations/',
-    'https://www.swinburneonline.edu.au/online-courses/units/legal-practice-professional-conduct/',
-    'https://www.swinburneonline.edu.au/online-courses/units/legal-technology-and-innovation/',
-    'https://www.swinburneonline.edu.au/online-courses/units/legal-writing/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mda20019-media-platforms-and-practices/',
-    'https://www.swinburneonline.edu.au/online-courses/units/patents-designs/',
-    'https://www.swinburneonline.edu.au/online-courses/units/adv10001-principles-advertising/',
-    'https://www.swinburneonline.edu.au/online-courses/units/privacy-in-law-and-society/',
-    'https://www.swinburneonline.edu.au/online-courses/units/professional-experience-in-law-1/',
-    'https://www.swinburneonline.edu.au/online-courses/units/professional-experience-in-law-3/',
-    'https://www.swinburneonline.edu.au/online-courses/units/property-law/',
-    'https://www.swinburneonline.edu.au/online-courses/units/public-private-international-law/',
-    'https://www.swinburneonline.edu.au/online-courses/units/sentencing/',
-    'https://www.swinburneonline.edu.au/online-courses/units/psy70013-social-psychology/',
-    'https://www.swinburneonline.edu.au/online-courses/units/technological-advances-in-dealing-with-crime/',
-    'https://www.swinburneonline.edu.au/online-courses/units/torts-1/',
-    'https://www.swinburneonline.edu.au/online-courses/units/torts-2/',
-    'https://www.swinburneonline.edu.au/online-courses/units/trade-marks-related-rights/',
-    'https://www.swinburneonline.edu.au/online-courses/units/youth-justice-and-crime/',
-    'https://www.swinburneonline.edu.au/online-courses/units/administrative-law/',
-    'https://www.swinburneonline.edu.au/online-courses/units/psy30014-applied-social-psychology/',
-    'https://www.swinburneonline.edu.au/online-courses/units/cri30001-advanced-topics/',
-    'https://www.swinburneonline.edu.au/online-courses/units/civil-procedure-and-alternative-dispute-resolution/',
-    'https://www.swinburneonline.edu.au/online-courses/units/commercial-law/',
-    'https://www.swinburneonline.edu.au/online-courses/units/company-law/',
-    'https://www.swinburneonline.edu.au/online-courses/units/competition-law-policy/',
-    'https://www.swinburneonline.edu.au/online-courses/units/contract-law/',
-    'https://www.swinburneonline.edu.au/online-courses/units/copyright/',
-    'https://www.swinburneonline.edu.au/online-courses/units/law60003-corporations-and-contract-law/',
-    'https://www.swinburneonline.edu.au/online-courses/units/cri30002-corrections-systems-and-practice/',
-    'https://www.swinburneonline.edu.au/online-courses/units/crime-and-punishment-in-the-international-context/',
-    'https://www.swinburneonline.edu.au/online-courses/units/crime-society-and-culture/',
-    'https://www.swinburneonline.edu.au/online-courses/units/criminal-law-procedure/',
-    'https://www.swinburneonline.edu.au/online-courses/units/criminal-law-and-process/',
-    'https://www.swinburneonline.edu.au/online-courses/units/cyber-crime/',
-    'https://www.swinburneonline.edu.au/online-courses/units/electives/',
-    'https://www.swinburneonline.edu.au/online-courses/units/electives-for-bachelor-of-social-science-behavioural-studies/',
-    'https://www.swinburneonline.edu.au/online-courses/units/electives-for-bachelor-of-social-science-security-and-counter-terrorism/',
-    'https://www.swinburneonline.edu.au/online-courses/units/electives-for-bachelor-of-business-accounting/',
-    'https://www.swinburneonline.edu.au/online-courses/units/electives-for-bachelor-of-social-science-security-and-international-relations/',
-    'https://www.swinburneonline.edu.au/online-courses/units/electives-for-bachelor-of-accounting/',
-    'https://www.swinburneonline.edu.au/online-courses/units/electives-for-bachelor-of-business-business-administration/',
-    'https://www.swinburneonline.edu.au/online-courses/units/electives-for-bachelor-of-business-with-a-major-in-finance/',
-    'https://www.swinburneonline.edu.au/online-courses/units/electives-for-bachelor-of-business-management/',
-    'https://www.swinburneonline.edu.au/online-courses/units/electives-for-bachelor-of-business-marketing/',
-    'https://www.swinburneonline.edu.au/online-courses/units/electives-for-bachelor-of-business-sports-management/',
-    'https://www.swinburneonline.edu.au/online-courses/units/ethics-and-client-management-2/',
-    'https://www.swinburneonline.edu.au/online-courses/units/fin20015-ethics-and-client-relationships/',
-    'https://www.swinburneonline.edu.au/online-courses/units/ethics-of-innovation/',
-    'https://www.swinburneonline.edu.au/online-courses/units/ethics-and-client-management/',
-    'https://www.swinburneonline.edu.au/online-courses/units/evidence/',
-    'https://www.swinburneonline.edu.au/online-courses/units/facilitate-compliance-in-an-education-and-care-service/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu30006-families-and-community/',
-    'https://www.swinburneonline.edu.au/online-courses/units/federal-state-constitutional-law/',
-    'https://www.swinburneonline.edu.au/online-courses/units/fin20017-finance-behavioural-bias/',
-    'https://www.swinburneonline.edu.au/online-courses/units/acc80005-financial-accounting-theory/',
-    'https://www.swinburneonline.edu.au/online-courses/units/financial-advice-technology-project/',
-    'https://www.swinburneonline.edu.au/online-courses/units/fin10002-financial-statistics/',
-    'https://www.swinburneonline.edu.au/online-courses/units/fixed-income-and-debt-markets/',
-    'https://www.swinburneonline.edu.au/online-courses/units/acc30003-forensic-accounting/',
-    'https://www.swinburneonline.edu.au/online-courses/units/inb10002-foundations-of-international-business/',
-    'https://www.swinburneonline.edu.au/online-courses/units/front-end-web-development/',
-    'https://www.swinburneonline.edu.au/online-courses/units/frontiers-of-digital-marketing/',
-    'https://www.swinburneonline.edu.au/online-courses/units/fundamentals-of-data-management/',
-    'https://www.swinburneonline.edu.au/online-courses/units/future-of-sport/',
-    'https://www.swinburneonline.edu.au/online-courses/units/future-work-skills/',
-    'https://www.swinburneonline.edu.au/online-courses/units/global-crime/',
-    'https://www.swinburneonline.edu.au/online-courses/units/global-screen-studies-beyond-hollywood/',
-    'https://www.swinburneonline.edu.au/online-courses/units/ent80010-governance-and-corporate-leadership/',
-    'https://www.swinburneonline.edu.au/online-courses/units/governing-technology-for-business-environments/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu30014-health-and-physical-education/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu70008-health-physical-education-primary-school/',
-    'https://www.swinburneonline.edu.au/online-courses/units/pol30012-history-politics-and-human-rights/',
-    'https://www.swinburneonline.edu.au/online-courses/units/ddd10001-20th-century-design/',
-    'https://www.swinburneonline.edu.au/online-courses/units/psy70018-abnormal-psychology/',
-    'https://www.swinburneonline.edu.au/online-courses/units/acc60002-accounting-information-and-managerial-decision-making/',
-    'https://www.swinburneonline.edu.au/online-courses/units/acc20003-accounting-systems/',
-    'https://www.swinburneonline.edu.au/online-courses/units/achieving-high-quality-early-learning/',
-    'https://www.swinburneonline.edu.au/online-courses/units/administer-and-monitor-medicines-and-intravenous-therapy/',
-    'https://www.swinburneonline.edu.au/online-courses/units/advanced-criminal-law-and-sentencing/',
-    'https://www.swinburneonline.edu.au/online-courses/units/bus30024-advanced-innovation/',
-    'https://www.swinburneonline.edu.au/online-courses/units/acc20009-advanced-management-accounting/',
-    'https://www.swinburneonline.edu.au/online-courses/units/advanced-quantitative-methods-for-psychology/',
-    'https://www.swinburneonline.edu.au/online-courses/units/advanced-topics-in-forensic-psychology/',
-    'https://www.swinburneonline.edu.au/online-courses/units/advanced-web-development/',
-    'https://www.swinburneonline.edu.au/online-courses/units/adv20001-advertising-issues-regulations-ethics-and-cultural-considerations/',
-    'https://www.swinburneonline.edu.au/online-courses/units/adv30001-advertising-media-planning-and-purchasing/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu40004-advocacy-and-social-justice/',
-    'https://www.swinburneonline.edu.au/online-courses/units/agile-methodologies-and-frameworks/',
-    'https://www.swinburneonline.edu.au/online-courses/units/agile-methodologies-and-frameworks-2/',
-    'https://www.swinburneonline.edu.au/online-courses/units/alternative-investments/',
-    'https://www.swinburneonline.edu.au/online-courses/units/analyse-and-respond-to-client-health-information/',
-    'https://www.swinburneonline.edu.au/online-courses/units/analyse-information-to-inform-learning/',
-    'https://www.swinburneonline.edu.au/online-courses/units/acc30009-analysis-competitive-advantage/',
-    'https://www.swinburneonline.edu.au/online-courses/units/sta20006-analysis-variance-and-regression/',
-    'https://www.swinburneonline.edu.au/online-courses/units/applied-cybersecurity/',
-    'https://www.swinburneonline.edu.au/online-courses/units/apply-a-palliative-care-approach-in-nursing-care/',
-    'https://www.swinburneonline.edu.au/online-courses/units/apply-communication-skills-in-nursing-practice/',
-    'https://www.swinburneonline.edu.au/online-courses/units/apply-legal-and-ethical-parameters-to-nursing-practice/',
-    'https://www.swinburneonline.edu.au/online-courses/units/apply-nursing-practice-in-the-primary-health-care-setting/',
-    'https://www.swinburneonline.edu.au/online-courses/units/apply-principles-of-wound-management-in-the-clinical-environment/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu70006-arts-primary-school/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu40008-arts-education/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu80013-assessment-and-data/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu40010-assessment-primary/',
-    'https://www.swinburneonline.edu.au/online-courses/units/pol20008-australian-foreign-policy/',
-    'https://www.swinburneonline.edu.au/online-courses/units/hrm60016-behaviour-in-organisations/',
-    'https://www.swinburneonline.edu.au/online-courses/units/behavioural-finance-and-investment/',
-    'https://www.swinburneonline.edu.au/online-courses/units/big-data-architecture-and-applications/',
-    'https://www.swinburneonline.edu.au/online-courses/units/big-data-management/',
-    'https://www.swinburneonline.edu.au/online-courses/units/dco20001-brand-and-identity-design/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mkt30017-branding-innovation-and-design/',
-    'https://www.swinburneonline.edu.au/online-courses/units/building-and-sustaining-positive-relationships/',
-    'https://www.swinburneonline.edu.au/online-courses/units/spo20001-building-sport-brands/',
-    'https://www.swinburneonline.edu.au/online-courses/units/bus30009-industry-consulting-project/',
-    'https://www.swinburneonline.edu.au/online-courses/units/business-digitalisation/',
-    'https://www.swinburneonline.edu.au/online-courses/units/fin80014-business-finance-and-quantitative-analysis/',
-    'https://www.swinburneonline.edu.au/online-courses/units/business-for-sustainability-social-change-and-impact/',
-    'https://www.swinburneonline.edu.au/online-courses/units/inf80007-business-information-systems-for-a-rapidly-changing-world/',
-    'https://www.swinburneonline.edu.au/online-courses/units/fin60003-business-modelling-and-analysis/',
-    'https://www.swinburneonline.edu.au/online-courses/units/business-society-and-sustainability/',
-    'https://www.swinburneonline.edu.au/online-courses/units/child-growth-health-and-wellbeing/',
-    'https://www.swinburneonline.edu.au/online-courses/units/child-play-with-literacy-and-creative-pedagogy/',
-    'https://www.swinburneonline.edu.au/online-courses/units/child-play-with-science-technology-engineering-and-mathematics/',
-    'https://www.swinburneonline.edu.au/online-courses/units/cloud-approaches-for-enterprise-systems/',
-    'https://www.swinburneonline.edu.au/online-courses/units/cloud-computing-architecture/',
-    'https://www.swinburneonline.edu.au/online-courses/units/ddd30048-communication-design-strategy/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu10007-contemporary-perspectives-learning-and/',
-    'https://www.swinburneonline.edu.au/online-courses/units/ddd20004-contemporary-design-issues/',
-    'https://www.swinburneonline.edu.au/online-courses/units/contemporary-issues-in-business-analysis/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu20003-contemporary-perspectives-learning-and/',
-    'https://www.swinburneonline.edu.au/online-courses/units/comply-with-infection-prevention-and-control-policies-and-procedures/',
-    'https://www.swinburneonline.edu.au/online-courses/units/compositing-for-visual-effects/',
-    'https://www.swinburneonline.edu.au/online-courses/units/computer-systems/',
-    'https://www.swinburneonline.edu.au/online-courses/units/adv20002-concept-development-and-copywriting/',
-    'https://www.swinburneonline.edu.au/online-courses/units/confirm-physical-health-status/',
-    'https://www.swinburneonline.edu.au/online-courses/units/contribute-to-nursing-care-of-a-person-with-complex-needs/',
-    'https://www.swinburneonline.edu.au/online-courses/units/coordinate-human-resource-functions-and-processes/',
-    'https://www.swinburneonline.edu.au/online-courses/units/coordinate-the-learning-and-development-of-teams-and-individuals/',
-    'https://www.swinburneonline.edu.au/online-courses/units/coordinate-workforce-plan-implementation/',
-    'https://www.swinburneonline.edu.au/online-courses/units/acc20001-corporate-accounting/',
-    'https://www.swinburneonline.edu.au/online-courses/units/ent80009-corporate-entrepreneurship-and-innovation/',
-    'https://www.swinburneonline.edu.au/online-courses/units/fin20006-corporate-finance/',
-    'https://www.swinburneonline.edu.au/online-courses/units/fin80005-corporate-financial-management/',
-    'https://www.swinburneonline.edu.au/online-courses/units/counselling-and-interventions/',
-    'https://www.swinburneonline.edu.au/online-courses/units/cri10001-criminology-theory-and-practice/',
-    'https://www.swinburneonline.edu.au/online-courses/units/pol30016-countering-violent-extremism/',
-    'https://www.swinburneonline.edu.au/online-courses/units/pol30009-critical-perspectives-on-terrorism-capstone-unit/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mgt10002-critical-thinking-management/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu30015-curriculum-and-pedagogy-for-primary-practicum-3p/',
-    'https://www.swinburneonline.edu.au/online-courses/units/curriculum-development-assessment-responsive-pedagogy/',
-    'https://www.swinburneonline.edu.au/online-courses/units/curriculum-planning-and-assessment-practicum-2/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu30003-curriculum-planning-and-assessment-for-infants-practicum-3/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu20006-curriculum-planning-and-assessment-for-primary-practicum-2/',
-    'https://www.swinburneonline.edu.au/online-courses/units/cyber-crime-and-security/',
-    'https://www.swinburneonline.edu.au/online-courses/units/cyber-forensics/',
-    'https://www.swinburneonline.edu.au/online-courses/units/cyber-risk-data-management/',
-    'https://www.swinburneonline.edu.au/online-courses/units/data-analytics-for-business/',
-    'https://www.swinburneonline.edu.au/online-courses/units/data-analytics-with-python/',
-    'https://www.swinburneonline.edu.au/online-courses/units/data-science-principles/',
-    'https://www.swinburneonline.edu.au/online-courses/units/data-visualisation/',
-    'https://www.swinburneonline.edu.au/online-courses/units/database-analysis-and-design/',
-    'https://www.swinburneonline.edu.au/online-courses/units/bsbmkg523-design-and-develop-an-integrated-marketing-communication-plan/',
-    'https://www.swinburneonline.edu.au/online-courses/units/design-and-implement-the-curriculum-to-foster-childrens-learning-and-development/',
-    'https://www.swinburneonline.edu.au/online-courses/units/dco30002-design-for-production/',
-    'https://www.swinburneonline.edu.au/online-courses/units/develop-administrative-systems/',
-    'https://www.swinburneonline.edu.au/online-courses/units/bsbhrm512-develop-and-manage-performance-management-processes/',
-    'https://www.swinburneonline.edu.au/online-courses/units/bsbldr501-develop-and-use-emotional-intelligence/',
-    'https://www.swinburneonline.edu.au/online-courses/units/develop-critical-thinking-in-others/',
-    'https://www.swinburneonline.edu.au/online-courses/units/develop-cultural-competence/',
-    'https://www.swinburneonline.edu.au/online-courses/units/develop-positive-and-respectful-relationships-with-children/',
-    'https://www.swinburneonline.edu.au/online-courses/units/develop-workplace-policies-and-procedures-for-sustainability/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu20001-developing-literacy/',
-    'https://www.swinburneonline.edu.au/online-courses/units/development-project-1-tools-and-practices/',
-    'https://www.swinburneonline.edu.au/online-courses/units/soc20020-deviance-difference-conformity/',
-    'https://www.swinburneonline.edu.au/online-courses/units/pol20009-dictators-and-democrats-comparative-politics/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mda20009-digital-communities/',
-    'https://www.swinburneonline.edu.au/online-courses/units/digital-management-and-the-future-of-work/',
-    'https://www.swinburneonline.edu.au/online-courses/units/dig10004-digital-video-and-audio/',
-    'https://www.swinburneonline.edu.au/online-courses/units/hrm20016-dynamics-of-diversity-in-organisations/',
-    'https://www.swinburneonline.edu.au/online-courses/units/eco10004-economic-principles/',
-    'https://www.swinburneonline.edu.au/online-courses/units/economics-for-business-decision-making/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu80019-educational-leadership-and-policy/',
-    'https://www.swinburneonline.edu.au/online-courses/units/educational-leadershipmanagement-and-program-assessment/',
-    'https://www.swinburneonline.edu.au/online-courses/units/eforensic-fundamentals/',
-    'https://www.swinburneonline.edu.au/online-courses/units/electives-for-bachelor-of-social-science-criminology/',
-    'https://www.swinburneonline.edu.au/online-courses/units/electives-for-bachelor-of-business-logistics-and-supply-chain-management/',
-    'https://www.swinburneonline.edu.au/online-courses/units/elements-of-financial-planning/',
-    'https://www.swinburneonline.edu.au/online-courses/units/elements-of-financial-planning-and-regulation/',
-    'https://www.swinburneonline.edu.au/online-courses/units/embed-sustainable-practices-in-service-operations/',
-    'https://www.swinburneonline.edu.au/online-courses/units/empirical-study/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu70007-english-primary-school/',
-    'https://www.swinburneonline.edu.au/online-courses/units/ensure-the-health-and-safety-of-children/',
-    'https://www.swinburneonline.edu.au/online-courses/units/enterprise-network-server-administration/',
-    'https://www.swinburneonline.edu.au/online-courses/units/equity-trusts/',
-    'https://www.swinburneonline.edu.au/online-courses/units/bsbmkg502-establish-and-adjust-marketing-mix/',
-    'https://www.swinburneonline.edu.au/online-courses/units/establish-and-implement-plans-for-developing-cooperative-behaviour/',
-    'https://www.swinburneonline.edu.au/online-courses/units/establish-innovative-work-environments/',
-    'https://www.swinburneonline.edu.au/online-courses/units/ethics-and-international-finance/',
-    'https://www.swinburneonline.edu.au/online-courses/units/ethical-professional-issues/',
-    'https://www.swinburneonline.edu.au/online-courses/units/ddd20016-experience-design-and-usability/',
-    'https://www.swinburneonline.edu.au/online-courses/units/facilitate-performance-development-processes/',
-    'https://www.swinburneonline.edu.au/online-courses/units/follow-safe-work-practices-for-direct-client-care/',
-    'https://www.swinburneonline.edu.au/online-courses/units/foster-the-holistic-development-and-wellbeing-of-the-child-in-early-childhood/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mda10008-global-media-industries/',
-    'https://www.swinburneonline.edu.au/online-courses/units/pub20001-global-public-relations-practice/',
-    'https://www.swinburneonline.edu.au/online-courses/units/hrm30011-human-resource-analytics/',
-    'https://www.swinburneonline.edu.au/online-courses/units/hrm10003-human-resource-management/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu70009-humanities-primary-school/',
-    'https://www.swinburneonline.edu.au/online-courses/units/ict-design-project/',
-    'https://www.swinburneonline.edu.au/online-courses/units/ict-innovation-project/',
-    'https://www.swinburneonline.edu.au/online-courses/units/ict-inquiry-project/',
-    'https://www.swinburneonline.edu.au/online-courses/units/ict-project-a/',
-    'https://www.swinburneonline.edu.au/online-courses/units/ict-project-b/',
-    'https://www.swinburneonline.edu.au/online-courses/units/identify-and-respond-to-children-and-young-people-at-risk/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu40003-identity-early-childhood-professional/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu30001-imagining-world-through-language-and/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu30007-imagining-world-through-arts/',
-    'https://www.swinburneonline.edu.au/online-courses/units/implement-and-monitor-care-for-a-person-with-acute-health-problems/',
-    'https://www.swinburneonline.edu.au/online-courses/units/implement-and-monitor-care-for-a-person-with-chronic-health-problems/',
-    'https://www.swinburneonline.edu.au/online-courses/units/implement-and-monitor-care-for-a-person-with-diabetes/',
-    'https://www.swinburneonline.edu.au/online-courses/units/implement-and-monitor-care-for-a-person-with-mental-health-conditions/',
-    'https://www.swinburneonline.edu.au/online-courses/units/implement-and-monitor-care-of-the-older-person/',
-    'https://www.swinburneonline.edu.au/online-courses/units/bsbmkg514-implement-and-monitor-marketing-activities/',
-    'https://www.swinburneonline.edu.au/online-courses/units/implement-and-monitor-work-health-and-safety-whs-policies-procedures-and-programs/',
-    'https://www.swinburneonline.edu.au/online-courses/units/implement-strategies-for-the-inclusion-of-all-children/',
-    'https://www.swinburneonline.edu.au/online-courses/units/bsbwhs401-implement-and-monitor-work-health-and-safety-whs-policies-procedures-and-programs-to-meet-legislative-requirements/',
-    'https://www.swinburneonline.edu.au/online-courses/units/implement-monitor-and-evaluate-nursing-care/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu10005-indigenous-education-and-perspectives/',
-    'https://www.swinburneonline.edu.au/online-courses/units/information-systems-risk-and-security/',
-    'https://www.swinburneonline.edu.au/online-courses/units/information-technology-project/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mda10006-innovation-cultures-perspectives-on-science-and-technology/',
-    'https://www.swinburneonline.edu.au/online-courses/units/innovation-for-education/',
-    'https://www.swinburneonline.edu.au/online-courses/units/innovative-branding/',
-    'https://www.swinburneonline.edu.au/online-courses/units/innovative-business-practice/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mkt20021-integrated-marketing-communication/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu40007-integrated-studies/',
-    'https://www.swinburneonline.edu.au/online-courses/units/ddd30020-interaction-design-for-mobile-devices/',
-    'https://www.swinburneonline.edu.au/online-courses/units/ddd20015-interaction-design-web/',
-    'https://www.swinburneonline.edu.au/online-courses/units/com20001-intercultural-communications/',
-    'https://www.swinburneonline.edu.au/online-courses/units/interface-design-and-development/',
-    'https://www.swinburneonline.edu.au/online-courses/units/international-commercial-law/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mkt30011-international-marketing/',
-    'https://www.swinburneonline.edu.au/online-courses/units/pol10002-international-politics/',
-    'https://www.swinburneonline.edu.au/online-courses/units/pol20010-international-relations-and-security-studies/',
-    'https://www.swinburneonline.edu.au/online-courses/units/interpret-and-apply-medical-terminology-appropriately/',
-    'https://www.swinburneonline.edu.au/online-courses/units/bsbmkg507-interpret-market-trends-and-developments/',
-    'https://www.swinburneonline.edu.au/online-courses/units/introduction-to-academic-language-literacy-and-numeracy-in-education/',
-    'https://www.swinburneonline.edu.au/online-courses/units/introduction-to-artificial-intelligence/',
-    'https://www.swinburneonline.edu.au/online-courses/units/inf10003-introduction-business/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu10001-introduction-to-curriculum-planning-and-assessment-practicum-1/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu30008-introduction-educational-leadership/',
-    'https://www.swinburneonline.edu.au/online-courses/units/for10001-introduction-forensic/',
-    'https://www.swinburneonline.edu.au/online-courses/units/introduction-to-law/',
-    'https://www.swinburneonline.edu.au/online-courses/units/law10006-introduction-to-commercial-law/',
-    'https://www.swinburneonline.edu.au/online-courses/units/introduction-to-curriculum-planning-and-assessment-for-primary-practicum-1/',
-    'https://www.swinburneonline.edu.au/online-courses/units/bus10002-introduction-to-logistics-and-supply-chain-management/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mda10001-introduction-to-media-studies/',
-    'https://www.swinburneonline.edu.au/online-courses/units/introduction-to-programming/',
-    'https://www.swinburneonline.edu.au/online-courses/units/introduction-to-public-relations-theory-and-practice/',
-    'https://www.swinburneonline.edu.au/online-courses/units/psy70010-introduction-to-research-methods/',
-    'https://www.swinburneonline.edu.au/online-courses/units/psy10005-introduction-to-research-methods/',
-    'https://www.swinburneonline.edu.au/online-courses/units/psy20001-introduction-to-theories-of-counselling/',
-    'https://www.swinburneonline.edu.au/online-courses/units/investment-and-behavioural-finance/',
-    'https://www.swinburneonline.edu.au/online-courses/units/iot-programming/',
-    'https://www.swinburneonline.edu.au/online-courses/units/pub30002-issues-crisis-and-risk-communication/',
-    'https://www.swinburneonline.edu.au/online-courses/units/issues-crisis-and-risk-communication/',
-    'https://www.swinburneonline.edu.au/online-courses/units/it-security/',
-    'https://www.swinburneonline.edu.au/online-courses/units/knowledge-management-and-analytics/',
-    'https://www.swinburneonline.edu.au/online-courses/units/law-and-the-media/',
-    'https://www.swinburneonline.edu.au/online-courses/units/bsbldr502-lead-and-manage-effective-workplace-relationships/',
-    'https://www.swinburneonline.edu.au/online-courses/units/bsbwor502-lead-and-manage-team-effectiveness/',
-    'https://www.swinburneonline.edu.au/online-courses/units/lead-communication-in-the-workplace/',
-    'https://www.swinburneonline.edu.au/online-courses/units/lead-the-work-team/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mgt30003-leadership-and-management/',
-    'https://www.swinburneonline.edu.au/online-courses/units/leadership-practice-and-skills/',
-    'https://www.swinburneonline.edu.au/online-courses/units/org60001-leading/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mgt60044-leading-innovation-in-the-workforce/',
-    'https://www.swinburneonline.edu.au/online-courses/units/com10011-learning-and-communicating-innovative/',
-    'https://www.swinburneonline.edu.au/online-courses/units/com10003-learning-and-communicating-online/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu80016-literacy-across-curriculum/',
-    'https://www.swinburneonline.edu.au/online-courses/units/literacy-and-numeracy-across-the-curriculum/',
-    'https://www.swinburneonline.edu.au/online-courses/units/literature-review/',
-    'https://www.swinburneonline.edu.au/online-courses/units/maintain-work-health-and-safety/',
-    'https://www.swinburneonline.edu.au/online-courses/units/malware-analysis/',
-    'https://www.swinburneonline.edu.au/online-courses/units/bsbfim501-manage-budgets-and-financial-plans/',
-    'https://www.swinburneonline.edu.au/online-courses/units/manage-budgets-and-financial-plans/',
-    'https://www.swinburneonline.edu.au/online-courses/units/bbsadm506-manage-business-document-design-and-development/',
-    'https://www.swinburneonline.edu.au/online-courses/units/bsbops502-manage-business-operational-plans/',
-    'https://www.swinburneonline.edu.au/online-courses/units/bsbops502-manage-business-operational-plans-2/',
-    'https://www.swinburneonline.edu.au/online-courses/units/manage-business-resources/',
-    'https://www.swinburneonline.edu.au/online-courses/units/manage-business-risk/',
-    'https://www.swinburneonline.edu.au/online-courses/units/manage-employee-and-industrial-relations/',
-    'https://www.swinburneonline.edu.au/online-courses/units/bsbwrk520-manage-employee-relations/',
-    'https://www.swinburneonline.edu.au/online-courses/units/eco20004-macroeconomic-policy/',
-    'https://www.swinburneonline.edu.au/online-courses/units/bsbhrm501-manage-human-resources-services/',
-    'https://www.swinburneonline.edu.au/online-courses/units/bsbadm502-manage-meetings/',
-    'https://www.swinburneonline.edu.au/online-courses/units/manage-meetings/',
-    'https://www.swinburneonline.edu.au/online-courses/units/bsbfim502-manage-payroll/',
-    'https://www.swinburneonline.edu.au/online-courses/units/bsbfim502-manage-payroll-2/',
-    'https://www.swinburneonline.edu.au/online-courses/units/bsbmgt502-manage-people-performance/',
-    'https://www.swinburneonline.edu.au/online-courses/units/manage-people-performance/',
-    'https://www.swinburneonline.edu.au/online-courses/units/manage-personal-and-professional-development/',
-    'https://www.swinburneonline.edu.au/online-courses/units/manage-personal-stressors-in-the-work-environment/',
-    'https://www.swinburneonline.edu.au/online-courses/units/manage-recruiting-and-onboarding/',
-    'https://www.swinburneonline.edu.au/online-courses/units/bsbwor501-manage-personal-work-priorities-and-professional-development/',
-    'https://www.swinburneonline.edu.au/online-courses/units/bsbhrm506-manage-recruitment-selection-and-induction-processes/',
-    'https://www.swinburneonline.edu.au/online-courses/units/manage-team-effectiveness/',
-    'https://www.swinburneonline.edu.au/online-courses/units/bsbhrm513-manage-workforce-planning/',
-    'https://www.swinburneonline.edu.au/online-courses/units/acc20011-management-accounting-1/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mgt60040-management-analysis-and-problem-solving/',
-    'https://www.swinburneonline.edu.au/online-courses/units/fin30018-management-of-personal-financial-risk/',
-    'https://www.swinburneonline.edu.au/online-courses/units/managing-crisis-communications/',
-    'https://www.swinburneonline.edu.au/online-courses/units/hrm20003-managing-diversity-in-organisations/',
-    'https://www.swinburneonline.edu.au/online-courses/units/managing-it-projects/',
-    'https://www.swinburneonline.edu.au/online-courses/units/managing-workplace-relations/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mkt30015-marketing-and-communication-information-and-decision-making/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mgt30015-marketing-and-communication-information-and-decision-making/',
-    'https://www.swinburneonline.edu.au/online-courses/units/marketing-and-innovation/',
-    'https://www.swinburneonline.edu.au/online-courses/units/marketing-and-the-consumer-experience/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mkt20020-marketing-behaviour/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mkt20023-marketing-channel-design-and-integration/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mkt10002-marketing-concepts/',
-    'https://www.swinburneonline.edu.au/online-courses/units/marketing-insights/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mkt20019-marketing-research/',
-    'https://www.swinburneonline.edu.au/online-courses/units/marketing-research-and-analytics/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mkt30016-marketing-strategy-and-planning/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu20002-mathematics-practice/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu70010-mathematics-primary-school/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu30009-mathematics-primary-classroom/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mda30005-media-studies-project/',
-    'https://www.swinburneonline.edu.au/online-courses/units/nature-pedagogies/',
-    'https://www.swinburneonline.edu.au/online-courses/units/network-administration/',
-    'https://www.swinburneonline.edu.au/online-courses/units/network-routing-principles/',
-    'https://www.swinburneonline.edu.au/online-courses/units/network-security-and-resilience/',
-    'https://www.swinburneonline.edu.au/online-courses/units/networks-and-switching/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu80017-numeracy-across-curriculum/',
-    'https://www.swinburneonline.edu.au/online-courses/units/nurture-creativity-in-children/',
-    'https://www.swinburneonline.edu.au/online-courses/units/object-oriented-programming/',
-    'https://www.swinburneonline.edu.au/online-courses/units/scm20001-operations-management/',
-    'https://www.swinburneonline.edu.au/online-courses/units/operations-management/',
-    'https://www.swinburneonline.edu.au/online-courses/units/ent60006-opportunity-discovery/',
-    'https://www.swinburneonline.edu.au/online-courses/units/organisation-theory-and-practice/',
-    'https://www.swinburneonline.edu.au/online-courses/units/organisational-growth-and-innovation-capstone-project/',
-    'https://www.swinburneonline.edu.au/online-courses/units/org30001-organisational-learning-and-design/',
-    'https://www.swinburneonline.edu.au/online-courses/units/org20001-organisations-and-management/',
-    'https://www.swinburneonline.edu.au/online-courses/units/organise-personal-work-priorities-and-development/',
-    'https://www.swinburneonline.edu.au/online-courses/units/dco10003-packaging-design/',
-    'https://www.swinburneonline.edu.au/online-courses/units/participate-in-workplace-health-and-safety/',
-    'https://www.swinburneonline.edu.au/online-courses/units/perform-clinical-assessment-and-plan-nursing-care/',
-    'https://www.swinburneonline.edu.au/online-courses/units/fin30022-personal-financial-risk-estate-planning/',
-    'https://www.swinburneonline.edu.au/online-courses/units/dco10004-photography-design/',
-    'https://www.swinburneonline.edu.au/online-courses/units/bsbadm504-plan-and-implement-administrative-systems/',
-    'https://www.swinburneonline.edu.au/online-courses/units/bsbmkg506-plan-market-research/',
-    'https://www.swinburneonline.edu.au/online-courses/units/planning-for-career-success/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu40002-play-and-environment/',
-    'https://www.swinburneonline.edu.au/online-courses/units/cri20001-policing-systems-and-practice/',
-    'https://www.swinburneonline.edu.au/online-courses/units/practise-nursing-within-the-australian-health-care-system/',
-    'https://www.swinburneonline.edu.au/online-courses/units/primary-specialisation/',
-    'https://www.swinburneonline.edu.au/online-courses/units/fin10003-principles-of-financial-planning/',
-    'https://www.swinburneonline.edu.au/online-courses/units/problem-solving-with-ict/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mkt20024-product-and-service-innovation-management/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mkt20016-product-management/',
-    'https://www.swinburneonline.edu.au/online-courses/units/product-management-for-business/',
-    'https://www.swinburneonline.edu.au/online-courses/units/com10007-professional-communication-practice/',
-    'https://www.swinburneonline.edu.au/online-courses/units/professional-experience-1/',
-    'https://www.swinburneonline.edu.au/online-courses/units/professional-experience-2/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu80021-professional-experience-3/',
-    'https://www.swinburneonline.edu.au/online-courses/units/professional-experience-in-law-2/',
-    'https://www.swinburneonline.edu.au/online-courses/units/bus20009-professional-internship-business/',
-    'https://www.swinburneonline.edu.au/online-courses/units/professional-internship-business/',
-    'https://www.swinburneonline.edu.au/online-courses/units/professional-issues-in-it/',
-    'https://www.swinburneonline.edu.au/online-courses/units/com30002-professional-practice-client-and-agency-management/',
-    'https://www.swinburneonline.edu.au/online-courses/units/professionalism-with-family-community-and-industry/',
-    'https://www.swinburneonline.edu.au/online-courses/units/programming-for-development/',
-    'https://www.swinburneonline.edu.au/online-courses/units/project-governance-and-resource-management/',
-    'https://www.swinburneonline.edu.au/online-courses/units/project-management-essentials/',
-    'https://www.swinburneonline.edu.au/online-courses/units/promote-aboriginal-and-or-torres-strait-islander-cultural-safety/',
-    'https://www.swinburneonline.edu.au/online-courses/units/promote-and-provide-healthy-food-and-drinks/',
-    'https://www.swinburneonline.edu.au/online-courses/units/promote-childrens-agency/',
-    'https://www.swinburneonline.edu.au/online-courses/units/provide-an-emergency-first-aid-response-in-an-education-and-care-setting/',
-    'https://www.swinburneonline.edu.au/online-courses/units/provide-care-for-babies-and-toddlers/',
-    'https://www.swinburneonline.edu.au/online-courses/units/provide-care-for-children/',
-    'https://www.swinburneonline.edu.au/online-courses/units/provide-experiences-to-support-childrens-play-and-learning/',
-    'https://www.swinburneonline.edu.au/online-courses/units/provide-first-aid/',
-    'https://www.swinburneonline.edu.au/online-courses/units/psychological-assessment/',
-    'https://www.swinburneonline.edu.au/online-courses/units/psy20008-psychology-infancy/',
-    'https://www.swinburneonline.edu.au/online-courses/units/psy30008-psychology-personality/',
-    'https://www.swinburneonline.edu.au/online-courses/units/psy70016-psychology-of-personality/',
-    'https://www.swinburneonline.edu.au/online-courses/units/psy30011-psychology-of-wellbeing-double-unit/',
-    'https://www.swinburneonline.edu.au/online-courses/units/psy70019-psychology-project/',
-    'https://www.swinburneonline.edu.au/online-courses/units/psy30003-psychology-project/',
-    'https://www.swinburneonline.edu.au/online-courses/units/pub30003-public-relations-project-and-campaign-planning/',
-    'https://www.swinburneonline.edu.au/online-courses/units/pub20002-public-relations-theory-and-practice/',
-    'https://www.swinburneonline.edu.au/online-courses/units/pub20003-public-relations-writing/',
-    'https://www.swinburneonline.edu.au/online-courses/units/ddd30013-publication-design/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu40006-ready-to-teach-early-childhood-practicum-5e/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu40005-ready-to-teach-primary-practicum-4e/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu40012-ready-to-teach-professional-experience-practicum-4p/',
-    'https://www.swinburneonline.edu.au/online-courses/units/reflect-on-and-improve-own-professional-practice/',
-    'https://www.swinburneonline.edu.au/online-courses/units/research-and-apply-evidence-to-practice/',
-    'https://www.swinburneonline.edu.au/online-courses/units/research-project-development/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mda30012-researching-social-media-publics/',
-    'https://www.swinburneonline.edu.au/online-courses/units/fin30023-retirement-planning/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu30002-science-and-technology/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu70011-science-primary-school/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mda20007-screen-franchising-and-innovation/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu60050-secondary-curriculum-and-pedagogy-1/',
-    'https://www.swinburneonline.edu.au/online-courses/units/secure-remote-access-networks/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mkt20012-services-marketing/',
-    'https://www.swinburneonline.edu.au/online-courses/units/social-and-emotional-learning/',
-    'https://www.swinburneonline.edu.au/online-courses/units/soc30011-social-research-design-principles-and-methods/',
-    'https://www.swinburneonline.edu.au/online-courses/units/soc10004-sociological-foundations/',
-    'https://www.swinburneonline.edu.au/online-courses/units/software-development-for-mobile-devices/',
-    'https://www.swinburneonline.edu.au/online-courses/units/software-development-practices/',
-    'https://www.swinburneonline.edu.au/online-courses/units/sport-business-analytics/',
-    'https://www.swinburneonline.edu.au/online-courses/units/spo20002-sport-clubs-and-facilities-management/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mda20011-sports-advertising-media/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mkt60006-strategic-and-entrepreneurial-marketing/',
-    'https://www.swinburneonline.edu.au/online-courses/units/acc80011-strategic-cost-management/',
-    'https://www.swinburneonline.edu.au/online-courses/units/hrm70006-strategic-hrm-in-the-business-context/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mkt30013-strategic-marketing-planning-project/',
-    'https://www.swinburneonline.edu.au/online-courses/units/strategic-planning/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mgt30005-strategic-planning-dynamic/',
-    'https://www.swinburneonline.edu.au/online-courses/units/superannuation-and-retirement-planning/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu60015-supervised-professional-experience-1/',
-    'https://www.swinburneonline.edu.au/online-courses/units/supervised-professional-experience-1-edu60044/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu70003-supervised-practicum-b/',
-    'https://www.swinburneonline.edu.au/online-courses/units/supervised-professional-experience-2-edu70016/',
-    'https://www.swinburneonline.edu.au/online-courses/units/supervised-professional-experience-3-ready-to-teach-edu80015/',
-    'https://www.swinburneonline.edu.au/online-courses/units/support-the-holistic-development-of-children-in-early-childhood/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu30013-supporting-diversity-and-equity/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu40009-supporting-inclusion-primary/',
-    'https://www.swinburneonline.edu.au/online-courses/units/supporting-students-english-as-additional-language/',
-    'https://www.swinburneonline.edu.au/online-courses/units/sustainable-business-practice/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu20005-sustainable-education-and-perspectives/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mgt30004-sustainable-organisation-change-project/',
-    'https://www.swinburneonline.edu.au/online-courses/units/org30003-sustainable-organisational-design/',
-    'https://www.swinburneonline.edu.au/online-courses/units/acc30005-taxation/',
-    'https://www.swinburneonline.edu.au/online-courses/units/teacher-professionalism-and-ethical-conduct/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu30070-teacher-wellbeing-resilience-and-emotional-intelligence/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu10006-teaching-and-learning-21st-century/',
-    'https://www.swinburneonline.edu.au/online-courses/units/teaching-early-reading/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu80014-teaching-diversity-equity-and-inclusion/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu30016-teaching-australian-schools/',
-    'https://www.swinburneonline.edu.au/online-courses/units/teaching-science/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu30012-teaching-science-and-technology/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu40011-teaching-humanities/',
-    'https://www.swinburneonline.edu.au/online-courses/units/technology-essentials-for-managers/',
-    'https://www.swinburneonline.edu.au/online-courses/units/technology-in-an-indigenous-context-project/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu40001-healthy-and-active-child/',
-    'https://www.swinburneonline.edu.au/online-courses/units/spo10001-the-sport-industry/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu10004-theories-teaching-and-learning/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu70013-transformative-technologies-in-education/',
-    'https://www.swinburneonline.edu.au/online-courses/units/scm30001-transportation-management/',
-    'https://www.swinburneonline.edu.au/online-courses/units/dco10005-typography/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu20004-understanding-and-supporting-behaviour/',
-    'https://www.swinburneonline.edu.au/online-courses/units/understanding-and-supporting-inclusion/',
-    'https://www.swinburneonline.edu.au/online-courses/units/understanding-behaviour-for-classroom-practice/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu80012-understanding-indigenous-education-perspectives/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu10002-understanding-language-and-literacy/',
-    'https://www.swinburneonline.edu.au/online-courses/units/scm30002-understanding-risk-management/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu60017-understanding-theories-teaching-learning-development/',
-    'https://www.swinburneonline.edu.au/online-courses/units/bsbpmg522-undertake-project-work/',
-    'https://www.swinburneonline.edu.au/online-courses/units/use-an-approved-learning-framework-to-guide-practice/',
-    'https://www.swinburneonline.edu.au/online-courses/units/use-information-about-children-to-inform-practice/',
-    'https://www.swinburneonline.edu.au/online-courses/units/user-centred-design/',
-    'https://www.swinburneonline.edu.au/online-courses/units/ux-design-practice/',
-    'https://www.swinburneonline.edu.au/online-courses/units/dco10007-visual-communication-studio-2/',
-    'https://www.swinburneonline.edu.au/online-courses/units/dco20004-web-design/',
-    'https://www.swinburneonline.edu.au/online-courses/units/web-development/',
-    'https://www.swinburneonline.edu.au/online-courses/units/ddd30019-web-marketing-and-advanced/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu30004-wellbeing-and-resilience/',
-    'https://www.swinburneonline.edu.au/online-courses/units/hlthir404d-work-effectively-with-aboriginal-and-or-torres-strait-islander-people/',
-    'https://www.swinburneonline.edu.au/online-courses/units/hlthir403c-work-effectively-with-culturally-diverse-clients-and-co-workers/',
-    'https://www.swinburneonline.edu.au/online-courses/units/work-in-partnership-with-families-to-provide-appropriate-education-and-care-for-children/',
-    'https://www.swinburneonline.edu.au/online-courses/units/work-legally-and-ethically/',
-    'https://www.swinburneonline.edu.au/online-courses/units/work-with-diverse-people/',
-    'https://www.swinburneonline.edu.au/online-courses/units/chccs400c-work-within-a-relevant-legal-and-ethical-framework/',
-    'https://www.swinburneonline.edu.au/online-courses/units/establish-and-implement-plans-for-developing-cooperative-behaviour-2/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu30027-planning-teaching-learning-for-infants-practicum-3e/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mental-health-diversity-diagnosis-treatment/',
-    'https://www.swinburneonline.edu.au/online-courses/units/psy70012-psychology-101/',
-    'https://www.swinburneonline.edu.au/online-courses/units/psy10008-fundamentals-psychology/',
-    'https://www.swinburneonline.edu.au/online-courses/units/psy10007-brain-behaviour/',
-    'https://www.swinburneonline.edu.au/online-courses/units/psy70011-brain-behaviour/',
-    'https://www.swinburneonline.edu.au/online-courses/units/psy20006-cognition-and-human-performance/',
-    'https://www.swinburneonline.edu.au/online-courses/units/psy70014-cognition-and-human-performance/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mgt10001-introduction-management/',
-    'https://www.swinburneonline.edu.au/online-courses/units/contemporary-management-principles/',
-    'https://www.swinburneonline.edu.au/online-courses/units/psy20007-development-psychology/',
-    'https://www.swinburneonline.edu.au/online-courses/units/psy70015-development-of-psychology/',
-    'https://www.swinburneonline.edu.au/online-courses/units/dig10004-digital-video-and-audio-2/',
-    'https://www.swinburneonline.edu.au/online-courses/units/edu30011-discovering-science/',
-    'https://www.swinburneonline.edu.au/online-courses/units/sta10003-foundations-statistics/',
-    'https://www.swinburneonline.edu.au/online-courses/units/sta70006-foundations-of-statistics/',
-    'https://www.swinburneonline.edu.au/online-courses/units/inb20008-global-logistics-supply-chain-management/',
-    'https://www.swinburneonline.edu.au/online-courses/units/scm20003-global-logistics-and-supply-chain-management/',
-    'https://www.swinburneonline.edu.au/online-courses/units/psy70017-history-and-philosophy-of-psychology/',
-    'https://www.swinburneonline.edu.au/online-courses/units/psy30013-history-and-philosophy-psychology/',
-    'https://www.swinburneonline.edu.au/online-courses/units/how-to-think-like-a-hacker/',
-    'https://www.swinburneonline.edu.au/online-courses/units/bsbmkg501-identify-and-evaluate-marketing-opportunities/',
-    'https://www.swinburneonline.edu.au/online-courses/units/identify-and-evaluate-marketing-opportunities/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mda10015-social-media-strategy/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mda20028-business-media-entrepreneurship/',
-    'https://www.swinburneonline.edu.au/online-courses/units/jou20007-interactive-storytelling/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mda20026-media-analytics-visualisation/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mda30022-social-media-social-impact/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mda0021-social-media-industry-project/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mda10012-communicating-with-data/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mda10018-content-creator-lab/',
-    'https://www.swinburneonline.edu.au/online-courses/units/wei20002-work-experience-in-industry-b/',
-    'https://www.swinburneonline.edu.au/online-courses/units/wei20001-work-experience-in-industry-a/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mda10013-digital-self-digital-commiunity/',
-    'https://www.swinburneonline.edu.au/online-courses/units/mda20016-integrated-professional-placement-a-media-and-communication/',
-    'https://www.swinburneonline.edu.au/online-courses/units/bus20011-integrated-professional-placement-b-business/',
-    'https://www.swinburneonline.edu.au/online-courses/units/acc20013-company-accounting/',
-    'https://www.swinburneonline.edu.au/online-courses/units/acc20007-management-accounting-planning-and/',
-    'https://www.swinburneonline.edu.au/online-courses/units/acc10007-financial-information-decision-making/',
-    'https://www.swinburneonline.edu.au/online-courses/units/pol30015-cybersecurity/',
-    'https://www.swinburneonline.edu.au/online-courses/units/cybersecurity-for-business/',
-    'https://www.swinburneonline.edu.au/online-courses/units/cybersecurity-law-policy-and-ethics/',
-    'https://www.swinburneonline.edu.au/online-courses/units/cybersecurity-project/',
-    'https://www.swinburneonline.edu.au/online-courses/units/cybersecurity-the-people-and-organisation/',
-    'https://www.swinburneonline.edu.au/online-courses/units/networks-and-cybersecurity-frameworks/',
-    'https://www.swinburneonline.edu.au/online-courses/units/how-to-think-like-a-hacker-an-anatomy-of-cyber-attacks/',
-    'https://www.swinburneonline.edu.au/online-courses/units/cybersecurity-operations-management/',
-    'https://www.swinburneonline.edu.au/faqs/am-i-eligible-for-a-commonwealth-supported-place-and-a-help-loan/',
-    'https://www.swinburneonline.edu.au/faqs/am-i-eligible-for-a-student-concession-card-when-studying-online/',
-    'https://www.swinburneonline.edu.au/faqs/are-exams-only-held-at-the-end-of-each-teaching-period/',
-    'https://www.swinburneonline.edu.au/faqs/are-placements-available-part-time-for-education-students/',
-    'https://www.swinburneonline.edu.au/faqs/are-postgraduate-students-eligible-for-commonwealth-supported-places-csp/',
-    'https://www.swinburneonline.edu.au/faqs/are-the-courses-the-same-as-the-on-campus-courses/',
-    'https://www.swinburneonline.edu.au/faqs/are-the-education-degrees-nationally-recognised/',
-    'https://www.swinburneonline.edu.au/faqs/are-there-dates-i-need-to-think-about-when-applying-for-a-vsl/',
-    'https://www.swinburneonline.edu.au/faqs/can-i-cover-the-cost-of-my-introductory-skill-set-course-using-vet-student-loan/',
-    'https://www.swinburneonline.edu.au/faqs/can-i-do-my-education-placement-outside-of-australia/',
-    'https://www.swinburneonline.edu.au/faqs/can-i-study-a-mixture-of-on-campus-and-online-units/',
-    'https://www.swinburneonline.edu.au/faqs/do-i-have-to-pay-for-my-studies-upfront/',
-    'https://www.swinburneonline.edu.au/faqs/do-i-have-to-purchase-learning-materials/',
-    'https://www.swinburneonline.edu.au/faqs/do-i-need-fancy-software/',
-    'https://www.swinburneonline.edu.au/faqs/do-i-need-to-be-logged-on-to-study-at-specific-times/',
-    'https://www.swinburneonline.edu.au/faqs/do-i-need-to-purchase-any-learning-materials-for-the-diploma-of-nursing/',
-    'https://www.swinburneonline.edu.au/faqs/do-you-have-a-head-office-somewhere-if-i-want-to-meet-someone-face-to-face-about-my-course/',
-    'https://www.swinburneonline.edu.au/faqs/do-you-have-postgraduate-programs/',
-    'https://www.swinburneonline.edu.au/faqs/do-you-offer-hecs-help-and-fee-help/',
-    'https://www.swinburneonline.edu.au/faqs/does-the-graduate-certification-in-professional-data-analytics-prepare-me-for-the-tableau-desktop-certified-specialist-certification-exam/',
-    'https://www.swinburneonline.edu.au/faqs/has-swinburne-online-been-affected-by-covid-19/',
-    'https://www.swinburneonline.edu.au/faqs/how-are-my-placements-arranged/',
-    'https://www.swinburneonline.edu.au/faqs/how-can-i-get-in-touch-with-other-students/',
-    'https://www.swinburneonline.edu.au/faqs/how-do-assessments-work/',
-    'https://www.swinburneonline.edu.au/faqs/how-do-exams-work/',
-    'https://www.swinburneonline.edu.au/faqs/how-do-i-apply-to-enrol-in-a-degree-or-a-diploma/',
-    'https://www.swinburneonline.edu.au/faqs/how-do-i-repay-my-help-loan/',
-    'https://www.swinburneonline.edu.au/faqs/how-does-online-study-work/',
-    'https://www.swinburneonline.edu.au/faqs/how-does-swinburne-university-of-technology-rate-against-other-universities/',
-    'https://www.swinburneonline.edu.au/faqs/how-does-your-model-of-online-study-work-for-higher-education-if-there-are-no-lectures/',
-    'https://www.swinburneonline.edu.au/faqs/how-does-your-model-of-online-study-work-for-tafe/',
-    'https://www.swinburneonline.edu.au/faqs/how-does-your-model-of-online-study-work-for-the-diploma-of-nursing/',
-    'https://www.swinburneonline.edu.au/faqs/how-long-will-it-take-to-earn-my-degree/',
-    'https://www.swinburneonline.edu.au/faqs/how-long-will-my-application-take-to-be-assessed/',
-    'https://www.swinburneonline.edu.au/faqs/how-many-alumni-are-there/',
-    'https://www.swinburneonline.edu.au/faqs/how-many-hours-of-study-per-week-are-recommended-per-unit/',
-    'https://www.swinburneonline.edu.au/faqs/how-many-placements-do-i-have-to-do/',
-    'https://www.swinburneonline.edu.au/faqs/how-many-units-can-i-undertake-per-teaching-period/',
-    'https://www.swinburneonline.edu.au/faqs/how-will-a-credit-for-previous-studies-appear-on-my-transcript/',
-    'https://www.swinburneonline.edu.au/faqs/i-currently-work-as-an-integration-aide-at-a-primary-school-can-i-do-my-teaching-placement-at-the-school-i-work-at/',
-    'https://www.swinburneonline.edu.au/faqs/im-not-sure-if-i-meet-the-entry-requirements-but-i-want-to-study-what-should-i-do/',
-    'https://www.swinburneonline.edu.au/faqs/im-not-sure-what-to-study-who-can-help-me/',
-    'https://www.swinburneonline.edu.au/faqs/im-interested-in-becoming-a-teacher-how-will-teaching-placements-work-given-that-your-degrees-are-online/',
-    'https://www.swinburneonline.edu.au/faqs/im-studying-a-degree-will-i-have-to-sit-exams/',
-    'https://www.swinburneonline.edu.au/faqs/im-studying-a-tafe-course-will-i-have-to-sit-exams/',
-    'https://www.swinburneonline.edu.au/faqs/if-i-have-a-vsl-can-i-withdraw-from-my-course/',
-    'https://www.swinburneonline.edu.au/faqs/if-i-have-just-completed-year-12-can-i-apply-to-enrol-in-your-march-intake-teaching-period-1/',
-    'https://www.swinburneonline.edu.au/faqs/ka16f000000hjvuqa0/',
-    'https://www.swinburneonline.edu.au/faqs/is-now-a-good-time-to-look-at-a-career-change/',
-    'https://www.swinburneonline.edu.au/faqs/is-there-a-graduation-ceremony/',
-    'https://www.swinburneonline.edu.au/faqs/is-there-fee-or-financial-assistance-for-international-students/',
-    'https://www.swinburneonline.edu.au/faqs/is-there-fee-or-financial-assistance-for-postgraduate-degrees/',
-    'https://www.swinburneonline.edu.au/faqs/should-i-start-studying-now/',
-    'https://www.swinburneonline.edu.au/faqs/what-are-electives-and-why-do-i-need-to-study-them/',
-    'https://www.swinburneonline.edu.au/faqs/what-are-exemptions/',
-    'https://www.swinburneonline.edu.au/faqs/what-are-placements/',
-    'https://www.swinburneonline.edu.au/faqs/what-are-the-benefits-of-acquiring-a-tableau-certification/',
-    'https://www.swinburneonline.edu.au/faqs/what-are-the-entry-requirements-for-tafe-courses/',
-    'https://www.swinburneonline.edu.au/faqs/what-are-the-entry-requirements-for-the-diploma-of-nursing/',
-    'https://www.swinburneonline.edu.au/faqs/what-are-the-main-differences-between-online-on-campus-and-distance-education/',
-    'https://www.swinburneonline.edu.au/faqs/what-devices-will-i-need-to-complete-my-qualification/',
-    'https://www.swinburneonline.edu.au/faqs/what-happens-if-i-dont-pay-my-fees-on-time/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-a-certificate/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-a-commonwealth-supported-place/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-a-double-degree/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-a-grade-point-average-gpa/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-a-graduate-certificate/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-a-major-unit/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-a-masters-degree/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-a-phd/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-a-pre-requisite/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-a-specialisation/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-a-virtual-classroom/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-an-honours-degree/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-distance-education/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-hecs-help/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-higher-education/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-tafe/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-the-student-amenities-help-fee-for-and-why-do-i-have-to-pay-it/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-vet/',
-    'https://www.swinburneonline.edu.au/faqs/what-kind-of-support-do-you-offer-for-online-students/',
-    'https://www.swinburneonline.edu.au/faqs/what-level-of-english-language-proficiency-do-i-need-to-study-a-masters-at-swinburne-online/',
-    'https://www.swinburneonline.edu.au/faqs/what-level-of-english-language-proficiency-do-i-need-to-study-an-undergraduate-degree-at-swinburne-online/',
-    'https://www.swinburneonline.edu.au/faqs/what-sort-of-career-prospects-do-i-have-with-an-online-qualification/',
-    'https://www.swinburneonline.edu.au/faqs/whats-changing-in-the-diploma-of-nursing/',
-    'https://www.swinburneonline.edu.au/faqs/when-will-swinburne-online-be-releasing-the-new-diploma-of-nursing/',
-    'https://www.swinburneonline.edu.au/faqs/where-are-swinburne-onlines-exam-centres-located/',
-    'https://www.swinburneonline.edu.au/faqs/where-can-find-out-more-about-vet-student-loans/',
-    'https://www.swinburneonline.edu.au/faqs/where-can-i-get-assessment-support/',
-    'https://www.swinburneonline.edu.au/faqs/where-can-i-get-english-language-support/',
-    'https://www.swinburneonline.edu.au/faqs/where-can-i-get-important-information-about-the-vet-student-loan-program/',
-    'https://www.swinburneonline.edu.au/faqs/where-can-i-go-for-career-advice/',
-    'https://www.swinburneonline.edu.au/faqs/which-units-should-i-start-with/',
-    'https://www.swinburneonline.edu.au/faqs/who-can-help-me-put-together-a-study-plan-for-my-course/',
-    'https://www.swinburneonline.edu.au/faqs/where-can-i-study-online-from/',
-    'https://www.swinburneonline.edu.au/faqs/which-units-can-i-take-as-electives/',
-    'https://www.swinburneonline.edu.au/faqs/who-can-i-contact-for-support-during-my-studies/',
-    'https://www.swinburneonline.edu.au/faqs/why-is-swinburne-online-a-good-study-option-during-isolation/',
-    'https://www.swinburneonline.edu.au/faqs/why-is-the-diploma-of-nursing-changing/',
-    'https://www.swinburneonline.edu.au/faqs/will-i-be-studying-alone/',
-    'https://www.swinburneonline.edu.au/faqs/will-i-ever-need-to-go-to-a-campus/',
-    'https://www.swinburneonline.edu.au/faqs/will-i-have-to-sit-exams-in-the-diploma-of-nursing/',
-    'https://www.swinburneonline.edu.au/faqs/will-i-need-to-attend-placements-to-complete-the-diploma-of-nursing/',
-    'https://www.swinburneonline.edu.au/faqs/will-i-need-to-be-screened-to-work-with-children/',
-    'https://www.swinburneonline.edu.au/faqs/will-i-receive-the-same-qualification-as-an-on-campus-student/',
-    'https://www.swinburneonline.edu.au/faqs/will-you-be-offering-courses-as-part-of-the-governments-higher-education-relief-package/',
-    'https://www.swinburneonline.edu.au/faqs/is-the-whole-course-discounted/',
-    'https://www.swinburneonline.edu.au/faqs/how-do-i-ensure-im-enrolled-with-a-discounted-fee/',
-    'https://www.swinburneonline.edu.au/faqs/what-if-i-only-want-to-complete-two-units/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-a-professional-certificate/',
-    'https://www.swinburneonline.edu.au/faqs/can-i-enrol-in-a-professional-certificate/',
-    'https://www.swinburneonline.edu.au/faqs/what-if-i-want-to-continue-studying-after-1-december-2020/',
-    'https://www.swinburneonline.edu.au/faqs/will-i-receive-credit-for-my-previous-studies/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-online-education/',
-    'https://www.swinburneonline.edu.au/faqs/why-are-these-courses-discounted/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-the-entry-criteria/',
-    'https://www.swinburneonline.edu.au/faqs/what-units-will-i-study/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-the-relationship-between-swinburne-university-of-technology-and-swinburne-online/',
-    'https://www.swinburneonline.edu.au/faqs/how-long-has-swinburne-been-around-for/',
-    'https://www.swinburneonline.edu.au/faqs/who-can-help-me-if-i-am-having-technological-difficulties/',
-    'https://www.swinburneonline.edu.au/faqs/what-are-core-units/',
-    'https://www.swinburneonline.edu.au/faqs/how-much-will-my-course-cost/',
-    'https://www.swinburneonline.edu.au/faqs/can-i-study-abroad/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-postgraduate-study/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-undergraduate-study/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-a-diploma/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-the-tableau-desktop-certified-specialist-certification/',
-    'https://www.swinburneonline.edu.au/faqs/can-i-obtain-help-to-defer-payment/',
-    'https://www.swinburneonline.edu.au/faqs/do-you-accept-international-students/',
-    'https://www.swinburneonline.edu.au/faqs/how-do-i-stay-on-track-with-my-study/',
-    'https://www.swinburneonline.edu.au/faqs/is-an-online-qualification-a-real-qualification/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-a-bachelor-degree/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-a-graduate-diploma/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-the-difference-between-a-degree-and-a-diploma/',
-    'https://www.swinburneonline.edu.au/faqs/what-resources-are-available-to-alumni-once-they-have-graduated/',
-    'https://www.swinburneonline.edu.au/faqs/when-is-the-cut-off-date-for-enrolment/',
-    'https://www.swinburneonline.edu.au/faqs/will-i-be-charged-interest-on-my-hecs-help-loan/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-a-good-option-for-upskilling-during-this-time/',
-    'https://www.swinburneonline.edu.au/faqs/when-does-the-stars-program-commence/',
-    'https://www.swinburneonline.edu.au/faqs/how-many-pre-service-teachers-can-partake-in-the-stars-program-for-2022-2023-year/',
-    'https://www.swinburneonline.edu.au/faqs/how-will-the-stars-program-fit-in-with-my-current-units-of-study/',
-    'https://www.swinburneonline.edu.au/faqs/how-many-practicums-will-i-need-to-complete-during-the-stars-program/',
-    'https://www.swinburneonline.edu.au/faqs/what-schools-can-i-do-my-placement-in-as-part-of-the-stars-program/',
-    'https://www.swinburneonline.edu.au/faqs/what-if-i-have-already-organised-my-placement-s-can-i-still-participate-in-the-program/',
-    'https://www.swinburneonline.edu.au/faqs/what-will-i-receive-at-completion-of-this-program/',
-    'https://www.swinburneonline.edu.au/faqs/when-do-the-stars-canvas-modules-open-would-i-be-able-to-have-access-to-them-at-the-start-of-the-teaching-period-as-id-like-to-work-on-the-stars-module-before-placement/',
-    'https://www.swinburneonline.edu.au/faqs/when-swinburne-matches-the-student-to-the-placement-school-what-is-the-criteria-for-travel-expectations-will-swinburne-match-me-to-somewhere-within-a-reasonable-distance-from-my-home-or-could-it-be/',
-    'https://www.swinburneonline.edu.au/faqs/can-i-complete-my-two-stars-placements-in-the-school-that-i-am-doing-permission-to-teach-ptt-work-the-school-fits-the-low-socioeconomic-criteria-and-have-said-they-would-be-happy-for-me-do-my-stars/',
-    'https://www.swinburneonline.edu.au/faqs/are-stars-placements-extra-placements-or-part-of-my-course/',
-    'https://www.swinburneonline.edu.au/faqs/is-stars-paid/',
-    'https://www.swinburneonline.edu.au/faqs/will-there-be-any-financial-support-for-travel-or-accommodation-to-undertake-a-placement-in-regional-or-remote-victoria/',
-    'https://www.swinburneonline.edu.au/faqs/i-have-secured-a-placement-in-a-school-setting-that-is-not-a-regional-remote-or-low-socioeconomic-school-if-i-am-successful-in-my-application-will-you-help-me-change-to-a-stars-approved-school-setti/',
-    'https://www.swinburneonline.edu.au/faqs/i-am-a-master-of-teaching-secondary-student-applying-for-the-stars-program-does-it-matter-the-year-level-of-placement-or-my-specialist-teaching-area/',
-    'https://www.swinburneonline.edu.au/faqs/how-do-i-organise-a-placement-in-a-stars-approved-school-setting/',
-    'https://www.swinburneonline.edu.au/faqs/why-should-i-choose-swinburne-over-different-providers/',
-    'https://www.swinburneonline.edu.au/faqs/as-a-business-leader-owner-what-value-can-an-mba-add-that-i-do-not-gain-in-my-current-vocation/',
-    'https://www.swinburneonline.edu.au/faqs/what-support-can-i-expect/',
-    'https://www.swinburneonline.edu.au/faqs/is-an-mba-too-advanced-for-someone-who-has-never-studied/',
-    'https://www.swinburneonline.edu.au/faqs/as-i-am-studying-online-can-i-pursue-full-time-opportunities-throughout-my-studies/',
-    'https://www.swinburneonline.edu.au/faqs/do-these-degrees-provide-any-networking-opportunities/',
-    'https://www.swinburneonline.edu.au/faqs/how-will-swinburne-prepare-me-for-future-job-opportunities/',
-    'https://www.swinburneonline.edu.au/faqs/with-an-mba-does-the-institution-matter/',
-    'https://www.swinburneonline.edu.au/faqs/what-job-opportunities-require-an-mba/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-the-likelihood-of-employment-with-an-mba/',
-    'https://www.swinburneonline.edu.au/faqs/is-there-a-pay-increase-between-undergraduate-and-mba-students/',
-    'https://www.swinburneonline.edu.au/faqs/13452-2/',
-    'https://www.swinburneonline.edu.au/faqs/ka16f000000pn4mqas/',
-    'https://www.swinburneonline.edu.au/faqs/what-career-outcomes-can-you-get-with-a-business-degree/',
-    'https://www.swinburneonline.edu.au/faqs/why-study-business-courses-in-australia/',
-    'https://www.swinburneonline.edu.au/faqs/what-are-the-benefits-of-doing-business/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-the-most-important-thing-to-learn-in-business/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-the-best-type-of-business-to-major-in/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-the-most-versatile-business-degree/',
-    'https://www.swinburneonline.edu.au/faqs/what-degree-is-best-for-starting-a-business%ef%bf%bc/',
-    'https://www.swinburneonline.edu.au/faqs/what-are-the-three-major-skills-needed-to-run-a-business%ef%bf%bc/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-the-difference-between-business-administration-and-business-management/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-the-difference-between-management-and-administration/',
-    'https://www.swinburneonline.edu.au/faqs/what-does-a-business-administrator-do/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-an-example-of-business-administration/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-the-meaning-of-a-degree-in-business-administration/',
-    'https://www.swinburneonline.edu.au/faqs/what-are-the-main-topics-in-business-administration/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-the-meaning-of-business-management/',
-    'https://www.swinburneonline.edu.au/faqs/what-are-examples-of-business-management/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-the-definition-of-a-business-management-degree/',
-    'https://www.swinburneonline.edu.au/faqs/what-will-i-learn-in-a-business-management-degree/',
-    'https://www.swinburneonline.edu.au/faqs/what-pays-the-most-with-a-business-degree/',
-    'https://www.swinburneonline.edu.au/faqs/what-job-can-you-get-with-a-business-degree-in-australia/',
-    'https://www.swinburneonline.edu.au/faqs/do-people-with-business-degrees-get-jobs/',
-    'https://www.swinburneonline.edu.au/faqs/how-can-studying-business-be-beneficial-for-your-future/',
-    'https://www.swinburneonline.edu.au/faqs/what-are-the-four-advantages-of-studying-business-environment/',
-    'https://www.swinburneonline.edu.au/faqs/which-business-degree-is-best-in-australia/',
-    'https://www.swinburneonline.edu.au/faqs/what-degree-is-best-for-starting-a-business/',
-    'https://www.swinburneonline.edu.au/faqs/what-should-i-study-for-small-business/',
-    'https://www.swinburneonline.edu.au/faqs/qualifications-for-financial-advisor-australia/',
-    'https://www.swinburneonline.edu.au/faqs/how-to-start-as-financial-advisor/',
-    'https://www.swinburneonline.edu.au/faqs/duration-to-become-financial-advisor/',
-    'https://www.swinburneonline.edu.au/faqs/is-it-hard-being-a-financial-advisor/',
-    'https://www.swinburneonline.edu.au/faqs/is-being-a-financial-advisor-stressful/',
-    'https://www.swinburneonline.edu.au/faqs/kind-of-person-for-financial-advisor/',
-    'https://www.swinburneonline.edu.au/faqs/duties-of-financial-advisor/',
-    'https://www.swinburneonline.edu.au/faqs/job-of-financial-advisor/',
-    'https://www.swinburneonline.edu.au/faqs/what-qualifies-you-as-a-ceo/',
-    'https://www.swinburneonline.edu.au/faqs/qualifications-most-ceos-have/',
-    'https://www.swinburneonline.edu.au/faqs/skills-to-become-ceo/',
-    'https://www.swinburneonline.edu.au/faqs/how-to-become-ceo-australia/',
-    'https://www.swinburneonline.edu.au/faqs/how-to-become-a-ceo-of-a-company/',
-    'https://www.swinburneonline.edu.au/faqs/is-postgraduate-study-covered-by-hecs/',
-    'https://www.swinburneonline.edu.au/faqs/can-you-get-a-student-loan-for-a-masters-in-australia/',
-    'https://www.swinburneonline.edu.au/faqs/is-higher-education-loan-program-help-the-same-as-hecs/',
-    'https://www.swinburneonline.edu.au/faqs/how-many-degrees-can-you-put-on-hecs/',
-    'https://www.swinburneonline.edu.au/faqs/how-do-i-pay-for-postgraduate-study-in-australia/',
-    'https://www.swinburneonline.edu.au/faqs/do-i-have-to-pay-for-masters-in-australia/',
-    'https://www.swinburneonline.edu.au/faqs/how-do-i-get-full-funding-for-a-masters-in-australia/',
-    'https://www.swinburneonline.edu.au/faqs/is-it-easy-to-get-a-scholarship-for-masters-in-australia/',
-    'https://www.swinburneonline.edu.au/faqs/best-degree-for-financial-advisor/',
-    'https://www.swinburneonline.edu.au/faqs/can-you-complete-an-mba-while-working-full-time/',
-    'https://www.swinburneonline.edu.au/faqs/can-you-study-an-mba-part-time/',
-    'https://www.swinburneonline.edu.au/faqs/how-many-hours-a-week-is-an-mba/',
-    'https://www.swinburneonline.edu.au/faqs/how-long-is-a-full-time-mba/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-a-weekend-mba/',
-    'https://www.swinburneonline.edu.au/faqs/how-long-does-it-take-to-finish-a-part-time-mba/',
-    'https://www.swinburneonline.edu.au/faqs/what-does-an-mba-teach/',
-    'https://www.swinburneonline.edu.au/faqs/who-should-do-an-mba/',
-    'https://www.swinburneonline.edu.au/faqs/why-study-an-mba/',
-    'https://www.swinburneonline.edu.au/faqs/do-you-need-a-degree-to-do-an-mba/',
-    'https://www.swinburneonline.edu.au/faqs/how-long-does-an-mba-take-in-australia/',
-    'https://www.swinburneonline.edu.au/faqs/which-is-better-a-financial-planner-or-advisor/',
-    'https://www.swinburneonline.edu.au/faqs/difference-between-financial-planner-and-financial-advisor/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-the-main-difference-between-a-financial-planner-and-a-financial-advisor-in-australia/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-the-difference-between-a-financial-planner-and-a-financial-advisor/',
-    'https://www.swinburneonline.edu.au/faqs/what-qualifications-do-financial-advisors-need/',
-    'https://www.swinburneonline.edu.au/faqs/how-do-you-figure-out-what-you-want-to-do-as-a-career/',
-    'https://www.swinburneonline.edu.au/faqs/how-to-find-your-dream-job/',
-    'https://www.swinburneonline.edu.au/faqs/why-am-i-struggling-to-choose-a-career/',
-    'https://www.swinburneonline.edu.au/faqs/what-to-do-if-you-are-confused-about-your-career/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-the-most-common-mistake-when-choosing-a-career/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-the-most-likely-career-for-a-customer-support-professional/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-the-career-path-for-customer-service-agents/',
-    'https://www.swinburneonline.edu.au/faqs/what-should-i-do-after-customer-service/',
-    'https://www.swinburneonline.edu.au/faqs/how-do-i-pivot-into-business-from-customer-service/',
-    'https://www.swinburneonline.edu.au/faqs/what-can-you-do-after-working-in-customer-service/',
-    'https://www.swinburneonline.edu.au/faqs/what-are-transferable-skills-in-customer-service/',
-    'https://www.swinburneonline.edu.au/faqs/how-can-i-transition-out-of-a-customer-service-job/',
-    'https://www.swinburneonline.edu.au/faqs/what-are-customer-service-skills/',
-    'https://www.swinburneonline.edu.au/faqs/how-to-describe-customer-service-skills/',
-    'https://www.swinburneonline.edu.au/faqs/how-to-demonstrate-customer-service-skills/',
-    'https://www.swinburneonline.edu.au/faqs/what-are-the-top-5-good-customer-service-skills/',
-    'https://www.swinburneonline.edu.au/faqs/is-it-normal-to-not-know-what-career-you-want/',
-    'https://www.swinburneonline.edu.au/faqs/do-you-offer-online-support-or-will-i-need-to-figure-it-all-out-myself/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-an-online-learning-advisor-and-how-can-i-contact-them/',
-    'https://www.swinburneonline.edu.au/faqs/what-is-an-online-learning-advisor-and-how-can-i-contact-them-2/',
-    'https://www.swinburneonline.edu.au/countdown/enrolments-closed-for-2023/',
-    'https://www.swinburneonline.edu.au/countdown/m-teach-secondary/',
-    'https://www.swinburneonline.edu.au/countdown/bach-design-enrolment/',
-    'https://www.swinburneonline.edu.au/countdown/test-coursepage-coe-banner/',
-    'https://www.swinburneonline.edu.au/countdown/3-tp-course-page-coe/',
-    'https://www.swinburneonline.edu.au/countdown/4-tp-course-page-coe/',
-    'https://www.swinburneonline.edu.au/countdown/homepage-coe-3tp-courses/',
-    'https://www.swinburneonline.edu.au/goal-getters/how-to-build-a-strong-and-unique-personal-brand/',
-    'https://www.swinburneonline.edu.au/goal-getters/how-to-kick-start-your-design-career/',
-    'https://www.swinburneonline.edu.au/goal-getters/how-to-study-full-time-while-travelling-the-country-in-a-van/',
-    'https://www.swinburneonline.edu.au/goal-getters/how-to-use-your-values-to-guide-your-career/',
-    'https://www.swinburneonline.edu.au/podcast/how-to-change-careers-through-online-study-its-easier-than-ever/',
-    'https://www.swinburneonline.edu.au/podcast/sarah-atkinson-from-hairdresser-to-psychology-degree/',
-    'https://www.swinburneonline.edu.au/podcast/chasing-your-dreams-and-tv-shows-that-left-us-reeling/',
-    'https://www.swinburneonline.edu.au/category/business/',
-    'https://www.swinburneonline.edu.au/category/careers/',
-    'https://www.swinburneonline.edu.au/category/communication-design/',
-    'https://www.swinburneonline.edu.au/category/education/',
-    'https://www.swinburneonline.edu.au/category/health/',
-    'https://www.swinburneonline.edu.au/category/information-technology/',
-    'https://www.swinburneonline.edu.au/category/online-study/',
-    'https://www.swinburneonline.edu.au/category/psychology/',
-    'https://www.swinburneonline.edu.au/category/social-science/',
-    'https://www.swinburneonline.edu.au/category/student-stories/',
-    'https://www.swinburneonline.edu.au/category/support/',
-    'https://www.swinburneonline.edu.au/category/uncategorised/',
-]
\ No newline at end of file
@@ -9,13 +9,17 @@ def initialize_topics_file():
             writer = csv.writer(file)
             writer.writerow(["topic", "count"])
 
-def update_topic_count(new_topics):
+def load_topic_counts():
     topics_dict = {}
     if os.path.exists(topics_file):
         with open(topics_file, mode='r') as file:
             reader = csv.DictReader(file)
             for row in reader:
                 topics_dict[row["topic"]] = int(row["count"])
+    return topics_dict
+
+def update_topic_count(new_topics):
+    topics_dict = load_topic_counts()
     
     for topic in new_topics:
         topics_dict[topic] = topics_dict.get(topic, 0) + 1
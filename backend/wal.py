@@ -0,0 +1,238 @@
+import base64
+import json
+import os
+import threading
+from contextlib import contextmanager
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:
+    # Windows has no flock; a single development server there has no other process to coordinate with
+    fcntl = None
+
+WAL_FILE = "index.wal"
+LOCK_FILE = "index.lock"
+
+
+def _header(generation):
+    return (json.dumps({"op": "generation", "generation": generation}) + "\n").encode("utf-8")
+
+
+def _read_header(file):
+    # (generation, offset of the first record), or None while the first line is still being written. Logs
+    # written before the header existed start straight with a record and count as generation 0.
+    file.seek(0)
+    line = file.readline()
+    if not line:
+        return 0, 0
+    if not line.endswith(b"\n"):
+        return None
+    record = json.loads(line)
+    if record.get("op") != "generation":
+        return 0, 0
+    return record["generation"], len(line)
+
+
+def _decode(line):
+    record = json.loads(line)
+    if record["op"] == "add":
+        vectors = np.frombuffer(base64.b64decode(record["vectors"]), dtype=np.float32)
+        record["vectors"] = vectors.reshape(-1, record["dimension"])
+    return record
+
+
+class WriteAheadLog:
+    # Append-only log of the adds and deletes made since the index files were last written.
+    # One JSON line per write, fsync'd before the write is applied, so replaying it over the
+    # last saved index restores every acknowledged write after a crash. Every worker serving the
+    # index follows it (see LogCursor); each save starts a new log with the next generation number.
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+
+    @classmethod
+    def for_index(cls, vector_path):
+        return cls(os.path.join(vector_path, WAL_FILE))
+
+    def _append(self, record, generation):
+        # Callers hold the IndexLock exclusively, so no other process is appending. Returns the offset the
+        # record starts at, for truncate().
+        line = (json.dumps(record) + "\n").encode("utf-8")
+        with self.lock:
+            with open(self.path, "a+b") as file:
+                offset = file.seek(0, os.SEEK_END)
+                if not offset:
+                    header = _header(generation)
+                    line = header + line
+                    offset = len(header)
+                else:
+                    file.seek(offset - 1)
+                    if file.read(1) != b"\n":
+                        # A crash mid-append left a partial last line; it was never acknowledged, so drop it.
+                        # Followers never read past a line without its newline.
+                        print(f"Discarding a partial record at the end of {self.path}")
+                        file.seek(0)
+                        offset = file.read().rfind(b"\n") + 1
+                        file.truncate(offset)
+                file.write(line)
+                file.flush()
+                os.fsync(file.fileno())
+        return offset
+
+    def truncate(self, offset):
+        # Drops the records from `offset` on: a write that failed to apply right after it was logged, before
+        # the IndexLock let any other worker read it
+        with self.lock:
+            with open(self.path, "r+b") as file:
+                file.truncate(offset)
+                file.flush()
+                os.fsync(file.fileno())
+
+    def log_add(self, ids, vectors, documents, generation):
+        vectors = np.asarray(vectors, dtype=np.float32)
+        return self._append({
+            "op": "add",
+            "ids": list(ids),
+            "dimension": int(vectors.shape[1]),
+            "vectors": base64.b64encode(vectors.tobytes()).decode("ascii"),
+            "documents": [{"page_content": document.page_content, "metadata": document.metadata} for document in documents],
+        }, generation)
+
+    def log_delete(self, ids, generation):
+        return self._append({"op": "delete", "ids": list(ids)}, generation)
+
+    def generation(self):
+        try:
+            with open(self.path, "rb") as file:
+                header = _read_header(file)
+        except FileNotFoundError:
+            return 0
+        return header[0] if header else 0
+
+    def start(self, generation):
+        # Replaces the log with an empty one for the save that just committed. Followers still holding
+        # the old file see the new generation and know the index files moved on without them.
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as file:
+            file.write(_header(generation))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, self.path)
+
+
+class LogCursor:
+    # How far one worker has applied the log. Keeping the file open keeps its inode, so a log replaced by
+    # another worker's save is told apart from this one even if the new file gets the same inode number.
+    def __init__(self, wal):
+        self.wal = wal
+        self.lock = threading.Lock()
+        self.file = None
+        self.start = self.offset = 0
+        self.generation = wal.generation()
+        self._replaced()
+
+    def _replaced(self):
+        try:
+            stat = os.stat(self.wal.path)
+        except FileNotFoundError:
+            # No save has written a log yet, and nothing has been appended
+            return False
+        if self.file is not None:
+            opened = os.fstat(self.file.fileno())
+            if (opened.st_ino, opened.st_dev) == (stat.st_ino, stat.st_dev):
+                return False
+        file = open(self.wal.path, "rb")
+        header = _read_header(file)
+        if header is None or header[0] != self.generation:
+            file.close()
+            return header is not None
+        # The first write since the save created the log
+        if self.file is not None:
+            self.file.close()
+        self.file = file
+        self.start = self.offset = header[1]
+        return False
+
+    def replaced(self):
+        # True once another worker's save started a new log: the index files are newer than this worker's copy
+        with self.lock:
+            return self._replaced()
+
+    def pending(self):
+        with self.lock:
+            if self._replaced() or self.file is None:
+                return False
+            return os.fstat(self.file.fileno()).st_size > self.offset
+
+    def has_records(self):
+        with self.lock:
+            return self.file is not None and os.fstat(self.file.fileno()).st_size > self.start
+
+    def read(self):
+        # Records appended since the last read. A last line without its newline is still being written
+        # (or was cut short by a crash and will be dropped by the next append), so it is left for later.
+        with self.lock:
+            if self.file is None:
+                return []
+            self.file.seek(self.offset)
+            data = self.file.read()
+            end = data.rfind(b"\n") + 1
+            self.offset += end
+            return [_decode(line) for line in data[:end].splitlines()]
+
+    def rewind(self, offset):
+        # After WriteAheadLog.truncate(offset): read on from where the dropped records started
+        with self.lock:
+            self.offset = min(self.offset, offset)
+
+    def reset(self):
+        # After this worker's own save: follow the log it started
+        with self.lock:
+            self.close()
+            self.generation = self.wal.generation()
+            self._replaced()
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        self.start = self.offset = 0
+
+
+class IndexLock:
+    # flock on index.lock beside the log. A process holds it exclusively to append to the log or save the
+    # index, so only one process at a time writes to the directory; loading holds it shared so a load never
+    # sees a save half-renamed. Re-entrant within a process.
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.RLock()
+        self._depth = 0
+        self._file = None
+
+    @classmethod
+    def for_index(cls, vector_path):
+        return cls(os.path.join(vector_path, LOCK_FILE))
+
+    @contextmanager
+    def _locked(self, operation):
+        with self._lock:
+            if not self._depth and fcntl is not None:
+                self._file = open(self.path, "a+b")
+                fcntl.flock(self._file.fileno(), operation)
+            self._depth += 1
+            try:
+                yield
+            finally:
+                self._depth -= 1
+                if not self._depth and self._file is not None:
+                    fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+                    self._file.close()
+                    self._file = None
+
+    def exclusive(self):
+        return self._locked(fcntl and fcntl.LOCK_EX)
+
+    def shared(self):
+        return self._locked(fcntl and fcntl.LOCK_SH)
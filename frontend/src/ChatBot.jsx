@@ -62,6 +62,8 @@ const ChatBot = () => {
 
     const chatContainerRef = useRef(null);
     const recognitionRef = useRef(null);
+    // The session id the backend issued for this conversation, sent back so it keeps the history
+    const sessionRef = useRef(null);
 
     // useEffect(() => {
     //     if (chatContainerRef.current) {
@@ -139,34 +141,61 @@ const ChatBot = () => {
             ]);
 
             try {
-                await addTopic(message);
+                // Not awaited: the spelling check behind it must not delay the answer
+                addTopic(message);
 
-                const response = await fetch('http://127.0.0.1:8000/chat', {
+                const response = await fetch('http://127.0.0.1:8000/chat/stream', {
                     method: 'POST',
                     headers: {
                         'Content-Type': 'application/json',
                     },
-                    body: JSON.stringify({ query: message }),
+                    body: JSON.stringify({ query: message, session_id: sessionRef.current }),
                 });
 
                 if (!response.ok) {
                     throw new Error('Network response was not ok');
                 }
 
-                const data = await response.json();
-
-                setChatHistory((prevHistory) => [
-                    ...prevHistory,
-                    { user: "bot", message: data.answer },
-                ]);
-
-                if (data.similar_questions) {
-                    const newOptions = data.similar_questions
-                        .split('*')
-                        .map(q => cleanString(q))
-                        .filter(q => q.trim() !== '');
-                    setAutoCompleteOptions(newOptions);
-                    setShowSimilarQuestions(true);
+                // Server-Sent Events: the answer as "token" events, one "similar_questions" event, then "done" with the session id
+                const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+                let buffer = "";
+                let answerStarted = false;
+                while (true) {
+                    const { value, done } = await reader.read();
+                    if (done) {
+                        break;
+                    }
+                    buffer += value;
+                    const events = buffer.split("\n\n");
+                    buffer = events.pop();
+                    for (const block of events) {
+                        const event = block.match(/^event: (.*)$/m)?.[1];
+                        const dataLine = block.match(/^data: (.*)$/m)?.[1];
+                        const data = dataLine === undefined ? "" : JSON.parse(dataLine);
+                        if (event === "token") {
+                            if (!answerStarted) {
+                                answerStarted = true;
+                                setIsThinking(false);
+                                setChatHistory((prevHistory) => [...prevHistory, { user: "bot", message: data }]);
+                            } else {
+                                setChatHistory((prevHistory) => [
+                                    ...prevHistory.slice(0, -1),
+                                    { user: "bot", message: prevHistory[prevHistory.length - 1].message + data },
+                                ]);
+                            }
+                        } else if (event === "similar_questions" && data) {
+                            const newOptions = data
+                                .split('*')
+                                .map(q => cleanString(q))
+                                .filter(q => q.trim() !== '');
+                            setAutoCompleteOptions(newOptions);
+                            setShowSimilarQuestions(true);
+                        } else if (event === "done") {
+                            sessionRef.current = data.session_id;
+                        } else if (event === "error") {
+                            throw new Error(data);
+                        }
+                    }
                 }
             } catch (error) {
                 console.error('Error:', error);